@@ -0,0 +1,48 @@
+-- Migration: Create Agentic Step Graph Log
+-- Purpose: Store per-step timing and status of multi-step agent reasoning runs
+--          (written by AgenticTelemetryService.record_agent_step_graph)
+-- Date: October 2026
+
+-- Step Graph Log Table
+CREATE TABLE IF NOT EXISTS agentic_step_graph_log (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    agent_id TEXT NOT NULL,
+    graph_name TEXT NOT NULL,
+    tenant_id TEXT NOT NULL,
+    session_id TEXT,
+    execution_id TEXT,
+    total_ms DOUBLE PRECISION,
+    critical_path JSONB DEFAULT '[]'::JSONB,
+    step_timings JSONB DEFAULT '{}'::JSONB,
+    step_status JSONB DEFAULT '{}'::JSONB,
+    errors JSONB DEFAULT '{}'::JSONB,
+    success BOOLEAN DEFAULT true,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Indexes for step graph log
+CREATE INDEX IF NOT EXISTS idx_agentic_step_graph_log_agent_id
+    ON agentic_step_graph_log(agent_id);
+CREATE INDEX IF NOT EXISTS idx_agentic_step_graph_log_graph_name
+    ON agentic_step_graph_log(graph_name);
+CREATE INDEX IF NOT EXISTS idx_agentic_step_graph_log_tenant_id
+    ON agentic_step_graph_log(tenant_id);
+CREATE INDEX IF NOT EXISTS idx_agentic_step_graph_log_execution_id
+    ON agentic_step_graph_log(execution_id);
+CREATE INDEX IF NOT EXISTS idx_agentic_step_graph_log_created_at
+    ON agentic_step_graph_log(created_at);
+
+-- RLS Policies (Tenant-isolated)
+ALTER TABLE agentic_step_graph_log ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "tenant_read_step_graph_logs" ON agentic_step_graph_log
+    FOR SELECT
+    USING (tenant_id = current_setting('app.current_tenant_id', true)::TEXT);
+
+CREATE POLICY "tenant_insert_step_graph_logs" ON agentic_step_graph_log
+    FOR INSERT
+    WITH CHECK (tenant_id = current_setting('app.current_tenant_id', true)::TEXT);
+
+-- Comments
+COMMENT ON TABLE agentic_step_graph_log IS
+    'Agent step graph logs - tracks per-step timing, status and critical path of multi-step reasoning runs';
@@ -0,0 +1,11 @@
+-- Migration: Add cached flag to agentic execution log
+-- Purpose: Mark agent LLM calls served from the response cache
+--          (recorded with zero tokens and cost by AgentBase._call_llm)
+-- Date: October 2026
+-- Breaking Change: No - Adds new optional column
+
+ALTER TABLE agentic_execution_log
+    ADD COLUMN IF NOT EXISTS cached BOOLEAN DEFAULT false;
+
+COMMENT ON COLUMN agentic_execution_log.cached IS
+    'True when the response came from the agent LLM response cache (no provider call)';
@@ -28,6 +28,7 @@ import uvicorn
 from symphainy_platform.bootstrap import load_platform_config, pre_boot_validate
 from symphainy_platform.runtime.service_factory import create_runtime_services
 from symphainy_platform.civic_systems.experience import create_app
+from symphainy_platform.civic_systems.experience.middleware.rate_limiter import configure_rate_limiter
 from symphainy_platform.civic_systems.smart_city.sdk.security_guard_sdk import SecurityGuardSDK
 from symphainy_platform.civic_systems.smart_city.sdk.traffic_cop_sdk import TrafficCopSDK
 from utilities import get_logger
@@ -67,9 +68,13 @@ def main() -> None:
     security_guard_sdk = SecurityGuardSDK(
         auth_abstraction=auth_abstraction,
         tenant_abstraction=tenant_abstraction,
+        token_cache=public_works.get_auth_token_cache(),
     )
     traffic_cop_sdk = TrafficCopSDK(state_abstraction=state_abstraction)
 
+    # Endpoint rate limits (login, register) share Redis buckets across workers
+    configure_rate_limiter(public_works.get_rate_limiter())
+
     app = create_app()
     app.state.security_guard_sdk = security_guard_sdk
     app.state.traffic_cop_sdk = traffic_cop_sdk
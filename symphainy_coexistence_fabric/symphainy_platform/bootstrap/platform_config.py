@@ -134,6 +134,14 @@ def build_canonical_config() -> Dict[str, Any]:
         "arango_username": arango_username,
         "arango_password": arango_password,
         "arango_database": arango_database,
+        "arango_import_batch_size": _get_env_int("ARANGO_IMPORT_BATCH_SIZE", 1000),  # documents per bulk import request
+        # Semantic vector search: in-process ANN index (falls back to the AQL scan when disabled or numpy is missing).
+        # Off by default: the index only sees writes made through its own process, so enable it only when a
+        # single process writes the embedding collections (or other writers call invalidate()).
+        "vector_index_enabled": _get_env_bool("VECTOR_INDEX_ENABLED", False),
+        "vector_index_dir": _get_env("VECTOR_INDEX_DIR", "").strip() or None,  # snapshot directory; unset = in-memory only
+        "vector_index_nprobe": _get_env_int("VECTOR_INDEX_NPROBE", 16),
+        "vector_index_train_threshold": _get_env_int("VECTOR_INDEX_TRAIN_THRESHOLD", 1024),
         "supabase_url": supabase_url,
         "supabase_anon_key": supabase_anon_key,
         "supabase_service_key": supabase_service_key,
@@ -145,7 +153,13 @@ def build_canonical_config() -> Dict[str, Any]:
         "meilisearch_host": _get_env("MEILISEARCH_HOST", "meilisearch"),
         "meilisearch_port": meilisearch_port,
         "meilisearch_key": os.getenv("MEILI_MASTER_KEY"),
+        # Hybrid retrieval (Meilisearch + vector store, reciprocal rank fusion) for agent context
+        "hybrid_retrieval_index": _get_env("HYBRID_RETRIEVAL_INDEX", "knowledge_assets"),
+        "hybrid_retrieval_rrf_k": _get_env_int("HYBRID_RETRIEVAL_RRF_K", 60),
+        "hybrid_retrieval_cache_ttl_seconds": _get_env_int("HYBRID_RETRIEVAL_CACHE_TTL_SECONDS", 60),  # 0 disables the hot-query cache
+        "hybrid_retrieval_cache_entries": _get_env_int("HYBRID_RETRIEVAL_CACHE_ENTRIES", 256),  # per tenant
         "runtime_port": _get_env_int("RUNTIME_PORT", 8000),
+        "startup_timeout_seconds": _get_env_int("STARTUP_TIMEOUT_SECONDS", 30),  # per connect/check bound for pre-boot and Public Works
         "log_level": _get_env("LOG_LEVEL", "INFO"),
         "otel_exporter_otlp_endpoint": _get_env("OTEL_EXPORTER_OTLP_ENDPOINT", "").strip() or None,  # required; no default; pre-boot validates presence and reachability
         # Optional (not required for G3): LLM / capabilities
@@ -153,6 +167,68 @@ def build_canonical_config() -> Dict[str, Any]:
         "openai_base_url": os.getenv("OPENAI_BASE_URL"),
         "huggingface_endpoint_url": os.getenv("HUGGINGFACE_EMBEDDINGS_ENDPOINT_URL") or os.getenv("HUGGINGFACE_EMBEDDINGS_ENDPOINT"),
         "huggingface_api_key": os.getenv("HUGGINGFACE_EMBEDDINGS_API_KEY") or os.getenv("HUGGINGFACE_API_KEY"),
+        # LLM gateway: provider-wide and per-tenant budgets (0 = half the provider-wide value), queue deadlines per lane
+        "llm_requests_per_minute": _get_env_int("LLM_REQUESTS_PER_MINUTE", 500),
+        "llm_tokens_per_minute": _get_env_int("LLM_TOKENS_PER_MINUTE", 200000),
+        "llm_tenant_requests_per_minute": _get_env_int("LLM_TENANT_REQUESTS_PER_MINUTE", 0),
+        "llm_tenant_tokens_per_minute": _get_env_int("LLM_TENANT_TOKENS_PER_MINUTE", 0),
+        "llm_max_in_flight": _get_env_int("LLM_MAX_IN_FLIGHT", 32),
+        "llm_tenant_max_in_flight": _get_env_int("LLM_TENANT_MAX_IN_FLIGHT", 0),
+        "llm_interactive_deadline_seconds": _get_env_int("LLM_INTERACTIVE_DEADLINE_SECONDS", 30),
+        "llm_batch_deadline_seconds": _get_env_int("LLM_BATCH_DEADLINE_SECONDS", 300),
+        # LLM response cache (agents opt in): in-process size, default TTL, highest cacheable temperature (percent)
+        "llm_response_cache_enabled": _get_env_bool("LLM_RESPONSE_CACHE_ENABLED", True),
+        "llm_response_cache_local_entries": _get_env_int("LLM_RESPONSE_CACHE_LOCAL_ENTRIES", 10000),
+        "llm_response_cache_ttl_seconds": _get_env_int("LLM_RESPONSE_CACHE_TTL_SECONDS", 3600),
+        "llm_response_cache_max_temperature_pct": _get_env_int("LLM_RESPONSE_CACHE_MAX_TEMPERATURE_PCT", 30),
+        # Chat conversation log: turns per window read, compaction threshold / turns kept, idle TTL
+        "conversation_window": _get_env_int("CONVERSATION_WINDOW", 20),
+        "conversation_compact_threshold": _get_env_int("CONVERSATION_COMPACT_THRESHOLD", 200),
+        "conversation_keep_recent": _get_env_int("CONVERSATION_KEEP_RECENT", 50),
+        "conversation_ttl_seconds": _get_env_int("CONVERSATION_TTL_SECONDS", 30 * 24 * 3600),
+        # Rate limits shared by all workers (Redis token buckets): per minute per tenant / user / intent type (0 = unlimited),
+        # plus per-intent-type overrides as "intent_type=limit[/window_seconds],..."
+        "rate_limit_tenant_per_minute": _get_env_int("RATE_LIMIT_TENANT_PER_MINUTE", 600),
+        "rate_limit_user_per_minute": _get_env_int("RATE_LIMIT_USER_PER_MINUTE", 120),
+        "rate_limit_intent_per_minute": _get_env_int("RATE_LIMIT_INTENT_PER_MINUTE", 0),
+        "rate_limit_intent_quotas": _get_env("RATE_LIMIT_INTENT_QUOTAS", ""),
+        # Admission control (per worker): in-flight executions overall / per tenant (0 = unbounded), loop lag budget (0 = off)
+        "admission_max_in_flight": _get_env_int("ADMISSION_MAX_IN_FLIGHT", 256),
+        "admission_tenant_max_in_flight": _get_env_int("ADMISSION_TENANT_MAX_IN_FLIGHT", 0),
+        "admission_max_loop_lag_ms": _get_env_int("ADMISSION_MAX_LOOP_LAG_MS", 250),
+        "admission_retry_after_seconds": _get_env_int("ADMISSION_RETRY_AFTER_SECONDS", 1),
+        # Intent idempotency: results replayed for repeated keys (client Idempotency-Key, or a hash of the inputs
+        # for the listed deterministic intent types, empty = built-in list); identical intents in flight share one execution
+        "idempotency_enabled": _get_env_bool("IDEMPOTENCY_ENABLED", True),
+        "idempotency_ttl_seconds": _get_env_int("IDEMPOTENCY_TTL_SECONDS", 86400),
+        "idempotency_derived_intent_types": _get_env("IDEMPOTENCY_DERIVED_INTENT_TYPES", ""),
+        # Batch intent submission: batch executions running at once per worker (all batches), largest batch accepted
+        "intent_batch_max_concurrency": _get_env_int("INTENT_BATCH_MAX_CONCURRENCY", 8),
+        "intent_batch_max_size": _get_env_int("INTENT_BATCH_MAX_SIZE", 500),
+        # Verified-token cache: skips JWT verification and the tenant lookup for repeat tokens until exp,
+        # trusted at most max_ttl_seconds (bounds staleness if an invalidation event is missed)
+        "auth_token_cache_enabled": _get_env_bool("AUTH_TOKEN_CACHE_ENABLED", True),
+        "auth_token_cache_local_entries": _get_env_int("AUTH_TOKEN_CACHE_LOCAL_ENTRIES", 10000),
+        "auth_token_cache_max_ttl_seconds": _get_env_int("AUTH_TOKEN_CACHE_MAX_TTL_SECONDS", 300),
+        # PDF extraction: pdfplumber processes (0 = one worker thread), pages per pool task, extracted pages cached
+        "pdf_parse_workers": _get_env_int("PDF_PARSE_WORKERS", 4),
+        "pdf_pages_per_task": _get_env_int("PDF_PAGES_PER_TASK", 8),
+        "pdf_page_cache_entries": _get_env_int("PDF_PAGE_CACHE_ENTRIES", 5000),
+        # AS2 ingestion: decryption processes (0 = thread pool); Message-IDs remembered for one to two
+        # retention windows (Redis sets), Bloom filter capacity per window when Redis is unreachable
+        "as2_crypto_workers": _get_env_int("AS2_CRYPTO_WORKERS", 2),
+        "as2_dedup_retention_seconds": _get_env_int("AS2_DEDUP_RETENTION_SECONDS", 7 * 24 * 3600),
+        "as2_dedup_bloom_capacity": _get_env_int("AS2_DEDUP_BLOOM_CAPACITY", 500000),
+        # Column profiles (one per parsed file, shared by embeddings / metrics / quality): in-process entries, Redis TTL
+        "column_profile_cache_local_entries": _get_env_int("COLUMN_PROFILE_CACHE_LOCAL_ENTRIES", 256),
+        "column_profile_cache_ttl_seconds": _get_env_int("COLUMN_PROFILE_CACHE_TTL_SECONDS", 7 * 24 * 3600),
+        # Embedding micro-batching (per provider): texts per call, max queueing delay, concurrent calls
+        "embedding_max_batch_size": _get_env_int("EMBEDDING_MAX_BATCH_SIZE", 64),
+        "embedding_max_wait_ms": _get_env_int("EMBEDDING_MAX_WAIT_MS", 5),
+        "embedding_max_in_flight": _get_env_int("EMBEDDING_MAX_IN_FLIGHT", 4),
+        # Embedding cache: in-process LRU size and shared (Redis) entry TTL
+        "embedding_cache_local_entries": _get_env_int("EMBEDDING_CACHE_LOCAL_ENTRIES", 50000),
+        "embedding_cache_ttl_seconds": _get_env_int("EMBEDDING_CACHE_TTL_SECONDS", 30 * 24 * 3600),
     }
     return config
 
@@ -5,6 +5,8 @@ Consumes only the canonical config from Layer 1. For each required backing
 service (Redis, Arango, Consul, Supabase, GCS, Meilisearch, DuckDB), runs
 a minimal connectivity/readiness check. When configured, Telemetry (OTLP)
 is validated. No Public Works or adapters.
+Checks are independent, so they run concurrently (one thread each) under a
+shared deadline; boot waits for the slowest check rather than the sum.
 On first failure: exit with a clear, actionable message.
 
 Aligned with PLATFORM_CONTRACT §5 (pre-boot validation).
@@ -12,9 +14,12 @@ Aligned with PLATFORM_CONTRACT §5 (pre-boot validation).
 
 import json
 import os
+import queue
 import socket
 import sys
-from typing import Any, Dict
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
 from urllib.parse import urlparse
 
 # Optional: use get_logger from utilities if available
@@ -27,6 +32,9 @@ except ImportError:
 
 logger = get_logger("bootstrap.pre_boot")
 
+# Default bound for the whole concurrent check run (config: startup_timeout_seconds)
+DEFAULT_PRE_BOOT_TIMEOUT_SECONDS = 30
+
 # Last pre-boot result (set after pre_boot_validate succeeds). Used by Control Room for infrastructure health.
 _last_pre_boot_result: Dict[str, Any] = {}
 
@@ -34,7 +42,8 @@ _last_pre_boot_result: Dict[str, Any] = {}
 def get_pre_boot_status() -> Dict[str, Any]:
     """
     Return the last pre-boot validation result for use by Control Room / genesis status.
-    Keys: status ("passed" | "not_run"), services_validated (list), telemetry ("checked" | "skipped").
+    Keys: status ("passed" | "not_run"), services_validated (list), telemetry ("checked" | "skipped"),
+    timings_ms (per-service check duration), total_ms.
     """
     return dict(_last_pre_boot_result)
 
@@ -269,31 +278,88 @@ def _check_telemetry(config: Dict[str, Any]) -> str:
     return "checked"
 
 
+def _run_checks(
+    checks: List[Tuple[str, Callable[[Dict[str, Any]], Any]]],
+    config: Dict[str, Any],
+    timeout: float,
+) -> Dict[str, float]:
+    """
+    Run checks concurrently and return per-check durations (ms).
+
+    Each check runs in a daemon thread so a hung backend cannot hold the process
+    open after _fail. The first check to fail (in completion order) aborts boot;
+    checks still pending at the deadline fail as timed out.
+    """
+    results: queue.Queue = queue.Queue()
+
+    def _worker(name: str, check: Callable[[Dict[str, Any]], Any]) -> None:
+        started = time.perf_counter()
+        try:
+            check(config)
+            results.put((name, None, time.perf_counter() - started))
+        except BaseException as e:  # _fail raises SystemExit inside the thread
+            results.put((name, e, time.perf_counter() - started))
+
+    for name, check in checks:
+        threading.Thread(target=_worker, args=(name, check), name=f"pre-boot-{name}", daemon=True).start()
+
+    timings_ms: Dict[str, float] = {}
+    pending = {name for name, _ in checks}
+    deadline = time.monotonic() + timeout
+    while pending:
+        try:
+            name, error, elapsed = results.get(timeout=max(deadline - time.monotonic(), 0))
+        except queue.Empty:
+            _fail(
+                ", ".join(sorted(pending)),
+                f"readiness check did not finish within {timeout}s",
+                "Check that the service is reachable, or raise STARTUP_TIMEOUT_SECONDS.",
+            )
+            break
+        pending.discard(name)
+        timings_ms[name] = round(elapsed * 1000, 3)
+        if error is not None:
+            raise error
+    return timings_ms
+
+
 def pre_boot_validate(config: Dict[str, Any]) -> None:
     """
     Run pre-boot validation for all required backing services (Gate G3).
 
-    Uses only the canonical config. Order: Data Plane (Redis, Arango, Supabase,
-    GCS, Meilisearch, DuckDB) then Control Plane (Consul). On first failure,
-    exits the process with a clear message.
+    Uses only the canonical config. Data Plane (Redis, Arango, Supabase, GCS,
+    Meilisearch, DuckDB), Control Plane (Consul) and Telemetry are checked
+    concurrently. On first failure, exits the process with a clear message.
     """
     logger.info("Pre-boot validation: checking required backing services...")
-    # Data plane first (per PRE_BOOT_SPEC / HYBRID_CLOUD_VISION)
-    _check_redis(config)
-    _check_arango(config)
-    _check_supabase(config)
-    _check_gcs(config)
-    _check_meilisearch(config)
-    _check_duckdb(config)
-    # Control plane
-    _check_consul(config)
-    # Telemetry (required)
-    _check_telemetry(config)
+    started = time.perf_counter()
+    checks: List[Tuple[str, Callable[[Dict[str, Any]], Any]]] = [
+        # Data plane (per PRE_BOOT_SPEC / HYBRID_CLOUD_VISION)
+        ("redis", _check_redis),
+        ("arango", _check_arango),
+        ("supabase", _check_supabase),
+        ("gcs", _check_gcs),
+        ("meilisearch", _check_meilisearch),
+        ("duckdb", _check_duckdb),
+        # Control plane
+        ("consul", _check_consul),
+        # Telemetry (required)
+        ("telemetry", _check_telemetry),
+    ]
+    timeout = float(config.get("startup_timeout_seconds") or DEFAULT_PRE_BOOT_TIMEOUT_SECONDS)
+    timings_ms = _run_checks(checks, config, timeout)
+    total_ms = round((time.perf_counter() - started) * 1000, 3)
     # Store result for Control Room / genesis status
     global _last_pre_boot_result
     _last_pre_boot_result = {
         "status": "passed",
-        "services_validated": ["redis", "arango", "supabase", "gcs", "meilisearch", "duckdb", "consul", "telemetry"],
+        "services_validated": [name for name, _ in checks],
         "telemetry": "checked",
+        "timings_ms": timings_ms,
+        "total_ms": total_ms,
     }
-    logger.info("Pre-boot validation: all required services passed.")
+    slowest = max(timings_ms, key=timings_ms.get) if timings_ms else None
+    logger.info(
+        f"Pre-boot validation: all required services passed in {total_ms:.1f}ms"
+        + (f" (slowest: {slowest} {timings_ms[slowest]:.1f}ms)" if slowest else "")
+    )
@@ -29,7 +29,6 @@ from typing import Dict, Any, Optional
 from utilities import get_logger, generate_event_id
 from symphainy_platform.civic_systems.platform_sdk import PlatformIntentService, PlatformContext
 from symphainy_platform.runtime.artifact_registry import (
-    ArtifactRecord,
     Materialization,
     SemanticDescriptor,
     ProducedBy,
@@ -175,6 +174,24 @@ class IngestFileService(PlatformIntentService):
             storage_location = ingestion_result["storage_location"]
             file_metadata = ingestion_result.get("ingestion_metadata", {})
             
+            # === REGISTER FILE REFERENCE (State Surface resolves it for parsing) ===
+            
+            if ctx.state_surface:
+                await ctx.state_surface.store_file_reference(
+                    session_id=ctx.session_id,
+                    tenant_id=ctx.tenant_id,
+                    file_reference=file_reference,
+                    storage_location=storage_location,
+                    filename=filename,
+                    metadata={
+                        "ui_name": ui_name,
+                        "file_type": file_type,
+                        "content_type": mime_type,
+                        "ingestion_type": ingestion_type,
+                        "file_id": artifact_id
+                    }
+                )
+            
             # === REGISTER ARTIFACT (Contract Section 4) ===
             
             await self._register_artifact(
@@ -405,22 +422,15 @@ class IngestFileService(PlatformIntentService):
                 execution_id=ctx.execution_id
             )
             
-            # Create artifact record with lifecycle_state: PENDING (Working Material)
-            artifact = ArtifactRecord(
+            # Register artifact via State Surface with lifecycle_state: PENDING (Working Material)
+            artifact_registered = await ctx.state_surface.artifact_registry.register_artifact(
                 artifact_id=artifact_id,
                 artifact_type="file",
                 tenant_id=ctx.tenant_id,
                 produced_by=produced_by,
-                parent_artifacts=[],
-                lifecycle_state=LifecycleState.PENDING.value,
                 semantic_descriptor=semantic_descriptor,
-                materializations=[]
-            )
-            
-            # Register artifact via State Surface
-            artifact_registered = await ctx.state_surface.artifact_registry.register_artifact(
-                artifact=artifact,
-                tenant_id=ctx.tenant_id
+                parent_artifacts=[],
+                lifecycle_state=LifecycleState.PENDING.value
             )
             
             if not artifact_registered:
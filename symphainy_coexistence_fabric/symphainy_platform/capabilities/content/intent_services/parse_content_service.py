@@ -21,6 +21,7 @@ Key Changes from Legacy:
 """
 
 from typing import Dict, Any, Optional, List
+import json
 import uuid
 
 from utilities import get_logger, generate_event_id
@@ -181,6 +182,16 @@ class ParseContentService(PlatformIntentService):
         elif isinstance(parsed_content, dict) and "records" in parsed_content:
             record_count = len(parsed_content["records"])
         
+        # Persist parsed result so downstream intents can resolve parsed_file_id
+        await self._store_parsed_result(
+            ctx=ctx,
+            parsed_file_id=parsed_file_id,
+            file_id=file_id,
+            parsed_file_reference=parsed_file_reference,
+            parsing_type=parsing_type_result,
+            parsed_result=parsed_result
+        )
+        
         # Track parsed result for lineage
         await self._track_parsed_result(
             ctx=ctx,
@@ -356,6 +367,66 @@ class ParseContentService(PlatformIntentService):
             execution_id=ctx.execution_id
         )
     
+    async def _store_parsed_result(
+        self,
+        ctx: PlatformContext,
+        parsed_file_id: str,
+        file_id: str,
+        parsed_file_reference: str,
+        parsing_type: str,
+        parsed_result: Dict[str, Any]
+    ) -> None:
+        """
+        Store parsed result in file storage and register its reference in State Surface.
+        
+        Same layout as FileParserService: parsed/{tenant_id}/{parsed_file_id}.json.
+        """
+        file_storage = ctx.platform.get_file_storage_abstraction() if ctx.platform else None
+        if not file_storage or not ctx.state_surface:
+            raise RuntimeError(
+                "File storage or State Surface not wired; cannot persist parsed result. Platform contract §8A."
+            )
+        
+        parsed_content = parsed_result.get("parsed_content")
+        text_content = parsed_result.get("text_content")
+        parsed_file_path = f"parsed/{ctx.tenant_id}/{parsed_file_id}.json"
+        parsed_data_json = json.dumps({
+            "parsed_file_id": parsed_file_id,
+            "file_id": file_id,
+            "parsing_type": parsed_result.get("parsing_type") or parsing_type,
+            "text_content": text_content,
+            "structured_data": parsed_content if parsed_content is not text_content else None,
+            "metadata": parsed_result.get("metadata", {}),
+            "timestamp": self.clock.now_iso()
+        }, default=str).encode("utf-8")
+        
+        upload_result = await file_storage.upload_file(
+            file_path=parsed_file_path,
+            file_data=parsed_data_json,
+            metadata={
+                "content_type": "application/json",
+                "parsed_file_id": parsed_file_id,
+                "file_id": file_id,
+                "parsing_type": parsing_type
+            }
+        )
+        if not upload_result.get("success"):
+            raise RuntimeError(f"Failed to store parsed result: {upload_result.get('error')}")
+        
+        await ctx.state_surface.store_file_reference(
+            session_id=ctx.session_id,
+            tenant_id=ctx.tenant_id,
+            file_reference=parsed_file_reference,
+            storage_location=parsed_file_path,
+            filename=f"{parsed_file_id}.json",
+            metadata={
+                "file_type": "parsed",
+                "parsing_type": parsing_type,
+                "file_id": file_id,
+                "size": len(parsed_data_json)
+            }
+        )
+    
     async def _track_parsed_result(
         self,
         ctx: PlatformContext,
@@ -5,11 +5,13 @@ AI-powered analysis of structured data using InsightsEDAAgent.
 
 Uses ctx.reasoning.agents.invoke() for REAL statistical analysis,
 pattern detection, and anomaly identification - NOT just field counting.
+The statistical profile itself is computed deterministically by
+EDAStatisticsService (DuckDB, off the event loop) and handed to the agent.
 
 Contract: docs/intent_contracts/journey_insights_analysis/intent_analyze_structured_data.md
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from utilities import get_logger, generate_event_id
@@ -18,6 +20,7 @@ from symphainy_platform.civic_systems.platform_sdk import (
     PlatformIntentService,
     PlatformContext
 )
+from symphainy_platform.foundations.libraries.statistics import EDAStatisticsService, ProfileOptions
 
 
 class AnalyzeStructuredDataService(PlatformIntentService):
@@ -39,6 +42,7 @@ class AnalyzeStructuredDataService(PlatformIntentService):
         """Initialize Analyze Structured Data Service."""
         super().__init__(service_id=service_id, intent_type="analyze_structured_data")
         self.logger = get_logger(self.__class__.__name__)
+        self.statistics_service = EDAStatisticsService()
     
     async def execute(self, ctx: PlatformContext) -> Dict[str, Any]:
         """Execute analyze_structured_data intent."""
@@ -48,6 +52,7 @@ class AnalyzeStructuredDataService(PlatformIntentService):
         analysis_type = ctx.intent.parameters.get("analysis_type", "comprehensive")
         include_patterns = ctx.intent.parameters.get("include_patterns", True)
         include_anomalies = ctx.intent.parameters.get("include_anomalies", True)
+        sampling = ctx.intent.parameters.get("sampling")  # e.g. {"sampling": "reservoir", "sample_size": 50000}
         
         if not parsed_file_id:
             raise ValueError("parsed_file_id is required")
@@ -62,9 +67,13 @@ class AnalyzeStructuredDataService(PlatformIntentService):
         if not parsed_content:
             raise ValueError(f"Parsed file not found: {parsed_file_id}")
         
+        # Deterministic column profile (scales with file size; no DataFrame)
+        statistical_profile = await self._profile_parsed_content(parsed_content, sampling)
+        
         # Perform AI-powered analysis via InsightsEDAAgent
         analysis = await self._analyze_via_agent(
-            ctx, parsed_content, analysis_type, include_patterns, include_anomalies
+            ctx, parsed_content, analysis_type, include_patterns, include_anomalies,
+            statistical_profile
         )
         
         analysis_result = {
@@ -72,6 +81,7 @@ class AnalyzeStructuredDataService(PlatformIntentService):
             "parsed_file_id": parsed_file_id,
             "analysis_type": analysis_type,
             "analysis": analysis,
+            "statistical_profile": statistical_profile,
             "used_real_llm": analysis.get("used_real_llm", False),
             "analyzed_at": datetime.utcnow().isoformat()
         }
@@ -90,13 +100,35 @@ class AnalyzeStructuredDataService(PlatformIntentService):
             }]
         }
     
+    async def _profile_parsed_content(
+        self,
+        parsed_content: Dict[str, Any],
+        sampling: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Profile the tabular rows in parsed content via EDAStatisticsService.
+        
+        Returns None when the content has no rows (e.g. text documents).
+        """
+        rows, columns = EDAStatisticsService.extract_rows(parsed_content)
+        if not rows:
+            return None
+        try:
+            return await self.statistics_service.profile_rows(
+                rows, columns=columns, options=ProfileOptions.from_request(sampling)
+            )
+        except Exception as e:
+            self.logger.error(f"Statistical profiling failed: {e}", exc_info=True)
+            return None
+    
     async def _analyze_via_agent(
         self,
         ctx: PlatformContext,
         parsed_content: Dict[str, Any],
         analysis_type: str,
         include_patterns: bool,
-        include_anomalies: bool
+        include_anomalies: bool,
+        statistical_profile: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Analyze structured data using real InsightsEDAAgent.
@@ -118,6 +150,7 @@ class AnalyzeStructuredDataService(PlatformIntentService):
                         "analysis_type": analysis_type,
                         "include_patterns": include_patterns,
                         "include_anomalies": include_anomalies,
+                        "statistical_profile": statistical_profile,
                         "analysis_goals": [
                             "statistical_summary",
                             "pattern_detection", 
@@ -14,9 +14,14 @@ is policy-governed and ratified by Solution and Smart City.
 from .agent_base import AgentBase
 from .agent_registry import AgentRegistry
 from .agent_factory import AgentFactory
+from .step_graph import AgentStep, StepGraph, StepGraphResult, StepGraphError
 
 __all__ = [
     "AgentBase",
     "AgentRegistry",
     "AgentFactory",
+    "AgentStep",
+    "StepGraph",
+    "StepGraphResult",
+    "StepGraphError",
 ]
@@ -11,6 +11,8 @@ Key Principle: Agents reason. They do not execute.
 Agents may collaborate, but they may not commit.
 """
 
+import asyncio
+import dataclasses
 import sys
 from pathlib import Path
 
@@ -35,6 +37,8 @@ from .models.agent_definition import AgentDefinition
 from .models.agent_posture import AgentPosture
 from .models.agent_runtime_context import AgentRuntimeContext
 from .mcp_client_manager import MCPClientManager
+from .step_graph import AgentStep, StepGraph, StepGraphResult
+from symphainy_platform.foundations.public_works.llm_gateway import LLMGateway
 
 
 class AgentBase:
@@ -49,6 +53,22 @@ class AgentBase:
     - Structured output (proposals, blueprints, ranked options)
     """
     
+    # Agents that answer users directly (guide, liaisons) set this to ground their
+    # prompts in tenant knowledge retrieved for each request (hybrid retrieval)
+    retrieves_knowledge_context: bool = False
+    knowledge_context_limit: int = 5
+    
+    # LLM gateway lane: user-facing agents are "interactive"; generation fan-outs queue as "batch"
+    llm_priority: str = "batch"
+    
+    # LLM response cache lifetime; None = responses are never reused. Agents whose
+    # low-temperature prompts repeat (SOP/blueprint drafting, guide discovery) opt in;
+    # postures override it with llm_defaults["cache_ttl_seconds"]
+    llm_cache_ttl_seconds: Optional[int] = None
+    
+    # Most reasoning steps run_step_graph() runs at once (None = bounded only by the LLM gateway)
+    step_graph_max_concurrency: Optional[int] = None
+    
     def __init__(
         self,
         agent_id: str,
@@ -189,6 +209,14 @@ class AgentBase:
         if not self._initialized:
             await self._initialize_4_layer_model()
         
+        # Knowledge retrieval overlaps with runtime context assembly (both are I/O bound)
+        retrieval: Optional[asyncio.Task] = None
+        query = request.get("message", request.get("prompt", request.get("goal", "")))
+        tenant_id = getattr(context, "tenant_id", None) or self.tenant_id
+        wants_knowledge = runtime_context is None or not runtime_context.knowledge_context
+        if self.retrieves_knowledge_context and wants_knowledge and query and tenant_id:
+            retrieval = asyncio.create_task(self.retrieve_context(query, tenant_id))
+        
         # Layer 3: Use provided runtime context, or assemble if not provided (fallback)
         if runtime_context is None:
             # Fallback: Agent can assemble if orchestrator didn't provide (for backward compatibility)
@@ -198,6 +226,12 @@ class AgentBase:
             # Use provided runtime context (read-only)
             self.logger.debug(f"Using runtime context provided by orchestrator: goal={runtime_context.journey_goal[:50] if runtime_context.journey_goal else 'none'}")
         
+        if retrieval is not None:
+            knowledge = await retrieval
+            if knowledge and not runtime_context.knowledge_context:
+                # Copy rather than mutate: an orchestrator-provided context is read-only
+                runtime_context = dataclasses.replace(runtime_context, knowledge_context=knowledge)
+        
         # Layer 4: Assemble prompt (derived from layers 1-3)
         system_message = self._assemble_system_message(runtime_context)
         user_message = self._assemble_user_message(request, runtime_context)
@@ -330,8 +364,69 @@ class AgentBase:
             if prefs:
                 user_message += f"\n\nPreferences: {', '.join(prefs)}"
         
+        # Add retrieved knowledge if any
+        if runtime_context.knowledge_context:
+            user_message += "\n\nRelevant knowledge:"
+            for item in runtime_context.knowledge_context:
+                user_message += f"\n  - {self._knowledge_snippet(item.get('document', item))}"
+        
         return user_message
     
+    async def retrieve_context(
+        self,
+        query: str,
+        tenant_id: str,
+        limit: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve tenant knowledge relevant to a query (lexical + vector, rank-fused).
+        
+        Knowledge context enriches a prompt; it is never a reason to fail the request,
+        so an unavailable or failing retrieval yields no context (logged).
+        
+        Args:
+            query: Query text (usually the user's message)
+            tenant_id: Tenant identifier
+            limit: Maximum documents (default: knowledge_context_limit)
+            filters: Optional equality filters
+        
+        Returns:
+            Hybrid retrieval results ({"key", "score", "ranks", "document"}), best first
+        """
+        get_retrieval = getattr(self.public_works, "get_hybrid_retrieval_abstraction", None)
+        retrieval = get_retrieval() if get_retrieval is not None else None
+        if retrieval is None:
+            self.logger.debug("Hybrid retrieval not available - no knowledge context")
+            return []
+        
+        try:
+            result = await retrieval.retrieve(
+                query,
+                tenant_id,
+                limit=limit or self.knowledge_context_limit,
+                filters=filters
+            )
+        except Exception as e:
+            self.logger.warning(f"Knowledge retrieval failed for agent {self.agent_id}: {e}")
+            return []
+        
+        self.logger.debug(
+            f"Knowledge context for agent {self.agent_id}: {len(result['results'])} documents, "
+            f"cached={result['cached']}, timings_ms={result['timings_ms']}"
+        )
+        return result["results"]
+    
+    @staticmethod
+    def _knowledge_snippet(document: Dict[str, Any], max_chars: int = 300) -> str:
+        """One-line prompt rendering of a retrieved document."""
+        for field in ("text", "content", "summary", "description", "title", "semantic_meaning"):
+            value = document.get(field)
+            if isinstance(value, str) and value.strip():
+                text = " ".join(value.split())
+                return text if len(text) <= max_chars else text[:max_chars - 3] + "..."
+        return str(document.get("chunk_id") or document.get("id") or "")
+    
     async def _process_with_assembled_prompt(
         self,
         system_message: str,
@@ -481,6 +576,42 @@ class AgentBase:
             except Exception as e:
                 self.logger.debug(f"Telemetry tracking failed (non-critical): {e}")
     
+    async def run_step_graph(
+        self,
+        graph_name: str,
+        steps: List[AgentStep],
+        context: Optional[ExecutionContext] = None,
+        initial: Optional[Dict[str, Any]] = None
+    ) -> StepGraphResult:
+        """
+        Run multi-step reasoning as a dependency graph (independent steps concurrently).
+        
+        Args:
+            graph_name: Pipeline name for logs and telemetry
+            steps: Steps declaring their inputs
+            context: Optional execution context (for telemetry)
+            initial: Seed values steps may name as inputs
+        
+        Returns:
+            StepGraphResult; call raise_for_failures() when every step is required
+        """
+        result = await StepGraph(steps, max_concurrency=self.step_graph_max_concurrency).run(initial)
+        self.logger.info(
+            f"Step graph {graph_name} finished in {result.total_ms}ms "
+            f"(critical path: {' -> '.join(result.critical_path)})"
+        )
+        if self.telemetry_service and context:
+            try:
+                await self.telemetry_service.record_agent_step_graph(
+                    agent_id=self.agent_id,
+                    graph_name=graph_name,
+                    summary=result.to_dict(),
+                    context=context
+                )
+            except Exception as e:
+                self.logger.debug(f"Telemetry tracking failed (non-critical): {e}")
+        return result
+    
     async def get_session_state(
         self,
         session_id: str,
@@ -624,6 +755,16 @@ class AgentBase:
         
         return True
     
+    def _get_llm_response_cache(self, request: Dict[str, Any], cache_ttl_seconds: Optional[int]) -> Optional[Any]:
+        """Response cache for this request, or None if the agent did not opt in or it is not cacheable."""
+        if cache_ttl_seconds is None or cache_ttl_seconds <= 0:
+            return None
+        getter = getattr(self.public_works, "get_llm_response_cache", None)
+        response_cache = getter() if getter is not None else None
+        if response_cache is None or not response_cache.is_cacheable(request):
+            return None
+        return response_cache
+    
     async def _call_llm(
         self,
         prompt: str,
@@ -652,7 +793,8 @@ class AgentBase:
             max_tokens: Maximum tokens (can be overridden by posture)
             temperature: Temperature (can be overridden by posture)
             user_context: Optional user context
-            metadata: Optional metadata for tracking
+            metadata: Optional metadata for tracking ("priority" overrides the LLM gateway lane;
+                      "cache_bypass" skips the response cache lookup but refreshes the entry)
             context: Optional execution context (for telemetry)
         
         Returns:
@@ -670,10 +812,12 @@ class AgentBase:
             raise ValueError("LLM adapter not available - ensure OpenAI adapter is configured")
         
         # Override with posture LLM defaults if available
+        cache_ttl_seconds = self.llm_cache_ttl_seconds
         if self.llm_defaults:
             model = self.llm_defaults.get("model", model)
             max_tokens = self.llm_defaults.get("max_tokens", max_tokens)
             temperature = self.llm_defaults.get("temperature", temperature)
+            cache_ttl_seconds = self.llm_defaults.get("cache_ttl_seconds", cache_ttl_seconds)
         
         # Prepare request with governance metadata
         request = {
@@ -686,19 +830,60 @@ class AgentBase:
             "temperature": temperature
         }
         
+        tenant_id = (context.tenant_id if context else None) or self.tenant_id
+        
+        # Track start time for latency
+        from datetime import datetime
+        start_time = datetime.utcnow()
+        
+        # Identical low-temperature requests from an opted-in agent reuse the stored response
+        response_cache = self._get_llm_response_cache(request, cache_ttl_seconds)
+        cache_key = None
+        if response_cache is not None:
+            cache_key = response_cache.key(request, tenant_id, scope=self.agent_id)
+            if (metadata or {}).get("cache_bypass"):
+                response_cache.record_bypass(self.agent_id)
+            else:
+                cached = await response_cache.get(cache_key)
+                if cached is not None:
+                    content = cached["choices"][0].get("message", {}).get("content", "")
+                    # Cache hits stay in the audit trail, with no provider tokens or cost
+                    self.logger.info(
+                        f"🤖 LLM call via agent {self.agent_id} served from response cache: "
+                        f"model={model}, prompt_length={len(prompt)}"
+                    )
+                    if self.telemetry_service and context:
+                        await self.telemetry_service.record_agent_execution(
+                            agent_id=self.agent_id,
+                            agent_name=getattr(self, 'agent_definition', {}).get('constitution', {}).get('role', self.agent_id) if hasattr(self, 'agent_definition') else self.agent_id,
+                            prompt=prompt,
+                            response=content,
+                            model_name=model,
+                            tokens={"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+                            cost=0.0,
+                            latency_ms=(datetime.utcnow() - start_time).total_seconds() * 1000,
+                            context=context,
+                            success=True,
+                            cached=True
+                        )
+                    return content
+        
         # Track usage (governance)
         self.logger.info(
             f"🤖 LLM call via agent {self.agent_id}: model={model}, "
             f"prompt_length={len(prompt)}, max_tokens={max_tokens}"
         )
         
-        # Track start time for latency
-        from datetime import datetime
-        start_time = datetime.utcnow()
-        
         try:
-            # Call via adapter (with governance)
-            response = await llm_adapter.generate_completion(request)
+            # Call via adapter (with governance): the gateway charges the tenant and queues by lane
+            if isinstance(llm_adapter, LLMGateway):
+                response = await llm_adapter.generate_completion(
+                    request,
+                    tenant_id=tenant_id,
+                    priority=(metadata or {}).get("priority", self.llm_priority)
+                )
+            else:
+                response = await llm_adapter.generate_completion(request)
             
             # Calculate latency
             end_time = datetime.utcnow()
@@ -733,6 +918,8 @@ class AgentBase:
                 raise RuntimeError("LLM call returned no choices")
             
             content = choices[0].get("message", {}).get("content", "")
+            if cache_key is not None:
+                await response_cache.put(cache_key, {"choices": choices[:1]}, cache_ttl_seconds)
             
             # Extract usage info
             usage = response.get("usage", {})
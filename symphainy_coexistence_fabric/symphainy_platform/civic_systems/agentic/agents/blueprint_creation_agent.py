@@ -30,6 +30,7 @@ if str(project_root) not in sys.path:
 from typing import Dict, Any, List, Optional
 from utilities import get_logger
 from ..agent_base import AgentBase
+from ..step_graph import AgentStep
 from ..models.agent_runtime_context import AgentRuntimeContext
 from symphainy_platform.runtime.execution_context import ExecutionContext
 
@@ -48,6 +49,8 @@ class BlueprintCreationAgent(AgentBase):
     not template-driven output.
     """
     
+    llm_cache_ttl_seconds = 3600  # same workflow context -> same analysis
+    
     def __init__(
         self,
         agent_id: str = "blueprint_creation_agent",
@@ -86,7 +89,8 @@ class BlueprintCreationAgent(AgentBase):
         """
         Process blueprint creation request with full LLM reasoning.
         
-        Pattern:
+        Pattern (a step graph; the context lookups run concurrently, as do
+        the responsibility matrix and executive summary):
         1. Gather workflow and coexistence context
         2. Reason about transformation strategy (LLM)
         3. Design intelligent phases (LLM)
@@ -99,65 +103,91 @@ class BlueprintCreationAgent(AgentBase):
         coexistence_analysis_id = request.get("coexistence_analysis_id")
         blueprint_options = request.get("blueprint_options", {})
         
-        # Step 1: Gather context
-        workflow_data = {}
-        if workflow_id:
-            workflow_data = await self.use_tool(
+        async def get_workflow_data() -> Dict[str, Any]:
+            if not workflow_id:
+                return {}
+            return await self.use_tool(
                 "operations_get_workflow",
                 {"workflow_id": workflow_id},
                 context
             ) or {}
         
-        coexistence_data = {}
-        if coexistence_analysis_id:
-            coexistence_data = await self.use_tool(
-                "operations_get_coexistence_analysis",
-                {"analysis_id": coexistence_analysis_id},
-                context
-            ) or {}
-        elif workflow_id:
-            coexistence_data = await self.use_tool(
-                "operations_analyze_coexistence",
-                {"workflow_id": workflow_id},
-                context
-            ) or {}
+        async def get_coexistence_data() -> Dict[str, Any]:
+            if coexistence_analysis_id:
+                return await self.use_tool(
+                    "operations_get_coexistence_analysis",
+                    {"analysis_id": coexistence_analysis_id},
+                    context
+                ) or {}
+            if workflow_id:
+                return await self.use_tool(
+                    "operations_analyze_coexistence",
+                    {"workflow_id": workflow_id},
+                    context
+                ) or {}
+            return {}
         
-        # Get platform context for richer blueprints
-        platform_context = await self._gather_platform_context(context)
-        
-        # Step 2: Reason about transformation strategy (LLM)
-        transformation_strategy = await self._reason_about_transformation(
-            workflow_data=workflow_data,
-            coexistence_data=coexistence_data,
-            platform_context=platform_context,
-            context=context
-        )
-        
-        # Step 3: Design intelligent phases (LLM)
-        phases = await self._design_intelligent_phases(
-            workflow_data=workflow_data,
-            coexistence_data=coexistence_data,
-            transformation_strategy=transformation_strategy,
-            context=context
-        )
-        
-        # Step 4: Create responsibility matrix (LLM)
-        responsibility_matrix = await self._create_intelligent_responsibility_matrix(
-            phases=phases,
-            coexistence_data=coexistence_data,
-            transformation_strategy=transformation_strategy,
-            context=context
-        )
+        steps = [
+            # Step 1: Gather context (platform context for richer blueprints)
+            AgentStep("workflow_data", get_workflow_data),
+            AgentStep("coexistence_data", get_coexistence_data),
+            AgentStep("platform_context", lambda: self._gather_platform_context(context)),
+            # Step 2: Reason about transformation strategy (LLM)
+            AgentStep(
+                "transformation_strategy",
+                lambda workflow_data, coexistence_data, platform_context: self._reason_about_transformation(
+                    workflow_data=workflow_data,
+                    coexistence_data=coexistence_data,
+                    platform_context=platform_context,
+                    context=context
+                ),
+                inputs=("workflow_data", "coexistence_data", "platform_context")
+            ),
+            # Step 3: Design intelligent phases (LLM)
+            AgentStep(
+                "phases",
+                lambda workflow_data, coexistence_data, transformation_strategy: self._design_intelligent_phases(
+                    workflow_data=workflow_data,
+                    coexistence_data=coexistence_data,
+                    transformation_strategy=transformation_strategy,
+                    context=context
+                ),
+                inputs=("workflow_data", "coexistence_data", "transformation_strategy")
+            ),
+            # Step 4: Create responsibility matrix (LLM)
+            AgentStep(
+                "responsibility_matrix",
+                lambda phases, coexistence_data, transformation_strategy: self._create_intelligent_responsibility_matrix(
+                    phases=phases,
+                    coexistence_data=coexistence_data,
+                    transformation_strategy=transformation_strategy,
+                    context=context
+                ),
+                inputs=("phases", "coexistence_data", "transformation_strategy")
+            ),
+            AgentStep(
+                "executive_summary",
+                lambda workflow_data, phases, transformation_strategy: self._generate_executive_summary(
+                    workflow_data, phases, transformation_strategy, context
+                ),
+                inputs=("workflow_data", "phases", "transformation_strategy")
+            ),
+        ]
+        result = await self.run_step_graph("blueprint_creation", steps, context)
+        result.raise_for_failures()
+        transformation_strategy = result.values["transformation_strategy"]
+        phases = result.values["phases"]
         
         # Step 5: Generate presentation-ready blueprint
         blueprint = await self._generate_presentation_blueprint(
-            workflow_data=workflow_data,
-            coexistence_data=coexistence_data,
+            workflow_data=result.values["workflow_data"],
+            coexistence_data=result.values["coexistence_data"],
             phases=phases,
-            responsibility_matrix=responsibility_matrix,
+            responsibility_matrix=result.values["responsibility_matrix"],
             transformation_strategy=transformation_strategy,
             options=blueprint_options,
-            context=context
+            context=context,
+            executive_summary=result.values["executive_summary"]
         )
         
         self.logger.info(f"✅ Blueprint created with {len(phases)} phases")
@@ -599,18 +629,22 @@ Return as JSON with this structure:
         responsibility_matrix: Dict[str, Any],
         transformation_strategy: Dict[str, Any],
         options: Dict[str, Any],
-        context: ExecutionContext
+        context: ExecutionContext,
+        executive_summary: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Generate a presentation-ready blueprint with visual elements.
+        
+        The executive summary is generated here unless already provided.
         """
         # Calculate total duration
         total_weeks = sum(p.get("duration_weeks", 4) for p in phases)
         
         # Generate executive summary using LLM
-        executive_summary = await self._generate_executive_summary(
-            workflow_data, phases, transformation_strategy, context
-        )
+        if executive_summary is None:
+            executive_summary = await self._generate_executive_summary(
+                workflow_data, phases, transformation_strategy, context
+            )
         
         # Build presentation-ready blueprint
         blueprint = {
@@ -34,6 +34,9 @@ class ContentLiaisonAgent(ConversationalAgentBase):
     - Semantic interpretation explanations
     """
     
+    retrieves_knowledge_context = True
+    llm_priority = "interactive"
+    
     def __init__(
         self,
         agent_id: str,
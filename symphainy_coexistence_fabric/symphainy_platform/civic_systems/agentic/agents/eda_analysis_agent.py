@@ -1,5 +1,8 @@
 """
-EDA Analysis Agent Base - Pandas-based EDA and Business Insights
+EDA Analysis Agent Base - Out-of-core EDA and Business Insights
+
+Statistics come from EDAStatisticsService (DuckDB, off the event loop), so
+profiles scale with file size instead of materializing a pandas DataFrame.
 """
 
 import sys
@@ -20,13 +23,14 @@ from typing import Dict, Any, List, Optional
 from ..agent_base import AgentBase
 from ..models.agent_runtime_context import AgentRuntimeContext
 from symphainy_platform.runtime.execution_context import ExecutionContext
+from symphainy_platform.foundations.libraries.statistics import EDAStatisticsService, ProfileOptions
 
 
 class EDAAnalysisAgentBase(AgentBase):
     """
-    Base for EDA analysis agents (pandas-based).
+    Base for EDA analysis agents.
     
-    Purpose: Pandas-based EDA, business insights.
+    Purpose: Out-of-core EDA statistics, business insights.
     """
     
     def __init__(
@@ -44,6 +48,7 @@ class EDAAnalysisAgentBase(AgentBase):
             collaboration_router=collaboration_router,
             **kwargs
         )
+        self.statistics_service = EDAStatisticsService()
     
     async def _process_with_assembled_prompt(
         self,
@@ -91,16 +96,10 @@ class EDAAnalysisAgentBase(AgentBase):
         # Get data
         data = await context.get_state("data") if hasattr(context, 'get_state') else request_data.get("data", {})
         
-        # Load into pandas DataFrame
-        try:
-            import pandas as pd
-            df = pd.DataFrame(data) if isinstance(data, (list, dict)) else pd.DataFrame([data])
-        except ImportError:
-            self.logger.warning("Pandas not available, using basic analysis")
-            df = None
-        
-        # Perform EDA
-        eda_results = await self.perform_eda(df, context) if df is not None else {}
+        # Perform EDA (streamed through the statistics engine; no DataFrame copy)
+        eda_results = await self.perform_eda(
+            data, context, options=ProfileOptions.from_request(request_data.get("sampling"))
+        )
         
         # Generate insights
         insights = await self.generate_insights(eda_results, context)
@@ -130,21 +129,15 @@ class EDAAnalysisAgentBase(AgentBase):
         # 1. Get data (via Runtime State Surface)
         data = await context.get_state("data") if hasattr(context, 'get_state') else request.get("data", {})
         
-        # 2. Load into pandas DataFrame (if data is available)
-        try:
-            import pandas as pd
-            df = pd.DataFrame(data) if isinstance(data, (list, dict)) else pd.DataFrame([data])
-        except ImportError:
-            self.logger.warning("Pandas not available, using basic analysis")
-            df = None
-        
-        # 3. Perform EDA
-        eda_results = await self.perform_eda(df, context) if df is not None else {}
+        # 2. Perform EDA (streamed through the statistics engine; no DataFrame copy)
+        eda_results = await self.perform_eda(
+            data, context, options=ProfileOptions.from_request(request.get("sampling"))
+        )
         
-        # 4. Generate business insights
+        # 3. Generate business insights
         insights = await self.generate_insights(eda_results, context)
         
-        # 5. Return structured output (non-executing)
+        # 4. Return structured output (non-executing)
         return {
             "artifact_type": "proposal",
             "artifact": {
@@ -156,38 +149,89 @@ class EDAAnalysisAgentBase(AgentBase):
     
     async def get_agent_description(self) -> str:
         """Get agent description."""
-        return f"EDA Analysis agent ({self.agent_id}) - Pandas-based EDA and business insights"
+        return f"EDA Analysis agent ({self.agent_id}) - Out-of-core EDA and business insights"
     
     async def perform_eda(
         self,
-        df: Any,  # pandas.DataFrame
-        context: ExecutionContext
+        data: Any,
+        context: ExecutionContext,
+        options: Optional[ProfileOptions] = None
     ) -> Dict[str, Any]:
         """
-        Perform EDA analysis (abstract method).
+        Perform EDA analysis.
         
-        Subclasses should implement this.
+        Accepts parsed rows (list of dicts, or a dict with "rows"/"columns") or
+        a pandas DataFrame. Statistics are computed by EDAStatisticsService in a
+        worker thread. A string is inline content (one value), never a file path:
+        agent input must not choose what the server reads from disk.
         
         Args:
-            df: Pandas DataFrame
+            data: Rows or DataFrame
             context: Execution context
+            options: Profiling options (sampling mode, top-k, memory limit)
         
         Returns:
-            EDA results dictionary
+            EDA results dictionary (shape, columns, dtypes, null_counts,
+            numeric_summary, plus the full "profile")
         """
-        # Default implementation: Basic statistics
-        if df is None:
+        if data is None or (isinstance(data, (list, dict)) and not data):
             return {}
         
         try:
-            return {
-                "shape": df.shape if hasattr(df, 'shape') else None,
-                "columns": list(df.columns) if hasattr(df, 'columns') else [],
-                "dtypes": str(df.dtypes) if hasattr(df, 'dtypes') else None
-            }
+            profile = await self._profile(data, options)
         except Exception as e:
-            self.logger.warning(f"EDA analysis failed: {e}")
-            return {}
+            # Details stay in the log: engine errors can quote the data or files they touched
+            self.logger.error(f"EDA analysis failed: {e}", exc_info=True)
+            return {"error": "EDA analysis failed", "error_type": type(e).__name__}
+        
+        return self.summarize_profile(profile)
+    
+    async def _profile(self, data: Any, options: Optional[ProfileOptions]) -> Dict[str, Any]:
+        """Route data to the matching EDAStatisticsService entry point."""
+        if isinstance(data, str):
+            return await self.statistics_service.profile_rows([data], options=options)
+        if hasattr(data, "columns") and hasattr(data, "dtypes"):
+            return await self.statistics_service.profile_dataframe(data, options=options)
+        rows, columns = EDAStatisticsService.extract_rows(data)
+        if not rows and isinstance(data, dict):
+            rows = [data]
+        return await self.statistics_service.profile_rows(rows, columns=columns, options=options)
+    
+    @staticmethod
+    def summarize_profile(profile: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Project a column profile onto the EDA result shape insights are built from.
+        
+        Args:
+            profile: Profile from EDAStatisticsService
+        
+        Returns:
+            EDA results dictionary
+        """
+        columns = profile.get("columns", {})
+        numeric_summary = {}
+        for name, stats in columns.items():
+            if "mean" not in stats:
+                continue
+            quantiles = stats.get("quantiles") or {}
+            numeric_summary[name] = {
+                "count": stats.get("non_null"),
+                "mean": stats.get("mean"),
+                "std": stats.get("stddev"),
+                "min": stats.get("min"),
+                "25%": quantiles.get("p25"),
+                "50%": quantiles.get("p50"),
+                "75%": quantiles.get("p75"),
+                "max": stats.get("max"),
+            }
+        return {
+            "shape": (profile.get("row_count", 0), profile.get("column_count", 0)),
+            "columns": list(columns.keys()),
+            "dtypes": {name: stats.get("type") for name, stats in columns.items()},
+            "null_counts": {name: stats.get("null_count", 0) for name, stats in columns.items()},
+            "numeric_summary": numeric_summary,
+            "profile": profile,
+        }
     
     async def generate_insights(
         self,
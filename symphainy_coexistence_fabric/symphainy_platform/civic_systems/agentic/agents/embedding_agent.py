@@ -22,7 +22,9 @@ for _ in range(10):  # Max 10 levels up
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from typing import Dict, Any, Optional, List
+import asyncio
+import hashlib
+from typing import Dict, Any, Optional, List, Set
 from datetime import datetime
 import uuid
 
@@ -40,8 +42,14 @@ class EmbeddingService:
     1. metadata_embedding: Column name + data type + structure
     2. meaning_embedding: Semantic meaning (inferred via LLM)
     3. samples_embedding: Representative sample values
+    
+    Columns are processed concurrently (bounded by COLUMN_CONCURRENCY) so their
+    embedding requests are coalesced into batched provider calls.
     """
     
+    # Columns embedded concurrently (each also makes one meaning-inference LLM call)
+    COLUMN_CONCURRENCY = 16
+    
     def __init__(self, public_works: Optional[Any] = None):
         """
         Initialize Embedding Service.
@@ -138,7 +146,8 @@ class EmbeddingService:
             n: Sample every nth row (default: 10)
         
         Returns:
-            Dict with embedding_id, embeddings_count, and metadata
+            Dict with embedding_id, embeddings_count (stored), status ("success", "partial" or
+            "failed"), failed_columns (column_name, error, error_type) and metadata
         """
         self.logger.info(f"Creating semantic embeddings from deterministic_embedding_id: {deterministic_embedding_id}")
         
@@ -171,11 +180,11 @@ class EmbeddingService:
         # 4. Sample representative rows (every nth row)
         sampled_data = self._sample_representative(parsed_content, n=n)
         
-        # 5. Create embeddings for each column
-        embeddings = []
+        # 5. Create embeddings for each column (concurrently; embeddings are batched)
         content_id = generate_event_id()
+        column_limit = asyncio.Semaphore(self.COLUMN_CONCURRENCY)
         
-        for col in schema:
+        async def embed_column(col: Dict[str, Any]) -> Dict[str, Any]:
             col_name = col.get("name")
             col_type = col.get("type", "unknown")
             
@@ -192,15 +201,16 @@ class EmbeddingService:
                 ]
             
             # Create 3 embeddings per column
-            column_embeddings = await self._create_column_embeddings(
-                column_name=col_name,
-                column_type=col_type,
-                sample_values=sample_values,
-                context=context
-            )
+            async with column_limit:
+                column_embeddings = await self._create_column_embeddings(
+                    column_name=col_name,
+                    column_type=col_type,
+                    sample_values=sample_values,
+                    context=context
+                )
             
             # Create embedding document
-            embedding_doc = {
+            return {
                 "_key": generate_event_id(),
                 "content_id": content_id,
                 "parsed_file_id": parsed_file_id,
@@ -217,21 +227,48 @@ class EmbeddingService:
                 "session_id": context.session_id,
                 "created_at": datetime.utcnow().isoformat()
             }
-            
-            embeddings.append(embedding_doc)
         
-        # 6. Store via SemanticDataAbstraction
-        if self.vector_store:
-            storage_result = await self.vector_store.store_semantic_embeddings(
-                embedding_documents=embeddings
-            )
-            self.logger.info(f"✅ Stored {storage_result.get('stored_count', 0)} semantic embeddings")
-        else:
+        embeddings = list(await asyncio.gather(*(embed_column(col) for col in schema)))
+        
+        # 6. Store via SemanticDataAbstraction; failures are reported per column
+        failed_columns: List[Dict[str, Any]] = []
+        if embeddings and self.vector_store:
+            try:
+                storage_result = await self.vector_store.store_semantic_embeddings(
+                    embedding_documents=embeddings
+                )
+                failed_keys = set(storage_result.get("failed_keys") or [])
+                failed_columns = [
+                    {"column_name": doc["column_name"], "error": "Storage failed: rejected by bulk import", "error_type": "StorageError"}
+                    for doc in embeddings if doc["_key"] in failed_keys
+                ]
+                if not storage_result.get("success", True) and not failed_keys:
+                    raise RuntimeError("bulk import reported failure without failed keys")
+            except Exception as e:
+                self.logger.error(f"Failed to store semantic embeddings: {e}", exc_info=True)
+                failed_columns = [
+                    {"column_name": doc["column_name"], "error": f"Storage failed: {str(e)}", "error_type": "StorageError"}
+                    for doc in embeddings
+                ]
+        elif embeddings:
             self.logger.warning("Vector store not available - embeddings not stored")
+            failed_columns = [
+                {"column_name": doc["column_name"], "error": "SemanticDataAbstraction not available", "error_type": "ConfigurationError"}
+                for doc in embeddings
+            ]
+        
+        stored_count = len(embeddings) - len(failed_columns)
+        status = "success" if not failed_columns else ("partial" if stored_count else "failed")
+        self.logger.info(
+            f"Semantic embeddings for {parsed_file_id}: {stored_count} stored, "
+            f"{len(failed_columns)} failed (status={status})"
+        )
         
         return {
             "embedding_id": content_id,
-            "embeddings_count": len(embeddings),
+            "embeddings_count": stored_count,
+            "status": status,
+            "failed_columns": failed_columns,
             "deterministic_embedding_id": deterministic_embedding_id,
             "parsed_file_id": parsed_file_id,
             "columns_processed": len(schema)
@@ -259,21 +296,25 @@ class EmbeddingService:
         if not self.embedding_agent:
             raise ValueError("StatelessEmbeddingAgent not available")
         
-        # 1. Metadata embedding (column name + type)
+        # 1. Metadata embedding (column name + type) and 4. samples embedding
+        # (representative sample values) do not depend on the inferred meaning,
+        # so they are requested together while 2. semantic meaning is inferred.
         metadata_text = f"Column: {column_name}, Type: {column_type}"
-        metadata_result = await self.embedding_agent.generate_embedding(
-            text=metadata_text,
-            context=context
+        samples_text = f"Sample values: {', '.join(sample_values[:5])}" if sample_values else "No samples"
+        (metadata_result, samples_result), semantic_meaning = await asyncio.gather(
+            self.embedding_agent.generate_embeddings(
+                texts=[metadata_text, samples_text],
+                context=context
+            ),
+            self._infer_semantic_meaning(
+                column_name=column_name,
+                column_type=column_type,
+                sample_values=sample_values,
+                context=context
+            )
         )
         metadata_embedding = metadata_result.get("embedding", [])
-        
-        # 2. Semantic meaning (inferred via LLM via agent)
-        semantic_meaning = await self._infer_semantic_meaning(
-            column_name=column_name,
-            column_type=column_type,
-            sample_values=sample_values,
-            context=context
-        )
+        samples_embedding = samples_result.get("embedding", [])
         
         # 3. Meaning embedding (from semantic meaning text)
         meaning_result = await self.embedding_agent.generate_embedding(
@@ -282,14 +323,6 @@ class EmbeddingService:
         )
         meaning_embedding = meaning_result.get("embedding", [])
         
-        # 4. Samples embedding (representative sample values)
-        samples_text = f"Sample values: {', '.join(sample_values[:5])}" if sample_values else "No samples"
-        samples_result = await self.embedding_agent.generate_embedding(
-            text=samples_text,
-            context=context
-        )
-        samples_embedding = samples_result.get("embedding", [])
-        
         return {
             "metadata_embedding": metadata_embedding,
             "meaning_embedding": meaning_embedding,
@@ -470,85 +503,49 @@ What does this column represent? Return ONLY a concise description (1-5 words)."
         if not llm_adapter:
             raise ValueError("LLM adapter not available for embedding generation")
         
-        # Process each chunk
+        from symphainy_platform.foundations.libraries.chunking.deterministic_chunking_service import DeterministicChunk
+        
+        # Validate chunks
         embedding_documents = []
+        pending_chunks = []
         
         for chunk in chunks:
             try:
-                # Import DeterministicChunk to check type
-                from .deterministic_chunking_service import DeterministicChunk
-                
                 # Validate chunk type
                 if not isinstance(chunk, DeterministicChunk):
                     raise ValueError(f"Invalid chunk type: {type(chunk)}")
-                
-                # Idempotency check (CTO principle)
-                if await self._chunk_embedding_exists(
-                    chunk_id=chunk.chunk_id,
-                    semantic_profile=semantic_profile,
-                    model_name=model_name,
-                    semantic_version=semantic_version
-                ):
-                    self.logger.debug(
-                        f"Chunk {chunk.chunk_id} already embedded "
-                        f"(profile={semantic_profile}, model={model_name})"
-                    )
-                    results["embedded_chunk_ids"].append(chunk.chunk_id)
-                    continue  # Skip if already embedded
-                
-                # Create embedding via LLM adapter
-                embedding_vector = await self._create_embedding_vector(
-                    text=chunk.text,
+                pending_chunks.append(chunk)
+            except Exception as e:
+                self._record_chunk_failure(results, chunk, e)
+        
+        # One bulk cache lookup per file, keyed by chunk.text_hash; hits are then
+        # served in-process when the chunks are embedded below
+        embedding_cache = self.public_works.get_embedding_cache() if hasattr(self.public_works, "get_embedding_cache") else None
+        if embedding_cache is not None and pending_chunks:
+            cached = await embedding_cache.get_many([chunk.text_hash for chunk in pending_chunks], model_name)
+            results["cache_hits"] = len(cached)
+        
+        # Create embeddings for all remaining chunks in batched provider calls
+        vectors: List[List[float]] = []
+        if pending_chunks:
+            try:
+                vectors = await self._create_embedding_vectors(
+                    texts=[chunk.text for chunk in pending_chunks],
                     model_name=model_name,
-                    llm_adapter=llm,
+                    llm_adapter=llm_adapter,
                     context=context
                 )
-                
-                # Create embedding document (stores by reference, not blob - CTO principle)
-                embedding_doc = {
-                    "_key": generate_event_id(),  # Unique document key
-                    "chunk_id": chunk.chunk_id,  # Reference to deterministic chunk
-                    "chunk_index": chunk.chunk_index,
-                    "source_path": chunk.source_path,
-                    "text_hash": chunk.text_hash,
-                    "structural_type": chunk.structural_type,
-                    "embedding": embedding_vector,  # Vector embedding
-                    "semantic_profile": semantic_profile,
-                    "model_name": model_name,
-                    "semantic_version": semantic_version,  # Platform-controlled (CTO principle)
-                    "schema_fingerprint": chunk.schema_fingerprint,  # Link to schema-level
-                    "pattern_hints": chunk.pattern_hints,
-                    "tenant_id": tenant_id,
-                    "session_id": context.session_id if context else None,
-                    "metadata": {
-                        "chunk_index": chunk.chunk_index,
-                        "source_path": chunk.source_path,
-                        "text_hash": chunk.text_hash,
-                        "structural_type": chunk.structural_type,
-                        "schema_fingerprint": chunk.schema_fingerprint,
-                        "file_id": chunk.metadata.get("file_id") if chunk.metadata else None,
-                        "parsed_file_id": chunk.metadata.get("parsed_file_id") if chunk.metadata else None,
-                        "created_at": datetime.utcnow().isoformat()
-                    }
-                }
-                
-                embedding_documents.append(embedding_doc)
-                results["embedded_chunk_ids"].append(chunk.chunk_id)
-                
             except Exception as e:
-                # Explicit failure handling (CIO Gap 3)
-                error_info = {
-                    "chunk_id": chunk.chunk_id if hasattr(chunk, 'chunk_id') else "unknown",
-                    "chunk_index": chunk.chunk_index if hasattr(chunk, 'chunk_index') else "unknown",
-                    "error": str(e),
-                    "error_type": type(e).__name__
-                }
-                results["failed_chunks"].append(error_info)
-                results["status"] = "partial" if results["embedded_chunk_ids"] else "failed"
-                self.logger.error(
-                    f"Failed to create embedding for chunk {error_info['chunk_id']}: {e}",
-                    exc_info=True
-                )
+                for chunk in pending_chunks:
+                    self._record_chunk_failure(results, chunk, e)
+                pending_chunks = []
+        
+        for chunk, embedding_vector in zip(pending_chunks, vectors):
+            embedding_doc = self._chunk_embedding_document(
+                chunk, embedding_vector, semantic_profile, model_name, semantic_version, tenant_id, context
+            )
+            embedding_documents.append(embedding_doc)
+            results["embedded_chunk_ids"].append(chunk.chunk_id)
         
         # Store embeddings via SemanticDataAbstraction (if any succeeded)
         if embedding_documents and self.vector_store:
@@ -560,6 +557,21 @@ What does this column represent? Return ONLY a concise description (1-5 words)."
                     f"✅ Stored {storage_result.get('stored_count', 0)} chunk embeddings "
                     f"(profile={semantic_profile}, model={model_name})"
                 )
+                # Bulk import reports failures per document; only those chunks failed
+                failed_keys = set(storage_result.get("failed_keys") or [])
+                for doc in embedding_documents:
+                    if doc["_key"] not in failed_keys:
+                        continue
+                    results["failed_chunks"].append({
+                        "chunk_id": doc.get("chunk_id"),
+                        "chunk_index": doc.get("chunk_index"),
+                        "error": "Storage failed: rejected by bulk import",
+                        "error_type": "StorageError"
+                    })
+                    if doc.get("chunk_id") in results["embedded_chunk_ids"]:
+                        results["embedded_chunk_ids"].remove(doc.get("chunk_id"))
+                if failed_keys:
+                    results["status"] = "partial" if results["embedded_chunk_ids"] else "failed"
             except Exception as e:
                 self.logger.error(f"Failed to store chunk embeddings: {e}", exc_info=True)
                 # Mark all as failed if storage fails
@@ -598,40 +610,242 @@ What does this column represent? Return ONLY a concise description (1-5 words)."
         
         return results
     
-    async def _chunk_embedding_exists(
+    async def create_incremental_chunk_embeddings(
         self,
-        chunk_id: str,
+        parsed_content: Dict[str, Any],
+        file_id: str,
+        parsed_file_id: str,
+        semantic_profile: str = "default",
+        model_name: str = "text-embedding-ada-002",
+        semantic_version: str = "1.0.0",
+        tenant_id: str = None,
+        context: Optional[ExecutionContext] = None
+    ) -> Dict[str, Any]:
+        """
+        Chunk a parsed file and embed only chunks not already embedded for this file.
+        
+        Chunks are diffed against the chunk manifest of the file's previous parse (kept per
+        profile / model / version); unchanged chunks keep their stored embedding documents
+        (same chunk_id, same key) and moved chunks (same text, new position) get their stored
+        vector re-keyed instead of re-embedded. The new manifest leaves out chunks that failed,
+        so the next run retries them.
+        
+        Returns:
+            create_chunk_embeddings result plus chunk_count, unchanged_chunk_ids,
+            rekeyed_chunk_ids, removed_chunk_ids (no longer in the file) and previous_parsed_file_id
+        """
+        if not tenant_id and context:
+            tenant_id = context.tenant_id
+        
+        if not tenant_id:
+            raise ValueError("tenant_id is required (provide directly or via context)")
+        
+        from symphainy_platform.foundations.libraries.chunking.deterministic_chunking_service import DeterministicChunkingService
+        
+        chunking_service = DeterministicChunkingService(public_works=self.public_works)
+        chunk_diff = await chunking_service.diff_chunks(
+            parsed_content=parsed_content,
+            file_id=file_id,
+            tenant_id=tenant_id,
+            parsed_file_id=parsed_file_id,
+            embedding_profile=f"{semantic_profile}|{model_name}|{semantic_version}"
+        )
+        
+        rekeyed_ids = await self._rekey_moved_chunk_embeddings(
+            chunk_diff, semantic_profile, model_name, semantic_version, tenant_id, context
+        )
+        # Moved chunks whose stored vector could not be re-keyed are embedded again
+        to_embed = chunk_diff.changed + [
+            chunk for chunk in chunk_diff.chunks
+            if chunk.chunk_id in chunk_diff.moved and chunk.chunk_id not in rekeyed_ids
+        ]
+        
+        if to_embed:
+            results = await self.create_chunk_embeddings(
+                chunks=to_embed,
+                semantic_profile=semantic_profile,
+                model_name=model_name,
+                semantic_version=semantic_version,
+                tenant_id=tenant_id,
+                context=context
+            )
+        else:
+            results = {
+                "status": "success",
+                "embedded_chunk_ids": [],
+                "failed_chunks": [],
+                "semantic_profile": semantic_profile,
+                "model_name": model_name,
+                "semantic_version": semantic_version
+            }
+        
+        failed_ids = {failure.get("chunk_id") for failure in results["failed_chunks"]}
+        if chunk_diff.chunks:
+            await chunking_service.save_chunk_manifest(chunk_diff, exclude_chunk_ids=failed_ids)
+        
+        results.update({
+            "chunk_count": len(chunk_diff.chunks),
+            "unchanged_chunk_ids": chunk_diff.unchanged_chunk_ids,
+            "rekeyed_chunk_ids": sorted(rekeyed_ids),
+            "removed_chunk_ids": chunk_diff.removed_chunk_ids,
+            "previous_parsed_file_id": chunk_diff.previous_parsed_file_id
+        })
+        self.logger.info(
+            f"Incremental chunk embeddings for {parsed_file_id}: {len(results['embedded_chunk_ids'])} embedded, "
+            f"{len(rekeyed_ids)} re-keyed, {len(chunk_diff.unchanged_chunk_ids)} unchanged of {len(chunk_diff.chunks)} chunks"
+        )
+        return results
+    
+    async def _rekey_moved_chunk_embeddings(
+        self,
+        chunk_diff: Any,
         semantic_profile: str,
         model_name: str,
-        semantic_version: str
-    ) -> bool:
+        semantic_version: str,
+        tenant_id: str,
+        context: Optional[ExecutionContext]
+    ) -> Set[str]:
         """
-        Check if chunk embedding already exists (idempotency check).
+        Store the vectors of moved chunks (same text, new position) under their new chunk IDs.
+        
+        One lookup for all their previous documents and one bulk store; a chunk whose previous
+        document is missing, or whose store fails, is left out (the caller embeds it).
         
-        CTO Principle: Idempotent - won't re-embed existing chunks
+        Returns:
+            chunk_ids now stored with a re-keyed vector
         """
-        if not self.vector_store:
-            raise RuntimeError(
-                "Vector store not wired; cannot check existing embeddings. Platform contract §8A."
-            )
+        if not chunk_diff.moved or not self.vector_store:
+            return set()
         
+        previous_keys = {
+            chunk_id: self._chunk_embedding_key(previous_id, semantic_profile, model_name, semantic_version)
+            for chunk_id, previous_id in chunk_diff.moved.items()
+        }
         try:
-            # Query for existing embedding with matching criteria
-            existing_embeddings = await self.vector_store.get_semantic_embeddings(
-                filter_conditions={
-                    "chunk_id": chunk_id,
-                    "semantic_profile": semantic_profile,
-                    "model_name": model_name,
-                    "semantic_version": semantic_version
-                },
-                limit=1
+            stored = await self.vector_store.get_semantic_embeddings_by_keys(list(previous_keys.values()))
+        except Exception as e:
+            self.logger.warning(f"Could not read embeddings of moved chunks, embedding them again: {e}")
+            return set()
+        vectors = {doc["_key"]: doc.get("embedding") for doc in stored if doc.get("embedding")}
+        
+        documents = [
+            self._chunk_embedding_document(
+                chunk, vectors[previous_keys[chunk.chunk_id]], semantic_profile, model_name, semantic_version, tenant_id, context
             )
-            
-            return len(existing_embeddings) > 0
-            
+            for chunk in chunk_diff.chunks
+            if chunk.chunk_id in previous_keys and previous_keys[chunk.chunk_id] in vectors
+        ]
+        if not documents:
+            return set()
+        try:
+            storage_result = await self.vector_store.store_semantic_embeddings(embedding_documents=documents)
         except Exception as e:
-            self.logger.debug(f"Error checking for existing embedding: {e}")
-            return False  # If check fails, proceed with creation
+            self.logger.warning(f"Could not store re-keyed chunk embeddings, embedding them again: {e}")
+            return set()
+        failed_keys = set(storage_result.get("failed_keys") or [])
+        return {doc["chunk_id"] for doc in documents if doc["_key"] not in failed_keys}
+    
+    def _chunk_embedding_document(
+        self,
+        chunk: Any,
+        embedding_vector: List[float],
+        semantic_profile: str,
+        model_name: str,
+        semantic_version: str,
+        tenant_id: str,
+        context: Optional[ExecutionContext]
+    ) -> Dict[str, Any]:
+        """Embedding document for a chunk (stores by reference, not blob - CTO principle)."""
+        return {
+            # Deterministic key: re-embedding a chunk replaces its document (idempotent, CTO principle)
+            "_key": self._chunk_embedding_key(chunk.chunk_id, semantic_profile, model_name, semantic_version),
+            "chunk_id": chunk.chunk_id,  # Reference to deterministic chunk
+            "chunk_index": chunk.chunk_index,
+            "source_path": chunk.source_path,
+            "text_hash": chunk.text_hash,
+            "structural_type": chunk.structural_type,
+            "embedding": embedding_vector,  # Vector embedding
+            "semantic_profile": semantic_profile,
+            "model_name": model_name,
+            "semantic_version": semantic_version,  # Platform-controlled (CTO principle)
+            "schema_fingerprint": chunk.schema_fingerprint,  # Link to schema-level
+            "pattern_hints": chunk.pattern_hints,
+            "tenant_id": tenant_id,
+            "session_id": context.session_id if context else None,
+            "metadata": {
+                "chunk_index": chunk.chunk_index,
+                "source_path": chunk.source_path,
+                "text_hash": chunk.text_hash,
+                "structural_type": chunk.structural_type,
+                "schema_fingerprint": chunk.schema_fingerprint,
+                "file_id": chunk.metadata.get("file_id") if chunk.metadata else None,
+                "parsed_file_id": chunk.metadata.get("parsed_file_id") if chunk.metadata else None,
+                "created_at": datetime.utcnow().isoformat()
+            }
+        }
+    
+    def _record_chunk_failure(self, results: Dict[str, Any], chunk: Any, error: Exception) -> None:
+        """Record an explicit per-chunk failure (CIO Gap 3)."""
+        error_info = {
+            "chunk_id": chunk.chunk_id if hasattr(chunk, 'chunk_id') else "unknown",
+            "chunk_index": chunk.chunk_index if hasattr(chunk, 'chunk_index') else "unknown",
+            "error": str(error),
+            "error_type": type(error).__name__
+        }
+        results["failed_chunks"].append(error_info)
+        results["status"] = "partial" if results["embedded_chunk_ids"] else "failed"
+        self.logger.error(
+            f"Failed to create embedding for chunk {error_info['chunk_id']}: {error}",
+            exc_info=error
+        )
+    
+    @staticmethod
+    def _chunk_embedding_key(
+        chunk_id: str,
+        semantic_profile: str,
+        model_name: str,
+        semantic_version: str
+    ) -> str:
+        """
+        Stable embedding document key for a chunk.
+        
+        CTO Principle: Idempotent - storing the same chunk embedding again replaces it
+        instead of creating a duplicate, so no per-chunk existence query is needed.
+        """
+        identity = f"{chunk_id}|{semantic_profile}|{model_name}|{semantic_version}"
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+    
+    async def _create_embedding_vectors(
+        self,
+        texts: List[str],
+        model_name: str,
+        llm_adapter: Any,
+        context: Optional[ExecutionContext] = None
+    ) -> List[List[float]]:
+        """
+        Create embedding vectors for several texts in batched provider calls.
+        
+        Adapters exposing embed_many (LLM protocol) or an embedding engine batch
+        directly; otherwise texts are embedded concurrently, which the provider
+        adapter's embedding engine still coalesces.
+        
+        Returns:
+            One vector per text, in order
+        """
+        if hasattr(llm_adapter, 'embed_many'):
+            results = await llm_adapter.embed_many(contents=texts, model=model_name)
+            return [list(result.get("embedding", [])) for result in results]
+        if hasattr(llm_adapter, 'embedding_engine'):
+            return await llm_adapter.embedding_engine.embed_many(texts, model_name)
+        return list(await asyncio.gather(*(
+            self._create_embedding_vector(
+                text=text,
+                model_name=model_name,
+                llm_adapter=llm_adapter,
+                context=context
+            )
+            for text in texts
+        )))
     
     async def _create_embedding_vector(
         self,
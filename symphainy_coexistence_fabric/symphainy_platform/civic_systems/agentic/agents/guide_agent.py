@@ -9,6 +9,7 @@ HOW (Agent Implementation): I analyze user intent, provide navigation guidance,
 Key Principle: Global concierge - helps users understand platform capabilities and navigate to appropriate pillars.
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -44,6 +45,10 @@ class GuideAgent(AgentBase):
     - Routing to pillar liaison agents
     """
     
+    retrieves_knowledge_context = True
+    llm_priority = "interactive"
+    llm_cache_ttl_seconds = 600  # discovery prompts repeat across similar sessions
+    
     def __init__(
         self,
         agent_id: str = "guide_agent",
@@ -306,12 +311,15 @@ class GuideAgent(AgentBase):
             context: Execution context
         
         Returns:
-            Dict with response and guidance
+            Dict with response, guidance and retrieved knowledge_context
         """
         self.logger.info(f"Processing chat message in session {session_id}")
         
-        # Get user state from session
-        user_state = await self._get_user_state(session_id, tenant_id, context)
+        # Get user state from session and relevant tenant knowledge concurrently
+        user_state, knowledge_context = await asyncio.gather(
+            self._get_user_state(session_id, tenant_id, context),
+            self.retrieve_context(message, tenant_id)
+        )
         
         # Analyze user intent
         intent_analysis = await self.analyze_user_intent(
@@ -358,7 +366,8 @@ class GuideAgent(AgentBase):
             "intent_analysis": intent_analysis,
             "journey_guidance": journey_guidance,
             "routing_info": routing_info,
-            "user_state": user_state
+            "user_state": user_state,
+            "knowledge_context": knowledge_context
         }
     
     async def _generate_guidance_response(
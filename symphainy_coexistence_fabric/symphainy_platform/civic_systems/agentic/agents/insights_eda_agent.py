@@ -1,7 +1,7 @@
 """
 Insights EDA Agent - EDA Analysis Agent for Insights Realm
 
-Pandas-based EDA analysis agent that provides business insights.
+EDA analysis agent that provides business insights from out-of-core column profiles.
 """
 
 import sys
@@ -21,6 +21,7 @@ if str(project_root) not in sys.path:
 from typing import Dict, Any, List
 
 from .eda_analysis_agent import EDAAnalysisAgentBase
+from symphainy_platform.foundations.libraries.statistics import ProfileOptions
 from symphainy_platform.runtime.execution_context import ExecutionContext
 
 
@@ -51,11 +52,17 @@ class InsightsEDAAgent(EDAAnalysisAgentBase):
         """
         Perform EDA analysis and generate business insights.
         """
-        # Get data from request or context
-        data = request.get("data", {})
-        
-        # Perform EDA
-        eda_results = await self.perform_eda(data, context)
+        # Reuse a profile the caller already computed; otherwise profile the data
+        profile = request.get("statistical_profile")
+        if profile:
+            eda_results = self.summarize_profile(profile)
+        else:
+            data = request.get("data")
+            if data is None:
+                data = request.get("content", {})
+            eda_results = await self.perform_eda(
+                data, context, options=ProfileOptions.from_request(request.get("sampling"))
+            )
         
         # Generate business insights
         insights = await self.generate_insights(eda_results, context)
@@ -71,43 +78,7 @@ class InsightsEDAAgent(EDAAnalysisAgentBase):
     
     async def get_agent_description(self) -> str:
         """Get agent description."""
-        return f"Insights EDA Agent ({self.agent_id}) - Pandas-based EDA and business insights"
-    
-    async def perform_eda(
-        self,
-        df: Any,  # pandas.DataFrame
-        context: ExecutionContext
-    ) -> Dict[str, Any]:
-        """
-        Perform EDA analysis.
-        """
-        try:
-            import pandas as pd
-            
-            if df is None or not isinstance(df, pd.DataFrame):
-                return {"error": "No data provided or invalid DataFrame"}
-            
-            # Basic EDA statistics
-            eda_results = {
-                "shape": df.shape,
-                "columns": list(df.columns),
-                "dtypes": df.dtypes.to_dict(),
-                "null_counts": df.isnull().sum().to_dict(),
-                "numeric_summary": df.describe().to_dict() if len(df.select_dtypes(include=['number']).columns) > 0 else {}
-            }
-            
-            return eda_results
-            
-        except ImportError:
-            self.logger.warning("Pandas not available, using basic analysis")
-            return {
-                "shape": None,
-                "columns": list(df.keys()) if isinstance(df, dict) else [],
-                "dtypes": None
-            }
-        except Exception as e:
-            self.logger.error(f"EDA analysis failed: {e}", exc_info=True)
-            return {"error": str(e)}
+        return f"Insights EDA Agent ({self.agent_id}) - Out-of-core EDA and business insights"
     
     async def generate_insights(
         self,
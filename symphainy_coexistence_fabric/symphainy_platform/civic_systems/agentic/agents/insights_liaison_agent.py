@@ -44,6 +44,9 @@ class InsightsLiaisonAgent(AgentBase):
     - Recommendations
     """
     
+    retrieves_knowledge_context = True
+    llm_priority = "interactive"
+    
     def __init__(self, public_works: Optional[Any] = None, **kwargs):
         """
         Initialize Insights Liaison Agent.
@@ -45,6 +45,9 @@ class OperationsLiaisonAgent(AgentBase):
     - SOP refinement through chat
     """
     
+    retrieves_knowledge_context = True
+    llm_priority = "interactive"
+    
     def __init__(
         self,
         agent_definition_id: str = "operations_liaison_agent",
@@ -43,6 +43,9 @@ class OutcomesLiaisonAgent(AgentBase):
     ARCHITECTURAL PRINCIPLE: Liaison agents explain, guide, and request - but never execute.
     """
     
+    retrieves_knowledge_context = True
+    llm_priority = "interactive"
+    
     def __init__(
         self,
         agent_definition_id: str = "outcomes_liaison_agent",
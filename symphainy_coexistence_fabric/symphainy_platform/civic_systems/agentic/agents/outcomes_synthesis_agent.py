@@ -28,6 +28,7 @@ from datetime import datetime
 from utilities import get_logger
 from symphainy_platform.runtime.execution_context import ExecutionContext
 from symphainy_platform.civic_systems.agentic.agent_base import AgentBase
+from symphainy_platform.civic_systems.agentic.step_graph import AgentStep
 from symphainy_platform.civic_systems.agentic.models.agent_runtime_context import AgentRuntimeContext
 
 
@@ -229,20 +230,25 @@ class OutcomesSynthesisAgent(AgentBase):
         insights_summary = request.get("insights_summary", {})
         journey_summary = request.get("journey_summary", {})
         
-        # Step 1: Reason about visualization design (LLM)
-        visualization_reasoning = await self._reason_about_visualization_design(
-            content_summary=content_summary,
-            insights_summary=insights_summary,
-            journey_summary=journey_summary,
-            context=context
-        )
-        
-        # Step 2: Design tutorial content for Data Mash (LLM)
-        tutorial_content = await self._design_data_mash_tutorial(
-            content_summary=content_summary,
-            reasoning=visualization_reasoning,
-            context=context
-        )
+        # Steps 1 and 2 are independent LLM calls and run concurrently
+        steps = [
+            # Step 1: Reason about visualization design (LLM)
+            AgentStep("visualization_reasoning", lambda: self._reason_about_visualization_design(
+                content_summary=content_summary,
+                insights_summary=insights_summary,
+                journey_summary=journey_summary,
+                context=context
+            )),
+            # Step 2: Design tutorial content for Data Mash (LLM)
+            AgentStep("tutorial_content", lambda: self._design_data_mash_tutorial(
+                content_summary=content_summary,
+                context=context
+            )),
+        ]
+        result = await self.run_step_graph("summary_visuals", steps, context)
+        result.raise_for_failures()
+        visualization_reasoning = result.values["visualization_reasoning"]
+        tutorial_content = result.values["tutorial_content"]
         
         # Step 3: Use ReportGeneratorService as tool
         visuals_result = await self.use_tool(
@@ -389,8 +395,8 @@ What should each pillar visualization show? How to make it educational?"""
     async def _design_data_mash_tutorial(
         self,
         content_summary: Dict[str, Any],
-        reasoning: Dict[str, Any],
-        context: ExecutionContext
+        context: ExecutionContext,
+        reasoning: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Design Data Mash tutorial content using LLM.
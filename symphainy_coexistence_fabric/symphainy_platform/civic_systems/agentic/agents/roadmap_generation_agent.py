@@ -30,6 +30,7 @@ if str(project_root) not in sys.path:
 from typing import Dict, Any, List, Optional
 from utilities import get_logger
 from ..agent_base import AgentBase
+from ..step_graph import AgentStep
 from ..models.agent_runtime_context import AgentRuntimeContext
 from symphainy_platform.runtime.execution_context import ExecutionContext
 
@@ -88,7 +89,7 @@ class RoadmapGenerationAgent(AgentBase):
         """
         Process roadmap generation request with full LLM reasoning.
         
-        Pattern:
+        Pattern (a step graph; steps 4, 5 and the executive summary run concurrently):
         1. Gather platform context
         2. Reason about strategic approach (LLM)
         3. Design intelligent phases (LLM)
@@ -102,40 +103,66 @@ class RoadmapGenerationAgent(AgentBase):
         timeline = request.get("timeline", "12 months")
         roadmap_options = request.get("roadmap_options", {})
         
-        # Step 1: Gather platform context
-        platform_context = await self._gather_platform_context(context)
-        
-        # Step 2: Reason about strategic approach (LLM)
-        strategic_analysis = await self._reason_about_strategy(
-            goals=goals,
-            timeline=timeline,
-            platform_context=platform_context,
-            context=context
-        )
-        
-        # Step 3: Design intelligent phases (LLM)
-        phases = await self._design_intelligent_phases(
-            goals=goals,
-            timeline=timeline,
-            strategic_analysis=strategic_analysis,
-            platform_context=platform_context,
-            context=context
-        )
-        
-        # Step 4: Create meaningful milestones (LLM)
-        milestones = await self._create_intelligent_milestones(
-            phases=phases,
-            goals=goals,
-            context=context
-        )
-        
-        # Step 5: Identify context-specific risks (LLM)
-        risks = await self._identify_intelligent_risks(
-            goals=goals,
-            phases=phases,
-            platform_context=platform_context,
-            context=context
-        )
+        steps = [
+            # Step 1: Gather platform context
+            AgentStep("platform_context", lambda: self._gather_platform_context(context)),
+            # Step 2: Reason about strategic approach (LLM)
+            AgentStep(
+                "strategic_analysis",
+                lambda platform_context: self._reason_about_strategy(
+                    goals=goals,
+                    timeline=timeline,
+                    platform_context=platform_context,
+                    context=context
+                ),
+                inputs=("platform_context",)
+            ),
+            # Step 3: Design intelligent phases (LLM)
+            AgentStep(
+                "phases",
+                lambda strategic_analysis, platform_context: self._design_intelligent_phases(
+                    goals=goals,
+                    timeline=timeline,
+                    strategic_analysis=strategic_analysis,
+                    platform_context=platform_context,
+                    context=context
+                ),
+                inputs=("strategic_analysis", "platform_context")
+            ),
+            # Step 4: Create meaningful milestones (LLM)
+            AgentStep(
+                "milestones",
+                lambda phases: self._create_intelligent_milestones(phases=phases, goals=goals, context=context),
+                inputs=("phases",)
+            ),
+            # Step 5: Identify context-specific risks (LLM)
+            AgentStep(
+                "risks",
+                lambda phases, platform_context: self._identify_intelligent_risks(
+                    goals=goals,
+                    phases=phases,
+                    platform_context=platform_context,
+                    context=context
+                ),
+                inputs=("phases", "platform_context")
+            ),
+            AgentStep(
+                "executive_summary",
+                lambda phases, strategic_analysis: self._generate_executive_summary(
+                    goals=self._goal_texts(goals),
+                    phases=phases,
+                    timeline=timeline,
+                    strategic_analysis=strategic_analysis,
+                    context=context
+                ),
+                inputs=("phases", "strategic_analysis")
+            ),
+        ]
+        result = await self.run_step_graph("roadmap_generation", steps, context)
+        result.raise_for_failures()
+        strategic_analysis = result.values["strategic_analysis"]
+        phases = result.values["phases"]
+        milestones = result.values["milestones"]
         
         # Step 6: Generate presentation-ready roadmap
         roadmap = await self._generate_presentation_roadmap(
@@ -143,11 +170,12 @@ class RoadmapGenerationAgent(AgentBase):
             timeline=timeline,
             phases=phases,
             milestones=milestones,
-            risks=risks,
+            risks=result.values["risks"],
             strategic_analysis=strategic_analysis,
-            platform_context=platform_context,
+            platform_context=result.values["platform_context"],
             options=roadmap_options,
-            context=context
+            context=context,
+            executive_summary=result.values["executive_summary"]
         )
         
         self.logger.info(f"✅ Roadmap created with {len(phases)} phases, {len(milestones)} milestones")
@@ -704,10 +732,13 @@ Return as JSON array:
         strategic_analysis: Dict[str, Any],
         platform_context: Dict[str, Any],
         options: Dict[str, Any],
-        context: ExecutionContext
+        context: ExecutionContext,
+        executive_summary: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Generate a presentation-ready roadmap with visual elements.
+        
+        The executive summary is generated here unless already provided.
         """
         # Calculate totals
         total_months = sum(p.get("duration_months", 3) for p in phases)
@@ -715,16 +746,17 @@ Return as JSON array:
         end_date = start_date + timedelta(days=total_months * 30)
         
         # Normalize goals
-        goal_texts = [g.get("objective", g) if isinstance(g, dict) else str(g) for g in goals]
+        goal_texts = self._goal_texts(goals)
         
         # Generate executive summary
-        executive_summary = await self._generate_executive_summary(
-            goals=goal_texts,
-            phases=phases,
-            timeline=timeline,
-            strategic_analysis=strategic_analysis,
-            context=context
-        )
+        if executive_summary is None:
+            executive_summary = await self._generate_executive_summary(
+                goals=goal_texts,
+                phases=phases,
+                timeline=timeline,
+                strategic_analysis=strategic_analysis,
+                context=context
+            )
         
         # Build presentation-ready roadmap
         roadmap = {
@@ -859,6 +891,11 @@ Write a compelling executive summary (2-3 paragraphs)."""
                 "recommended_actions": ["Review", "Approve", "Execute"]
             }
     
+    @staticmethod
+    def _goal_texts(goals: List[Any]) -> List[str]:
+        """Goal objectives as text."""
+        return [g.get("objective", g) if isinstance(g, dict) else str(g) for g in goals]
+    
     def _extract_dependencies(self, phases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Extract dependencies from phases."""
         dependencies = []
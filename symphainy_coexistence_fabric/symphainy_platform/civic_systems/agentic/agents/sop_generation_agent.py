@@ -44,6 +44,8 @@ class SOPGenerationAgent(AgentBase):
     ARCHITECTURAL PRINCIPLE: Agent reasons, services execute.
     """
     
+    llm_cache_ttl_seconds = 3600  # same requirements -> same reasoning
+    
     def __init__(
         self,
         agent_definition_id: str = "sop_generation_agent",
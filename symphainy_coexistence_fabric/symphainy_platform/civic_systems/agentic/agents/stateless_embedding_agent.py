@@ -254,3 +254,56 @@ class StatelessEmbeddingAgent(AgentBase):
         except Exception as e:
             self.logger.error(f"❌ Embedding generation failed: {e}")
             raise RuntimeError(f"Embedding generation failed: {str(e)}")
+    
+    async def generate_embeddings(
+        self,
+        texts: List[str],
+        model: str = "sentence-transformers/all-mpnet-base-v2",
+        context: Optional[ExecutionContext] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate embeddings for several texts via HuggingFaceAdapter with governance.
+        
+        Texts are sent through the adapter's embedding engine, so they share
+        batched endpoint requests with other concurrent embedding calls.
+        
+        Args:
+            texts: Texts to generate embeddings for
+            model: Model name (for reference)
+            context: Optional execution context
+        
+        Returns:
+            One dict per text, in order, shaped like generate_embedding()
+        
+        Raises:
+            ValueError: If Public Works or HuggingFaceAdapter not available
+            RuntimeError: If embedding generation fails
+        """
+        if not self.public_works:
+            raise ValueError("Public Works not available - cannot access HuggingFaceAdapter")
+        
+        hf_adapter = self.public_works.get_huggingface_adapter()
+        if not hf_adapter:
+            raise ValueError("HuggingFaceAdapter not available - ensure HuggingFace adapter is configured")
+        
+        # Track usage (governance)
+        tenant_id = context.tenant_id if context else None
+        self.logger.info(
+            f"🧬 Batch embedding generation via agent {self.agent_id}: "
+            f"model={model}, texts={len(texts)}, tenant_id={tenant_id}"
+        )
+        
+        try:
+            embeddings = await hf_adapter.embedding_engine.embed_many(list(texts), model)
+        except Exception as e:
+            self.logger.error(f"❌ Batch embedding generation failed: {e}")
+            raise RuntimeError(f"Embedding generation failed: {str(e)}")
+        
+        return [
+            {
+                "embedding": embedding,
+                "model": model,
+                "dimension": len(embedding)
+            }
+            for embedding in embeddings
+        ]
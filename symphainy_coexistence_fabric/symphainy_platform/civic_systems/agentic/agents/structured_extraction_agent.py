@@ -29,6 +29,7 @@ import uuid
 import json
 
 from ..agent_base import AgentBase
+from ..step_graph import AgentStep, StepGraphError
 from symphainy_platform.runtime.execution_context import ExecutionContext
 from symphainy_platform.realms.insights.models.extraction_config import (
     ExtractionConfig,
@@ -36,6 +37,25 @@ from symphainy_platform.realms.insights.models.extraction_config import (
 )
 
 
+DATA_PREVIEW_CHARS = 2000
+
+# Parsed content carried by extraction prompts (compact JSON, about 12k tokens); larger files are cut here
+PROMPT_CONTENT_CHARS = 48_000
+
+
+def _bounded_json_preview(value: Any, limit: int = DATA_PREVIEW_CHARS, indent: Optional[int] = 2) -> str:
+    """First `limit` chars of json.dumps(value, indent=indent), encoding only as far as needed."""
+    parts: List[str] = []
+    size = 0
+    separators = None if indent is not None else (",", ":")
+    for chunk in json.JSONEncoder(indent=indent, separators=separators, default=str).iterencode(value):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
+
 class StructuredExtractionAgent(AgentBase):
     """
     Structured Extraction Agent - Agentic extraction reasoning.
@@ -198,63 +218,77 @@ class StructuredExtractionAgent(AgentBase):
             f"categories={len(config.categories)}, extraction_id={extraction_id}"
         )
         
-        extracted_data = {}
-        categories = []
-        confidence_scores = {}
-        
         # Determine extraction order
         extraction_order = config.extraction_order if config.extraction_order else [
             cat.name for cat in config.categories
         ]
-        
-        # Extract each category in order
+        categories_by_name = {}
         for category_name in extraction_order:
             category = next((c for c in config.categories if c.name == category_name), None)
             if not category:
                 self.logger.warning(f"Category not found in config: {category_name}")
                 continue
-            
-            # Check dependencies
-            dependencies = config.dependencies.get(category_name, [])
-            if dependencies:
-                # Ensure dependencies are extracted first
-                for dep_name in dependencies:
-                    if dep_name not in extracted_data:
-                        self.logger.warning(
-                            f"Dependency {dep_name} not extracted before {category_name}"
-                        )
-            
-            # Extract category
-            try:
-                category_result = await self._extract_category(
-                    category=category,
-                    data_source=data_source,
-                    config=config,
-                    context=context
-                )
-                
-                extracted_data[category_name] = category_result.get("data", {})
-                confidence_scores[category_name] = category_result.get("confidence", 0.0)
-                
-                categories.append({
-                    "name": category_name,
-                    "extraction_type": category.extraction_type,
-                    "data": category_result.get("data", {}),
-                    "confidence": category_result.get("confidence", 0.0),
-                    "metadata": category_result.get("metadata", {})
-                })
-                
-            except Exception as e:
-                self.logger.error(f"Failed to extract category {category_name}: {e}", exc_info=True)
-                extracted_data[category_name] = {}
-                confidence_scores[category_name] = 0.0
-                categories.append({
-                    "name": category_name,
-                    "extraction_type": category.extraction_type,
-                    "data": {},
-                    "confidence": 0.0,
-                    "error": str(e)
-                })
+            categories_by_name[category_name] = category
+        
+        # Load the data source once per run; every category prompt shares the same rendered content
+        data_context = await self._prepare_data_context(data_source, context)
+        data_block = self._format_data_block(data_context)
+        
+        def extraction_step(category: ExtractionCategory):
+            # Dependencies only order the run; their results are not passed to the prompt
+            async def run(**dependency_results) -> Dict[str, Any]:
+                try:
+                    return await self._extract_category(
+                        category=category,
+                        data_source=data_source,
+                        config=config,
+                        context=context,
+                        data_block=data_block
+                    )
+                except Exception as e:
+                    self.logger.error(f"Failed to extract category {category.name}: {e}", exc_info=True)
+                    return {"data": {}, "confidence": 0.0, "error": str(e)}
+            return run
+        
+        # Categories run as soon as their dependencies are extracted; independent ones concurrently
+        steps = []
+        for category_name, category in categories_by_name.items():
+            dependencies = []
+            for dep_name in config.dependencies.get(category_name, []):
+                if dep_name in categories_by_name:
+                    dependencies.append(dep_name)
+                else:
+                    self.logger.warning(f"Dependency {dep_name} of {category_name} is not part of this extraction")
+            steps.append(AgentStep(category_name, extraction_step(category), inputs=tuple(dependencies)))
+        try:
+            result = await self.run_step_graph("structured_extraction", steps, context)
+        except StepGraphError as e:
+            # Cyclic dependencies: extract in the configured order instead
+            self.logger.warning(f"Extraction dependencies unusable ({e}); extracting sequentially")
+            steps = [
+                AgentStep(step.name, step.run, inputs=(steps[index - 1].name,) if index else ())
+                for index, step in enumerate(steps)
+            ]
+            result = await self.run_step_graph("structured_extraction", steps, context)
+        
+        extracted_data = {}
+        categories = []
+        confidence_scores = {}
+        for category_name, category in categories_by_name.items():
+            category_result = result.values[category_name]
+            extracted_data[category_name] = category_result.get("data", {})
+            confidence_scores[category_name] = category_result.get("confidence", 0.0)
+            entry = {
+                "name": category_name,
+                "extraction_type": category.extraction_type,
+                "data": category_result.get("data", {}),
+                "confidence": category_result.get("confidence", 0.0),
+            }
+            if "metadata" in category_result:
+                entry["metadata"] = category_result["metadata"]
+            if "error" in category_result:
+                entry["error"] = category_result["error"]
+            categories.append(entry)
         
         return {
             "extraction_id": extraction_id,
@@ -268,7 +302,8 @@ class StructuredExtractionAgent(AgentBase):
         category: ExtractionCategory,
         data_source: Dict[str, Any],
         config: ExtractionConfig,
-        context: ExecutionContext
+        context: ExecutionContext,
+        data_block: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Extract a single category using the configured extraction type.
@@ -278,6 +313,7 @@ class StructuredExtractionAgent(AgentBase):
             data_source: Data source
             config: Full ExtractionConfig (for context)
             context: Execution context
+            data_block: Prompt-ready data context shared by a run (prepared here if None)
         
         Returns:
             Dict with extracted data and confidence
@@ -285,13 +321,13 @@ class StructuredExtractionAgent(AgentBase):
         extraction_type = category.extraction_type
         
         if extraction_type == "llm":
-            return await self._extract_via_llm(category, data_source, config, context)
+            return await self._extract_via_llm(category, data_source, config, context, data_block)
         elif extraction_type == "pattern":
-            return await self._extract_via_pattern(category, data_source, config, context)
+            return await self._extract_via_pattern(category, data_source, config, context, data_block)
         elif extraction_type == "embedding":
-            return await self._extract_via_embedding(category, data_source, config, context)
+            return await self._extract_via_embedding(category, data_source, config, context, data_block)
         elif extraction_type == "hybrid":
-            return await self._extract_via_hybrid(category, data_source, config, context)
+            return await self._extract_via_hybrid(category, data_source, config, context, data_block)
         else:
             raise ValueError(f"Unknown extraction type: {extraction_type}")
     
@@ -300,7 +336,8 @@ class StructuredExtractionAgent(AgentBase):
         category: ExtractionCategory,
         data_source: Dict[str, Any],
         config: ExtractionConfig,
-        context: ExecutionContext
+        context: ExecutionContext,
+        data_block: Optional[str] = None
     ) -> Dict[str, Any]:
         """Extract category using LLM."""
         # Build prompt from template
@@ -314,9 +351,10 @@ Domain: {config.domain}
 """
         
         # Prepare data context for prompt (retrieve actual parsed file content)
-        data_context = await self._prepare_data_context(data_source, context)
+        if data_block is None:
+            data_block = self._format_data_block(await self._prepare_data_context(data_source, context))
         
-        prompt = f"{prompt_template}\n\nData Source:\n{json.dumps(data_context, indent=2)}"
+        prompt = f"{prompt_template}\n\nData Source:\n{data_block}"
         
         system_message = f"""
 You are a structured data extraction expert specializing in {config.domain}.
@@ -378,39 +416,42 @@ Extract {category.name} information accurately and return valid JSON.
         category: ExtractionCategory,
         data_source: Dict[str, Any],
         config: ExtractionConfig,
-        context: ExecutionContext
+        context: ExecutionContext,
+        data_block: Optional[str] = None
     ) -> Dict[str, Any]:
         """Extract category using pattern matching."""
         # Pattern-based extraction (for future implementation)
         # For MVP, fall back to LLM
         self.logger.info(f"Pattern extraction not yet implemented, falling back to LLM for {category.name}")
-        return await self._extract_via_llm(category, data_source, config, context)
+        return await self._extract_via_llm(category, data_source, config, context, data_block)
     
     async def _extract_via_embedding(
         self,
         category: ExtractionCategory,
         data_source: Dict[str, Any],
         config: ExtractionConfig,
-        context: ExecutionContext
+        context: ExecutionContext,
+        data_block: Optional[str] = None
     ) -> Dict[str, Any]:
         """Extract category using embedding similarity."""
         # Embedding-based extraction (for future implementation)
         # For MVP, fall back to LLM
         self.logger.info(f"Embedding extraction not yet implemented, falling back to LLM for {category.name}")
-        return await self._extract_via_llm(category, data_source, config, context)
+        return await self._extract_via_llm(category, data_source, config, context, data_block)
     
     async def _extract_via_hybrid(
         self,
         category: ExtractionCategory,
         data_source: Dict[str, Any],
         config: ExtractionConfig,
-        context: ExecutionContext
+        context: ExecutionContext,
+        data_block: Optional[str] = None
     ) -> Dict[str, Any]:
         """Extract category using hybrid approach (embeddings + LLM)."""
         # Hybrid extraction (for future implementation)
         # For MVP, use LLM
         self.logger.info(f"Hybrid extraction not yet implemented, using LLM for {category.name}")
-        return await self._extract_via_llm(category, data_source, config, context)
+        return await self._extract_via_llm(category, data_source, config, context, data_block)
     
     async def _prepare_data_context(
         self, 
@@ -462,15 +503,15 @@ Extract {category.name} information accurately and return valid JSON.
             
             parsed_content = parsed_file.get("parsed_content")
             
-            # Create data preview (truncate for prompt efficiency)
+            # Create data preview (truncate for prompt efficiency; stops encoding at the limit)
             if isinstance(parsed_content, (dict, list)):
-                data_preview = json.dumps(parsed_content, indent=2)[:2000]  # Limit to 2000 chars
+                data_preview = _bounded_json_preview(parsed_content)
             else:
-                data_preview = str(parsed_content)[:2000]
+                data_preview = str(parsed_content)[:DATA_PREVIEW_CHARS]
             
             self.logger.info(
                 f"Retrieved parsed file content via Content Realm: {parsed_file_id} "
-                f"(type: {type(parsed_content).__name__}, size: {len(str(parsed_content))} chars)"
+                f"(type: {type(parsed_content).__name__})"
             )
             
             return {
@@ -491,6 +532,32 @@ Extract {category.name} information accurately and return valid JSON.
                 "error": str(e)
             }
     
+    def _format_data_block(self, data_context: Dict[str, Any]) -> str:
+        """
+        Render a data context for a prompt.
+        
+        The parsed content follows the context as compact JSON, cut at PROMPT_CONTENT_CHARS
+        (the prompt says so when it is cut); its data_preview is left out as redundant.
+        """
+        if "parsed_content" not in data_context:
+            return json.dumps(data_context, indent=2, default=str)
+        parsed_content = data_context["parsed_content"]
+        summary = {
+            key: value for key, value in data_context.items() if key not in ("parsed_content", "data_preview")
+        }
+        if isinstance(parsed_content, (dict, list)):
+            content = _bounded_json_preview(parsed_content, PROMPT_CONTENT_CHARS + 1, indent=None)
+        else:
+            content = str(parsed_content)[:PROMPT_CONTENT_CHARS + 1]
+        block = f"{json.dumps(summary, indent=2, default=str)}\n\nParsed Content:\n{content[:PROMPT_CONTENT_CHARS]}"
+        if len(content) > PROMPT_CONTENT_CHARS:
+            self.logger.warning(
+                f"Parsed file {data_context.get('parsed_file_id')} exceeds the extraction prompt budget; "
+                f"only its first {PROMPT_CONTENT_CHARS} characters are sent"
+            )
+            block += f"\n[Parsed content truncated: only the first {PROMPT_CONTENT_CHARS} characters are shown]"
+        return block
+    
     def _calculate_confidence(
         self,
         extracted_data: Dict[str, Any],
@@ -536,7 +603,7 @@ Analyze the following data source and propose an extraction pattern.
 Suggest categories that should be extracted and their extraction types.
 
 Data Source:
-{json.dumps(data_context, indent=2)}
+{self._format_data_block(data_context)}
 
 Return a JSON structure with:
 - suggested_categories: List of category names
@@ -172,6 +172,11 @@ AGENT_POSTURE_SCHEMA = {
                     "minimum": 1,
                     "description": "Default max tokens"
                 },
+                "cache_ttl_seconds": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": "Reuse identical low-temperature responses for this long (0 disables)"
+                },
                 "timeout": {
                     "type": "integer",
                     "minimum": 1,
@@ -37,6 +37,7 @@ class AgentRuntimeContext:
         available_artifacts: List of available artifact IDs
         human_preferences: Human preferences (detail_level, wants_visuals, etc.)
         session_state: Optional session state (for stateful agents)
+        knowledge_context: Retrieved tenant knowledge relevant to the request (hybrid retrieval results)
     """
     
     business_context: Dict[str, Any] = field(default_factory=dict)  # industry, systems, constraints
@@ -44,6 +45,7 @@ class AgentRuntimeContext:
     available_artifacts: List[str] = field(default_factory=list)
     human_preferences: Dict[str, Any] = field(default_factory=dict)  # detail_level, wants_visuals, etc.
     session_state: Optional[Dict[str, Any]] = None  # For stateful agents
+    knowledge_context: List[Dict[str, Any]] = field(default_factory=list)  # Retrieved documents, best first
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -52,7 +54,8 @@ class AgentRuntimeContext:
             "journey_goal": self.journey_goal,
             "available_artifacts": self.available_artifacts,
             "human_preferences": self.human_preferences,
-            "session_state": self.session_state
+            "session_state": self.session_state,
+            "knowledge_context": self.knowledge_context
         }
     
     @classmethod
@@ -63,7 +66,8 @@ class AgentRuntimeContext:
             journey_goal=data.get("journey_goal", ""),
             available_artifacts=data.get("available_artifacts", []),
             human_preferences=data.get("human_preferences", {}),
-            session_state=data.get("session_state")
+            session_state=data.get("session_state"),
+            knowledge_context=data.get("knowledge_context", [])
         )
     
     @classmethod
@@ -156,5 +160,6 @@ class AgentRuntimeContext:
             journey_goal=journey_goal,
             available_artifacts=available_artifacts,
             human_preferences=human_preferences,
-            session_state=session_state
+            session_state=session_state,
+            knowledge_context=request.get("knowledge_context") or []
         )
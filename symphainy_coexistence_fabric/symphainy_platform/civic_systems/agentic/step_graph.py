@@ -0,0 +1,230 @@
+"""
+Step Graph - Dependency-ordered execution of multi-step agent reasoning
+
+Runs an agent's reasoning steps (LLM calls, tool calls) as a small dependency graph
+instead of a fixed sequence.
+
+WHAT (Agentic Role): I run an agent's reasoning steps as soon as their inputs are ready
+HOW (Agentic Implementation): each step names the steps (or seed values) it consumes; I start
+    every step whose inputs are available, concurrently, and start dependents as steps finish,
+    so wall time follows the critical path rather than the sum of the steps
+
+Steps only reason; LLM calls inside them still go through AgentBase._call_llm (and so
+the LLM gateway, which admits concurrent calls per tenant and lane). A failed step
+uses its fallback when it has one; otherwise its dependents are skipped while
+independent steps still complete, and the failure is reported on the result.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+
+STEP_COMPLETED = "completed"
+STEP_FALLBACK = "fallback"
+STEP_FAILED = "failed"
+STEP_SKIPPED = "skipped"
+
+
+class StepGraphError(RuntimeError):
+    """Raised for an invalid graph (cycle, unknown input) or by raise_for_failures()."""
+
+
+@dataclass
+class AgentStep:
+    """
+    One reasoning step.
+
+    Attributes:
+        name: Step name; its value is available to later steps under this name
+        run: Coroutine function called with one keyword argument per input
+        inputs: Names of steps (or seed values) this step consumes
+        fallback: Called with the exception when run fails; its return value is used instead
+        timeout_seconds: Optional bound on the step's run time
+    """
+    name: str
+    run: Callable[..., Awaitable[Any]]
+    inputs: Sequence[str] = ()
+    fallback: Optional[Callable[[BaseException], Any]] = None
+    timeout_seconds: Optional[float] = None
+
+
+@dataclass
+class StepGraphResult:
+    """Outcome of a step graph run."""
+    values: Dict[str, Any] = field(default_factory=dict)
+    status: Dict[str, str] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    timings_ms: Dict[str, Dict[str, float]] = field(default_factory=dict)  # step -> {"started", "duration"}
+    total_ms: float = 0.0
+    critical_path: List[str] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> bool:
+        """True when every step completed or used its fallback."""
+        return all(status in (STEP_COMPLETED, STEP_FALLBACK) for status in self.status.values())
+
+    def raise_for_failures(self) -> None:
+        """Raise StepGraphError naming the failed and skipped steps, if any."""
+        if not self.succeeded:
+            details = "; ".join(f"{name}: {message}" for name, message in self.errors.items())
+            raise StepGraphError(f"Step graph failed ({details})")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Timing and status summary (no step values) for telemetry."""
+        return {
+            "status": dict(self.status),
+            "errors": dict(self.errors),
+            "timings_ms": {name: dict(timing) for name, timing in self.timings_ms.items()},
+            "total_ms": self.total_ms,
+            "critical_path": list(self.critical_path),
+        }
+
+
+class StepGraph:
+    """Dependency graph of agent steps; see module docstring."""
+
+    def __init__(self, steps: Sequence[AgentStep], max_concurrency: Optional[int] = None):
+        """
+        Initialize step graph.
+
+        Args:
+            steps: Steps in any order (names must be unique)
+            max_concurrency: Most steps running at once (None = no bound beyond the LLM gateway)
+
+        Raises:
+            StepGraphError: Duplicate step names or a dependency cycle
+        """
+        self._steps: Dict[str, AgentStep] = {}
+        for step in steps:
+            if step.name in self._steps:
+                raise StepGraphError(f"Duplicate step name: {step.name}")
+            self._steps[step.name] = step
+        self.max_concurrency = max_concurrency
+        self._order = self._topological_order()
+
+    async def run(self, initial: Optional[Dict[str, Any]] = None) -> StepGraphResult:
+        """
+        Run all steps.
+
+        Args:
+            initial: Seed values steps may name as inputs
+
+        Returns:
+            StepGraphResult (values of completed / fallback steps, per-step status and timings)
+
+        Raises:
+            StepGraphError: A step input is neither a step nor a seed value
+        """
+        seeds = dict(initial or {})
+        for step in self._steps.values():
+            for name in step.inputs:
+                if name not in self._steps and name not in seeds:
+                    raise StepGraphError(f"Step '{step.name}' has unknown input '{name}'")
+
+        result = StepGraphResult()
+        available = dict(seeds)
+        pending = list(self._order)
+        running: Dict["asyncio.Task[Any]", AgentStep] = {}
+        semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        started = time.perf_counter()
+
+        try:
+            while pending or running:
+                for name in list(pending):
+                    step = self._steps[name]
+                    blocked = [dep for dep in step.inputs if result.status.get(dep) in (STEP_FAILED, STEP_SKIPPED)]
+                    if blocked:
+                        pending.remove(name)
+                        result.status[name] = STEP_SKIPPED
+                        result.errors[name] = f"input '{blocked[0]}' unavailable"
+                    elif all(dep in available for dep in step.inputs):
+                        pending.remove(name)
+                        kwargs = {dep: available[dep] for dep in step.inputs}
+                        task = asyncio.ensure_future(self._run_step(step, kwargs, semaphore, started, result))
+                        running[task] = step
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step = running.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        available[step.name] = result.values[step.name] = task.result()
+                        result.status[step.name] = STEP_COMPLETED
+                        continue
+                    result.errors[step.name] = str(error) or type(error).__name__
+                    if step.fallback is not None:
+                        try:
+                            available[step.name] = result.values[step.name] = step.fallback(error)
+                            result.status[step.name] = STEP_FALLBACK
+                            continue
+                        except Exception as fallback_error:
+                            result.errors[step.name] += f" (fallback failed: {fallback_error})"
+                    result.status[step.name] = STEP_FAILED
+        finally:
+            for task in running:
+                task.cancel()
+
+        result.total_ms = _elapsed_ms(started)
+        result.critical_path = self._critical_path(result)
+        return result
+
+    async def _run_step(
+        self,
+        step: AgentStep,
+        kwargs: Dict[str, Any],
+        semaphore: Optional[asyncio.Semaphore],
+        graph_started: float,
+        result: StepGraphResult
+    ) -> Any:
+        if semaphore is not None:
+            await semaphore.acquire()
+        step_started = time.perf_counter()
+        timing = result.timings_ms[step.name] = {"started": _elapsed_ms(graph_started, step_started)}
+        try:
+            coroutine = step.run(**kwargs)
+            if step.timeout_seconds is not None:
+                return await asyncio.wait_for(coroutine, step.timeout_seconds)
+            return await coroutine
+        finally:
+            timing["duration"] = _elapsed_ms(step_started)
+            if semaphore is not None:
+                semaphore.release()
+
+    def _topological_order(self) -> List[str]:
+        remaining = {name: {dep for dep in step.inputs if dep in self._steps} for name, step in self._steps.items()}
+        order: List[str] = []
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise StepGraphError(f"Step graph has a dependency cycle among: {sorted(remaining)}")
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+
+    def _critical_path(self, result: StepGraphResult) -> List[str]:
+        """Chain of steps (by latest-finishing input) that ended last."""
+        def finished(name: str) -> float:
+            timing = result.timings_ms.get(name, {})
+            return timing.get("started", 0.0) + timing.get("duration", 0.0)
+
+        timed = [name for name in self._order if name in result.timings_ms]
+        if not timed:
+            return []
+        path = [max(timed, key=finished)]
+        while True:
+            inputs = [dep for dep in self._steps[path[-1]].inputs if dep in result.timings_ms]
+            if not inputs:
+                break
+            path.append(max(inputs, key=finished))
+        return list(reversed(path))
+
+
+def _elapsed_ms(started: float, now: Optional[float] = None) -> float:
+    return round(((time.perf_counter() if now is None else now) - started) * 1000, 3)
@@ -63,7 +63,8 @@ class AgenticTelemetryService:
         latency_ms: float,
         context: ExecutionContext,
         success: bool = True,
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        cached: bool = False
     ) -> bool:
         """
         Record agent execution for telemetry.
@@ -80,6 +81,7 @@ class AgenticTelemetryService:
             context: Execution context
             success: Whether execution succeeded
             error_message: Optional error message
+            cached: Whether the response was served from the LLM response cache
         
         Returns:
             True if recording successful
@@ -111,6 +113,7 @@ class AgenticTelemetryService:
                 "model_name": model_name,
                 "success": success,
                 "error_message": error_message,
+                "cached": cached,
                 "created_at": self.clock.now().isoformat() if self.clock else datetime.utcnow().isoformat()
             }
             
@@ -206,6 +209,67 @@ class AgenticTelemetryService:
             self.logger.error(f"Exception recording tool usage: {e}", exc_info=True)
             return False
     
+    async def record_agent_step_graph(
+        self,
+        agent_id: str,
+        graph_name: str,
+        summary: Dict[str, Any],
+        context: ExecutionContext
+    ) -> bool:
+        """
+        Record a multi-step reasoning run (per-step timing and status) for telemetry.
+        
+        Args:
+            agent_id: Agent identifier
+            graph_name: Reasoning pipeline name (e.g. "roadmap_generation")
+            summary: StepGraphResult.to_dict() (status, errors, timings_ms, total_ms, critical_path)
+            context: Execution context
+        
+        Returns:
+            True if recording successful
+        """
+        if not self.supabase_adapter:
+            raise RuntimeError(
+                "Supabase adapter not wired; cannot record step graph telemetry. Platform contract §8A."
+            )
+        
+        try:
+            step_record = {
+                "id": None,
+                "agent_id": agent_id,
+                "graph_name": graph_name,
+                "tenant_id": context.tenant_id,
+                "session_id": context.session_id,
+                "execution_id": context.execution_id,
+                "total_ms": summary.get("total_ms"),
+                "critical_path": summary.get("critical_path", []),
+                "step_timings": summary.get("timings_ms", {}),
+                "step_status": summary.get("status", {}),
+                "errors": summary.get("errors", {}),
+                "success": all(
+                    status in ("completed", "fallback") for status in summary.get("status", {}).values()
+                ),
+                "created_at": self.clock.now().isoformat() if self.clock else datetime.utcnow().isoformat()
+            }
+            
+            result = await self.supabase_adapter.execute_rls_policy(
+                table="agentic_step_graph_log",
+                operation="insert",
+                user_context={"tenant_id": context.tenant_id},
+                data=step_record
+            )
+            
+            if result.get("success"):
+                self.logger.debug(f"✅ Recorded step graph: {agent_id}/{graph_name}")
+                return True
+            else:
+                self.logger.warning(f"Failed to record step graph: {result.get('error')}")
+                return False
+                
+        except Exception as e:
+            self.logger.error(f"Exception recording step graph: {e}", exc_info=True)
+            return False
+    
     async def record_agent_health(
         self,
         agent_id: str,
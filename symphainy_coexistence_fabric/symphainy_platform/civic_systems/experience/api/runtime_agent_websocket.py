@@ -42,7 +42,7 @@ from ..services.guide_agent_service import GuideAgentService
 from ..services.websocket_connection_manager import WebSocketConnectionManager
 from symphainy_platform.civic_systems.smart_city.sdk.security_guard_sdk import SecurityGuardSDK
 from symphainy_platform.runtime.execution_context import ExecutionContext
-from symphainy_platform.runtime.state_surface import StateSurface
+from symphainy_platform.foundations.public_works.conversation_log import ConversationLog
 
 
 router = APIRouter(prefix="/api/runtime", tags=["runtime", "websocket", "agents"])
@@ -180,15 +180,14 @@ async def runtime_agent_websocket(
         # Runtime client already retrieved above for session validation
         guide_service = app.state.guide_agent_service
         
-        # Get State Surface for persistent conversation context storage
-        state_surface = None
+        # Conversation log for persistent conversation context (append-only turns, windowed reads)
+        conversation_log = None
         if hasattr(app.state, "public_works") and app.state.public_works:
-            state_abstraction = app.state.public_works.get_state_abstraction()
-            if state_abstraction:
-                state_surface = StateSurface(
-                    state_abstraction=state_abstraction,
-                    use_memory=(state_abstraction is None)
-                )
+            conversation_log = app.state.public_works.get_conversation_log()
+        if conversation_log is None:
+            if not hasattr(app.state, "conversation_log"):
+                app.state.conversation_log = ConversationLog()  # in-process only
+            conversation_log = app.state.conversation_log
         
         # Main message loop
         while True:
@@ -217,10 +216,10 @@ async def runtime_agent_websocket(
                 conversation_id = context.get("conversation_id") or f"{surface}_{ws_session_id}"
                 user_text = payload.get("text", "")
                 
-                # Get conversation context from persistent storage
+                # Get conversation context (route, summary, recent turns) from persistent storage
                 conv_context = await _get_conversation_context(
                     conversation_id=conversation_id,
-                    state_surface=state_surface,
+                    conversation_log=conversation_log,
                     tenant_id=tenant_id,
                     surface=surface
                 )
@@ -236,13 +235,21 @@ async def runtime_agent_websocket(
                     tenant_id=tenant_id
                 )
                 
-                conv_context["agent_type"] = agent_type
-                conv_context["agent_id"] = agent_id
-                conv_context["messages"].append({
-                    "role": "user",
-                    "text": user_text,
-                    "timestamp": __import__("datetime").datetime.utcnow().isoformat()
-                })
+                agent_type, agent_id = await _record_agent_route(
+                    conversation_id=conversation_id,
+                    conversation_context=conv_context,
+                    conversation_log=conversation_log,
+                    tenant_id=tenant_id,
+                    agent_type=agent_type,
+                    agent_id=agent_id
+                )
+                await _append_conversation_turn(
+                    conversation_id=conversation_id,
+                    role="user",
+                    text=user_text,
+                    conversation_log=conversation_log,
+                    tenant_id=tenant_id
+                )
                 
                 logger.info(f"Routing message to agent: {agent_id} (type: {agent_type}, surface: {surface})")
                 
@@ -328,17 +335,12 @@ async def runtime_agent_websocket(
                             "timestamp": __import__("datetime").datetime.utcnow().isoformat()
                         })
                         
-                        conv_context["messages"].append({
-                            "role": "assistant",
-                            "text": response_text,
-                            "timestamp": __import__("datetime").datetime.utcnow().isoformat()
-                        })
-                        
-                        # Save conversation context to persistent storage
-                        await _save_conversation_context(
+                        # Save the reply to persistent storage
+                        await _append_conversation_turn(
                             conversation_id=conversation_id,
-                            context=conv_context,
-                            state_surface=state_surface,
+                            role="assistant",
+                            text=response_text,
+                            conversation_log=conversation_log,
                             tenant_id=tenant_id
                         )
                     else:
@@ -478,79 +480,105 @@ async def _determine_agent_routing(
 
 async def _get_conversation_context(
     conversation_id: str,
-    state_surface: Optional[StateSurface],
+    conversation_log: ConversationLog,
     tenant_id: str,
     surface: str
 ) -> Dict[str, Any]:
     """
     Get conversation context from persistent storage.
     
+    Reads only the conversation's route, summary and most recent turns, never the
+    whole history.
+    
     Args:
         conversation_id: Conversation identifier
-        state_surface: State Surface for persistent storage
+        conversation_log: Conversation log for persistent storage
         tenant_id: Tenant identifier
         surface: UI surface
     
     Returns:
-        Conversation context dictionary
+        Conversation context dictionary (surface, agent_type, agent_id, summary,
+        version, messages window, total_messages)
     """
     # Default context
     default_context = {
         "surface": surface,
         "messages": [],
         "agent_type": None,
-        "agent_id": None
+        "agent_id": None,
+        "summary": "",
+        "version": 0
     }
     
-    # Try to load from persistent storage
-    if state_surface:
-        try:
-            session_state = await state_surface.get_session_state(
-                conversation_id,
-                tenant_id
-            )
-            if session_state and "conversation_context" in session_state:
-                return session_state["conversation_context"]
-        except Exception as e:
-            logger.warning(f"Failed to load conversation context: {e}")
+    try:
+        conversation = await conversation_log.read_window(tenant_id, conversation_id)
+        conversation["surface"] = conversation.get("surface") or surface
+        return conversation
+    except Exception as e:
+        logger.warning(f"Failed to load conversation context: {e}")
     
     return default_context
 
 
-async def _save_conversation_context(
+async def _record_agent_route(
+    conversation_id: str,
+    conversation_context: Dict[str, Any],
+    conversation_log: ConversationLog,
+    tenant_id: str,
+    agent_type: str,
+    agent_id: str
+) -> tuple[str, str]:
+    """
+    Persist the agent route of a newly routed conversation.
+    
+    The route is written only if the conversation is still at the version that was
+    read; if another tab routed it first, that route is kept and returned.
+    
+    Returns:
+        Tuple of (agent_type, agent_id) the conversation is routed to
+    """
+    if conversation_context.get("agent_id"):
+        return agent_type, agent_id
+    
+    try:
+        route = {"surface": conversation_context.get("surface"), "agent_type": agent_type, "agent_id": agent_id}
+        if await conversation_log.update_meta(
+            tenant_id, conversation_id, route, expected_version=conversation_context.get("version", 0)
+        ):
+            return agent_type, agent_id
+        
+        current = await conversation_log.read_window(tenant_id, conversation_id, limit=0)
+        if current.get("agent_id"):
+            return current.get("agent_type") or "guide", current["agent_id"]
+        await conversation_log.update_meta(tenant_id, conversation_id, route)
+    except Exception as e:
+        logger.warning(f"Failed to save conversation route: {e}")
+    
+    return agent_type, agent_id
+
+
+async def _append_conversation_turn(
     conversation_id: str,
-    context: Dict[str, Any],
-    state_surface: Optional[StateSurface],
+    role: str,
+    text: str,
+    conversation_log: ConversationLog,
     tenant_id: str
 ):
     """
-    Save conversation context to persistent storage.
+    Append one turn to the conversation in persistent storage (O(1)).
     
     Args:
         conversation_id: Conversation identifier
-        context: Conversation context dictionary
-        state_surface: State Surface for persistent storage
+        role: "user" or "assistant"
+        text: Turn text
+        conversation_log: Conversation log for persistent storage
         tenant_id: Tenant identifier
     """
-    if not state_surface:
-        return
-    
     try:
-        # Get existing session state
-        session_state = await state_surface.get_session_state(
-            conversation_id,
-            tenant_id
-        ) or {}
-        
-        # Update conversation context
-        session_state["conversation_context"] = context
-        
-        # Save to persistent storage
-        await state_surface.set_session_state(
-            conversation_id,
-            tenant_id,
-            session_state
-        )
+        await conversation_log.append(tenant_id, conversation_id, {
+            "role": role,
+            "text": text,
+            "timestamp": __import__("datetime").datetime.utcnow().isoformat()
+        })
     except Exception as e:
-        logger.warning(f"Failed to save conversation context: {e}")
-
+        logger.warning(f"Failed to save conversation turn: {e}")
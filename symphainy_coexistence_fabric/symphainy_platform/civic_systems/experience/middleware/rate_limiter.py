@@ -1,7 +1,8 @@
 """
 Rate Limiter for API Endpoints
 
-Simple rate limiting using Redis (or in-memory fallback).
+Per-client endpoint limits on the shared DistributedRateLimiter (Redis token buckets,
+so every worker enforces the same window; in-process buckets without Redis).
 """
 import sys
 from pathlib import Path
@@ -16,26 +17,33 @@ for _ in range(10):
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from typing import Optional, Dict, Tuple, Callable
-from datetime import datetime, timedelta
+from typing import Optional, Tuple, Callable
 from functools import wraps
 from fastapi import Request, HTTPException, status, Depends
+import math
 import os
 from utilities import get_logger
+from symphainy_platform.foundations.public_works.rate_limiter import DistributedRateLimiter
 
 logger = get_logger("RateLimiter")
 
 
 class RateLimiter:
     """
-    Simple rate limiter using in-memory storage (or Redis if available).
+    Endpoint rate limiter keyed by client (IP, or test id in test mode).
     
-    For production, consider using Redis for distributed rate limiting.
+    Delegates to a DistributedRateLimiter; use configure_rate_limiter() to share the
+    Public Works limiter so limits hold across workers.
     """
     
-    def __init__(self):
-        """Initialize rate limiter."""
-        self.rate_limits: Dict[str, Dict[str, any]] = {}  # key -> {count, reset_at}
+    def __init__(self, limiter: Optional[DistributedRateLimiter] = None):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            limiter: Shared limiter (None = in-process buckets)
+        """
+        self.limiter = limiter or DistributedRateLimiter()
         self.logger = logger
     
     def _get_key(self, identifier: str, endpoint: str) -> str:
@@ -91,7 +99,7 @@ class RateLimiter:
         
         return "unknown"
     
-    def check_rate_limit(
+    async def check_rate_limit(
         self,
         request: Request,
         endpoint: str,
@@ -118,53 +126,27 @@ class RateLimiter:
         identifier = self._get_client_identifier(request)
         key = self._get_key(identifier, endpoint)
         
-        now = datetime.utcnow()
-        
-        # Get current rate limit state
-        if key in self.rate_limits:
-            limit_info = self.rate_limits[key]
-            reset_at = limit_info["reset_at"]
-            
-            # Check if window has expired
-            if now >= reset_at:
-                # Reset window
-                self.rate_limits[key] = {
-                    "count": 1,
-                    "reset_at": now + timedelta(seconds=window_seconds)
-                }
-                return True, None
-            
-            # Check if limit exceeded
-            if limit_info["count"] >= max_requests:
-                retry_after = int((reset_at - now).total_seconds())
-                return False, retry_after
-            
-            # Increment count
-            limit_info["count"] += 1
-        else:
-            # First request in window
-            self.rate_limits[key] = {
-                "count": 1,
-                "reset_at": now + timedelta(seconds=window_seconds)
-            }
-        
+        decision = await self.limiter.check(key, max_requests, window_seconds)
+        if not decision.allowed:
+            return False, max(1, math.ceil(decision.retry_after))
         return True, None
-    
-    def cleanup_expired_limits(self):
-        """Clean up expired rate limit entries."""
-        now = datetime.utcnow()
-        expired_keys = [
-            key for key, info in self.rate_limits.items()
-            if now >= info["reset_at"]
-        ]
-        for key in expired_keys:
-            del self.rate_limits[key]
 
 
 # Global rate limiter instance
 _rate_limiter = RateLimiter()
 
 
+def configure_rate_limiter(limiter: Optional[DistributedRateLimiter]) -> None:
+    """
+    Use a shared limiter (e.g. Public Works get_rate_limiter()) for endpoint limits.
+    
+    Args:
+        limiter: Shared limiter; None keeps the current one
+    """
+    if limiter is not None:
+        _rate_limiter.limiter = limiter
+
+
 def get_rate_limiter() -> RateLimiter:
     """
     Get rate limiter instance (FastAPI dependency).
@@ -217,12 +199,9 @@ def create_rate_limit_dependency(
         Raises:
             HTTPException: 429 if rate limit exceeded
         """
-        # Clean up expired limits periodically
-        rate_limiter.cleanup_expired_limits()
-        
         # Check rate limit
         endpoint = f"{request.method}:{request.url.path}"
-        is_allowed, retry_after = rate_limiter.check_rate_limit(
+        is_allowed, retry_after = await rate_limiter.check_rate_limit(
             request=request,
             endpoint=endpoint,
             max_requests=max_requests,
@@ -287,12 +266,9 @@ def rate_limit(max_requests: int = 5, window_seconds: int = 60):
                 # If no request found, call function anyway (shouldn't happen in FastAPI)
                 return await func(*args, **kwargs)
             
-            # Clean up expired limits periodically
-            _rate_limiter.cleanup_expired_limits()
-            
             # Check rate limit
             endpoint = f"{request.method}:{request.url.path}"
-            is_allowed, retry_after = _rate_limiter.check_rate_limit(
+            is_allowed, retry_after = await _rate_limiter.check_rate_limit(
                 request=request,
                 endpoint=endpoint,
                 max_requests=max_requests,
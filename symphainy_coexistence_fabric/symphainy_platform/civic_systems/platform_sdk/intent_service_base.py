@@ -232,6 +232,37 @@ class PlatformIntentService:
     # TELEMETRY HELPERS
     # ========================================================================
     
+    async def record_telemetry(
+        self,
+        ctx: PlatformContext,
+        telemetry_data: Dict[str, Any]
+    ) -> None:
+        """
+        Record telemetry for a step inside execute().
+        
+        Best-effort: telemetry must never fail the intent.
+        
+        Args:
+            ctx: Platform context
+            telemetry_data: Telemetry fields (action, status, ...)
+        """
+        if not ctx.governance:
+            return
+        
+        try:
+            await ctx.governance.telemetry.record_telemetry(
+                telemetry_data={
+                    "service_id": self.service_id,
+                    "intent_type": self.intent_type,
+                    "execution_id": ctx.execution_id,
+                    "timestamp": self.clock.now_iso(),
+                    **telemetry_data
+                },
+                tenant_id=ctx.tenant_id
+            )
+        except Exception as e:
+            self.logger.debug(f"Failed to record telemetry: {e}")
+    
     async def _record_telemetry_start(self, ctx: PlatformContext) -> None:
         """Record telemetry for execution start."""
         if not ctx.governance:
@@ -285,20 +316,22 @@ class PlatformIntentService:
     
     def validate_params(
         self,
-        ctx: PlatformContext,
-        required_params: List[str]
+        ctx: Any,
+        required_params: List[str],
+        param_types: Optional[Dict[str, type]] = None
     ) -> tuple[bool, Optional[str]]:
         """
         Validate required parameters are present.
         
         Args:
-            ctx: Platform context
+            ctx: Platform context, or the intent parameters dict itself
             required_params: List of required parameter names
+            param_types: Optional expected types by parameter name
         
         Returns:
             Tuple of (is_valid, error_message)
         """
-        params = ctx.intent.parameters
+        params = ctx if isinstance(ctx, dict) else ctx.intent.parameters
         
         for param in required_params:
             if param not in params:
@@ -306,6 +339,14 @@ class PlatformIntentService:
             if params[param] is None:
                 return False, f"Required parameter '{param}' is None"
         
+        for param, expected_type in (param_types or {}).items():
+            value = params.get(param)
+            if value is not None and not isinstance(value, expected_type):
+                return False, (
+                    f"Parameter '{param}' must be {expected_type.__name__}, "
+                    f"got {type(value).__name__}"
+                )
+        
         return True, None
     
     def get_param(
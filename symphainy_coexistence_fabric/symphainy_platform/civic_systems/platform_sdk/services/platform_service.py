@@ -233,25 +233,39 @@ class PlatformService:
             raise ValueError(f"No parser available for file type: {file_type}")
         
         try:
-            # Get file data from state surface if needed
-            file_data = None
-            if self._state_surface:
-                file_data = await self._state_surface.get_file(file_reference)
-            
-            # Create parsing request
+            # Create parsing request (parsers read file bytes via State Surface)
             request = FileParsingRequest(
                 file_reference=file_reference,
-                file_data=file_data,
-                options=options or {}
+                filename=(options or {}).get("filename", ""),
+                options=options or {},
+                state_surface=self._state_surface
             )
             
             # Execute parsing
-            if hasattr(parser, 'parse'):
+            if hasattr(parser, 'parse_file'):
+                result = await parser.parse_file(request)
+            elif hasattr(parser, 'parse'):
                 result = await parser.parse(request)
-            elif hasattr(parser, 'process'):
-                result = await parser.process(file_reference, file_data, options or {})
             else:
-                raise AttributeError(f"Parser for {file_type} has no parse/process method")
+                raise AttributeError(f"Parser for {file_type} has no parse_file/parse method")
+            
+            if isinstance(result, FileParsingResult):
+                if not result.success:
+                    raise RuntimeError(result.error or f"{file_type} parser reported failure")
+                parsed_content = (
+                    result.structured_data
+                    if result.structured_data is not None
+                    else result.text_content
+                )
+                return {
+                    "file_reference": file_reference,
+                    "file_type": file_type,
+                    "parsed_content": parsed_content,
+                    "text_content": result.text_content,
+                    "metadata": result.metadata or {},
+                    "parsing_type": result.parsing_type,
+                    "status": "success"
+                }
             
             return {
                 "file_reference": file_reference,
@@ -369,10 +383,10 @@ class PlatformService:
                     "audit trail may be incomplete. Callers should pass execution_context."
                 )
                 from symphainy_platform.runtime.execution_context import ExecutionContext
-                from symphainy_platform.runtime.intent_model import Intent
+                from symphainy_platform.runtime.intent_model import IntentFactory
                 from utilities import generate_event_id
                 
-                minimal_intent = Intent(
+                minimal_intent = IntentFactory.create_intent(
                     intent_type="get_parsed_file",
                     tenant_id=tenant_id,
                     session_id=session_id or "platform_sdk",
@@ -385,7 +399,8 @@ class PlatformService:
                     intent=minimal_intent,
                     tenant_id=tenant_id,
                     session_id=session_id or "platform_sdk",
-                    solution_id="platform_sdk"
+                    solution_id="platform_sdk",
+                    state_surface=self._state_surface
                 )
             
             # Pure delegation
@@ -539,10 +554,10 @@ class PlatformService:
                     "audit trail may be incomplete. Callers should pass execution_context."
                 )
                 from symphainy_platform.runtime.execution_context import ExecutionContext
-                from symphainy_platform.runtime.intent_model import Intent
+                from symphainy_platform.runtime.intent_model import IntentFactory
                 from utilities import generate_event_id
                 
-                minimal_intent = Intent(
+                minimal_intent = IntentFactory.create_intent(
                     intent_type="create_deterministic_embeddings",
                     tenant_id=tenant_id,
                     session_id=session_id,
@@ -1028,11 +1043,10 @@ class PlatformService:
             raise RuntimeError("SemanticDataAbstraction not available.")
         
         try:
-            return await self._semantic_data.search(
+            return await self._semantic_data.vector_search(
                 query_embedding=query_embedding,
-                tenant_id=tenant_id,
-                limit=limit,
-                filters=filters or {}
+                filter_conditions={**(filters or {}), "tenant_id": tenant_id},
+                limit=limit
             )
         except Exception as e:
             self._logger.error(f"Semantic search failed: {e}")
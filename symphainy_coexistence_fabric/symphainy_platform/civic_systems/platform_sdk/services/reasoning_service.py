@@ -71,6 +71,18 @@ class LLMService:
                 "LLM abstraction not available for embeddings. Check Public Works get_llm_abstraction()."
             )
         return await self._llm_abstraction.embed(content=content, model=model)
+    
+    async def embed_many(
+        self,
+        contents: List[str],
+        model: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Generate embeddings for several texts in batched provider calls."""
+        if not self._llm_abstraction:
+            raise RuntimeError(
+                "LLM abstraction not available for embeddings. Check Public Works get_llm_abstraction()."
+            )
+        return await self._llm_abstraction.embed_many(contents=contents, model=model)
 
 
 @dataclass
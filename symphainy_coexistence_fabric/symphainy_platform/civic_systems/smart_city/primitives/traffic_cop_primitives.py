@@ -20,16 +20,26 @@ if str(project_root) not in sys.path:
 
 from typing import Dict, Any, Optional
 from utilities import get_logger
+from symphainy_platform.foundations.public_works.rate_limiter import DistributedRateLimiter
 
 
 class RateLimitStore:
     """
-    Rate limit store interface (abstract).
+    Rate limit store for Traffic Cop decisions.
     
-    In MVP: Simple in-memory or Redis-based rate limit tracking
-    In full: Sophisticated rate limiting with sliding windows
+    Backed by the shared DistributedRateLimiter (Redis token buckets, so limits hold
+    across all workers; in-process buckets when Redis is unavailable).
     """
     
+    def __init__(self, limiter: Optional[DistributedRateLimiter] = None):
+        """
+        Initialize rate limit store.
+        
+        Args:
+            limiter: Shared limiter (Public Works get_rate_limiter()); None = in-process buckets
+        """
+        self.limiter = limiter or DistributedRateLimiter()
+    
     async def check_rate_limit(
         self,
         tenant_id: Optional[str],  # Optional for anonymous sessions
@@ -39,21 +49,21 @@ class RateLimitStore:
         window_seconds: int
     ) -> bool:
         """
-        Check if rate limit is exceeded.
+        Check the rate limit and count the request against it (one atomic step).
         
         Args:
             tenant_id: Tenant identifier
             user_id: Optional user identifier
-            resource: Resource identifier (e.g., "create_session")
+            action: Action identifier (e.g., "create_session")
             limit: Maximum number of requests
             window_seconds: Time window in seconds
         
         Returns:
             True if within limit, False if exceeded
         """
-        # MVP: Always allow (for MVP showcase)
-        # Full: Implement sliding window rate limiting
-        return True
+        key = f"traffic_cop:{action}:{tenant_id or 'anonymous'}:{user_id or '*'}"
+        decision = await self.limiter.check(key, limit, window_seconds)
+        return decision.allowed
     
     async def record_request(
         self,
@@ -64,14 +74,14 @@ class RateLimitStore:
         """
         Record a request for rate limiting.
         
+        check_rate_limit already counts an allowed request, so there is nothing left
+        to record; kept for callers of the check-then-record interface.
+        
         Args:
             tenant_id: Tenant identifier
             user_id: Optional user identifier
             action: Action identifier
         """
-        # MVP: No-op (for MVP showcase)
-        # Full: Record request in Redis with TTL
-        pass
 
 
 class TrafficCopPrimitives:
@@ -87,7 +97,7 @@ class TrafficCopPrimitives:
         Initialize Traffic Cop Primitives.
         
         Args:
-            rate_limit_store: Optional rate limit store (for MVP, can be None)
+            rate_limit_store: Optional rate limit store (None = in-process buckets)
         """
         self.rate_limit_store = rate_limit_store or RateLimitStore()
         self.logger = get_logger(self.__class__.__name__)
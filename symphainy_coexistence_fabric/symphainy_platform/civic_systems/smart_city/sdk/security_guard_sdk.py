@@ -64,7 +64,8 @@ class SecurityGuardSDK:
         self,
         auth_abstraction: AuthenticationProtocol,
         tenant_abstraction: TenancyProtocol,
-        policy_resolver: Optional[Any] = None  # Policy library (optional for MVP)
+        policy_resolver: Optional[Any] = None,  # Policy library (optional for MVP)
+        token_cache: Optional[Any] = None
     ):
         """
         Initialize Security Guard SDK.
@@ -73,10 +74,13 @@ class SecurityGuardSDK:
             auth_abstraction: Authentication abstraction (from Public Works)
             tenant_abstraction: Tenant abstraction (from Public Works)
             policy_resolver: Optional policy resolver (for policy preparation)
+            token_cache: Optional VerifiedTokenCache (from Public Works); repeat validations
+                of a token skip signature verification and the tenant lookup until it expires
         """
         self.auth_abstraction = auth_abstraction
         self.tenant_abstraction = tenant_abstraction
         self.policy_resolver = policy_resolver
+        self.token_cache = token_cache
         self.logger = get_logger(self.__class__.__name__)
         self.clock = get_clock()
         
@@ -241,21 +245,36 @@ class SecurityGuardSDK:
             AuthenticationResult with execution contract, or None if invalid
         """
         try:
-            # 1. Validate token (pure infrastructure)
-            validation_data = await self.auth_abstraction.validate_token(token)
-            
-            if not validation_data or not validation_data.get("success"):
-                self.logger.warning("Token validation failed")
-                return None
-            
-            user_id = validation_data.get("user_id")
-            email = validation_data.get("email", "")
-            
-            # 2. Get tenant context
-            tenant_info = await self.tenant_abstraction.get_user_tenant_info(user_id)
-            
-            if not tenant_info:
-                return None
+            cached = await self.token_cache.get(token) if self.token_cache is not None else None
+            if cached is not None:
+                user_id = cached["user_id"]
+                email = cached.get("email", "")
+                tenant_info = cached["tenant_info"]
+            else:
+                # 1. Validate token (pure infrastructure)
+                validation_data = await self.auth_abstraction.validate_token(token)
+                
+                if not validation_data or not validation_data.get("success"):
+                    self.logger.warning("Token validation failed")
+                    return None
+                
+                user_id = validation_data.get("user_id")
+                email = validation_data.get("email", "")
+                
+                # 2. Get tenant context
+                tenant_info = await self.tenant_abstraction.get_user_tenant_info(user_id)
+                
+                if not tenant_info:
+                    return None
+                
+                # Only memberships read from user_tenants are cached; a metadata fallback
+                # (e.g. after a user_tenants error) is re-resolved on the next request
+                if self.token_cache is not None and tenant_info.get("tenant_source") == "user_tenants":
+                    await self.token_cache.put(
+                        token,
+                        {"user_id": user_id, "email": email, "tenant_info": tenant_info},
+                        validation_data.get("expires_at")
+                    )
             
             tenant_id = tenant_info.get("tenant_id") or tenant_info.get("primary_tenant_id")
             roles = tenant_info.get("roles", [])
@@ -285,6 +304,16 @@ class SecurityGuardSDK:
             self.logger.error(f"Token validation coordination failed: {e}", exc_info=True)
             return None
     
+    async def revoke_token(self, token: str) -> None:
+        """Forget a cached validation of this token (all workers)."""
+        if self.token_cache is not None:
+            await self.token_cache.revoke_token(token)
+    
+    async def invalidate_user(self, user_id: str) -> None:
+        """Forget cached validations of a user's tokens after a membership or role change (all workers)."""
+        if self.token_cache is not None:
+            await self.token_cache.invalidate_user(user_id)
+    
     async def get_tenant_context(
         self,
         tenant_id: str
@@ -193,6 +193,18 @@ def get_env_contract() -> EnvContract:
     Returns:
         EnvContract instance with validated environment variables
     """
+    from .config_helper import (
+        get_supabase_url,
+        get_supabase_anon_key,
+        get_supabase_service_key,
+    )
+
+    supabase_url = get_supabase_url()
+    supabase_anon = get_supabase_anon_key()
+    supabase_service = get_supabase_service_key()
+    supabase_jwks = os.getenv("SUPABASE_JWKS_URL")
+    supabase_issuer = os.getenv("SUPABASE_JWT_ISSUER")
+
     # Read from environment variables explicitly
     return EnvContract(
         REDIS_URL=os.getenv("REDIS_URL", "redis://localhost:6379"),
@@ -12,6 +12,7 @@ Organization:
 - validation/    - Pattern validation
 - metrics/       - Metrics calculation
 - quality/       - Data quality assessment
+- statistics/    - Out-of-core EDA statistics (column profiles)
 - coexistence/   - Coexistence analysis and blueprints
 - export/        - Export and migration capabilities
 - extraction/    - Structured data extraction
@@ -36,6 +37,7 @@ if TYPE_CHECKING:
     from .validation import PatternValidationService
     from .metrics import MetricsCalculatorService
     from .quality import DataQualityService
+    from .statistics import EDAStatisticsService
     from .coexistence import CoexistenceAnalysisService
     from .export import ExportService
     from .extraction import StructuredExtractionService
@@ -55,6 +57,7 @@ __all__ = [
     "PatternValidationService",
     "MetricsCalculatorService",
     "DataQualityService",
+    "EDAStatisticsService",
     "CoexistenceAnalysisService",
     "ExportService",
     "StructuredExtractionService",
@@ -1,4 +1,4 @@
 """Chunking Library - Deterministic chunking capabilities."""
-from .deterministic_chunking_service import DeterministicChunkingService, DeterministicChunk
+from .deterministic_chunking_service import DeterministicChunkingService, DeterministicChunk, ChunkDiff
 
-__all__ = ["DeterministicChunkingService", "DeterministicChunk"]
+__all__ = ["DeterministicChunkingService", "DeterministicChunk", "ChunkDiff"]
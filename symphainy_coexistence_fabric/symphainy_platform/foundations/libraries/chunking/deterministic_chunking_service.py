@@ -4,7 +4,8 @@ Deterministic Chunking Service - Chunk-Level Deterministic Identity
 Enabling service for creating deterministic chunks from parsed content.
 
 WHAT (Enabling Service Role): I create deterministic chunks (stable, reproducible, content-addressed)
-HOW (Enabling Service Implementation): I extract structural elements from parsed content and generate stable chunk IDs
+HOW (Enabling Service Implementation): I extract structural elements from parsed content and generate stable chunk IDs,
+                                       and diff them against the chunk manifest of the file's previous parse
 
 Key Principle: Deterministic = identity + structure + locality signals
 CTO Principle: Chunking based on parser structure, not heuristics
@@ -19,9 +20,9 @@ project_root = Path(__file__).resolve().parents[5]
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import hashlib
 import json
 import re
@@ -57,6 +58,29 @@ class DeterministicChunk:
             self.metadata = {}
 
 
+@dataclass
+class ChunkDiff:
+    """
+    Chunks of a parse compared with the chunk manifest of the previous parse of the same file.
+    
+    Chunks are matched on text_hash (as a multiset), not on chunk_id: chunk IDs include the
+    structural path, so inserting one paragraph shifts the ID of every paragraph after it.
+    A chunk whose ID is in the manifest is already embedded and indexed; a chunk whose text
+    is in the manifest under another ID only `moved` (its stored vector can be re-keyed);
+    only `changed` needs embedding.
+    """
+    chunks: List[DeterministicChunk]
+    changed: List[DeterministicChunk]  # New or changed text: embed and index
+    unchanged_chunk_ids: List[str] = field(default_factory=list)  # Already embedded under this ID
+    removed_chunk_ids: List[str] = field(default_factory=list)  # In the manifest, gone from this parse
+    moved: Dict[str, str] = field(default_factory=dict)  # chunk_id -> manifest chunk_id with the same text
+    file_id: Optional[str] = None
+    parsed_file_id: Optional[str] = None
+    tenant_id: Optional[str] = None
+    embedding_profile: str = "default"
+    previous_parsed_file_id: Optional[str] = None  # Parse the manifest came from (None = no manifest)
+
+
 class DeterministicChunkingService:
     """
     Creates deterministic chunks from parsed content.
@@ -78,8 +102,11 @@ class DeterministicChunkingService:
         # Get Deterministic Embedding Service for schema-level linking
         self.deterministic_embedding_service = None
         if public_works:
-            from .deterministic_embedding_service import DeterministicEmbeddingService
+            from ..embeddings.deterministic_embedding_service import DeterministicEmbeddingService
             self.deterministic_embedding_service = DeterministicEmbeddingService(public_works=public_works)
+        
+        # Chunk manifests live in deterministic compute (DuckDB) next to the schema-level embeddings
+        self.deterministic_compute_abstraction = getattr(public_works, "deterministic_compute_abstraction", None)
     
     async def create_chunks(
         self,
@@ -111,10 +138,7 @@ class DeterministicChunkingService:
         if parsed_file_id and self.deterministic_embedding_service:
             try:
                 context = ExecutionContext(tenant_id=tenant_id)
-                # Try to get deterministic embedding by parsed_file_id
-                # Note: We may need to search by parsed_file_id, not embedding_id
-                # For now, we'll try to get it if we have the embedding_id stored
-                # This is a placeholder - actual implementation may need to query by parsed_file_id
+                # Latest deterministic embedding stored for this parsed file
                 deterministic_embedding = await self._get_deterministic_embedding_by_parsed_file_id(
                     parsed_file_id=parsed_file_id,
                     context=context
@@ -624,6 +648,137 @@ class DeterministicChunkingService:
         # Use first 16 characters for shorter ID (still collision-resistant for our use case)
         return full_hash[:16]
     
+    async def diff_chunks(
+        self,
+        parsed_content: Dict[str, Any],
+        file_id: str,
+        tenant_id: str,
+        parsed_file_id: str,
+        embedding_profile: str = "default"
+    ) -> ChunkDiff:
+        """
+        Create chunks and diff them against the stored chunk manifest.
+        
+        The baseline is this parsed file's own manifest (re-chunking the same parse) or
+        else the latest manifest of any earlier parse of the same source file. Nothing is
+        persisted here: call save_chunk_manifest once the changed (and moved) chunks are
+        embedded. Manifest IDs of moved chunks are also listed in removed_chunk_ids: the ID
+        is gone even though its text is still there.
+        
+        Args:
+            parsed_content: Parsed file content (from FileParserService)
+            file_id: File identifier
+            tenant_id: Tenant identifier
+            parsed_file_id: Parsed file identifier
+            embedding_profile: Embedding configuration manifests are kept per (profile/model/version)
+        
+        Returns:
+            ChunkDiff (every chunk is `changed` when there is no manifest)
+        
+        Raises:
+            RuntimeError: If DeterministicComputeAbstraction is not wired
+        """
+        if self.deterministic_compute_abstraction is None:
+            raise RuntimeError(
+                "DeterministicComputeAbstraction not wired; cannot read chunk manifests. Platform contract §8A."
+            )
+        
+        chunks = await self.create_chunks(
+            parsed_content=parsed_content,
+            file_id=file_id,
+            tenant_id=tenant_id,
+            parsed_file_id=parsed_file_id
+        )
+        
+        manifest = await self.deterministic_compute_abstraction.get_chunk_manifest(
+            tenant_id=tenant_id,
+            embedding_profile=embedding_profile,
+            parsed_file_id=parsed_file_id,
+            file_id=file_id
+        )
+        
+        previous = manifest["chunks"] if manifest else []
+        previous_ids = {entry["chunk_id"] for entry in previous}
+        current_ids = {chunk.chunk_id for chunk in chunks}
+        
+        # Same ID first; the manifest entries left over are matched on text_hash, one chunk each
+        by_text_hash: Dict[str, List[str]] = {}
+        for entry in previous:
+            if entry["chunk_id"] not in current_ids:
+                by_text_hash.setdefault(entry["text_hash"], []).append(entry["chunk_id"])
+        changed, moved = [], {}
+        for chunk in chunks:
+            if chunk.chunk_id in previous_ids:
+                continue
+            candidates = by_text_hash.get(chunk.text_hash)
+            if candidates:
+                moved[chunk.chunk_id] = candidates.pop(0)
+            else:
+                changed.append(chunk)
+        
+        diff = ChunkDiff(
+            chunks=chunks,
+            changed=changed,
+            unchanged_chunk_ids=[chunk.chunk_id for chunk in chunks if chunk.chunk_id in previous_ids],
+            removed_chunk_ids=sorted(previous_ids - current_ids),
+            moved=moved,
+            file_id=file_id,
+            parsed_file_id=parsed_file_id,
+            tenant_id=tenant_id,
+            embedding_profile=embedding_profile,
+            previous_parsed_file_id=manifest.get("parsed_file_id") if manifest else None
+        )
+        
+        self.logger.info(
+            f"Chunk diff for {parsed_file_id}: {len(diff.changed)} changed, {len(diff.moved)} moved, "
+            f"{len(diff.unchanged_chunk_ids)} unchanged, {len(diff.removed_chunk_ids)} removed "
+            f"(baseline: {diff.previous_parsed_file_id or 'none'})"
+        )
+        return diff
+    
+    async def save_chunk_manifest(
+        self,
+        chunk_diff: ChunkDiff,
+        exclude_chunk_ids: Iterable[str] = ()
+    ) -> bool:
+        """
+        Persist the manifest of a diffed parse.
+        
+        Args:
+            chunk_diff: Diff from diff_chunks
+            exclude_chunk_ids: Chunks that failed to embed (left out so the next diff retries them)
+        
+        Returns:
+            True if stored, False otherwise
+        
+        Raises:
+            RuntimeError: If DeterministicComputeAbstraction is not wired
+        """
+        if self.deterministic_compute_abstraction is None:
+            raise RuntimeError(
+                "DeterministicComputeAbstraction not wired; cannot store chunk manifest. Platform contract §8A."
+            )
+        
+        excluded = set(exclude_chunk_ids)
+        return await self.deterministic_compute_abstraction.store_chunk_manifest(
+            parsed_file_id=chunk_diff.parsed_file_id,
+            file_id=chunk_diff.file_id,
+            tenant_id=chunk_diff.tenant_id,
+            embedding_profile=chunk_diff.embedding_profile,
+            chunks=[self._manifest_entry(chunk) for chunk in chunk_diff.chunks if chunk.chunk_id not in excluded]
+        )
+    
+    @staticmethod
+    def _manifest_entry(chunk: DeterministicChunk) -> Dict[str, Any]:
+        """Chunk identity recorded in a manifest (no text, no timestamps)."""
+        return {
+            "chunk_id": chunk.chunk_id,
+            "chunk_index": chunk.chunk_index,
+            "source_path": chunk.source_path,
+            "text_hash": chunk.text_hash,
+            "structural_type": chunk.structural_type
+        }
+    
     async def _get_deterministic_embedding_by_parsed_file_id(
         self,
         parsed_file_id: str,
@@ -632,12 +787,10 @@ class DeterministicChunkingService:
         """
         Get deterministic embedding by parsed_file_id.
         
-        This is a helper to link chunks to schema-level deterministic.
-        The actual implementation may need to query by parsed_file_id.
-        
-        For now, this is a placeholder - we may need to add a method to
-        DeterministicEmbeddingService to query by parsed_file_id.
+        This is a helper to link chunks to schema-level deterministic
+        (latest deterministic embedding stored for the parsed file).
         """
-        # TODO: Implement query by parsed_file_id
-        # For now, return None (schema-level may not exist yet)
-        return None
+        return await self.deterministic_embedding_service.get_deterministic_embedding_by_parsed_file_id(
+            parsed_file_id=parsed_file_id,
+            context=context
+        )
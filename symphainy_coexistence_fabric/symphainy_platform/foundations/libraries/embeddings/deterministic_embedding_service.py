@@ -4,7 +4,8 @@ Deterministic Embedding Service - Schema Fingerprints + Pattern Signatures
 Enabling service for creating deterministic embeddings from parsed files.
 
 WHAT (Enabling Service Role): I create deterministic embeddings (schema fingerprints + pattern signatures)
-HOW (Enabling Service Implementation): I extract schema structure and data patterns from parsed content
+HOW (Enabling Service Implementation): I extract schema structure from parsed content and data patterns
+                                       from its shared column profile (ColumnProfileService)
 
 Key Principle: Deterministic = reproducible, hash-based, exact matching capable.
 """
@@ -22,10 +23,14 @@ from datetime import datetime
 import hashlib
 import json
 import re
-from collections import Counter
 
 from utilities import get_logger, generate_event_id
 from symphainy_platform.runtime.execution_context import ExecutionContext
+from symphainy_platform.foundations.libraries.statistics.column_profile import ColumnProfileService
+
+
+# Profile pattern classes reported in pattern signatures (flagged when > 50% of non-null values match)
+SIGNATURE_PATTERNS = ("email", "phone", "uuid", "numeric_string")
 
 
 class DeterministicEmbeddingService:
@@ -46,6 +51,7 @@ class DeterministicEmbeddingService:
         """
         self.logger = get_logger(self.__class__.__name__)
         self.public_works = public_works
+        self.column_profile_service = ColumnProfileService(public_works=public_works)
         
         # Get Deterministic Compute abstraction for storage (governed access)
         # ARCHITECTURAL PRINCIPLE: Realms use Public Works abstractions, never direct adapters.
@@ -83,8 +89,11 @@ class DeterministicEmbeddingService:
         # Create schema fingerprint
         schema_fingerprint = self._create_schema_fingerprint(schema)
         
-        # Create pattern signature
-        pattern_signature = await self._create_pattern_signature(parsed_content, schema)
+        # Create pattern signature (from the column profile shared with metrics and data quality)
+        profile = await self.column_profile_service.get_profile(
+            parsed_file_id, parsed_content, tenant_id=context.tenant_id
+        )
+        pattern_signature = self._create_pattern_signature(schema, profile)
         
         # Generate embedding ID
         embedding_id = generate_event_id()
@@ -108,6 +117,36 @@ class DeterministicEmbeddingService:
             "schema": schema
         }
     
+    async def _store_deterministic_embedding(
+        self,
+        embedding_id: str,
+        parsed_file_id: str,
+        schema_fingerprint: str,
+        pattern_signature: Dict[str, Any],
+        context: ExecutionContext
+    ) -> None:
+        """
+        Store deterministic embedding via DeterministicComputeAbstraction (governed access).
+        
+        Raises:
+            RuntimeError: If the abstraction is not wired or the store fails
+        """
+        if not self.deterministic_compute_abstraction:
+            raise RuntimeError(
+                "DeterministicComputeAbstraction not wired; cannot store embedding. Platform contract §8A."
+            )
+        
+        stored = await self.deterministic_compute_abstraction.store_deterministic_embedding(
+            embedding_id=embedding_id,
+            parsed_file_id=parsed_file_id,
+            schema_fingerprint=schema_fingerprint,
+            pattern_signature=pattern_signature,
+            tenant_id=context.tenant_id,
+            session_id=context.session_id
+        )
+        if not stored:
+            raise RuntimeError(f"Failed to store deterministic embedding: {embedding_id}")
+    
     def _extract_schema(self, parsed_content: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Extract schema from parsed content.
@@ -209,113 +248,82 @@ class DeterministicEmbeddingService:
         
         return fingerprint
     
-    async def _create_pattern_signature(
+    def _create_pattern_signature(
         self,
-        parsed_content: Dict[str, Any],
-        schema: List[Dict[str, Any]]
+        schema: List[Dict[str, Any]],
+        profile: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
         Create pattern signature (statistical signature of data patterns).
         
         Args:
-            parsed_content: Parsed file content
             schema: Schema definition
+            profile: Column profile of the parsed content (ColumnProfileService)
         
         Returns:
             Pattern signature dictionary
         """
         signature = {}
-        data = parsed_content.get("data", [])
-        
-        if not isinstance(data, list) or len(data) == 0:
+        if profile["row_count"] == 0:
             return {"empty": True}
         
         # Analyze each column
         for col in schema:
             col_name = col.get("name")
             col_type = col.get("type", "unknown")
-            
-            # Extract column values
-            values = []
-            for row in data:
-                if isinstance(row, dict) and col_name in row:
-                    values.append(row[col_name])
-            
-            if not values:
+            column = profile["columns"].get(col_name)
+            if not column or column["count"] == 0:
                 continue
             
             # Calculate statistics
+            non_null_count = column["count"] - column["null_count"]
             col_signature = {
                 "type": col_type,
-                "total_count": len(values),
-                "null_count": sum(1 for v in values if v is None),
-                "unique_count": len(set(v for v in values if v is not None))
+                "total_count": column["count"],
+                "null_count": column["null_count"],
+                "unique_count": column["distinct_count"]
             }
             
             # Type-specific analysis
             if col_type in ["integer", "float"]:
-                numeric_values = [v for v in values if v is not None and isinstance(v, (int, float))]
-                if numeric_values:
-                    col_signature["min"] = min(numeric_values)
-                    col_signature["max"] = max(numeric_values)
-                    col_signature["mean"] = sum(numeric_values) / len(numeric_values)
+                if column["numeric_count"]:
+                    col_signature["min"] = column["min"]
+                    col_signature["max"] = column["max"]
+                    col_signature["mean"] = column["mean"]
             
             elif col_type == "string":
-                string_values = [str(v) for v in values if v is not None]
-                if string_values:
+                if non_null_count:
                     # Length statistics
-                    lengths = [len(s) for s in string_values]
-                    col_signature["min_length"] = min(lengths)
-                    col_signature["max_length"] = max(lengths)
-                    col_signature["mean_length"] = sum(lengths) / len(lengths)
+                    col_signature["min_length"] = column["length"]["min"]
+                    col_signature["max_length"] = column["length"]["max"]
+                    col_signature["mean_length"] = column["length"]["mean"]
                     
                     # Format patterns (sample)
-                    sample_values = string_values[:10]
-                    col_signature["sample_values"] = sample_values
+                    col_signature["sample_values"] = column["sample_values"]
                     
                     # Pattern detection
-                    patterns = self._detect_patterns(string_values)
+                    patterns = self._detect_patterns(column["pattern_counts"], non_null_count)
                     if patterns:
                         col_signature["patterns"] = patterns
             
             elif col_type in ["date", "datetime"]:
-                date_values = [v for v in values if v is not None]
-                if date_values:
+                if column["string_min"] is not None:
                     col_signature["date_range"] = {
-                        "earliest": min(date_values),
-                        "latest": max(date_values)
+                        "earliest": column["string_min"],
+                        "latest": column["string_max"]
                     }
             
             signature[col_name] = col_signature
         
         return signature
     
-    def _detect_patterns(self, values: List[str]) -> Dict[str, Any]:
-        """Detect common patterns in string values."""
-        patterns = {}
-        
-        # Email pattern
-        email_count = sum(1 for v in values if re.match(r'^[\w\.-]+@[\w\.-]+\.\w+$', v))
-        if email_count > len(values) * 0.5:
-            patterns["email"] = True
-        
-        # Phone pattern
-        phone_count = sum(1 for v in values if re.match(r'^\+?[\d\s\-\(\)]+$', v))
-        if phone_count > len(values) * 0.5:
-            patterns["phone"] = True
-        
-        # UUID pattern
-        uuid_count = sum(1 for v in values if re.match(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', v, re.I))
-        if uuid_count > len(values) * 0.5:
-            patterns["uuid"] = True
-        
-        # Numeric string pattern
-        numeric_count = sum(1 for v in values if re.match(r'^\d+$', v))
-        if numeric_count > len(values) * 0.5:
-            patterns["numeric_string"] = True
-        
-        return patterns
-    
+    def _detect_patterns(self, pattern_counts: Dict[str, int], value_count: int) -> Dict[str, Any]:
+        """Common patterns (from profile pattern-class counts) matched by most values."""
+        return {
+            name: True
+            for name in SIGNATURE_PATTERNS
+            if pattern_counts.get(name, 0) > value_count * 0.5
+        }
     
     async def get_deterministic_embedding(
         self,
@@ -347,17 +355,7 @@ class DeterministicEmbeddingService:
             )
             
             if embedding:
-                # Convert to expected format (include schema for compatibility)
-                return {
-                    "_key": embedding.get("embedding_id"),
-                    "parsed_file_id": embedding.get("parsed_file_id"),
-                    "tenant_id": embedding.get("tenant_id"),
-                    "session_id": embedding.get("session_id"),
-                    "schema_fingerprint": embedding.get("schema_fingerprint"),
-                    "pattern_signature": embedding.get("pattern_signature"),
-                    "schema": embedding.get("schema_fingerprint", {}).get("schema"),  # Extract schema if available
-                    "created_at": embedding.get("created_at")
-                }
+                return self._to_embedding_document(embedding)
             else:
                 return None
                 
@@ -365,6 +363,50 @@ class DeterministicEmbeddingService:
             self.logger.error(f"Failed to get deterministic embedding: {e}", exc_info=True)
             return None
     
+    async def get_deterministic_embedding_by_parsed_file_id(
+        self,
+        parsed_file_id: str,
+        context: ExecutionContext
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest deterministic embedding of a parsed file (governed access).
+        
+        Args:
+            parsed_file_id: Parsed file identifier
+            context: Execution context
+        
+        Returns:
+            Embedding document or None
+        """
+        if not self.deterministic_compute_abstraction:
+            raise RuntimeError(
+                "DeterministicComputeAbstraction not wired; cannot get embedding. Platform contract §8A."
+            )
+        
+        embeddings = await self.deterministic_compute_abstraction.query_deterministic_embeddings(
+            filter_conditions={"parsed_file_id": parsed_file_id, "tenant_id": context.tenant_id}
+        )
+        if not embeddings:
+            return None
+        latest = max(embeddings, key=lambda embedding: str(embedding.get("created_at") or ""))
+        return self._to_embedding_document(latest)
+    
+    @staticmethod
+    def _to_embedding_document(embedding: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a stored row to the expected format (include schema for compatibility)."""
+        schema_fingerprint = embedding.get("schema_fingerprint")
+        return {
+            "_key": embedding.get("embedding_id"),
+            "parsed_file_id": embedding.get("parsed_file_id"),
+            "tenant_id": embedding.get("tenant_id"),
+            "session_id": embedding.get("session_id"),
+            "schema_fingerprint": schema_fingerprint,
+            "pattern_signature": embedding.get("pattern_signature"),
+            # Extract schema if available (fingerprints are stored as a hash string)
+            "schema": schema_fingerprint.get("schema") if isinstance(schema_fingerprint, dict) else None,
+            "created_at": embedding.get("created_at")
+        }
+    
     async def match_schemas(
         self,
         source_embedding_id: str,
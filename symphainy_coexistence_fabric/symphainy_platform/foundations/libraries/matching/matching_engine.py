@@ -0,0 +1,288 @@
+"""
+Matching Engine - Vectorized column similarity and assignment
+
+Shared by the matching services to score every source column against every
+target column at once and pick one-to-one matches.
+
+WHAT (Enabling Service Role): I turn two column lists into a similarity matrix and a set of matches
+HOW (Enabling Service Implementation): I normalize embedding matrices once and compute cosine
+                                       similarity with one matrix multiply (token-overlap Jaccard
+                                       from incidence matrices for columns without embeddings),
+                                       then solve the assignment optimally (Hungarian) or greedily
+                                       above a threshold
+
+No business logic - pure matching algorithm.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+ASSIGNMENT_STRATEGIES = ("optimal", "greedy")
+
+_TOKEN = re.compile(r"\S+")
+
+
+def cosine_similarity_matrix(source: "np.ndarray", target: "np.ndarray") -> "np.ndarray":
+    """
+    Cosine similarity of every source row against every target row.
+
+    Args:
+        source: (S, D) matrix
+        target: (T, D) matrix
+
+    Returns:
+        (S, T) matrix; rows or columns with zero norm score 0.0
+    """
+    source = _normalize(np.asarray(source, dtype=np.float32))
+    target = _normalize(np.asarray(target, dtype=np.float32))
+    return source @ target.T
+
+
+def jaccard_similarity_matrix(source_texts: Sequence[str], target_texts: Sequence[str]) -> "np.ndarray":
+    """
+    Jaccard similarity of lower-cased word sets, for every source/target pair.
+
+    Empty texts score 0.0 against everything.
+    """
+    source_tokens = [set(_TOKEN.findall((text or "").lower())) for text in source_texts]
+    target_tokens = [set(_TOKEN.findall((text or "").lower())) for text in target_texts]
+    vocabulary: Dict[str, int] = {}
+    for tokens in source_tokens + target_tokens:
+        for token in tokens:
+            vocabulary.setdefault(token, len(vocabulary))
+
+    source_matrix = _incidence(source_tokens, vocabulary)
+    target_matrix = _incidence(target_tokens, vocabulary)
+    intersection = source_matrix @ target_matrix.T
+    union = source_matrix.sum(axis=1)[:, None] + target_matrix.sum(axis=1)[None, :] - intersection
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(union > 0, intersection / np.maximum(union, 1), 0.0).astype(np.float32)
+
+
+def column_similarity_matrix(
+    source_columns: Sequence[Dict[str, Any]],
+    target_columns: Sequence[Dict[str, Any]],
+    vector_field: str = "meaning_embedding",
+    text_field: str = "semantic_meaning"
+) -> "np.ndarray":
+    """
+    Similarity of every source column against every target column.
+
+    Pairs where both columns carry a vector of the common dimension use cosine
+    similarity; every other pair uses Jaccard similarity of `text_field`.
+
+    Returns:
+        (S, T) float32 matrix
+    """
+    scores = np.zeros((len(source_columns), len(target_columns)), dtype=np.float32)
+    if scores.size == 0:
+        return scores
+
+    source_vectors, source_has = _vectors(source_columns, vector_field)
+    target_vectors, target_has = _vectors(target_columns, vector_field)
+    dimension = _common_dimension(source_vectors + target_vectors)
+    source_has &= np.array([v is not None and len(v) == dimension for v in source_vectors], dtype=bool)
+    target_has &= np.array([v is not None and len(v) == dimension for v in target_vectors], dtype=bool)
+
+    rows, cols = np.flatnonzero(source_has), np.flatnonzero(target_has)
+    if len(rows) and len(cols):
+        scores[np.ix_(rows, cols)] = cosine_similarity_matrix(
+            np.array([source_vectors[i] for i in rows], dtype=np.float32),
+            np.array([target_vectors[j] for j in cols], dtype=np.float32)
+        )
+
+    text_pairs = ~(source_has[:, None] & target_has[None, :])
+    if text_pairs.any():
+        text_rows = np.flatnonzero(text_pairs.any(axis=1))
+        text_cols = np.flatnonzero(text_pairs.any(axis=0))
+        text_scores = jaccard_similarity_matrix(
+            [source_columns[i].get(text_field, "") for i in text_rows],
+            [target_columns[j].get(text_field, "") for j in text_cols]
+        )
+        block = np.ix_(text_rows, text_cols)
+        scores[block] = np.where(text_pairs[block], text_scores, scores[block])
+    return scores
+
+
+def paired_similarity(
+    source_columns: Sequence[Dict[str, Any]],
+    target_columns: Sequence[Dict[str, Any]],
+    vector_field: str = "meaning_embedding",
+    text_field: str = "semantic_meaning"
+) -> "np.ndarray":
+    """Similarity of source_columns[i] with target_columns[i] (same rules as column_similarity_matrix)."""
+    scores = np.zeros(len(source_columns), dtype=np.float32)
+    for dimension_pairs in _group_pairs_by_dimension(source_columns, target_columns, vector_field).values():
+        index = np.array(dimension_pairs)
+        source = _normalize(np.array([source_columns[i][vector_field] for i in index], dtype=np.float32))
+        target = _normalize(np.array([target_columns[i][vector_field] for i in index], dtype=np.float32))
+        scores[index] = np.einsum("ij,ij->i", source, target)
+    for i, (source, target) in enumerate(zip(source_columns, target_columns)):
+        if not _has_vector_pair(source, target, vector_field):
+            scores[i] = jaccard_similarity_matrix([source.get(text_field, "")], [target.get(text_field, "")])[0, 0]
+    return scores
+
+
+def assign(
+    scores: "np.ndarray",
+    threshold: float = 0.0,
+    strategy: str = "optimal"
+) -> List[Tuple[int, int, float]]:
+    """
+    One-to-one assignment of rows to columns using pairs scoring above threshold.
+
+    Args:
+        scores: (S, T) similarity matrix
+        threshold: Pairs must score strictly above this
+        strategy: "optimal" maximizes total score (Hungarian); "greedy" takes the
+                  highest remaining pair first
+
+    Returns:
+        (row, column, score) triples sorted by row
+    """
+    if strategy not in ASSIGNMENT_STRATEGIES:
+        raise ValueError(f"strategy must be one of {ASSIGNMENT_STRATEGIES}, got {strategy!r}")
+    scores = np.asarray(scores, dtype=np.float64)
+    if scores.size == 0:
+        return []
+    eligible = scores > threshold
+
+    # Rows / columns without any eligible pair cannot be matched; solve the rest only
+    rows = np.flatnonzero(eligible.any(axis=1))
+    cols = np.flatnonzero(eligible.any(axis=0))
+    if len(rows) == 0:
+        return []
+    sub_scores = np.where(eligible, scores, 0.0)[np.ix_(rows, cols)]
+
+    if strategy == "greedy":
+        pairs = _greedy(sub_scores)
+    else:
+        pairs = _hungarian_max(sub_scores)
+
+    matches = [
+        (int(rows[i]), int(cols[j]), float(scores[rows[i], cols[j]]))
+        for i, j in pairs
+        if eligible[rows[i], cols[j]]
+    ]
+    matches.sort()
+    return matches
+
+
+def _normalize(matrix: "np.ndarray") -> "np.ndarray":
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def _incidence(token_sets: List[set], vocabulary: Dict[str, int]) -> "np.ndarray":
+    matrix = np.zeros((len(token_sets), max(1, len(vocabulary))), dtype=np.float32)
+    for row, tokens in enumerate(token_sets):
+        matrix[row, [vocabulary[token] for token in tokens]] = 1.0
+    return matrix
+
+
+def _vectors(columns: Sequence[Dict[str, Any]], vector_field: str) -> Tuple[List[Optional[list]], "np.ndarray"]:
+    vectors = [column.get(vector_field) or None for column in columns]
+    return vectors, np.array([vector is not None for vector in vectors], dtype=bool)
+
+
+def _common_dimension(vectors: List[Optional[list]]) -> Optional[int]:
+    """Most frequent vector length (vectors of another length fall back to text similarity)."""
+    counts: Dict[int, int] = {}
+    for vector in vectors:
+        if vector is not None:
+            counts[len(vector)] = counts.get(len(vector), 0) + 1
+    return max(counts, key=counts.get) if counts else None
+
+
+def _has_vector_pair(source: Dict[str, Any], target: Dict[str, Any], vector_field: str) -> bool:
+    source_vector, target_vector = source.get(vector_field), target.get(vector_field)
+    return bool(source_vector) and bool(target_vector) and len(source_vector) == len(target_vector)
+
+
+def _group_pairs_by_dimension(
+    source_columns: Sequence[Dict[str, Any]],
+    target_columns: Sequence[Dict[str, Any]],
+    vector_field: str
+) -> Dict[int, List[int]]:
+    groups: Dict[int, List[int]] = {}
+    for i, (source, target) in enumerate(zip(source_columns, target_columns)):
+        if _has_vector_pair(source, target, vector_field):
+            groups.setdefault(len(source[vector_field]), []).append(i)
+    return groups
+
+
+def _greedy(scores: "np.ndarray") -> List[Tuple[int, int]]:
+    flat = scores.ravel()
+    candidates = np.flatnonzero(flat > 0)
+    order = candidates[np.argsort(-flat[candidates], kind="stable")]
+    used_rows, used_cols = set(), set()
+    pairs: List[Tuple[int, int]] = []
+    limit = min(scores.shape)
+    for position in order:
+        row, col = divmod(int(position), scores.shape[1])
+        if row in used_rows or col in used_cols:
+            continue
+        used_rows.add(row)
+        used_cols.add(col)
+        pairs.append((row, col))
+        if len(pairs) == limit:
+            break
+    return pairs
+
+
+def _hungarian_max(scores: "np.ndarray") -> List[Tuple[int, int]]:
+    """Maximum-weight assignment (rectangular); returns (row, column) pairs."""
+    if scores.shape[0] > scores.shape[1]:
+        return [(row, col) for col, row in _hungarian_max(scores.T)]
+    cost = scores.max() - scores
+    return list(enumerate(_hungarian_min(cost)))
+
+
+def _hungarian_min(cost: "np.ndarray") -> List[int]:
+    """
+    Minimum-cost assignment of every row to a distinct column (rows <= columns).
+
+    Shortest augmenting path form of the Hungarian algorithm with potentials;
+    the inner scan over columns is vectorized, so the cost is O(n^2) numpy ops.
+    """
+    n, m = cost.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    owner = np.zeros(m + 1, dtype=np.int64)  # owner[j] = 1-based row assigned to column j
+    way = np.zeros(m + 1, dtype=np.int64)
+    for i in range(1, n + 1):
+        owner[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = owner[j0]
+            free = ~used[1:]
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            better = free & (reduced < minv[1:])
+            minv[1:][better] = reduced[better]
+            way[1:][better] = j0
+            masked = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(masked)) + 1
+            delta = masked[j1 - 1]
+            used_columns = np.flatnonzero(used)
+            u[owner[used_columns]] += delta
+            v[used_columns] -= delta
+            minv[1:][free] -= delta
+            j0 = j1
+            if owner[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            owner[j0] = owner[j1]
+            j0 = j1
+
+    assignment = [0] * n
+    for j in range(1, m + 1):
+        if owner[j]:
+            assignment[owner[j] - 1] = j - 1
+    return assignment
@@ -12,6 +12,7 @@ ARCHITECTURAL PRINCIPLE: This is Phase 1 of three-phase matching.
 - No business logic - pure matching algorithm
 """
 
+import hashlib
 from typing import Dict, Any, Optional, List
 from utilities import get_logger
 from symphainy_platform.runtime.execution_context import ExecutionContext
@@ -129,51 +130,54 @@ class SchemaMatchingService:
             mapped_source_cols = set()
             mapped_target_cols = set()
             
+            # Index target columns once: by hash, by lower-cased name (with type) and by type.
+            # Each index keeps the first target in order, matching a left-to-right scan.
+            target_by_hash: Dict[str, Dict[str, Any]] = {}
+            target_by_name_type: Dict[tuple, Dict[str, Any]] = {}
+            target_by_name: Dict[str, Dict[str, Any]] = {}
+            target_by_type: Dict[Any, Dict[str, Any]] = {}
+            for target_col in target_columns:
+                target_name = target_col.get("name")
+                target_type = target_col.get("type")
+                target_by_hash.setdefault(self._hash_column(target_col), target_col)
+                target_by_name_type.setdefault((target_name.lower(), target_type), target_col)
+                target_by_name.setdefault(target_name.lower(), target_col)
+                target_by_type.setdefault(target_type, target_col)
+            
             for source_col in source_columns:
                 source_col_name = source_col.get("name")
                 source_col_type = source_col.get("type")
-                source_col_hash = self._hash_column(source_col)
+                
+                # Exact match (same name, type, position)
+                target_col = target_by_hash.get(self._hash_column(source_col))
+                if target_col is not None:
+                    exact_matches.append({
+                        "source_column": source_col_name,
+                        "target_column": target_col.get("name"),
+                        "match_type": "exact",
+                        "confidence": 1.0,
+                        "source_type": source_col_type,
+                        "target_type": target_col.get("type")
+                    })
+                    mapped_source_cols.add(source_col_name)
+                    mapped_target_cols.add(target_col.get("name"))
+                    continue
                 
                 best_match = None
                 best_score = 0.0
-                
-                for target_col in target_columns:
-                    target_col_name = target_col.get("name")
-                    target_col_type = target_col.get("type")
-                    target_col_hash = self._hash_column(target_col)
-                    
-                    # Exact match (same name, type, position)
-                    if source_col_hash == target_col_hash:
-                        exact_matches.append({
-                            "source_column": source_col_name,
-                            "target_column": target_col_name,
-                            "match_type": "exact",
-                            "confidence": 1.0,
-                            "source_type": source_col_type,
-                            "target_type": target_col_type
-                        })
-                        mapped_source_cols.add(source_col_name)
-                        mapped_target_cols.add(target_col_name)
-                        best_match = target_col_name
-                        best_score = 1.0
-                        break
-                    
-                    # Name match (exact column name)
-                    elif source_col_name.lower() == target_col_name.lower():
-                        score = 0.8 if source_col_type == target_col_type else 0.6
-                        if score > best_score:
-                            best_match = target_col_name
-                            best_score = score
-                    
+                name = source_col_name.lower()
+                if (name, source_col_type) in target_by_name_type:
+                    # Name match (exact column name, same type)
+                    best_match, best_score = target_by_name_type[(name, source_col_type)].get("name"), 0.8
+                elif name in target_by_name:
+                    # Name match (exact column name, different type)
+                    best_match, best_score = target_by_name[name].get("name"), 0.6
+                elif source_col_type in target_by_type:
                     # Type match (same type, different name)
-                    elif source_col_type == target_col_type:
-                        score = 0.5
-                        if score > best_score:
-                            best_match = target_col_name
-                            best_score = score
+                    best_match, best_score = target_by_type[source_col_type].get("name"), 0.5
                 
                 # Store similarity score if not exact match
-                if best_match and best_score < 1.0:
+                if best_match:
                     similarity_scores[source_col_name] = {
                         "target_column": best_match,
                         "score": best_score,
@@ -241,8 +245,6 @@ class SchemaMatchingService:
     
     def _hash_column(self, column: Dict[str, Any]) -> str:
         """Generate hash for column (name + type + position)."""
-        import hashlib
-        
         name = column.get("name", "")
         col_type = column.get("type", "")
         position = column.get("position", "")
@@ -4,7 +4,9 @@ Semantic Matching Service - Phase 2: Semantic Matching
 Enabling service for semantic matching using semantic embeddings.
 
 WHAT (Enabling Service Role): I match columns by semantic meaning
-HOW (Enabling Service Implementation): I use semantic embeddings to find similar columns
+HOW (Enabling Service Implementation): I use semantic embeddings to find similar columns, scoring
+                                       all unmapped pairs in one similarity matrix and assigning
+                                       each target column at most once
 
 ARCHITECTURAL PRINCIPLE: This is Phase 2 of three-phase matching.
 - Uses SemanticDataAbstraction (governed access)
@@ -17,6 +19,14 @@ from utilities import get_logger
 from symphainy_platform.runtime.execution_context import ExecutionContext
 from symphainy_platform.foundations.libraries.chunking.deterministic_chunking_service import DeterministicChunkingService
 from symphainy_platform.foundations.libraries.parsing.file_parser_service import FileParserService
+from .matching_engine import ASSIGNMENT_STRATEGIES, assign, column_similarity_matrix, paired_similarity
+
+
+# Minimum similarity for a suggested mapping of unmapped columns
+SEMANTIC_MATCH_THRESHOLD = 0.6
+
+# Minimum similarity for semantic confirmation of a schema match
+CONFIRMATION_THRESHOLD = 0.7
 
 
 class SemanticMatchingService:
@@ -27,15 +37,20 @@ class SemanticMatchingService:
     Returns similarity scores based on semantic similarity.
     """
     
-    def __init__(self, public_works: Optional[Any] = None):
+    def __init__(self, public_works: Optional[Any] = None, assignment_strategy: str = "optimal"):
         """
         Initialize Semantic Matching Service.
         
         Args:
             public_works: Public Works Foundation Service (for accessing abstractions)
+            assignment_strategy: "optimal" (maximum total similarity) or "greedy"
+                (highest-scoring pair first) one-to-one assignment of unmapped columns
         """
+        if assignment_strategy not in ASSIGNMENT_STRATEGIES:
+            raise ValueError(f"assignment_strategy must be one of {ASSIGNMENT_STRATEGIES}")
         self.logger = get_logger(self.__class__.__name__)
         self.public_works = public_works
+        self.assignment_strategy = assignment_strategy
         
         # Get SemanticDataAbstraction (governed access)
         # ARCHITECTURAL PRINCIPLE: Realms use Public Works abstractions, never direct adapters.
@@ -152,62 +167,48 @@ class SemanticMatchingService:
             unmapped_target = schema_matches.get("unmapped_target", [])
             
             # Phase 2: Semantic matching for unmapped columns
+            # Score every unmapped source/target pair at once, then assign one-to-one
+            source_cols = [col for col in unmapped_source if source_col_map.get(col)]
+            target_cols = [col for col in unmapped_target if target_col_map.get(col)]
+            scores = column_similarity_matrix(
+                [source_col_map[col] for col in source_cols],
+                [target_col_map[col] for col in target_cols]
+            )
+            
             semantic_matches = []
             suggested_mappings = []
-            enhanced_confidence = {}
-            
-            # For each unmapped source column, find best semantic match
-            for source_col in unmapped_source:
-                source_emb = source_col_map.get(source_col)
-                if not source_emb:
-                    continue
-                
-                best_match = None
-                best_score = 0.0
-                
-                # Try to match against unmapped target columns
-                for target_col in unmapped_target:
-                    target_emb = target_col_map.get(target_col)
-                    if not target_emb:
-                        continue
-                    
-                    # Calculate semantic similarity
-                    similarity = self._calculate_semantic_similarity(source_emb, target_emb)
-                    
-                    if similarity > best_score:
-                        best_score = similarity
-                        best_match = target_col
-                
-                # If good match found, add to semantic matches
-                if best_match and best_score > 0.6:  # Threshold for semantic match
-                    semantic_matches.append({
-                        "source_column": source_col,
-                        "target_column": best_match,
-                        "match_type": "semantic",
-                        "confidence": best_score,
-                        "semantic_meaning": source_emb.get("semantic_meaning", "")
-                    })
-                    suggested_mappings.append({
-                        "source_column": source_col,
-                        "target_column": best_match,
-                        "confidence": best_score,
-                        "reason": "Semantic similarity"
-                    })
+            for row, col, score in assign(scores, SEMANTIC_MATCH_THRESHOLD, self.assignment_strategy):
+                source_col, best_match = source_cols[row], target_cols[col]
+                semantic_matches.append({
+                    "source_column": source_col,
+                    "target_column": best_match,
+                    "match_type": "semantic",
+                    "confidence": score,
+                    "semantic_meaning": source_col_map[source_col].get("semantic_meaning", "")
+                })
+                suggested_mappings.append({
+                    "source_column": source_col,
+                    "target_column": best_match,
+                    "confidence": score,
+                    "reason": "Semantic similarity"
+                })
             
             # Enhance confidence for existing schema matches using semantic similarity
-            exact_matches = schema_matches.get("exact_matches", [])
-            for match in exact_matches:
-                source_col = match.get("source_column")
-                target_col = match.get("target_column")
-                
-                source_emb = source_col_map.get(source_col)
-                target_emb = target_col_map.get(target_col)
-                
-                if source_emb and target_emb:
-                    semantic_sim = self._calculate_semantic_similarity(source_emb, target_emb)
-                    # Enhance confidence if semantic similarity confirms match
-                    if semantic_sim > 0.7:
-                        enhanced_confidence[f"{source_col}->{target_col}"] = min(1.0, match.get("confidence", 0.0) + 0.1)
+            confirmable = [
+                match for match in schema_matches.get("exact_matches", [])
+                if source_col_map.get(match.get("source_column")) and target_col_map.get(match.get("target_column"))
+            ]
+            confirmations = paired_similarity(
+                [source_col_map[match["source_column"]] for match in confirmable],
+                [target_col_map[match["target_column"]] for match in confirmable]
+            )
+            enhanced_confidence = {}
+            for match, semantic_sim in zip(confirmable, confirmations):
+                # Enhance confidence if semantic similarity confirms match
+                if semantic_sim > CONFIRMATION_THRESHOLD:
+                    enhanced_confidence[f"{match['source_column']}->{match['target_column']}"] = min(
+                        1.0, match.get("confidence", 0.0) + 0.1
+                    )
             
             return {
                 "semantic_matches": semantic_matches,
@@ -237,64 +238,3 @@ class SemanticMatchingService:
                 col_map[column_name] = emb
         
         return col_map
-    
-    def _calculate_semantic_similarity(
-        self,
-        source_emb: Dict[str, Any],
-        target_emb: Dict[str, Any]
-    ) -> float:
-        """
-        Calculate semantic similarity between two embeddings.
-        
-        Uses cosine similarity on meaning_embedding vectors.
-        """
-        try:
-            # Get meaning embeddings
-            source_meaning_emb = source_emb.get("meaning_embedding")
-            target_meaning_emb = target_emb.get("meaning_embedding")
-            
-            if not source_meaning_emb or not target_meaning_emb:
-                # Fallback: Use semantic_meaning text similarity
-                source_meaning = source_emb.get("semantic_meaning", "")
-                target_meaning = target_emb.get("semantic_meaning", "")
-                return self._text_similarity(source_meaning, target_meaning)
-            
-            # Calculate cosine similarity
-            import numpy as np
-            
-            source_vec = np.array(source_meaning_emb)
-            target_vec = np.array(target_meaning_emb)
-            
-            # Cosine similarity
-            dot_product = np.dot(source_vec, target_vec)
-            norm_source = np.linalg.norm(source_vec)
-            norm_target = np.linalg.norm(target_vec)
-            
-            if norm_source == 0 or norm_target == 0:
-                return 0.0
-            
-            similarity = dot_product / (norm_source * norm_target)
-            return float(similarity)
-            
-        except Exception as e:
-            self.logger.debug(f"Failed to calculate semantic similarity: {e}")
-            # Fallback to text similarity
-            source_meaning = source_emb.get("semantic_meaning", "")
-            target_meaning = target_emb.get("semantic_meaning", "")
-            return self._text_similarity(source_meaning, target_meaning)
-    
-    def _text_similarity(self, text1: str, text2: str) -> float:
-        """Simple text similarity (Jaccard similarity on words)."""
-        if not text1 or not text2:
-            return 0.0
-        
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
-        intersection = words1 & words2
-        union = words1 | words2
-        
-        if not union:
-            return 0.0
-        
-        return len(intersection) / len(union)
@@ -4,7 +4,8 @@ Metrics Calculator Service - Pure Data Processing for Metrics Calculation
 Enabling service for metrics calculation operations.
 
 WHAT (Enabling Service Role): I execute metrics calculation
-HOW (Enabling Service Implementation): I use Public Works abstractions for metrics
+HOW (Enabling Service Implementation): I use Public Works abstractions for metrics and read column
+                                       statistics from the parsed file's shared column profile
 
 Key Principle: Pure data processing - no LLM, no business logic, no orchestration.
 """
@@ -21,6 +22,16 @@ from typing import Dict, Any, Optional
 
 from utilities import get_logger
 from symphainy_platform.runtime.execution_context import ExecutionContext
+from symphainy_platform.foundations.libraries.statistics.column_profile import ColumnProfileService
+
+
+# Declared column type -> profile value types that satisfy it (bool is an int subclass)
+_TYPE_MATCHES = {
+    "integer": ("integer", "boolean"),
+    "float": ("integer", "float", "boolean"),
+    "string": ("string",),
+    "boolean": ("boolean",),
+}
 
 
 class MetricsCalculatorService:
@@ -40,6 +51,7 @@ class MetricsCalculatorService:
         """
         self.logger = get_logger(self.__class__.__name__)
         self.public_works = public_works
+        self.column_profile_service = ColumnProfileService(public_works=public_works)
     
     async def calculate_metrics(
         self,
@@ -83,20 +95,25 @@ class MetricsCalculatorService:
                     "error": "Parsed file not found"
                 }
             
-            # Calculate basic metrics
+            # Calculate basic metrics (column statistics come from the shared profile: one scan)
             data = parsed_content.get("data", [])
             metadata = parsed_content.get("metadata", {})
             columns = metadata.get("columns", [])
+            profile = await self.column_profile_service.get_profile(parsed_file_id, parsed_content, tenant_id)
             
             # Data quality metrics
             total_rows = len(data) if isinstance(data, list) else 0
             total_columns = len(columns)
             
-            # Completeness metrics
+            # Completeness metrics (missing, None or "" in dict rows)
             completeness_scores = {}
             for col in columns:
                 col_name = col.get("name", "")
-                null_count = sum(1 for row in data if isinstance(row, dict) and (row.get(col_name) is None or row.get(col_name) == ""))
+                column = profile["columns"].get(col_name)
+                if column is None:
+                    null_count = profile["dict_row_count"]
+                else:
+                    null_count = column["missing_count"] + column["null_count"] + column["empty_count"]
                 completeness = 1.0 - (null_count / total_rows) if total_rows > 0 else 0.0
                 completeness_scores[col_name] = {
                     "completeness": completeness,
@@ -109,23 +126,11 @@ class MetricsCalculatorService:
             for col in columns:
                 col_name = col.get("name", "")
                 col_type = col.get("type", "unknown")
-                # Basic type accuracy check
-                type_matches = 0
-                type_total = 0
-                for row in data:
-                    if isinstance(row, dict) and col_name in row:
-                        value = row[col_name]
-                        if value is not None:
-                            type_total += 1
-                            # Basic type checking
-                            if col_type == "integer" and isinstance(value, int):
-                                type_matches += 1
-                            elif col_type == "float" and isinstance(value, (int, float)):
-                                type_matches += 1
-                            elif col_type == "string" and isinstance(value, str):
-                                type_matches += 1
-                            elif col_type == "boolean" and isinstance(value, bool):
-                                type_matches += 1
+                column = profile["columns"].get(col_name)
+                # Basic type accuracy check: non-null values whose type matches the declared type
+                type_counts = column["type_counts"] if column else {}
+                type_total = sum(type_counts.values())
+                type_matches = sum(type_counts.get(name, 0) for name in _TYPE_MATCHES.get(col_type, ()))
                 
                 accuracy = type_matches / type_total if type_total > 0 else 0.0
                 accuracy_scores[col_name] = {
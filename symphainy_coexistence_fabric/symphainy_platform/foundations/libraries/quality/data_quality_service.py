@@ -4,7 +4,8 @@ Data Quality Service - Combined Parsing + Embedding Analysis
 Enabling service for data quality assessment operations.
 
 WHAT (Enabling Service Role): I assess data quality across parsing, data, and source dimensions
-HOW (Enabling Service Implementation): I combine parsing results with embeddings to identify root causes
+HOW (Enabling Service Implementation): I combine parsing results with embeddings to identify root causes,
+                                       reading column statistics from the parsed file's shared column profile
 
 Key Principle: Pure data processing - combines parsing results with embeddings to identify issues.
 """
@@ -23,6 +24,7 @@ from utilities import get_logger
 from symphainy_platform.runtime.execution_context import ExecutionContext
 from symphainy_platform.foundations.libraries.chunking.deterministic_chunking_service import DeterministicChunkingService
 from symphainy_platform.foundations.libraries.parsing.file_parser_service import FileParserService
+from symphainy_platform.foundations.libraries.statistics.column_profile import ColumnProfileService
 
 
 class DataQualityService:
@@ -46,6 +48,7 @@ class DataQualityService:
         """
         self.logger = get_logger(self.__class__.__name__)
         self.public_works = public_works
+        self.column_profile_service = ColumnProfileService(public_works=public_works)
     
     async def assess_data_quality(
         self,
@@ -96,6 +99,11 @@ class DataQualityService:
             # Get parsing results from State Surface
             parsed_data = await self._get_parsed_data(parsed_file_id, context)
             
+            # Column profile shared with embeddings and metrics (cached per parsed file)
+            profile = None
+            if parsed_data:
+                profile = await self.column_profile_service.get_profile(parsed_file_id, parsed_data, tenant_id)
+            
             # Get deterministic embeddings (for embedding confidence calculation)
             deterministic_embedding = None
             if deterministic_embedding_id:
@@ -117,7 +125,7 @@ class DataQualityService:
             
             # Assess embedding quality and calculate embedding confidence
             embedding_quality = await self._assess_embedding_quality(
-                parsed_data, deterministic_embedding, embeddings
+                parsed_data, deterministic_embedding, embeddings, profile
             )
             embedding_confidence = self._calculate_embedding_confidence(embedding_quality)
             
@@ -126,7 +134,7 @@ class DataQualityService:
             
             # Assess data quality
             data_quality = await self._assess_data_quality(
-                parsed_data, embeddings, parser_type
+                parsed_data, embeddings, parser_type, profile
             )
             
             # Assess source quality
@@ -353,14 +361,15 @@ class DataQualityService:
         self,
         parsed_data: Optional[Dict[str, Any]],
         embeddings: Optional[List[Dict[str, Any]]],
-        parser_type: str
+        parser_type: str,
+        profile: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Assess data quality.
         
         Checks:
         - Data anomalies
-        - Completeness
+        - Completeness (columns with no values, from the column profile)
         - Consistency
         - Validity
         - Faded documents (via embeddings)
@@ -394,6 +403,20 @@ class DataQualityService:
                     "suggestion": "Check source file or parser configuration"
                 })
         
+        # Check for columns that never hold a value
+        if profile and profile.get("row_count"):
+            empty_columns = [
+                name for name, column in profile.get("columns", {}).items()
+                if column.get("null_rate") == 1.0
+            ]
+            if empty_columns:
+                issues.append({
+                    "type": "empty_columns",
+                    "description": f"Columns with no values: {', '.join(empty_columns)}",
+                    "severity": "medium",
+                    "suggestion": "Check column mapping or source extract"
+                })
+        
         # Use embeddings to detect semantic anomalies
         if embeddings:
             # Check embedding confidence scores (if available)
@@ -596,7 +619,8 @@ class DataQualityService:
         self,
         parsed_data: Optional[Dict[str, Any]],
         deterministic_embedding: Optional[Dict[str, Any]],
-        embeddings: Optional[List[Dict[str, Any]]]
+        embeddings: Optional[List[Dict[str, Any]]],
+        profile: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Assess embedding quality using deterministic embeddings.
@@ -651,7 +675,7 @@ class DataQualityService:
         # Check pattern signature match
         pattern_signature = deterministic_embedding.get("pattern_signature", {})
         if pattern_signature:
-            pattern_match = self._validate_pattern_signature(parsed_data, pattern_signature)
+            pattern_match = self._validate_pattern_signature(parsed_data, pattern_signature, profile)
             if not pattern_match["valid"]:
                 issues.append({
                     "type": "pattern_mismatch",
@@ -737,18 +761,22 @@ class DataQualityService:
     def _validate_pattern_signature(
         self,
         parsed_data: Dict[str, Any],
-        pattern_signature: Dict[str, Any]
+        pattern_signature: Dict[str, Any],
+        profile: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Validate parsed data against pattern signature."""
+        """Validate parsed data against pattern signature (columns seen in any row when profiled)."""
         # Simplified validation - check if data types match
         data = parsed_data.get("data", [])
         if not data:
             return {"valid": False, "description": "No data to validate"}
         
         # Basic validation: check if we have data for expected columns
-        first_row = data[0] if isinstance(data, list) else {}
         expected_cols = set(pattern_signature.keys())
-        actual_cols = set(first_row.keys()) if isinstance(first_row, dict) else set()
+        if profile is not None:
+            actual_cols = set(profile.get("columns", {}))
+        else:
+            first_row = data[0] if isinstance(data, list) else {}
+            actual_cols = set(first_row.keys()) if isinstance(first_row, dict) else set()
         
         if expected_cols - actual_cols:
             return {
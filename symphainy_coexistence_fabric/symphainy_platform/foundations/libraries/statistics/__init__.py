@@ -0,0 +1,8 @@
+"""Statistics Library - Out-of-core EDA statistics and shared single-pass column profiles."""
+from .eda_statistics_service import EDAStatisticsService, ProfileOptions, SAMPLING_MODES
+from .column_profile import ColumnProfileService, ColumnProfiler, HyperLogLog, profile_rows
+
+__all__ = [
+    "EDAStatisticsService", "ProfileOptions", "SAMPLING_MODES",
+    "ColumnProfileService", "ColumnProfiler", "HyperLogLog", "profile_rows",
+]
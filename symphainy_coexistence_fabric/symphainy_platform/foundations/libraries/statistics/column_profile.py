@@ -0,0 +1,469 @@
+"""
+Column Profile - Single-pass shared column statistics for parsed files
+
+Enabling service for per-column statistics shared by deterministic embeddings, metrics
+and data quality, so a parsed file's rows are scanned once instead of once per service.
+
+WHAT (Enabling Service Role): I compute a column profile (types, null / empty counts, distinct
+                              estimates, min / max / mean, length histograms, regex pattern
+                              classes, samples) for a parsed file and share it by parsed_file_id
+HOW (Enabling Service Implementation): I transpose rows into columnar batches in one pass and
+                              reduce each column with C-level builtins and numpy (type counts,
+                              hashed distinct sets with a HyperLogLog past a limit, regexes run
+                              once per distinct value); profiles are cached (in-process + Redis)
+                              through Public Works' ColumnProfileCache
+
+Key Principle: Pure, deterministic computation. Hashes are seedless (FNV-1a + a 64-bit
+finalizer), so the same data always yields the same profile, in any process.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[5]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+import asyncio
+import hashlib
+import math
+import re
+from collections import Counter, defaultdict
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from utilities import get_logger
+
+
+PROFILE_VERSION = 1
+
+DEFAULT_BATCH_ROWS = 10_000
+
+DEFAULT_EXACT_DISTINCT_LIMIT = 100_000
+
+DEFAULT_HLL_PRECISION = 12
+
+DEFAULT_SAMPLE_SIZE = 10
+
+# Regex pattern classes, matched (re.match) against each distinct non-null value's string form
+PATTERN_CLASSES = {
+    "email": re.compile(r'^[\w\.-]+@[\w\.-]+\.\w+$'),
+    "phone": re.compile(r'^\+?[\d\s\-\(\)]+$'),
+    "uuid": re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.I),
+    "numeric_string": re.compile(r'^\d+$'),
+    "date": re.compile(r'^\d{4}-\d{2}-\d{2}'),
+    "datetime": re.compile(r'^\d{4}-\d{2}-\d{2}T'),
+}
+
+# Python type -> profile type name (bool before int: bool is an int subclass)
+_TYPE_NAMES = {
+    bool: "boolean",
+    int: "integer",
+    float: "float",
+    str: "string",
+    list: "array",
+    dict: "object",
+}
+
+_NUMERIC_TYPES = (bool, int, float)
+
+# Value -> shape for pattern matching: ASCII hex letters -> "a", other letters -> "g" ("T" kept for
+# datetime), digits -> "0"; punctuation, whitespace and non-ASCII unchanged. Every PATTERN_CLASSES
+# regex gives the same answer on the shape as on the value, and far fewer shapes than values exist.
+_SHAPE_TABLE = str.maketrans(
+    "abcdefABCDEFghijklmnopqrstuvwxyzGHIJKLMNOPQRSUVWXYZ0123456789",
+    "a" * 12 + "g" * 39 + "0" * 10
+)
+
+# Strings up to this many UTF-8 bytes are hashed vectorized; longer ones individually
+_VECTOR_HASH_MAX_BYTES = 64
+
+_FNV_OFFSET = np.uint64(0xCBF29CE484222325)
+_FNV_PRIME = np.uint64(0x100000001B3)
+
+
+def _finalize(h: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer: spreads FNV's weak high bits (HyperLogLog reads the top bits)."""
+    h = h ^ (h >> np.uint64(30))
+    h = h * np.uint64(0xBF58476D1CE4E5B9)
+    h = h ^ (h >> np.uint64(27))
+    h = h * np.uint64(0x94D049BB133111EB)
+    return h ^ (h >> np.uint64(31))
+
+
+def hash_strings(values: Sequence[str], type_tag: int = 0) -> np.ndarray:
+    """
+    Seedless 64-bit hashes of strings (FNV-1a over UTF-8, one numpy step per byte position).
+
+    Args:
+        values: Strings to hash
+        type_tag: Mixed into every hash so equal string forms of different types differ
+    """
+    joined = "\x00".join(values)
+    if joined.count("\x00") == len(values) - 1:
+        encoded = joined.encode("utf-8").split(b"\x00") if values else []
+    else:
+        encoded = [value.encode("utf-8") for value in values]
+    hashes = np.empty(len(encoded), dtype=np.uint64)
+    if not encoded:
+        return hashes
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    short = lengths <= _VECTOR_HASH_MAX_BYTES
+    if short.any():
+        width = max(1, int(lengths[short].max()))
+        batch = encoded if short.all() else [b for b, ok in zip(encoded, short) if ok]
+        matrix = np.array(batch, dtype=f"S{width}").view(np.uint8).reshape(-1, width)
+        # Longest first, so the strings still covering byte position i are a prefix: padding
+        # bytes are never hashed and a hash does not depend on the batch's widest string
+        order = np.argsort(-lengths[short], kind="stable")
+        matrix = matrix[order]
+        active = np.searchsorted(-lengths[short][order], -np.arange(width), side="left")
+        h = np.full(matrix.shape[0], _FNV_OFFSET, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            for column in range(width):
+                rows = int(active[column])
+                h[:rows] = (h[:rows] ^ matrix[:rows, column]) * _FNV_PRIME
+        short_hashes = np.empty_like(h)
+        short_hashes[order] = h
+        hashes[short] = short_hashes
+    for index in np.flatnonzero(~short):
+        hashes[index] = int.from_bytes(hashlib.blake2b(encoded[index], digest_size=8).digest(), "little")
+    with np.errstate(over="ignore"):
+        hashes ^= lengths.astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+        hashes ^= np.uint64(type_tag) * np.uint64(0xD6E8FEB86659FD93)
+        return _finalize(hashes)
+
+
+class HyperLogLog:
+    """HyperLogLog distinct-count sketch over 64-bit hashes (numpy registers, mergeable)."""
+
+    def __init__(self, precision: int = DEFAULT_HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        if hashes.size == 0:
+            return
+        p = np.uint64(self.precision)
+        index = (hashes >> (np.uint64(64) - p)).astype(np.int64)
+        # Rank = leading zeros of the remaining bits + 1, read from the next 32 bits (exact in float64)
+        remaining = ((hashes << p) >> np.uint64(32)).astype(np.float64)
+        rank = (33 - np.frexp(remaining)[1]).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        m = float(self.registers.size)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / float(np.sum(np.ldexp(1.0, -self.registers.astype(np.int64))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return int(round(m * math.log(m / zeros)))
+        return int(round(raw))
+
+
+class _ColumnAccumulator:
+    """Running statistics of one column across batches."""
+
+    def __init__(self, sample_size: int, exact_distinct_limit: int, hll_precision: int):
+        self.sample_size = sample_size
+        self.exact_distinct_limit = exact_distinct_limit
+        self.count = 0
+        self.null_count = 0
+        self.empty_count = 0
+        self.type_counts: Counter = Counter()
+        self.numeric_count = 0
+        self.numeric_sum = 0
+        self.numeric_min: Any = None
+        self.numeric_max: Any = None
+        self.string_min: Optional[str] = None
+        self.string_max: Optional[str] = None
+        self.length_count = 0
+        self.length_sum = 0
+        self.length_min: Optional[int] = None
+        self.length_max: Optional[int] = None
+        self.length_buckets = np.zeros(65, dtype=np.int64)
+        self.pattern_counts: Counter = Counter()
+        self.samples: List[str] = []
+        self.hll = HyperLogLog(hll_precision)
+        self.exact_hashes: Optional[List[np.ndarray]] = []  # per-batch unique hashes, merged lazily
+        self._exact_pending = 0
+
+    def update(self, values: List[Any]) -> None:
+        self.count += len(values)
+        type_counts = Counter(map(type, values))
+        nulls = type_counts.pop(type(None), 0)
+        self.null_count += nulls
+        for value_type, count in type_counts.items():
+            self.type_counts[_TYPE_NAMES.get(value_type, "other")] += count
+        if not type_counts:
+            return
+
+        if len(type_counts) == 1:
+            (only_type,) = type_counts
+            non_null = {only_type: [v for v in values if v is not None] if nulls else values}
+        else:
+            non_null = defaultdict(list)
+            for value in values:
+                if value is not None:
+                    non_null[type(value)].append(value)
+
+        string_forms: List[str] = []
+        for value_type, typed in non_null.items():
+            forms = typed if value_type is str else list(map(str, typed))
+            string_forms.extend(forms)
+            if value_type is str:
+                self.empty_count += typed.count("")
+                low, high = min(typed), max(typed)
+                self.string_min = low if self.string_min is None else min(self.string_min, low)
+                self.string_max = high if self.string_max is None else max(self.string_max, high)
+            if value_type in _NUMERIC_TYPES:
+                self.numeric_count += len(typed)
+                self.numeric_sum += sum(typed)
+                low, high = min(typed), max(typed)
+                self.numeric_min = low if self.numeric_min is None else min(self.numeric_min, low)
+                self.numeric_max = high if self.numeric_max is None else max(self.numeric_max, high)
+            tag = list(_TYPE_NAMES).index(value_type) + 1 if value_type in _TYPE_NAMES else 0
+            self._add_distinct(hash_strings(forms, tag))
+
+        self._update_lengths(string_forms)
+        self._update_patterns(string_forms)
+        if len(self.samples) < self.sample_size:
+            for value in values:
+                if value is not None:
+                    self.samples.append(str(value))
+                    if len(self.samples) == self.sample_size:
+                        break
+
+    def _add_distinct(self, hashes: np.ndarray) -> None:
+        self.hll.add_hashes(hashes)
+        if self.exact_hashes is None:
+            return
+        unique = np.unique(hashes)
+        self.exact_hashes.append(unique)
+        self._exact_pending += unique.size
+        if self._exact_pending > 2 * self.exact_distinct_limit:
+            self._compact_exact()
+
+    def _compact_exact(self) -> None:
+        """Merge the per-batch hash sets; past the limit only the HyperLogLog is kept."""
+        merged = np.unique(np.concatenate(self.exact_hashes)) if self.exact_hashes else np.empty(0, dtype=np.uint64)
+        if merged.size > self.exact_distinct_limit:
+            self.exact_hashes = None
+            return
+        self.exact_hashes = [merged]
+        self._exact_pending = merged.size
+
+    def _update_lengths(self, forms: List[str]) -> None:
+        if not forms:
+            return
+        lengths = np.fromiter(map(len, forms), dtype=np.int64, count=len(forms))
+        self.length_count += lengths.size
+        self.length_sum += int(lengths.sum())
+        low, high = int(lengths.min()), int(lengths.max())
+        self.length_min = low if self.length_min is None else min(self.length_min, low)
+        self.length_max = high if self.length_max is None else max(self.length_max, high)
+        # Bucket b holds lengths with bit length b: 0, 1, 2-3, 4-7, ...
+        self.length_buckets += np.bincount(np.frexp(lengths.astype(np.float64))[1], minlength=65)[:65]
+
+    def _update_patterns(self, forms: List[str]) -> None:
+        if not forms:
+            return
+        # One translate over the joined batch (values containing the separator: one by one)
+        joined = "\x00".join(forms)
+        if joined.count("\x00") == len(forms) - 1:
+            shapes = Counter(joined.translate(_SHAPE_TABLE).split("\x00"))
+        else:
+            shapes = Counter(value.translate(_SHAPE_TABLE) for value in forms)
+        for shape, count in shapes.items():
+            for name, pattern in PATTERN_CLASSES.items():
+                if pattern.match(shape):
+                    self.pattern_counts[name] += count
+
+    def result(self, row_count: int) -> Dict[str, Any]:
+        non_null = self.count - self.null_count
+        typed = {name: count for name, count in self.type_counts.items() if count}
+        if self.exact_hashes is not None:
+            self._compact_exact()
+        exact = self.exact_hashes is not None
+        histogram = {}
+        for bits, count in enumerate(self.length_buckets.tolist()):
+            if count:
+                histogram[str(bits) if bits < 2 else f"{1 << (bits - 1)}-{(1 << bits) - 1}"] = count
+        return {
+            "count": self.count,
+            "missing_count": row_count - self.count,
+            "null_count": self.null_count,
+            "empty_count": self.empty_count,
+            "null_rate": (row_count - non_null) / row_count if row_count else 0.0,
+            "type_counts": typed,
+            "inferred_type": max(typed, key=typed.get) if typed else "null",
+            "distinct_count": int(self.exact_hashes[0].size) if exact else self.hll.estimate(),
+            "distinct_exact": exact,
+            "min": self.numeric_min,
+            "max": self.numeric_max,
+            "mean": self.numeric_sum / self.numeric_count if self.numeric_count else None,
+            "numeric_count": self.numeric_count,
+            "string_min": self.string_min,
+            "string_max": self.string_max,
+            "length": {
+                "min": self.length_min,
+                "max": self.length_max,
+                "mean": self.length_sum / self.length_count if self.length_count else None,
+                "histogram": histogram,
+            },
+            "pattern_counts": dict(self.pattern_counts),
+            "sample_values": list(self.samples),
+        }
+
+
+class ColumnProfiler:
+    """
+    Accumulates a column profile over columnar batches (or rows, transposed batch by batch).
+
+    Columns are reported in first-seen order. A column's `count` is the rows that carry
+    it; `missing_count` the dict rows that do not.
+    """
+
+    def __init__(
+        self,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        exact_distinct_limit: int = DEFAULT_EXACT_DISTINCT_LIMIT,
+        hll_precision: int = DEFAULT_HLL_PRECISION
+    ):
+        """
+        Initialize profiler.
+
+        Args:
+            sample_size: Leading non-null values kept per column (as strings)
+            exact_distinct_limit: Distinct values counted exactly (by hash) before the HyperLogLog takes over
+            hll_precision: HyperLogLog register bits (12 = 4096 registers, ~1.6% error)
+        """
+        self.sample_size = sample_size
+        self.exact_distinct_limit = exact_distinct_limit
+        self.hll_precision = hll_precision
+        self.row_count = 0
+        self.dict_row_count = 0
+        self._columns: Dict[str, _ColumnAccumulator] = {}
+
+    def update(self, batch: Mapping[str, List[Any]], row_count: int) -> None:
+        """
+        Add a columnar batch.
+
+        Args:
+            batch: Column name -> values of the rows in this batch that carry the column
+            row_count: Dict rows in the batch
+        """
+        self.row_count += row_count
+        self.dict_row_count += row_count
+        for name, values in batch.items():
+            column = self._columns.get(name)
+            if column is None:
+                column = self._columns[name] = _ColumnAccumulator(
+                    self.sample_size, self.exact_distinct_limit, self.hll_precision
+                )
+            column.update(values)
+
+    def update_rows(self, rows: Iterable[Any], batch_rows: int = DEFAULT_BATCH_ROWS) -> None:
+        """Transpose dict rows into columnar batches of batch_rows and add them (other rows are counted only)."""
+        rows = iter(rows)
+        for batch in iter(lambda: list(islice(rows, batch_rows)), []):
+            dict_rows = [row for row in batch if isinstance(row, dict)]
+            self.row_count += len(batch) - len(dict_rows)
+            if dict_rows:
+                self.update(self._transpose(dict_rows), len(dict_rows))
+
+    @staticmethod
+    def _transpose(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """Rows -> columns; uniform rows (same keys) go through itemgetter / zip in C."""
+        keys = list(rows[0])
+        if keys and set(map(len, rows)) == {len(keys)}:
+            try:
+                values = list(map(itemgetter(*keys), rows))
+            except KeyError:
+                values = None
+            if values is not None:
+                if len(keys) == 1:
+                    return {keys[0]: values}
+                return dict(zip(keys, map(list, zip(*values))))
+        columns: Dict[str, List[Any]] = defaultdict(list)
+        for row in rows:
+            for name, value in row.items():
+                columns[name].append(value)
+        return columns
+
+    def result(self) -> Dict[str, Any]:
+        """Profile: row counts and per-column statistics (JSON-serializable)."""
+        return {
+            "profile_version": PROFILE_VERSION,
+            "row_count": self.row_count,
+            "dict_row_count": self.dict_row_count,
+            "columns": {name: column.result(self.dict_row_count) for name, column in self._columns.items()},
+        }
+
+
+def profile_rows(rows: Iterable[Any], batch_rows: int = DEFAULT_BATCH_ROWS, **options: Any) -> Dict[str, Any]:
+    """Profile of rows in one pass (see ColumnProfiler for options)."""
+    profiler = ColumnProfiler(**options)
+    profiler.update_rows(rows, batch_rows=batch_rows)
+    return profiler.result()
+
+
+class ColumnProfileService:
+    """
+    Column Profile Service - one profile per parsed file, shared by the services that read it.
+
+    Profiles are computed off the event loop and cached by (tenant, parsed_file_id) in
+    Public Works' ColumnProfileCache; without Public Works every call computes its own.
+    """
+
+    def __init__(self, public_works: Optional[Any] = None):
+        """
+        Initialize Column Profile Service.
+
+        Args:
+            public_works: Public Works Foundation Service (for the shared profile cache)
+        """
+        self.logger = get_logger(self.__class__.__name__)
+        self.public_works = public_works
+        self.cache = (
+            public_works.get_column_profile_cache()
+            if hasattr(public_works, "get_column_profile_cache") else None
+        )
+
+    async def get_profile(
+        self,
+        parsed_file_id: str,
+        parsed_content: Dict[str, Any],
+        tenant_id: str
+    ) -> Dict[str, Any]:
+        """
+        Column profile of a parsed file's rows (parsed_content["data"]).
+
+        Args:
+            parsed_file_id: Parsed file identifier (cache key; parsed files do not change)
+            parsed_content: Parsed file content (from FileParserService)
+            tenant_id: Tenant identifier (cache scope)
+
+        Returns:
+            Profile dict (see ColumnProfiler.result)
+        """
+        async def compute() -> Dict[str, Any]:
+            data = parsed_content.get("data", [])
+            rows = data if isinstance(data, list) else []
+            profile = await asyncio.to_thread(profile_rows, rows)
+            self.logger.debug(
+                f"Column profile computed for {parsed_file_id}: "
+                f"{profile['row_count']} rows, {len(profile['columns'])} columns"
+            )
+            return profile
+
+        if self.cache is None:
+            return await compute()
+        return await self.cache.get_or_compute(tenant_id, parsed_file_id, compute)
@@ -0,0 +1,518 @@
+"""
+EDA Statistics Service - Out-of-Core Column Profiling
+
+Enabling service for exploratory data analysis statistics over structured data.
+
+WHAT (Enabling Service Role): I compute column profiles (counts, null rates, quantiles,
+                              approximate distinct counts, top-k, correlations)
+HOW (Enabling Service Implementation): I stream columnar sources (Parquet, CSV, NDJSON,
+                              spooled parsed rows) through an in-process DuckDB engine off
+                              the event loop, with optional sampling
+
+Key Principle: Pure, deterministic computation. Quantiles (t-digest), distinct counts
+(HyperLogLog) and top-k are sketch-based, so memory stays flat as files grow; DuckDB
+spills to temp_directory under memory_limit instead of failing on large inputs.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[5]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+import asyncio
+import json
+import math
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from utilities import get_logger
+
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+    duckdb = None
+
+
+SAMPLING_MODES = ("full", "reservoir", "bernoulli", "system")
+
+_NUMERIC_TYPES = (
+    "TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT",
+    "UTINYINT", "USMALLINT", "UINTEGER", "UBIGINT", "UHUGEINT",
+    "FLOAT", "DOUBLE", "REAL",
+)
+
+_FILE_READERS = {
+    ".parquet": "read_parquet",
+    ".csv": "read_csv_auto",
+    ".tsv": "read_csv_auto",
+    ".json": "read_json_auto",
+    ".ndjson": "read_json_auto",
+    ".jsonl": "read_json_auto",
+}
+
+
+@dataclass
+class ProfileOptions:
+    """
+    Options for a profiling run.
+
+    sampling:
+        full      - every row (streamed; exact counts)
+        reservoir - uniform sample of `sample_size` rows (bounded memory, one pass)
+        bernoulli - each row kept with `sample_percent` probability
+        system    - vector-level sampling at `sample_percent` (fastest, coarser)
+    """
+    sampling: str = "full"
+    sample_size: int = 100_000
+    sample_percent: float = 10.0
+    seed: int = 42
+    top_k: int = 10
+    quantiles: Tuple[float, ...] = (0.05, 0.25, 0.5, 0.75, 0.95)
+    max_correlation_columns: int = 25
+    memory_limit: Optional[str] = None  # e.g. "1GB"; DuckDB spills beyond this
+    threads: Optional[int] = None
+    temp_directory: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, options: Optional[Dict[str, Any]]) -> "ProfileOptions":
+        """Build options from an intent/request parameter dict, ignoring unknown keys."""
+        if not options:
+            return cls()
+        known = {k: v for k, v in options.items() if k in cls.__dataclass_fields__}
+        if "quantiles" in known:
+            known["quantiles"] = _validated_quantiles(known["quantiles"])
+        return cls(**known)
+
+    @classmethod
+    def from_request(cls, options: Optional[Dict[str, Any]]) -> "ProfileOptions":
+        """Build options from agent/client input: sampling knobs only, no server paths or resource limits."""
+        server_side = ("memory_limit", "threads", "temp_directory")
+        return cls.from_dict({k: v for k, v in (options or {}).items() if k not in server_side})
+
+
+def _validated_quantiles(values: Any) -> Tuple[float, ...]:
+    """Quantiles as floats in [0, 1]; ValueError for anything else (including NaN)."""
+    if isinstance(values, (str, bytes)) or not isinstance(values, (list, tuple)):
+        raise ValueError("quantiles must be a list of numbers between 0 and 1")
+    quantiles = []
+    for value in values:
+        if isinstance(value, bool):
+            raise ValueError(f"Invalid quantile {value!r}; expected a number between 0 and 1")
+        try:
+            quantile = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid quantile {value!r}; expected a number between 0 and 1")
+        if math.isnan(quantile) or not 0.0 <= quantile <= 1.0:
+            raise ValueError(f"Invalid quantile {value!r}; expected a number between 0 and 1")
+        quantiles.append(quantile)
+    return tuple(quantiles)
+
+
+class EDAStatisticsService:
+    """
+    EDA Statistics Service - column profiles computed by DuckDB, off the event loop.
+
+    Every call opens its own in-memory DuckDB connection in a worker thread, so
+    concurrent profiles never share a connection and the event loop never blocks
+    on a scan.
+    """
+
+    def __init__(self, default_options: Optional[ProfileOptions] = None):
+        """
+        Initialize EDA Statistics Service.
+
+        Args:
+            default_options: Options used when a call does not pass its own
+        """
+        self.logger = get_logger(self.__class__.__name__)
+        self.default_options = default_options or ProfileOptions()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def profile_rows(
+        self,
+        rows: Sequence[Any],
+        columns: Optional[List[str]] = None,
+        options: Optional[ProfileOptions] = None
+    ) -> Dict[str, Any]:
+        """
+        Profile parsed rows (list of dicts, or list of lists with `columns`).
+
+        Rows are spooled to newline-delimited JSON in a temp file and scanned by
+        DuckDB, so no DataFrame copy of the data is built.
+
+        Args:
+            rows: Parsed rows
+            columns: Column names when rows are positional lists
+            options: Profiling options
+
+        Returns:
+            Profile dict (see _profile_sync)
+        """
+        options = options or self.default_options
+        return await asyncio.to_thread(self._profile_rows_sync, rows, columns, options)
+
+    async def profile_file(
+        self,
+        path: str,
+        file_format: Optional[str] = None,
+        options: Optional[ProfileOptions] = None
+    ) -> Dict[str, Any]:
+        """
+        Profile a columnar or delimited file in place (Parquet, CSV/TSV, JSON/NDJSON).
+
+        Args:
+            path: Local file path (or any path DuckDB can read, e.g. a glob)
+            file_format: Override format detection ("parquet", "csv", "json")
+            options: Profiling options
+
+        Returns:
+            Profile dict
+        """
+        options = options or self.default_options
+        reader = self._reader_for(path, file_format)
+        source = f"{reader}({_sql_literal(path)})"
+        return await asyncio.to_thread(self._profile_sync, source, options)
+
+    async def profile_dataframe(
+        self,
+        df: Any,  # pandas.DataFrame
+        options: Optional[ProfileOptions] = None
+    ) -> Dict[str, Any]:
+        """
+        Profile an existing pandas DataFrame (scanned in place by DuckDB).
+
+        Args:
+            df: pandas DataFrame
+            options: Profiling options
+
+        Returns:
+            Profile dict
+        """
+        options = options or self.default_options
+        return await asyncio.to_thread(self._profile_sync, None, options, df)
+
+    async def materialize_parquet(
+        self,
+        rows: Sequence[Any],
+        path: str,
+        columns: Optional[List[str]] = None
+    ) -> str:
+        """
+        Write parsed rows to a Parquet file so later profiles scan columnar data.
+
+        Args:
+            rows: Parsed rows
+            path: Output Parquet path
+            columns: Column names when rows are positional lists
+
+        Returns:
+            The Parquet path
+        """
+        return await asyncio.to_thread(self._materialize_parquet_sync, rows, path, columns)
+
+    @staticmethod
+    def extract_rows(content: Any) -> Tuple[List[Any], Optional[List[str]]]:
+        """
+        Find tabular rows in parsed content.
+
+        Accepts a list of row dicts, or a dict carrying rows under "rows",
+        "data" or "records" (optionally with "columns"/"headers").
+
+        Returns:
+            (rows, columns) - rows is empty when no tabular data is present
+        """
+        if isinstance(content, list):
+            return content, None
+        if isinstance(content, dict):
+            for key in ("rows", "data", "records"):
+                value = content.get(key)
+                if isinstance(value, list):
+                    return value, content.get("columns") or content.get("headers")
+            for key in ("structured_data", "parsed_content", "content"):
+                if key in content:
+                    return EDAStatisticsService.extract_rows(content[key])
+        return [], None
+
+    # ------------------------------------------------------------------
+    # Sync workers (run in threads)
+    # ------------------------------------------------------------------
+
+    def _profile_rows_sync(
+        self,
+        rows: Sequence[Any],
+        columns: Optional[List[str]],
+        options: ProfileOptions
+    ) -> Dict[str, Any]:
+        if not rows:
+            return self._empty_profile(options)
+        spool_path = _spool_rows(rows, columns, options.temp_directory)
+        try:
+            return self._profile_sync(_ndjson_source(spool_path), options)
+        finally:
+            _remove_quietly(spool_path)
+
+    def _materialize_parquet_sync(
+        self,
+        rows: Sequence[Any],
+        path: str,
+        columns: Optional[List[str]]
+    ) -> str:
+        spool_path = _spool_rows(rows, columns, self.default_options.temp_directory)
+        try:
+            con = self._connect(self.default_options)
+            try:
+                con.execute(f"COPY (SELECT * FROM {_ndjson_source(spool_path)}) TO {_sql_literal(path)} (FORMAT PARQUET)")
+            finally:
+                con.close()
+            return path
+        finally:
+            _remove_quietly(spool_path)
+
+    def _profile_sync(
+        self,
+        source: Optional[str],
+        options: ProfileOptions,
+        df: Any = None
+    ) -> Dict[str, Any]:
+        if options.sampling not in SAMPLING_MODES:
+            raise ValueError(f"Unknown sampling mode '{options.sampling}'; expected one of {SAMPLING_MODES}")
+        started = time.perf_counter()
+        con = self._connect(options)
+        try:
+            if df is not None:
+                con.register("eda_dataframe", df)
+                source = "eda_dataframe"
+            row_count = con.execute(f"SELECT count(*) FROM {source}").fetchone()[0]
+
+            if options.sampling == "full":
+                con.execute(f"CREATE TEMP VIEW eda_src AS SELECT * FROM {source}")
+            else:
+                # Materialize the sample once so every statistic sees the same rows
+                con.execute(f"CREATE TEMP TABLE eda_src AS SELECT * FROM {source} {self._sample_clause(options)}")
+            sampled_rows = (
+                row_count if options.sampling == "full"
+                else con.execute("SELECT count(*) FROM eda_src").fetchone()[0]
+            )
+
+            schema = [(name, col_type) for name, col_type, *_ in con.execute("DESCRIBE eda_src").fetchall()]
+            columns = self._column_statistics(con, schema, sampled_rows, options)
+            numeric = [name for name, col_type in schema if _is_numeric(col_type)]
+            correlations = self._correlations(con, numeric[:options.max_correlation_columns])
+        finally:
+            con.close()
+
+        return {
+            "engine": "duckdb",
+            "row_count": row_count,
+            "sampled_rows": sampled_rows,
+            "column_count": len(schema),
+            "sampling": self._sampling_summary(options),
+            "estimated": options.sampling != "full",
+            "columns": columns,
+            "correlations": correlations,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _connect(self, options: ProfileOptions):
+        if not DUCKDB_AVAILABLE:
+            raise ImportError("DuckDB not available. Install with: pip install duckdb")
+        con = duckdb.connect()
+        if options.memory_limit:
+            con.execute(f"SET memory_limit={_sql_literal(options.memory_limit)}")
+        if options.threads:
+            con.execute(f"SET threads={int(options.threads)}")
+        if options.temp_directory:
+            con.execute(f"SET temp_directory={_sql_literal(options.temp_directory)}")
+        return con
+
+    def _column_statistics(
+        self,
+        con: Any,
+        schema: List[Tuple[str, str]],
+        sampled_rows: int,
+        options: ProfileOptions
+    ) -> Dict[str, Dict[str, Any]]:
+        """Compute every per-column aggregate in a single scan."""
+        if not schema:
+            return {}
+        select: List[str] = []
+        layout: List[Tuple[str, str, str]] = []  # (column, stat, alias)
+
+        def add(column: str, stat: str, expression: str) -> None:
+            alias = f"s{len(layout)}"
+            select.append(f"{expression} AS {alias}")
+            layout.append((column, stat, alias))
+
+        # Rendered from floats only: quantiles are request input and end up in SQL
+        quantile_list = "[" + ", ".join(repr(float(q)) for q in _validated_quantiles(options.quantiles)) + "]"
+        sketch_top_k = _supports_approx_top_k(con)
+        for name, col_type in schema:
+            col = _quote_ident(name)
+            add(name, "non_null", f"count({col})")
+            if _is_nested(col_type):
+                continue
+            add(name, "approx_distinct", f"approx_count_distinct({col})")
+            add(name, "min", f"CAST(min({col}) AS VARCHAR)")
+            add(name, "max", f"CAST(max({col}) AS VARCHAR)")
+            if sketch_top_k:
+                add(name, "top_k", f"approx_top_k({col}, {int(options.top_k)})")
+            if _is_numeric(col_type):
+                add(name, "mean", f"avg({col})")
+                add(name, "stddev", f"stddev_samp({col})")
+                add(name, "quantiles", f"approx_quantile({col}, {quantile_list})")
+            elif "VARCHAR" in col_type:
+                add(name, "avg_length", f"avg(length({col}))")
+                add(name, "max_length", f"max(length({col}))")
+
+        values = con.execute(f"SELECT {', '.join(select)} FROM eda_src").fetchone()
+
+        columns: Dict[str, Dict[str, Any]] = {
+            name: {"type": col_type} for name, col_type in schema
+        }
+        for (name, stat, _), value in zip(layout, values):
+            if stat == "quantiles" and value is not None:
+                value = {f"p{int(round(q * 100))}": v for q, v in zip(options.quantiles, value)}
+            elif stat in ("mean", "stddev", "avg_length") and value is not None:
+                value = float(value)
+            columns[name][stat] = value
+        if not sketch_top_k:
+            # Older DuckDB without approx_top_k: exact top-k, one GROUP BY per column
+            for name, col_type in schema:
+                if not _is_nested(col_type):
+                    columns[name]["top_k"] = self._top_k_fallback(con, name, options.top_k)
+        for stats in columns.values():
+            non_null = stats.get("non_null", 0) or 0
+            stats["null_count"] = sampled_rows - non_null
+            stats["null_rate"] = round((sampled_rows - non_null) / sampled_rows, 6) if sampled_rows else 0.0
+        return columns
+
+    def _top_k_fallback(self, con: Any, name: str, k: int) -> List[Any]:
+        col = _quote_ident(name)
+        rows = con.execute(
+            f"SELECT {col} FROM eda_src WHERE {col} IS NOT NULL "
+            f"GROUP BY {col} ORDER BY count(*) DESC LIMIT {int(k)}"
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def _correlations(self, con: Any, numeric: List[str]) -> List[Dict[str, Any]]:
+        """Pearson correlation for every numeric pair, in one scan."""
+        pairs = [(a, b) for i, a in enumerate(numeric) for b in numeric[i + 1:]]
+        if not pairs:
+            return []
+        expressions = [f"corr({_quote_ident(a)}, {_quote_ident(b)})" for a, b in pairs]
+        values = con.execute(f"SELECT {', '.join(expressions)} FROM eda_src").fetchone()
+        correlations = [
+            {"column_a": a, "column_b": b, "correlation": round(float(v), 6)}
+            for (a, b), v in zip(pairs, values)
+            if v is not None and v == v  # drop NULL / NaN (constant columns)
+        ]
+        correlations.sort(key=lambda c: abs(c["correlation"]), reverse=True)
+        return correlations
+
+    def _sample_clause(self, options: ProfileOptions) -> str:
+        seed = int(options.seed)
+        if options.sampling == "reservoir":
+            return f"USING SAMPLE reservoir({int(options.sample_size)} ROWS) REPEATABLE ({seed})"
+        return f"USING SAMPLE {float(options.sample_percent)} PERCENT ({options.sampling}, {seed})"
+
+    def _sampling_summary(self, options: ProfileOptions) -> Dict[str, Any]:
+        summary: Dict[str, Any] = {"mode": options.sampling}
+        if options.sampling == "reservoir":
+            summary["sample_size"] = options.sample_size
+        elif options.sampling in ("bernoulli", "system"):
+            summary["sample_percent"] = options.sample_percent
+        return summary
+
+    def _reader_for(self, path: str, file_format: Optional[str]) -> str:
+        if file_format:
+            reader = _FILE_READERS.get(f".{file_format.lower().lstrip('.')}")
+        else:
+            reader = _FILE_READERS.get(Path(path).suffix.lower())
+        if not reader:
+            raise ValueError(f"Unsupported file format for profiling: {file_format or path}")
+        return reader
+
+    def _empty_profile(self, options: ProfileOptions) -> Dict[str, Any]:
+        return {
+            "engine": "duckdb",
+            "row_count": 0,
+            "sampled_rows": 0,
+            "column_count": 0,
+            "sampling": self._sampling_summary(options),
+            "estimated": False,
+            "columns": {},
+            "correlations": [],
+            "elapsed_ms": 0.0,
+        }
+
+
+def _spool_rows(rows: Iterable[Any], columns: Optional[List[str]], directory: Optional[str]) -> str:
+    """Write rows as newline-delimited JSON to a temp file and return its path."""
+    fd, spool_path = tempfile.mkstemp(suffix=".ndjson", prefix="eda_rows_", dir=directory)
+    with os.fdopen(fd, "w", encoding="utf-8") as spool:
+        for record in _iter_records(rows, columns):
+            spool.write(json.dumps(record, default=str))
+            spool.write("\n")
+    return spool_path
+
+
+def _ndjson_source(path: str) -> str:
+    # sample_size=-1: infer column types from every row, not just the first 20k
+    return f"read_json_auto({_sql_literal(path)}, format='newline_delimited', sample_size=-1)"
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _iter_records(rows: Iterable[Any], columns: Optional[List[str]]) -> Iterable[Dict[str, Any]]:
+    for row in rows:
+        if isinstance(row, dict):
+            yield row
+        elif columns and isinstance(row, (list, tuple)):
+            yield dict(zip(columns, row))
+        else:
+            yield {"value": row}
+
+
+def _supports_approx_top_k(con: Any) -> bool:
+    try:
+        con.execute("SELECT approx_top_k(1, 1)").fetchone()
+        return True
+    except Exception:
+        return False
+
+
+def _quote_ident(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _sql_literal(value: str) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _is_numeric(col_type: str) -> bool:
+    return col_type.upper() in _NUMERIC_TYPES or col_type.upper().startswith("DECIMAL")
+
+
+def _is_nested(col_type: str) -> bool:
+    upper = col_type.upper()
+    return upper.endswith("[]") or upper.startswith(("STRUCT", "MAP", "UNION", "JSON"))
@@ -30,14 +30,16 @@ class AuthAbstraction(AuthenticationProtocol):
     belongs in Platform SDK, not here.
     """
     
-    def __init__(self, supabase_adapter: SupabaseAdapter):
+    def __init__(self, supabase_adapter: SupabaseAdapter, token_cache: Optional[Any] = None):
         """
         Initialize Auth abstraction with Supabase adapter.
         
         Args:
             supabase_adapter: Supabase adapter (Layer 0)
+            token_cache: Optional VerifiedTokenCache; tokens are revoked from it on logout
         """
         self.supabase = supabase_adapter
+        self.token_cache = token_cache
         self.logger = get_logger(self.__class__.__name__)
         self.clock = get_clock()
         
@@ -143,6 +145,7 @@ class AuthAbstraction(AuthenticationProtocol):
                 "user_id": str,
                 "email": str,
                 "access_token": str,
+                "expires_at": Optional[int],  # JWT exp (None if unknown)
                 "raw_user_data": Dict[str, Any],
                 "raw_user_metadata": Dict[str, Any],
                 "raw_app_metadata": Dict[str, Any],
@@ -176,6 +179,7 @@ class AuthAbstraction(AuthenticationProtocol):
                 "user_id": user_data.get("id"),
                 "email": user_data.get("email", ""),
                 "access_token": token,  # Return the validated token
+                "expires_at": result.get("expires_at"),
                 "raw_user_data": user_data,
                 "raw_user_metadata": user_data.get("user_metadata", {}),
                 "raw_app_metadata": user_data.get("app_metadata", {}),
@@ -327,6 +331,8 @@ class AuthAbstraction(AuthenticationProtocol):
         """
         try:
             result = await self.supabase.sign_out(token)
+            if result.get("success", False) and self.token_cache is not None:
+                await self.token_cache.revoke_token(token)
             return result.get("success", False)
         except Exception as e:
             self.logger.error(f"Logout error: {str(e)}", exc_info=True)
@@ -5,7 +5,8 @@ Implements deterministic compute operations using DuckDB adapter.
 Returns raw data only - no business logic.
 
 WHAT (Infrastructure Role): I provide deterministic compute storage services
-HOW (Infrastructure Implementation): I use DuckDB adapter for deterministic embeddings and computations
+HOW (Infrastructure Implementation): I use DuckDB adapter for deterministic embeddings, computations
+                                     and chunk manifests
 
 NOTE: This is PURE INFRASTRUCTURE - no business logic.
 Business logic (UUID generation, validation, metadata enhancement) belongs in Realm services.
@@ -50,6 +51,7 @@ class DeterministicComputeAbstraction:
         # Table names (infrastructure concern)
         self.deterministic_embeddings_table = "deterministic_embeddings"
         self.computation_results_table = "computation_results"
+        self.chunk_manifests_table = "chunk_manifests"
         
         self.logger.info("Deterministic Compute Abstraction initialized (pure infrastructure)")
     
@@ -89,6 +91,20 @@ class DeterministicComputeAbstraction:
                 }
             )
             
+            # Create chunk_manifests table (chunk identities per parsed file, for incremental re-embedding)
+            await self.duckdb.create_table(
+                self.chunk_manifests_table,
+                {
+                    "parsed_file_id": "VARCHAR",
+                    "file_id": "VARCHAR",
+                    "tenant_id": "VARCHAR",
+                    "embedding_profile": "VARCHAR",
+                    "chunk_count": "INTEGER",
+                    "chunks": "JSON",
+                    "created_at": "TIMESTAMP"
+                }
+            )
+            
             # Create indexes
             await self.duckdb.execute_command(
                 f"CREATE INDEX IF NOT EXISTS idx_parsed_file_id ON {self.deterministic_embeddings_table}(parsed_file_id)"
@@ -99,6 +115,9 @@ class DeterministicComputeAbstraction:
             await self.duckdb.execute_command(
                 f"CREATE INDEX IF NOT EXISTS idx_computation_type ON {self.computation_results_table}(computation_type)"
             )
+            await self.duckdb.execute_command(
+                f"CREATE INDEX IF NOT EXISTS idx_manifest_file_id ON {self.chunk_manifests_table}(file_id)"
+            )
             
             self.logger.info("DuckDB schema initialized")
             return True
@@ -394,3 +413,90 @@ class DeterministicComputeAbstraction:
         except Exception as e:
             self.logger.error(f"Failed to replay computation: {e}", exc_info=True)
             return None
+    
+    async def store_chunk_manifest(
+        self,
+        parsed_file_id: str,
+        file_id: str,
+        tenant_id: str,
+        embedding_profile: str,
+        chunks: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Store (replace) the chunk manifest of a parsed file for one embedding profile.
+        
+        Args:
+            parsed_file_id: Parsed file identifier
+            file_id: Source file identifier (re-parses of a file share it)
+            tenant_id: Tenant identifier
+            embedding_profile: Embedding configuration the chunks were embedded with
+            chunks: Chunk identities (chunk_id, text_hash, source_path, ...)
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            from datetime import datetime
+            
+            await self.duckdb.execute_query(
+                f"DELETE FROM {self.chunk_manifests_table} "
+                f"WHERE parsed_file_id = ? AND tenant_id = ? AND embedding_profile = ?",
+                {"parsed_file_id": parsed_file_id, "tenant_id": tenant_id, "embedding_profile": embedding_profile}
+            )
+            rows_inserted = await self.duckdb.insert_data(
+                self.chunk_manifests_table,
+                [{
+                    "parsed_file_id": parsed_file_id,
+                    "file_id": file_id,
+                    "tenant_id": tenant_id,
+                    "embedding_profile": embedding_profile,
+                    "chunk_count": len(chunks),
+                    "chunks": json.dumps(chunks),
+                    "created_at": datetime.utcnow().isoformat()
+                }]
+            )
+            return rows_inserted > 0
+            
+        except Exception as e:
+            self.logger.error(f"Failed to store chunk manifest: {e}", exc_info=True)
+            return False
+    
+    async def get_chunk_manifest(
+        self,
+        tenant_id: str,
+        embedding_profile: str,
+        parsed_file_id: Optional[str] = None,
+        file_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a chunk manifest: the parsed file's own, or else the latest for its source file.
+        
+        Args:
+            tenant_id: Tenant identifier
+            embedding_profile: Embedding configuration
+            parsed_file_id: Parsed file identifier (exact manifest)
+            file_id: Source file identifier (latest manifest of any parse of the file)
+        
+        Returns:
+            Manifest document (chunks parsed from JSON) or None
+        """
+        try:
+            for column, value in (("parsed_file_id", parsed_file_id), ("file_id", file_id)):
+                if not value:
+                    continue
+                results = await self.duckdb.execute_query(
+                    f"SELECT * FROM {self.chunk_manifests_table} "
+                    f"WHERE {column} = ? AND tenant_id = ? AND embedding_profile = ? "
+                    f"ORDER BY created_at DESC LIMIT 1",
+                    {column: value, "tenant_id": tenant_id, "embedding_profile": embedding_profile}
+                )
+                if results:
+                    manifest = results[0]
+                    if isinstance(manifest.get("chunks"), str):
+                        manifest["chunks"] = json.loads(manifest["chunks"])
+                    return manifest
+            return None
+            
+        except Exception as e:
+            self.logger.error(f"Failed to get chunk manifest: {e}", exc_info=True)
+            return None
@@ -0,0 +1,334 @@
+"""
+Hybrid Retrieval Abstraction - Lexical + Vector Retrieval (Layer 1)
+
+Answers one query from both Meilisearch (keyword relevance) and the semantic vector
+store (meaning similarity), fused into a single ranking.
+
+WHAT (Infrastructure Role): I retrieve the most relevant tenant documents for a query
+HOW (Infrastructure Implementation): I run the lexical search and the query-embedding +
+                                     vector search concurrently on non-blocking clients,
+                                     fuse the two rankings with reciprocal rank fusion, and
+                                     keep a short-lived per-tenant cache of hot queries
+
+Reciprocal rank fusion scores a document sum(weight / (k + rank)) over the rankings it
+appears in, so it needs no score calibration between engines. Documents are matched
+across engines by their first present identity field (chunk_id, id, _key).
+"""
+
+import asyncio
+import json
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from utilities import get_logger
+from ..protocols.hybrid_retrieval_protocol import HybridRetrievalProtocol
+
+
+DEFAULT_RRF_K = 60
+
+DEFAULT_CACHE_TTL_SECONDS = 60
+
+DEFAULT_CACHE_ENTRIES_PER_TENANT = 256
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-mpnet-base-v2"
+
+IDENTITY_FIELDS = ("chunk_id", "id", "_key")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def reciprocal_rank_fusion(
+    rankings: Dict[str, Sequence[str]],
+    k: int = DEFAULT_RRF_K,
+    weights: Optional[Dict[str, float]] = None
+) -> List[Tuple[str, float, Dict[str, int]]]:
+    """
+    Fuse several rankings of document keys.
+
+    Args:
+        rankings: Source name -> keys, best first (duplicates after the first are ignored)
+        k: RRF constant; larger values flatten the contribution of top ranks
+        weights: Optional per-source weight (default 1.0)
+
+    Returns:
+        (key, fused score, {source: 1-based rank}) triples, best first; ties are broken
+        by best single rank, then key
+    """
+    weights = weights or {}
+    scores: Dict[str, float] = {}
+    ranks: Dict[str, Dict[str, int]] = {}
+    for source, keys in rankings.items():
+        weight = weights.get(source, 1.0)
+        seen = set()
+        for rank, key in enumerate(keys, start=1):
+            if key in seen:
+                continue
+            seen.add(key)
+            scores[key] = scores.get(key, 0.0) + weight / (k + rank)
+            ranks.setdefault(key, {})[source] = rank
+    fused = [(key, score, ranks[key]) for key, score in scores.items()]
+    fused.sort(key=lambda item: (-item[1], min(item[2].values()), item[0]))
+    return fused
+
+
+class HybridRetrievalAbstraction(HybridRetrievalProtocol):
+    """
+    Hybrid lexical + vector retrieval with reciprocal rank fusion.
+
+    Either engine may be unconfigured (its stage is skipped and has no timing) or fail
+    for a request; the other's ranking is then returned alone and the failure is
+    reported under "errors". Results with a failed stage are not cached. The vector
+    stage is skipped when no query_embedding is given and no embedding adapter is set.
+    """
+
+    def __init__(
+        self,
+        meilisearch_adapter: Optional[Any] = None,
+        semantic_data: Optional[Any] = None,
+        embedding_adapter: Optional[Any] = None,
+        lexical_index: str = "knowledge_assets",
+        embedding_model: str = DEFAULT_EMBEDDING_MODEL,
+        rrf_k: int = DEFAULT_RRF_K,
+        lexical_weight: float = 1.0,
+        vector_weight: float = 1.0,
+        candidate_multiplier: int = 3,
+        cache_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        cache_entries_per_tenant: int = DEFAULT_CACHE_ENTRIES_PER_TENANT
+    ):
+        """
+        Initialize hybrid retrieval.
+
+        Args:
+            meilisearch_adapter: MeilisearchAdapter (lexical engine; uses asearch)
+            semantic_data: SemanticDataAbstraction (vector engine; uses vector_search)
+            embedding_adapter: Adapter with generate_embedding(text, model) for query vectors
+                               (must be the model the stored embeddings were built with)
+            lexical_index: Default Meilisearch index
+            embedding_model: Query embedding model
+            rrf_k: Reciprocal rank fusion constant
+            lexical_weight: Fusion weight of the lexical ranking
+            vector_weight: Fusion weight of the vector ranking
+            candidate_multiplier: Candidates fetched per engine = limit * multiplier
+            cache_ttl_seconds: Lifetime of a cached query result (0 disables the cache)
+            cache_entries_per_tenant: Most recently used queries kept per tenant
+        """
+        self.meilisearch = meilisearch_adapter
+        self.semantic_data = semantic_data
+        self.embedding_adapter = embedding_adapter
+        self.lexical_index = lexical_index
+        self.embedding_model = embedding_model
+        self.rrf_k = rrf_k
+        self.weights = {"lexical": lexical_weight, "vector": vector_weight}
+        self.candidate_multiplier = max(1, candidate_multiplier)
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_entries_per_tenant = cache_entries_per_tenant
+        self.logger = get_logger(self.__class__.__name__)
+
+        self._cache: Dict[str, "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]"] = {}
+        self._stats = {"queries": 0, "cache_hits": 0, "lexical_errors": 0, "vector_errors": 0}
+
+    async def retrieve(
+        self,
+        query: str,
+        tenant_id: str,
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None,
+        index: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve fused lexical + vector results for a query.
+
+        Returns:
+            Dict with:
+                - results: [{"key", "score", "ranks", "document"}] best first
+                - timings_ms: embedding, lexical, vector, fusion and total milliseconds
+                  (embedding runs before vector search, concurrently with lexical search)
+                - cached: True when served from the per-tenant cache
+                - errors: stage -> error message for stages that failed
+        """
+        started = time.perf_counter()
+        self._stats["queries"] += 1
+        index = index or self.lexical_index
+        filters = dict(filters or {})
+        cache_key = self._cache_key(query, limit, filters, index)
+
+        cached = self._cache_get(tenant_id, cache_key)
+        if cached is not None:
+            self._stats["cache_hits"] += 1
+            return {
+                "query": query,
+                "results": list(cached),
+                "timings_ms": {"total": _elapsed_ms(started)},
+                "cached": True,
+                "errors": {},
+            }
+
+        timings: Dict[str, float] = {}
+        errors: Dict[str, str] = {}
+        candidates = limit * self.candidate_multiplier
+        scoped_filters = {**filters, "tenant_id": tenant_id}
+
+        lexical_hits, vector_hits = await asyncio.gather(
+            self._lexical(query, index, scoped_filters, candidates, timings, errors),
+            self._vector(query, query_embedding, scoped_filters, candidates, timings, errors)
+        )
+
+        fusion_started = time.perf_counter()
+        results = self._fuse(lexical_hits, vector_hits, limit)
+        timings["fusion"] = _elapsed_ms(fusion_started)
+        timings["total"] = _elapsed_ms(started)
+
+        if not errors:
+            self._cache_put(tenant_id, cache_key, results)
+
+        self.logger.debug(
+            f"Hybrid retrieval: {len(lexical_hits)} lexical + {len(vector_hits)} vector -> "
+            f"{len(results)} results in {timings['total']}ms"
+        )
+        return {"query": query, "results": results, "timings_ms": timings, "cached": False, "errors": errors}
+
+    def invalidate(self, tenant_id: Optional[str] = None) -> int:
+        """Drop cached results for a tenant (or all tenants)."""
+        if tenant_id is None:
+            dropped = sum(len(entries) for entries in self._cache.values())
+            self._cache.clear()
+            return dropped
+        return len(self._cache.pop(tenant_id, {}))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Query, cache-hit and stage-error counters."""
+        return {**self._stats, "cached_queries": sum(len(entries) for entries in self._cache.values())}
+
+    # ============================================================================
+    # STAGES
+    # ============================================================================
+
+    async def _lexical(
+        self,
+        query: str,
+        index: str,
+        filters: Dict[str, Any],
+        candidates: int,
+        timings: Dict[str, float],
+        errors: Dict[str, str]
+    ) -> List[Dict[str, Any]]:
+        if self.meilisearch is None:
+            return []
+        started = time.perf_counter()
+        try:
+            response = await self.meilisearch.asearch(index, query, filters=filters, limit=candidates)
+            return list(response.get("hits", []))
+        except Exception as e:
+            self._stats["lexical_errors"] += 1
+            errors["lexical"] = str(e)
+            self.logger.warning(f"Lexical retrieval failed (vector results only): {e}")
+            return []
+        finally:
+            timings["lexical"] = _elapsed_ms(started)
+
+    async def _vector(
+        self,
+        query: str,
+        query_embedding: Optional[List[float]],
+        filters: Dict[str, Any],
+        candidates: int,
+        timings: Dict[str, float],
+        errors: Dict[str, str]
+    ) -> List[Dict[str, Any]]:
+        if self.semantic_data is None:
+            return []
+        try:
+            if query_embedding is None:
+                if self.embedding_adapter is None:
+                    return []
+                started = time.perf_counter()
+                try:
+                    embedded = await self.embedding_adapter.generate_embedding(query, self.embedding_model)
+                finally:
+                    timings["embedding"] = _elapsed_ms(started)
+                query_embedding = embedded.get("embedding")
+                if not query_embedding:
+                    raise RuntimeError("embedding adapter returned no embedding")
+
+            started = time.perf_counter()
+            try:
+                return list(await self.semantic_data.vector_search(
+                    query_embedding=query_embedding,
+                    filter_conditions=filters,
+                    limit=candidates
+                ))
+            finally:
+                timings["vector"] = _elapsed_ms(started)
+        except Exception as e:
+            self._stats["vector_errors"] += 1
+            errors["vector"] = str(e)
+            self.logger.warning(f"Vector retrieval failed (lexical results only): {e}")
+            return []
+
+    def _fuse(
+        self,
+        lexical_hits: List[Dict[str, Any]],
+        vector_hits: List[Dict[str, Any]],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        documents: Dict[str, Dict[str, Any]] = {}
+        rankings: Dict[str, List[str]] = {"lexical": [], "vector": []}
+        for source, hits in (("lexical", lexical_hits), ("vector", vector_hits)):
+            for hit in hits:
+                key = _document_key(hit)
+                if key is None:
+                    continue
+                rankings[source].append(key)
+                merged = documents.setdefault(key, {})
+                for field, value in hit.items():
+                    if field != "embedding":  # vectors are not useful context and are large
+                        merged.setdefault(field, value)
+
+        return [
+            {"key": key, "score": round(score, 6), "ranks": ranks, "document": documents[key]}
+            for key, score, ranks in reciprocal_rank_fusion(rankings, self.rrf_k, self.weights)[:limit]
+        ]
+
+    # ============================================================================
+    # PER-TENANT CACHE
+    # ============================================================================
+
+    @staticmethod
+    def _cache_key(query: str, limit: int, filters: Dict[str, Any], index: str) -> str:
+        normalized = _WHITESPACE.sub(" ", query.strip().lower())
+        return json.dumps([normalized, limit, index, filters], sort_keys=True, default=str)
+
+    def _cache_get(self, tenant_id: str, key: str) -> Optional[List[Dict[str, Any]]]:
+        entries = self._cache.get(tenant_id)
+        if entries is None or key not in entries:
+            return None
+        stored_at, results = entries[key]
+        if time.monotonic() - stored_at > self.cache_ttl_seconds:
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return results
+
+    def _cache_put(self, tenant_id: str, key: str, results: List[Dict[str, Any]]) -> None:
+        if self.cache_ttl_seconds <= 0 or self.cache_entries_per_tenant <= 0:
+            return
+        entries = self._cache.setdefault(tenant_id, OrderedDict())
+        entries[key] = (time.monotonic(), results)
+        entries.move_to_end(key)
+        while len(entries) > self.cache_entries_per_tenant:
+            entries.popitem(last=False)
+
+
+def _document_key(document: Dict[str, Any]) -> Optional[str]:
+    for field in IDENTITY_FIELDS:
+        value = document.get(field)
+        if value is not None:
+            return str(value)
+    return None
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
@@ -81,7 +81,7 @@ class KnowledgeDiscoveryAbstraction(KnowledgeDiscoveryProtocol):
             Raw search results from Meilisearch adapter
         """
         try:
-            result = await self.meilisearch.search(
+            result = await self.meilisearch.asearch(
                 index,
                 query,
                 filters=filters,
@@ -120,7 +120,7 @@ class KnowledgeDiscoveryAbstraction(KnowledgeDiscoveryProtocol):
             Raw faceted search results from Meilisearch adapter
         """
         try:
-            result = await self.meilisearch.search_with_facets(
+            result = await self.meilisearch.asearch_with_facets(
                 index,
                 query,
                 facets,
@@ -8,6 +8,7 @@ Adapters stay inside Public Works; no adapter at boundary.
 from typing import Any, Dict, List, Optional
 
 from utilities import get_logger
+from ..llm_gateway import LLMGateway
 
 
 class LLMAbstraction:
@@ -69,7 +70,14 @@ class LLMAbstraction:
             "max_tokens": max_tokens,
             **{k: v for k, v in kwargs.items() if k in ("top_p", "frequency_penalty", "presence_penalty", "stop")},
         }
-        response = await self._openai.generate_completion(request)
+        # Tenant / lane / deadline are admission hints for the gateway, not provider parameters
+        governance = {
+            k: kwargs[k] for k in ("tenant_id", "priority", "deadline_seconds") if kwargs.get(k) is not None
+        }
+        if governance and isinstance(self._openai, LLMGateway):
+            response = await self._openai.generate_completion(request, **governance)
+        else:
+            response = await self._openai.generate_completion(request)
         if response.get("error"):
             raise RuntimeError(f"OpenAI completion failed: {response['error']}")
         choices = response.get("choices", [])
@@ -124,24 +132,32 @@ class LLMAbstraction:
         model: Optional[str] = None
     ) -> Dict[str, Any]:
         """Generate embeddings. Routes by model/config (OpenAI or HuggingFace). No silent fallback on API failure; raises if unavailable."""
+        return (await self.embed_many([content], model))[0]
+
+    async def embed_many(
+        self,
+        contents: List[str],
+        model: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate embeddings for several texts in as few provider calls as possible.
+
+        Routes like embed(); texts go through the provider adapter's embedding engine,
+        which also coalesces them with concurrent requests.
+        """
         model = model or self._default_embed_model
 
         if self._openai and (model.startswith("text-embedding") or "openai" in model.lower() or not model.startswith("hf-")):
-            emb = await self._openai.generate_embeddings(content, model)
-            return {
-                "embedding": emb if isinstance(emb, list) else list(emb),
-                "model": model,
-                "dimensions": len(emb) if isinstance(emb, (list, tuple)) else 0,
-            }
+            vectors = await self._openai.embedding_engine.embed_many(list(contents), model)
+            return [
+                {"embedding": list(emb), "model": model, "dimensions": len(emb)}
+                for emb in vectors
+            ]
         if self._huggingface:
-            response = await self._huggingface.generate_embedding(
-                text=content,
-                model=model.replace("hf-", "") if model else "sentence-transformers/all-mpnet-base-v2",
-            )
-            emb = response.get("embedding", [])
-            return {
-                "embedding": emb if isinstance(emb, list) else [emb],
-                "model": response.get("model", model),
-                "dimensions": len(emb) if isinstance(emb, (list, tuple)) else response.get("dimension", 0),
-            }
+            hf_model = model.replace("hf-", "") if model else "sentence-transformers/all-mpnet-base-v2"
+            vectors = await self._huggingface.embedding_engine.embed_many(list(contents), hf_model)
+            return [
+                {"embedding": list(emb), "model": hf_model, "dimensions": len(emb)}
+                for emb in vectors
+            ]
         raise RuntimeError("No LLM adapter available for embeddings. Check Public Works LLM configuration.")
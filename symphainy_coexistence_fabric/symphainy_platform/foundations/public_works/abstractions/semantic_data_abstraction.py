@@ -18,6 +18,7 @@ from ..protocols.semantic_data_protocol import SemanticDataProtocol
 from ..protocols.vector_store_protocol import VectorStoreProtocol
 from ..protocols.semantic_graph_protocol import SemanticGraphProtocol
 from ..protocols.correlation_map_protocol import CorrelationMapProtocol
+from ..protocols.vector_backend_protocol import VectorBackendProtocol
 
 
 class SemanticDataAbstraction(
@@ -34,14 +35,23 @@ class SemanticDataAbstraction(
     Domain logic (embedding generation, semantic graph generation) belongs in Realm services.
     """
     
-    def __init__(self, arango_adapter: AdapterType):
+    def __init__(
+        self,
+        arango_adapter: AdapterType,
+        import_batch_size: int = 1000,
+        vector_backend: Optional[VectorBackendProtocol] = None
+    ):
         """
         Initialize Semantic Data abstraction.
         
         Args:
             arango_adapter: ArangoDB adapter for semantic data storage (Layer 0)
+            import_batch_size: Default documents per bulk import request
+            vector_backend: Vector search backend (defaults to the ArangoDB adapter's AQL scan)
         """
         self.arango = arango_adapter
+        self.vector_backend = vector_backend or arango_adapter
+        self.import_batch_size = import_batch_size
         self.logger = get_logger(self.__class__.__name__)
         
         # Collection names for ArangoDB (infrastructure concern)
@@ -58,7 +68,9 @@ class SemanticDataAbstraction(
     
     async def store_semantic_embeddings(
         self,
-        embedding_documents: List[Dict[str, Any]]
+        embedding_documents: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        on_duplicate: str = "replace"
     ) -> Dict[str, Any]:
         """
         Store semantic embedding documents - pure infrastructure.
@@ -69,17 +81,21 @@ class SemanticDataAbstraction(
         PHASE 3 ANTI-CORRUPTION: Require chunk_id in embedding documents.
         Embeddings must reference deterministic chunks, not parsed_file_id directly.
         
+        Documents are written with the adapter's bulk import (one request per batch);
+        re-storing an existing _key follows `on_duplicate` (replace by default).
+        
         Args:
             embedding_documents: List of pre-built embedding documents
+            batch_size: Documents per import request (defaults to import_batch_size)
+            on_duplicate: Action on _key conflict ("error", "update", "replace", "ignore")
         
         Returns:
-            Dict with storage result (stored_count, success status)
+            Dict with storage result (stored_count, failed_keys, batches, success status)
         """
         try:
             if not embedding_documents:
                 raise ValueError("embedding_documents list cannot be empty")
             
-            stored_count = 0
             for doc in embedding_documents:
                 # Ensure _key exists (should be provided by Librarian Service)
                 if "_key" not in doc:
@@ -92,25 +108,53 @@ class SemanticDataAbstraction(
                         "Embeddings must reference deterministic chunks, not parsed_file_id directly.\n"
                         "Use EmbeddingService.create_chunk_embeddings() to create chunk-based embeddings."
                     )
-                
-                # Store in ArangoDB (pure infrastructure)
-                await self.arango.create_document(
-                    self.structured_embeddings_collection,
-                    doc
-                )
-                stored_count += 1
             
-            self.logger.info(f"Stored {stored_count} semantic embeddings")
+            # Store in ArangoDB (pure infrastructure)
+            report = await self.arango.import_documents(
+                self.structured_embeddings_collection,
+                embedding_documents,
+                batch_size=batch_size or self.import_batch_size,
+                on_duplicate=on_duplicate
+            )
+            stored_count = report["total"] - report["errors"]
+            await self._index_embeddings(embedding_documents, report["failed_keys"])
+            
+            if report["errors"]:
+                self.logger.warning(
+                    f"Stored {stored_count}/{report['total']} semantic embeddings "
+                    f"({report['errors']} failed across {len(report['batches'])} batches)"
+                )
+            else:
+                self.logger.info(f"Stored {stored_count} semantic embeddings")
             
             return {
-                "success": True,
-                "stored_count": stored_count
+                "success": report["success"],
+                "stored_count": stored_count,
+                "created": report["created"],
+                "updated": report["updated"],
+                "failed_count": report["errors"],
+                "failed_keys": report["failed_keys"],
+                "batches": report["batches"]
             }
             
         except Exception as e:
             self.logger.error(f"Failed to store semantic embeddings: {e}", exc_info=True)
             raise
     
+    async def _index_embeddings(self, embedding_documents: List[Dict[str, Any]], failed_keys: List[str]) -> None:
+        """Feed stored embeddings to an incrementally maintained vector index, if the backend has one."""
+        index_documents = getattr(self.vector_backend, "index_documents", None)
+        if index_documents is None:
+            return
+        failed = set(failed_keys)
+        stored = [doc for doc in embedding_documents if doc["_key"] not in failed]
+        try:
+            await index_documents(self.structured_embeddings_collection, stored)
+        except Exception as e:
+            # The documents are stored; drop the index so the next search reloads it from ArangoDB
+            self.logger.error(f"Failed to index stored embeddings, invalidating vector index: {e}", exc_info=True)
+            self.vector_backend.invalidate(self.structured_embeddings_collection)
+    
     async def get_semantic_embeddings(
         self,
         filter_conditions: Optional[Dict[str, Any]] = None,
@@ -170,6 +214,27 @@ class SemanticDataAbstraction(
             self.logger.error(f"Failed to get semantic embeddings: {e}", exc_info=True)
             raise
     
+    async def get_semantic_embeddings_by_keys(self, keys: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get stored embedding documents by _key - pure infrastructure (one query).
+        
+        Args:
+            keys: Embedding document keys
+        
+        Returns:
+            The documents found (missing keys are skipped)
+        """
+        if not keys:
+            return []
+        try:
+            return await self.arango.execute_aql(
+                f"FOR doc IN {self.structured_embeddings_collection} FILTER doc._key IN @keys RETURN doc",
+                bind_vars={"keys": list(keys)}
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to get semantic embeddings by key: {e}", exc_info=True)
+            raise
+    
     async def query_by_semantic_id(
         self,
         semantic_id: str,
@@ -214,9 +279,9 @@ class SemanticDataAbstraction(
         Vector similarity search - pure infrastructure.
         
         Uses pluggable vector backend (ArangoDB by default) for similarity calculation.
-        This method delegates to the vector backend adapter for vector search.
-        The adapter can be swapped with other backends (Pinecone, Weaviate) that implement
-        the VectorBackendProtocol interface.
+        This method delegates to the vector backend for vector search.
+        The backend can be swapped with others (in-process ANN index, Pinecone, Weaviate)
+        that implement the VectorBackendProtocol interface.
         
         Args:
             query_embedding: Query vector (embedding)
@@ -233,9 +298,8 @@ class SemanticDataAbstraction(
             
             filter_conditions = filter_conditions or {}
             
-            # Use ArangoDB vector search via adapter
-            # The adapter handles vector similarity calculation using ArangoDB functions
-            results = await self.arango.vector_search(
+            # Delegate to the configured vector backend (ANN index or ArangoDB scan)
+            results = await self.vector_backend.vector_search(
                 collection_name=self.structured_embeddings_collection,
                 query_vector=query_embedding,
                 vector_field="embedding",  # Field name in embedding documents
@@ -260,7 +324,9 @@ class SemanticDataAbstraction(
     async def store_semantic_graph(
         self,
         node_documents: List[Dict[str, Any]],
-        edge_documents: List[Dict[str, Any]]
+        edge_documents: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        on_duplicate: str = "replace"
     ) -> Dict[str, Any]:
         """
         Store semantic graph documents - pure infrastructure.
@@ -268,54 +334,83 @@ class SemanticDataAbstraction(
         Expects pre-built node and edge documents (with _key, _from, _to, etc.).
         No validation, no UUID generation, no metadata enhancement.
         
+        Nodes are bulk imported before edges; re-storing an existing _key follows
+        `on_duplicate` (replace by default).
+        
         Args:
             node_documents: List of pre-built node documents
             edge_documents: List of pre-built edge documents
+            batch_size: Documents per import request (defaults to import_batch_size)
+            on_duplicate: Action on _key conflict ("error", "update", "replace", "ignore")
         
         Returns:
-            Dict with storage result (stored_nodes, stored_edges, success status)
+            Dict with storage result (stored_nodes, stored_edges, failed keys,
+            per-batch reports, success status)
         """
         try:
-            stored_nodes = 0
             for doc in node_documents:
                 # Ensure _key exists (should be provided by Librarian Service)
                 if "_key" not in doc:
                     raise ValueError("Node document must have '_key' field")
-                
-                # Store in ArangoDB (pure infrastructure)
-                await self.arango.create_document(
-                    self.semantic_graph_nodes_collection,
-                    doc
-                )
-                stored_nodes += 1
             
-            stored_edges = 0
             for doc in edge_documents:
                 # Ensure _key, _from, _to exist (should be provided by Librarian Service)
                 if "_key" not in doc:
                     raise ValueError("Edge document must have '_key' field")
                 if "_from" not in doc or "_to" not in doc:
                     raise ValueError("Edge document must have '_from' and '_to' fields")
-                
-                # Store in ArangoDB (pure infrastructure)
-                await self.arango.create_document(
-                    self.semantic_graph_edges_collection,
-                    doc
-                )
-                stored_edges += 1
             
-            self.logger.info(f"Stored semantic graph: {stored_nodes} nodes, {stored_edges} edges")
+            batch_size = batch_size or self.import_batch_size
+            
+            # Store in ArangoDB (pure infrastructure)
+            node_report = await self._import(
+                self.semantic_graph_nodes_collection, node_documents, batch_size, on_duplicate
+            )
+            edge_report = await self._import(
+                self.semantic_graph_edges_collection, edge_documents, batch_size, on_duplicate
+            )
+            stored_nodes = node_report["total"] - node_report["errors"]
+            stored_edges = edge_report["total"] - edge_report["errors"]
+            
+            if node_report["errors"] or edge_report["errors"]:
+                self.logger.warning(
+                    f"Stored semantic graph with errors: {stored_nodes}/{node_report['total']} nodes, "
+                    f"{stored_edges}/{edge_report['total']} edges"
+                )
+            else:
+                self.logger.info(f"Stored semantic graph: {stored_nodes} nodes, {stored_edges} edges")
             
             return {
-                "success": True,
+                "success": node_report["success"] and edge_report["success"],
                 "stored_nodes": stored_nodes,
-                "stored_edges": stored_edges
+                "stored_edges": stored_edges,
+                "failed_node_keys": node_report["failed_keys"],
+                "failed_edge_keys": edge_report["failed_keys"],
+                "node_batches": node_report["batches"],
+                "edge_batches": edge_report["batches"]
             }
             
         except Exception as e:
             self.logger.error(f"Failed to store semantic graph: {e}", exc_info=True)
             raise
     
+    async def _import(
+        self,
+        collection_name: str,
+        documents: List[Dict[str, Any]],
+        batch_size: int,
+        on_duplicate: str
+    ) -> Dict[str, Any]:
+        """Bulk import documents; an empty list is a no-op."""
+        if not documents:
+            return {"success": True, "total": 0, "errors": 0, "failed_keys": [], "batches": []}
+        return await self.arango.import_documents(
+            collection_name,
+            documents,
+            batch_size=batch_size,
+            on_duplicate=on_duplicate
+        )
+    
     async def get_semantic_graph(
         self,
         filter_conditions: Optional[Dict[str, Any]] = None
@@ -64,11 +64,8 @@ class SemanticSearchAbstraction(SemanticSearchProtocol):
         try:
             self.logger.info(f"Searching: {query} in index {index}")
             
-            # Use Meilisearch adapter (synchronous, but we're in async context)
-            # Meilisearch client is sync, so we run it in a thread pool
-            import asyncio
-            results = await asyncio.to_thread(
-                self.meilisearch_adapter.search,
+            # Non-blocking HTTP search (no worker thread per query)
+            results = await self.meilisearch_adapter.asearch(
                 index_name=index,
                 query=query,
                 filters=filters,
@@ -13,7 +13,7 @@ import asyncio
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
-from utilities import get_logger, get_clock
+from utilities import get_logger, get_clock, LogCategory
 
 from ..protocols.state_protocol import StateManagementProtocol
 from ..adapters.redis_adapter import RedisAdapter
@@ -76,7 +76,10 @@ class StateManagementAbstraction(StateManagementProtocol):
             # Determine backend from metadata
             backend = (metadata or {}).get("backend", "redis")
             strategy = (metadata or {}).get("strategy", "hot")
-            self.logger.info(f"🔵 STORING STATE: {state_id}, backend={backend}, strategy={strategy}")
+            self.logger.info(
+                lambda: f"🔵 STORING STATE: {state_id}, backend={backend}, strategy={strategy}",
+                category=LogCategory.HOT_PATH
+            )
             
             # Store in appropriate backend
             if backend == "arango_db" and self.arango_adapter:
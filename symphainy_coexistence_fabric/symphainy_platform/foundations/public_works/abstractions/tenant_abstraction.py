@@ -108,6 +108,7 @@ class TenantAbstraction(TenancyProtocol):
                 "tenant_type": str,
                 "roles": List[str],
                 "permissions": List[str],
+                "tenant_source": str,  # "user_tenants" or "user_metadata" (fallback)
                 "raw_user_tenant_data": Dict[str, Any]  # Full data from user_tenants table
             }
         """
@@ -8,6 +8,8 @@ WHAT (Infrastructure Role): I provide raw ArangoDB client operations
 HOW (Infrastructure Implementation): I use real ArangoDB client with no business logic
 """
 
+import asyncio
+import re
 import sys
 from typing import Dict, Any, Optional, List
 from urllib.parse import urlparse
@@ -26,6 +28,13 @@ except ImportError:
 from utilities import get_logger
 
 
+DEFAULT_IMPORT_BATCH_SIZE = 1000
+
+IMPORT_ON_DUPLICATE_MODES = ("error", "update", "replace", "ignore")
+
+_IMPORT_POSITION = re.compile(r"at position (\d+)")
+
+
 class ArangoAdapter:
     """
     Raw ArangoDB client wrapper - no business logic.
@@ -72,17 +81,19 @@ class ArangoAdapter:
             port = parsed.port or 8529
             
             # Create ArangoDB client
-            self._client = ArangoClient(hosts=f"http://{host}:{port}")
+            client = ArangoClient(hosts=f"http://{host}:{port}")
             
-            # Connect to database
-            self._db = self._client.db(
+            # Connect to database (python-arango is synchronous; keep the round trips off the event loop)
+            db = await asyncio.to_thread(
+                client.db,
                 name=self.database,
                 username=self.username,
                 password=self.password
             )
             
             # Test connection
-            self._db.properties()
+            await asyncio.to_thread(db.properties)
+            self._client, self._db = client, db
             
             self.logger.info(
                 f"ArangoDB adapter connected: {host}:{port}/{self.database}"
@@ -148,9 +159,9 @@ class ArangoAdapter:
             return False
         try:
             if collection_type == "document":
-                self._db.create_collection(collection_name)
+                await asyncio.to_thread(self._db.create_collection, collection_name)
             elif collection_type == "edge":
-                self._db.create_collection(collection_name, edge=True)
+                await asyncio.to_thread(self._db.create_collection, collection_name, edge=True)
             else:
                 self.logger.error(f"Unknown collection type: {collection_type}")
                 return False
@@ -169,7 +180,7 @@ class ArangoAdapter:
         if not self._db:
             return False
         try:
-            return self._db.has_collection(collection_name)
+            return await asyncio.to_thread(self._db.has_collection, collection_name)
         except Exception as e:
             self.logger.error(f"Failed to check collection existence: {e}")
             return False
@@ -332,6 +343,94 @@ class ArangoAdapter:
         """
         return await self.insert_document(collection_name, document)
     
+    # ============================================================================
+    # BULK OPERATIONS
+    # ============================================================================
+    
+    async def import_documents(
+        self,
+        collection_name: str,
+        documents: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+        on_duplicate: str = "replace"
+    ) -> Dict[str, Any]:
+        """
+        Bulk import documents (or edges) using the ArangoDB import endpoint.
+        
+        Documents are sent in batches of `batch_size`; each batch is one HTTP round
+        trip run off the event loop. A failing batch (server error, or connection / HTTP
+        error) is reported with all its keys failed and does not stop later batches.
+        
+        Args:
+            collection_name: Collection name (document or edge collection)
+            documents: Documents to import
+            batch_size: Documents per import request
+            on_duplicate: Action on `_key` conflict ("error", "update", "replace", "ignore")
+        
+        Returns:
+            Dict with totals (created, updated, ignored, errors), `failed_keys`
+            and a per-batch report
+        """
+        if on_duplicate not in IMPORT_ON_DUPLICATE_MODES:
+            raise ValueError(
+                f"Invalid on_duplicate '{on_duplicate}'; expected one of {IMPORT_ON_DUPLICATE_MODES}"
+            )
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        
+        report: Dict[str, Any] = {
+            "success": False,
+            "total": len(documents),
+            "created": 0,
+            "updated": 0,
+            "ignored": 0,
+            "errors": 0,
+            "failed_keys": [],
+            "batches": []
+        }
+        if not self._db:
+            report["errors"] = len(documents)
+            report["failed_keys"] = [doc.get("_key") for doc in documents]
+            return report
+        
+        collection = self._db.collection(collection_name)
+        for index, start in enumerate(range(0, len(documents), batch_size)):
+            batch = documents[start:start + batch_size]
+            batch_report: Dict[str, Any] = {"batch": index, "size": len(batch)}
+            try:
+                result = await asyncio.to_thread(
+                    collection.import_bulk,
+                    batch,
+                    halt_on_error=False,
+                    details=True,
+                    on_duplicate=on_duplicate
+                )
+            except Exception as e:  # ArangoError, or a connection / HTTP error: the whole batch failed
+                self.logger.error(
+                    f"Bulk import batch {index} into {collection_name} failed: {e}"
+                )
+                batch_report.update({"created": 0, "updated": 0, "ignored": 0, "errors": len(batch), "error": str(e)})
+                report["failed_keys"].extend(doc.get("_key") for doc in batch)
+            else:
+                details = result.get("details") or []
+                batch_report.update({
+                    "created": result.get("created", 0),
+                    "updated": result.get("updated", 0),
+                    "ignored": result.get("ignored", 0),
+                    "errors": result.get("errors", 0),
+                    "details": details
+                })
+                for detail in details:
+                    match = _IMPORT_POSITION.search(detail)
+                    if match and int(match.group(1)) < len(batch):
+                        report["failed_keys"].append(batch[int(match.group(1))].get("_key"))
+            for field in ("created", "updated", "ignored", "errors"):
+                report[field] += batch_report[field]
+            report["batches"].append(batch_report)
+        
+        report["success"] = report["errors"] == 0
+        return report
+    
     # ============================================================================
     # RAW AQL OPERATIONS
     # ============================================================================
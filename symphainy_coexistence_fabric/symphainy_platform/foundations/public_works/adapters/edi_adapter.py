@@ -5,19 +5,52 @@ Handles EDI protocol ingestion (AS2, SFTP, etc.).
 Processes EDI data and stores via FileStorageAbstraction.
 
 WHAT (Infrastructure Role): I provide EDI protocol ingestion
-HOW (Infrastructure Implementation): I process EDI data and use FileStorageAbstraction
+HOW (Infrastructure Implementation): I process EDI data and use FileStorageAbstraction; AS2 decryption
+                                     runs in a process pool (forkserver / spawn, rebuilt if a worker
+                                     dies), and retransmitted AS2 messages are
+                                     rejected by Message-ID before any decryption; X12 / EDIFACT
+                                     payloads are tokenized as a stream into a transaction offset
+                                     index (edi_tokenizer), stored as a JSON sidecar next to the
+                                     payload
 """
 
+import asyncio
+import json
 import uuid
-from typing import Dict, Any, Optional
-from utilities import get_logger, get_clock
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Iterator, List, Optional
+from utilities import get_logger, get_clock, worker_process_context
 
 from ..protocols.ingestion_protocol import (
     IngestionRequest,
     IngestionResult,
     IngestionType
 )
-from .as2_decryption import AS2Decryptor, AS2DecryptionError
+from .as2_decryption import AS2Decryptor, AS2DecryptionError, as2_message_id
+from .edi_tokenizer import (
+    EDIFormatError,
+    EDITokenizer,
+    EDITransaction,
+    EDITransactionIndexEntry,
+    iter_chunks,
+    looks_like_edi,
+    read_transaction,
+)
+
+
+# Sidecar object holding a stored payload's transaction index: {storage_path}{suffix}
+TRANSACTION_INDEX_SUFFIX = ".edi-index.json"
+
+
+class AS2DuplicateMessageError(Exception):
+    """AS2 message already received from this partner (retransmission)."""
+
+    def __init__(self, partner_id: str, message_id: str, mdn: Optional[Dict[str, Any]] = None):
+        super().__init__(f"Duplicate AS2 message: {message_id}")
+        self.partner_id = partner_id
+        self.message_id = message_id
+        self.mdn = mdn
 
 
 class EDIAdapter:
@@ -33,7 +66,9 @@ class EDIAdapter:
     def __init__(
         self,
         file_storage_abstraction: Any,
-        edi_config: Optional[Dict[str, Any]] = None
+        edi_config: Optional[Dict[str, Any]] = None,
+        message_dedup: Optional[Any] = None,
+        crypto_workers: int = 2
     ):
         """
         Initialize EDI adapter.
@@ -52,12 +87,19 @@ class EDIAdapter:
                     - as2_name: Organization's AS2 identifier
                     - decrypt_key: Organization's private key (if different from partner)
                     - decrypt_key_pass: Password for organization key (optional)
+            message_dedup: Optional AS2MessageDeduplicator (None = no duplicate detection)
+            crypto_workers: AS2 decryption processes (0 = the event loop's default thread pool)
         """
         self.file_storage = file_storage_abstraction
         self.config = edi_config or {}
+        self.message_dedup = message_dedup
         self.logger = get_logger(self.__class__.__name__)
         self.clock = get_clock()
         
+        # Worker processes start on first decryption (and again after a worker died)
+        self.crypto_workers = max(0, crypto_workers)
+        self._crypto_pool: Optional[ProcessPoolExecutor] = None
+        
         # Cache AS2 decryptors per partner
         self._as2_decryptors: Dict[str, AS2Decryptor] = {}
         
@@ -112,6 +154,21 @@ class EDIAdapter:
                 edi_protocol,
                 partner_id
             )
+        except AS2DuplicateMessageError as e:
+            return IngestionResult(
+                success=False,
+                file_id="",
+                file_reference="",
+                storage_location="",
+                ingestion_metadata={
+                    "duplicate": True,
+                    "partner_id": e.partner_id,
+                    "message_id": e.message_id,
+                    # The first delivery's MDN, so the retransmission can be acknowledged again
+                    **({"mdn": e.mdn} if e.mdn is not None else {})
+                },
+                error=str(e)
+            )
         except AS2DecryptionError as e:
             return IngestionResult(
                 success=False,
@@ -122,6 +179,36 @@ class EDIAdapter:
                 error=f"AS2 decryption failed: {str(e)}"
             )
         
+        # The dedup claim taken after decryption holds only once the message is stored
+        dedup_claim = processing_metadata.pop("dedup_claim", None)
+        try:
+            result = await self._store_edi_data(
+                request, processed_data, processing_metadata, edi_protocol, partner_id, transaction_type
+            )
+        except BaseException:
+            if dedup_claim is not None:
+                await self.message_dedup.release(*dedup_claim)
+            raise
+        if dedup_claim is not None:
+            if result.success:
+                await self.message_dedup.confirm(*dedup_claim, mdn=processing_metadata.get("mdn"))
+            else:
+                await self.message_dedup.release(*dedup_claim)
+        return result
+    
+    async def _store_edi_data(
+        self,
+        request: IngestionRequest,
+        processed_data: bytes,
+        processing_metadata: Dict[str, Any],
+        edi_protocol: str,
+        partner_id: Optional[str],
+        transaction_type: Optional[str]
+    ) -> IngestionResult:
+        """Index and store processed EDI data as a file."""
+        # Transaction index (ST/SE, UNH/UNT offsets) so transactions can be re-read individually
+        transaction_index = await self._index_transactions(processed_data)
+        
         # Generate file ID and reference
         file_id = str(uuid.uuid4())
         filename = request.source_metadata.get(
@@ -145,6 +232,34 @@ class EDIAdapter:
             "session_id": request.session_id,
             "file_id": file_id
         }
+        index_metadata = self._index_metadata(transaction_index)
+        # Storage metadata gets the summary; the full index goes to the sidecar object
+        edi_metadata.update({key: value for key, value in index_metadata.items() if key != "transaction_index"})
+        
+        if transaction_index is not None:
+            # Index first: a stored payload always has its index (an orphaned sidecar is harmless)
+            index_path = f"{storage_path}{TRANSACTION_INDEX_SUFFIX}"
+            index_stored = await self.file_storage.upload_file(
+                file_path=index_path,
+                file_data=json.dumps(index_metadata["transaction_index"]).encode("utf-8"),
+                metadata={
+                    "content_type": "application/json",
+                    "file_id": file_id,
+                    "tenant_id": request.tenant_id,
+                    "index_of": storage_path
+                }
+            )
+            if not self._upload_succeeded(index_stored):
+                return IngestionResult(
+                    success=False,
+                    file_id="",
+                    file_reference="",
+                    storage_location="",
+                    ingestion_metadata={},
+                    error="EDI ingestion failed - transaction index could not be stored"
+                )
+            edi_metadata["transaction_index_path"] = index_path
+            index_metadata["transaction_index_path"] = index_path
         
         # Store as file (same as upload)
         success = await self.file_storage.upload_file(
@@ -153,7 +268,7 @@ class EDIAdapter:
             metadata=edi_metadata
         )
         
-        if success:
+        if self._upload_succeeded(success):
             self.logger.info(f"EDI file ingested successfully: {storage_path} ({len(processed_data)} bytes)")
             return IngestionResult(
                 success=True,
@@ -168,7 +283,8 @@ class EDIAdapter:
                     "original_filename": filename,
                     "file_size": len(processed_data),
                     "storage_path": storage_path,
-                    **processing_metadata  # Include AS2 metadata (verified, sender, message_id, etc.)
+                    **processing_metadata,  # Include AS2 metadata (verified, sender, message_id, etc.)
+                    **index_metadata
                 }
             )
         else:
@@ -223,6 +339,7 @@ class EDIAdapter:
             Decrypted EDI data
         
         Raises:
+            AS2DuplicateMessageError: If the partner already sent this Message-ID
             AS2DecryptionError: If decryption or verification fails
         """
         if not partner_id:
@@ -240,8 +357,15 @@ class EDIAdapter:
             except Exception as e:
                 raise AS2DecryptionError(f"AS2 processing failed: partner_id required. {str(e)}")
         
+        # Retransmissions are rejected from the plaintext headers, before any crypto work
+        message_id = as2_message_id(data) if self.message_dedup is not None else None
+        if message_id is not None and await self.message_dedup.is_duplicate(partner_id, message_id):
+            self.logger.info(f"Duplicate AS2 message rejected: partner_id={partner_id}, message_id={message_id}")
+            raise AS2DuplicateMessageError(partner_id, message_id, await self.message_dedup.get_mdn(partner_id, message_id))
+        
         # Get or create decryptor for this partner
         decryptor = self._get_decryptor(partner_id)
+        decryptor.executor = self._crypto_executor()
         
         # Get organization config (optional, for pyas2lib)
         organization_config = self.config.get("organization")
@@ -273,13 +397,123 @@ class EDIAdapter:
             # Store metadata for later use (e.g., MDN generation)
             # Metadata is stored in ingestion_metadata in the ingest() method
             
-            return decrypted_payload, metadata
-            
         except AS2DecryptionError:
             raise
+        except BrokenProcessPool as e:
+            # A worker died (e.g. killed for memory): this message fails, the next one gets a new pool
+            self._drop_crypto_pool(decryptor.executor)
+            raise AS2DecryptionError(f"AS2 decryption worker died: {str(e)}")
         except Exception as e:
             self.logger.error(f"AS2 processing failed for partner {partner_id}: {e}", exc_info=True)
             raise AS2DecryptionError(f"AS2 processing failed: {str(e)}")
+        
+        # Claimed only once decrypted, so a message that failed can be resent; losing the
+        # claim means a concurrent retransmission was decrypted by another worker. ingest()
+        # confirms the claim once the payload is stored and releases it otherwise.
+        if message_id is not None:
+            if not await self.message_dedup.claim(partner_id, message_id):
+                raise AS2DuplicateMessageError(partner_id, message_id)
+            metadata = {**metadata, "dedup_claim": (partner_id, message_id)}
+        
+        return decrypted_payload, metadata
+    
+    def iter_transactions(self, data: bytes) -> Iterator[EDITransaction]:
+        """
+        Transaction sets of an X12 / EDIFACT payload, one at a time (streamed, not materialized).
+        
+        Raises:
+            EDIFormatError: If data is not an X12 or EDIFACT interchange
+        """
+        return EDITokenizer().iter_transactions(iter_chunks(data))
+    
+    async def load_transaction_index(self, storage_path: str) -> List[EDITransactionIndexEntry]:
+        """
+        Transaction index persisted next to a stored payload.
+        
+        Args:
+            storage_path: Storage path of the payload (ingestion result storage_location)
+        
+        Raises:
+            FileNotFoundError: If the payload was stored without an index (not X12 / EDIFACT)
+        """
+        raw = await self.file_storage.download_file(f"{storage_path}{TRANSACTION_INDEX_SUFFIX}")
+        if raw is None:
+            raise FileNotFoundError(f"No EDI transaction index stored for {storage_path}")
+        return [EDITransactionIndexEntry.from_dict(entry) for entry in json.loads(raw)]
+    
+    async def read_transaction(
+        self,
+        storage_path: str,
+        position: int,
+        data: Optional[bytes] = None
+    ) -> EDITransaction:
+        """
+        Re-read one transaction of a stored payload by its persisted index (no full re-parse).
+        
+        Args:
+            storage_path: Storage path of the payload (ingestion result storage_location)
+            position: Position of the transaction in the index (0-based)
+            data: The payload if already at hand (downloaded from storage_path otherwise)
+        
+        Raises:
+            FileNotFoundError: If the payload or its index is not stored
+            IndexError: If position is outside the index
+        """
+        entry = (await self.load_transaction_index(storage_path))[position]
+        if data is None:
+            data = await self.file_storage.download_file(storage_path)
+            if data is None:
+                raise FileNotFoundError(f"EDI payload not found: {storage_path}")
+        return read_transaction(data, entry)
+    
+    async def _index_transactions(self, data: bytes) -> Optional[List[EDITransactionIndexEntry]]:
+        """Transaction index of an X12 / EDIFACT payload (None for other payloads or malformed EDI)."""
+        if not looks_like_edi(data):
+            return None
+        try:
+            # Tokenizing a large batch is CPU work: keep it off the event loop
+            return await asyncio.to_thread(EDITokenizer().build_index, iter_chunks(data))
+        except EDIFormatError as e:
+            self.logger.warning(f"EDI payload could not be tokenized, stored without transaction index: {e}")
+            return None
+    
+    @staticmethod
+    def _upload_succeeded(result: Any) -> bool:
+        # FileStorageAbstraction.upload_file returns {"success": ...}; plain adapters a bool
+        return bool(result.get("success")) if isinstance(result, dict) else bool(result)
+    
+    @staticmethod
+    def _index_metadata(transaction_index: Optional[List[EDITransactionIndexEntry]]) -> Dict[str, Any]:
+        if transaction_index is None:
+            return {}
+        return {
+            "edi_standard": transaction_index[0].standard if transaction_index else None,
+            "transaction_count": len(transaction_index),
+            "transaction_index": [entry.to_dict() for entry in transaction_index]
+        }
+    
+    def shutdown(self) -> None:
+        """Stop the AS2 decryption processes (a later decryption starts a new pool)."""
+        if self._crypto_pool is not None:
+            self._crypto_pool.shutdown(wait=False, cancel_futures=True)
+            self._crypto_pool = None
+    
+    def _crypto_executor(self) -> Optional[Executor]:
+        """AS2 decryption pool; None runs decryption in the loop's default thread pool."""
+        if self.crypto_workers == 0:
+            return None
+        if self._crypto_pool is None:
+            # Never fork a process that already runs the event loop and client threads
+            self._crypto_pool = ProcessPoolExecutor(
+                max_workers=self.crypto_workers, mp_context=worker_process_context()
+            )
+        return self._crypto_pool
+    
+    def _drop_crypto_pool(self, pool: Optional[Executor]) -> None:
+        """Forget a broken pool (unless it was already replaced); _crypto_executor starts a new one."""
+        if pool is not None and pool is self._crypto_pool:
+            self.logger.warning("AS2 decryption pool broken (worker died); starting a new one for the next message")
+            self.shutdown()
     
     def _get_decryptor(self, partner_id: str) -> AS2Decryptor:
         """
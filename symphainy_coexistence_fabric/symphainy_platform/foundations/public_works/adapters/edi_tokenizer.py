@@ -0,0 +1,408 @@
+"""
+EDI Tokenizer - Streaming X12 / EDIFACT segment tokenizer (Layer 0)
+
+Turns a byte stream into segments and transaction sets without materializing the file:
+only the current partial segment (and, for iter_transactions, the current transaction)
+is held in memory, so large 837 / 835 batches are processed one transaction at a time.
+
+WHAT (Infrastructure Role): I split X12 and EDIFACT interchanges into segments and transactions
+HOW (Infrastructure Implementation): I detect delimiters from each ISA / UNA header (UNB alone uses
+                                     the EDIFACT defaults), scan chunks for the segment terminator
+                                     (honouring the EDIFACT release character), and record the byte
+                                     offsets of every ST..SE / UNH..UNT so a transaction can be
+                                     re-read later without tokenizing the whole file again
+
+Offsets are byte offsets into the stream as given (after AS2 decryption).
+"""
+
+from dataclasses import dataclass, field, asdict
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Union
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# ISA is fixed-width: 106 bytes up to and including the segment terminator
+_ISA_LENGTH = 106
+
+_WHITESPACE = b" \t\r\n"
+
+# (interchange header, interchange trailer, group header, group trailer, transaction header, transaction trailer)
+_ENVELOPES = {
+    "x12": ("ISA", "IEA", "GS", "GE", "ST", "SE"),
+    "edifact": ("UNB", "UNZ", "UNG", "UNE", "UNH", "UNT"),
+}
+
+
+class EDIFormatError(ValueError):
+    """Data is not an X12 or EDIFACT interchange (or its header is malformed)."""
+
+
+@dataclass(frozen=True)
+class EDIDelimiters:
+    """Delimiters of one interchange (one character each; release / repetition optional)."""
+    standard: str  # "x12" or "edifact"
+    element: str
+    component: str
+    segment: str
+    repetition: Optional[str] = None
+    release: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EDIDelimiters":
+        return cls(**data)
+
+
+EDIFACT_DEFAULT_DELIMITERS = EDIDelimiters(
+    standard="edifact", element="+", component=":", segment="'", repetition=None, release="?"
+)
+
+
+@dataclass
+class EDISegment:
+    """One segment: tag, data elements (elements[0] is the tag) and its byte span."""
+    tag: str
+    elements: List[str]
+    offset: int
+    end_offset: int
+
+    def element(self, index: int, default: str = "") -> str:
+        """Data element by position (1-based, as in the implementation guides)."""
+        return self.elements[index] if index < len(self.elements) else default
+
+
+@dataclass
+class EDITransactionIndexEntry:
+    """Where one transaction set sits in the stream, and the envelope it belongs to."""
+    standard: str
+    transaction_type: str
+    control_number: str
+    start_offset: int
+    end_offset: int
+    segment_count: int
+    interchange_control_number: Optional[str]
+    group_control_number: Optional[str]
+    delimiters: EDIDelimiters
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "delimiters": self.delimiters.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EDITransactionIndexEntry":
+        return cls(**{**data, "delimiters": EDIDelimiters.from_dict(data["delimiters"])})
+
+
+@dataclass
+class EDITransaction:
+    """One transaction set (ST..SE or UNH..UNT, inclusive) with its index entry."""
+    entry: EDITransactionIndexEntry
+    segments: List[EDISegment] = field(default_factory=list)
+
+
+def looks_like_edi(data: bytes) -> bool:
+    """Whether data starts (after whitespace) with an X12 or EDIFACT interchange header."""
+    head = bytes(data[:64]).lstrip(_WHITESPACE)
+    return head[:3] in (b"ISA", b"UNA", b"UNB")
+
+
+def iter_chunks(data: Union[bytes, bytearray, memoryview], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[memoryview]:
+    """In-memory bytes as chunks (views, no copies)."""
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        yield view[start:start + chunk_size]
+
+
+def iter_file_chunks(handle: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """A binary file object as chunks."""
+    while True:
+        chunk = handle.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def read_transaction(
+    source: Union[bytes, bytearray, memoryview, BinaryIO],
+    entry: EDITransactionIndexEntry,
+    encoding: str = "latin-1"
+) -> EDITransaction:
+    """
+    Re-read one transaction by its index entry (a slice or seek + read, then only its segments).
+
+    Args:
+        source: The same bytes the index was built from, or a seekable binary file of them
+        entry: Index entry from EDITokenizer.index / build_index
+        encoding: Text encoding of element values
+    """
+    length = entry.end_offset - entry.start_offset
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = memoryview(source)[entry.start_offset:entry.end_offset]
+    else:
+        source.seek(entry.start_offset)
+        data = source.read(length)
+    if len(data) != length:
+        raise EDIFormatError(f"Transaction {entry.control_number} is outside the data ({len(data)} of {length} bytes)")
+    tokenizer = EDITokenizer(delimiters=entry.delimiters, encoding=encoding)
+    segments = list(tokenizer.iter_segments([data], base_offset=entry.start_offset))
+    return EDITransaction(entry=entry, segments=segments)
+
+
+class EDITokenizer:
+    """
+    Streaming X12 / EDIFACT tokenizer.
+
+    Feed it chunks (iter_chunks / iter_file_chunks or any iterable of bytes); it yields
+    segments or whole transactions as soon as their terminator has been seen. Index
+    entries for the transactions produced so far accumulate in `index`.
+    """
+
+    def __init__(self, delimiters: Optional[EDIDelimiters] = None, encoding: str = "latin-1"):
+        """
+        Initialize tokenizer.
+
+        Args:
+            delimiters: Delimiters to start with (e.g. to re-read a transaction that has no
+                        header); each ISA / UNA / UNB header in the stream replaces them
+            encoding: Text encoding of element values (latin-1 maps every byte)
+        """
+        self.delimiters = delimiters
+        self.encoding = encoding
+        self.index: List[EDITransactionIndexEntry] = []
+
+    # ========================================================================
+    # SEGMENTS
+    # ========================================================================
+
+    def iter_segments(self, chunks: Iterable[bytes], base_offset: int = 0) -> Iterator[EDISegment]:
+        """
+        Yield segments as their terminators arrive.
+
+        Args:
+            chunks: The byte stream
+            base_offset: Offset of the stream's first byte (for offsets of re-read slices)
+
+        Raises:
+            EDIFormatError: If no delimiters are known and the stream has no interchange header
+        """
+        buffer = bytearray()
+        base = base_offset  # stream offset of buffer[0]
+        pos = 0  # start of the unconsumed part of buffer
+        scan_from = 0  # terminator search resumes here (bytes before it hold no terminator)
+        previous_tag: Optional[str] = None
+        chunks = iter(chunks)
+        at_eof = False
+        while not at_eof:
+            chunk = next(chunks, None)
+            if chunk is None:
+                at_eof = True
+            else:
+                buffer += chunk
+            while True:
+                while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                    pos += 1
+                scan_from = max(scan_from, pos)
+                if pos >= len(buffer):
+                    break
+                if scan_from == pos:
+                    header = self._header_length(buffer, pos, previous_tag, at_eof)
+                    if header is None:
+                        break  # header not complete yet
+                    if header:
+                        segment = self._header_segment(buffer, pos, header, base)
+                        if segment is not None:
+                            pos += header
+                            previous_tag = segment.tag
+                            yield segment
+                            continue
+                end = self._find_terminator(buffer, scan_from, pos)
+                if end == -1:
+                    if not at_eof:
+                        scan_from = len(buffer)
+                        break
+                    end = len(buffer)  # last segment without a terminator
+                    raw = bytes(buffer[pos:end])
+                    consumed = end
+                else:
+                    raw = bytes(buffer[pos:end])
+                    consumed = end + 1
+                segment = self._segment(raw, base + pos, base + consumed)
+                pos = consumed
+                scan_from = pos
+                previous_tag = segment.tag
+                yield segment
+            # Compact once per chunk (not per segment)
+            del buffer[:pos]
+            base += pos
+            scan_from -= pos
+            pos = 0
+
+    def components(self, value: str) -> List[str]:
+        """A composite element split into its components (current delimiters)."""
+        return self._split(value, self.delimiters.component)
+
+    # ========================================================================
+    # TRANSACTIONS
+    # ========================================================================
+
+    def iter_transactions(self, chunks: Iterable[bytes], keep_segments: bool = True) -> Iterator[EDITransaction]:
+        """
+        Yield transaction sets (ST..SE / UNH..UNT) one at a time, appending each to `index`.
+
+        Envelope segments (ISA / GS / UNB / ...) are not yielded; their control numbers are
+        on each transaction's index entry.
+
+        Args:
+            chunks: The byte stream
+            keep_segments: False to yield transactions without their segments (index only)
+        """
+        interchange_control: Optional[str] = None
+        group_control: Optional[str] = None
+        current: Optional[EDITransaction] = None
+        for segment in self.iter_segments(chunks):
+            envelope = _ENVELOPES.get(self.delimiters.standard if self.delimiters else "", ())
+            if not envelope:
+                continue
+            interchange_header, _, group_header, _, transaction_header, transaction_trailer = envelope
+            if segment.tag == interchange_header:
+                interchange_control = segment.element(13 if segment.tag == "ISA" else 5).strip() or None
+                group_control = None
+            elif segment.tag == group_header:
+                group_control = segment.element(6 if segment.tag == "GS" else 5).strip() or None
+            elif segment.tag == transaction_header:
+                if segment.tag == "ST":
+                    transaction_type, control_number = segment.element(1), segment.element(2)
+                else:
+                    transaction_type = self.components(segment.element(2))[0]
+                    control_number = segment.element(1)
+                current = EDITransaction(entry=EDITransactionIndexEntry(
+                    standard=self.delimiters.standard,
+                    transaction_type=transaction_type,
+                    control_number=control_number,
+                    start_offset=segment.offset,
+                    end_offset=segment.end_offset,
+                    segment_count=0,
+                    interchange_control_number=interchange_control,
+                    group_control_number=group_control,
+                    delimiters=self.delimiters
+                ))
+            if current is None:
+                continue
+            current.entry.segment_count += 1
+            current.entry.end_offset = segment.end_offset
+            if keep_segments:
+                current.segments.append(segment)
+            if segment.tag == transaction_trailer:
+                self.index.append(current.entry)
+                yield current
+                current = None
+        if current is not None:
+            raise EDIFormatError(
+                f"Transaction {current.entry.control_number} ({current.entry.transaction_type}) has no trailer"
+            )
+
+    def build_index(self, chunks: Iterable[bytes]) -> List[EDITransactionIndexEntry]:
+        """Tokenize the stream keeping only the transaction index."""
+        for _ in self.iter_transactions(chunks, keep_segments=False):
+            pass
+        return self.index
+
+    # ========================================================================
+    # INTERNALS
+    # ========================================================================
+
+    def _header_length(self, buffer: bytearray, pos: int, previous_tag: Optional[str], at_eof: bool) -> Optional[int]:
+        """Bytes needed to read an ISA / UNA header at pos (0 = no header here, None = wait for more)."""
+        if len(buffer) - pos < 3 and not at_eof:
+            return None
+        tag = bytes(buffer[pos:pos + 3])
+        if tag == b"ISA":
+            needed = _ISA_LENGTH
+        elif tag == b"UNA":
+            needed = 9
+        elif tag == b"UNB" and previous_tag != "UNA":
+            # No service string advice: this interchange uses the EDIFACT defaults
+            self.delimiters = EDIFACT_DEFAULT_DELIMITERS
+            return 0
+        else:
+            if self.delimiters is None:
+                raise EDIFormatError(f"Not an X12 or EDIFACT interchange (starts with {tag!r})")
+            return 0
+        if len(buffer) - pos < needed:
+            if at_eof:
+                raise EDIFormatError(f"Truncated {tag.decode()} header")
+            return None
+        return needed
+
+    def _header_segment(self, buffer: bytearray, pos: int, length: int, base: int) -> Optional[EDISegment]:
+        """Read delimiters from the ISA / UNA header at pos; UNA is returned as a segment, ISA as None
+        (it is then tokenized like any other segment with the new delimiters)."""
+        header = bytes(buffer[pos:pos + length]).decode("latin-1")
+        if header.startswith("UNA"):
+            component, element, _decimal, release, repetition, segment = header[3:9]
+            self.delimiters = EDIDelimiters(
+                standard="edifact",
+                element=element,
+                component=component,
+                segment=segment,
+                repetition=None if repetition == " " else repetition,
+                release=None if release == " " else release
+            )
+            return EDISegment(tag="UNA", elements=["UNA", header[3:9]], offset=base + pos, end_offset=base + pos + length)
+
+        element = header[3]
+        fields = header.split(element)
+        if len(fields) < 17 or len(fields[16]) < 2:
+            raise EDIFormatError("Malformed ISA header")
+        repetition = fields[11]
+        self.delimiters = EDIDelimiters(
+            standard="x12",
+            element=element,
+            component=fields[16][0],
+            segment=fields[16][1],
+            repetition=repetition if len(repetition) == 1 and not repetition.isalnum() else None
+        )
+        return None
+
+    def _find_terminator(self, buffer: bytearray, start: int, segment_start: int) -> int:
+        """First unescaped terminator at or after start (escapes are counted back to segment_start)."""
+        terminator = ord(self.delimiters.segment)
+        release = ord(self.delimiters.release) if self.delimiters.release else None
+        index = buffer.find(terminator, start)
+        while index != -1 and release is not None:
+            escapes = 0
+            while index - escapes - 1 >= segment_start and buffer[index - escapes - 1] == release:
+                escapes += 1
+            if escapes % 2 == 0:
+                break
+            index = buffer.find(terminator, index + 1)
+        return index
+
+    def _segment(self, raw: bytes, offset: int, end_offset: int) -> EDISegment:
+        elements = self._split(raw.decode(self.encoding), self.delimiters.element)
+        return EDISegment(tag=elements[0].strip(), elements=elements, offset=offset, end_offset=end_offset)
+
+    def _split(self, text: str, separator: str) -> List[str]:
+        """Split on separator, removing release characters; an escaped component separator inside
+        an element keeps its release character so components() can still tell it apart."""
+        release = self.delimiters.release
+        if release is None or release not in text:
+            return text.split(separator)
+        parts: List[str] = []
+        current: List[str] = []
+        escaped = False
+        for char in text:
+            if escaped:
+                if char == self.delimiters.component and separator != char:
+                    current.append(release)
+                current.append(char)
+                escaped = False
+            elif char == release:
+                escaped = True
+            elif char == separator:
+                parts.append("".join(current))
+                current = []
+            else:
+                current.append(char)
+        parts.append("".join(current))
+        return parts
@@ -12,6 +12,8 @@ import logging
 from typing import Dict, Any, Optional
 import io
 
+from utilities import lazy_import, module_available
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,22 +30,19 @@ class ExcelProcessingAdapter:
         self.pandas_available = False
         self.openpyxl_available = False
         
-        # Try to import pandas
-        try:
-            import pandas as pd
-            self.pandas = pd
+        # pandas/openpyxl are heavy; check availability now, import on first parse
+        if module_available("pandas"):
+            self.pandas = lazy_import("pandas")
             self.pandas_available = True
             self.logger.info("✅ Pandas available for Excel parsing")
-        except ImportError:
+        else:
             self.logger.warning("⚠️ Pandas not available, will try openpyxl")
         
-        # Try to import openpyxl
-        try:
-            import openpyxl
-            self.openpyxl = openpyxl
+        if module_available("openpyxl"):
+            self.openpyxl = lazy_import("openpyxl")
             self.openpyxl_available = True
             self.logger.info("✅ Openpyxl available for Excel parsing")
-        except ImportError:
+        else:
             self.logger.warning("⚠️ Openpyxl not available")
         
         if not self.pandas_available and not self.openpyxl_available:
@@ -10,9 +10,18 @@ HOW (Infrastructure Implementation): I use real HuggingFace Inference Endpoints
 """
 
 import os
+import asyncio
 import httpx
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Union
+
+from ..embedding_cache import EmbeddingCache
+from ..embedding_engine import (
+    EmbeddingEngine,
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_WAIT_MS,
+    DEFAULT_MAX_IN_FLIGHT,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +34,16 @@ class HuggingFaceAdapter:
     without any business logic or abstraction. It's the raw technology layer.
     """
     
-    def __init__(self, endpoint_url: str = None, api_key: str = None, config_adapter = None):
+    def __init__(
+        self,
+        endpoint_url: str = None,
+        api_key: str = None,
+        config_adapter = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        embedding_cache: Optional[EmbeddingCache] = None
+    ):
         """
         Initialize HuggingFace adapter.
         
@@ -33,6 +51,10 @@ class HuggingFaceAdapter:
             endpoint_url: HuggingFace Inference Endpoint URL (takes precedence)
             api_key: HuggingFace API key/token (takes precedence)
             config_adapter: ConfigAdapter for reading configuration (REQUIRED if parameters not provided)
+            max_batch_size: Maximum texts per embedding request
+            max_wait_ms: Longest an embedding request waits for its batch to fill
+            max_in_flight: Maximum concurrent embedding requests to the endpoint
+            embedding_cache: Optional two-tier cache consulted before the provider
         
         Raises:
             ValueError: If required configuration is missing
@@ -86,8 +108,48 @@ class HuggingFaceAdapter:
                 "Example: HuggingFaceAdapter(config_adapter=config_adapter)"
             )
         
+        # Keep-alive client, created on first request (bound to the running event loop)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._max_connections = max(max_in_flight, 1) * 2
+        
+        # Concurrent generate_embedding() calls are coalesced into batched inference requests
+        self.embedding_engine = EmbeddingEngine(
+            provider="huggingface",
+            embed_batch=self.generate_embeddings_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            max_in_flight=max_in_flight,
+            cache=embedding_cache
+        )
+        
         logger.info(f"✅ HuggingFace adapter initialized for endpoint: {self.endpoint_url[:50]}...")
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled keep-alive client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=120.0,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections
+                )
+            )
+            self._client_loop = loop
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Flush queued embeddings and close the pooled HTTP client."""
+        await self.embedding_engine.flush()
+        if self._client is not None and not self._client.is_closed:
+            try:
+                await self._client.aclose()
+            except RuntimeError as e:
+                # Client belongs to an event loop that has already closed
+                logger.debug(f"HuggingFace client close skipped: {e}")
+        self._client = None
+    
     async def generate_embedding(
         self,
         text: str,
@@ -100,17 +162,44 @@ class HuggingFaceAdapter:
             text: Text to generate embedding for
             model: Model name (for reference, endpoint is already configured)
         
+        Concurrent calls are sent together as one batched request.
+        
         Returns:
             Dict with embedding and metadata
         """
-        return await self.inference(
-            inputs=text,
-            model=model
-        )
+        embedding = await self.embedding_engine.embed(text, model)
+        return {
+            "embedding": embedding,
+            "model": model,
+            "dimension": len(embedding)
+        }
+    
+    async def generate_embeddings_batch(
+        self,
+        texts: List[str],
+        model: str = "sentence-transformers/all-mpnet-base-v2"
+    ) -> List[List[float]]:
+        """
+        Generate embeddings for several texts in one endpoint request.
+        
+        Args:
+            texts: Texts to generate embeddings for
+            model: Model name (for reference, endpoint is already configured)
+        
+        Returns:
+            One embedding per text, in order
+        """
+        result = await self.inference(inputs=list(texts), model=model)
+        embeddings = result.get("embedding", [])
+        if len(embeddings) != len(texts):
+            raise RuntimeError(
+                f"HF endpoint returned {len(embeddings)} embeddings for {len(texts)} inputs"
+            )
+        return embeddings
     
     async def inference(
         self,
-        inputs: str,
+        inputs: Union[str, List[str]],
         model: str = "sentence-transformers/all-mpnet-base-v2",
         **kwargs
     ) -> Dict[str, Any]:
@@ -118,7 +207,7 @@ class HuggingFaceAdapter:
         Call HuggingFace Inference Endpoint.
         
         Args:
-            inputs: Input text/data
+            inputs: Input text/data, or a list of texts (embedding is then one vector per text)
             model: Model name (for reference)
             **kwargs: Additional parameters
         
@@ -136,28 +225,36 @@ class HuggingFaceAdapter:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
-                    self.endpoint_url,
-                    json=payload,
-                    headers=headers
-                )
-                response.raise_for_status()
-                result = response.json()
-                
-                # Handle different response formats
-                if isinstance(result, list) and len(result) > 0:
-                    embedding = result[0] if isinstance(result[0], list) else result
-                elif isinstance(result, dict) and "embedding" in result:
-                    embedding = result["embedding"]
-                else:
-                    embedding = result
-                
+            response = await self._get_client().post(
+                self.endpoint_url,
+                json=payload,
+                headers=headers
+            )
+            response.raise_for_status()
+            result = response.json()
+            
+            if isinstance(inputs, list):
+                # Batched inputs: one vector per input
+                embeddings = result.get("embeddings", result.get("embedding", [])) if isinstance(result, dict) else result
                 return {
-                    "embedding": embedding if isinstance(embedding, list) else [embedding],
+                    "embedding": embeddings,
                     "model": model,
-                    "dimension": len(embedding) if isinstance(embedding, list) else 1
+                    "dimension": len(embeddings[0]) if embeddings and isinstance(embeddings[0], list) else 0
                 }
+            
+            # Handle different response formats
+            if isinstance(result, list) and len(result) > 0:
+                embedding = result[0] if isinstance(result[0], list) else result
+            elif isinstance(result, dict) and "embedding" in result:
+                embedding = result["embedding"]
+            else:
+                embedding = result
+            
+            return {
+                "embedding": embedding if isinstance(embedding, list) else [embedding],
+                "model": model,
+                "dimension": len(embedding) if isinstance(embedding, list) else 1
+            }
         
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 503:
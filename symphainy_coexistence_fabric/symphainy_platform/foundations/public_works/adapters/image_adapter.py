@@ -12,6 +12,8 @@ import logging
 from typing import Dict, Any, Optional
 import io
 
+from utilities import lazy_import, module_available
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,22 +30,20 @@ class ImageProcessingAdapter:
         self.pytesseract_available = False
         self.pil_available = False
         
-        # Try to import pytesseract
-        try:
-            import pytesseract
-            self.pytesseract = pytesseract
+        # pytesseract and PIL are imported on first OCR call
+        if module_available("pytesseract"):
+            self.pytesseract = lazy_import("pytesseract")
             self.pytesseract_available = True
             self.logger.info("✅ Pytesseract available for OCR")
-        except ImportError:
+        else:
             self.logger.warning("⚠️ Pytesseract not available - OCR will not work")
         
-        # Try to import PIL/Pillow (required for image processing)
-        try:
-            from PIL import Image
-            self.Image = Image
+        # PIL/Pillow (required for image processing)
+        if module_available("PIL.Image"):
+            self.Image = lazy_import("PIL.Image")
             self.pil_available = True
             self.logger.info("✅ PIL/Pillow available for image processing")
-        except ImportError:
+        else:
             self.logger.warning("⚠️ PIL/Pillow not available - OCR will not work")
         
         if not self.pytesseract_available or not self.pil_available:
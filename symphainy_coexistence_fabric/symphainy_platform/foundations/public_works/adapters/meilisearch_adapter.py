@@ -6,10 +6,16 @@ This is the raw technology layer for Meilisearch operations.
 
 WHAT (Infrastructure Role): I provide raw Meilisearch client operations
 HOW (Infrastructure Implementation): I use real Meilisearch client with no business logic
+
+Searches also have non-blocking variants (asearch / asearch_with_facets) that call the
+Meilisearch HTTP API on a pooled keep-alive client, so search latency does not tie up
+a worker thread and can overlap with other I/O.
 """
 
 import asyncio
 from typing import Dict, Any, Optional, List
+
+import httpx
 from meilisearch import Client as MeilisearchClient
 from meilisearch.errors import MeilisearchError
 
@@ -39,6 +45,10 @@ class MeilisearchAdapter:
         self._client: Optional[MeilisearchClient] = None
         self.logger = get_logger(self.__class__.__name__)
         self.base_url = f"http://{host}:{port}"
+        
+        # Keep-alive client for the async search API, created on first use (bound to the running event loop)
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
     
     def connect(self) -> bool:
         """Connect to Meilisearch."""
@@ -59,6 +69,30 @@ class MeilisearchAdapter:
         """Disconnect from Meilisearch."""
         self._client = None
     
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Return the pooled keep-alive client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client.is_closed or self._async_client_loop is not loop:
+            headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+            self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=headers,
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+            )
+            self._async_client_loop = loop
+        return self._async_client
+    
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP client."""
+        if self._async_client is not None and not self._async_client.is_closed:
+            try:
+                await self._async_client.aclose()
+            except RuntimeError as e:
+                # Client belongs to an event loop that has already closed
+                self.logger.debug(f"Meilisearch async client close skipped: {e}")
+        self._async_client = None
+    
     # ============================================================================
     # RAW INDEX OPERATIONS
     # ============================================================================
@@ -231,6 +265,58 @@ class MeilisearchAdapter:
             self.logger.error(f"Meilisearch faceted search error: {e}")
             return {"hits": [], "estimatedTotalHits": 0, "facetDistribution": {}}
     
+    async def asearch(
+        self,
+        index_name: str,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 20,
+        offset: int = 0,
+        attributes_to_retrieve: Optional[List[str]] = None,
+        attributes_to_crop: Optional[List[str]] = None,
+        crop_length: int = 200
+    ) -> Dict[str, Any]:
+        """
+        Raw Meilisearch search without blocking the event loop - no business logic.
+        
+        Same arguments and result shape as search().
+        
+        Raises:
+            httpx.HTTPError: Meilisearch unreachable or the search rejected (not an empty result)
+        """
+        if self._client is None:
+            return {"hits": [], "estimatedTotalHits": 0}
+        
+        search_params: Dict[str, Any] = {"q": query, "limit": limit, "offset": offset}
+        if filters:
+            search_params["filter"] = self._build_filter_string(filters)
+        if attributes_to_retrieve:
+            search_params["attributesToRetrieve"] = attributes_to_retrieve
+        if attributes_to_crop:
+            search_params["attributesToCrop"] = attributes_to_crop
+            search_params["cropLength"] = crop_length
+        
+        return await self._post_search(index_name, search_params)
+    
+    async def asearch_with_facets(
+        self,
+        index_name: str,
+        query: str,
+        facets: List[str],
+        limit: int = 20
+    ) -> Dict[str, Any]:
+        """Raw faceted search without blocking the event loop (httpx.HTTPError propagates) - no business logic."""
+        if self._client is None:
+            return {"hits": [], "estimatedTotalHits": 0, "facetDistribution": {}}
+        
+        return await self._post_search(index_name, {"q": query, "limit": limit, "facets": facets})
+    
+    async def _post_search(self, index_name: str, search_params: Dict[str, Any]) -> Dict[str, Any]:
+        """POST /indexes/{index}/search and return the decoded response."""
+        response = await self._get_async_client().post(f"/indexes/{index_name}/search", json=search_params)
+        response.raise_for_status()
+        return response.json()
+    
     # ============================================================================
     # UTILITY METHODS
     # ============================================================================
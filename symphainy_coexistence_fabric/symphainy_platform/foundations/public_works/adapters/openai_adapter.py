@@ -15,6 +15,15 @@ import os
 import json
 import logging
 
+from ..embedding_cache import EmbeddingCache
+from ..embedding_engine import (
+    EmbeddingEngine,
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_WAIT_MS,
+    DEFAULT_MAX_IN_FLIGHT,
+)
+from ..llm_gateway import ProviderRateLimitError, parse_rate_limit_headers
+
 try:
     from openai import AsyncOpenAI
     try:
@@ -36,7 +45,17 @@ logger = logging.getLogger(__name__)
 class OpenAIAdapter:
     """Raw OpenAI adapter for LLM operations."""
     
-    def __init__(self, api_key: str = None, base_url: str = None, config_adapter = None, **kwargs):
+    def __init__(
+        self,
+        api_key: str = None,
+        base_url: str = None,
+        config_adapter = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        **kwargs
+    ):
         """
         Initialize OpenAI adapter.
         
@@ -44,6 +63,10 @@ class OpenAIAdapter:
             api_key: OpenAI API key (takes precedence)
             base_url: OpenAI base URL (for custom endpoints)
             config_adapter: ConfigAdapter for reading configuration (REQUIRED if api_key not provided)
+            max_batch_size: Maximum texts per embeddings API call
+            max_wait_ms: Longest an embedding request waits for its batch to fill
+            max_in_flight: Maximum concurrent embeddings API calls
+            embedding_cache: Optional two-tier cache consulted before the provider
         
         Raises:
             ValueError: If neither api_key nor config_adapter is provided
@@ -82,6 +105,17 @@ class OpenAIAdapter:
         
         # OpenAI client (private - use wrapper methods instead)
         self._client = None
+        self._completion_client = None
+        
+        # Concurrent generate_embeddings() calls are coalesced into batched API calls
+        self.embedding_engine = EmbeddingEngine(
+            provider="openai",
+            embed_batch=self.generate_embeddings_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            max_in_flight=max_in_flight,
+            cache=embedding_cache
+        )
         
         # Initialize OpenAI client
         self._initialize_client()
@@ -98,9 +132,13 @@ class OpenAIAdapter:
                 base_url=self.base_url
             )
             self.client = self._client
+            # Completions run behind LLMGateway, which owns 429 backoff and the
+            # AIMD rate scale; SDK retries would sleep while holding a gateway slot.
+            self._completion_client = self._client.with_options(max_retries=0)
             self.logger.info("✅ OpenAI adapter initialized")
         except Exception as e:
             self._client = None
+            self._completion_client = None
             self.client = None
             raise RuntimeError(
                 f"OpenAI client initialization failed: {e}. Check API key and network."
@@ -110,13 +148,17 @@ class OpenAIAdapter:
         """
         Generate completion using OpenAI.
         Fails fast: raises if client is not initialized or API call fails.
+        
+        The result carries the provider's rate-limit headers under "rate_limit"
+        (see parse_rate_limit_headers); HTTP 429 raises ProviderRateLimitError.
         """
         if not self._client:
             raise RuntimeError(
                 "OpenAI client not initialized. Check LLM configuration (e.g. openai_api_key) and that the OpenAI SDK is installed."
             )
         try:
-            response = await self._client.chat.completions.create(**request)
+            raw = await self._completion_client.chat.completions.with_raw_response.create(**request)
+            response = raw.parse()
             return {
                 "id": response.id,
                 "choices": [
@@ -135,9 +177,19 @@ class OpenAIAdapter:
                     "total_tokens": response.usage.total_tokens
                 },
                 "model": response.model,
-                "created": response.created
+                "created": response.created,
+                "rate_limit": parse_rate_limit_headers(raw.headers)
             }
         except Exception as e:
+            if getattr(e, "status_code", None) == 429:
+                headers = getattr(getattr(e, "response", None), "headers", None)
+                limits = parse_rate_limit_headers(headers)
+                self.logger.warning(f"OpenAI rate limit hit: {e}")
+                raise ProviderRateLimitError(
+                    f"OpenAI rate limit: {e}",
+                    retry_after=limits.get("retry_after_seconds"),
+                    limits=limits
+                ) from e
             self.logger.error(f"OpenAI completion failed: {e}")
             raise RuntimeError(
                 f"OpenAI API request failed: {e}. Check API key, network, and model availability."
@@ -146,7 +198,27 @@ class OpenAIAdapter:
     async def generate_embeddings(self, text: str, model: str = "text-embedding-ada-002") -> List[float]:
         """
         Generate embeddings using OpenAI.
+        
+        Concurrent calls are sent together as one batched embeddings request.
+        Fails fast: raises if client is not initialized or API call fails.
+        """
+        if not self._client:
+            raise RuntimeError(
+                "OpenAI client not initialized. Check LLM configuration (e.g. openai_api_key) and that the OpenAI SDK is installed."
+            )
+        return await self.embedding_engine.embed(text, model)
+    
+    async def generate_embeddings_batch(
+        self,
+        texts: List[str],
+        model: str = "text-embedding-ada-002"
+    ) -> List[List[float]]:
+        """
+        Generate embeddings for several texts in one API call.
         Fails fast: raises if client is not initialized or API call fails.
+        
+        Returns:
+            One embedding per text, in order
         """
         if not self._client:
             raise RuntimeError(
@@ -154,13 +226,15 @@ class OpenAIAdapter:
             )
         try:
             response = await self._client.embeddings.create(
-                input=text,
+                input=list(texts),
                 model=model
             )
-            if not response.data:
-                raise RuntimeError("OpenAI returned no embedding data; check API response.")
-            embeddings = response.data[0].embedding
-            self.logger.info(f"✅ Embeddings generated for text (length: {len(text)})")
+            if not response.data or len(response.data) != len(texts):
+                raise RuntimeError(
+                    f"OpenAI returned {len(response.data or [])} embeddings for {len(texts)} inputs; check API response."
+                )
+            embeddings = [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+            self.logger.info(f"✅ Embeddings generated for {len(texts)} texts")
             return embeddings
         except Exception as e:
             self.logger.error(f"Failed to generate embeddings: {e}")
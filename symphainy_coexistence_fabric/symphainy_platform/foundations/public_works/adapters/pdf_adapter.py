@@ -5,60 +5,230 @@ Raw technology client for PDF file parsing.
 Uses pdfplumber or PyPDF2 for parsing.
 
 WHAT (Infrastructure): I provide PDF parsing capabilities
-HOW (Adapter): I use pdfplumber/PyPDF2 to parse PDF files
+HOW (Adapter): I use pdfplumber/PyPDF2 to parse PDF files; pdfplumber pages are extracted off the
+               event loop, in page ranges spread over a process pool, and streamed back as they
+               complete; extracted pages are cached by document hash and page index
+
+Small documents (fewer than parallel_min_pages pages) and max_workers=0 use one worker thread,
+which still keeps extraction off the event loop without paying for process start-up. Pool
+processes are started with forkserver (spawn where unavailable, see
+utilities.worker_process_context): forking once the event loop and client threads exist can
+deadlock. A pool broken by a dead worker is dropped and rebuilt
+on the next parse.
 """
 
-import logging
-from typing import Dict, Any, Optional
+import asyncio
+import hashlib
 import io
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from utilities import lazy_import, module_available, worker_process_context
 
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_MAX_WORKERS = 4
+
+DEFAULT_PAGES_PER_TASK = 8
+
+DEFAULT_PAGE_CACHE_ENTRIES = 5000
+
+DEFAULT_PARALLEL_MIN_PAGES = 16
+
+WORKER_NICENESS = 10
+
+# A worker's open document is closed once no page range of it has run for this long
+DOCUMENT_IDLE_CLOSE_SECONDS = 1.0
+
+# Per worker thread (in a pool process or the loop's thread pool): the document opened last,
+# reused by its later page ranges, with the timer that closes it once idle
+_worker_documents: Dict[int, Dict[str, Any]] = {}
+_worker_documents_lock = threading.Lock()
+
+
+def _pdfplumber_page_count(path: str) -> int:
+    """Number of pages in the PDF at path."""
+    import pdfplumber
+    with pdfplumber.open(path) as pdf:
+        return len(pdf.pages)
+
+
+def _table_records(page_number: int, page_tables: List[List[List[Any]]]) -> List[Dict[str, Any]]:
+    tables = []
+    for table_idx, table in enumerate(page_tables):
+        if table:
+            headers = table[0]
+            rows = table[1:]
+            tables.append({
+                "page": page_number,
+                "table_index": table_idx,
+                "headers": headers,
+                "rows": rows,
+                "row_count": len(rows),
+                "column_count": len(headers) if headers else 0
+            })
+    return tables
+
+
+def _open_for_worker(path: str) -> Any:
+    """
+    The pdfplumber document at path, kept open for this worker's next page range.
+
+    Opening parses the page tree (~0.15s for 500 pages), so a worker opens each document
+    once rather than once per task. Keyed by inode, size and mtime as well as path, since
+    temporary file names can be reused. At most one document stays open per worker; it is
+    closed when the worker moves to another document, or DOCUMENT_IDLE_CLOSE_SECONDS after
+    the worker's last page range of it (_release_for_worker), so a finished parse does not
+    keep its parsed document, file descriptor and deleted temp file alive.
+    """
+    import pdfplumber
+    stat = os.stat(path)
+    key = (path, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    with _worker_documents_lock:
+        current = _worker_documents.pop(threading.get_ident(), None)
+        if current is not None:
+            if current["timer"] is not None:
+                current["timer"].cancel()
+            if current["key"] == key:
+                current["timer"] = None
+                _worker_documents[threading.get_ident()] = current
+                return current["pdf"]
+            current["pdf"].close()
+    pdf = pdfplumber.open(path)
+    with _worker_documents_lock:
+        _worker_documents[threading.get_ident()] = {"key": key, "pdf": pdf, "timer": None}
+    return pdf
+
+
+def _release_for_worker() -> None:
+    """End of a page range: close this worker's document unless another range of it starts soon."""
+    with _worker_documents_lock:
+        current = _worker_documents.get(threading.get_ident())
+        if current is None:
+            return
+        timer = threading.Timer(DOCUMENT_IDLE_CLOSE_SECONDS, _close_idle_document, (threading.get_ident(), current))
+        timer.daemon = True
+        current["timer"] = timer
+        timer.start()
+
+
+def _close_idle_document(worker: int, entry: Dict[str, Any]) -> None:
+    with _worker_documents_lock:
+        # A range that reopened the document in the meantime cleared (or replaced) the timer
+        if _worker_documents.get(worker) is not entry or entry["timer"] is not threading.current_thread():
+            return
+        del _worker_documents[worker]
+    entry["pdf"].close()
+
+
+def _pdfplumber_extract_pages(path: str, page_numbers: List[int]) -> List[Dict[str, Any]]:
+    """
+    Extract text and tables of some pages (runs in a pool worker; 1-based page numbers).
+
+    Returns:
+        One {"page", "text", "tables"} per page, in page_numbers order
+    """
+    pdf = _open_for_worker(path)
+    pages = []
+    try:
+        for page_number in page_numbers:
+            page = pdf.pages[page_number - 1]
+            pages.append({
+                "page": page_number,
+                "text": page.extract_text() or "",
+                "tables": _table_records(page_number, page.extract_tables())
+            })
+            page.close()  # drops the page's parsed layout objects
+    finally:
+        _release_for_worker()
+    return pages
+
+
+def _init_worker() -> None:
+    """Pool worker start-up: extraction yields the CPU to the event loop's process."""
+    try:
+        os.nice(WORKER_NICENESS)
+    except (AttributeError, OSError):
+        pass
+
+
 class PdfProcessingAdapter:
     """
     Adapter for PDF file parsing.
-    
+
     Uses pdfplumber (preferred) or PyPDF2 for parsing PDF files.
     """
-    
-    def __init__(self):
-        """Initialize PDF Processing Adapter."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        pages_per_task: int = DEFAULT_PAGES_PER_TASK,
+        page_cache_entries: int = DEFAULT_PAGE_CACHE_ENTRIES,
+        parallel_min_pages: int = DEFAULT_PARALLEL_MIN_PAGES,
+        page_counter: Callable[[str], int] = _pdfplumber_page_count,
+        page_extractor: Callable[[str, List[int]], List[Dict[str, Any]]] = _pdfplumber_extract_pages
+    ):
+        """
+        Initialize PDF Processing Adapter.
+
+        Args:
+            max_workers: Extraction processes (0 = extract in one worker thread, no process pool)
+            pages_per_task: Pages extracted per pool task (the unit streamed back)
+            page_cache_entries: Extracted pages kept in the page cache (0 disables it)
+            parallel_min_pages: Smaller documents are extracted in a worker thread
+            page_counter: Module-level function (path) -> page count; runs in a worker thread
+            page_extractor: Module-level function (path, page numbers) -> page records; must be
+                            picklable, it runs in the pool processes
+        """
         self.logger = logger
         self.pdfplumber_available = False
         self.pypdf2_available = False
-        
-        # Try to import pdfplumber (preferred - better table extraction)
-        try:
-            import pdfplumber
-            self.pdfplumber = pdfplumber
+        self.max_workers = max(0, max_workers)
+        self.pages_per_task = max(1, pages_per_task)
+        self.page_cache_entries = max(0, page_cache_entries)
+        self.parallel_min_pages = parallel_min_pages
+        self._page_counter = page_counter
+        self._page_extractor = page_extractor
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._page_cache: "OrderedDict[Tuple[str, int], Dict[str, Any]]" = OrderedDict()
+        self._stats = {"documents": 0, "pages_extracted": 0, "page_cache_hits": 0, "pool_tasks": 0}
+
+        # pdfplumber (preferred - better table extraction); imported on first parse
+        if module_available("pdfplumber"):
+            self.pdfplumber = lazy_import("pdfplumber")
             self.pdfplumber_available = True
             self.logger.info("✅ Pdfplumber available for PDF parsing")
-        except ImportError:
+        else:
             self.logger.warning("⚠️ Pdfplumber not available, will try PyPDF2")
-        
-        # Try to import PyPDF2 (fallback)
-        try:
-            import PyPDF2
-            self.PyPDF2 = PyPDF2
+
+        # PyPDF2 (fallback)
+        if module_available("PyPDF2"):
+            self.PyPDF2 = lazy_import("PyPDF2")
             self.pypdf2_available = True
             self.logger.info("✅ PyPDF2 available for PDF parsing")
-        except ImportError:
+        else:
             self.logger.warning("⚠️ PyPDF2 not available")
-        
+
         if not self.pdfplumber_available and not self.pypdf2_available:
             self.logger.warning("⚠️ Neither pdfplumber nor PyPDF2 available - PDF parsing will be limited")
-        
+
         self.logger.info("✅ PDF Processing Adapter initialized")
-    
+
     async def parse_file(self, file_data: bytes, filename: str) -> Dict[str, Any]:
         """
         Parse PDF file from bytes.
-        
+
         Args:
             file_data: PDF file content as bytes
             filename: Original filename (for logging)
-        
+
         Returns:
             Dict with parsed data:
             {
@@ -73,11 +243,11 @@ class PdfProcessingAdapter:
             # Use pdfplumber if available (preferred - better table extraction)
             if self.pdfplumber_available:
                 return await self._parse_with_pdfplumber(file_data, filename)
-            
+
             # Fallback to PyPDF2
             if self.pypdf2_available:
                 return await self._parse_with_pypdf2(file_data, filename)
-            
+
             # No library available - return error
             return {
                 "success": False,
@@ -86,7 +256,7 @@ class PdfProcessingAdapter:
                 "tables": [],
                 "metadata": {}
             }
-        
+
         except Exception as e:
             self.logger.error(f"❌ PDF parsing failed: {e}", exc_info=True)
             return {
@@ -96,96 +266,184 @@ class PdfProcessingAdapter:
                 "tables": [],
                 "metadata": {}
             }
-    
+
+    async def iter_pages(self, file_data: bytes, filename: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Extract pages with pdfplumber, yielding each page as soon as it is available.
+
+        Cached pages come first; the rest arrive in completion order, not page order. Lets
+        callers process (or persist) a large PDF without holding every page at once.
+
+        Args:
+            file_data: PDF file content as bytes
+            filename: Original filename (for logging)
+
+        Yields:
+            {"page": int (1-based), "text": str, "tables": List[Dict], "page_count": int, "cached": bool}
+        """
+        document_hash = hashlib.sha256(file_data).hexdigest()
+        self._stats["documents"] += 1
+
+        # Workers open the document by path: written once, instead of pickled into every task
+        fd, path = tempfile.mkstemp(suffix=".pdf")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(file_data)
+            loop = asyncio.get_running_loop()
+            page_count = await loop.run_in_executor(None, self._page_counter, path)
+
+            missing = []
+            for page_number in range(1, page_count + 1):
+                cached = self._cache_get(document_hash, page_number)
+                if cached is None:
+                    missing.append(page_number)
+                else:
+                    self._stats["page_cache_hits"] += 1
+                    yield {**cached, "page_count": page_count, "cached": True}
+
+            if missing:
+                executor = self._executor(page_count)
+                step = self.pages_per_task if executor is not None else len(missing)
+                tasks = []
+                try:
+                    for i in range(0, len(missing), step):
+                        tasks.append(loop.run_in_executor(executor, self._page_extractor, path, missing[i:i + step]))
+                    self._stats["pool_tasks"] += len(tasks) if executor is not None else 0
+                    for next_done in asyncio.as_completed(tasks):
+                        for page in await next_done:
+                            self._stats["pages_extracted"] += 1
+                            self._cache_put(document_hash, page)
+                            yield {**page, "page_count": page_count, "cached": False}
+                except BrokenProcessPool:
+                    # A worker died (e.g. killed for memory on a hostile PDF): this parse fails,
+                    # the next one gets a new pool
+                    self._drop_pool(executor)
+                    raise
+                finally:
+                    for task in tasks:
+                        task.cancel()  # consumer stopped early: drop ranges not yet started
+                    await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            os.unlink(path)
+        self.logger.debug(f"Extracted {filename}: {page_count} pages ({len(missing)} not cached)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Documents, extracted pages, page cache hits and pool tasks since start-up."""
+        return {**self._stats, "page_cache_entries": len(self._page_cache), "max_workers": self.max_workers}
+
+    def shutdown(self) -> None:
+        """Stop the extraction processes (a later parse starts a new pool)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _executor(self, page_count: int) -> Optional[Executor]:
+        """Process pool for large documents; None runs in the loop's default thread pool."""
+        if self.max_workers == 0 or page_count < self.parallel_min_pages:
+            return None
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=worker_process_context(), initializer=_init_worker
+            )
+        return self._pool
+
+    def _drop_pool(self, pool: Optional[Executor]) -> None:
+        """Forget a broken pool (unless it was already replaced); _executor starts a new one."""
+        if pool is not None and pool is self._pool:
+            self.logger.warning("PDF extraction pool broken (worker died); starting a new one for the next parse")
+            self.shutdown()
+
+    def _cache_get(self, document_hash: str, page_number: int) -> Optional[Dict[str, Any]]:
+        key = (document_hash, page_number)
+        page = self._page_cache.get(key)
+        if page is not None:
+            self._page_cache.move_to_end(key)
+        return page
+
+    def _cache_put(self, document_hash: str, page: Dict[str, Any]) -> None:
+        if self.page_cache_entries == 0:
+            return
+        self._page_cache[(document_hash, page["page"])] = page
+        self._page_cache.move_to_end((document_hash, page["page"]))
+        while len(self._page_cache) > self.page_cache_entries:
+            self._page_cache.popitem(last=False)
+
     async def _parse_with_pdfplumber(self, file_data: bytes, filename: str) -> Dict[str, Any]:
-        """Parse PDF file using pdfplumber."""
+        """Parse PDF file using pdfplumber (pages streamed in from iter_pages)."""
         try:
-            pdf_file = io.BytesIO(file_data)
-            
-            text_parts = []
-            tables = []
+            page_texts: Dict[int, str] = {}
+            page_tables: Dict[int, List[Dict[str, Any]]] = {}
             page_count = 0
-            
-            with self.pdfplumber.open(pdf_file) as pdf:
-                page_count = len(pdf.pages)
-                
-                for page_num, page in enumerate(pdf.pages, 1):
-                    # Extract text
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(f"--- Page {page_num} ---\n{page_text}")
-                    
-                    # Extract tables
-                    page_tables = page.extract_tables()
-                    for table_idx, table in enumerate(page_tables):
-                        if table:
-                            # Convert table to structured format
-                            if len(table) > 0:
-                                headers = table[0] if table else []
-                                rows = table[1:] if len(table) > 1 else []
-                                
-                                tables.append({
-                                    "page": page_num,
-                                    "table_index": table_idx,
-                                    "headers": headers,
-                                    "rows": rows,
-                                    "row_count": len(rows),
-                                    "column_count": len(headers) if headers else 0
-                                })
-            
-            full_text = "\n\n".join(text_parts)
-            
+            cached_pages = 0
+
+            async for page in self.iter_pages(file_data, filename):
+                page_count = page["page_count"]
+                cached_pages += page["cached"]
+                if page["text"]:
+                    page_texts[page["page"]] = page["text"]
+                if page["tables"]:
+                    page_tables[page["page"]] = page["tables"]
+
+            full_text = "\n\n".join(
+                f"--- Page {page_num} ---\n{page_texts[page_num]}" for page_num in sorted(page_texts)
+            )
+            tables = [table for page_num in sorted(page_tables) for table in page_tables[page_num]]
+
             metadata = {
                 "type": "pdf",
                 "page_count": page_count,
                 "table_count": len(tables),
                 "filename": filename,
-                "size": len(file_data)
+                "size": len(file_data),
+                "cached_pages": cached_pages
             }
-            
+
             return {
                 "success": True,
                 "text": full_text,
                 "tables": tables,
                 "metadata": metadata
             }
-        
+
         except Exception as e:
             self.logger.error(f"❌ Pdfplumber PDF parsing failed: {e}", exc_info=True)
             raise
-    
+
     async def _parse_with_pypdf2(self, file_data: bytes, filename: str) -> Dict[str, Any]:
-        """Parse PDF file using PyPDF2 (text only, no table extraction)."""
+        """Parse PDF file using PyPDF2 (text only, no table extraction), in a worker thread."""
         try:
-            pdf_file = io.BytesIO(file_data)
-            pdf_reader = self.PyPDF2.PdfReader(pdf_file)
-            
-            text_parts = []
-            page_count = len(pdf_reader.pages)
-            
-            for page_num, page in enumerate(pdf_reader.pages, 1):
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(f"--- Page {page_num} ---\n{page_text}")
-            
-            full_text = "\n\n".join(text_parts)
-            
-            metadata = {
-                "type": "pdf",
-                "page_count": page_count,
-                "table_count": 0,  # PyPDF2 doesn't extract tables
-                "filename": filename,
-                "size": len(file_data),
-                "parsing_method": "pypdf2"
-            }
-            
-            return {
-                "success": True,
-                "text": full_text,
-                "tables": [],  # PyPDF2 doesn't extract tables
-                "metadata": metadata
-            }
-        
+            return await asyncio.to_thread(self._parse_with_pypdf2_sync, file_data, filename)
+
         except Exception as e:
             self.logger.error(f"❌ PyPDF2 PDF parsing failed: {e}", exc_info=True)
             raise
+
+    def _parse_with_pypdf2_sync(self, file_data: bytes, filename: str) -> Dict[str, Any]:
+        pdf_file = io.BytesIO(file_data)
+        pdf_reader = self.PyPDF2.PdfReader(pdf_file)
+
+        text_parts = []
+        page_count = len(pdf_reader.pages)
+
+        for page_num, page in enumerate(pdf_reader.pages, 1):
+            page_text = page.extract_text()
+            if page_text:
+                text_parts.append(f"--- Page {page_num} ---\n{page_text}")
+
+        full_text = "\n\n".join(text_parts)
+
+        metadata = {
+            "type": "pdf",
+            "page_count": page_count,
+            "table_count": 0,  # PyPDF2 doesn't extract tables
+            "filename": filename,
+            "size": len(file_data),
+            "parsing_method": "pypdf2"
+        }
+
+        return {
+            "success": True,
+            "text": full_text,
+            "tables": [],  # PyPDF2 doesn't extract tables
+            "metadata": metadata
+        }
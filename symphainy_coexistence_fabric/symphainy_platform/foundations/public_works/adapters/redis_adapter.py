@@ -10,10 +10,10 @@ HOW (Infrastructure Implementation): I use real Redis client with no business lo
 
 import json
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 import redis.asyncio as redis
 from redis.asyncio import Redis
-from redis.exceptions import RedisError
+from redis.exceptions import RedisError, WatchError
 
 from utilities import get_logger
 
@@ -41,6 +41,7 @@ class RedisAdapter:
         self.db = db
         self.password = password
         self._client: Optional[Redis] = None
+        self._scripts: Dict[str, Any] = {}  # script source -> registered Script (per client)
         self.logger = get_logger(self.__class__.__name__)
     
     async def connect(self) -> bool:
@@ -63,6 +64,7 @@ class RedisAdapter:
         if self._client:
             await self._client.aclose()
             self._client = None
+            self._scripts.clear()
     
     # ============================================================================
     # RAW STRING OPERATIONS
@@ -101,6 +103,33 @@ class RedisAdapter:
             self.logger.error(f"Redis DELETE error: {e}")
             return False
     
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Raw Redis MGET operation (one round trip) - no business logic."""
+        if not self._client or not keys:
+            return [None] * len(keys)
+        try:
+            return await self._client.mget(keys)
+        except RedisError as e:
+            self.logger.error(f"Redis MGET error: {e}")
+            return [None] * len(keys)
+    
+    async def mset(self, mapping: Dict[str, str], ttl: Optional[int] = None) -> bool:
+        """Raw Redis multi-key SET (one pipelined round trip) - no business logic."""
+        if not self._client or not mapping:
+            return False
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    if ttl:
+                        pipe.setex(key, ttl, value)
+                    else:
+                        pipe.set(key, value)
+                await pipe.execute()
+            return True
+        except RedisError as e:
+            self.logger.error(f"Redis MSET error: {e}")
+            return False
+    
     async def flushdb(self) -> bool:
         """Raw Redis FLUSHDB operation - clears current database."""
         if not self._client:
@@ -164,6 +193,26 @@ class RedisAdapter:
             self.logger.error(f"Redis LPUSH error: {e}")
             return 0
     
+    async def rpush(self, key: str, value: str) -> int:
+        """Raw Redis RPUSH operation (append; returns new length) - no business logic."""
+        if not self._client:
+            return 0
+        try:
+            return await self._client.rpush(key, value)
+        except RedisError as e:
+            self.logger.error(f"Redis RPUSH error: {e}")
+            return 0
+    
+    async def llen(self, key: str) -> int:
+        """Raw Redis LLEN operation - no business logic."""
+        if not self._client:
+            return 0
+        try:
+            return await self._client.llen(key)
+        except RedisError as e:
+            self.logger.error(f"Redis LLEN error: {e}")
+            return 0
+    
     async def lrange(self, key: str, start: int, end: int) -> List[str]:
         """Raw Redis LRANGE operation - no business logic."""
         if not self._client:
@@ -184,6 +233,130 @@ class RedisAdapter:
             self.logger.error(f"Redis LTRIM error: {e}")
             return False
     
+    # ============================================================================
+    # RAW SET OPERATIONS (for membership / deduplication)
+    # ============================================================================
+
+    async def sadd(self, key: str, member: str, ttl: Optional[int] = None) -> Optional[int]:
+        """
+        Raw Redis SADD (plus EXPIRE in the same round trip when ttl is given) - no business logic.
+
+        Returns:
+            1 if member was added, 0 if already present, None if not connected or on error
+        """
+        if not self._client:
+            return None
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                pipe.sadd(key, member)
+                if ttl:
+                    pipe.expire(key, ttl)
+                results = await pipe.execute()
+            return int(results[0])
+        except RedisError as e:
+            self.logger.error(f"Redis SADD error: {e}")
+            return None
+
+    async def sismember(self, key: str, member: str) -> Optional[bool]:
+        """Raw Redis SISMEMBER operation; None if not connected or on error - no business logic."""
+        if not self._client:
+            return None
+        try:
+            return bool(await self._client.sismember(key, member))
+        except RedisError as e:
+            self.logger.error(f"Redis SISMEMBER error: {e}")
+            return None
+
+    async def srem(self, key: str, member: str) -> Optional[int]:
+        """Raw Redis SREM operation; number removed, None if not connected or on error - no business logic."""
+        if not self._client:
+            return None
+        try:
+            return int(await self._client.srem(key, member))
+        except RedisError as e:
+            self.logger.error(f"Redis SREM error: {e}")
+            return None
+
+    # ============================================================================
+    # RAW OPTIMISTIC TRANSACTIONS
+    # ============================================================================
+    
+    async def compare_and_swap(
+        self,
+        watch_key: str,
+        expected: Optional[str],
+        commands: Sequence[Tuple[Any, ...]]
+    ) -> bool:
+        """
+        Raw WATCH / MULTI / EXEC - no business logic.
+        
+        Runs commands ((name, *args) tuples, e.g. ("setex", key, ttl, value)) atomically
+        if watch_key still holds expected (None = key absent) and is not modified
+        before EXEC.
+        
+        Returns:
+            True if the commands ran; False on a value mismatch or concurrent change
+        """
+        if not self._client:
+            return False
+        try:
+            async with self._client.pipeline(transaction=True) as pipe:
+                await pipe.watch(watch_key)
+                if await pipe.get(watch_key) != expected:
+                    await pipe.unwatch()
+                    return False
+                pipe.multi()
+                for name, *args in commands:
+                    getattr(pipe, name)(*args)
+                await pipe.execute()
+                return True
+        except WatchError:
+            return False
+        except RedisError as e:
+            self.logger.error(f"Redis compare-and-swap error: {e}")
+            return False
+
+    async def transaction(self, commands: Sequence[Tuple[Any, ...]]) -> Optional[List[Any]]:
+        """
+        Raw MULTI / EXEC - no business logic.
+        
+        Runs commands ((name, *args) tuples, e.g. ("rpush", key, value)) atomically in one round trip.
+        
+        Returns:
+            Per-command results, or None if not connected or on error
+        """
+        if not self._client:
+            return None
+        try:
+            async with self._client.pipeline(transaction=True) as pipe:
+                for name, *args in commands:
+                    getattr(pipe, name)(*args)
+                return await pipe.execute()
+        except RedisError as e:
+            self.logger.error(f"Redis transaction error: {e}")
+            return None
+
+    # ============================================================================
+    # RAW SERVER-SIDE SCRIPTS
+    # ============================================================================
+
+    async def eval_script(self, script: str, keys: Sequence[str], args: Sequence[Any]) -> Optional[Any]:
+        """
+        Raw Lua script execution (EVALSHA, loading the script on first use) - no business logic.
+
+        Returns:
+            Script result, or None if not connected or on error
+        """
+        if not self._client:
+            return None
+        if script not in self._scripts:
+            self._scripts[script] = self._client.register_script(script)
+        try:
+            return await self._scripts[script](keys=list(keys), args=list(args))
+        except RedisError as e:
+            self.logger.error(f"Redis script error: {e}")
+            return None
+
     # ============================================================================
     # RAW SCAN OPERATIONS (for listing keys)
     # ============================================================================
@@ -245,6 +418,37 @@ class RedisAdapter:
             self.logger.error(f"Redis XADD error: {e}")
             return None
     
+    async def xadd_many(
+        self,
+        entries: Sequence[Tuple[str, Dict[str, str]]],
+        maxlen: Optional[int] = None,
+        approximate: bool = True
+    ) -> List[Optional[str]]:
+        """
+        Raw Redis XADD of several entries in one pipelined round trip - no business logic.
+        
+        Args:
+            entries: (stream_name, fields) pairs, appended in order
+            maxlen: Optional maximum length per stream (trims old entries)
+            approximate: If True, use approximate trimming (faster)
+        
+        Returns:
+            Message ID per entry (all None if the pipeline failed)
+        """
+        if not self._client or not entries:
+            return [None] * len(entries)
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for stream_name, fields in entries:
+                    if maxlen:
+                        pipe.xadd(stream_name, fields, maxlen=maxlen, approximate=approximate)
+                    else:
+                        pipe.xadd(stream_name, fields)
+                return list(await pipe.execute())
+        except RedisError as e:
+            self.logger.error(f"Redis pipelined XADD error: {e}")
+            return [None] * len(entries)
+    
     async def xread(
         self,
         streams: Dict[str, str],
@@ -54,7 +54,8 @@ class SupabaseAdapter:
         anon_key: str,
         service_key: Optional[str] = None,
         jwks_url: Optional[str] = None,
-        jwt_issuer: Optional[str] = None
+        jwt_issuer: Optional[str] = None,
+        token_cache: Optional[Any] = None
     ):
         """
         Initialize Supabase adapter with real credentials.
@@ -65,8 +66,11 @@ class SupabaseAdapter:
             service_key: Supabase service role key (optional)
             jwks_url: Optional JWKS URL for local JWT verification
             jwt_issuer: Optional JWT issuer for token validation
+            token_cache: Optional VerifiedTokenCache; a user's cached tokens are invalidated
+                whenever their tenant membership is written here
         """
         self.logger = get_logger(self.__class__.__name__)
+        self.token_cache = token_cache
         
         # Normalize URL - remove trailing slashes
         self.url = url.rstrip('/') if url else url
@@ -445,7 +449,8 @@ class SupabaseAdapter:
             return {
                 "success": True,
                 "user": user_dict,
-                "access_token": access_token
+                "access_token": access_token,
+                "expires_at": payload.get("exp")
             }
             
         except Exception as e:
@@ -568,7 +573,8 @@ class SupabaseAdapter:
                         "primary_tenant_id": user_metadata.get("primary_tenant_id"),
                         "tenant_type": user_metadata.get("tenant_type", "individual"),
                         "roles": user_metadata.get("roles", []),
-                        "permissions": user_metadata.get("permissions", [])
+                        "permissions": user_metadata.get("permissions", []),
+                        "tenant_source": "user_metadata"
                     }
                 except Exception as e:
                     self.logger.warning(f"Could not get user metadata for user_id {user_id}: {e}")
@@ -589,7 +595,8 @@ class SupabaseAdapter:
                 "primary_tenant_id": tenant_data["tenant_id"],
                 "tenant_type": tenant_info.get("type", "individual"),
                 "roles": [role],
-                "permissions": permissions
+                "permissions": permissions,
+                "tenant_source": "user_tenants"
             }
             
         except Exception as e:
@@ -699,6 +706,7 @@ class SupabaseAdapter:
         """Raw admin user update with Supabase - no business logic."""
         try:
             response = self.service_client.auth.admin.update_user_by_id(user_id, updates)
+            await self._invalidate_user_tokens(user_id)  # metadata may carry tenant / roles
             
             return {
                 "success": True,
@@ -758,18 +766,22 @@ class SupabaseAdapter:
                     "error_type": "config_error"
                 }
             
-            # If setting as primary, unset other primary tenants for this user
-            if is_primary:
-                self.service_client.table("user_tenants").update({
-                    "is_primary": False
-                }).eq("user_id", user_id).execute()
-            
-            response = self.service_client.table("user_tenants").insert({
-                "user_id": user_id,
-                "tenant_id": tenant_id,
-                "role": role,
-                "is_primary": is_primary
-            }).execute()
+            try:
+                # If setting as primary, unset other primary tenants for this user
+                if is_primary:
+                    self.service_client.table("user_tenants").update({
+                        "is_primary": False
+                    }).eq("user_id", user_id).execute()
+                
+                response = self.service_client.table("user_tenants").insert({
+                    "user_id": user_id,
+                    "tenant_id": tenant_id,
+                    "role": role,
+                    "is_primary": is_primary
+                }).execute()
+            finally:
+                # Even a failed insert may follow the primary-flag update
+                await self._invalidate_user_tokens(user_id)
             
             if not response.data:
                 return {
@@ -790,6 +802,15 @@ class SupabaseAdapter:
                 "error_type": "database_error"
             }
     
+    async def _invalidate_user_tokens(self, user_id: str) -> None:
+        """Drop the user's cached token validations (all workers) after a membership write."""
+        if self.token_cache is None:
+            return
+        try:
+            await self.token_cache.invalidate_user(user_id)
+        except Exception as e:
+            self.logger.warning(f"Could not invalidate cached tokens for user_id {user_id}: {e}")
+    
     async def get_tenant_by_id(self, tenant_id: str) -> Dict[str, Any]:
         """Get tenant information by ID."""
         try:
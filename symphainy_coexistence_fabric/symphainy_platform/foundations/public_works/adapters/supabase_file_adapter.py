@@ -8,6 +8,7 @@ WHAT (Infrastructure Role): I provide raw Supabase operations for file managemen
 HOW (Infrastructure Implementation): I use real Supabase client with no business logic
 """
 
+import asyncio
 from typing import Dict, Any, Optional, List
 from supabase import create_client, Client
 
@@ -42,8 +43,8 @@ class SupabaseFileAdapter:
     async def connect(self) -> bool:
         """Connect to Supabase (already connected in __init__)."""
         try:
-            # Test connection
-            result = self._client.table("project_files").select("uuid").limit(1).execute()
+            # Test connection (the Supabase client is synchronous; keep it off the event loop)
+            await asyncio.to_thread(self._client.table("project_files").select("uuid").limit(1).execute)
             self.logger.info("Supabase File Management adapter connected")
             return True
         except Exception as e:
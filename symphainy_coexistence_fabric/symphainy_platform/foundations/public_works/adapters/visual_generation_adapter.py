@@ -16,15 +16,17 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 import logging
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import plotly.express as px
 from typing import Dict, Any, Optional
 from datetime import datetime
 import base64
 import io
 
-from utilities import get_logger
+from utilities import get_logger, lazy_import
+
+# plotly costs hundreds of milliseconds to import; defer it until the first chart is built
+go = lazy_import("plotly.graph_objects")
+plotly_subplots = lazy_import("plotly.subplots")
+px = lazy_import("plotly.express")
 from ..protocols.visual_generation_protocol import VisualizationResult, VisualGenerationProtocol
 
 
@@ -274,7 +276,7 @@ class VisualGenerationAdapter:
             self.logger.info(f"Creating summary dashboard for tenant {tenant_id}...")
             
             # Create subplot layout
-            fig = make_subplots(
+            fig = plotly_subplots.make_subplots(
                 rows=2, cols=2,
                 subplot_titles=[
                     "Content Pillar Summary",
@@ -502,7 +504,7 @@ class VisualGenerationAdapter:
             objectives = poc_data.get("objectives", [])
             
             # Create subplot layout
-            fig = make_subplots(
+            fig = plotly_subplots.make_subplots(
                 rows=1, cols=2,
                 subplot_titles=["POC Scope", "Timeline"],
                 specs=[[{"type": "pie"}, {"type": "bar"}]]
@@ -12,6 +12,8 @@ import logging
 from typing import Dict, Any, Optional
 import io
 
+from utilities import lazy_import, module_available
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,13 +29,12 @@ class WordProcessingAdapter:
         self.logger = logger
         self.docx_available = False
         
-        # Try to import python-docx
-        try:
-            from docx import Document
-            self.Document = Document
+        # python-docx is imported on first parse
+        if module_available("docx"):
+            self.docx = lazy_import("docx")
             self.docx_available = True
             self.logger.info("✅ Python-docx available for Word parsing")
-        except ImportError:
+        else:
             self.logger.warning("⚠️ Python-docx not available - Word parsing will not work")
         
         self.logger.info("✅ Word Processing Adapter initialized")
@@ -68,7 +69,7 @@ class WordProcessingAdapter:
             
             # Parse using python-docx
             docx_file = io.BytesIO(file_data)
-            doc = self.Document(docx_file)
+            doc = self.docx.Document(docx_file)
             
             # Extract text from paragraphs
             text_parts = []
@@ -0,0 +1,227 @@
+"""
+AS2 Message Dedup - Seen AS2 Message-IDs per partner
+
+Lets EDI ingestion recognise a partner's retransmission of a message it already received
+(same AS2 Message-ID), so the message is not decrypted, stored and processed twice.
+
+WHAT (Infrastructure Role): I remember which AS2 messages were received within the retention window
+HOW (Infrastructure Implementation): I keep one Redis set per retention window (current and previous
+                                     are checked, so an ID is remembered for one to two windows);
+                                     SADD on the current set is the atomic claim shared by every
+                                     worker; a claim is confirmed once the message is stored (its
+                                     MDN is kept for retransmissions) or released if storing fails.
+                                     An in-process aging Bloom filter (two generations, rotated with
+                                     the window) records confirmed IDs and answers when Redis is
+                                     not configured or not reachable
+
+Redis is authoritative: a Bloom filter only knows this process's messages and can report
+false positives, so with Redis up its answer is never used on its own. Without Redis the
+Bloom filter's false-positive rate is the chance of rejecting a new message as a duplicate.
+"""
+
+import hashlib
+import json
+import math
+import time
+from typing import Any, Callable, Dict, Optional
+
+from utilities import get_logger
+
+
+DEFAULT_RETENTION_SECONDS = 7 * 24 * 3600
+
+DEFAULT_BLOOM_CAPACITY = 500_000
+
+DEFAULT_BLOOM_ERROR_RATE = 1e-6
+
+_KEY_PREFIX = "as2dedup:v1"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (double hashing of one SHA-256 digest)."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size_bits = max(8, int(math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.hash_count = max(1, int(round(self.size_bits / self.capacity * math.log(2))))
+        self._bits = bytearray((self.size_bits + 7) // 8)
+        self.count = 0
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def _positions(self, item: str):
+        digest = hashlib.sha256(item.encode("utf-8")).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:16], "big") | 1
+        return ((first + i * second) % self.size_bits for i in range(self.hash_count))
+
+
+class AS2MessageDeduplicator:
+    """Redis sets plus an in-process aging Bloom filter for AS2 Message-IDs; see module docstring."""
+
+    def __init__(
+        self,
+        redis_adapter: Optional[Any] = None,
+        retention_seconds: int = DEFAULT_RETENTION_SECONDS,
+        bloom_capacity: int = DEFAULT_BLOOM_CAPACITY,
+        bloom_error_rate: float = DEFAULT_BLOOM_ERROR_RATE,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize AS2 message dedup.
+
+        Args:
+            redis_adapter: RedisAdapter holding the shared sets (None = in-process Bloom filter only)
+            retention_seconds: Window length; a Message-ID is remembered for one to two windows
+            bloom_capacity: Message-IDs per window the Bloom filter holds at bloom_error_rate
+            bloom_error_rate: Bloom filter false-positive rate at capacity
+            clock: Wall clock (seconds since epoch; windows are aligned across workers)
+        """
+        self.redis = redis_adapter
+        self.retention_seconds = max(1, retention_seconds)
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self.logger = get_logger(self.__class__.__name__)
+        self._clock = clock
+        self._window = self._current_window()
+        self._current = BloomFilter(bloom_capacity, bloom_error_rate)
+        self._previous = BloomFilter(bloom_capacity, bloom_error_rate)
+        self._pending: set = set()
+        self._stats = {
+            "checked": 0, "duplicates": 0, "claimed": 0, "lost_claims": 0, "released": 0, "redis_errors": 0
+        }
+
+    async def is_duplicate(self, partner_id: str, message_id: str) -> bool:
+        """
+        Whether this partner's message was already received (checked before decryption).
+
+        Does not record the message; call claim() once it has been decrypted, so a message
+        that failed to decrypt can still be retried by the partner.
+        """
+        self._stats["checked"] += 1
+        member = self._member(partner_id, message_id)
+        seen: Optional[bool] = None
+        if self.redis is not None:
+            seen = False
+            for key in self._redis_keys():
+                found = await self.redis.sismember(key, member)
+                if found is None:
+                    seen = None
+                    break
+                if found:
+                    seen = True
+                    break
+            if seen is None:
+                self._stats["redis_errors"] += 1
+                self.logger.warning("AS2 dedup check could not reach Redis; using this worker's Bloom filter")
+        if seen is None:
+            seen = member in self._pending or self._bloom_contains(member)
+        if seen:
+            self._stats["duplicates"] += 1
+        return seen
+
+    async def claim(self, partner_id: str, message_id: str) -> bool:
+        """
+        Claim a decrypted message; confirm() it once stored, release() it if storing fails.
+
+        Returns:
+            False if another worker claimed the same message first (a concurrent retransmission)
+        """
+        member = self._member(partner_id, message_id)
+        if self.redis is None:
+            if member in self._pending:
+                self._stats["lost_claims"] += 1
+                return False
+            self._pending.add(member)
+            self._stats["claimed"] += 1
+            return True
+        added = await self.redis.sadd(self._redis_keys()[0], member, ttl=2 * self.retention_seconds)
+        if added is None:
+            self._stats["redis_errors"] += 1
+            self.logger.warning(f"AS2 message {message_id} not recorded in Redis; other workers may accept a retransmission")
+            added = 1
+        if added:
+            self._pending.add(member)
+            self._stats["claimed"] += 1
+            return True
+        self._stats["lost_claims"] += 1
+        return False
+
+    async def confirm(self, partner_id: str, message_id: str, mdn: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record a claimed message as received (it was stored).
+
+        Args:
+            mdn: The MDN returned to the partner, handed back when the message is retransmitted
+        """
+        member = self._member(partner_id, message_id)
+        self._pending.discard(member)
+        self._bloom_add(member)
+        if mdn is not None and self.redis is not None:
+            stored = await self.redis.set(self._mdn_key(member), json.dumps(mdn, default=str), ttl=2 * self.retention_seconds)
+            if not stored:
+                self._stats["redis_errors"] += 1
+                self.logger.warning(f"MDN of AS2 message {message_id} not recorded in Redis; a retransmission gets no MDN")
+
+    async def release(self, partner_id: str, message_id: str) -> None:
+        """Drop a claim whose message was not stored, so the partner's retransmission is accepted."""
+        member = self._member(partner_id, message_id)
+        self._pending.discard(member)
+        self._stats["released"] += 1
+        if self.redis is not None and await self.redis.srem(self._redis_keys()[0], member) is None:
+            self._stats["redis_errors"] += 1
+            self.logger.error(f"AS2 message {message_id} could not be released in Redis; its retransmission will be rejected")
+
+    async def get_mdn(self, partner_id: str, message_id: str) -> Optional[Dict[str, Any]]:
+        """MDN recorded by confirm() for a received message (None if none was recorded or Redis is unavailable)."""
+        if self.redis is None:
+            return None
+        raw = await self.redis.get(self._mdn_key(self._member(partner_id, message_id)))
+        return json.loads(raw) if raw else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Checks, duplicates, claims and Redis errors; Bloom filter fill."""
+        return {
+            **self._stats,
+            "bloom_entries": self._current.count + self._previous.count,
+            "bloom_size_bytes": 2 * len(self._current._bits),
+        }
+
+    def _bloom_contains(self, member: str) -> bool:
+        self._rotate()
+        return member in self._current or member in self._previous
+
+    def _bloom_add(self, member: str) -> None:
+        self._rotate()
+        self._current.add(member)
+
+    def _rotate(self) -> None:
+        window = self._current_window()
+        if window == self._window:
+            return
+        self._previous = self._current if window == self._window + 1 else BloomFilter(self.bloom_capacity, self.bloom_error_rate)
+        self._current = BloomFilter(self.bloom_capacity, self.bloom_error_rate)
+        self._window = window
+
+    def _current_window(self) -> int:
+        return int(self._clock() // self.retention_seconds)
+
+    def _redis_keys(self):
+        """Current window's set first, then the previous window's."""
+        window = self._current_window()
+        return [f"{_KEY_PREFIX}:{window}", f"{_KEY_PREFIX}:{window - 1}"]
+
+    @staticmethod
+    def _mdn_key(member: str) -> str:
+        return f"{_KEY_PREFIX}:mdn:{hashlib.sha256(member.encode('utf-8')).hexdigest()}"
+
+    @staticmethod
+    def _member(partner_id: str, message_id: str) -> str:
+        return f"{partner_id}\x1f{message_id.strip().strip('<>')}"
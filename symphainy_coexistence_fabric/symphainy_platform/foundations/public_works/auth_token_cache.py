@@ -0,0 +1,249 @@
+"""
+Auth Token Cache - Verified tokens and resolved tenants for the auth hot path
+
+Lets token validation skip the JWKS signature check and the user_tenants lookup for a
+token that was already verified, until the token expires.
+
+WHAT (Infrastructure Role): I remember, per token, the verified identity and resolved tenant / roles
+HOW (Infrastructure Implementation): I key entries by the token's SHA-256 (tokens are never stored)
+                                     in an in-process LRU in front of a shared Redis tier; entries
+                                     live until the token's exp, capped by max_ttl_seconds, and
+                                     invalidations (revoked token, changed membership) are
+                                     published on a Redis stream every worker follows
+
+max_ttl_seconds bounds how long a missed invalidation event can keep stale roles alive.
+Shared-tier failures degrade to cache misses (full validation), never to errors.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from utilities import get_logger
+
+
+DEFAULT_LOCAL_MAX_ENTRIES = 10_000
+
+DEFAULT_MAX_TTL_SECONDS = 300
+
+INVALIDATION_STREAM = "authcache:v1:invalidations"
+
+_KEY_PREFIX = "authcache:v1"
+
+_STREAM_MAXLEN = 10_000
+
+_LISTEN_BLOCK_MS = 5_000
+
+
+def token_hash(token: str) -> str:
+    """SHA-256 hex digest of a bearer token (the cache key; the token itself is never stored)."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class VerifiedTokenCache:
+    """In-process LRU plus optional shared Redis tier for verified tokens; see module docstring."""
+
+    def __init__(
+        self,
+        redis_adapter: Optional[Any] = None,
+        local_max_entries: int = DEFAULT_LOCAL_MAX_ENTRIES,
+        max_ttl_seconds: int = DEFAULT_MAX_TTL_SECONDS,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize auth token cache.
+
+        Args:
+            redis_adapter: RedisAdapter for the shared tier and invalidation stream (None = in-process only)
+            local_max_entries: Maximum tokens held in the in-process LRU
+            max_ttl_seconds: Longest an entry is trusted, whatever the token's exp
+            clock: Wall clock (seconds since epoch, as in JWT exp)
+        """
+        self.redis = redis_adapter
+        self.local_max_entries = local_max_entries
+        self.max_ttl_seconds = max_ttl_seconds
+        self.logger = get_logger(self.__class__.__name__)
+        self._clock = clock
+        self._origin = uuid.uuid4().hex  # skips our own invalidation events
+        self._local: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._by_user: Dict[str, Set[str]] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self._last_event_id: Optional[str] = None  # a restarted listener resumes here
+        self._stats = {"local_hits": 0, "shared_hits": 0, "misses": 0, "stores": 0, "invalidations": 0}
+
+    async def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a verified token: in-process first, then the shared tier.
+
+        Returns:
+            The entry stored by put() (user_id, email, tenant_info, ...), or None on a miss
+        """
+        self._ensure_listener()
+        digest = token_hash(token)
+        now = self._clock()
+        entry = self._local.get(digest)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > now:
+                self._local.move_to_end(digest)
+                self._stats["local_hits"] += 1
+                return dict(value)
+            self._forget(digest)
+
+        if self.redis is not None:
+            try:
+                payload = await self.redis.get(self._entry_key(digest))
+            except Exception as e:
+                self.logger.warning(f"Auth token cache shared read failed: {e}")
+                payload = None
+            if payload is not None:
+                try:
+                    stored = json.loads(payload)
+                    expires_at, value = float(stored["expires_at"]), stored["entry"]
+                except (ValueError, TypeError, KeyError) as e:
+                    self.logger.warning(f"Discarding unreadable cached token entry: {e}")
+                else:
+                    if expires_at > now:
+                        self._remember(digest, value, expires_at)
+                        self._stats["shared_hits"] += 1
+                        return dict(value)
+
+        self._stats["misses"] += 1
+        return None
+
+    async def put(self, token: str, entry: Dict[str, Any], token_expires_at: Optional[float]) -> None:
+        """
+        Remember a verified token until its exp (capped at max_ttl_seconds).
+
+        Args:
+            token: The bearer token that was verified
+            entry: JSON-serializable validation result; must include user_id
+            token_expires_at: The token's exp claim (None = not cached)
+        """
+        if token_expires_at is None:
+            return
+        now = self._clock()
+        expires_at = min(float(token_expires_at), now + self.max_ttl_seconds)
+        if expires_at <= now:
+            return
+        digest = token_hash(token)
+        self._remember(digest, dict(entry), expires_at)
+        self._stats["stores"] += 1
+        if self.redis is None:
+            return
+        ttl = max(1, int(expires_at - now))
+        payload = json.dumps({"expires_at": expires_at, "entry": entry}, default=str)
+        user_key = self._user_key(entry.get("user_id"))
+        try:
+            await self.redis.set(self._entry_key(digest), payload, ttl=ttl)
+            await self.redis.rpush(user_key, digest)
+            await self.redis.expire(user_key, self.max_ttl_seconds)
+        except Exception as e:
+            self.logger.warning(f"Auth token cache shared write failed: {e}")
+
+    async def revoke_token(self, token: str) -> None:
+        """Drop a token everywhere (e.g. on logout); other workers drop it via the invalidation stream."""
+        digest = token_hash(token)
+        self._forget(digest)
+        self._stats["invalidations"] += 1
+        if self.redis is not None:
+            await self.redis.delete(self._entry_key(digest))
+            await self._publish({"kind": "token", "hash": digest})
+
+    async def invalidate_user(self, user_id: str) -> None:
+        """Drop every cached token of a user (membership or role change, session termination)."""
+        for digest in list(self._by_user.get(user_id, ())):
+            self._forget(digest)
+        self._stats["invalidations"] += 1
+        if self.redis is not None:
+            user_key = self._user_key(user_id)
+            for digest in await self.redis.lrange(user_key, 0, -1):
+                await self.redis.delete(self._entry_key(digest))
+            await self.redis.delete(user_key)
+            await self._publish({"kind": "user", "user_id": user_id})
+
+    def apply_invalidation(self, event: Dict[str, Any]) -> None:
+        """Apply an invalidation event published by another worker to the in-process tier."""
+        if event.get("origin") == self._origin:
+            return
+        if event.get("kind") == "token":
+            self._forget(event.get("hash", ""))
+        elif event.get("kind") == "user":
+            for digest in list(self._by_user.get(event.get("user_id", ""), ())):
+                self._forget(digest)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit / miss / invalidation counters and in-process size."""
+        hits = self._stats["local_hits"] + self._stats["shared_hits"]
+        lookups = hits + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "local_entries": len(self._local)
+        }
+
+    async def aclose(self) -> None:
+        """Stop following the invalidation stream."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def _publish(self, event: Dict[str, Any]) -> None:
+        fields = {**event, "origin": self._origin}
+        if await self.redis.xadd(INVALIDATION_STREAM, fields, maxlen=_STREAM_MAXLEN) is None:
+            self.logger.warning(f"Auth token invalidation not published; other workers keep entries up to {self.max_ttl_seconds}s")
+
+    def _ensure_listener(self) -> None:
+        if self.redis is None or (self._listener is not None and not self._listener.done()):
+            return
+        self._listener = asyncio.get_running_loop().create_task(self._follow_invalidations())
+
+    async def _follow_invalidations(self) -> None:
+        """Apply invalidations after the last one applied (first start: from now; stream ids are ms timestamps)."""
+        if self._last_event_id is None:
+            self._last_event_id = f"{int(self._clock() * 1000)}-0"
+        while True:
+            started = time.monotonic()
+            result = await self.redis.xread({INVALIDATION_STREAM: self._last_event_id}, count=100, block=_LISTEN_BLOCK_MS)
+            messages = result.get(INVALIDATION_STREAM, [])
+            for message_id, fields in messages:
+                self._last_event_id = message_id
+                self.apply_invalidation(fields)
+            if not messages and time.monotonic() - started < _LISTEN_BLOCK_MS / 2000:
+                await asyncio.sleep(1.0)  # Redis unavailable; retry without spinning
+
+    def _remember(self, digest: str, value: Dict[str, Any], expires_at: float) -> None:
+        self._forget(digest)
+        self._local[digest] = (expires_at, value)
+        user_id = value.get("user_id")
+        if user_id:
+            self._by_user.setdefault(user_id, set()).add(digest)
+        while len(self._local) > self.local_max_entries:
+            self._forget(next(iter(self._local)))
+
+    def _forget(self, digest: str) -> None:
+        entry = self._local.pop(digest, None)
+        if entry is None:
+            return
+        user_id = entry[1].get("user_id")
+        digests = self._by_user.get(user_id)
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                del self._by_user[user_id]
+
+    @staticmethod
+    def _entry_key(digest: str) -> str:
+        return f"{_KEY_PREFIX}:token:{digest}"
+
+    @staticmethod
+    def _user_key(user_id: Optional[str]) -> str:
+        return f"{_KEY_PREFIX}:user:{user_id}"
@@ -7,10 +7,17 @@ they do not import concrete backend classes.
 """
 
 from .redis_streams_event_log import RedisStreamsEventLogBackend
+from .ann_vector_backend import AnnVectorBackend, NUMPY_AVAILABLE, DEFAULT_NPROBE, DEFAULT_TRAIN_THRESHOLD
 from ..protocols.event_log_protocol import EventLogProtocol
+from ..protocols.vector_backend_protocol import VectorBackendProtocol
 from typing import Optional, Any
 
-__all__ = ["RedisStreamsEventLogBackend", "create_event_log_backend"]
+__all__ = [
+    "RedisStreamsEventLogBackend",
+    "AnnVectorBackend",
+    "create_event_log_backend",
+    "create_vector_backend",
+]
 
 
 def create_event_log_backend(redis_adapter: Optional[Any]) -> Optional[EventLogProtocol]:
@@ -22,3 +29,26 @@ def create_event_log_backend(redis_adapter: Optional[Any]) -> Optional[EventLogP
     if redis_adapter is None:
         return None
     return RedisStreamsEventLogBackend(redis_adapter)
+
+
+def create_vector_backend(
+    arango_adapter: Any,
+    ann_enabled: bool = False,
+    index_dir: Optional[str] = None,
+    nprobe: int = DEFAULT_NPROBE,
+    train_threshold: int = DEFAULT_TRAIN_THRESHOLD
+) -> VectorBackendProtocol:
+    """
+    Factory: create VectorBackendProtocol implementation for semantic vector search.
+    Returns the in-process ANN backend when enabled (opt-in: it only sees writes made
+    through this process) and numpy is installed; otherwise
+    the ArangoAdapter itself (AQL COSINE_SIMILARITY scan), which implements the protocol.
+    """
+    if not ann_enabled or not NUMPY_AVAILABLE:
+        return arango_adapter
+    return AnnVectorBackend(
+        arango_adapter,
+        index_dir=index_dir,
+        nprobe=nprobe,
+        train_threshold=train_threshold
+    )
@@ -0,0 +1,738 @@
+"""
+ANN Vector Backend - VectorBackendProtocol implementation with an in-process IVF index
+
+Serves vector_search from an approximate nearest-neighbour index held in memory
+instead of scanning the whole collection with COSINE_SIMILARITY in AQL.
+
+WHAT (Infrastructure Role): I answer top-k cosine similarity queries without a collection scan
+HOW (Infrastructure Implementation): I keep one IVF-Flat index (spherical k-means coarse lists over
+                                     normalized float32 vectors, nprobe lists searched per query) per
+                                     collection, vector field and tenant; ArangoDB stays the system
+                                     of record and returns the matched documents
+
+Partitions load lazily on first search (from the index directory when a snapshot is
+present and still matches the collection, otherwise from ArangoDB) and are then kept
+current by index_documents / remove_documents. Writes made by other processes are not
+seen until the collection is invalidated, so the backend is opt-in (VECTOR_INDEX_ENABLED)
+for deployments where one process writes the embedding collections. Filters on scalar
+fields are applied inside the index; filters it cannot evaluate fall back to the ArangoDB scan.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from utilities import get_logger
+
+
+DEFAULT_NPROBE = 16
+
+# Partitions smaller than this are searched exhaustively (exact) and never trained
+DEFAULT_TRAIN_THRESHOLD = 1024
+
+# Re-train the coarse lists when a partition has grown this much since the last training
+_RETRAIN_GROWTH = 4
+
+_KMEANS_ITERATIONS = 10
+
+_KMEANS_SAMPLE = 20_000
+
+_MAX_LISTS = 4096
+
+# Longest string value kept as a filterable attribute (longer text is not filterable in-index)
+_MAX_FILTER_VALUE_LENGTH = 256
+
+_ASSIGN_CHUNK = 8192
+
+_TENANT_FIELD = "tenant_id"
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _normalize_rows(vectors: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Unit-normalize rows; returns (normalized, nonzero mask)."""
+    norms = np.linalg.norm(vectors, axis=1)
+    nonzero = norms > 0
+    normalized = np.zeros_like(vectors)
+    normalized[nonzero] = vectors[nonzero] / norms[nonzero, None]
+    return normalized, nonzero
+
+
+def _group_rows(assignments: "np.ndarray", nlist: int, offset: int = 0) -> List["np.ndarray"]:
+    """Row ids (offset + position) per list id."""
+    order = np.argsort(assignments, kind="stable")
+    bounds = np.searchsorted(assignments[order], np.arange(nlist + 1))
+    rows = order.astype(np.int64) + offset
+    return [rows[bounds[i]:bounds[i + 1]] for i in range(nlist)]
+
+
+def _filterable(field: str, value: Any, vector_field: str) -> bool:
+    """Whether an equality condition on field can be evaluated from the index attributes."""
+    return (
+        field != vector_field
+        and field not in ("_id", "_rev")
+        and isinstance(value, _SCALAR_TYPES)
+        and not (isinstance(value, str) and len(value) > _MAX_FILTER_VALUE_LENGTH)
+    )
+
+
+def _filter_attributes(document: Dict[str, Any], vector_field: str) -> Dict[str, Any]:
+    """Top-level scalar fields that can be matched by equality filters."""
+    return {field: value for field, value in document.items() if _filterable(field, value, vector_field)}
+
+
+class IVFFlatIndex:
+    """
+    Inverted-file index over unit-normalized float32 vectors (inner product = cosine).
+
+    Rows are appended; deletes leave tombstones that are dropped on the next rebuild.
+    Not thread-safe for concurrent writers; rebuilt() only reads, so a rebuild can run
+    in a worker thread while searches continue against the current index.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        nprobe: int = DEFAULT_NPROBE,
+        train_threshold: int = DEFAULT_TRAIN_THRESHOLD
+    ):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for IVFFlatIndex (install the 'ann' extra)")
+        if dimension < 1 or nprobe < 1:
+            raise ValueError("dimension and nprobe must be positive")
+        self.dimension = dimension
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+
+        self._vectors = np.zeros((0, dimension), dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._count = 0
+        self._keys: List[str] = []
+        self._attributes: List[Dict[str, Any]] = []
+        self._rows: Dict[str, int] = {}
+        self._postings: Dict[Tuple[str, Any], set] = {}
+
+        # Coarse quantizer; published as one tuple so readers never see a half-built state
+        self._ivf: Optional[Tuple["np.ndarray", List["np.ndarray"]]] = None
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def nlist(self) -> int:
+        """Number of inverted lists (0 while the index is exhaustive)."""
+        return 0 if self._ivf is None else len(self._ivf[1])
+
+    def add(
+        self,
+        keys: List[str],
+        vectors: Iterable[Iterable[float]],
+        attributes: Optional[List[Dict[str, Any]]] = None
+    ) -> int:
+        """
+        Insert or replace vectors by key.
+
+        Args:
+            keys: Document keys
+            vectors: One vector per key (dimension must match)
+            attributes: Optional filterable attributes per key
+
+        Returns:
+            Number of vectors indexed (zero vectors are skipped: they have no cosine)
+        """
+        if not keys:
+            return 0
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(len(keys), -1)
+        if matrix.shape[1] != self.dimension:
+            raise ValueError(f"Expected {self.dimension}-dimensional vectors, got {matrix.shape[1]}")
+        attributes = attributes or [{} for _ in keys]
+        self.remove(keys)
+
+        matrix, nonzero = _normalize_rows(matrix)
+        keep = np.flatnonzero(nonzero)
+        if len(keep) == 0:
+            return 0
+        self._reserve(self._count + len(keep))
+        start = self._count
+        self._vectors[start:start + len(keep)] = matrix[keep]
+        self._alive[start:start + len(keep)] = True
+        self._count += len(keep)
+
+        for offset, index in enumerate(keep):
+            row = start + offset
+            key = keys[index]
+            self._keys.append(key)
+            self._attributes.append(attributes[index])
+            self._rows[key] = row
+            for item in attributes[index].items():
+                self._postings.setdefault(item, set()).add(row)
+
+        ivf = self._ivf
+        if ivf is not None:
+            centroids, lists = ivf
+            assignments = np.argmax(matrix[keep] @ centroids.T, axis=1)
+            for list_id, rows in enumerate(_group_rows(assignments, len(lists), start)):
+                if len(rows):
+                    lists[list_id] = np.concatenate((lists[list_id], rows))
+        return len(keep)
+
+    def remove(self, keys: Iterable[str]) -> int:
+        """Delete vectors by key; returns the number removed."""
+        removed = 0
+        for key in keys:
+            row = self._rows.pop(key, None)
+            if row is None:
+                continue
+            self._alive[row] = False
+            for item in self._attributes[row].items():
+                rows = self._postings.get(item)
+                if rows is not None:
+                    rows.discard(row)
+                    if not rows:
+                        del self._postings[item]
+            removed += 1
+        return removed
+
+    def needs_rebuild(self) -> bool:
+        """True when the partition should be (re)trained or compacted."""
+        live = len(self._rows)
+        if self._ivf is None:
+            return live >= self.train_threshold
+        dead = self._count - live
+        return live >= self._trained_size * _RETRAIN_GROWTH or dead > max(live, self.train_threshold)
+
+    def rebuilt(self) -> "IVFFlatIndex":
+        """New compacted index over the live rows, trained when large enough (read-only on self)."""
+        live = np.flatnonzero(self._alive[:self._count])
+        fresh = IVFFlatIndex(self.dimension, self.nprobe, self.train_threshold)
+        fresh._load_rows(
+            [self._keys[row] for row in live],
+            self._vectors[live],
+            [self._attributes[row] for row in live]
+        )
+        if len(live) >= self.train_threshold:
+            fresh._train()
+        return fresh
+
+    def search(
+        self,
+        query: Iterable[float],
+        limit: int = 10,
+        filter_conditions: Optional[Dict[str, Any]] = None,
+        similarity_threshold: Optional[float] = None,
+        nprobe: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Approximate top-k by cosine similarity.
+
+        Filters select candidates before scoring. When the probed lists hold fewer than
+        `limit` matching rows, every matching row is scored (exact for selective filters).
+
+        Args:
+            query: Query vector
+            limit: Maximum results
+            filter_conditions: Equality filters on indexed attributes
+            similarity_threshold: Minimum similarity (results below 0.0 are never returned)
+            nprobe: Lists searched (defaults to the index setting)
+
+        Returns:
+            (key, similarity) pairs, highest similarity first
+        """
+        q = np.asarray(query, dtype=np.float32).reshape(-1)
+        if q.shape[0] != self.dimension:
+            raise ValueError(f"Expected {self.dimension}-dimensional query, got {q.shape[0]}")
+        norm = float(np.linalg.norm(q))
+        if norm == 0 or limit < 1 or not self._rows:
+            return []
+        q = q / norm
+
+        allowed = self._allowed_rows(filter_conditions)
+        if allowed is not None and len(allowed) == 0:
+            return []
+
+        ivf = self._ivf
+        if ivf is None or (allowed is not None and len(allowed) <= limit * 4):
+            rows = allowed if allowed is not None else np.flatnonzero(self._alive[:self._count])
+        else:
+            centroids, lists = ivf
+            probe = min(nprobe or self.nprobe, len(lists))
+            nearest = np.argpartition(-(centroids @ q), probe - 1)[:probe]
+            rows = np.concatenate([lists[list_id] for list_id in nearest])
+            rows = rows[self._alive[rows]]
+            if allowed is not None:
+                mask = np.zeros(self._count, dtype=bool)
+                mask[allowed] = True
+                rows = rows[mask[rows]]
+                if len(rows) < limit:
+                    rows = allowed
+
+        if len(rows) == 0:
+            return []
+        scores = self._vectors[rows] @ q
+        floor = max(0.0, similarity_threshold if similarity_threshold is not None else 0.0)
+        keep = scores >= floor
+        rows, scores = rows[keep], scores[keep]
+        if len(rows) > limit:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+            rows, scores = rows[top], scores[top]
+        order = np.argsort(-scores, kind="stable")
+        return [(self._keys[rows[i]], float(scores[i])) for i in order]
+
+    def save(self, path: str) -> None:
+        """Write a compacted snapshot to `path`.npz and `path`.json."""
+        snapshot = self if self._count == len(self._rows) else self.rebuilt()
+        count = snapshot._count
+        arrays = {"vectors": snapshot._vectors[:count]}
+        meta: Dict[str, Any] = {
+            "dimension": snapshot.dimension,
+            "keys": snapshot._keys,
+            "attributes": snapshot._attributes,
+            "trained_size": snapshot._trained_size,
+        }
+        if snapshot._ivf is not None:
+            centroids, lists = snapshot._ivf
+            assignments = np.zeros(count, dtype=np.int32)
+            for list_id, rows in enumerate(lists):
+                assignments[rows] = list_id
+            arrays["centroids"] = centroids
+            arrays["assignments"] = assignments
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        np.savez(f"{path}.npz", **arrays)
+        with open(f"{path}.json", "w", encoding="utf-8") as handle:
+            json.dump(meta, handle)
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        nprobe: int = DEFAULT_NPROBE,
+        train_threshold: int = DEFAULT_TRAIN_THRESHOLD
+    ) -> "IVFFlatIndex":
+        """Read a snapshot written by save()."""
+        with open(f"{path}.json", "r", encoding="utf-8") as handle:
+            meta = json.load(handle)
+        with np.load(f"{path}.npz") as arrays:
+            index = cls(meta["dimension"], nprobe, train_threshold)
+            index._load_rows(meta["keys"], arrays["vectors"], meta["attributes"])
+            if "centroids" in arrays:
+                centroids = arrays["centroids"].astype(np.float32)
+                index._ivf = (centroids, _group_rows(arrays["assignments"], len(centroids)))
+                index._trained_size = meta["trained_size"]
+        return index
+
+    def _load_rows(self, keys: List[str], vectors: "np.ndarray", attributes: List[Dict[str, Any]]) -> None:
+        count = len(keys)
+        self._vectors = np.array(vectors, dtype=np.float32).reshape(count, self.dimension)
+        self._alive = np.ones(count, dtype=bool)
+        self._count = count
+        self._keys = list(keys)
+        self._attributes = list(attributes)
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+        self._postings = {}
+        for row, attrs in enumerate(self._attributes):
+            for item in attrs.items():
+                self._postings.setdefault(item, set()).add(row)
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._vectors)
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2, 64)
+        vectors = np.zeros((capacity, self.dimension), dtype=np.float32)
+        vectors[:self._count] = self._vectors[:self._count]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:self._count] = self._alive[:self._count]
+        self._vectors, self._alive = vectors, alive
+
+    def _allowed_rows(self, filter_conditions: Optional[Dict[str, Any]]) -> Optional["np.ndarray"]:
+        if not filter_conditions:
+            return None
+        postings = []
+        for item in filter_conditions.items():
+            rows = self._postings.get(item)
+            if not rows:
+                return np.zeros(0, dtype=np.int64)
+            postings.append(rows)
+        postings.sort(key=len)
+        allowed = set(postings[0]).intersection(*postings[1:])
+        return np.fromiter(sorted(allowed), dtype=np.int64, count=len(allowed))
+
+    def _train(self) -> None:
+        """Spherical k-means over (a sample of) the rows, then assign every row to a list."""
+        count = self._count
+        vectors = self._vectors[:count]
+        nlist = int(min(_MAX_LISTS, max(1, round(count ** 0.5))))
+        rng = np.random.default_rng(0)
+        sample = vectors
+        if count > _KMEANS_SAMPLE:
+            sample = vectors[rng.choice(count, _KMEANS_SAMPLE, replace=False)]
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(_KMEANS_ITERATIONS):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            updated, nonzero = _normalize_rows(sums)
+            # Empty lists keep their previous centroid
+            centroids[nonzero] = updated[nonzero]
+
+        assignments = np.concatenate([
+            np.argmax(vectors[start:start + _ASSIGN_CHUNK] @ centroids.T, axis=1)
+            for start in range(0, count, _ASSIGN_CHUNK)
+        ])
+        self._ivf = (centroids, _group_rows(assignments, nlist))
+        self._trained_size = count
+
+
+class _Partition:
+    """Index for one (collection, vector field, tenant)."""
+
+    __slots__ = ("index",)
+
+    def __init__(self, index: IVFFlatIndex):
+        self.index = index
+
+
+class AnnVectorBackend:
+    """
+    VectorBackendProtocol implementation backed by per-tenant IVF-Flat indexes.
+
+    Wraps ArangoAdapter for loading partitions, returning matched documents and for
+    collection management. Created through create_vector_backend(); exposed to callers
+    only as VectorBackendProtocol via SemanticDataAbstraction.
+    """
+
+    def __init__(
+        self,
+        arango_adapter: Any,
+        index_dir: Optional[str] = None,
+        nprobe: int = DEFAULT_NPROBE,
+        train_threshold: int = DEFAULT_TRAIN_THRESHOLD
+    ):
+        """
+        Initialize ANN vector backend.
+
+        Args:
+            arango_adapter: ArangoDB adapter (system of record)
+            index_dir: Directory for index snapshots (None = in-memory only)
+            nprobe: Inverted lists searched per query
+            train_threshold: Partition size below which search is exhaustive
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for AnnVectorBackend (install the 'ann' extra)")
+        self._arango = arango_adapter
+        self.index_dir = index_dir
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self.logger = get_logger(self.__class__.__name__)
+
+        # (collection, vector_field) -> tenant -> partition
+        self._partitions: Dict[Tuple[str, str], Dict[Optional[str], _Partition]] = {}
+        self._fully_loaded: set = set()
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._stats = {"searches": 0, "scan_fallbacks": 0, "partitions_loaded": 0, "snapshots_loaded": 0}
+
+    # ========================================================================
+    # VectorBackendProtocol
+    # ========================================================================
+
+    async def vector_search(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        vector_field: str = "embedding",
+        filter_conditions: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+        similarity_threshold: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Perform approximate vector similarity search.
+
+        Args:
+            collection_name: Collection to search in
+            query_vector: Query vector (embedding) to search for
+            vector_field: Field name containing the vector (default: "embedding")
+            filter_conditions: Optional equality filters (e.g., {"tenant_id": "...", "file_id": "..."})
+            limit: Maximum number of results
+            similarity_threshold: Optional minimum similarity score (0.0 to 1.0)
+
+        Returns:
+            List of documents with a "similarity" field, sorted by similarity (highest first)
+        """
+        if not query_vector:
+            self.logger.warning("Query vector is empty")
+            return []
+
+        conditions = dict(filter_conditions or {})
+        # Conditions on values the index does not keep (non-scalar, long text) go to the scan
+        if not all(_filterable(field, value, vector_field) for field, value in conditions.items()):
+            self._stats["scan_fallbacks"] += 1
+            return await self._arango.vector_search(
+                collection_name=collection_name,
+                query_vector=query_vector,
+                vector_field=vector_field,
+                filter_conditions=filter_conditions,
+                limit=limit,
+                similarity_threshold=similarity_threshold
+            )
+
+        self._stats["searches"] += 1
+        group = (collection_name, vector_field)
+        if _TENANT_FIELD in conditions:
+            tenant = conditions.pop(_TENANT_FIELD)
+            await self._ensure_tenant(group, tenant)
+            partitions = [self._partitions[group].get(tenant)]
+        else:
+            await self._ensure_collection(group)
+            partitions = list(self._partitions.get(group, {}).values())
+
+        hits: List[Tuple[str, float]] = []
+        for partition in partitions:
+            if partition is None or partition.index.dimension != len(query_vector):
+                continue
+            hits.extend(partition.index.search(query_vector, limit, conditions, similarity_threshold))
+        hits.sort(key=lambda hit: hit[1], reverse=True)
+        return await self._hydrate(collection_name, hits[:limit])
+
+    async def create_collection(
+        self,
+        collection_name: str,
+        vector_dimension: Optional[int] = None,
+        collection_type: str = "document"
+    ) -> bool:
+        """Create the backing ArangoDB collection (indexes are created on first write or search)."""
+        return await self._arango.create_collection(collection_name, collection_type=collection_type)
+
+    async def collection_exists(self, collection_name: str) -> bool:
+        """Return True if the backing ArangoDB collection exists."""
+        return await self._arango.collection_exists(collection_name)
+
+    # ========================================================================
+    # Index maintenance
+    # ========================================================================
+
+    async def index_documents(
+        self,
+        collection_name: str,
+        documents: List[Dict[str, Any]],
+        vector_field: str = "embedding"
+    ) -> int:
+        """
+        Apply documents already written to ArangoDB to the loaded indexes.
+
+        Partitions that are not loaded yet are skipped; they read these documents
+        from ArangoDB when first searched.
+
+        Returns:
+            Number of vectors indexed
+        """
+        group = (collection_name, vector_field)
+        if group not in self._partitions:
+            return 0
+        by_tenant: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        for doc in documents:
+            if doc.get("_key") and doc.get(vector_field):
+                by_tenant.setdefault(doc.get(_TENANT_FIELD), []).append(doc)
+
+        indexed = 0
+        async with self._lock(group):
+            partitions = self._partitions[group]
+            for tenant, docs in by_tenant.items():
+                partition = partitions.get(tenant)
+                if partition is None:
+                    if group not in self._fully_loaded:
+                        continue
+                    partition = partitions[tenant] = _Partition(self._new_index(len(docs[0][vector_field])))
+                indexed += self._add(partition.index, docs, vector_field)
+                await self._maybe_rebuild(partition)
+        return indexed
+
+    async def remove_documents(
+        self,
+        collection_name: str,
+        keys: List[str],
+        vector_field: str = "embedding"
+    ) -> int:
+        """Remove documents (deleted from ArangoDB) from the loaded indexes."""
+        group = (collection_name, vector_field)
+        removed = 0
+        async with self._lock(group):
+            for partition in self._partitions.get(group, {}).values():
+                removed += partition.index.remove(keys)
+        return removed
+
+    def invalidate(self, collection_name: Optional[str] = None) -> None:
+        """Drop loaded partitions so they reload from ArangoDB (e.g. after external writes)."""
+        for group in list(self._partitions):
+            if collection_name is None or group[0] == collection_name:
+                del self._partitions[group]
+                self._fully_loaded.discard(group)
+
+    async def persist(self) -> int:
+        """Write snapshots of every loaded partition to index_dir; returns partitions written."""
+        if self.index_dir is None:
+            return 0
+        written = 0
+        for group, partitions in list(self._partitions.items()):
+            async with self._lock(group):
+                for tenant, partition in list(partitions.items()):
+                    await asyncio.to_thread(partition.index.save, self._snapshot_path(group, tenant))
+                    written += 1
+        self.logger.info(f"Persisted {written} vector index partitions to {self.index_dir}")
+        return written
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Search counters and per-partition sizes."""
+        stats = dict(self._stats)
+        stats["partitions"] = {
+            f"{collection}.{field}[{tenant}]": {"vectors": len(p.index), "lists": p.index.nlist}
+            for (collection, field), partitions in self._partitions.items()
+            for tenant, p in partitions.items()
+        }
+        return stats
+
+    # ========================================================================
+    # Internals
+    # ========================================================================
+
+    def _lock(self, group: Tuple[str, str]) -> asyncio.Lock:
+        lock = self._locks.get(group)
+        if lock is None:
+            lock = self._locks[group] = asyncio.Lock()
+        return lock
+
+    def _new_index(self, dimension: int) -> IVFFlatIndex:
+        return IVFFlatIndex(dimension, self.nprobe, self.train_threshold)
+
+    def _add(self, index: IVFFlatIndex, documents: List[Dict[str, Any]], vector_field: str) -> int:
+        documents = [doc for doc in documents if len(doc[vector_field]) == index.dimension]
+        if len(documents) < 1:
+            return 0
+        return index.add(
+            [doc["_key"] for doc in documents],
+            [doc[vector_field] for doc in documents],
+            [_filter_attributes(doc, vector_field) for doc in documents]
+        )
+
+    async def _maybe_rebuild(self, partition: _Partition) -> None:
+        # Built off-loop from a read-only view; searches keep using the current index meanwhile
+        if partition.index.needs_rebuild():
+            partition.index = await asyncio.to_thread(partition.index.rebuilt)
+
+    async def _ensure_tenant(self, group: Tuple[str, str], tenant: Any) -> None:
+        if tenant in self._partitions.get(group, {}) or group in self._fully_loaded:
+            return
+        async with self._lock(group):
+            partitions = self._partitions.setdefault(group, {})
+            if tenant in partitions or group in self._fully_loaded:
+                return
+            partition = await self._load_snapshot(group, tenant)
+            if partition is None:
+                documents = await self._fetch(group, tenant)
+                partition = await self._build(group, documents)
+            if partition is not None:
+                partitions[tenant] = partition
+
+    async def _ensure_collection(self, group: Tuple[str, str]) -> None:
+        if group in self._fully_loaded:
+            return
+        async with self._lock(group):
+            if group in self._fully_loaded:
+                return
+            partitions = self._partitions.setdefault(group, {})
+            by_tenant: Dict[Any, List[Dict[str, Any]]] = {}
+            for doc in await self._fetch(group):
+                by_tenant.setdefault(doc.get(_TENANT_FIELD), []).append(doc)
+            for tenant, documents in by_tenant.items():
+                if tenant not in partitions:
+                    partition = await self._build(group, documents)
+                    if partition is not None:
+                        partitions[tenant] = partition
+            self._fully_loaded.add(group)
+
+    async def _fetch(self, group: Tuple[str, str], *tenant: Any) -> List[Dict[str, Any]]:
+        """Documents carrying the vector field, for one tenant when given (tenant may be None)."""
+        collection, field = group
+        tenant_clause = ""
+        bind_vars: Dict[str, Any] = {}
+        if tenant:
+            tenant_clause = f"FILTER doc.{_TENANT_FIELD} == @tenant_id"
+            bind_vars["tenant_id"] = tenant[0]
+        query = f"""
+        FOR doc IN {collection}
+        {tenant_clause}
+        FILTER doc.{field} != null
+        RETURN doc
+        """
+        return await self._arango.execute_aql(query, bind_vars=bind_vars, batch_size=1000)
+
+    async def _build(self, group: Tuple[str, str], documents: List[Dict[str, Any]]) -> Optional[_Partition]:
+        field = group[1]
+        documents = [doc for doc in documents if doc.get("_key") and doc.get(field)]
+        if not documents:
+            return None
+        index = self._new_index(len(documents[0][field]))
+        self._add(index, documents, field)
+        if index.needs_rebuild():
+            index = await asyncio.to_thread(index.rebuilt)
+        self._stats["partitions_loaded"] += 1
+        return _Partition(index)
+
+    def _snapshot_path(self, group: Tuple[str, str], tenant: Any) -> str:
+        collection, field = group
+        digest = hashlib.sha256(json.dumps(tenant).encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.index_dir, collection, field, digest)
+
+    async def _load_snapshot(self, group: Tuple[str, str], tenant: Any) -> Optional[_Partition]:
+        if self.index_dir is None:
+            return None
+        path = self._snapshot_path(group, tenant)
+        if not os.path.exists(f"{path}.npz"):
+            return None
+        try:
+            index = await asyncio.to_thread(IVFFlatIndex.load, path, self.nprobe, self.train_threshold)
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning(f"Ignoring unreadable vector index snapshot {path}: {e}")
+            return None
+        # Snapshots are a warm start only: reload from ArangoDB when the collection moved on
+        if await self._count(group, tenant) != len(index):
+            return None
+        self._stats["snapshots_loaded"] += 1
+        return _Partition(index)
+
+    async def _count(self, group: Tuple[str, str], tenant: Any) -> Optional[int]:
+        collection, field = group
+        query = f"""
+        FOR doc IN {collection}
+        FILTER doc.{_TENANT_FIELD} == @tenant_id AND doc.{field} != null
+        COLLECT WITH COUNT INTO total
+        RETURN total
+        """
+        result = await self._arango.execute_aql(query, bind_vars={"tenant_id": tenant})
+        return result[0] if result else None
+
+    async def _hydrate(self, collection_name: str, hits: List[Tuple[str, float]]) -> List[Dict[str, Any]]:
+        """Fetch matched documents in one query and attach similarity, in rank order."""
+        if not hits:
+            return []
+        query = f"""
+        FOR doc IN {collection_name}
+        FILTER doc._key IN @keys
+        RETURN doc
+        """
+        documents = await self._arango.execute_aql(query, bind_vars={"keys": [key for key, _ in hits]})
+        by_key = {doc.get("_key"): doc for doc in documents}
+        return [
+            {**by_key[key], "similarity": similarity}
+            for key, similarity in hits
+            if key in by_key
+        ]
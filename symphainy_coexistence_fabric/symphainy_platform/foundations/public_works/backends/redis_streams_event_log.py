@@ -42,6 +42,19 @@ class RedisStreamsEventLogBackend:
             approximate=approximate
         )
 
+    async def xadd_many(
+        self,
+        entries: List[Tuple[str, Dict[str, str]]],
+        maxlen: Optional[int] = None,
+        approximate: bool = True
+    ) -> List[Optional[str]]:
+        """Append entries in one pipelined round trip. Delegates to RedisAdapter."""
+        return await self._redis.xadd_many(
+            entries,
+            maxlen=maxlen,
+            approximate=approximate
+        )
+
     async def xrange(
         self,
         stream_name: str,
@@ -0,0 +1,146 @@
+"""
+Column Profile Cache - Two-tier cache of parsed-file column profiles
+
+Lets deterministic embeddings, metrics and data quality share one column profile per
+parsed file (ColumnProfileService) instead of each scanning the rows again.
+
+WHAT (Infrastructure Role): I remember column profiles by (tenant, parsed_file_id)
+HOW (Infrastructure Implementation): I keep an in-process LRU in front of a shared Redis tier
+                                     holding profiles as JSON, and coalesce concurrent requests
+                                     for the same parsed file into one computation
+
+Parsed files are immutable (a re-parse gets a new parsed_file_id), so entries are never
+stale; they only expire.
+"""
+
+import asyncio
+import json
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from utilities import get_logger
+
+
+DEFAULT_LOCAL_MAX_ENTRIES = 256
+
+DEFAULT_SHARED_TTL_SECONDS = 7 * 24 * 3600
+
+_KEY_PREFIX = "colprofile:v1"
+
+
+class ColumnProfileCache:
+    """
+    In-process LRU plus optional shared Redis tier, with single-flight computation.
+
+    Shared-tier failures degrade to cache misses (the profile is recomputed), never to errors.
+    """
+
+    def __init__(
+        self,
+        redis_adapter: Optional[Any] = None,
+        local_max_entries: int = DEFAULT_LOCAL_MAX_ENTRIES,
+        shared_ttl_seconds: Optional[int] = DEFAULT_SHARED_TTL_SECONDS
+    ):
+        """
+        Initialize column profile cache.
+
+        Args:
+            redis_adapter: RedisAdapter for the shared tier (None = in-process only)
+            local_max_entries: Maximum profiles held in the in-process LRU
+            shared_ttl_seconds: Expiry for shared entries (None = no expiry)
+        """
+        self.redis = redis_adapter
+        self.local_max_entries = local_max_entries
+        self.shared_ttl_seconds = shared_ttl_seconds
+        self.logger = get_logger(self.__class__.__name__)
+        self._local: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._in_flight: Dict[Tuple[str, str], "asyncio.Future[Dict[str, Any]]"] = {}
+        self._stats = {"local_hits": 0, "shared_hits": 0, "misses": 0, "coalesced": 0}
+
+    async def get(self, tenant_id: str, parsed_file_id: str) -> Optional[Dict[str, Any]]:
+        """Cached profile from either tier, or None."""
+        key = (tenant_id, parsed_file_id)
+        profile = self._local.get(key)
+        if profile is not None:
+            self._local.move_to_end(key)
+            self._stats["local_hits"] += 1
+            return profile
+        if self.redis is None:
+            return None
+        payload = await self.redis.get(self._shared_key(tenant_id, parsed_file_id))
+        if payload is None:
+            return None
+        try:
+            profile = json.loads(payload)
+        except (ValueError, TypeError) as e:
+            self.logger.warning(f"Discarding unreadable cached column profile {parsed_file_id}: {e}")
+            return None
+        self._remember(key, profile)
+        self._stats["shared_hits"] += 1
+        return profile
+
+    async def put(self, tenant_id: str, parsed_file_id: str, profile: Dict[str, Any]) -> None:
+        """Store a profile in both tiers."""
+        self._remember((tenant_id, parsed_file_id), profile)
+        if self.redis is not None:
+            await self.redis.set(
+                self._shared_key(tenant_id, parsed_file_id),
+                json.dumps(profile, default=str),
+                ttl=self.shared_ttl_seconds
+            )
+
+    async def get_or_compute(
+        self,
+        tenant_id: str,
+        parsed_file_id: str,
+        compute: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Cached profile, or compute() stored in both tiers.
+
+        Concurrent calls for the same parsed file in this process share one compute().
+        """
+        profile = await self.get(tenant_id, parsed_file_id)
+        if profile is not None:
+            return profile
+        key = (tenant_id, parsed_file_id)
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            self._stats["coalesced"] += 1
+            return await asyncio.shield(pending)
+
+        self._stats["misses"] += 1
+        future: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            profile = await compute()
+            await self.put(tenant_id, parsed_file_id, profile)
+            future.set_result(profile)
+            return profile
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # retrieved here so an unawaited failure is not logged as lost
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+    def invalidate(self, tenant_id: str, parsed_file_id: str) -> None:
+        """Drop the in-process entry (shared entries expire on their own)."""
+        self._local.pop((tenant_id, parsed_file_id), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit / miss / coalesced counters and in-process size."""
+        return {**self._stats, "local_entries": len(self._local)}
+
+    def _remember(self, key: Tuple[str, str], profile: Dict[str, Any]) -> None:
+        self._local[key] = profile
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_max_entries:
+            self._local.popitem(last=False)
+
+    @staticmethod
+    def _shared_key(tenant_id: str, parsed_file_id: str) -> str:
+        return f"{_KEY_PREFIX}:{tenant_id}:{parsed_file_id}"
@@ -0,0 +1,391 @@
+"""
+Conversation Log - Append-only chat history with windowed reads
+
+Stores guide and liaison chat turns without rewriting the whole conversation on
+every message.
+
+WHAT (Infrastructure Role): I keep each conversation's turns, routing and running summary
+HOW (Infrastructure Implementation): turns are a Redis list per conversation (RPUSH append,
+                                     LRANGE tail reads; each append refreshes the TTL of both
+                                     keys in the same MULTI); a small JSON meta record holds the
+                                     route, the summary of compacted turns and a version that
+                                     every meta change compares-and-swaps (WATCH/MULTI), so
+                                     parallel tabs never overwrite each other's changes
+
+Once a conversation grows past compact_threshold turns, a background task folds the
+oldest turns into the summary and trims them from the list in the same transaction.
+Appends only touch the list tail, so they never conflict with compaction. Without
+Redis an in-process store with the same semantics is used (single process only).
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from utilities import get_logger
+
+
+DEFAULT_WINDOW = 20
+
+DEFAULT_COMPACT_THRESHOLD = 200
+
+DEFAULT_KEEP_RECENT = 50
+
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+
+SUMMARY_MAX_CHARS = 4000
+
+_KEY_PREFIX = "conversation:v1"
+
+Summarizer = Callable[[str, List[Dict[str, Any]], Optional[str]], Awaitable[str]]
+
+
+def extractive_summary(previous: str, messages: List[Dict[str, Any]], max_chars: int = SUMMARY_MAX_CHARS) -> str:
+    """Previous summary plus one clipped line per turn, keeping the most recent max_chars."""
+    lines = [previous] if previous else []
+    for message in messages:
+        text = " ".join(str(message.get("text") or message.get("content") or "").split())
+        if text:
+            lines.append(f"{message.get('role', 'user')}: {text[:200]}")
+    return "\n".join(lines)[-max_chars:]
+
+
+def make_llm_summarizer(llm_adapter: Any, model: str = "gpt-4o-mini", max_tokens: int = 400) -> Summarizer:
+    """
+    Summarizer that asks the LLM to fold turns into the running summary.
+
+    Falls back to extractive_summary when the call fails. Through an LLMGateway the
+    call is charged to the conversation's tenant in the batch lane.
+    """
+    from .llm_gateway import LLMGateway
+
+    logger = get_logger("ConversationSummarizer")
+
+    async def summarize(previous: str, messages: List[Dict[str, Any]], tenant_id: Optional[str] = None) -> str:
+        transcript = "\n".join(
+            f"{message.get('role', 'user')}: {message.get('text') or message.get('content') or ''}"
+            for message in messages
+        )
+        request = {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": (
+                    "You maintain a running summary of a conversation between a user and a platform assistant. "
+                    "Keep goals, decisions, facts about the user's business and open questions. Be concise."
+                )},
+                {"role": "user", "content": f"Current summary:\n{previous or '(none)'}\n\nNew turns:\n{transcript}\n\nUpdated summary:"},
+            ],
+            "max_tokens": max_tokens,
+            "temperature": 0.2,
+        }
+        try:
+            if isinstance(llm_adapter, LLMGateway):
+                response = await llm_adapter.generate_completion(request, tenant_id=tenant_id, priority="batch")
+            else:
+                response = await llm_adapter.generate_completion(request)
+            content = response["choices"][0]["message"]["content"].strip()
+            if content:
+                return content[:SUMMARY_MAX_CHARS]
+        except Exception as e:
+            logger.warning(f"LLM conversation summary failed (using extractive summary): {e}")
+        return extractive_summary(previous, messages)
+
+    return summarize
+
+
+class ConversationLog:
+    """Append-only conversation turns plus versioned meta; see module docstring."""
+
+    def __init__(
+        self,
+        redis_adapter: Optional[Any] = None,
+        summarizer: Optional[Summarizer] = None,
+        window: int = DEFAULT_WINDOW,
+        compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+        keep_recent: int = DEFAULT_KEEP_RECENT,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS
+    ):
+        """
+        Initialize conversation log.
+
+        Args:
+            redis_adapter: RedisAdapter (None = in-process store)
+            summarizer: async (previous_summary, turns, tenant_id) -> summary
+                        (default: extractive_summary)
+            window: Turns returned by read_window() by default
+            compact_threshold: Stored turns that trigger background compaction
+            keep_recent: Turns left uncompacted after compaction
+            ttl_seconds: Idle lifetime of a conversation (refreshed on every append)
+        """
+        self._store = redis_adapter if redis_adapter is not None else _MemoryStore()
+        self.summarizer = summarizer
+        self.window = window
+        self.compact_threshold = max(compact_threshold, keep_recent + 1)
+        self.keep_recent = keep_recent
+        self.ttl_seconds = ttl_seconds
+        self.logger = get_logger(self.__class__.__name__)
+        self._compactions: Dict[Tuple[str, str], "asyncio.Task[bool]"] = {}
+        self._stats = {"appends": 0, "window_reads": 0, "meta_conflicts": 0, "compactions": 0}
+
+    async def append(self, tenant_id: str, conversation_id: str, message: Dict[str, Any]) -> int:
+        """
+        Append one turn (O(1)).
+
+        Returns:
+            Number of turns currently stored (excluding compacted turns)
+        """
+        messages_key = self._messages_key(tenant_id, conversation_id)
+        # Meta expires with the turns, so an active conversation never loses its route or summary
+        results = await self._store.transaction([
+            ("rpush", messages_key, json.dumps(message, default=str)),
+            ("expire", messages_key, self.ttl_seconds),
+            ("expire", self._meta_key(tenant_id, conversation_id), self.ttl_seconds),
+        ])
+        length = int(results[0]) if results else 0
+        self._stats["appends"] += 1
+        if length > self.compact_threshold:
+            self._schedule_compaction(tenant_id, conversation_id)
+        return length
+
+    async def read_window(
+        self,
+        tenant_id: str,
+        conversation_id: str,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Read the conversation's meta and its most recent turns.
+
+        Returns:
+            Dict with surface, agent_type, agent_id, summary (of compacted turns),
+            version (for update_meta), messages (last `limit` turns, oldest first)
+            and total_messages (including compacted turns)
+        """
+        limit = self.window if limit is None else limit
+        messages_key = self._messages_key(tenant_id, conversation_id)
+        meta, _ = await self._read_meta(tenant_id, conversation_id)
+        raw_messages, length = await asyncio.gather(
+            self._store.lrange(messages_key, -limit, -1) if limit > 0 else _empty(),
+            self._store.llen(messages_key)
+        )
+        messages = []
+        for raw in raw_messages:
+            try:
+                messages.append(json.loads(raw))
+            except (TypeError, ValueError):
+                self.logger.warning(f"Skipping unreadable turn in conversation {conversation_id}")
+        self._stats["window_reads"] += 1
+        return {
+            "surface": meta.get("surface"),
+            "agent_type": meta.get("agent_type"),
+            "agent_id": meta.get("agent_id"),
+            "summary": meta.get("summary", ""),
+            "version": meta.get("version", 0),
+            "messages": messages,
+            "total_messages": length + meta.get("compacted_messages", 0),
+        }
+
+    async def update_meta(
+        self,
+        tenant_id: str,
+        conversation_id: str,
+        changes: Dict[str, Any],
+        expected_version: Optional[int] = None,
+        retries: int = 3
+    ) -> bool:
+        """
+        Change meta fields (route, surface, ...) with optimistic concurrency.
+
+        Args:
+            changes: Fields to set
+            expected_version: Only apply if meta is still at this version (from read_window);
+                              None = apply on top of whatever is current, retrying on races
+            retries: Attempts when expected_version is None
+
+        Returns:
+            True if applied; False if the version moved (re-read and decide again)
+        """
+        meta_key = self._meta_key(tenant_id, conversation_id)
+        for _ in range(max(1, retries)):
+            meta, raw = await self._read_meta(tenant_id, conversation_id)
+            if expected_version is not None and meta.get("version", 0) != expected_version:
+                self._stats["meta_conflicts"] += 1
+                return False
+            updated = {**meta, **changes, "version": meta.get("version", 0) + 1}
+            if await self._store.compare_and_swap(
+                meta_key, raw, [("setex", meta_key, self.ttl_seconds, json.dumps(updated))]
+            ):
+                return True
+            self._stats["meta_conflicts"] += 1
+            if expected_version is not None:
+                return False
+        return False
+
+    async def compact(self, tenant_id: str, conversation_id: str) -> bool:
+        """
+        Fold all but the keep_recent newest turns into the summary and trim them.
+
+        Returns:
+            True if turns were compacted; False if there was nothing to do or another
+            writer changed the meta first (the next append retries)
+        """
+        messages_key = self._messages_key(tenant_id, conversation_id)
+        meta_key = self._meta_key(tenant_id, conversation_id)
+        meta, raw = await self._read_meta(tenant_id, conversation_id)
+        count = await self._store.llen(messages_key) - self.keep_recent
+        if count <= 0:
+            return False
+
+        oldest = []
+        for item in await self._store.lrange(messages_key, 0, count - 1):
+            try:
+                oldest.append(json.loads(item))
+            except (TypeError, ValueError):
+                continue
+        previous = meta.get("summary", "")
+        if self.summarizer is not None:
+            summary = await self.summarizer(previous, oldest, tenant_id)
+        else:
+            summary = extractive_summary(previous, oldest)
+
+        updated = {
+            **meta,
+            "summary": summary,
+            "compacted_messages": meta.get("compacted_messages", 0) + count,
+            "version": meta.get("version", 0) + 1,
+        }
+        # Meta and trim commit together: a lost race leaves both untouched
+        compacted = await self._store.compare_and_swap(meta_key, raw, [
+            ("setex", meta_key, self.ttl_seconds, json.dumps(updated)),
+            ("ltrim", messages_key, count, -1),
+        ])
+        if compacted:
+            self._stats["compactions"] += 1
+            self.logger.debug(f"Compacted {count} turns of conversation {conversation_id}")
+        return compacted
+
+    async def aclose(self) -> None:
+        """Wait for in-flight background compactions."""
+        if self._compactions:
+            await asyncio.gather(*self._compactions.values(), return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Append, read, conflict and compaction counters."""
+        return {**self._stats, "compactions_running": len(self._compactions)}
+
+    # ============================================================================
+    # INTERNALS
+    # ============================================================================
+
+    def _schedule_compaction(self, tenant_id: str, conversation_id: str) -> None:
+        key = (tenant_id, conversation_id)
+        if key in self._compactions:
+            return
+        task = asyncio.ensure_future(self._compact_in_background(tenant_id, conversation_id))
+        self._compactions[key] = task
+        task.add_done_callback(lambda _: self._compactions.pop(key, None))
+
+    async def _compact_in_background(self, tenant_id: str, conversation_id: str) -> bool:
+        try:
+            return await self.compact(tenant_id, conversation_id)
+        except Exception as e:
+            self.logger.warning(f"Conversation compaction failed for {conversation_id}: {e}")
+            return False
+
+    async def _read_meta(self, tenant_id: str, conversation_id: str) -> Tuple[Dict[str, Any], Optional[str]]:
+        raw = await self._store.get(self._meta_key(tenant_id, conversation_id))
+        if raw is None:
+            return {}, None
+        try:
+            return json.loads(raw), raw
+        except (TypeError, ValueError):
+            self.logger.warning(f"Unreadable meta for conversation {conversation_id}; starting fresh")
+            return {}, raw
+
+    @staticmethod
+    def _messages_key(tenant_id: str, conversation_id: str) -> str:
+        return f"{_KEY_PREFIX}:{tenant_id}:{conversation_id}:messages"
+
+    @staticmethod
+    def _meta_key(tenant_id: str, conversation_id: str) -> str:
+        return f"{_KEY_PREFIX}:{tenant_id}:{conversation_id}:meta"
+
+
+async def _empty() -> List[str]:
+    return []
+
+
+class _MemoryStore:
+    """In-process stand-in for the RedisAdapter operations ConversationLog uses."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._values: Dict[str, Any] = {}
+        self._expires: Dict[str, float] = {}
+        self._clock = clock
+
+    async def rpush(self, key: str, value: str) -> int:
+        items = self._live(key, default=[])
+        items.append(value)
+        self._values[key] = items
+        return len(items)
+
+    async def llen(self, key: str) -> int:
+        return len(self._live(key, default=[]))
+
+    async def lrange(self, key: str, start: int, end: int) -> List[str]:
+        items = self._live(key, default=[])
+        return items[slice(*_redis_range(len(items), start, end))]
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._live(key)
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        if key not in self._values:
+            return False
+        self._expires[key] = self._clock() + ttl
+        return True
+
+    async def compare_and_swap(self, watch_key: str, expected: Optional[str], commands: Sequence[Tuple[Any, ...]]) -> bool:
+        # Single-threaded event loop: nothing can interleave between the check and the writes
+        if self._live(watch_key) != expected:
+            return False
+        await self.transaction(commands)
+        return True
+
+    async def transaction(self, commands: Sequence[Tuple[Any, ...]]) -> List[Any]:
+        results = []
+        for name, *args in commands:
+            if name == "rpush":
+                results.append(await self.rpush(*args))
+            elif name == "expire":
+                results.append(await self.expire(*args))
+            elif name == "setex":
+                key, ttl, value = args
+                self._values[key] = value
+                self._expires[key] = self._clock() + ttl
+                results.append(True)
+            elif name == "ltrim":
+                key, start, end = args
+                items = self._live(key, default=[])
+                self._values[key] = items[slice(*_redis_range(len(items), start, end))]
+                results.append(True)
+            else:
+                raise ValueError(f"Unsupported command: {name}")
+        return results
+
+    def _live(self, key: str, default: Any = None) -> Any:
+        expires_at = self._expires.get(key)
+        if expires_at is not None and expires_at <= self._clock():
+            self._values.pop(key, None)
+            self._expires.pop(key, None)
+        return self._values.get(key, default)
+
+
+def _redis_range(length: int, start: int, end: int) -> Tuple[int, int]:
+    """Redis inclusive (start, end) with negative indexes -> Python slice bounds."""
+    if start < 0:
+        start = max(length + start, 0)
+    if end < 0:
+        end = length + end
+    return start, max(end + 1, start)
@@ -0,0 +1,185 @@
+"""
+Embedding Cache - Two-tier cache of embedding vectors
+
+Reuses vectors for identical text (column names, sample values, boilerplate chunks)
+across files and tenants instead of re-embedding it.
+
+WHAT (Infrastructure Role): I remember embeddings by (model, dimension, normalized text hash)
+HOW (Infrastructure Implementation): I keep an in-process LRU in front of a shared Redis tier
+                                     holding packed float32 vectors, read and written in bulk
+                                     (one MGET / one pipelined SET per batch)
+
+Text is normalized the same way DeterministicChunk.text_hash is computed (whitespace
+collapsed, stripped, SHA-256), so chunk hashes can be used as cache keys directly.
+"""
+
+import base64
+import hashlib
+import re
+import sys
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utilities import get_logger
+
+
+DEFAULT_LOCAL_MAX_ENTRIES = 50_000
+
+DEFAULT_SHARED_TTL_SECONDS = 30 * 24 * 3600
+
+_WHITESPACE = re.compile(r"\s+")
+
+_KEY_PREFIX = "embcache:v1"
+
+
+def normalized_text_hash(text: str) -> str:
+    """SHA-256 of whitespace-normalized text (matches DeterministicChunk.text_hash)."""
+    normalized = _WHITESPACE.sub(" ", text.strip())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def pack_vector(vector: List[float]) -> str:
+    """Pack a vector as base64 little-endian float32 (Redis client decodes responses as text)."""
+    packed = array("f", vector)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+def unpack_vector(payload: str) -> List[float]:
+    """Inverse of pack_vector."""
+    packed = array("f")
+    packed.frombytes(base64.b64decode(payload))
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tolist()
+
+
+class EmbeddingCache:
+    """
+    In-process LRU plus optional shared Redis tier.
+
+    `dimension` in keys is the requested output dimension; None means the model's
+    native dimension. Shared-tier failures degrade to cache misses (the vector is
+    recomputed), never to errors.
+    """
+
+    def __init__(
+        self,
+        redis_adapter: Optional[Any] = None,
+        local_max_entries: int = DEFAULT_LOCAL_MAX_ENTRIES,
+        shared_ttl_seconds: Optional[int] = DEFAULT_SHARED_TTL_SECONDS
+    ):
+        """
+        Initialize embedding cache.
+
+        Args:
+            redis_adapter: RedisAdapter for the shared tier (None = in-process only)
+            local_max_entries: Maximum vectors held in the in-process LRU
+            shared_ttl_seconds: Expiry for shared entries (None = no expiry)
+        """
+        self.redis = redis_adapter
+        self.local_max_entries = local_max_entries
+        self.shared_ttl_seconds = shared_ttl_seconds
+        self.logger = get_logger(self.__class__.__name__)
+        self._local: "OrderedDict[Tuple[str, Optional[int], str], List[float]]" = OrderedDict()
+        self._stats = {"local_hits": 0, "shared_hits": 0, "misses": 0, "stores": 0}
+
+    def get_local(self, text_hash: str, model: str, dimension: Optional[int] = None) -> Optional[List[float]]:
+        """In-process lookup only (no I/O)."""
+        key = (model, dimension, text_hash)
+        vector = self._local.get(key)
+        if vector is not None:
+            self._local.move_to_end(key)
+            self._stats["local_hits"] += 1
+        return vector
+
+    async def get_many(
+        self,
+        text_hashes: Iterable[str],
+        model: str,
+        dimension: Optional[int] = None
+    ) -> Dict[str, List[float]]:
+        """
+        Bulk lookup: in-process first, then one shared-tier read for the rest.
+
+        Args:
+            text_hashes: Normalized text hashes to look up
+            model: Embedding model
+            dimension: Requested output dimension (None = model native)
+
+        Returns:
+            Dict of text_hash -> vector for every hit (misses are absent)
+        """
+        found: Dict[str, List[float]] = {}
+        remote: List[str] = []
+        for text_hash in dict.fromkeys(text_hashes):
+            vector = self.get_local(text_hash, model, dimension)
+            if vector is not None:
+                found[text_hash] = vector
+            else:
+                remote.append(text_hash)
+
+        if remote and self.redis is not None:
+            payloads = await self.redis.mget([self._shared_key(h, model, dimension) for h in remote])
+            for text_hash, payload in zip(remote, payloads):
+                if payload is None:
+                    continue
+                try:
+                    vector = unpack_vector(payload)
+                except (ValueError, TypeError) as e:
+                    self.logger.warning(f"Discarding unreadable cached embedding {text_hash[:12]}: {e}")
+                    continue
+                if dimension is not None and len(vector) != dimension:
+                    continue
+                found[text_hash] = vector
+                self._remember(text_hash, model, dimension, vector)
+                self._stats["shared_hits"] += 1
+
+        self._stats["misses"] += len(remote) - sum(1 for h in remote if h in found)
+        return found
+
+    async def put_many(
+        self,
+        vectors: Dict[str, List[float]],
+        model: str,
+        dimension: Optional[int] = None
+    ) -> None:
+        """
+        Store vectors in both tiers (one shared-tier write).
+
+        Args:
+            vectors: Dict of text_hash -> vector
+            model: Embedding model
+            dimension: Requested output dimension (None = model native)
+        """
+        if not vectors:
+            return
+        for text_hash, vector in vectors.items():
+            self._remember(text_hash, model, dimension, list(vector))
+        self._stats["stores"] += len(vectors)
+        if self.redis is not None:
+            await self.redis.mset(
+                {self._shared_key(h, model, dimension): pack_vector(v) for h, v in vectors.items()},
+                ttl=self.shared_ttl_seconds
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit / miss counters and in-process size."""
+        stats = dict(self._stats)
+        lookups = stats["local_hits"] + stats["shared_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["local_hits"] + stats["shared_hits"]) / lookups, 4) if lookups else 0.0
+        stats["local_entries"] = len(self._local)
+        return stats
+
+    def _remember(self, text_hash: str, model: str, dimension: Optional[int], vector: List[float]) -> None:
+        key = (model, dimension, text_hash)
+        self._local[key] = vector
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_max_entries:
+            self._local.popitem(last=False)
+
+    @staticmethod
+    def _shared_key(text_hash: str, model: str, dimension: Optional[int]) -> str:
+        return f"{_KEY_PREFIX}:{model}:{dimension or 'native'}:{text_hash}"
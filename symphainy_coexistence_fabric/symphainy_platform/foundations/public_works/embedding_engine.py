@@ -0,0 +1,205 @@
+"""
+Embedding Engine - Cross-request micro-batching for embedding providers
+
+Coalesces concurrent single-text embedding requests into batched provider calls.
+
+WHAT (Infrastructure Role): I turn many small embedding requests into few large ones
+HOW (Infrastructure Implementation): I queue texts per model, flush a batch when it reaches
+                                     max_batch_size or max_wait_ms has passed since the first
+                                     queued text, and bound in-flight batches with a semaphore
+
+Each LLM adapter owns one engine (one per provider), so the in-flight bound is per provider.
+Identical texts within a batch are sent once. With an EmbeddingCache, in-process hits
+return without queueing and each batch checks the shared tier before calling the provider.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from utilities import get_logger
+from .embedding_cache import EmbeddingCache, normalized_text_hash
+
+
+DEFAULT_MAX_BATCH_SIZE = 64
+
+DEFAULT_MAX_WAIT_MS = 5.0
+
+DEFAULT_MAX_IN_FLIGHT = 4
+
+# (texts, model) -> one vector per text, in order
+BatchEmbedFn = Callable[[List[str], str], Awaitable[List[List[float]]]]
+
+
+class EmbeddingEngine:
+    """Micro-batching front for a provider's batch embedding call."""
+
+    def __init__(
+        self,
+        provider: str,
+        embed_batch: BatchEmbedFn,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        cache: Optional[EmbeddingCache] = None
+    ):
+        """
+        Initialize embedding engine.
+
+        Args:
+            provider: Provider name (for logs and stats)
+            embed_batch: Provider call embedding a list of texts with one model
+            max_batch_size: Maximum texts per provider call
+            max_wait_ms: Longest a queued text waits for its batch to fill
+            max_in_flight: Maximum concurrent provider calls
+            cache: Optional embedding cache consulted before the provider
+        """
+        if max_batch_size < 1 or max_in_flight < 1 or max_wait_ms < 0:
+            raise ValueError(
+                "max_batch_size and max_in_flight must be positive and max_wait_ms non-negative"
+            )
+        self.provider = provider
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.max_in_flight = max_in_flight
+        self._embed_batch = embed_batch
+        self.cache = cache
+        self.logger = get_logger(self.__class__.__name__)
+
+        # Queues are bound to the running event loop (rebuilt if the loop changes)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Dict[str, List[Tuple[str, asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats = {"requests": 0, "texts": 0, "batches": 0, "sent_texts": 0, "errors": 0}
+
+    async def embed(self, text: str, model: str) -> List[float]:
+        """Embed one text; it is sent together with other queued texts for the same model."""
+        return (await self.embed_many([text], model))[0]
+
+    async def embed_many(self, texts: List[str], model: str) -> List[List[float]]:
+        """
+        Embed several texts, sharing batches with concurrent callers.
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model
+
+        Returns:
+            One vector per text, in order
+
+        Raises:
+            Exception: The provider error of any batch carrying one of these texts
+        """
+        if not texts:
+            return []
+        loop = self._bind()
+        self._stats["requests"] += 1
+        self._stats["texts"] += len(texts)
+        if self.cache is None:
+            return list(await asyncio.gather(*(self._submit(loop, text, model) for text in texts)))
+
+        # In-process cache hits return immediately; only misses are queued
+        vectors: List[Optional[List[float]]] = [
+            self.cache.get_local(normalized_text_hash(text), model) for text in texts
+        ]
+        misses = [index for index, vector in enumerate(vectors) if vector is None]
+        if misses:
+            computed = await asyncio.gather(*(self._submit(loop, texts[index], model) for index in misses))
+            for index, vector in zip(misses, computed):
+                vectors[index] = vector
+        return vectors
+
+    async def flush(self) -> None:
+        """Send everything queued now and wait for in-flight batches to finish."""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        for model in list(self._pending):
+            self._flush(model)
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Request / batch counters (mean_batch_size = texts sent per provider call)."""
+        stats = dict(self._stats)
+        stats["provider"] = self.provider
+        stats["mean_batch_size"] = (
+            round(stats["sent_texts"] / stats["batches"], 2) if stats["batches"] else 0.0
+        )
+        return stats
+
+    def _bind(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._pending = {}
+            self._timers = {}
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._tasks = set()
+        return loop
+
+    def _submit(self, loop: asyncio.AbstractEventLoop, text: str, model: str) -> asyncio.Future:
+        future = loop.create_future()
+        pending = self._pending.setdefault(model, [])
+        pending.append((text, future))
+        if len(pending) >= self.max_batch_size:
+            self._flush(model)
+        elif model not in self._timers:
+            self._timers[model] = loop.call_later(self.max_wait_ms / 1000.0, self._flush, model)
+        return future
+
+    def _flush(self, model: str) -> None:
+        timer = self._timers.pop(model, None)
+        if timer:
+            timer.cancel()
+        pending = self._pending.pop(model, [])
+        for start in range(0, len(pending), self.max_batch_size):
+            batch = pending[start:start + self.max_batch_size]
+            task = self._loop.create_task(self._dispatch(model, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, model: str, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        batch = [(text, future) for text, future in batch if not future.done()]
+        if not batch:
+            return
+        unique = list(dict.fromkeys(text for text, _ in batch))
+        async with self._semaphore:
+            try:
+                by_text = await self._embed_unique(unique, model)
+            except Exception as e:
+                self._stats["errors"] += 1
+                self.logger.error(
+                    f"{self.provider} embedding batch failed ({len(unique)} texts, model={model}): {e}"
+                )
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+        for text, future in batch:
+            if not future.done():
+                future.set_result(by_text[text])
+
+    async def _embed_unique(self, texts: List[str], model: str) -> Dict[str, List[float]]:
+        """Resolve texts from the shared cache tier, embedding (and caching) the rest."""
+        by_text: Dict[str, List[float]] = {}
+        hashes: Dict[str, str] = {}
+        if self.cache is not None:
+            hashes = {text: normalized_text_hash(text) for text in texts}
+            cached = await self.cache.get_many(hashes.values(), model)
+            by_text = {text: cached[h] for text, h in hashes.items() if h in cached}
+        missing = [text for text in texts if text not in by_text]
+        if not missing:
+            return by_text
+
+        self._stats["batches"] += 1
+        self._stats["sent_texts"] += len(missing)
+        vectors = await self._embed_batch(missing, model)
+        if len(vectors) != len(missing):
+            raise RuntimeError(
+                f"{self.provider} returned {len(vectors)} embeddings for {len(missing)} texts"
+            )
+        by_text.update(zip(missing, vectors))
+        if self.cache is not None:
+            await self.cache.put_many({hashes[text]: vector for text, vector in zip(missing, vectors)}, model)
+        return by_text
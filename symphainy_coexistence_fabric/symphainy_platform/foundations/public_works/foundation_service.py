@@ -13,7 +13,8 @@ Rules:
 - Foundations are deterministic
 """
 
-from typing import Dict, Any, Optional
+import asyncio
+from typing import Dict, Any, List, Optional
 from utilities import get_logger
 
 from .adapters.redis_adapter import RedisAdapter
@@ -49,16 +50,55 @@ from .protocols.correlation_map_protocol import CorrelationMapProtocol
 from .protocols.full_text_search_protocol import FullTextSearchProtocol
 from .protocols.graph_query_protocol import GraphQueryProtocol
 from .protocols.knowledge_discovery_protocol import KnowledgeDiscoveryProtocol
+from .protocols.hybrid_retrieval_protocol import HybridRetrievalProtocol
 from .protocols.event_publisher_protocol import EventPublisherProtocol
 from .protocols.event_log_protocol import EventLogProtocol
 from .protocols.data_governance_protocol import DataGovernanceProtocol
 from .protocols.wal_query_protocol import WALQueryProtocol
 from .protocols.solution_registry_protocol import SolutionRegistryProtocol
 from .protocols.visual_generation_protocol import VisualGenerationProtocol
-from .backends import create_event_log_backend
+from .backends import create_event_log_backend, create_vector_backend
 from .protocols.deterministic_embedding_storage_protocol import DeterministicEmbeddingStorageProtocol
 from .protocols.file_parsing_protocol import FileParsingProtocol
 from .document_parsing_router import DocumentParsingRouter
+from .startup import StartupOrchestrator, StartupStep, StartupTimings, DEFAULT_STEP_TIMEOUT_SECONDS
+from .embedding_engine import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS, DEFAULT_MAX_IN_FLIGHT
+from .embedding_cache import EmbeddingCache, DEFAULT_LOCAL_MAX_ENTRIES, DEFAULT_SHARED_TTL_SECONDS
+from .llm_gateway import (
+    LLMGateway,
+    DEFAULT_REQUESTS_PER_MINUTE,
+    DEFAULT_TOKENS_PER_MINUTE,
+    DEFAULT_MAX_IN_FLIGHT as DEFAULT_LLM_MAX_IN_FLIGHT,
+)
+from .conversation_log import (
+    ConversationLog,
+    make_llm_summarizer,
+    DEFAULT_WINDOW as DEFAULT_CONVERSATION_WINDOW,
+    DEFAULT_COMPACT_THRESHOLD as DEFAULT_CONVERSATION_COMPACT_THRESHOLD,
+    DEFAULT_KEEP_RECENT as DEFAULT_CONVERSATION_KEEP_RECENT,
+    DEFAULT_TTL_SECONDS as DEFAULT_CONVERSATION_TTL_SECONDS,
+)
+from .rate_limiter import DistributedRateLimiter, Quota, parse_quota_spec
+from .auth_token_cache import (
+    VerifiedTokenCache,
+    DEFAULT_LOCAL_MAX_ENTRIES as DEFAULT_AUTH_CACHE_ENTRIES,
+    DEFAULT_MAX_TTL_SECONDS as DEFAULT_AUTH_CACHE_MAX_TTL_SECONDS,
+)
+from .column_profile_cache import (
+    ColumnProfileCache,
+    DEFAULT_LOCAL_MAX_ENTRIES as DEFAULT_PROFILE_CACHE_ENTRIES,
+    DEFAULT_SHARED_TTL_SECONDS as DEFAULT_PROFILE_CACHE_TTL_SECONDS,
+)
+from .as2_message_dedup import (
+    AS2MessageDeduplicator,
+    DEFAULT_RETENTION_SECONDS as DEFAULT_AS2_DEDUP_RETENTION_SECONDS,
+    DEFAULT_BLOOM_CAPACITY as DEFAULT_AS2_DEDUP_BLOOM_CAPACITY,
+)
+from .llm_response_cache import (
+    LLMResponseCache,
+    DEFAULT_LOCAL_MAX_ENTRIES as DEFAULT_LLM_CACHE_ENTRIES,
+    DEFAULT_TTL_SECONDS as DEFAULT_LLM_CACHE_TTL_SECONDS,
+)
 
 # Layer 0: Additional Adapters
 from .adapters.meilisearch_adapter import MeilisearchAdapter
@@ -116,6 +156,7 @@ class PublicWorksFoundationService:
         # Layer 0: Ingestion Adapters
         self.upload_adapter: Optional[Any] = None
         self.edi_adapter: Optional[Any] = None
+        self.as2_message_dedup: Optional[AS2MessageDeduplicator] = None  # AS2 Message-IDs already received
         self.api_adapter: Optional[Any] = None
         
         # Layer 0: Visual Generation Adapter
@@ -123,7 +164,14 @@ class PublicWorksFoundationService:
         
         # Layer 0: LLM Adapters
         self.openai_adapter: Optional[Any] = None  # OpenAIAdapter
+        self.llm_gateway: Optional[LLMGateway] = None  # admission control in front of openai_adapter
         self.huggingface_adapter: Optional[Any] = None  # HuggingFaceAdapter
+        self.embedding_cache: Optional[EmbeddingCache] = None
+        self.column_profile_cache: Optional[ColumnProfileCache] = None  # one profile per parsed file
+        self.llm_response_cache: Optional[LLMResponseCache] = None  # opt-in per agent
+        self.conversation_log: Optional[ConversationLog] = None  # chat turns (Redis lists)
+        self.rate_limiter: Optional[DistributedRateLimiter] = None  # request quotas (Redis token buckets)
+        self.auth_token_cache: Optional[VerifiedTokenCache] = None  # verified tokens + resolved tenants
         
         # Layer 0: DuckDB Adapter
         self.duckdb_adapter: Optional[Any] = None  # DuckDBAdapter
@@ -137,7 +185,9 @@ class PublicWorksFoundationService:
         self.service_discovery_abstraction: Optional[ServiceDiscoveryAbstraction] = None
         self.semantic_search_abstraction: Optional[SemanticSearchAbstraction] = None
         self.knowledge_discovery_abstraction: Optional[Any] = None  # KnowledgeDiscoveryAbstraction
+        self.hybrid_retrieval_abstraction: Optional[HybridRetrievalProtocol] = None
         self.semantic_data_abstraction: Optional[Any] = None  # SemanticDataAbstraction
+        self._vector_backend: Optional[Any] = None  # VectorBackendProtocol (ANN index or Arango scan, from create_vector_backend)
         self.deterministic_compute_abstraction: Optional[Any] = None  # DeterministicComputeAbstraction
         self.registry_abstraction: Optional[Any] = None  # RegistryAbstraction
         self._boundary_contract_store: Optional[Any] = None  # BoundaryContractStoreProtocol
@@ -174,6 +224,10 @@ class PublicWorksFoundationService:
         # Layer 1: Ingestion Abstractions
         self.ingestion_abstraction: Optional[Any] = None  # Will import IngestionAbstraction when needed
         
+        # Startup timing breakdown (import / construct / connect / schema)
+        self.startup_timings = StartupTimings()
+        self._state_collections_ready = False
+        
         # Initialization flag
         self._initialized = False
     
@@ -190,24 +244,55 @@ class PublicWorksFoundationService:
         
         try:
             self.logger.info("Initializing Public Works Foundation...")
+            self.startup_timings = StartupTimings()
             
             # Layer 0: Create adapters
             await self._create_adapters()
             
             # Layer 1: Create abstractions
-            await self._create_abstractions()
+            with self.startup_timings.measure("abstractions", "construct"):
+                await self._create_abstractions()
             
+            self.startup_timings.finish()
             self._initialized = True
             self.logger.info("Public Works Foundation initialized successfully")
+            self.logger.info(f"Public Works startup timings: {self.startup_timings.format()}")
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to initialize Public Works Foundation: {e}", exc_info=True)
             return False
     
+    def get_startup_timings(self) -> Dict[str, Any]:
+        """
+        Get the startup timing breakdown (import / construct / connect / schema).
+        
+        Returns:
+            Dict with total_ms, per-phase wall/cumulative ms, and per-component ms
+        """
+        return self.startup_timings.summary()
+    
     async def _create_adapters(self):
-        """Create all infrastructure adapters (Layer 0). Uses only self.config (canonical config)."""
+        """
+        Create all infrastructure adapters (Layer 0). Uses only self.config (canonical config).
+        
+        Adapters are constructed first (no I/O); connects and schema initialization
+        then run concurrently via StartupOrchestrator, so startup waits on the slowest
+        dependency chain instead of the sum of every backing service.
+        """
         self.logger.info("Creating infrastructure adapters...")
+        timings = self.startup_timings
+        steps: List[StartupStep] = []
+        
+        with timings.measure("adapter_modules", "import"):
+            from .adapters.csv_adapter import CsvProcessingAdapter
+            from .adapters.excel_adapter import ExcelProcessingAdapter
+            from .adapters.pdf_adapter import PdfProcessingAdapter
+            from .adapters.word_adapter import WordProcessingAdapter
+            from .adapters.html_adapter import HtmlProcessingAdapter
+            from .adapters.image_adapter import ImageProcessingAdapter
+            from .adapters.json_adapter import JsonProcessingAdapter
+            from .adapters.visual_generation_adapter import VisualGenerationAdapter
         
         # Redis adapter
         redis_config = self.config.get("redis", {})
@@ -218,8 +303,7 @@ class PublicWorksFoundationService:
                 db=redis_config.get("db", 0),
                 password=redis_config.get("password")
             )
-            await self.redis_adapter.connect()
-            self.logger.info("Redis adapter created")
+            steps.append(StartupStep("redis", self._connect_redis))
         else:
             self.logger.warning("Redis configuration not provided, Redis adapter not created")
         
@@ -231,10 +315,7 @@ class PublicWorksFoundationService:
                 port=consul_config.get("port", 8500),
                 token=consul_config.get("token")
             )
-            if self.consul_adapter.connect():
-                self.logger.info("Consul adapter created")
-            else:
-                self.logger.warning("Consul adapter connection failed")
+            steps.append(StartupStep("consul", self._connect_consul))
         else:
             self.logger.warning("Consul configuration not provided, Consul adapter not created")
         
@@ -249,35 +330,32 @@ class PublicWorksFoundationService:
         else:
             self.logger.info("Kreuzberg configuration not provided, Kreuzberg adapter not created")
         
-        # Create parsing adapters (CSV, Excel, PDF, Word, HTML, Image, JSON)
-        from .adapters.csv_adapter import CsvProcessingAdapter
-        from .adapters.excel_adapter import ExcelProcessingAdapter
-        from .adapters.pdf_adapter import PdfProcessingAdapter
-        from .adapters.word_adapter import WordProcessingAdapter
-        from .adapters.html_adapter import HtmlProcessingAdapter
-        from .adapters.image_adapter import ImageProcessingAdapter
-        from .adapters.json_adapter import JsonProcessingAdapter
-        
-        self.csv_adapter = CsvProcessingAdapter()
-        self.logger.info("CSV adapter created")
-        
-        self.excel_adapter = ExcelProcessingAdapter()
-        self.logger.info("Excel adapter created")
-        
-        self.pdf_adapter = PdfProcessingAdapter()
-        self.logger.info("PDF adapter created")
-        
-        self.word_adapter = WordProcessingAdapter()
-        self.logger.info("Word adapter created")
-        
-        self.html_adapter = HtmlProcessingAdapter()
-        self.logger.info("HTML adapter created")
-        
-        self.image_adapter = ImageProcessingAdapter()
-        self.logger.info("Image/OCR adapter created")
-        
-        self.json_adapter = JsonProcessingAdapter()
-        self.logger.info("JSON adapter created")
+        # Create parsing adapters (CSV, Excel, PDF, Word, HTML, Image, JSON); heavy libraries load on first parse
+        with timings.measure("parsing_adapters", "construct"):
+            self.csv_adapter = CsvProcessingAdapter()
+            self.logger.info("CSV adapter created")
+            
+            self.excel_adapter = ExcelProcessingAdapter()
+            self.logger.info("Excel adapter created")
+            
+            self.pdf_adapter = PdfProcessingAdapter(
+                max_workers=self.config.get("pdf_parse_workers", 4),
+                pages_per_task=self.config.get("pdf_pages_per_task", 8),
+                page_cache_entries=self.config.get("pdf_page_cache_entries", 5000)
+            )
+            self.logger.info("PDF adapter created")
+            
+            self.word_adapter = WordProcessingAdapter()
+            self.logger.info("Word adapter created")
+            
+            self.html_adapter = HtmlProcessingAdapter()
+            self.logger.info("HTML adapter created")
+            
+            self.image_adapter = ImageProcessingAdapter()
+            self.logger.info("Image/OCR adapter created")
+            
+            self.json_adapter = JsonProcessingAdapter()
+            self.logger.info("JSON adapter created")
         
 
         # Meilisearch adapter (canonical config only)
@@ -289,10 +367,7 @@ class PublicWorksFoundationService:
             port=meilisearch_port,
             api_key=meilisearch_key
         )
-        if self.meilisearch_adapter.connect():
-            self.logger.info("Meilisearch adapter created")
-        else:
-            self.logger.warning("Meilisearch adapter connection failed")
+        steps.append(StartupStep("meilisearch", self._connect_meilisearch))
         
         # Supabase adapter (canonical config only; no env/config_helper)
         supabase_url = self.config.get("supabase_url")
@@ -312,13 +387,14 @@ class PublicWorksFoundationService:
             self.logger.info(f"   Service key preview: {key_preview}")
         
         if supabase_url and supabase_anon_key:
-            self.supabase_adapter = SupabaseAdapter(
-                url=supabase_url,
-                anon_key=supabase_anon_key,
-                service_key=supabase_service_key,
-                jwks_url=supabase_jwks_url,
-                jwt_issuer=supabase_jwt_issuer
-            )
+            with timings.measure("supabase", "construct"):
+                self.supabase_adapter = SupabaseAdapter(
+                    url=supabase_url,
+                    anon_key=supabase_anon_key,
+                    service_key=supabase_service_key,
+                    jwks_url=supabase_jwks_url,
+                    jwt_issuer=supabase_jwt_issuer
+                )
             self.logger.info("Supabase adapter created")
         else:
             self.logger.warning("Supabase configuration not provided, Supabase adapter not created")
@@ -345,23 +421,8 @@ class PublicWorksFoundationService:
                 "Please provide GCS_PROJECT_ID and GCS_BUCKET_NAME environment variables."
             )
         
-        try:
-            self.gcs_adapter = GCSAdapter(
-                project_id=gcs_project_id,
-                bucket_name=gcs_bucket_name,
-                credentials_json=gcs_credentials_json
-            )
-            self.logger.info("GCS adapter created")
-        except ImportError as e:
-            raise RuntimeError(
-                f"GCS adapter dependencies not available: {e}. "
-                "Please install: pip install google-cloud-storage google-auth"
-            )
-        except Exception as e:
-            raise RuntimeError(
-                f"GCS adapter creation failed: {e}. "
-                "Please verify GCS credentials and configuration."
-            )
+        # GCS client construction authenticates, so it runs alongside the other connects
+        steps.append(StartupStep("gcs", self._connect_gcs, required=True))
         
         # Supabase File adapter
         if supabase_url and supabase_service_key:
@@ -369,19 +430,29 @@ class PublicWorksFoundationService:
                 url=supabase_url,
                 service_key=supabase_service_key
             )
-            await self.supabase_file_adapter.connect()
-            self.logger.info("Supabase File adapter created")
+            steps.append(StartupStep("supabase_file", self._connect_supabase_file))
         else:
             self.logger.warning("Supabase File adapter not created (missing URL or service key)")
         
-        # Visual Generation adapter
-        from .adapters.visual_generation_adapter import VisualGenerationAdapter
-        self.visual_generation_adapter = VisualGenerationAdapter()
+        # Visual Generation adapter (plotly is imported on first chart)
+        with timings.measure("visual_generation", "construct"):
+            self.visual_generation_adapter = VisualGenerationAdapter()
         self.logger.info("Visual Generation adapter created")
         
         # LLM Adapters (OpenAI and HuggingFace) — canonical config only (optional keys)
         openai_api_key = self.config.get("openai_api_key")
         openai_base_url = self.config.get("openai_base_url")
+        embedding_batching = {
+            "max_batch_size": int(self.config.get("embedding_max_batch_size") or DEFAULT_MAX_BATCH_SIZE),
+            "max_wait_ms": float(self.config.get("embedding_max_wait_ms", DEFAULT_MAX_WAIT_MS)),
+            "max_in_flight": int(self.config.get("embedding_max_in_flight") or DEFAULT_MAX_IN_FLIGHT),
+        }
+        # Shared by both providers (keys include the model); Redis is the shared tier
+        self.embedding_cache = EmbeddingCache(
+            redis_adapter=self.redis_adapter,
+            local_max_entries=int(self.config.get("embedding_cache_local_entries") or DEFAULT_LOCAL_MAX_ENTRIES),
+            shared_ttl_seconds=int(self.config.get("embedding_cache_ttl_seconds") or DEFAULT_SHARED_TTL_SECONDS)
+        )
         
         if openai_api_key:
             from .adapters.openai_adapter import OpenAIAdapter
@@ -394,14 +465,65 @@ class PublicWorksFoundationService:
                 self.openai_adapter = OpenAIAdapter(
                     api_key=openai_api_key,
                     base_url=openai_base_url,
-                    config_adapter=openai_config
+                    config_adapter=openai_config,
+                    embedding_cache=self.embedding_cache,
+                    **embedding_batching
                 )
                 self.logger.info("✅ OpenAI adapter created")
+                # Every completion goes through the gateway (tenant budgets, priority lanes, 429 backoff)
+                self.llm_gateway = LLMGateway(
+                    self.openai_adapter,
+                    requests_per_minute=int(self.config.get("llm_requests_per_minute") or DEFAULT_REQUESTS_PER_MINUTE),
+                    tokens_per_minute=int(self.config.get("llm_tokens_per_minute") or DEFAULT_TOKENS_PER_MINUTE),
+                    tenant_requests_per_minute=int(self.config.get("llm_tenant_requests_per_minute") or 0) or None,
+                    tenant_tokens_per_minute=int(self.config.get("llm_tenant_tokens_per_minute") or 0) or None,
+                    max_in_flight=int(self.config.get("llm_max_in_flight") or DEFAULT_LLM_MAX_IN_FLIGHT),
+                    tenant_max_in_flight=int(self.config.get("llm_tenant_max_in_flight") or 0) or None,
+                    interactive_deadline_seconds=float(self.config.get("llm_interactive_deadline_seconds") or 30),
+                    batch_deadline_seconds=float(self.config.get("llm_batch_deadline_seconds") or 300)
+                )
+                if self.config.get("llm_response_cache_enabled", True):
+                    self.llm_response_cache = LLMResponseCache(
+                        redis_adapter=self.redis_adapter,
+                        local_max_entries=int(self.config.get("llm_response_cache_local_entries") or DEFAULT_LLM_CACHE_ENTRIES),
+                        default_ttl_seconds=int(self.config.get("llm_response_cache_ttl_seconds") or DEFAULT_LLM_CACHE_TTL_SECONDS),
+                        max_temperature=int(self.config.get("llm_response_cache_max_temperature_pct", 30)) / 100
+                    )
             except Exception as e:
                 self.logger.warning(f"OpenAI adapter creation failed: {e}")
         else:
             self.logger.warning("OpenAI API key not found, OpenAI adapter not created")
         
+        # Chat history: append-only turns in Redis, old turns summarized in the background
+        self.conversation_log = ConversationLog(
+            redis_adapter=self.redis_adapter,
+            summarizer=make_llm_summarizer(self.llm_gateway) if self.llm_gateway else None,
+            window=int(self.config.get("conversation_window") or DEFAULT_CONVERSATION_WINDOW),
+            compact_threshold=int(self.config.get("conversation_compact_threshold") or DEFAULT_CONVERSATION_COMPACT_THRESHOLD),
+            keep_recent=int(self.config.get("conversation_keep_recent") or DEFAULT_CONVERSATION_KEEP_RECENT),
+            ttl_seconds=int(self.config.get("conversation_ttl_seconds") or DEFAULT_CONVERSATION_TTL_SECONDS)
+        )
+        
+        # Column profiles shared by deterministic embeddings, metrics and data quality
+        self.column_profile_cache = ColumnProfileCache(
+            redis_adapter=self.redis_adapter,
+            local_max_entries=int(self.config.get("column_profile_cache_local_entries") or DEFAULT_PROFILE_CACHE_ENTRIES),
+            shared_ttl_seconds=int(self.config.get("column_profile_cache_ttl_seconds") or DEFAULT_PROFILE_CACHE_TTL_SECONDS)
+        )
+        
+        # Request quotas shared by all API workers (Traffic Cop, Experience endpoints, intent submission)
+        self.rate_limiter = self._create_rate_limiter()
+        
+        # Token validation hot path: verified tokens and their tenant / roles until exp
+        if self.config.get("auth_token_cache_enabled", True):
+            self.auth_token_cache = VerifiedTokenCache(
+                redis_adapter=self.redis_adapter,
+                local_max_entries=int(self.config.get("auth_token_cache_local_entries") or DEFAULT_AUTH_CACHE_ENTRIES),
+                max_ttl_seconds=int(self.config.get("auth_token_cache_max_ttl_seconds") or DEFAULT_AUTH_CACHE_MAX_TTL_SECONDS)
+            )
+            if self.supabase_adapter:
+                self.supabase_adapter.token_cache = self.auth_token_cache  # membership writes invalidate
+        
         # HuggingFace adapter (optional keys from config)
         hf_endpoint_url = self.config.get("huggingface_endpoint_url")
         hf_api_key = self.config.get("huggingface_api_key")
@@ -418,7 +540,9 @@ class PublicWorksFoundationService:
                 self.huggingface_adapter = HuggingFaceAdapter(
                     endpoint_url=hf_endpoint_url,
                     api_key=hf_api_key,
-                    config_adapter=hf_config
+                    config_adapter=hf_config,
+                    embedding_cache=self.embedding_cache,
+                    **embedding_batching
                 )
                 self.logger.info("✅ HuggingFace adapter created")
             except Exception as e:
@@ -431,7 +555,7 @@ class PublicWorksFoundationService:
             try:
                 from .abstractions.llm_abstraction import LLMAbstraction
                 self._llm_abstraction = LLMAbstraction(
-                    openai_adapter=self.openai_adapter,
+                    openai_adapter=self.llm_gateway or self.openai_adapter,
                     huggingface_adapter=self.huggingface_adapter,
                 )
                 self.logger.info("✅ LLM abstraction created (protocol-only boundary)")
@@ -448,7 +572,6 @@ class PublicWorksFoundationService:
         
         if arango_url:
             from .adapters.arango_adapter import ArangoAdapter
-            from .adapters.arango_graph_adapter import ArangoGraphAdapter
             
             self.arango_adapter = ArangoAdapter(
                 url=arango_url,
@@ -456,59 +579,152 @@ class PublicWorksFoundationService:
                 password=arango_password,
                 database=arango_database
             )
-            if await self.arango_adapter.connect():
-                self.logger.info("ArangoDB adapter created")
-                
-                # Create ArangoDB Graph adapter
-                self.arango_graph_adapter = ArangoGraphAdapter(self.arango_adapter)
-                self.logger.info("ArangoDB Graph adapter created")
-            else:
-                self.logger.warning("ArangoDB adapter connection failed")
+            steps.append(StartupStep("arango", self._connect_arango))
+            # State collections only need a live connection, not the other backends
+            steps.append(StartupStep(
+                "arango_schema",
+                self._ensure_state_collections,
+                phase="schema",
+                depends_on=("arango",),
+                required=True,
+            ))
         else:
             self.logger.warning("ArangoDB configuration not provided, ArangoDB adapter not created")
         
-        # DuckDB adapter (for deterministic compute)
-        await self._initialize_duckdb()
+        # DuckDB adapter (for deterministic compute); schema init waits on its connect only
+        if self._create_duckdb_adapter():
+            steps.append(StartupStep("duckdb", self._connect_duckdb))
+            steps.append(StartupStep(
+                "duckdb_schema",
+                self._initialize_duckdb_schema,
+                phase="schema",
+                depends_on=("duckdb",),
+            ))
+        
+        orchestrator = StartupOrchestrator(
+            timings,
+            default_timeout=float(self.config.get("startup_timeout_seconds") or DEFAULT_STEP_TIMEOUT_SECONDS),
+        )
+        statuses = await orchestrator.run(steps)
+        self.logger.info(f"Infrastructure connects finished: {statuses}")
     
-    async def _initialize_duckdb(self):
-        """Initialize DuckDB adapter and abstraction."""
-        from .adapters.duckdb_adapter import DuckDBAdapter
-        from .abstractions.deterministic_compute_abstraction import DeterministicComputeAbstraction
-        
-        duckdb_config = self.config.get("duckdb", {})
-        if duckdb_config:
-            database_path = duckdb_config.get(
-                "database_path",
-                "/app/data/duckdb/main.duckdb"  # Default path
+    async def _connect_redis(self) -> bool:
+        connected = await self.redis_adapter.connect()
+        if connected:
+            self.logger.info("Redis adapter created")
+        return connected
+    
+    async def _connect_consul(self) -> bool:
+        # python-consul is synchronous; keep it off the event loop
+        if await asyncio.to_thread(self.consul_adapter.connect):
+            self.logger.info("Consul adapter created")
+            return True
+        self.logger.warning("Consul adapter connection failed")
+        return False
+    
+    async def _connect_meilisearch(self) -> bool:
+        if await asyncio.to_thread(self.meilisearch_adapter.connect):
+            self.logger.info("Meilisearch adapter created")
+            return True
+        self.logger.warning("Meilisearch adapter connection failed")
+        return False
+    
+    async def _connect_gcs(self) -> None:
+        try:
+            self.gcs_adapter = await asyncio.to_thread(
+                GCSAdapter,
+                project_id=self.config.get("gcs_project_id"),
+                bucket_name=self.config.get("gcs_bucket_name"),
+                credentials_json=self.config.get("gcs_credentials_json")
             )
-            
-            self.duckdb_adapter = DuckDBAdapter(
-                database_path=database_path,
-                read_only=duckdb_config.get("read_only", False)
+            self.logger.info("GCS adapter created")
+        except ImportError as e:
+            raise RuntimeError(
+                f"GCS adapter dependencies not available: {e}. "
+                "Please install: pip install google-cloud-storage google-auth"
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"GCS adapter creation failed: {e}. "
+                "Please verify GCS credentials and configuration."
             )
+    
+    async def _connect_supabase_file(self) -> bool:
+        connected = await self.supabase_file_adapter.connect()
+        self.logger.info("Supabase File adapter created")
+        return connected
+    
+    async def _connect_arango(self) -> bool:
+        from .adapters.arango_graph_adapter import ArangoGraphAdapter
+        
+        if await self.arango_adapter.connect():
+            self.logger.info("ArangoDB adapter created")
             
-            # Connect
-            if await self.duckdb_adapter.connect():
-                self.logger.info(f"DuckDB adapter connected: {database_path}")
-                
-                # Create abstraction (file_storage_abstraction will be set later in _create_abstractions)
-                self.deterministic_compute_abstraction = DeterministicComputeAbstraction(
-                    duckdb_adapter=self.duckdb_adapter,
-                    file_storage_abstraction=None  # Will be set later in _create_abstractions
-                )
-                
-                # Initialize schema (create tables if needed)
-                await self.deterministic_compute_abstraction.initialize_schema()
-                
-                self.logger.info("Deterministic Compute Abstraction created")
-            else:
-                self.logger.warning("DuckDB adapter connection failed")
-                self.duckdb_adapter = None
-                self.deterministic_compute_abstraction = None
-        else:
+            # Create ArangoDB Graph adapter
+            self.arango_graph_adapter = ArangoGraphAdapter(self.arango_adapter)
+            self.logger.info("ArangoDB Graph adapter created")
+            return True
+        self.logger.warning("ArangoDB adapter connection failed")
+        return False
+    
+    def _create_rate_limiter(self) -> DistributedRateLimiter:
+        """Construct the shared request limiter from the rate_limit_* config (0 = unlimited)."""
+        def per_minute(key: str) -> Optional[Quota]:
+            limit = int(self.config.get(key) or 0)
+            return Quota(limit, 60.0) if limit > 0 else None
+        
+        return DistributedRateLimiter(
+            redis_adapter=self.redis_adapter,
+            tenant_quota=per_minute("rate_limit_tenant_per_minute"),
+            user_quota=per_minute("rate_limit_user_per_minute"),
+            intent_quotas=parse_quota_spec(self.config.get("rate_limit_intent_quotas")),
+            default_intent_quota=per_minute("rate_limit_intent_per_minute")
+        )
+    
+    def _create_duckdb_adapter(self) -> bool:
+        """Construct the DuckDB adapter from config; False when DuckDB is not configured."""
+        from .adapters.duckdb_adapter import DuckDBAdapter
+        
+        duckdb_config = self.config.get("duckdb", {})
+        if not duckdb_config:
             self.logger.info("DuckDB configuration not provided, DuckDB adapter not created")
             self.duckdb_adapter = None
             self.deterministic_compute_abstraction = None
+            return False
+        
+        database_path = duckdb_config.get(
+            "database_path",
+            "/app/data/duckdb/main.duckdb"  # Default path
+        )
+        self.duckdb_adapter = DuckDBAdapter(
+            database_path=database_path,
+            read_only=duckdb_config.get("read_only", False)
+        )
+        return True
+    
+    async def _connect_duckdb(self) -> bool:
+        """Connect DuckDB and create the Deterministic Compute Abstraction."""
+        from .abstractions.deterministic_compute_abstraction import DeterministicComputeAbstraction
+        
+        if await self.duckdb_adapter.connect():
+            self.logger.info(f"DuckDB adapter connected: {self.duckdb_adapter.database_path}")
+            
+            # Create abstraction (file_storage_abstraction will be set later in _create_abstractions)
+            self.deterministic_compute_abstraction = DeterministicComputeAbstraction(
+                duckdb_adapter=self.duckdb_adapter,
+                file_storage_abstraction=None  # Will be set later in _create_abstractions
+            )
+            return True
+        
+        self.logger.warning("DuckDB adapter connection failed")
+        self.duckdb_adapter = None
+        self.deterministic_compute_abstraction = None
+        return False
+    
+    async def _initialize_duckdb_schema(self):
+        """Initialize schema (create tables if needed)."""
+        await self.deterministic_compute_abstraction.initialize_schema()
+        self.logger.info("Deterministic Compute Abstraction created")
     
     async def _create_abstractions(self):
         """Create all infrastructure abstractions (Layer 1)."""
@@ -536,7 +752,8 @@ class PublicWorksFoundationService:
         self.logger.info("State management abstraction created")
         
         # Ensure required ArangoDB collections exist for state management
-        if self.arango_adapter:
+        # (normally already done concurrently as the arango_schema startup step)
+        if self.arango_adapter and not self._state_collections_ready:
             await self._ensure_state_collections()
         
         # Service discovery abstraction
@@ -575,11 +792,35 @@ class PublicWorksFoundationService:
             raise RuntimeError("ArangoDB adapter is required for semantic data abstraction")
         
         from .abstractions.semantic_data_abstraction import SemanticDataAbstraction
+        self._vector_backend = create_vector_backend(
+            self.arango_adapter,
+            ann_enabled=bool(self.config.get("vector_index_enabled", False)),
+            index_dir=self.config.get("vector_index_dir") or None,
+            nprobe=int(self.config.get("vector_index_nprobe") or 16),
+            train_threshold=int(self.config.get("vector_index_train_threshold") or 1024)
+        )
+        if self._vector_backend is self.arango_adapter and self.config.get("vector_index_enabled", False):
+            self.logger.warning("numpy not installed; semantic vector search uses the ArangoDB scan")
         self.semantic_data_abstraction = SemanticDataAbstraction(
-            arango_adapter=self.arango_adapter
+            arango_adapter=self.arango_adapter,
+            import_batch_size=int(self.config.get("arango_import_batch_size") or 1000),
+            vector_backend=self._vector_backend
         )
         self.logger.info("Semantic data abstraction created")
         
+        # Hybrid retrieval (lexical + vector with rank fusion) for agent context
+        from .abstractions.hybrid_retrieval_abstraction import HybridRetrievalAbstraction
+        self.hybrid_retrieval_abstraction = HybridRetrievalAbstraction(
+            meilisearch_adapter=self.meilisearch_adapter,
+            semantic_data=self.semantic_data_abstraction,
+            embedding_adapter=self.huggingface_adapter,
+            lexical_index=self.config.get("hybrid_retrieval_index") or "knowledge_assets",
+            rrf_k=int(self.config.get("hybrid_retrieval_rrf_k") or 60),
+            cache_ttl_seconds=int(self.config.get("hybrid_retrieval_cache_ttl_seconds", 60)),
+            cache_entries_per_tenant=int(self.config.get("hybrid_retrieval_cache_entries") or 256)
+        )
+        self.logger.info("Hybrid retrieval abstraction created")
+        
         # Deterministic compute abstraction (created after DuckDB adapter)
         # Note: DuckDB adapter is initialized in _create_adapters, but abstraction
         # needs file_storage_abstraction which is created here. So we update it here.
@@ -593,7 +834,8 @@ class PublicWorksFoundationService:
         # Auth abstraction
         if self.supabase_adapter:
             self.auth_abstraction = AuthAbstraction(
-                supabase_adapter=self.supabase_adapter
+                supabase_adapter=self.supabase_adapter,
+                token_cache=self.auth_token_cache
             )
             self.logger.info("Auth abstraction created")
         else:
@@ -731,9 +973,16 @@ class PublicWorksFoundationService:
         # EDI adapter (optional - only if EDI config provided)
         edi_config = self.config.get("edi", {})
         if edi_config:
+            self.as2_message_dedup = AS2MessageDeduplicator(
+                redis_adapter=self.redis_adapter,
+                retention_seconds=int(self.config.get("as2_dedup_retention_seconds") or DEFAULT_AS2_DEDUP_RETENTION_SECONDS),
+                bloom_capacity=int(self.config.get("as2_dedup_bloom_capacity") or DEFAULT_AS2_DEDUP_BLOOM_CAPACITY)
+            )
             self.edi_adapter = EDIAdapter(
                 file_storage_abstraction=self.file_storage_abstraction,
-                edi_config=edi_config
+                edi_config=edi_config,
+                message_dedup=self.as2_message_dedup,
+                crypto_workers=int(self.config.get("as2_crypto_workers", 2))
             )
             self.logger.info("EDI adapter created")
         else:
@@ -925,17 +1174,43 @@ class PublicWorksFoundationService:
             except Exception as e:
                 self.logger.error(f"Failed to ensure ArangoDB collection {collection_name}: {e}")
                 raise RuntimeError(f"Infrastructure initialization failed: could not create collection {collection_name}") from e
+        
+        self._state_collections_ready = True
     
     async def shutdown(self):
         """Shutdown all infrastructure components."""
         self.logger.info("Shutting down Public Works Foundation...")
         
+        if self.conversation_log:
+            await self.conversation_log.aclose()
+        
+        if self.auth_token_cache:
+            await self.auth_token_cache.aclose()
+        
         if self.redis_adapter:
             await self.redis_adapter.disconnect()
         
         if self.consul_adapter:
             self.consul_adapter.disconnect()
         
+        if self.huggingface_adapter:
+            await self.huggingface_adapter.aclose()
+        
+        if self.pdf_adapter:
+            self.pdf_adapter.shutdown()
+        
+        if self.edi_adapter:
+            self.edi_adapter.shutdown()
+        
+        if self.meilisearch_adapter:
+            await self.meilisearch_adapter.aclose()
+        
+        if self._vector_backend is not None and hasattr(self._vector_backend, "persist"):
+            try:
+                await self._vector_backend.persist()
+            except Exception as e:
+                self.logger.warning(f"Vector index snapshot failed: {e}")
+        
         if self.telemetry_adapter and hasattr(self.telemetry_adapter, "shutdown"):
             try:
                 self.telemetry_adapter.shutdown()
@@ -1139,6 +1414,15 @@ class PublicWorksFoundationService:
         """
         return self.semantic_data_abstraction
 
+    def get_hybrid_retrieval_abstraction(self) -> Optional[HybridRetrievalProtocol]:
+        """
+        Get hybrid retrieval (Meilisearch + vector store fused by rank) for agent context.
+        
+        Returns:
+            Optional[HybridRetrievalProtocol]: Hybrid retrieval abstraction or None
+        """
+        return self.hybrid_retrieval_abstraction
+
     def get_vector_store(self) -> Optional[VectorStoreProtocol]:
         """
         Get vector store capability (embeddings storage and vector search).
@@ -1357,10 +1641,13 @@ class PublicWorksFoundationService:
         """
         Get LLM adapter (OpenAI). Internal use only; prefer get_llm_abstraction() at boundary.
         
+        Returns the LLMGateway wrapping the adapter (same interface; generate_completion
+        additionally accepts tenant_id, priority and deadline_seconds).
+        
         Returns:
-            Optional[OpenAIAdapter]: OpenAI adapter or None
+            Optional[LLMGateway]: Governed OpenAI adapter or None
         """
-        return self.openai_adapter
+        return self.llm_gateway or self.openai_adapter
     
     def get_huggingface_adapter(self) -> Optional[Any]:
         """
@@ -1371,6 +1658,69 @@ class PublicWorksFoundationService:
         """
         return self.huggingface_adapter
     
+    def get_embedding_cache(self) -> Optional[EmbeddingCache]:
+        """
+        Get the two-tier embedding cache shared by the LLM adapters.
+        
+        Returns:
+            Optional[EmbeddingCache]: Embedding cache or None if LLM adapters were not created
+        """
+        return self.embedding_cache
+    
+    def get_column_profile_cache(self) -> Optional[ColumnProfileCache]:
+        """
+        Get the column profile cache shared by ColumnProfileService users.
+        
+        Returns:
+            Optional[ColumnProfileCache]: Profile cache or None before adapters are created
+        """
+        return self.column_profile_cache
+    
+    def get_conversation_log(self) -> Optional[ConversationLog]:
+        """
+        Get the append-only chat conversation log (guide and liaison chat).
+        
+        Returns:
+            Optional[ConversationLog]: Conversation log or None before adapters are created
+        """
+        return self.conversation_log
+    
+    def get_rate_limiter(self) -> Optional[DistributedRateLimiter]:
+        """
+        Get the request limiter shared by all API workers (tenant / user / intent-type quotas).
+        
+        Returns:
+            Optional[DistributedRateLimiter]: Rate limiter or None before adapters are created
+        """
+        return self.rate_limiter
+    
+    def get_auth_token_cache(self) -> Optional[VerifiedTokenCache]:
+        """
+        Get the verified-token cache used by Security Guard token validation.
+        
+        Returns:
+            Optional[VerifiedTokenCache]: Token cache or None if disabled or before adapters are created
+        """
+        return self.auth_token_cache
+    
+    def get_as2_message_dedup(self) -> Optional[AS2MessageDeduplicator]:
+        """
+        Get the AS2 duplicate-message detector used by EDI ingestion.
+        
+        Returns:
+            Optional[AS2MessageDeduplicator]: Dedup or None if EDI is not configured
+        """
+        return self.as2_message_dedup
+    
+    def get_llm_response_cache(self) -> Optional[LLMResponseCache]:
+        """
+        Get the completion response cache used by agents that opt in.
+        
+        Returns:
+            Optional[LLMResponseCache]: Response cache or None if disabled or no LLM adapter
+        """
+        return self.llm_response_cache
+    
     def get_telemetry_abstraction(self) -> Optional[Any]:
         """
         Get telemetry abstraction (OpenTelemetry) for NurseSDK and intent services.
@@ -1417,6 +1767,7 @@ class PublicWorksFoundationService:
             self._security_guard_sdk = SecurityGuardSDK(
                 auth_abstraction=auth,
                 tenant_abstraction=tenant,
+                token_cache=self.auth_token_cache,
             )
             return self._security_guard_sdk
         except Exception:
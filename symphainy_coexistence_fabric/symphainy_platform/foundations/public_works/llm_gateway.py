@@ -0,0 +1,514 @@
+"""
+LLM Gateway - Governed access to the completion provider
+
+Sits in front of the LLM adapter so that no tenant (or batch fan-out) can exhaust the
+shared provider rate limit for everyone else.
+
+WHAT (Infrastructure Role): I decide when each completion request may reach the provider
+HOW (Infrastructure Implementation): I admit requests against global and per-tenant request
+                                     and token buckets plus in-flight limits, serve the
+                                     interactive lane before the batch lane, fail requests
+                                     whose queue deadline passes, and adapt to the provider:
+                                     rate-limit headers resync the global buckets, 429s
+                                     pause dispatch (Retry-After or exponential backoff)
+                                     and halve the admitted rate, which then recovers
+                                     additively on success
+
+Token cost is estimated before the call (prompt characters / 4 + max_tokens) and
+reconciled with the reported usage afterwards. The batch lane may not draw the global
+buckets below the interactive reserve, so chat stays responsive during fan-outs.
+"""
+
+import asyncio
+import random
+import re
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Mapping, Optional
+
+from utilities import get_logger
+
+
+PRIORITY_LANES = ("interactive", "batch")
+
+DEFAULT_REQUESTS_PER_MINUTE = 500
+
+DEFAULT_TOKENS_PER_MINUTE = 200_000
+
+DEFAULT_MAX_IN_FLIGHT = 32
+
+DEFAULT_DEADLINES = {"interactive": 30.0, "batch": 300.0}
+
+DEFAULT_MAX_TOKENS = 512
+
+SHARED_TENANT = "_shared"
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class LLMQueueTimeout(RuntimeError):
+    """A request's queue deadline passed before it could be sent to the provider."""
+
+
+class ProviderRateLimitError(RuntimeError):
+    """The provider rejected a request for rate limiting (HTTP 429)."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None, limits: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.limits = limits or {}
+
+
+def parse_duration(value: Any) -> Optional[float]:
+    """Seconds from a provider duration ("1s", "6m0s", "20ms", "0.5"); None if unparseable."""
+    if value is None:
+        return None
+    text = str(value).strip()
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(text)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def parse_rate_limit_headers(headers: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+    """
+    Rate-limit state from provider response headers (OpenAI x-ratelimit-* / retry-after).
+
+    Returns:
+        Dict with any of remaining_requests, remaining_tokens, reset_requests_seconds,
+        reset_tokens_seconds, retry_after_seconds (absent headers are omitted)
+    """
+    if not headers:
+        return {}
+    lowered = {str(key).lower(): value for key, value in headers.items()}
+    limits: Dict[str, Any] = {}
+    for field, header in (("remaining_requests", "x-ratelimit-remaining-requests"),
+                          ("remaining_tokens", "x-ratelimit-remaining-tokens")):
+        try:
+            limits[field] = int(lowered[header])
+        except (KeyError, TypeError, ValueError):
+            pass
+    for field, header in (("reset_requests_seconds", "x-ratelimit-reset-requests"),
+                          ("reset_tokens_seconds", "x-ratelimit-reset-tokens")):
+        seconds = parse_duration(lowered.get(header))
+        if seconds is not None:
+            limits[field] = seconds
+    retry_after = parse_duration(lowered.get("retry-after"))
+    if "retry-after-ms" in lowered:
+        retry_after_ms = parse_duration(lowered["retry-after-ms"])
+        retry_after = retry_after_ms / 1000 if retry_after_ms is not None else retry_after
+    if retry_after is not None:
+        limits["retry_after_seconds"] = retry_after
+    return limits
+
+
+def estimate_request_tokens(request: Dict[str, Any]) -> int:
+    """Rough token cost of a chat request: prompt characters / 4 plus the completion budget."""
+    characters = 0
+    for message in request.get("messages") or []:
+        content = message.get("content") if isinstance(message, dict) else None
+        if isinstance(content, str):
+            characters += len(content)
+        elif isinstance(content, list):
+            characters += sum(len(part.get("text", "")) for part in content if isinstance(part, dict))
+    return characters // 4 + int(request.get("max_tokens") or DEFAULT_MAX_TOKENS)
+
+
+class TokenBucket:
+    """Continuously refilling budget; consumption may go into debt (repaid by refill)."""
+
+    def __init__(self, rate_per_second: float, capacity: float, now: float):
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self.level = capacity
+        self._updated = now
+
+    def refill(self, now: float) -> float:
+        if now > self._updated:
+            self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+            self._updated = now
+        return self.level
+
+    def wait_time(self, amount: float, now: float, reserve: float = 0.0) -> float:
+        """Seconds until `amount` can be taken leaving `reserve` behind (capped at capacity)."""
+        needed = min(amount + reserve, self.capacity)
+        missing = needed - self.refill(now)
+        if missing <= 0:
+            return 0.0
+        return missing / self.rate if self.rate > 0 else float("inf")
+
+    def consume(self, amount: float, now: float) -> None:
+        self.refill(now)
+        self.level -= amount
+
+    def credit(self, amount: float, now: float) -> None:
+        self.refill(now)
+        self.level = min(self.capacity, self.level + amount)
+
+    def cap(self, level: float, now: float) -> None:
+        self.refill(now)
+        self.level = min(self.level, level)
+
+
+class _Waiter:
+    __slots__ = ("tenant", "tokens", "deadline", "future")
+
+    def __init__(self, tenant: str, tokens: int, deadline: float, future: asyncio.Future):
+        self.tenant = tenant
+        self.tokens = tokens
+        self.deadline = deadline
+        self.future = future
+
+
+class _TenantBudget:
+    __slots__ = ("requests", "tokens", "in_flight")
+
+    def __init__(self, requests: TokenBucket, tokens: TokenBucket):
+        self.requests = requests
+        self.tokens = tokens
+        self.in_flight = 0
+
+
+class LLMGateway:
+    """
+    Admission-controlled front for an LLM adapter's generate_completion().
+
+    Other adapter attributes (embeddings, model listing, health checks) pass through
+    unchanged, so the gateway can be handed out wherever the adapter was.
+    """
+
+    def __init__(
+        self,
+        adapter: Any,
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE,
+        tenant_requests_per_minute: Optional[int] = None,
+        tenant_tokens_per_minute: Optional[int] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        tenant_max_in_flight: Optional[int] = None,
+        interactive_deadline_seconds: float = DEFAULT_DEADLINES["interactive"],
+        batch_deadline_seconds: float = DEFAULT_DEADLINES["batch"],
+        interactive_reserve: float = 0.2,
+        max_retries: int = 3,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize LLM gateway.
+
+        Args:
+            adapter: LLM adapter with generate_completion(request)
+            requests_per_minute: Global request budget (the provider's RPM limit)
+            tokens_per_minute: Global token budget (the provider's TPM limit)
+            tenant_requests_per_minute: Per-tenant request budget (default: half the global)
+            tenant_tokens_per_minute: Per-tenant token budget (default: half the global)
+            max_in_flight: Maximum concurrent provider calls
+            tenant_max_in_flight: Maximum concurrent provider calls per tenant (default: half)
+            interactive_deadline_seconds: Default queue deadline of the interactive lane
+            batch_deadline_seconds: Default queue deadline of the batch lane
+            interactive_reserve: Fraction of each global bucket the batch lane may not use
+            max_retries: Provider 429 retries per request (within its deadline)
+            clock: Monotonic clock (seconds)
+        """
+        if requests_per_minute <= 0 or tokens_per_minute <= 0 or max_in_flight < 1:
+            raise ValueError("requests_per_minute, tokens_per_minute and max_in_flight must be positive")
+        self.adapter = adapter
+        self.max_in_flight = max_in_flight
+        self.tenant_max_in_flight = tenant_max_in_flight or max(1, max_in_flight // 2)
+        self.tenant_requests_per_minute = tenant_requests_per_minute or max(1, requests_per_minute // 2)
+        self.tenant_tokens_per_minute = tenant_tokens_per_minute or max(1, tokens_per_minute // 2)
+        self.deadlines = {"interactive": interactive_deadline_seconds, "batch": batch_deadline_seconds}
+        self.interactive_reserve = interactive_reserve
+        self.max_retries = max_retries
+        self.logger = get_logger(self.__class__.__name__)
+        self._clock = clock
+
+        now = clock()
+        self._base_rates = (requests_per_minute / 60.0, tokens_per_minute / 60.0)
+        self._requests = TokenBucket(self._base_rates[0], requests_per_minute, now)
+        self._tokens = TokenBucket(self._base_rates[1], tokens_per_minute, now)
+        self._tenants: Dict[str, _TenantBudget] = {}
+        self._in_flight = 0
+
+        # Adaptive state: admitted-rate scale (AIMD) and provider-imposed pause
+        self._rate_scale = 1.0
+        self._paused_until = 0.0
+        self._consecutive_limited = 0
+
+        # Queues are bound to the running event loop (rebuilt if the loop changes)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lanes: Dict[str, Deque[_Waiter]] = {lane: deque() for lane in PRIORITY_LANES}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_at = float("inf")
+        self._stats = {
+            "requests": 0, "completed": 0, "errors": 0, "deadline_expired": 0,
+            "rate_limited": 0, "retries": 0,
+        }
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes the gateway does not define
+        adapter = self.__dict__.get("adapter")
+        if adapter is None:
+            raise AttributeError(name)
+        return getattr(adapter, name)
+
+    async def generate_completion(
+        self,
+        request: Dict[str, Any],
+        tenant_id: Optional[str] = None,
+        priority: str = "interactive",
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate a completion once the request is admitted.
+
+        Args:
+            request: Provider request (as for the adapter)
+            tenant_id: Tenant charged for the request (None = shared budget)
+            priority: "interactive" (served first) or "batch"
+            deadline_seconds: Longest the request may wait in the queue (lane default if None)
+
+        Returns:
+            Adapter response
+
+        Raises:
+            ValueError: Unknown priority
+            LLMQueueTimeout: Not admitted before the deadline
+            ProviderRateLimitError: Still rate limited after max_retries
+        """
+        if priority not in PRIORITY_LANES:
+            raise ValueError(f"priority must be one of {PRIORITY_LANES}, got {priority!r}")
+        tenant = tenant_id or SHARED_TENANT
+        estimated = estimate_request_tokens(request)
+        deadline = self._clock() + (self.deadlines[priority] if deadline_seconds is None else deadline_seconds)
+        self._stats["requests"] += 1
+
+        attempt = 0
+        while True:
+            await self._admit(tenant, priority, estimated, deadline)
+            try:
+                response = await self.adapter.generate_completion(request)
+            except ProviderRateLimitError as e:
+                self._release(tenant, estimated, refund_request=True, used_tokens=0)
+                self._on_rate_limited(e)
+                attempt += 1
+                if attempt > self.max_retries or self._clock() >= deadline:
+                    self._stats["errors"] += 1
+                    raise
+                self._stats["retries"] += 1
+                continue
+            except BaseException:
+                self._release(tenant, estimated)
+                self._stats["errors"] += 1
+                raise
+
+            limits = response.pop("rate_limit", None) if isinstance(response, dict) else None
+            usage = response.get("usage") if isinstance(response, dict) else None
+            used = (usage or {}).get("total_tokens")
+            self._release(tenant, estimated, used_tokens=used)
+            self._on_success(limits)
+            self._stats["completed"] += 1
+            return response
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters plus current queue depth, in-flight calls and adaptive state."""
+        now = self._clock()
+        return {
+            **self._stats,
+            "queued": {lane: len(queue) for lane, queue in self._lanes.items()},
+            "in_flight": self._in_flight,
+            "rate_scale": round(self._rate_scale, 3),
+            "paused_for_seconds": round(max(0.0, self._paused_until - now), 3),
+            "tenants": len(self._tenants),
+        }
+
+    # ============================================================================
+    # ADMISSION
+    # ============================================================================
+
+    async def _admit(self, tenant: str, lane: str, tokens: int, deadline: float) -> None:
+        self._bind_loop()
+        future = self._loop.create_future()
+        self._lanes[lane].append(_Waiter(tenant, tokens, deadline, future))
+        self._pump()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # Admitted just before cancellation: give the slot back
+                self._release(tenant, tokens, refund_request=True, used_tokens=0)
+            raise
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lanes = {lane: deque() for lane in PRIORITY_LANES}
+            self._timer = None
+            self._timer_at = float("inf")
+            self._in_flight = 0
+            for budget in self._tenants.values():
+                budget.in_flight = 0
+
+    def _tenant(self, tenant: str, now: float) -> _TenantBudget:
+        budget = self._tenants.get(tenant)
+        if budget is None:
+            budget = _TenantBudget(
+                TokenBucket(self.tenant_requests_per_minute / 60.0, self.tenant_requests_per_minute, now),
+                TokenBucket(self.tenant_tokens_per_minute / 60.0, self.tenant_tokens_per_minute, now)
+            )
+            self._tenants[tenant] = budget
+        return budget
+
+    def _pump(self) -> None:
+        """Admit every queued request the budgets allow; schedule the next attempt."""
+        if self._loop is None:
+            return
+        now = self._clock()
+        next_check = float("inf")
+        global_blocked = now < self._paused_until
+        if global_blocked:
+            next_check = self._paused_until
+
+        for lane in PRIORITY_LANES:
+            queue = self._lanes[lane]
+            reserve = 0.0 if lane == "interactive" else self.interactive_reserve
+            for waiter in list(queue):
+                if waiter.future.done():
+                    queue.remove(waiter)
+                    continue
+                if waiter.deadline <= now:
+                    queue.remove(waiter)
+                    self._stats["deadline_expired"] += 1
+                    waiter.future.set_exception(LLMQueueTimeout(
+                        f"LLM request for tenant {waiter.tenant} not admitted within its {lane} deadline"
+                    ))
+                    continue
+                next_check = min(next_check, waiter.deadline)
+                if global_blocked or self._in_flight >= self.max_in_flight:
+                    continue  # only deadlines can change until a slot or budget frees up
+
+                budget = self._tenant(waiter.tenant, now)
+                if budget.in_flight >= self.tenant_max_in_flight:
+                    continue
+                tenant_wait = max(budget.requests.wait_time(1, now), budget.tokens.wait_time(waiter.tokens, now))
+                if tenant_wait > 0:
+                    next_check = min(next_check, now + tenant_wait)
+                    continue  # this tenant is over budget; others may proceed
+
+                global_wait = max(
+                    self._requests.wait_time(1, now, reserve * self._requests.capacity),
+                    self._tokens.wait_time(waiter.tokens, now, reserve * self._tokens.capacity)
+                )
+                if global_wait > 0:
+                    # Global budget is reserved for this waiter (FIFO within lane, lanes in order)
+                    next_check = min(next_check, now + global_wait)
+                    global_blocked = True
+                    continue
+
+                queue.remove(waiter)
+                self._requests.consume(1, now)
+                self._tokens.consume(waiter.tokens, now)
+                budget.requests.consume(1, now)
+                budget.tokens.consume(waiter.tokens, now)
+                budget.in_flight += 1
+                self._in_flight += 1
+                waiter.future.set_result(None)
+
+        self._schedule(next_check, now)
+
+    def _schedule(self, at: float, now: float) -> None:
+        if at == float("inf"):
+            return
+        if self._timer is not None and self._timer_at <= at:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer_at = at
+        self._timer = self._loop.call_later(max(0.0, at - now), self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._timer_at = float("inf")
+        self._pump()
+
+    def _release(
+        self,
+        tenant: str,
+        estimated: int,
+        refund_request: bool = False,
+        used_tokens: Optional[int] = None
+    ) -> None:
+        now = self._clock()
+        budget = self._tenant(tenant, now)
+        budget.in_flight = max(0, budget.in_flight - 1)
+        self._in_flight = max(0, self._in_flight - 1)
+        if refund_request:
+            self._requests.credit(1, now)
+            budget.requests.credit(1, now)
+        if used_tokens is not None:
+            # Reconcile the estimate with actual usage (positive = refund)
+            delta = estimated - used_tokens
+            for bucket in (self._tokens, budget.tokens):
+                if delta >= 0:
+                    bucket.credit(delta, now)
+                else:
+                    bucket.consume(-delta, now)
+        self._pump()
+
+    # ============================================================================
+    # ADAPTIVE BACKOFF
+    # ============================================================================
+
+    def _on_success(self, limits: Optional[Dict[str, Any]]) -> None:
+        self._consecutive_limited = 0
+        if self._rate_scale < 1.0:
+            self._set_scale(self._rate_scale + 0.05)
+        if limits:
+            self._apply_limits(limits)
+
+    def _on_rate_limited(self, error: ProviderRateLimitError) -> None:
+        self._stats["rate_limited"] += 1
+        self._consecutive_limited += 1
+        self._set_scale(self._rate_scale * 0.5)
+        delay = error.retry_after
+        if delay is None:
+            delay = error.limits.get("retry_after_seconds")
+        if delay is None:
+            delay = min(60.0, 2.0 ** (self._consecutive_limited - 1)) * random.uniform(0.9, 1.1)
+        self._pause(delay)
+        self._apply_limits(error.limits)
+        self.logger.warning(
+            f"LLM provider rate limited; pausing {delay:.2f}s, admitted rate at {self._rate_scale:.0%}"
+        )
+
+    def _apply_limits(self, limits: Dict[str, Any]) -> None:
+        """Resync the global buckets with the provider's remaining budget."""
+        now = self._clock()
+        for bucket, remaining_key, reset_key in (
+            (self._requests, "remaining_requests", "reset_requests_seconds"),
+            (self._tokens, "remaining_tokens", "reset_tokens_seconds"),
+        ):
+            remaining = limits.get(remaining_key)
+            if remaining is None:
+                continue
+            bucket.cap(remaining, now)
+            if remaining <= 0 and limits.get(reset_key):
+                self._pause(limits[reset_key])
+
+    def _pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, self._clock() + max(0.0, seconds))
+        self._pump()
+
+    def _set_scale(self, scale: float) -> None:
+        self._rate_scale = min(1.0, max(0.1, scale))
+        now = self._clock()
+        self._requests.refill(now)
+        self._tokens.refill(now)
+        self._requests.rate = self._base_rates[0] * self._rate_scale
+        self._tokens.rate = self._base_rates[1] * self._rate_scale
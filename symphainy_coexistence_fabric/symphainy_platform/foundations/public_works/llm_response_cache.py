@@ -0,0 +1,184 @@
+"""
+LLM Response Cache - Reuse of deterministic completion responses
+
+Returns the stored response for a completion request identical to one already made
+(same model, messages, temperature, max_tokens, ...) instead of calling the provider.
+
+WHAT (Infrastructure Role): I remember completion responses by (tenant, scope, canonical request hash)
+HOW (Infrastructure Implementation): I hash the request's canonical JSON (sorted keys) and keep
+                                     responses in an in-process LRU with per-entry expiry in
+                                     front of a shared Redis tier with the same TTL; shared entries
+                                     carry their expiry, so a worker's local copy never outlives them
+
+Only low-temperature, single-choice, non-streaming requests are cacheable: above
+max_temperature responses are meant to be sampled, not replayed. Keys include the
+tenant, so one tenant's cached output is never served to another; the scope (usually
+the agent id) keeps hit-rate metrics per agent. Shared-tier failures degrade to cache
+misses (the provider is called), never to errors.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from utilities import get_logger
+
+
+DEFAULT_LOCAL_MAX_ENTRIES = 10_000
+
+DEFAULT_TTL_SECONDS = 3600
+
+DEFAULT_MAX_TEMPERATURE = 0.3
+
+SHARED_TENANT = "_shared"
+
+_KEY_PREFIX = "llmcache:v2"
+
+
+def canonical_request_hash(request: Dict[str, Any]) -> str:
+    """SHA-256 of the request's canonical JSON (sorted keys, no whitespace)."""
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """In-process LRU plus optional shared Redis tier for completion responses."""
+
+    def __init__(
+        self,
+        redis_adapter: Optional[Any] = None,
+        local_max_entries: int = DEFAULT_LOCAL_MAX_ENTRIES,
+        default_ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_temperature: float = DEFAULT_MAX_TEMPERATURE,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize LLM response cache.
+
+        Args:
+            redis_adapter: RedisAdapter for the shared tier (None = in-process only)
+            local_max_entries: Maximum responses held in the in-process LRU
+            default_ttl_seconds: Entry lifetime when put() is not given one
+            max_temperature: Highest temperature whose responses are cached
+            clock: Wall clock (seconds) for entry expiry
+        """
+        self.redis = redis_adapter
+        self.local_max_entries = local_max_entries
+        self.default_ttl_seconds = default_ttl_seconds
+        self.max_temperature = max_temperature
+        self.logger = get_logger(self.__class__.__name__)
+        self._clock = clock
+        self._local: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._stats = {"local_hits": 0, "shared_hits": 0, "misses": 0, "stores": 0, "bypassed": 0}
+        self._scopes: Dict[str, Dict[str, int]] = {}
+
+    def is_cacheable(self, request: Dict[str, Any]) -> bool:
+        """True for low-temperature, single-choice, non-streaming requests."""
+        temperature = request.get("temperature", 1.0)
+        return (
+            temperature is not None
+            and float(temperature) <= self.max_temperature
+            and not request.get("stream")
+            and int(request.get("n") or 1) == 1
+        )
+
+    def key(self, request: Dict[str, Any], tenant_id: Optional[str] = None, scope: str = "default") -> str:
+        """Cache key of a request for a tenant and scope."""
+        return f"{tenant_id or SHARED_TENANT}:{scope}:{canonical_request_hash(request)}"
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a response: in-process first, then the shared tier.
+
+        Returns:
+            A fresh copy of the cached response, or None on a miss
+        """
+        scope = self._scope_of(key)
+        now = self._clock()
+        entry = self._local.get(key)
+        if entry is not None:
+            expires_at, payload = entry
+            if expires_at > now:
+                self._local.move_to_end(key)
+                self._count("local_hits", scope)
+                return json.loads(payload)
+            del self._local[key]
+
+        if self.redis is not None:
+            try:
+                payload = await self.redis.get(self._shared_key(key))
+            except Exception as e:
+                self.logger.warning(f"LLM response cache shared read failed: {e}")
+                payload = None
+            if payload is not None:
+                try:
+                    stored = json.loads(payload)
+                    expires_at, response = float(stored["expires_at"]), stored["response"]
+                except (ValueError, TypeError, KeyError) as e:
+                    self.logger.warning(f"Discarding unreadable cached LLM response: {e}")
+                else:
+                    if expires_at > now:
+                        self._remember(key, json.dumps(response, default=str), expires_at)
+                        self._count("shared_hits", scope)
+                        return response
+
+        self._count("misses", scope)
+        return None
+
+    async def put(self, key: str, response: Dict[str, Any], ttl_seconds: Optional[int] = None) -> None:
+        """Store a response in both tiers for ttl_seconds (default_ttl_seconds if None)."""
+        ttl = self.default_ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+        payload = json.dumps(response, default=str)
+        expires_at = self._clock() + ttl
+        self._remember(key, payload, expires_at)
+        self._stats["stores"] += 1
+        if self.redis is not None:
+            shared_payload = json.dumps({"expires_at": expires_at, "response": response}, default=str)
+            try:
+                await self.redis.set(self._shared_key(key), shared_payload, ttl=max(1, int(ttl)))
+            except Exception as e:
+                self.logger.warning(f"LLM response cache shared write failed: {e}")
+
+    def record_bypass(self, scope: str = "default") -> None:
+        """Count a cacheable call that skipped the lookup (bypass flag)."""
+        self._count("bypassed", scope)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit / miss counters (overall and per scope) and in-process size."""
+        stats: Dict[str, Any] = dict(self._stats)
+        stats["hit_rate"] = _hit_rate(stats)
+        stats["local_entries"] = len(self._local)
+        stats["scopes"] = {scope: {**counts, "hit_rate": _hit_rate(counts)} for scope, counts in self._scopes.items()}
+        return stats
+
+    def _remember(self, key: str, payload: str, expires_at: float) -> None:
+        self._local[key] = (expires_at, payload)
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_max_entries:
+            self._local.popitem(last=False)
+
+    def _count(self, counter: str, scope: str) -> None:
+        self._stats[counter] += 1
+        scope_stats = self._scopes.setdefault(
+            scope, {"local_hits": 0, "shared_hits": 0, "misses": 0, "bypassed": 0}
+        )
+        scope_stats[counter] += 1
+
+    @staticmethod
+    def _scope_of(key: str) -> str:
+        parts = key.split(":")
+        return parts[1] if len(parts) >= 3 else "default"
+
+    @staticmethod
+    def _shared_key(key: str) -> str:
+        return f"{_KEY_PREFIX}:{key}"
+
+
+def _hit_rate(counts: Dict[str, Any]) -> float:
+    hits = counts.get("local_hits", 0) + counts.get("shared_hits", 0)
+    lookups = hits + counts.get("misses", 0)
+    return round(hits / lookups, 4) if lookups else 0.0
@@ -213,6 +213,7 @@ class TenancyProtocol(Protocol):
                 "tenant_type": str,
                 "roles": List[str],
                 "permissions": List[str],
+                "tenant_source": str,  # "user_tenants" or "user_metadata" (fallback)
                 "raw_user_tenant_data": Dict[str, Any]
             }
         """
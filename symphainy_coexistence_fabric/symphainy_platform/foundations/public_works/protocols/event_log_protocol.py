@@ -42,6 +42,25 @@ class EventLogProtocol(Protocol):
         """
         ...
 
+    async def xadd_many(
+        self,
+        entries: List[Tuple[str, Dict[str, str]]],
+        maxlen: Optional[int] = None,
+        approximate: bool = True
+    ) -> List[Optional[str]]:
+        """
+        Append several entries (possibly to different streams) in one round trip.
+
+        Args:
+            entries: (stream_name, fields) pairs, appended in order
+            maxlen: Optional max stream length (trim old entries)
+            approximate: If True, use approximate trimming when maxlen set
+
+        Returns:
+            Message ID per entry (None where the append failed)
+        """
+        ...
+
     async def xrange(
         self,
         stream_name: str,
@@ -0,0 +1,50 @@
+"""
+Hybrid Retrieval Protocol - Abstraction Contract (Layer 2)
+
+Defines the interface for hybrid (lexical + vector) retrieval.
+Enables swappability of the lexical engine, vector store and fusion strategy.
+
+WHAT (Infrastructure Role): I define the contract for hybrid retrieval
+HOW (Infrastructure Implementation): I specify the interface for fused lexical and vector search
+"""
+
+from typing import Protocol, Dict, Any, List, Optional
+
+
+class HybridRetrievalProtocol(Protocol):
+    """Protocol for hybrid retrieval operations."""
+
+    async def retrieve(
+        self,
+        query: str,
+        tenant_id: str,
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None,
+        index: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve the documents most relevant to a query for a tenant.
+
+        Args:
+            query: Query text
+            tenant_id: Tenant identifier (scopes both searches and the cache)
+            limit: Maximum fused results
+            filters: Optional equality filters applied to both searches
+            query_embedding: Optional precomputed query vector (skips embedding)
+            index: Optional lexical index name (default: configured knowledge index)
+
+        Returns:
+            Dict with fused "results", per-stage "timings_ms", "cached" flag and
+            per-stage "errors"
+        """
+        ...
+
+    def invalidate(self, tenant_id: Optional[str] = None) -> int:
+        """
+        Drop cached results for a tenant (or all tenants).
+
+        Returns:
+            Number of cached queries dropped
+        """
+        ...
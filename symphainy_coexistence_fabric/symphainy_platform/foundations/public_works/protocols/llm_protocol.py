@@ -6,10 +6,10 @@ Enables swappability between OpenAI, HuggingFace, and other providers.
 Consumed by ReasoningService (ctx.reasoning.llm) — no adapter at boundary.
 
 WHAT (Infrastructure Role): I define the contract for LLM operations
-HOW (Infrastructure Implementation): I specify complete() and embed() only
+HOW (Infrastructure Implementation): I specify complete(), embed() and embed_many() only
 """
 
-from typing import Protocol, Dict, Any, Optional
+from typing import Protocol, Dict, Any, List, Optional
 
 
 class LLMProtocol(Protocol):
@@ -59,3 +59,20 @@ class LLMProtocol(Protocol):
             Dict with at least: embedding (list), model (str), dimensions (int)
         """
         ...
+
+    async def embed_many(
+        self,
+        contents: List[str],
+        model: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate embeddings for several texts (batched provider calls).
+
+        Args:
+            contents: Texts to embed
+            model: Embedding model to use
+
+        Returns:
+            One dict per text, in order, shaped like embed()
+        """
+        ...
@@ -23,16 +23,20 @@ class SemanticDataProtocol(Protocol):
     
     async def store_semantic_embeddings(
         self,
-        embedding_documents: List[Dict[str, Any]]
+        embedding_documents: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        on_duplicate: str = "replace"
     ) -> Dict[str, Any]:
         """
         Store semantic embedding documents - pure infrastructure.
         
         Args:
             embedding_documents: List of pre-built embedding documents (with _key, content_id, etc.)
+            batch_size: Documents per bulk import request (None = implementation default)
+            on_duplicate: Action when a _key already exists ("error", "update", "replace", "ignore")
         
         Returns:
-            Dict with storage result (count, success status)
+            Dict with storage result (count, success status, per-batch errors)
         """
         ...
     
@@ -53,6 +57,18 @@ class SemanticDataProtocol(Protocol):
         """
         ...
     
+    async def get_semantic_embeddings_by_keys(self, keys: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get stored embedding documents by _key - pure infrastructure.
+        
+        Args:
+            keys: Embedding document keys
+        
+        Returns:
+            The documents found (missing keys are skipped)
+        """
+        ...
+    
     async def query_by_semantic_id(
         self,
         semantic_id: str,
@@ -96,7 +112,9 @@ class SemanticDataProtocol(Protocol):
     async def store_semantic_graph(
         self,
         node_documents: List[Dict[str, Any]],
-        edge_documents: List[Dict[str, Any]]
+        edge_documents: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        on_duplicate: str = "replace"
     ) -> Dict[str, Any]:
         """
         Store semantic graph documents - pure infrastructure.
@@ -104,9 +122,11 @@ class SemanticDataProtocol(Protocol):
         Args:
             node_documents: List of pre-built node documents (with _key, content_id, etc.)
             edge_documents: List of pre-built edge documents (with _key, _from, _to, etc.)
+            batch_size: Documents per bulk import request (None = implementation default)
+            on_duplicate: Action when a _key already exists ("error", "update", "replace", "ignore")
         
         Returns:
-            Dict with storage result (node_count, edge_count, success status)
+            Dict with storage result (node_count, edge_count, success status, per-batch errors)
         """
         ...
     
@@ -19,7 +19,9 @@ class SemanticGraphProtocol(Protocol):
     async def store_semantic_graph(
         self,
         node_documents: List[Dict[str, Any]],
-        edge_documents: List[Dict[str, Any]]
+        edge_documents: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        on_duplicate: str = "replace"
     ) -> Dict[str, Any]:
         """Store semantic graph documents - pure infrastructure."""
         ...
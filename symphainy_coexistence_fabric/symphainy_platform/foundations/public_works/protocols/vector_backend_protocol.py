@@ -19,7 +19,8 @@ class VectorBackendProtocol(Protocol):
     Protocol for vector search backends - pure infrastructure.
     
     This protocol enables pluggable vector backends:
-    - ArangoDB (default, implemented)
+    - ArangoDB (AQL scan, implemented)
+    - In-process ANN index (AnnVectorBackend, implemented; opt-in via VECTOR_INDEX_ENABLED, needs numpy)
     - Pinecone (can be implemented)
     - Weaviate (can be implemented)
     - Other vector databases
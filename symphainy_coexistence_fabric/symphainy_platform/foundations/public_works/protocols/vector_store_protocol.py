@@ -18,7 +18,9 @@ class VectorStoreProtocol(Protocol):
 
     async def store_semantic_embeddings(
         self,
-        embedding_documents: List[Dict[str, Any]]
+        embedding_documents: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        on_duplicate: str = "replace"
     ) -> Dict[str, Any]:
         """Store semantic embedding documents - pure infrastructure."""
         ...
@@ -31,6 +33,10 @@ class VectorStoreProtocol(Protocol):
         """Get semantic embeddings with filtering - pure infrastructure."""
         ...
 
+    async def get_semantic_embeddings_by_keys(self, keys: List[str]) -> List[Dict[str, Any]]:
+        """Get stored embedding documents by _key (missing keys are skipped) - pure infrastructure."""
+        ...
+
     async def query_by_semantic_id(
         self,
         semantic_id: str,
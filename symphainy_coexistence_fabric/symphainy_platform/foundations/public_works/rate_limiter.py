@@ -0,0 +1,276 @@
+"""
+Rate Limiter - Distributed token-bucket quotas
+
+One limiter shared by every API worker: the Traffic Cop session checks, the Experience
+endpoint limits and the Runtime per-tenant / per-user / per-intent-type quotas.
+
+WHAT (Infrastructure Role): I decide whether a request fits its quotas across all workers
+HOW (Infrastructure Implementation): each quota is a token bucket (capacity = limit, refilled
+                                     at limit / window) held in a Redis hash and updated by
+                                     one Lua script on Redis time, so all workers draw from
+                                     the same buckets atomically; a request checked against
+                                     several buckets takes a token from all of them or none
+
+Without Redis (or while Redis errors) the same buckets are kept in-process, so limits
+still hold per worker instead of silently disappearing. Denials carry the seconds until
+the tightest bucket has refilled enough, for Retry-After.
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from utilities import get_logger
+
+from .llm_gateway import TokenBucket
+
+
+DEFAULT_TENANT_PER_MINUTE = 600
+
+DEFAULT_USER_PER_MINUTE = 120
+
+DEFAULT_LOCAL_MAX_BUCKETS = 10_000
+
+_KEY_PREFIX = "ratelimit:v1"
+
+# KEYS: bucket hashes. ARGV: cost, then capacity and refill-per-second for each key.
+# Returns {allowed (0/1), retry_after seconds (string), remaining tokens of the tightest
+# bucket (string), 1-based index of the bucket that denied (0 if allowed)}.
+_TOKEN_BUCKET_SCRIPT = """
+redis.replicate_commands()
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local cost = tonumber(ARGV[1])
+local levels = {}
+local wait, denied, remaining = 0, 0, nil
+for i = 1, #KEYS do
+  local capacity = tonumber(ARGV[2 * i])
+  local rate = tonumber(ARGV[2 * i + 1])
+  local state = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+  local level = tonumber(state[1])
+  local updated = tonumber(state[2])
+  if level == nil or updated == nil then
+    level = capacity
+  elseif now > updated then
+    level = math.min(capacity, level + (now - updated) * rate)
+  end
+  levels[i] = level
+  local missing = math.min(cost, capacity) - level
+  if missing > 0 and missing / rate > wait then
+    wait = missing / rate
+    denied = i
+  end
+  if remaining == nil or level - cost < remaining then
+    remaining = level - cost
+  end
+end
+if denied > 0 then
+  return {0, tostring(wait), '0', denied}
+end
+for i = 1, #KEYS do
+  local capacity = tonumber(ARGV[2 * i])
+  local rate = tonumber(ARGV[2 * i + 1])
+  redis.call('HSET', KEYS[i], 'tokens', tostring(levels[i] - cost), 'ts', tostring(now))
+  redis.call('PEXPIRE', KEYS[i], math.ceil(capacity / rate * 1000) + 1000)
+end
+return {1, '0', tostring(remaining), 0}
+"""
+
+
+@dataclass(frozen=True)
+class Quota:
+    """At most `limit` requests per `window_seconds` (bursts up to `limit`)."""
+    limit: int
+    window_seconds: float = 60.0
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.limit / self.window_seconds
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of a quota check."""
+    allowed: bool
+    retry_after: float = 0.0
+    remaining: int = 0
+    limit: Optional[int] = None  # limit of the bucket that denied (or the tightest one)
+    key: Optional[str] = None  # bucket that denied
+    scope: Optional[str] = None  # quota that denied ("tenant", "user", "intent"), set by check_quotas
+
+    @property
+    def retry_after_header(self) -> str:
+        """Whole seconds for a Retry-After header (at least 1)."""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+def parse_quota_spec(spec: Optional[str], window_seconds: float = 60.0) -> Dict[str, Quota]:
+    """
+    Parse "name=limit[/window_seconds],..." (e.g. "parse_content=60,embed_content=20/30").
+
+    Entries that do not parse are ignored; the window defaults to window_seconds.
+    """
+    quotas: Dict[str, Quota] = {}
+    for entry in (spec or "").split(","):
+        name, _, value = entry.partition("=")
+        limit, _, window = value.partition("/")
+        try:
+            quota = Quota(int(limit), float(window) if window.strip() else window_seconds)
+        except ValueError:
+            continue
+        if name.strip() and quota.limit > 0 and quota.window_seconds > 0:
+            quotas[name.strip()] = quota
+    return quotas
+
+
+class DistributedRateLimiter:
+    """Token-bucket quotas in Redis with an in-process fallback; see module docstring."""
+
+    def __init__(
+        self,
+        redis_adapter: Optional[Any] = None,
+        tenant_quota: Optional[Quota] = None,
+        user_quota: Optional[Quota] = None,
+        intent_quotas: Optional[Dict[str, Quota]] = None,
+        default_intent_quota: Optional[Quota] = None,
+        local_max_buckets: int = DEFAULT_LOCAL_MAX_BUCKETS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            redis_adapter: RedisAdapter holding the shared buckets (None = in-process only)
+            tenant_quota: Requests per tenant (None = unlimited)
+            user_quota: Requests per user within a tenant (None = unlimited)
+            intent_quotas: Per-tenant quota for specific intent types
+            default_intent_quota: Per-tenant quota for other intent types (None = unlimited)
+            local_max_buckets: In-process buckets kept before idle ones are dropped
+            clock: Time source for the in-process buckets
+        """
+        self.redis_adapter = redis_adapter
+        self.tenant_quota = tenant_quota
+        self.user_quota = user_quota
+        self.intent_quotas = dict(intent_quotas or {})
+        self.default_intent_quota = default_intent_quota
+        self.local_max_buckets = local_max_buckets
+        self.clock = clock
+        self.logger = get_logger(self.__class__.__name__)
+        self._local: Dict[str, TokenBucket] = {}
+        self._stats = {"checks": 0, "denied": 0, "local_checks": 0}
+        self._shared_available = True
+
+    async def check(self, key: str, limit: int, window_seconds: float, cost: int = 1) -> RateLimitDecision:
+        """Take `cost` tokens from one bucket (e.g. an endpoint limit per client)."""
+        return await self.acquire([(key, Quota(limit, window_seconds))], cost=cost)
+
+    async def check_quotas(
+        self,
+        tenant_id: Optional[str],
+        user_id: Optional[str] = None,
+        intent_type: Optional[str] = None,
+        cost: int = 1
+    ) -> RateLimitDecision:
+        """
+        Take `cost` tokens from the tenant, user and intent-type buckets that apply.
+
+        Anonymous requests (no tenant) share one "anonymous" tenant bucket.
+        """
+        tenant = tenant_id or "anonymous"
+        buckets: List[Tuple[str, Quota]] = []
+        if self.tenant_quota is not None:
+            buckets.append((f"tenant:{tenant}", self.tenant_quota))
+        if user_id and self.user_quota is not None:
+            buckets.append((f"user:{tenant}:{user_id}", self.user_quota))
+        intent_quota = self.intent_quotas.get(intent_type or "", self.default_intent_quota)
+        if intent_type and intent_quota is not None:
+            buckets.append((f"intent:{tenant}:{intent_type}", intent_quota))
+        decision = await self.acquire(buckets, cost=cost)
+        if decision.key is not None:
+            decision.scope = decision.key.split(":", 1)[0]
+        return decision
+
+    async def acquire(self, buckets: Sequence[Tuple[str, Quota]], cost: int = 1) -> RateLimitDecision:
+        """
+        Take `cost` tokens from every bucket, or from none if any is short.
+
+        Returns:
+            RateLimitDecision; when denied, key is the bucket that needs the longest to refill
+        """
+        if not buckets:
+            return RateLimitDecision(allowed=True)
+        self._stats["checks"] += 1
+        decision = await self._acquire_shared(buckets, cost)
+        if decision is None:
+            self._stats["local_checks"] += 1
+            decision = self._acquire_local(buckets, cost)
+        if not decision.allowed:
+            self._stats["denied"] += 1
+        return decision
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters: checks, denied, local_checks (checks served without Redis)."""
+        return {**self._stats, "local_buckets": len(self._local)}
+
+    async def _acquire_shared(self, buckets: Sequence[Tuple[str, Quota]], cost: int) -> Optional[RateLimitDecision]:
+        if self.redis_adapter is None:
+            return None
+        args: List[Any] = [cost]
+        for _, quota in buckets:
+            args.extend([quota.limit, quota.refill_per_second])
+        result = await self.redis_adapter.eval_script(
+            _TOKEN_BUCKET_SCRIPT, [f"{_KEY_PREFIX}:{key}" for key, _ in buckets], args
+        )
+        if result is None:
+            if self._shared_available:
+                self.logger.warning("Shared rate-limit buckets unavailable; limiting per process until Redis recovers")
+            self._shared_available = False
+            return None
+        self._shared_available = True
+        allowed, retry_after, remaining, denied = result
+        return self._decision(buckets, bool(int(allowed)), float(retry_after), float(remaining), int(denied) - 1)
+
+    def _acquire_local(self, buckets: Sequence[Tuple[str, Quota]], cost: int) -> RateLimitDecision:
+        now = self.clock()
+        if len(self._local) > self.local_max_buckets:
+            self._drop_full_buckets(now)
+        states = []
+        for key, quota in buckets:
+            bucket = self._local.get(key)
+            if bucket is None or bucket.capacity != quota.limit or bucket.rate != quota.refill_per_second:
+                bucket = self._local[key] = TokenBucket(quota.refill_per_second, quota.limit, now)
+            states.append(bucket)
+        waits = [bucket.wait_time(cost, now) for bucket in states]
+        longest = max(range(len(waits)), key=waits.__getitem__)
+        if waits[longest] > 0:
+            return self._decision(buckets, False, waits[longest], 0.0, longest)
+        for bucket in states:
+            bucket.consume(cost, now)
+        return self._decision(buckets, True, 0.0, min(bucket.level for bucket in states), -1)
+
+    def _drop_full_buckets(self, now: float) -> None:
+        """Forget buckets that have refilled completely (they behave like new ones)."""
+        for key in [key for key, bucket in self._local.items() if bucket.refill(now) >= bucket.capacity]:
+            del self._local[key]
+
+    @staticmethod
+    def _decision(
+        buckets: Sequence[Tuple[str, Quota]],
+        allowed: bool,
+        retry_after: float,
+        remaining: float,
+        denied: int
+    ) -> RateLimitDecision:
+        if allowed:
+            return RateLimitDecision(
+                allowed=True,
+                remaining=max(0, int(remaining)),
+                limit=min(quota.limit for _, quota in buckets)
+            )
+        return RateLimitDecision(
+            allowed=False,
+            retry_after=retry_after,
+            limit=buckets[denied][1].limit,
+            key=buckets[denied][0]
+        )
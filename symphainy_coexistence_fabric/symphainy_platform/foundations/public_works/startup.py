@@ -0,0 +1,213 @@
+"""
+Public Works Startup Orchestrator
+
+Runs independent Layer 0 connect / schema steps concurrently, honouring declared
+dependencies and per-step timeouts, and records a startup timing breakdown.
+
+WHAT (Foundation Role): I bring infrastructure adapters up as fast as their slowest dependency chain
+HOW (Implementation): I schedule StartupSteps as asyncio tasks that await their dependencies,
+                      bound each with asyncio.wait_for, and time every step by phase
+
+Phases:
+- import: loading adapter modules
+- construct: building adapter objects (no I/O)
+- connect: network / file handshakes with backing services
+- schema: collection / table creation after a connection exists
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from utilities import get_logger
+
+
+STARTUP_PHASES = ("import", "construct", "connect", "schema")
+
+DEFAULT_STEP_TIMEOUT_SECONDS = 30.0
+
+
+@dataclass
+class StartupStep:
+    """
+    One unit of startup work.
+
+    `action` returns False to report a soft failure (e.g. connect() returned False);
+    any other return value counts as success. Steps listed in `depends_on` must be
+    declared earlier in the same run; a step is skipped when a dependency did not succeed.
+    Exceptions from `required` steps abort startup; other failures are logged and recorded.
+    """
+    name: str
+    action: Callable[[], Awaitable[Any]]
+    phase: str = "connect"
+    depends_on: Tuple[str, ...] = ()
+    required: bool = False
+    timeout: Optional[float] = None
+
+
+class StartupTimings:
+    """Collects per-component, per-phase startup durations."""
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self._finished: Optional[float] = None
+        self._entries: List[Dict[str, Any]] = []
+
+    def record(self, component: str, phase: str, started: float, ended: float, status: str = "ok") -> None:
+        """Record one timed span (perf_counter timestamps)."""
+        self._entries.append({
+            "component": component,
+            "phase": phase,
+            "started": started,
+            "ended": ended,
+            "status": status,
+        })
+
+    @contextmanager
+    def measure(self, component: str, phase: str) -> Iterator[None]:
+        """Time the enclosed block as `component` / `phase`."""
+        started = time.perf_counter()
+        status = "ok"
+        try:
+            yield
+        except BaseException:
+            status = "failed"
+            raise
+        finally:
+            self.record(component, phase, started, time.perf_counter(), status)
+
+    def finish(self) -> None:
+        """Mark startup complete (fixes total_ms)."""
+        self._finished = time.perf_counter()
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Return the timing breakdown.
+
+        Per phase, `wall_ms` is elapsed time from the first span's start to the last
+        span's end (what startup actually waited) and `cumulative_ms` is the sum of
+        all spans (what it would have cost serially).
+        """
+        end = self._finished if self._finished is not None else time.perf_counter()
+        phases: Dict[str, Dict[str, float]] = {}
+        components: Dict[str, Dict[str, Any]] = {}
+        for phase in STARTUP_PHASES:
+            spans = [e for e in self._entries if e["phase"] == phase]
+            if not spans:
+                continue
+            phases[phase] = {
+                "wall_ms": _ms(max(e["ended"] for e in spans) - min(e["started"] for e in spans)),
+                "cumulative_ms": _ms(sum(e["ended"] - e["started"] for e in spans)),
+            }
+        for entry in self._entries:
+            component = components.setdefault(entry["component"], {"status": "ok"})
+            key = f"{entry['phase']}_ms"
+            component[key] = round(component.get(key, 0.0) + _ms(entry["ended"] - entry["started"]), 3)
+            if entry["status"] != "ok":
+                component["status"] = entry["status"]
+        return {
+            "total_ms": _ms(end - self._origin),
+            "phases": phases,
+            "components": components,
+        }
+
+    def format(self) -> str:
+        """One-line rendering for logs."""
+        summary = self.summary()
+        parts = [f"{phase}={values['wall_ms']:.1f}ms" for phase, values in summary["phases"].items()]
+        parts.append(f"total={summary['total_ms']:.1f}ms")
+        slow = sorted(
+            ((name, sum(v for k, v in data.items() if k.endswith("_ms"))) for name, data in summary["components"].items()),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:3]
+        if slow:
+            parts.append("slowest: " + ", ".join(f"{name} {ms:.1f}ms" for name, ms in slow))
+        return " ".join(parts)
+
+
+class StartupOrchestrator:
+    """Runs StartupSteps concurrently in dependency order."""
+
+    def __init__(
+        self,
+        timings: StartupTimings,
+        default_timeout: float = DEFAULT_STEP_TIMEOUT_SECONDS,
+    ):
+        self.timings = timings
+        self.default_timeout = default_timeout
+        self.logger = get_logger(self.__class__.__name__)
+
+    async def run(self, steps: List[StartupStep]) -> Dict[str, str]:
+        """
+        Run all steps; each starts as soon as its dependencies have finished.
+
+        Returns:
+            Dict mapping step name to "ok", "failed", "timeout" or "skipped"
+
+        Raises:
+            ValueError: If a step depends on an unknown or later step
+            Exception: The first error raised by a required step
+        """
+        tasks: Dict[str, asyncio.Task] = {}
+        for step in steps:
+            if step.phase not in STARTUP_PHASES:
+                raise ValueError(f"Unknown startup phase '{step.phase}' for step '{step.name}'")
+            missing = [dep for dep in step.depends_on if dep not in tasks]
+            if missing:
+                raise ValueError(
+                    f"Startup step '{step.name}' depends on {missing}, which must be declared before it"
+                )
+            deps = [tasks[dep] for dep in step.depends_on]
+            tasks[step.name] = asyncio.create_task(self._run_step(step, deps), name=f"startup:{step.name}")
+
+        outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        statuses: Dict[str, str] = {}
+        first_error: Optional[BaseException] = None
+        for step, outcome in zip(steps, outcomes):
+            if isinstance(outcome, BaseException):
+                statuses[step.name] = "failed"
+                if first_error is None:
+                    first_error = outcome
+            else:
+                statuses[step.name] = outcome
+        if first_error is not None:
+            raise first_error
+        return statuses
+
+    async def _run_step(self, step: StartupStep, deps: List[asyncio.Task]) -> str:
+        if deps:
+            dep_statuses = await asyncio.gather(*deps, return_exceptions=True)
+            if any(status != "ok" for status in dep_statuses):
+                self.logger.warning(
+                    f"Startup step '{step.name}' skipped: dependency {list(step.depends_on)} did not succeed"
+                )
+                return "skipped"
+
+        timeout = step.timeout if step.timeout is not None else self.default_timeout
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(step.action(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.timings.record(step.name, step.phase, started, time.perf_counter(), "timeout")
+            message = f"Startup step '{step.name}' timed out after {timeout:.1f}s"
+            if step.required:
+                raise RuntimeError(message)
+            self.logger.warning(message)
+            return "timeout"
+        except Exception as e:
+            self.timings.record(step.name, step.phase, started, time.perf_counter(), "failed")
+            if step.required:
+                raise
+            self.logger.warning(f"Startup step '{step.name}' failed: {e}", exc_info=True)
+            return "failed"
+
+        status = "failed" if result is False else "ok"
+        self.timings.record(step.name, step.phase, started, time.perf_counter(), status)
+        return status
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
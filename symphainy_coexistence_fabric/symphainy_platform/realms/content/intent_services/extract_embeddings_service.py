@@ -128,6 +128,9 @@ class ExtractEmbeddingsService(BaseIntentService):
         
         embedding_id = result.get("embedding_id")
         embeddings_count = result.get("embeddings_count", 0)
+        if result.get("status") == "failed":
+            failed = result.get("failed_columns") or [{}]
+            raise RuntimeError(f"Semantic embeddings were not stored: {failed[0].get('error', 'unknown error')}")
         
         # Track embeddings for lineage
         await self._track_embedding(
@@ -165,7 +168,9 @@ class ExtractEmbeddingsService(BaseIntentService):
                 "deterministic_embedding_id": deterministic_embedding_id,
                 "embedding_id": embedding_id,
                 "embeddings_count": embeddings_count,
-                "columns_processed": result.get("columns_processed", 0)
+                "columns_processed": result.get("columns_processed", 0),
+                "status": result.get("status", "success"),
+                "failed_columns": result.get("failed_columns", [])
             },
             "events": [event]
         }
@@ -19,7 +19,7 @@ Owns:
 from .intent_model import Intent, IntentType, IntentFactory
 from .intent_registry import IntentRegistry, IntentHandler
 from .execution_context import ExecutionContext, ExecutionContextFactory
-from .execution_lifecycle_manager import ExecutionLifecycleManager, ExecutionResult
+from .execution_lifecycle_manager import ExecutionLifecycleManager, ExecutionResult, IdempotencyConflictError
 from .transactional_outbox import TransactionalOutbox, OutboxEvent
 from .data_brain import DataBrain, DataReference, ProvenanceEntry
 from .state_surface import StateSurface
@@ -39,6 +39,7 @@ __all__ = [
     # Execution Lifecycle
     "ExecutionLifecycleManager",
     "ExecutionResult",
+    "IdempotencyConflictError",
     # Transactional Outbox
     "TransactionalOutbox",
     "OutboxEvent",
@@ -0,0 +1,153 @@
+"""
+Admission Control - Load shedding in front of intent execution
+
+Rejects new intent submissions while the runtime is already saturated, instead of
+queueing them behind work it cannot finish in time.
+
+WHAT (Runtime Role): I decide whether the runtime can take on another execution right now
+HOW (Runtime Implementation): I count in-flight executions (overall and per tenant) and sample
+                              event-loop lag in the background; a submission is rejected with a
+                              retry hint when either count is at its limit or lag is over budget
+
+Admission is per worker process (in-flight work and loop lag are local); quotas across
+workers are the rate limiter's job.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from utilities import get_logger
+
+
+DEFAULT_MAX_IN_FLIGHT = 256
+
+DEFAULT_MAX_LOOP_LAG_MS = 250.0
+
+DEFAULT_LAG_SAMPLE_INTERVAL = 0.1
+
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
+
+class AdmissionRejected(RuntimeError):
+    """The runtime is overloaded; retry after `retry_after` seconds."""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(f"Runtime overloaded ({reason})")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class _Admission:
+    """Holds one execution slot until exit."""
+
+    __slots__ = ("_controller", "_tenant")
+
+    def __init__(self, controller: "AdmissionController", tenant: str):
+        self._controller = controller
+        self._tenant = tenant
+
+    def __enter__(self) -> "_Admission":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._controller._release(self._tenant)
+
+
+class AdmissionController:
+    """In-flight and event-loop-lag admission; see module docstring."""
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = DEFAULT_MAX_IN_FLIGHT,
+        tenant_max_in_flight: Optional[int] = None,
+        max_loop_lag_ms: Optional[float] = DEFAULT_MAX_LOOP_LAG_MS,
+        lag_sample_interval: float = DEFAULT_LAG_SAMPLE_INTERVAL,
+        retry_after_seconds: float = DEFAULT_RETRY_AFTER_SECONDS
+    ):
+        """
+        Initialize admission controller.
+
+        Args:
+            max_in_flight: Executions running at once in this process (None = unbounded)
+            tenant_max_in_flight: Executions running at once per tenant (None = unbounded)
+            max_loop_lag_ms: Event-loop lag above which submissions are shed (None = not checked)
+            lag_sample_interval: Seconds between lag samples
+            retry_after_seconds: Retry hint returned with rejections
+        """
+        self.max_in_flight = max_in_flight
+        self.tenant_max_in_flight = tenant_max_in_flight
+        self.max_loop_lag_ms = max_loop_lag_ms
+        self.lag_sample_interval = lag_sample_interval
+        self.retry_after_seconds = retry_after_seconds
+        self.logger = get_logger(self.__class__.__name__)
+        self.in_flight = 0
+        self.loop_lag_ms = 0.0
+        self._tenant_in_flight: Dict[str, int] = {}
+        self._monitor: Optional[asyncio.Task] = None
+        self._stats = {"admitted": 0, "rejected_in_flight": 0, "rejected_tenant_in_flight": 0, "rejected_loop_lag": 0}
+
+    def admit(self, tenant_id: Optional[str]) -> _Admission:
+        """
+        Take an execution slot; use as `with controller.admit(tenant_id): ...`.
+
+        Raises:
+            AdmissionRejected: Too many executions in flight, or the event loop is lagging
+        """
+        self._ensure_monitor()
+        tenant = tenant_id or "anonymous"
+        if self.max_loop_lag_ms is not None and self.loop_lag_ms > self.max_loop_lag_ms:
+            self._reject("loop_lag", f"event loop lag {self.loop_lag_ms:.0f}ms")
+        if self.max_in_flight is not None and self.in_flight >= self.max_in_flight:
+            self._reject("in_flight", f"{self.in_flight} executions in flight")
+        tenant_in_flight = self._tenant_in_flight.get(tenant, 0)
+        if self.tenant_max_in_flight is not None and tenant_in_flight >= self.tenant_max_in_flight:
+            self._reject("tenant_in_flight", f"{tenant_in_flight} executions in flight for tenant")
+        self.in_flight += 1
+        self._tenant_in_flight[tenant] = tenant_in_flight + 1
+        self._stats["admitted"] += 1
+        return _Admission(self, tenant)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters plus current in-flight count and loop lag."""
+        return {**self._stats, "in_flight": self.in_flight, "loop_lag_ms": round(self.loop_lag_ms, 1)}
+
+    async def aclose(self) -> None:
+        """Stop the lag monitor."""
+        if self._monitor is not None:
+            self._monitor.cancel()
+            try:
+                await self._monitor
+            except asyncio.CancelledError:
+                pass
+            self._monitor = None
+
+    def _reject(self, reason: str, detail: str) -> None:
+        self._stats[f"rejected_{reason}"] += 1
+        self.logger.warning(f"Shedding intent submission: {detail}")
+        raise AdmissionRejected(reason, self.retry_after_seconds)
+
+    def _release(self, tenant: str) -> None:
+        self.in_flight -= 1
+        remaining = self._tenant_in_flight.get(tenant, 1) - 1
+        if remaining > 0:
+            self._tenant_in_flight[tenant] = remaining
+        else:
+            self._tenant_in_flight.pop(tenant, None)
+
+    def _ensure_monitor(self) -> None:
+        if self.max_loop_lag_ms is None:
+            return
+        loop = asyncio.get_running_loop()
+        if self._monitor is not None and not self._monitor.done() and self._monitor.get_loop() is loop:
+            return
+        self.loop_lag_ms = 0.0  # samples from another (or a stopped) loop no longer apply
+        self._monitor = loop.create_task(self._sample_loop_lag())
+
+    async def _sample_loop_lag(self) -> None:
+        """Lag = how late a sleep of lag_sample_interval wakes up; a spike decays by half per sample."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.lag_sample_interval)
+            sample = max(0.0, loop.time() - started - self.lag_sample_interval) * 1000
+            self.loop_lag_ms = max(sample, self.loop_lag_ms / 2)
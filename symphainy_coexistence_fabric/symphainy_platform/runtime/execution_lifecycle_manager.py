@@ -8,13 +8,23 @@ HOW (Runtime Implementation): I coordinate intent acceptance, execution, artifac
 
 Key Principle: Runtime owns execution. This manager ensures every step is
 governed, logged, and recoverable.
+
+Idempotency: an intent carrying an idempotency key (client-supplied, or derived from
+intent type, session and parameters for the deterministic intent types) runs once per
+tenant; repeats return the stored result, and repeats arriving while the first is still
+running wait for it (single-flight) instead of re-running parsers, embeddings or LLM calls.
+A client key reused for a different intent type or parameters is rejected
+(IdempotencyConflictError, HTTP 409) rather than answered with the first intent's result.
 """
 
-from typing import Dict, Any, Optional, List
+import asyncio
+import hashlib
+import json
+from typing import Dict, Any, FrozenSet, Iterable, Optional, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
-from utilities import get_logger, get_clock, generate_event_id
+from utilities import get_logger, get_clock, generate_event_id, log_context, bind_log_context
 from .intent_model import Intent, IntentFactory
 from .execution_context import ExecutionContext, ExecutionContextFactory
 from .intent_registry import IntentRegistry, IntentHandler
@@ -30,6 +40,33 @@ except ImportError:
     trace = None
 
 
+DEFAULT_IDEMPOTENCY_TTL_SECONDS = 86400
+
+# Deterministic for the same inputs; others are only deduplicated with a client key
+DEFAULT_DERIVED_KEY_INTENT_TYPES = frozenset({
+    "parse_content",
+    "extract_embeddings",
+    "analyze_content",
+    "interpret_data",
+    "assess_data_quality",
+    "extract_structured_data",
+    "analyze_structured_data",
+    "analyze_unstructured_data",
+})
+
+
+class IdempotencyConflictError(Exception):
+    """An idempotency key was reused for a different intent (type or parameters)."""
+
+    def __init__(self, key: str, intent_type: str, original_intent_type: Optional[str]):
+        super().__init__(
+            f"Idempotency key {key} was already used for a different {original_intent_type or 'intent'} request"
+        )
+        self.key = key
+        self.intent_type = intent_type
+        self.original_intent_type = original_intent_type
+
+
 @dataclass
 class ExecutionResult:
     """Execution result."""
@@ -72,7 +109,9 @@ class ExecutionLifecycleManager:
         artifact_storage: Optional[Any] = None,  # ArtifactStorageAbstraction
         solution_config: Optional[Dict[str, Any]] = None,
         data_steward_sdk: Optional[Any] = None,  # DataStewardSDK for boundary contract enforcement
-        platform_context_factory: Optional[Any] = None  # PlatformContextFactory for new architecture
+        platform_context_factory: Optional[Any] = None,  # PlatformContextFactory for new architecture
+        idempotency_ttl_seconds: Optional[int] = DEFAULT_IDEMPOTENCY_TTL_SECONDS,
+        derived_key_intent_types: Iterable[str] = DEFAULT_DERIVED_KEY_INTENT_TYPES
     ):
         """
         Initialize execution lifecycle manager.
@@ -87,6 +126,8 @@ class ExecutionLifecycleManager:
             solution_config: Optional solution-specific configuration
             data_steward_sdk: Optional Data Steward SDK for boundary contract enforcement
             platform_context_factory: Optional PlatformContextFactory for new architecture
+            idempotency_ttl_seconds: How long results are replayed for repeated keys (None = idempotency off)
+            derived_key_intent_types: Intent types keyed by a hash of their inputs when the client sends no key
         """
         self.intent_registry = intent_registry
         self.state_surface = state_surface
@@ -97,23 +138,174 @@ class ExecutionLifecycleManager:
         self.solution_config = solution_config or {}
         self.data_steward_sdk = data_steward_sdk
         self.platform_context_factory = platform_context_factory
+        self.idempotency_ttl_seconds = idempotency_ttl_seconds
+        self.derived_key_intent_types: FrozenSet[str] = frozenset(derived_key_intent_types)
         self.logger = get_logger(self.__class__.__name__)
         self.clock = get_clock()
+        # (tenant, key) -> (request fingerprint, future of the running execution)
+        self._in_flight: Dict[Tuple[str, str], Tuple[str, "asyncio.Future[Optional[ExecutionResult]]"]] = {}
+        self._idempotency_stats = {"executed": 0, "replayed": 0, "coalesced": 0}
         
         # Debug: Log data_steward_sdk state at initialization
         self.logger.info(f"🔍 ExecutionLifecycleManager.__init__: data_steward_sdk type={type(data_steward_sdk)}, is None={data_steward_sdk is None}")
         self.logger.info(f"🔍 ExecutionLifecycleManager.__init__: platform_context_factory available={platform_context_factory is not None}")
     
-    async def execute(self, intent: Intent) -> ExecutionResult:
+    async def execute(
+        self,
+        intent: Intent,
+        execution_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        intent_logged: bool = False
+    ) -> ExecutionResult:
         """
         Execute an intent through the full lifecycle.
         
+        Binds tenant/session/intent (and, once created, execution) IDs to the
+        log context so every log line emitted during execution carries them.
+        
         Args:
             intent: The intent to execute
+            execution_id: Optional pre-assigned execution ID (batch submissions hand it out up front)
+            metadata: Optional execution context metadata shared by related executions (e.g. batch_id)
+            intent_logged: True if INTENT_RECEIVED is already in the WAL (appended with its batch)
         
         Returns:
             Execution result
         """
+        with log_context(
+            tenant_id=intent.tenant_id,
+            session_id=intent.session_id,
+            intent_type=intent.intent_type
+        ):
+            key = self.idempotency_key(intent)
+            if key is None:
+                return await self._execute_lifecycle(intent, execution_id, metadata, intent_logged)
+            return await self._execute_once(key, intent, execution_id, metadata, intent_logged)
+    
+    def idempotency_key(self, intent: Intent) -> Optional[str]:
+        """
+        Key under which the intent's result is reused, or None if it always runs.
+        
+        The client's key wins; otherwise deterministic intent types are keyed by a canonical
+        hash of intent type, solution, session and parameters. metadata["skip_idempotency"]
+        forces a fresh run.
+        """
+        if self.idempotency_ttl_seconds is None or intent.metadata.get("skip_idempotency"):
+            return None
+        client_key = intent.idempotency_key or intent.metadata.get("idempotency_key")
+        if client_key:
+            return f"client:{client_key}"
+        if intent.intent_type not in self.derived_key_intent_types:
+            return None
+        canonical = json.dumps(
+            [intent.intent_type, intent.solution_id, intent.session_id, intent.parameters],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str
+        )
+        return f"intent:{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}"
+    
+    @staticmethod
+    def request_fingerprint(intent: Intent) -> str:
+        """Hash of what a key stands for (intent type and parameters); a reused key must match it."""
+        canonical = json.dumps([intent.intent_type, intent.parameters], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    
+    def get_idempotency_stats(self) -> Dict[str, int]:
+        """Executions run, replayed from a stored result, and coalesced onto one in flight."""
+        return {**self._idempotency_stats, "in_flight": len(self._in_flight)}
+    
+    async def _execute_once(
+        self,
+        key: str,
+        intent: Intent,
+        execution_id: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+        intent_logged: bool
+    ) -> ExecutionResult:
+        """
+        Single-flight per (tenant, key), then replay of the stored result while it lives.
+        
+        Raises:
+            IdempotencyConflictError: If the key belongs to a different intent type or parameters
+        """
+        flight_key = (intent.tenant_id, key)
+        fingerprint = self.request_fingerprint(intent)
+        in_flight = self._in_flight.get(flight_key)
+        if in_flight is not None:
+            if in_flight[0] != fingerprint:
+                raise IdempotencyConflictError(key, intent.intent_type, None)
+            self._idempotency_stats["coalesced"] += 1
+            self.logger.info(f"Intent {intent.intent_id} coalesced onto in-flight execution ({key})")
+            result = await asyncio.shield(in_flight[1])
+            if result is not None:
+                return result
+            # The first caller was cancelled before finishing; run it ourselves
+            return await self._execute_once(key, intent, execution_id, metadata, intent_logged)
+        
+        future: "asyncio.Future[Optional[ExecutionResult]]" = asyncio.get_running_loop().create_future()
+        self._in_flight[flight_key] = (fingerprint, future)
+        result: Optional[ExecutionResult] = None
+        try:
+            result = await self._replay(key, intent, fingerprint)
+            if result is None:
+                self._idempotency_stats["executed"] += 1
+                result = await self._execute_lifecycle(intent, execution_id, metadata, intent_logged)
+                if result.success:
+                    await self._remember_result(key, intent, result)
+            return result
+        finally:
+            del self._in_flight[flight_key]
+            future.set_result(result)
+    
+    async def _replay(self, key: str, intent: Intent, fingerprint: str) -> Optional[ExecutionResult]:
+        """Result of an earlier execution with this key, or None if there is none."""
+        stored = await self.state_surface.check_idempotency(key, intent.tenant_id)
+        if not stored or not stored.get("execution_id"):
+            return None
+        if stored.get("request_fingerprint", fingerprint) != fingerprint:
+            raise IdempotencyConflictError(key, intent.intent_type, stored.get("intent_type"))
+        self._idempotency_stats["replayed"] += 1
+        self.logger.info(
+            f"Intent {intent.intent_id} replayed from execution {stored['execution_id']} ({key})"
+        )
+        return ExecutionResult(
+            execution_id=stored["execution_id"],
+            success=True,
+            artifacts=stored.get("artifacts") or {},
+            events=stored.get("events") or [],
+            metadata={**(stored.get("metadata") or {}), "idempotent_replay": True, "original_intent_id": stored.get("intent_id")}
+        )
+    
+    async def _remember_result(self, key: str, intent: Intent, result: ExecutionResult) -> None:
+        """Store a successful result for replay (failures are not stored, so retries re-run)."""
+        record = {
+            "execution_id": result.execution_id,
+            "intent_id": intent.intent_id,
+            "intent_type": intent.intent_type,
+            "request_fingerprint": self.request_fingerprint(intent),
+            "artifacts": result.artifacts,
+            "events": result.events,
+            "metadata": result.metadata,
+        }
+        try:
+            json.dumps(record)
+        except (TypeError, ValueError):
+            # Non-JSON artifacts: keep the reference; the execution state holds the artifacts
+            record["artifacts"], record["events"] = {}, []
+        if not await self.state_surface.store_idempotency_result(
+            key, intent.tenant_id, record, ttl=self.idempotency_ttl_seconds
+        ):
+            self.logger.warning(f"Idempotency result not stored for {key}; a retry will re-run the intent")
+    
+    async def _execute_lifecycle(
+        self,
+        intent: Intent,
+        assigned_execution_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        intent_logged: bool = False
+    ) -> ExecutionResult:
+        """Run the lifecycle stages for execute()."""
         execution_id = None
         
         # Create trace span for execution
@@ -149,16 +341,17 @@ class ExecutionLifecycleManager:
                 raise ValueError(f"Invalid intent: {error}")
             
             # Log intent received
-            await self.wal.append(
-                WALEventType.INTENT_RECEIVED,
-                intent.tenant_id,
-                {
-                    "intent_id": intent.intent_id,
-                    "intent_type": intent.intent_type,
-                    "session_id": intent.session_id,
-                    "solution_id": intent.solution_id,
-                }
-            )
+            if not intent_logged:
+                await self.wal.append(
+                    WALEventType.INTENT_RECEIVED,
+                    intent.tenant_id,
+                    {
+                        "intent_id": intent.intent_id,
+                        "intent_type": intent.intent_type,
+                        "session_id": intent.session_id,
+                        "solution_id": intent.solution_id,
+                    }
+                )
             
             # Stage 2: Create Execution Context
             self.logger.info(f"Creating execution context for intent: {intent.intent_id}")
@@ -169,9 +362,12 @@ class ExecutionLifecycleManager:
             context = ExecutionContextFactory.create_context(
                 intent=intent,
                 state_surface=self.state_surface,
-                wal=self.wal
+                wal=self.wal,
+                metadata=dict(metadata) if metadata else None,
+                execution_id=assigned_execution_id
             )
             execution_id = context.execution_id
+            bind_log_context(execution_id=execution_id)  # reset by execute()'s log_context
             
             if OTEL_AVAILABLE and trace and current_span and hasattr(current_span, 'set_attribute'):
                 current_span.set_attribute("execution.id", execution_id)
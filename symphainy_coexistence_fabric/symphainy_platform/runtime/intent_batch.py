@@ -0,0 +1,256 @@
+"""
+Intent Batch - Many intents in one submission
+
+Lets a client hand over hundreds of intents (e.g. one parse per uploaded file) in one
+call instead of one HTTP round trip, auth check and registry lookup per intent.
+
+WHAT (Runtime Role): I accept a batch of intents and run them as one tracked operation
+HOW (Runtime Implementation): I validate every intent up front (handler lookups once per intent
+                              type), assign execution IDs, append all INTENT_RECEIVED events in
+                              one pipelined WAL write, then run the executions in the background
+                              through ExecutionLifecycleManager under one concurrency limit shared
+                              by every batch in the process; batch progress is kept in State
+                              Surface as operation progress
+
+Intents that fail validation are reported per item and never executed; the rest of the
+batch still runs. Each execution keeps its own execution state, so the usual execution
+status endpoint works for every execution ID in the batch.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from utilities import generate_event_id, get_clock, get_logger
+from .execution_lifecycle_manager import ExecutionLifecycleManager
+from .intent_model import Intent
+from .state_surface import StateSurface
+from .wal import WALEventType
+
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+DEFAULT_MAX_BATCH_SIZE = 500
+
+
+@dataclass
+class BatchItem:
+    """One intent of a batch."""
+    intent: Intent
+    execution_id: Optional[str] = None  # None when rejected
+    status: str = "queued"  # queued, running, completed, failed, rejected
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "intent_id": self.intent.intent_id,
+            "intent_type": self.intent.intent_type,
+            "execution_id": self.execution_id,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+@dataclass
+class IntentBatch:
+    """A submitted batch and its per-intent outcome."""
+    batch_id: str
+    tenant_id: str
+    items: List[BatchItem]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    created_at: str = ""
+
+    @property
+    def accepted(self) -> List[BatchItem]:
+        return [item for item in self.items if item.execution_id is not None]
+
+    def progress(self) -> Dict[str, Any]:
+        """Operation-progress record for State Surface."""
+        counts = {"completed": 0, "failed": 0, "rejected": 0}
+        for item in self.items:
+            if item.status in counts:
+                counts[item.status] += 1
+        processed = counts["completed"] + counts["failed"]
+        accepted = len(self.accepted)
+        if processed < accepted:
+            status = "running"
+        elif counts["failed"] or counts["rejected"]:
+            status = "completed_with_errors" if counts["completed"] else "failed"
+        else:
+            status = "completed"
+        return {
+            "batch_id": self.batch_id,
+            "status": status,
+            "total": len(self.items),
+            "accepted": accepted,
+            "processed": processed,
+            "succeeded": counts["completed"],
+            "failed": counts["failed"],
+            "rejected": counts["rejected"],
+            "items": [item.to_dict() for item in self.items],
+            "created_at": self.created_at,
+        }
+
+
+class IntentBatchExecutor:
+    """Validates, logs and schedules intent batches; see module docstring."""
+
+    def __init__(
+        self,
+        execution_lifecycle_manager: ExecutionLifecycleManager,
+        state_surface: StateSurface,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE
+    ):
+        """
+        Initialize batch executor.
+
+        Args:
+            execution_lifecycle_manager: Runs each intent (its registry and WAL are used for the batch)
+            state_surface: Holds batch progress (operation progress) and execution state
+            max_concurrency: Batch executions running at once in this process (all batches together)
+            max_batch_size: Largest batch accepted
+        """
+        self.execution_lifecycle_manager = execution_lifecycle_manager
+        self.state_surface = state_surface
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_batch_size = max_batch_size
+        self.logger = get_logger(self.__class__.__name__)
+        self.clock = get_clock()
+        self._running: Set[asyncio.Task] = set()
+        # Executor-wide, so concurrent batches cannot multiply the load
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+
+    async def submit(
+        self,
+        intents: List[Intent],
+        tenant_id: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> IntentBatch:
+        """
+        Validate and log a batch, then start executing it in the background.
+
+        Args:
+            intents: Intents to execute (all for tenant_id)
+            tenant_id: Tenant submitting the batch
+            metadata: Execution context metadata shared by every execution (batch_id is added)
+
+        Returns:
+            IntentBatch with execution IDs for accepted intents and errors for rejected ones
+
+        Raises:
+            ValueError: Empty batch or more than max_batch_size intents
+        """
+        self.check_size(len(intents))
+
+        batch = IntentBatch(
+            batch_id=generate_event_id(),
+            tenant_id=tenant_id,
+            items=[BatchItem(intent=intent) for intent in intents],
+            created_at=self.clock.now_iso()
+        )
+        batch.metadata = {**(metadata or {}), "batch_id": batch.batch_id}
+        self._validate(batch)
+
+        accepted = batch.accepted
+        if accepted:
+            await self.execution_lifecycle_manager.wal.append_many([
+                (
+                    WALEventType.INTENT_RECEIVED,
+                    item.intent.tenant_id,
+                    {
+                        "intent_id": item.intent.intent_id,
+                        "intent_type": item.intent.intent_type,
+                        "session_id": item.intent.session_id,
+                        "solution_id": item.intent.solution_id,
+                        "batch_id": batch.batch_id,
+                        "execution_id": item.execution_id,
+                    }
+                )
+                for item in accepted
+            ])
+        await self._save_progress(batch)
+
+        if accepted:
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+        self.logger.info(
+            f"Batch {batch.batch_id}: {len(accepted)} of {len(batch.items)} intents accepted "
+            f"(concurrency {self.max_concurrency})"
+        )
+        return batch
+
+    def check_size(self, size: int) -> None:
+        """Raise ValueError for an empty batch or one over max_batch_size."""
+        if size == 0:
+            raise ValueError("Batch contains no intents")
+        if size > self.max_batch_size:
+            raise ValueError(f"Batch of {size} intents exceeds the limit of {self.max_batch_size}")
+
+    async def get_status(self, batch_id: str, tenant_id: str) -> Optional[Dict[str, Any]]:
+        """Batch progress (counts plus per-intent status), or None if unknown."""
+        return await self.state_surface.get_operation_progress(batch_id, tenant_id)
+
+    async def aclose(self) -> None:
+        """Cancel batches still running (their executions are left as they are)."""
+        tasks = list(self._running)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _validate(self, batch: IntentBatch) -> None:
+        """Reject invalid intents; handler lookups happen once per intent type."""
+        registry = self.execution_lifecycle_manager.intent_registry
+        has_handler: Dict[str, bool] = {}
+        for item in batch.items:
+            intent = item.intent
+            is_valid, error = intent.validate()
+            if is_valid and intent.tenant_id != batch.tenant_id:
+                is_valid, error = False, "intent tenant_id does not match the batch"
+            if is_valid:
+                if intent.intent_type not in has_handler:
+                    has_handler[intent.intent_type] = bool(registry.get_intent_handlers(intent.intent_type))
+                if not has_handler[intent.intent_type]:
+                    is_valid, error = False, f"No handler found for intent type: {intent.intent_type}"
+            if is_valid:
+                item.execution_id = generate_event_id()
+            else:
+                item.status, item.error = "rejected", error
+
+    async def _run(self, batch: IntentBatch) -> None:
+        pending = len(batch.accepted)
+        checkpoint = max(1, pending // 20)  # progress writes: every 5% of the batch and at the end
+        done = 0
+
+        async def run_one(item: BatchItem) -> None:
+            nonlocal done
+            async with self._slots:
+                item.status = "running"
+                try:
+                    result = await self.execution_lifecycle_manager.execute(
+                        item.intent,
+                        execution_id=item.execution_id,
+                        metadata=batch.metadata,
+                        intent_logged=True
+                    )
+                    item.status, item.error = ("completed", None) if result.success else ("failed", result.error)
+                    if result.success:
+                        item.execution_id = result.execution_id  # differs when replayed or coalesced
+                except Exception as e:
+                    self.logger.error(f"Batch {batch.batch_id} execution {item.execution_id} failed: {e}", exc_info=True)
+                    item.status, item.error = "failed", str(e)
+            done += 1
+            if done % checkpoint == 0 and done < pending:
+                await self._save_progress(batch)
+
+        await asyncio.gather(*(run_one(item) for item in batch.accepted))
+        await self._save_progress(batch)
+        progress = batch.progress()
+        self.logger.info(
+            f"Batch {batch.batch_id} {progress['status']}: {progress['succeeded']} succeeded, {progress['failed']} failed"
+        )
+
+    async def _save_progress(self, batch: IntentBatch) -> None:
+        if not await self.state_surface.track_operation_progress(batch.batch_id, batch.tenant_id, batch.progress()):
+            self.logger.warning(f"Batch {batch.batch_id} progress not stored; status queries will lag")
@@ -150,6 +150,7 @@ class Intent:
             "parameters": self.parameters,
             "metadata": self.metadata,
             "created_at": self.created_at.isoformat(),
+            "idempotency_key": self.idempotency_key,
         }
     
     @classmethod
@@ -164,6 +165,7 @@ class Intent:
             parameters=data.get("parameters", {}),
             metadata=data.get("metadata", {}),
             created_at=datetime.fromisoformat(data.get("created_at", get_clock().now_utc().isoformat())),
+            idempotency_key=data.get("idempotency_key"),
         )
 
 
@@ -182,7 +184,8 @@ class IntentFactory:
         solution_id: str,
         parameters: Optional[Dict[str, Any]] = None,
         metadata: Optional[Dict[str, Any]] = None,
-        intent_id: Optional[str] = None
+        intent_id: Optional[str] = None,
+        idempotency_key: Optional[str] = None
     ) -> Intent:
         """
         Create an intent.
@@ -195,6 +198,7 @@ class IntentFactory:
             parameters: Intent parameters
             metadata: Intent metadata
             intent_id: Optional intent ID (generated if not provided)
+            idempotency_key: Optional client key; repeats of the key return the first result
         
         Returns:
             Created intent
@@ -210,6 +214,7 @@ class IntentFactory:
             solution_id=solution_id,
             parameters=parameters or {},
             metadata=metadata or {},
+            idempotency_key=idempotency_key,
         )
         
         # Validate intent
@@ -15,17 +15,22 @@ project_root = Path(__file__).resolve().parents[3]
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from fastapi import FastAPI, HTTPException, Depends, Request, Query
+import contextlib
+import math
+
+from fastapi import FastAPI, HTTPException, Depends, Header, Request, Query
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel
 
-from utilities import get_logger
-from .execution_lifecycle_manager import ExecutionLifecycleManager
+from utilities import get_logger, LogCategory
+from .execution_lifecycle_manager import ExecutionLifecycleManager, IdempotencyConflictError
 from .intent_model import Intent, IntentFactory
 from .intent_registry import IntentRegistry
 from .state_surface import StateSurface
 from .wal import WriteAheadLog
 from .transactional_outbox import TransactionalOutbox
+from .admission_control import AdmissionController, AdmissionRejected
+from .intent_batch import IntentBatchExecutor
 from symphainy_platform.civic_systems.smart_city.primitives.traffic_cop_primitives import (
     TrafficCopPrimitives,
     RateLimitStore
@@ -60,6 +65,7 @@ class IntentSubmitRequest(BaseModel):
     solution_id: str
     parameters: Dict[str, Any] = {}
     metadata: Dict[str, Any] = {}
+    idempotency_key: Optional[str] = None  # repeats return the first submission's result
 
 
 class IntentSubmitResponse(BaseModel):
@@ -68,6 +74,55 @@ class IntentSubmitResponse(BaseModel):
     intent_id: str
     status: str
     created_at: str
+    replayed: bool = False  # True when an earlier execution's result was returned
+
+
+class BatchIntentItem(BaseModel):
+    """One intent of a batch (tenant, session and solution come from the batch)."""
+    intent_id: Optional[str] = None
+    intent_type: str
+    parameters: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = {}
+
+
+class IntentBatchSubmitRequest(BaseModel):
+    """Request to submit many intents at once."""
+    tenant_id: str
+    session_id: str
+    solution_id: str
+    intents: List[BatchIntentItem]
+    metadata: Dict[str, Any] = {}  # shared by every intent of the batch
+
+
+class IntentBatchItemStatus(BaseModel):
+    """Outcome of one intent in a batch."""
+    intent_id: str
+    intent_type: str
+    execution_id: Optional[str] = None  # None when the intent was rejected
+    status: str
+    error: Optional[str] = None
+
+
+class IntentBatchSubmitResponse(BaseModel):
+    """Response from batch submission."""
+    batch_id: str
+    status: str
+    accepted: int
+    rejected: int
+    items: List[IntentBatchItemStatus]
+    created_at: str
+
+
+class IntentBatchStatusResponse(BaseModel):
+    """Response from batch status query."""
+    batch_id: str
+    status: str
+    total: int
+    processed: int
+    succeeded: int
+    failed: int
+    rejected: int
+    items: List[IntentBatchItemStatus]
 
 
 class ExecutionStatusResponse(BaseModel):
@@ -183,7 +238,10 @@ class RuntimeAPI:
         state_surface: StateSurface,
         artifact_storage: Optional[Any] = None,  # ArtifactStorageAbstraction
         file_storage: Optional[Any] = None,  # FileStorageAbstraction
-        registry_abstraction: Optional[Any] = None  # RegistryAbstraction (for Supabase queries)
+        registry_abstraction: Optional[Any] = None,  # RegistryAbstraction (for Supabase queries)
+        rate_limiter: Optional[Any] = None,  # DistributedRateLimiter
+        admission_controller: Optional[AdmissionController] = None,
+        batch_executor: Optional[IntentBatchExecutor] = None
     ):
         """
         Initialize Runtime API.
@@ -194,12 +252,19 @@ class RuntimeAPI:
             artifact_storage: Optional artifact storage abstraction
             file_storage: Optional file storage abstraction (for file artifacts)
             registry_abstraction: Optional registry abstraction (for Supabase artifact index queries)
+            rate_limiter: Optional shared rate limiter (tenant / user / intent-type quotas on intent submission)
+            admission_controller: Optional admission control (sheds submissions when the runtime is saturated)
+            batch_executor: Optional batch executor (default: one with default concurrency)
         """
         self.execution_lifecycle_manager = execution_lifecycle_manager
         self.file_storage = file_storage
         self.state_surface = state_surface
         self.artifact_storage = artifact_storage
         self.registry_abstraction = registry_abstraction
+        self.rate_limiter = rate_limiter
+        self.admission_controller = admission_controller
+        self.rate_limit_store = RateLimitStore(limiter=rate_limiter)
+        self.batch_executor = batch_executor or IntentBatchExecutor(execution_lifecycle_manager, state_surface)
         self.logger = get_logger(self.__class__.__name__)
     
     async def create_session(
@@ -238,14 +303,11 @@ class RuntimeAPI:
             # Validate execution contract via Traffic Cop Primitives (intent validation pattern)
             execution_contract = request.execution_contract or {}
             
-            # Initialize Traffic Cop Primitives (MVP: simple validation)
-            rate_limit_store = RateLimitStore()  # MVP: in-memory, always allows
-            traffic_cop_primitives = TrafficCopPrimitives(rate_limit_store=rate_limit_store)
-            
-            # Validate session creation intent
+            # Validate session creation intent (rate limits shared across workers)
+            traffic_cop_primitives = TrafficCopPrimitives(rate_limit_store=self.rate_limit_store)
             is_valid = await traffic_cop_primitives.validate_session_creation(
                 execution_contract=execution_contract,
-                rate_limit_store=rate_limit_store
+                rate_limit_store=self.rate_limit_store
             )
             
             if not is_valid:
@@ -373,7 +435,10 @@ class RuntimeAPI:
         """
         try:
             # Log received tenant_id for debugging
-            self.logger.info(f"🔵 RECEIVED REQUEST: tenant_id={request.tenant_id}, intent_type={request.intent_type}")
+            self.logger.info(
+                lambda: f"🔵 RECEIVED REQUEST: tenant_id={request.tenant_id}, intent_type={request.intent_type}",
+                category=LogCategory.HOT_PATH
+            )
             
             # Create intent
             intent = IntentFactory.create_intent(
@@ -383,11 +448,14 @@ class RuntimeAPI:
                 solution_id=request.solution_id,
                 parameters=request.parameters,
                 metadata=request.metadata,
-                intent_id=request.intent_id
+                intent_id=request.intent_id,
+                idempotency_key=request.idempotency_key
             )
             
-            # Execute intent
-            result = await self.execution_lifecycle_manager.execute(intent)
+            # Shed load before executing: admission (this worker saturated), then quotas (all workers)
+            with self._admit(request.tenant_id):
+                await self._enforce_quotas(request.tenant_id, request.metadata.get("user_id"), request.intent_type)
+                result = await self.execution_lifecycle_manager.execute(intent)
             
             if not result.success:
                 raise HTTPException(status_code=500, detail=result.error)
@@ -396,15 +464,147 @@ class RuntimeAPI:
                 execution_id=result.execution_id,
                 intent_id=intent.intent_id,
                 status="accepted" if result.success else "failed",
-                created_at=result.metadata.get("created_at", "")
+                created_at=result.metadata.get("created_at", ""),
+                replayed=bool(result.metadata.get("idempotent_replay"))
             )
             
         except HTTPException:
             raise
+        except IdempotencyConflictError as e:
+            raise HTTPException(
+                status_code=409,
+                detail={"error": "idempotency_key_conflict", "message": str(e)}
+            )
         except Exception as e:
             self.logger.error(f"Failed to submit intent: {e}", exc_info=True)
             raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
     
+    def _admit(self, tenant_id: Optional[str]) -> Any:
+        """Take an execution slot, or raise 429 with Retry-After when the runtime is overloaded."""
+        if self.admission_controller is None:
+            return contextlib.nullcontext()
+        try:
+            return self.admission_controller.admit(tenant_id)
+        except AdmissionRejected as e:
+            retry_after = str(max(1, math.ceil(e.retry_after)))
+            raise HTTPException(
+                status_code=429,
+                detail={"error": "runtime_overloaded", "reason": e.reason, "retry_after": retry_after},
+                headers={"Retry-After": retry_after}
+            )
+    
+    async def submit_intent_batch(
+        self,
+        request: IntentBatchSubmitRequest
+    ) -> IntentBatchSubmitResponse:
+        """
+        Submit many intents in one call.
+        
+        Intents are validated and logged together and executed in the background under the
+        batch executor's process-wide concurrency limit; admission control sheds the submission
+        itself. Poll get_intent_batch_status (or each execution's status).
+        
+        Args:
+            request: Batch submission request
+        
+        Returns:
+            Batch ID plus per-intent execution IDs (or rejection errors)
+        """
+        try:
+            # Size limits first, so a batch that cannot run takes nothing from the quotas
+            self.batch_executor.check_size(len(request.intents))
+            intents = [
+                IntentFactory.create_intent(
+                    intent_type=item.intent_type,
+                    tenant_id=request.tenant_id,
+                    session_id=request.session_id,
+                    solution_id=request.solution_id,
+                    parameters=item.parameters,
+                    metadata={**request.metadata, **item.metadata},
+                    intent_id=item.intent_id
+                )
+                for item in request.intents
+            ]
+            
+            with self._admit(request.tenant_id):
+                counts: Dict[str, int] = {}
+                for intent in intents:
+                    counts[intent.intent_type] = counts.get(intent.intent_type, 0) + 1
+                for intent_type, count in counts.items():
+                    await self._enforce_quotas(request.tenant_id, request.metadata.get("user_id"), intent_type, cost=count)
+                batch = await self.batch_executor.submit(intents, request.tenant_id, metadata=request.metadata)
+            
+            progress = batch.progress()
+            return IntentBatchSubmitResponse(
+                batch_id=batch.batch_id,
+                status=progress["status"],
+                accepted=progress["accepted"],
+                rejected=progress["rejected"],
+                items=[IntentBatchItemStatus(**item) for item in progress["items"]],
+                created_at=batch.created_at
+            )
+            
+        except HTTPException:
+            raise
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            self.logger.error(f"Failed to submit intent batch: {e}", exc_info=True)
+            raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    
+    async def get_intent_batch_status(self, batch_id: str, tenant_id: str) -> IntentBatchStatusResponse:
+        """
+        Get batch status (counts and per-intent status).
+        
+        Args:
+            batch_id: Batch identifier
+            tenant_id: Tenant identifier
+        
+        Returns:
+            Batch status response
+        """
+        progress = await self.batch_executor.get_status(batch_id, tenant_id)
+        if not progress:
+            raise HTTPException(status_code=404, detail="Batch not found")
+        return IntentBatchStatusResponse(
+            batch_id=batch_id,
+            status=progress["status"],
+            total=progress["total"],
+            processed=progress["processed"],
+            succeeded=progress["succeeded"],
+            failed=progress["failed"],
+            rejected=progress["rejected"],
+            items=[IntentBatchItemStatus(**item) for item in progress["items"]]
+        )
+    
+    async def _enforce_quotas(
+        self,
+        tenant_id: str,
+        user_id: Optional[str],
+        intent_type: str,
+        cost: int = 1
+    ) -> None:
+        """Count submissions against tenant / user / intent-type quotas; 429 when one is exhausted."""
+        if self.rate_limiter is None:
+            return
+        decision = await self.rate_limiter.check_quotas(
+            tenant_id=tenant_id,
+            user_id=user_id,
+            intent_type=intent_type,
+            cost=cost
+        )
+        if not decision.allowed:
+            raise HTTPException(
+                status_code=429,
+                detail={
+                    "error": "rate_limit_exceeded",
+                    "scope": decision.scope,
+                    "limit": decision.limit,
+                    "retry_after": decision.retry_after_header
+                },
+                headers={"Retry-After": decision.retry_after_header, "X-RateLimit-Limit": str(decision.limit)}
+            )
+    
     async def get_execution_status(
         self,
         execution_id: str,
@@ -937,7 +1137,10 @@ def create_runtime_app(
     state_surface: StateSurface,
     artifact_storage: Optional[Any] = None,
     file_storage: Optional[Any] = None,
-    registry_abstraction: Optional[Any] = None
+    registry_abstraction: Optional[Any] = None,
+    rate_limiter: Optional[Any] = None,
+    admission_controller: Optional[AdmissionController] = None,
+    batch_executor: Optional[IntentBatchExecutor] = None
 ) -> FastAPI:
     """
     Create FastAPI app for Runtime API.
@@ -948,14 +1151,26 @@ def create_runtime_app(
         artifact_storage: Optional artifact storage abstraction
         file_storage: Optional file storage abstraction
         registry_abstraction: Optional registry abstraction (for Supabase artifact index queries)
+        rate_limiter: Optional shared rate limiter (DistributedRateLimiter)
+        admission_controller: Optional admission control for intent submission
+        batch_executor: Optional batch executor (concurrency and size limits for batch submission)
     
     Returns:
         FastAPI application
     """
+    @contextlib.asynccontextmanager
+    async def lifespan(app: FastAPI):
+        yield
+        # Background batches and the admission lag monitor must not outlive the app
+        await runtime_api.batch_executor.aclose()
+        if admission_controller is not None:
+            await admission_controller.aclose()
+    
     app = FastAPI(
         title="Symphainy Runtime API",
         description="Runtime API - Intent submission and execution management",
-        version="2.0.0"
+        version="2.0.0",
+        lifespan=lifespan
     )
     
     runtime_api = RuntimeAPI(
@@ -963,7 +1178,10 @@ def create_runtime_app(
         state_surface,
         artifact_storage=artifact_storage,
         file_storage=file_storage,
-        registry_abstraction=registry_abstraction
+        registry_abstraction=registry_abstraction,
+        rate_limiter=rate_limiter,
+        admission_controller=admission_controller,
+        batch_executor=batch_executor
     )
     
     @app.post("/api/session/create", response_model=SessionCreateResponse)
@@ -972,10 +1190,25 @@ def create_runtime_app(
         return await runtime_api.create_session(request)
     
     @app.post("/api/intent/submit", response_model=IntentSubmitResponse)
-    async def submit_intent(request: IntentSubmitRequest):
-        """Submit intent for execution."""
+    async def submit_intent(
+        request: IntentSubmitRequest,
+        idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")
+    ):
+        """Submit intent for execution (Idempotency-Key header or body field makes retries safe)."""
+        if idempotency_key and not request.idempotency_key:
+            request.idempotency_key = idempotency_key
         return await runtime_api.submit_intent(request)
     
+    @app.post("/api/intent/batch/submit", response_model=IntentBatchSubmitResponse)
+    async def submit_intent_batch(request: IntentBatchSubmitRequest):
+        """Submit many intents in one call."""
+        return await runtime_api.submit_intent_batch(request)
+    
+    @app.get("/api/intent/batch/{batch_id}/status", response_model=IntentBatchStatusResponse)
+    async def get_intent_batch_status(batch_id: str, tenant_id: str):
+        """Get batch status."""
+        return await runtime_api.get_intent_batch_status(batch_id, tenant_id)
+    
     @app.get("/api/session/{session_id}")
     async def get_session(
         session_id: str,
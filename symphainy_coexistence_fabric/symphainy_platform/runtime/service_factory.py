@@ -26,7 +26,11 @@ from utilities import get_logger
 
 from .runtime_services import RuntimeServices
 from .state_surface import StateSurface
-from .execution_lifecycle_manager import ExecutionLifecycleManager
+from .execution_lifecycle_manager import (
+    ExecutionLifecycleManager,
+    DEFAULT_DERIVED_KEY_INTENT_TYPES,
+    DEFAULT_IDEMPOTENCY_TTL_SECONDS,
+)
 from .intent_registry import IntentRegistry
 from .wal import WriteAheadLog
 
@@ -39,7 +43,10 @@ from ..civic_systems.platform_sdk import PlatformContextFactory
 logger = get_logger(__name__)
 
 
-async def create_runtime_services(config: Dict[str, Any]) -> RuntimeServices:
+async def create_runtime_services(
+    config: Dict[str, Any],
+    public_works: Optional[PublicWorksFoundationService] = None
+) -> RuntimeServices:
     """
     Build the runtime object graph.
     
@@ -52,6 +59,9 @@ async def create_runtime_services(config: Dict[str, Any]) -> RuntimeServices:
     
     Args:
         config: Configuration dictionary (from get_env_contract())
+        public_works: Optional pre-built (uninitialized) PublicWorksFoundationService.
+            Lets harnesses such as tests/benchmarks bind Layer 0 to local stand-ins;
+            production passes nothing and the service is built from config.
     
     Returns:
         RuntimeServices object with all long-lived services
@@ -64,7 +74,8 @@ async def create_runtime_services(config: Dict[str, Any]) -> RuntimeServices:
     # Step 1: Initialize Public Works Foundation Service
     # This provides all infrastructure adapters and abstractions
     logger.info("  → Initializing PublicWorksFoundationService...")
-    public_works = PublicWorksFoundationService(config=config)
+    if public_works is None:
+        public_works = PublicWorksFoundationService(config=config)
     
     # Initialize adapters and abstractions (async method). Pre-boot passed, so init must succeed.
     logger.info("  → Initializing adapters and abstractions...")
@@ -457,6 +468,7 @@ async def create_runtime_services(config: Dict[str, Any]) -> RuntimeServices:
 
     # Step 6: Create ExecutionLifecycleManager
     logger.info("  → Creating ExecutionLifecycleManager...")
+    derived_key_intent_types = [t.strip() for t in (config.get("idempotency_derived_intent_types") or "").split(",") if t.strip()]
     execution_lifecycle_manager = ExecutionLifecycleManager(
         intent_registry=intent_registry,
         state_surface=state_surface,
@@ -464,6 +476,11 @@ async def create_runtime_services(config: Dict[str, Any]) -> RuntimeServices:
         artifact_storage=public_works.get_artifact_storage_abstraction(),
         platform_context_factory=platform_context_factory,
         data_steward_sdk=data_steward_sdk,
+        idempotency_ttl_seconds=(
+            int(config.get("idempotency_ttl_seconds") or DEFAULT_IDEMPOTENCY_TTL_SECONDS)
+            if config.get("idempotency_enabled", True) else None
+        ),
+        derived_key_intent_types=derived_key_intent_types or DEFAULT_DERIVED_KEY_INTENT_TYPES,
     )
     logger.info("  ✅ ExecutionLifecycleManager created")
 
@@ -509,16 +526,36 @@ def create_fastapi_app(services: RuntimeServices) -> Any:
         ValueError: If required services are missing
     """
     from .runtime_api import create_runtime_app
+    from .admission_control import AdmissionController
+    from .intent_batch import IntentBatchExecutor
     
     logger.info("🔧 Creating FastAPI app...")
     
+    # Admission control is per worker; 0 in config disables a check
+    config = services.public_works.config
+    admission_controller = AdmissionController(
+        max_in_flight=int(config.get("admission_max_in_flight") or 0) or None,
+        tenant_max_in_flight=int(config.get("admission_tenant_max_in_flight") or 0) or None,
+        max_loop_lag_ms=float(config.get("admission_max_loop_lag_ms") or 0) or None,
+        retry_after_seconds=float(config.get("admission_retry_after_seconds") or 1)
+    )
+    batch_executor = IntentBatchExecutor(
+        services.execution_lifecycle_manager,
+        services.state_surface,
+        max_concurrency=int(config.get("intent_batch_max_concurrency") or 8),
+        max_batch_size=int(config.get("intent_batch_max_size") or 500)
+    )
+    
     # Create FastAPI app (receives services, doesn't create them)
     app = create_runtime_app(
         execution_lifecycle_manager=services.execution_lifecycle_manager,
         state_surface=services.state_surface,
         registry_abstraction=services.registry_abstraction,
         artifact_storage=services.artifact_storage,
-        file_storage=services.file_storage
+        file_storage=services.file_storage,
+        rate_limiter=services.public_works.get_rate_limiter(),
+        admission_controller=admission_controller,
+        batch_executor=batch_executor
     )
     # Attach full services to app for tests and admin tooling (e.g. genesis_services fixture)
     app.state.runtime_services = services
@@ -10,7 +10,7 @@ HOW (Runtime Implementation): I use Public Works StateManagementAbstraction
 
 from typing import Dict, Any, Optional, List
 
-from utilities import get_logger, get_clock
+from utilities import get_logger, get_clock, LogCategory
 from symphainy_platform.foundations.public_works.protocols.state_protocol import StateManagementProtocol
 from symphainy_platform.foundations.public_works.protocols.file_storage_protocol import FileStorageProtocol
 from .artifact_registry import (
@@ -110,7 +110,10 @@ class StateSurface:
         """
         state_id = f"execution:{tenant_id}:{execution_id}"
         state["updated_at"] = self.clock.now_iso()
-        self.logger.info(f"🔵 SET_EXECUTION_STATE CALLED: {state_id}, status={state.get('status')}")
+        self.logger.info(
+            lambda: f"🔵 SET_EXECUTION_STATE CALLED: {state_id}, status={state.get('status')}",
+            category=LogCategory.HOT_PATH
+        )
         
         if self.use_memory:
             self._memory_store[state_id] = state
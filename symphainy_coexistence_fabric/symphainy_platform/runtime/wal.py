@@ -12,7 +12,7 @@ Uses Redis Streams for scalability (supports 350k+ policies).
 
 import json
 from dataclasses import dataclass
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, date
 from enum import Enum
 
@@ -193,6 +193,56 @@ class WriteAheadLog:
             self._memory_log.append(event)
             return event
     
+    async def append_many(
+        self,
+        events: List[Tuple[WALEventType, str, Dict[str, Any]]]
+    ) -> List[WALEvent]:
+        """
+        Append several events in one round trip (e.g. the intents of a batch submission).
+        
+        Args:
+            events: (event_type, tenant_id, payload) triples, appended in order
+        
+        Returns:
+            Created WAL events, in order
+        """
+        now = self.clock.now_utc()
+        created = [
+            WALEvent(
+                event_id=generate_event_id(),
+                event_type=event_type,
+                tenant_id=tenant_id,
+                timestamp=now,
+                payload=payload
+            )
+            for event_type, tenant_id, payload in events
+        ]
+        
+        if self.use_memory:
+            self._memory_log.extend(created)
+            return created
+        
+        if not self.event_log:
+            raise RuntimeError(
+                "Event log not wired; cannot append WAL event (use_memory=False). Platform contract §8A."
+            )
+        
+        try:
+            message_ids = await self.event_log.xadd_many(
+                [(self._get_stream_name(event.tenant_id), event.to_stream_fields()) for event in created],
+                maxlen=self.max_events_per_partition,
+                approximate=True
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to append WAL events: {e}", exc_info=True)
+            message_ids = [None] * len(created)
+        
+        missing = [event for event, message_id in zip(created, message_ids) if not message_id]
+        if missing:
+            self.logger.warning(f"Failed to append {len(missing)} of {len(created)} WAL events; kept in memory")
+            self._memory_log.extend(missing)
+        return created
+    
     async def get_events(
         self,
         tenant_id: str,
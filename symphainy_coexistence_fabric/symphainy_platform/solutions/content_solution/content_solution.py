@@ -42,6 +42,7 @@ from .journeys.file_upload_materialization_journey import FileUploadMaterializat
 from .journeys.file_parsing_journey import FileParsingJourney
 from .journeys.deterministic_embedding_journey import DeterministicEmbeddingJourney
 from .journeys.file_management_journey import FileManagementJourney
+from .journeys.bulk_ingestion_journey import BulkIngestionJourney
 
 
 class ContentSolution:
@@ -53,6 +54,7 @@ class ContentSolution:
     - FileParsingJourney (future)
     - DeterministicEmbeddingJourney (future)
     - FileManagementJourney (future)
+    - BulkIngestionJourney
     
     Exposes SOA APIs:
     - compose_journey: Invoke a journey by ID
@@ -77,7 +79,8 @@ class ContentSolution:
         "retrieve_artifact_metadata",
         "archive_file",
         "delete_file",  # Hard delete of file artifacts
-        "get_parsed_file"  # Retrieve parsed file content
+        "get_parsed_file",  # Retrieve parsed file content
+        "bulk_ingest_files"  # Ingest, parse and embed many files
     ]
     
     def __init__(
@@ -140,6 +143,12 @@ class ContentSolution:
             state_surface=self.state_surface
         )
         
+        # Bulk Ingestion Journey
+        self._journeys["bulk_ingestion"] = BulkIngestionJourney(
+            public_works=self.public_works,
+            state_surface=self.state_surface
+        )
+        
         self.logger.info(f"Initialized {len(self._journeys)} journey orchestrators")
     
     def _build_solution_model(self) -> Solution:
@@ -282,6 +291,8 @@ class ContentSolution:
             "retrieve_artifact_metadata": "file_management",
             "archive_file": "file_management",
             "delete_file": "file_management",  # Hard delete
+            # Bulk Ingestion
+            "bulk_ingest_files": "bulk_ingestion",
         }
         
         journey_id = intent_to_journey.get(intent_type)
@@ -9,16 +9,19 @@ Key Journeys:
 - FileParsingJourney: Parse uploaded files
 - DeterministicEmbeddingJourney: Create embeddings for parsed content
 - FileManagementJourney: Archive, retrieve, list files
+- BulkIngestionJourney: Ingest, parse and embed many files with progress tracking
 """
 
 from .file_upload_materialization_journey import FileUploadMaterializationJourney
 from .file_parsing_journey import FileParsingJourney
 from .deterministic_embedding_journey import DeterministicEmbeddingJourney
 from .file_management_journey import FileManagementJourney
+from .bulk_ingestion_journey import BulkIngestionJourney
 
 __all__ = [
     "FileUploadMaterializationJourney",
     "FileParsingJourney",
     "DeterministicEmbeddingJourney",
-    "FileManagementJourney"
+    "FileManagementJourney",
+    "BulkIngestionJourney"
 ]
@@ -0,0 +1,538 @@
+"""
+Bulk Ingestion Journey Orchestrator
+
+Composes the bulk ingestion journey: many files, each through
+1. ingest - FileUploadMaterializationJourney (skipped for files that already have an artifact_id)
+2. parse - FileParsingJourney (resumes the pending parsing journey created by materialization)
+3. embed - DeterministicEmbeddingJourney
+
+WHAT (Journey Role): I orchestrate ingestion of a whole manifest or storage prefix
+HOW (Journey Implementation): I fan items out to a bounded worker pool, run ingest → parse → embed
+                              per item with retry and backoff per stage, and checkpoint per-item
+                              progress through State Surface operation progress in batches
+                              (every k finished items or t seconds, and at the end)
+
+Key Principle: One failing file never fails the batch. Each item records the stage it reached
+and the artifacts it produced; re-running with the same operation_id and manifest skips
+completed items and resumes the others at the stage that failed.
+"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[5]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+import asyncio
+import posixpath
+from typing import Dict, Any, List, Optional
+
+from utilities import get_logger, generate_event_id, get_clock
+from symphainy_platform.runtime.execution_context import ExecutionContext
+from symphainy_platform.realms.utils.structured_artifacts import create_structured_artifact
+
+from .file_upload_materialization_journey import FileUploadMaterializationJourney
+from .file_parsing_journey import FileParsingJourney
+from .deterministic_embedding_journey import DeterministicEmbeddingJourney
+
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+MAX_CONCURRENCY_LIMIT = 32
+
+DEFAULT_MAX_RETRIES = 2
+
+DEFAULT_RETRY_BACKOFF_SECONDS = 0.5
+
+# A checkpoint rewrites the whole progress record: store it every k finished items
+# (at least this many, or about CHECKPOINTS_PER_RUN times per run) or every t seconds
+DEFAULT_CHECKPOINT_EVERY = 50
+
+CHECKPOINTS_PER_RUN = 20
+
+DEFAULT_CHECKPOINT_INTERVAL_SECONDS = 5.0
+
+STAGES = ("ingest", "parse", "embed")
+
+
+class BulkIngestionJourney:
+    """
+    Bulk Ingestion Journey Orchestrator.
+
+    Journey Flow:
+    1. User submits a manifest of files (or a storage prefix to ingest everything under)
+    2. Items are fanned out to max_concurrency workers
+    3. Each item runs ingest → parse → embed; a failing stage is retried with exponential backoff
+    4. Progress (counts plus per-item stage, artifacts and errors) is checkpointed every
+       checkpoint_every finished items or checkpoint_interval_seconds, and when the run ends
+    5. Re-submitting with the returned operation_id resumes: completed items are skipped,
+       failed ones continue from the stage they reached
+
+    Provides MCP Tools:
+    - content_bulk_ingest: Ingest, parse and embed many files
+    - content_get_bulk_ingestion_status: Get progress of a bulk ingestion
+    """
+
+    JOURNEY_ID = "bulk_ingestion"
+    JOURNEY_NAME = "Bulk Ingestion"
+
+    def __init__(
+        self,
+        public_works: Optional[Any] = None,
+        state_surface: Optional[Any] = None
+    ):
+        self.logger = get_logger(self.__class__.__name__)
+        self.clock = get_clock()
+        self.public_works = public_works
+        self.state_surface = state_surface
+        self.journey_id = self.JOURNEY_ID
+        self.journey_name = self.JOURNEY_NAME
+        self.telemetry_service = None
+
+        # Per-item stages reuse the single-file journeys
+        self.upload_journey = FileUploadMaterializationJourney(public_works=public_works, state_surface=state_surface)
+        self.parsing_journey = FileParsingJourney(public_works=public_works, state_surface=state_surface)
+        self.embedding_journey = DeterministicEmbeddingJourney(public_works=public_works, state_surface=state_surface)
+
+    async def compose_journey(
+        self,
+        context: ExecutionContext,
+        journey_params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Compose the bulk ingestion journey.
+
+        Args:
+            context: Execution context
+            journey_params: Journey parameters including:
+                - files: Manifest; each entry has either artifact_id (already ingested),
+                  storage_path (downloaded from file storage) or file_content + file_name,
+                  plus optional content_type / file_type
+                - storage_prefix: Ingest every file under this storage prefix (instead of files)
+                  storage_prefix and storage_path must lie under the caller's tenant ("{tenant_id}/...")
+                - content_type / file_type: Defaults for entries that do not set them
+                - operation_id: Resume a previous bulk ingestion (same manifest or prefix)
+                - max_concurrency: Items processed at once (default: 4)
+                - max_retries: Retries per failing stage (default: 2)
+                - retry_backoff_seconds: First retry delay, doubled per retry (default: 0.5)
+                - embed: If False, stop after parsing (default: True)
+                - checkpoint_every: Finished items per progress checkpoint
+                  (default: 50, or 1/20 of the items if more)
+                - checkpoint_interval_seconds: Longest time between checkpoints (default: 5)
+        """
+        journey_params = journey_params or {}
+        self.logger.info(f"Composing journey: {self.journey_name}")
+
+        journey_execution_id = generate_event_id()
+        operation_id = journey_params.get("operation_id") or journey_execution_id
+
+        try:
+            validation_result = self._validate_journey_params(journey_params, context.tenant_id)
+            if not validation_result["valid"]:
+                raise ValueError(f"Invalid journey parameters: {validation_result['error']}")
+
+            state_surface = self.state_surface or context.state_surface
+            if state_surface is None:
+                raise RuntimeError("State Surface is required to track bulk ingestion progress")
+
+            manifest = journey_params.get("files")
+            if manifest is None:
+                manifest = await self._list_storage_prefix(journey_params["storage_prefix"], context.tenant_id)
+            items = self._build_items(manifest, journey_params)
+            if not items:
+                raise ValueError("No files to ingest")
+
+            resumed = 0
+            if journey_params.get("operation_id"):
+                previous = await state_surface.get_operation_progress(operation_id, context.tenant_id)
+                if previous is not None:
+                    resumed = self._restore_items(items, previous)
+
+            stages = STAGES if journey_params.get("embed", True) else STAGES[:2]
+            max_concurrency = min(
+                max(1, int(journey_params.get("max_concurrency", DEFAULT_MAX_CONCURRENCY))),
+                MAX_CONCURRENCY_LIMIT
+            )
+            await self._run_items(
+                context,
+                state_surface,
+                operation_id,
+                items,
+                stages=stages,
+                max_concurrency=max_concurrency,
+                max_retries=max(0, int(journey_params.get("max_retries", DEFAULT_MAX_RETRIES))),
+                retry_backoff_seconds=float(journey_params.get("retry_backoff_seconds", DEFAULT_RETRY_BACKOFF_SECONDS)),
+                checkpoint_every=max(1, int(journey_params.get(
+                    "checkpoint_every", max(DEFAULT_CHECKPOINT_EVERY, len(items) // CHECKPOINTS_PER_RUN)
+                ))),
+                checkpoint_interval_seconds=float(journey_params.get(
+                    "checkpoint_interval_seconds", DEFAULT_CHECKPOINT_INTERVAL_SECONDS
+                ))
+            )
+
+            return self._build_journey_result(
+                progress=self._progress(operation_id, items),
+                journey_execution_id=journey_execution_id,
+                resumed=resumed
+            )
+
+        except Exception as e:
+            self.logger.error(f"Journey failed: {e}", exc_info=True)
+            return {
+                "success": False,
+                "error": str(e),
+                "journey_id": self.journey_id,
+                "journey_execution_id": journey_execution_id,
+                "operation_id": operation_id,
+                "artifacts": {},
+                "events": [{"type": "journey_failed", "journey_id": self.journey_id, "error": str(e)}]
+            }
+
+    def _validate_journey_params(self, params: Dict[str, Any], tenant_id: str) -> Dict[str, Any]:
+        files = params.get("files")
+        if files is None and not params.get("storage_prefix"):
+            return {"valid": False, "error": "files or storage_prefix is required"}
+        if files is not None and params.get("storage_prefix"):
+            return {"valid": False, "error": "files and storage_prefix are mutually exclusive"}
+        if params.get("storage_prefix") and not self._in_tenant_storage(params["storage_prefix"], tenant_id):
+            return {"valid": False, "error": f"storage_prefix must be under {tenant_id}/"}
+        if files is not None and not isinstance(files, list):
+            return {"valid": False, "error": "files must be a list"}
+        for index, entry in enumerate(files or []):
+            if not isinstance(entry, dict):
+                return {"valid": False, "error": f"files[{index}] must be an object"}
+            if not (entry.get("artifact_id") or entry.get("storage_path") or (entry.get("file_content") and entry.get("file_name"))):
+                return {"valid": False, "error": f"files[{index}] needs artifact_id, storage_path, or file_content and file_name"}
+            if entry.get("storage_path") and not self._in_tenant_storage(entry["storage_path"], tenant_id):
+                return {"valid": False, "error": f"files[{index}].storage_path must be under {tenant_id}/"}
+        return {"valid": True}
+
+    @staticmethod
+    def _in_tenant_storage(path: Any, tenant_id: str) -> bool:
+        """True if a storage path / prefix lies under the tenant's storage root (every writer uses "{tenant_id}/...")."""
+        if not isinstance(path, str) or not tenant_id or path.startswith("/"):
+            return False
+        if ".." in path.split("/"):
+            return False
+        return path.startswith(f"{tenant_id}/")
+
+    async def _list_storage_prefix(self, storage_prefix: str, tenant_id: str) -> List[Dict[str, Any]]:
+        """Manifest entries for every file under a storage prefix (tenant-scoped)."""
+        file_storage = self.public_works.get_file_storage_abstraction() if self.public_works else None
+        if file_storage is None:
+            raise RuntimeError("File storage is not available; cannot list storage_prefix")
+        listed = await file_storage.list_files(prefix=storage_prefix)
+        return [
+            {"storage_path": entry["name"]}
+            for entry in listed
+            if entry.get("name") and not entry["name"].endswith("/")
+            and self._in_tenant_storage(entry["name"], tenant_id)
+        ]
+
+    def _build_items(self, manifest: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Per-item state; item_key identifies an entry across resumed runs."""
+        items = []
+        seen: Dict[str, int] = {}
+        for entry in manifest:
+            base_key = entry.get("artifact_id") or entry.get("storage_path") or entry.get("file_name")
+            seen[base_key] = seen.get(base_key, 0) + 1
+            item_key = base_key if seen[base_key] == 1 else f"{base_key}#{seen[base_key]}"
+            file_name = entry.get("file_name") or (posixpath.basename(entry["storage_path"]) if entry.get("storage_path") else None)
+            items.append({
+                "item_key": item_key,
+                "entry": entry,
+                "file_name": file_name,
+                "content_type": entry.get("content_type", params.get("content_type", "unstructured")),
+                "file_type": entry.get("file_type") or params.get("file_type") or self._file_type_from_name(file_name),
+                "status": "pending",  # pending, running, completed, failed
+                "stage": "parse" if entry.get("artifact_id") else "ingest",  # next stage to run
+                "artifact_id": entry.get("artifact_id"),
+                "pending_journey_id": None,
+                "parsed_artifact_id": None,
+                "embedding_artifact_id": None,
+                "attempts": 0,
+                "error": None
+            })
+        return items
+
+    def _restore_items(self, items: List[Dict[str, Any]], previous: Dict[str, Any]) -> int:
+        """Carry stage and artifacts over from a checkpoint; returns items already completed."""
+        checkpoint = {item["item_key"]: item for item in previous.get("items", [])}
+        completed = 0
+        for item in items:
+            saved = checkpoint.get(item["item_key"])
+            if saved is None:
+                continue
+            for key in ("stage", "artifact_id", "pending_journey_id", "parsed_artifact_id", "embedding_artifact_id", "attempts"):
+                if saved.get(key) is not None:
+                    item[key] = saved[key]
+            if saved.get("status") == "completed":
+                item["status"] = "completed"
+                completed += 1
+        return completed
+
+    async def _run_items(
+        self,
+        context: ExecutionContext,
+        state_surface: Any,
+        operation_id: str,
+        items: List[Dict[str, Any]],
+        stages: tuple,
+        max_concurrency: int,
+        max_retries: int,
+        retry_backoff_seconds: float,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+        checkpoint_interval_seconds: float = DEFAULT_CHECKPOINT_INTERVAL_SECONDS
+    ) -> None:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        checkpoint_lock = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        unsaved = 0
+        saved_at = loop.time()
+
+        async def checkpoint() -> None:
+            nonlocal unsaved, saved_at
+            async with checkpoint_lock:
+                unsaved, saved_at = 0, loop.time()
+                progress = self._progress(operation_id, items)
+                if not await state_surface.track_operation_progress(operation_id, context.tenant_id, progress):
+                    self.logger.warning(f"Bulk ingestion {operation_id} checkpoint not stored; a resume will redo work")
+
+        async def run_one(item: Dict[str, Any]) -> None:
+            nonlocal unsaved
+            async with semaphore:
+                item["status"], item["error"] = "running", None
+                try:
+                    await self._run_item(context, item, stages, max_retries, retry_backoff_seconds)
+                except Exception as e:
+                    self.logger.error(f"Bulk ingestion item {item['item_key']} failed: {e}", exc_info=True)
+                    item["status"], item["error"] = "failed", str(e)
+            unsaved += 1
+            if unsaved >= checkpoint_every or loop.time() - saved_at >= checkpoint_interval_seconds:
+                await checkpoint()
+
+        await checkpoint()
+        try:
+            await asyncio.gather(*(run_one(item) for item in items if item["status"] != "completed"))
+        finally:
+            # Items finished since the last batch (also when the run is cancelled)
+            await checkpoint()
+        progress = self._progress(operation_id, items)
+        self.logger.info(
+            f"Bulk ingestion {operation_id} {progress['status']}: "
+            f"{progress['succeeded']} succeeded, {progress['failed']} failed"
+        )
+
+    async def _run_item(
+        self,
+        context: ExecutionContext,
+        item: Dict[str, Any],
+        stages: tuple,
+        max_retries: int,
+        retry_backoff_seconds: float
+    ) -> None:
+        """Run the remaining stages of one item; a stage that keeps failing marks the item failed."""
+        remaining = stages[stages.index(item["stage"]):] if item["stage"] in stages else ()
+        for position, stage in enumerate(remaining):
+            for attempt in range(max_retries + 1):
+                item["attempts"] += 1
+                result = await self._execute_stage(context, item, stage)
+                if result.get("success", False):
+                    break
+                item["error"] = f"{stage}: {result.get('error', 'Unknown error')}"
+                if attempt < max_retries:
+                    await asyncio.sleep(retry_backoff_seconds * (2 ** attempt))
+            else:
+                item["status"] = "failed"
+                return
+            item["error"] = None
+            item["stage"] = remaining[position + 1] if position + 1 < len(remaining) else "done"
+        item["stage"] = "done"
+        item["status"] = "completed"
+
+    async def _execute_stage(self, context: ExecutionContext, item: Dict[str, Any], stage: str) -> Dict[str, Any]:
+        if stage == "ingest":
+            return await self._execute_ingest(context, item)
+        if stage == "parse":
+            result = await self.parsing_journey.compose_journey(context, {
+                "artifact_id": item["artifact_id"],
+                "pending_journey_id": item["pending_journey_id"],
+                "ingest_type": item["content_type"],
+                "file_type": item["file_type"],
+                "auto_save": True
+            })
+            if result.get("success", False):
+                item["parsed_artifact_id"] = result.get("parsed_artifact_id")
+            return result
+        result = await self.embedding_journey.compose_journey(context, {
+            "parsed_artifact_id": item["parsed_artifact_id"],
+            "auto_save": True
+        })
+        if result.get("success", False):
+            item["embedding_artifact_id"] = result.get("embedding_artifact_id")
+        return result
+
+    async def _execute_ingest(self, context: ExecutionContext, item: Dict[str, Any]) -> Dict[str, Any]:
+        entry = item["entry"]
+        file_content = entry.get("file_content")
+        if file_content is None:
+            if not self._in_tenant_storage(entry["storage_path"], context.tenant_id):
+                return {"success": False, "error": f"storage_path must be under {context.tenant_id}/"}
+            file_storage = self.public_works.get_file_storage_abstraction() if self.public_works else None
+            if file_storage is None:
+                return {"success": False, "error": "File storage is not available"}
+            file_content = await file_storage.download_file(entry["storage_path"])
+            if file_content is None:
+                return {"success": False, "error": f"Could not download {entry['storage_path']}"}
+
+        result = await self.upload_journey.compose_journey(context, {
+            "file_content": file_content,
+            "file_name": item["file_name"],
+            "content_type": item["content_type"],
+            "file_type": item["file_type"],
+            "copybook_content": entry.get("copybook_content"),
+            "auto_save": True
+        })
+        if result.get("success", False):
+            item["artifact_id"] = result.get("artifact_id")
+            for event in result.get("events", []):
+                if event.get("type") == "file_materialized":
+                    item["pending_journey_id"] = event.get("pending_journey_id")
+        return result
+
+    def _progress(self, operation_id: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Operation-progress record (also the resume checkpoint)."""
+        succeeded = sum(1 for item in items if item["status"] == "completed")
+        failed = sum(1 for item in items if item["status"] == "failed")
+        processed = succeeded + failed
+        if processed < len(items):
+            status = "running"
+        elif failed:
+            status = "completed_with_errors" if succeeded else "failed"
+        else:
+            status = "completed"
+        return {
+            "operation_id": operation_id,
+            "operation_type": self.journey_id,
+            "status": status,
+            "total": len(items),
+            "processed": processed,
+            "succeeded": succeeded,
+            "failed": failed,
+            "items": [
+                {key: value for key, value in item.items() if key != "entry"}
+                for item in items
+            ],
+            "errors": [
+                {"item_key": item["item_key"], "error": item["error"]}
+                for item in items if item["status"] == "failed"
+            ],
+            "last_checkpoint": self.clock.now_iso()
+        }
+
+    @staticmethod
+    def _file_type_from_name(file_name: Optional[str]) -> str:
+        extension = posixpath.splitext(file_name or "")[1].lstrip(".").lower()
+        return extension or "unknown"
+
+    def _build_journey_result(self, progress: Dict[str, Any], journey_execution_id: str, resumed: int) -> Dict[str, Any]:
+        operation_id = progress["operation_id"]
+        semantic_payload = {
+            "operation_id": operation_id,
+            "status": progress["status"],
+            "total": progress["total"],
+            "succeeded": progress["succeeded"],
+            "failed": progress["failed"],
+            "resumed_completed": resumed,
+            "journey_execution_id": journey_execution_id
+        }
+
+        artifact = create_structured_artifact(
+            result_type="bulk_ingestion",
+            semantic_payload=semantic_payload,
+            renderings={"items": progress["items"], "errors": progress["errors"]}
+        )
+
+        events = [
+            {
+                "type": "bulk_ingestion_completed",
+                "operation_id": operation_id,
+                "status": progress["status"],
+                "succeeded": progress["succeeded"],
+                "failed": progress["failed"]
+            }
+        ]
+
+        result = {
+            "success": progress["status"] != "failed",
+            "journey_id": self.journey_id,
+            "journey_execution_id": journey_execution_id,
+            "operation_id": operation_id,
+            "status": progress["status"],
+            "artifacts": {"bulk_ingestion": artifact},
+            "events": events
+        }
+        if progress["status"] == "failed":
+            result["error"] = f"All {progress['total']} files failed"
+        return result
+
+    def get_soa_apis(self) -> Dict[str, Dict[str, Any]]:
+        """Get SOA API definitions for MCP tool registration."""
+        return {
+            "bulk_ingest": {
+                "handler": self._handle_bulk_ingest,
+                "input_schema": {
+                    "type": "object",
+                    "properties": {
+                        "files": {"type": "array", "description": "Manifest entries (artifact_id, storage_path, or file_content + file_name)"},
+                        "storage_prefix": {"type": "string", "description": "Ingest every file under this storage prefix"},
+                        "content_type": {"type": "string", "description": "Default content type (structured/unstructured/hybrid)"},
+                        "operation_id": {"type": "string", "description": "Resume a previous bulk ingestion"},
+                        "max_concurrency": {"type": "integer", "description": "Files processed at once"},
+                        "embed": {"type": "boolean", "description": "Create embeddings after parsing (default: true)"},
+                        "user_context": {"type": "object", "description": "User context"}
+                    },
+                    "required": []
+                },
+                "description": "Ingest, parse and embed many files with progress tracking"
+            },
+            "get_bulk_ingestion_status": {
+                "handler": self._handle_get_status,
+                "input_schema": {
+                    "type": "object",
+                    "properties": {
+                        "operation_id": {"type": "string", "description": "Bulk ingestion operation ID"},
+                        "user_context": {"type": "object", "description": "User context"}
+                    },
+                    "required": ["operation_id"]
+                },
+                "description": "Get progress of a bulk ingestion"
+            }
+        }
+
+    async def _handle_bulk_ingest(self, **kwargs) -> Dict[str, Any]:
+        user_context = kwargs.pop("user_context", None) or {}
+        context = ExecutionContext(
+            execution_id=generate_event_id(),
+            tenant_id=user_context.get("tenant_id", "default"),
+            session_id=user_context.get("session_id", generate_event_id()),
+            intent=None,
+            solution_id=user_context.get("solution_id", "content_solution")
+        )
+        context.state_surface = self.state_surface
+
+        return await self.compose_journey(context, kwargs)
+
+    async def _handle_get_status(self, **kwargs) -> Dict[str, Any]:
+        user_context = kwargs.get("user_context", {})
+        operation_id = kwargs.get("operation_id")
+        if self.state_surface is None:
+            return {"success": False, "error": "State Surface not available"}
+        progress = await self.state_surface.get_operation_progress(
+            operation_id,
+            user_context.get("tenant_id", "default")
+        )
+        if progress is None:
+            return {"success": False, "error": f"Unknown bulk ingestion: {operation_id}"}
+        return {"success": True, "progress": progress}
@@ -0,0 +1,236 @@
+"""
+Test Bulk Ingestion Journey
+
+Tests:
+- Fan-out of a manifest or storage prefix to a bounded worker pool
+- Per-item progress in State Surface operation progress
+- Per-stage retry and partial failure
+- Resume from checkpoint with the same operation_id
+- Progress checkpoints written in batches, not once per item
+"""
+
+import asyncio
+
+import pytest
+
+from symphainy_platform.runtime.execution_context import ExecutionContext
+from symphainy_platform.runtime.state_surface import StateSurface
+from symphainy_platform.solutions.content_solution.journeys import BulkIngestionJourney
+
+
+class _StageJourney:
+    """Stands in for a single-file journey; fails the first `failures[key]` calls for a key."""
+
+    def __init__(self, key_param, result_key, failures=None, extra_events=None, delay=0.005):
+        self.key_param = key_param
+        self.result_key = result_key
+        self.failures = dict(failures or {})
+        self.extra_events = extra_events
+        self.delay = delay
+        self.calls = []
+        self.running = 0
+        self.peak = 0
+
+    async def compose_journey(self, context, journey_params):
+        key = journey_params[self.key_param]
+        self.calls.append(journey_params)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        if self.failures.get(key, 0) > 0:
+            self.failures[key] -= 1
+            return {"success": False, "error": f"{key} unavailable"}
+        events = self.extra_events(key) if self.extra_events else []
+        return {"success": True, self.result_key: f"{self.result_key}:{key}", "events": events}
+
+
+class _Storage:
+    def __init__(self, files):
+        self.files = files
+
+    async def list_files(self, prefix=None, **kwargs):
+        return [{"name": name} for name in self.files if name.startswith(prefix)] + [{"name": f"{prefix}/"}]
+
+    async def download_file(self, file_path):
+        return self.files.get(file_path)
+
+
+class _PublicWorks:
+    def __init__(self, storage):
+        self.storage = storage
+
+    def get_file_storage_abstraction(self):
+        return self.storage
+
+
+def _journey(public_works=None, upload_failures=None, parse_failures=None, embed_failures=None):
+    state_surface = StateSurface(use_memory=True)
+    journey = BulkIngestionJourney(public_works=public_works, state_surface=state_surface)
+    journey.upload_journey = _StageJourney(
+        "file_name", "artifact_id", upload_failures,
+        extra_events=lambda name: [{"type": "file_materialized", "pending_journey_id": f"pending:{name}"}]
+    )
+    journey.parsing_journey = _StageJourney("artifact_id", "parsed_artifact_id", parse_failures)
+    journey.embedding_journey = _StageJourney("parsed_artifact_id", "embedding_artifact_id", embed_failures)
+    return journey, state_surface
+
+
+def _context():
+    return ExecutionContext(
+        execution_id="exec_1", tenant_id="t1", session_id="s1", intent=None, solution_id="content_solution"
+    )
+
+
+def _manifest(count):
+    return [{"file_name": f"doc{i}.pdf", "file_content": b"%PDF"} for i in range(count)]
+
+
+class TestBulkIngestionJourneyStructure:
+    """Test BulkIngestionJourney registration."""
+
+    def test_journey_registered(self, content_solution):
+        """bulk_ingestion journey and bulk_ingest_files intent should be registered."""
+        assert content_solution.get_journey("bulk_ingestion") is not None
+        assert "bulk_ingest_files" in content_solution.SUPPORTED_INTENTS
+        assert content_solution._find_journey_for_intent("bulk_ingest_files") is content_solution.get_journey("bulk_ingestion")
+
+    def test_has_soa_apis(self, content_solution):
+        """Should expose bulk ingest and status APIs."""
+        apis = content_solution.get_journey("bulk_ingestion").get_soa_apis()
+        assert {"bulk_ingest", "get_bulk_ingestion_status"} <= set(apis)
+
+
+class TestBulkIngestionJourneyExecution:
+    """Test fan-out, progress, retry and resume."""
+
+    @pytest.mark.asyncio
+    async def test_manifest_fans_out_with_bounded_concurrency(self):
+        """Every item runs ingest → parse → embed, at most max_concurrency at once."""
+        journey, state_surface = _journey()
+
+        result = await journey.compose_journey(_context(), {
+            "files": _manifest(6) + [{"artifact_id": "existing"}],
+            "max_concurrency": 2
+        })
+
+        assert result["success"] and result["status"] == "completed"
+        assert len(journey.upload_journey.calls) == 6  # already-ingested item skips ingest
+        assert len(journey.embedding_journey.calls) == 7
+        assert max(j.peak for j in (journey.upload_journey, journey.parsing_journey, journey.embedding_journey)) <= 2
+        parse_call = next(c for c in journey.parsing_journey.calls if c["artifact_id"] == "artifact_id:doc0.pdf")
+        assert parse_call["pending_journey_id"] == "pending:doc0.pdf" and parse_call["file_type"] == "pdf"
+
+        progress = await state_surface.get_operation_progress(result["operation_id"], "t1")
+        assert (progress["total"], progress["succeeded"], progress["failed"]) == (7, 7, 0)
+        item = progress["items"][0]
+        assert item["stage"] == "done"
+        assert item["embedding_artifact_id"] == "embedding_artifact_id:parsed_artifact_id:artifact_id:doc0.pdf"
+        assert "file_content" not in repr(progress)
+
+    @pytest.mark.asyncio
+    async def test_failing_stage_is_retried_and_failures_are_per_item(self):
+        """Transient failures are retried; a persistent failure fails only its item."""
+        journey, state_surface = _journey(parse_failures={"artifact_id:doc0.pdf": 2, "artifact_id:doc1.pdf": 10})
+
+        result = await journey.compose_journey(_context(), {
+            "files": _manifest(3), "max_retries": 2, "retry_backoff_seconds": 0
+        })
+
+        assert result["success"] and result["status"] == "completed_with_errors"
+        progress = await state_surface.get_operation_progress(result["operation_id"], "t1")
+        items = {item["item_key"]: item for item in progress["items"]}
+        assert items["doc0.pdf"]["status"] == "completed"
+        assert (items["doc1.pdf"]["status"], items["doc1.pdf"]["stage"]) == ("failed", "parse")
+        assert items["doc1.pdf"]["error"] == "parse: artifact_id:doc1.pdf unavailable"
+        assert progress["errors"] == [{"item_key": "doc1.pdf", "error": items["doc1.pdf"]["error"]}]
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_completed_items_and_failed_stages_restart(self):
+        """Re-running with operation_id continues from the checkpoint."""
+        journey, state_surface = _journey(embed_failures={"parsed_artifact_id:artifact_id:doc1.pdf": 10})
+        first = await journey.compose_journey(_context(), {
+            "files": _manifest(3), "max_retries": 0
+        })
+        assert first["status"] == "completed_with_errors"
+
+        journey.embedding_journey.failures.clear()
+        for stage in (journey.upload_journey, journey.parsing_journey, journey.embedding_journey):
+            stage.calls.clear()
+        second = await journey.compose_journey(_context(), {
+            "files": _manifest(3), "operation_id": first["operation_id"]
+        })
+
+        assert second["status"] == "completed" and second["operation_id"] == first["operation_id"]
+        assert journey.upload_journey.calls == [] and journey.parsing_journey.calls == []
+        assert [c["parsed_artifact_id"] for c in journey.embedding_journey.calls] == ["parsed_artifact_id:artifact_id:doc1.pdf"]
+        assert second["artifacts"]["bulk_ingestion"]["semantic_payload"]["resumed_completed"] == 2
+        progress = await state_surface.get_operation_progress(first["operation_id"], "t1")
+        assert progress["succeeded"] == 3
+
+    @pytest.mark.asyncio
+    async def test_progress_is_checkpointed_in_batches(self):
+        """The full progress record is stored every checkpoint_every items and once at the end."""
+        journey, state_surface = _journey()
+        journey.upload_journey.delay = journey.parsing_journey.delay = journey.embedding_journey.delay = 0
+        stored = []
+        track = state_surface.track_operation_progress
+
+        async def counting_track(operation_id, tenant_id, progress):
+            stored.append(progress["processed"])
+            return await track(operation_id, tenant_id, progress)
+
+        state_surface.track_operation_progress = counting_track
+        result = await journey.compose_journey(_context(), {
+            "files": _manifest(200), "max_concurrency": 8,
+            "checkpoint_every": 50, "checkpoint_interval_seconds": 3600
+        })
+
+        assert result["status"] == "completed"
+        assert stored[0] == 0 and stored[-1] == 200 and len(stored) <= 6
+        progress = await state_surface.get_operation_progress(result["operation_id"], "t1")
+        assert progress["succeeded"] == 200
+
+    @pytest.mark.asyncio
+    async def test_storage_prefix_is_listed_and_downloaded(self):
+        """A storage prefix expands to every file under it; missing downloads fail the item."""
+        storage = _Storage({"t1/imports/a.csv": b"x,y", "t1/imports/b.csv": None, "t2/imports/c.csv": b"z"})
+        journey, _ = _journey(public_works=_PublicWorks(storage))
+
+        result = await journey.compose_journey(_context(), {
+            "storage_prefix": "t1/imports", "max_retries": 0, "embed": False
+        })
+
+        assert (result["status"], result["events"][0]["succeeded"], result["events"][0]["failed"]) == ("completed_with_errors", 1, 1)
+        assert [c["file_name"] for c in journey.upload_journey.calls] == ["a.csv"]
+        assert journey.upload_journey.calls[0]["file_content"] == b"x,y"
+        assert journey.embedding_journey.calls == []
+
+    @pytest.mark.asyncio
+    async def test_invalid_params(self):
+        """A manifest entry without content or a reference is rejected up front."""
+        journey, _ = _journey()
+
+        result = await journey.compose_journey(_context(), {"files": [{"file_name": "a.pdf"}]})
+        assert not result["success"] and "files[0]" in result["error"]
+        result = await journey.compose_journey(_context(), {})
+        assert not result["success"] and "storage_prefix" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_storage_outside_tenant_is_rejected(self):
+        """Prefixes and paths must lie under the caller's tenant; nothing is listed or downloaded otherwise."""
+        storage = _Storage({"t2/imports/c.csv": b"z"})
+        journey, _ = _journey(public_works=_PublicWorks(storage))
+
+        assert not (await journey.compose_journey(_context(), {"storage_prefix": ""}))["success"]
+        for params in (
+            {"storage_prefix": "t2/imports"},
+            {"storage_prefix": "t1/../t2"},
+            {"files": [{"storage_path": "t2/imports/c.csv"}]},
+            {"files": [{"storage_path": "/t1/x.csv"}]},
+        ):
+            result = await journey.compose_journey(_context(), params)
+            assert not result["success"] and "t1/" in result["error"], params
+        assert journey.upload_journey.calls == []
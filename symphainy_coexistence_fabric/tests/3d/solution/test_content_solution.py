@@ -3,7 +3,7 @@ Test ContentSolution - Content Realm Platform Solution
 
 Tests:
 - Solution initialization
-- Journey registration (4 journeys)
+- Journey registration (5 journeys)
 - SOA API exposure
 - compose_journey intent handling
 - File upload/parse/embed flow
@@ -39,10 +39,10 @@ class TestContentSolutionInitialization:
 class TestContentJourneys:
     """Test ContentSolution journeys."""
     
-    def test_has_4_journeys(self, content_solution):
-        """ContentSolution should have 4 journeys."""
+    def test_has_5_journeys(self, content_solution):
+        """ContentSolution should have 5 journeys."""
         journeys = content_solution.get_journeys()
-        assert len(journeys) == 4
+        assert len(journeys) == 5
     
     def test_has_file_upload_materialization_journey(self, content_solution):
         """Should have file_upload_materialization journey."""
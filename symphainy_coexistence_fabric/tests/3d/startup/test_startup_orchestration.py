@@ -0,0 +1,192 @@
+"""
+Test startup orchestration (concurrent connects, pre-boot checks, lazy imports).
+
+Verifies that Public Works startup steps run concurrently in dependency order with
+timeouts, that pre-boot checks run concurrently and still exit on failure, that blocking
+client connects run off the event loop, and that heavy adapter libraries are deferred
+until first use.
+"""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import patch
+
+from symphainy_platform.foundations.public_works.startup import (
+    StartupOrchestrator,
+    StartupStep,
+    StartupTimings,
+)
+
+
+def _sleeper(log, name, seconds, result=True):
+    async def action():
+        log.append(f"{name}:start")
+        await asyncio.sleep(seconds)
+        log.append(f"{name}:end")
+        return result
+    return action
+
+
+class TestStartupOrchestrator:
+    """Independent steps overlap; dependents wait; failures are contained unless required."""
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self):
+        log = []
+        timings = StartupTimings()
+        steps = [StartupStep(name, _sleeper(log, name, 0.1)) for name in ("redis", "arango", "gcs")]
+
+        started = time.perf_counter()
+        statuses = await StartupOrchestrator(timings).run(steps)
+        elapsed = time.perf_counter() - started
+
+        assert statuses == {"redis": "ok", "arango": "ok", "gcs": "ok"}
+        assert elapsed < 0.25
+        summary = timings.summary()
+        assert summary["phases"]["connect"]["cumulative_ms"] > summary["phases"]["connect"]["wall_ms"]
+
+    @pytest.mark.asyncio
+    async def test_dependent_step_waits_and_skips_on_failure(self):
+        log = []
+        steps = [
+            StartupStep("duckdb", _sleeper(log, "duckdb", 0.02)),
+            StartupStep("duckdb_schema", _sleeper(log, "duckdb_schema", 0), phase="schema", depends_on=("duckdb",)),
+            StartupStep("arango", _sleeper(log, "arango", 0, result=False)),
+            StartupStep("arango_schema", _sleeper(log, "arango_schema", 0), phase="schema", depends_on=("arango",)),
+        ]
+
+        statuses = await StartupOrchestrator(StartupTimings()).run(steps)
+
+        assert log.index("duckdb:end") < log.index("duckdb_schema:start")
+        assert statuses["arango"] == "failed"
+        assert statuses["arango_schema"] == "skipped"
+        assert "arango_schema:start" not in log
+
+    @pytest.mark.asyncio
+    async def test_timeouts_are_contained_unless_required(self):
+        log = []
+        timings = StartupTimings()
+        statuses = await StartupOrchestrator(timings, default_timeout=0.05).run(
+            [StartupStep("meilisearch", _sleeper(log, "meilisearch", 1))]
+        )
+        assert statuses == {"meilisearch": "timeout"}
+        assert timings.summary()["components"]["meilisearch"]["status"] == "timeout"
+
+        with pytest.raises(RuntimeError, match="gcs"):
+            await StartupOrchestrator(StartupTimings(), default_timeout=0.05).run(
+                [StartupStep("gcs", _sleeper(log, "gcs", 1), required=True)]
+            )
+
+    @pytest.mark.asyncio
+    async def test_dependency_must_be_declared_first(self):
+        log = []
+        with pytest.raises(ValueError):
+            await StartupOrchestrator(StartupTimings()).run(
+                [StartupStep("arango_schema", _sleeper(log, "s", 0), depends_on=("arango",))]
+            )
+
+
+class TestPreBootConcurrency:
+    """Pre-boot checks run concurrently and record per-service timings."""
+
+    def test_checks_run_concurrently_and_record_timings(self):
+        from symphainy_platform.bootstrap import pre_boot
+
+        def slow_check(config):
+            time.sleep(0.1)
+
+        names = ["redis", "arango", "supabase", "gcs", "meilisearch", "duckdb", "consul", "telemetry"]
+        patches = [patch.object(pre_boot, f"_check_{name}", side_effect=slow_check) for name in names]
+        for p in patches:
+            p.start()
+        try:
+            started = time.perf_counter()
+            pre_boot.pre_boot_validate({})
+            elapsed = time.perf_counter() - started
+        finally:
+            for p in patches:
+                p.stop()
+
+        status = pre_boot.get_pre_boot_status()
+        assert elapsed < 0.5
+        assert status["status"] == "passed"
+        assert set(status["timings_ms"]) == set(names)
+
+    def test_hung_check_fails_at_deadline(self):
+        from symphainy_platform.bootstrap import pre_boot
+
+        def hang(config):
+            time.sleep(2)
+
+        with patch.object(pre_boot, "_fail", side_effect=SystemExit(1)) as fail:
+            with pytest.raises(SystemExit):
+                pre_boot._run_checks([("redis", hang)], {}, 0.1)
+        assert "redis" in fail.call_args[0][0]
+
+
+class _BlockingArangoClient:
+    """python-arango stand-in whose round trips block the calling thread."""
+
+    def __init__(self, hosts):
+        self.hosts = hosts
+
+    def db(self, name, username, password):
+        return self
+
+    def properties(self):
+        time.sleep(0.2)
+        return {}
+
+    def has_collection(self, name):
+        time.sleep(0.2)
+        return True
+
+
+class TestBlockingConnects:
+    """Synchronous client round trips do not serialize concurrent startup steps."""
+
+    @pytest.mark.asyncio
+    async def test_arango_round_trips_run_off_the_event_loop(self):
+        from symphainy_platform.foundations.public_works.adapters import arango_adapter
+
+        with patch.object(arango_adapter, "ArangoClient", _BlockingArangoClient), \
+                patch.object(arango_adapter, "ARANGO_AVAILABLE", True):
+            adapters = [arango_adapter.ArangoAdapter("http://arango:8529") for _ in range(3)]
+            started = time.monotonic()
+            connected = await asyncio.gather(*(adapter.connect() for adapter in adapters))
+            exists = await asyncio.gather(*(adapter.collection_exists("state_data") for adapter in adapters))
+            elapsed = time.monotonic() - started
+
+        assert connected == [True] * 3 and exists == [True] * 3
+        assert elapsed < 0.9  # one after another would take 1.2s
+
+
+class TestLazyAdapterImports:
+    """Heavy parsing/visual libraries are not imported when adapters are constructed."""
+
+    def test_adapters_defer_heavy_imports(self):
+        from utilities import LazyModule
+        from symphainy_platform.foundations.public_works.adapters import visual_generation_adapter
+        from symphainy_platform.foundations.public_works.adapters.excel_adapter import ExcelProcessingAdapter
+        from symphainy_platform.foundations.public_works.adapters.pdf_adapter import PdfProcessingAdapter
+
+        assert isinstance(visual_generation_adapter.go, LazyModule)
+        excel = ExcelProcessingAdapter()
+        pdf = PdfProcessingAdapter()
+        if excel.pandas_available:
+            assert isinstance(excel.pandas, LazyModule)
+        if pdf.pdfplumber_available:
+            assert isinstance(pdf.pdfplumber, LazyModule)
+
+    def test_lazy_module_loads_on_first_use(self):
+        from utilities import lazy_import, module_available, get_lazy_import_timings
+
+        module = lazy_import("colorsys")
+        assert not module.is_loaded
+        assert module.rgb_to_hsv(1, 0, 0)[0] == 0
+        assert module.is_loaded
+        assert "colorsys" in get_lazy_import_timings()
+        assert module_available("colorsys")
+        assert not module_available("definitely_not_a_module_xyz.sub")
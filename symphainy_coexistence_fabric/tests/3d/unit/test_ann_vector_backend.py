@@ -0,0 +1,209 @@
+"""
+Test AnnVectorBackend (in-process IVF-Flat index behind VectorBackendProtocol).
+
+Verifies recall against an exact scan, incremental inserts and deletes, filter-aware
+search, snapshot persistence, and that SemanticDataAbstraction searches through the
+backend and keeps it current on writes.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from symphainy_platform.foundations.public_works.backends import create_vector_backend
+from symphainy_platform.foundations.public_works.backends.ann_vector_backend import (
+    AnnVectorBackend,
+    IVFFlatIndex,
+)
+from symphainy_platform.foundations.public_works.abstractions.semantic_data_abstraction import (
+    SemanticDataAbstraction,
+)
+
+
+def _clustered(n, dimension=32, clusters=20, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dimension))
+    return (centers[rng.integers(clusters, size=n)] + 0.3 * rng.normal(size=(n, dimension))).astype(np.float32)
+
+
+def _exact(vectors, query, k):
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normalized @ (query / np.linalg.norm(query))
+    return [f"k{i}" for i in np.argsort(-scores)[:k]]
+
+
+def _index(vectors, train_threshold=256, **attrs):
+    index = IVFFlatIndex(vectors.shape[1], nprobe=8, train_threshold=train_threshold)
+    attributes = [{name: fn(i) for name, fn in attrs.items()} for i in range(len(vectors))]
+    index.add([f"k{i}" for i in range(len(vectors))], vectors, attributes)
+    return index.rebuilt() if index.needs_rebuild() else index
+
+
+class _FakeArango:
+    """ArangoAdapter surface used by the backend, answering its AQL by bind variables."""
+
+    def __init__(self, documents=()):
+        self.documents = {doc["_key"]: doc for doc in documents}
+        self.queries = []
+        self.scans = 0
+
+    async def execute_aql(self, query, bind_vars=None, count=False, batch_size=100):
+        bind_vars = bind_vars or {}
+        self.queries.append(query)
+        if "keys" in bind_vars:
+            return [self.documents[key] for key in bind_vars["keys"] if key in self.documents]
+        documents = list(self.documents.values())
+        if "tenant_id" in bind_vars:
+            documents = [doc for doc in documents if doc.get("tenant_id") == bind_vars["tenant_id"]]
+        if "COLLECT WITH COUNT" in query:
+            return [len(documents)]
+        return documents
+
+    async def vector_search(self, **kwargs):
+        self.scans += 1
+        return []
+
+    async def import_documents(self, collection_name, documents, batch_size=1000, on_duplicate="replace"):
+        for doc in documents:
+            self.documents[doc["_key"]] = doc
+        return {"success": True, "total": len(documents), "created": len(documents), "updated": 0,
+                "errors": 0, "failed_keys": [], "batches": []}
+
+
+def _docs(vectors, tenant="t1", start=0):
+    return [
+        {"_key": f"k{start + i}", "chunk_id": f"c{start + i}", "tenant_id": tenant,
+         "file_id": f"f{(start + i) % 5}", "embedding": vector.tolist()}
+        for i, vector in enumerate(vectors)
+    ]
+
+
+class TestIVFFlatIndex:
+    """Approximate search quality and index maintenance."""
+
+    def test_small_index_is_exact(self):
+        vectors = _clustered(100)
+        index = _index(vectors)
+        assert index.nlist == 0
+        assert [key for key, _ in index.search(vectors[3], 5)] == _exact(vectors, vectors[3], 5)
+
+    def test_trained_recall_against_exact_scan(self):
+        vectors = _clustered(4000)
+        queries = _clustered(50, seed=1)
+        index = _index(vectors)
+        assert index.nlist > 1
+
+        hits = sum(
+            len(set(key for key, _ in index.search(q, 10)) & set(_exact(vectors, q, 10)))
+            for q in queries
+        )
+        assert hits / (10 * len(queries)) >= 0.9
+
+    def test_incremental_insert_and_delete(self):
+        vectors = _clustered(1000)
+        index = _index(vectors)
+
+        assert index.remove(["k0"]) == 1
+        assert "k0" not in [key for key, _ in index.search(vectors[0], 10)]
+
+        index.add(["new"], [vectors[0]])
+        assert index.search(vectors[0], 1)[0][0] == "new"
+        assert len(index) == 1000
+
+    def test_filters_select_before_scoring(self):
+        vectors = _clustered(2000)
+        index = _index(vectors, file_id=lambda i: f"f{i % 100}", shard=lambda i: i % 4)
+
+        results = index.search(vectors[0], 10, {"file_id": "f7"})
+
+        matching = vectors[7::100]
+        expected = [f"k{7 + 100 * int(i[1:])}" for i in _exact(matching, vectors[0], 10)]
+        assert [key for key, _ in results] == expected[:len(results)]
+        assert results and all(score >= 0.0 for _, score in results)
+        assert index.search(vectors[0], 10, {"file_id": "missing"}) == []
+
+        # Broad filters probe the lists and mask candidates
+        assert all(int(key[1:]) % 4 == 1 for key, _ in index.search(vectors[0], 10, {"shard": 1}))
+
+    def test_snapshot_round_trip(self, tmp_path):
+        vectors = _clustered(600)
+        index = _index(vectors, file_id=lambda i: f"f{i % 3}")
+        index.remove(["k1"])
+        index.save(str(tmp_path / "part"))
+
+        loaded = IVFFlatIndex.load(str(tmp_path / "part"), nprobe=8)
+
+        assert len(loaded) == 599 and loaded.nlist == index.nlist
+        assert loaded.search(vectors[2], 5, {"file_id": "f2"}) == index.search(vectors[2], 5, {"file_id": "f2"})
+
+
+class TestAnnVectorBackend:
+    """Protocol behaviour, lazy partition loading and incremental maintenance."""
+
+    @pytest.mark.asyncio
+    async def test_tenant_partition_loaded_once_and_hydrated(self):
+        vectors = _clustered(50)
+        arango = _FakeArango(_docs(vectors) + _docs(_clustered(10, seed=2), tenant="t2", start=50))
+        backend = AnnVectorBackend(arango)
+
+        first = await backend.vector_search("structured_embeddings", vectors[4].tolist(),
+                                            filter_conditions={"tenant_id": "t1"}, limit=3)
+        loads = len(arango.queries)
+        await backend.vector_search("structured_embeddings", vectors[5].tolist(),
+                                    filter_conditions={"tenant_id": "t1"}, limit=3)
+
+        assert first[0]["_key"] == "k4" and first[0]["similarity"] == pytest.approx(1.0, abs=1e-5)
+        assert all(doc["tenant_id"] == "t1" for doc in first)
+        assert len(arango.queries) == loads + 1  # only the hydration query
+
+    @pytest.mark.asyncio
+    async def test_writes_through_abstraction_are_searchable(self):
+        vectors = _clustered(20)
+        arango = _FakeArango(_docs(vectors[:10]))
+        abstraction = SemanticDataAbstraction(arango, vector_backend=AnnVectorBackend(arango))
+        await abstraction.vector_search(vectors[0].tolist(), {"tenant_id": "t1"})
+
+        await abstraction.store_semantic_embeddings(_docs(vectors[10:], start=10))
+        results = await abstraction.vector_search(vectors[15].tolist(), {"tenant_id": "t1"}, limit=1)
+
+        assert results[0]["_key"] == "k15"
+
+    @pytest.mark.asyncio
+    async def test_unsupported_filters_use_scan(self):
+        arango = _FakeArango(_docs(_clustered(5)))
+        backend = AnnVectorBackend(arango)
+        await backend.vector_search("structured_embeddings", [1.0] * 32,
+                                    filter_conditions={"file_id": ["f1", "f2"]})
+        assert arango.scans == 1
+
+    @pytest.mark.asyncio
+    async def test_long_string_filter_uses_scan(self):
+        arango = _FakeArango(_docs(_clustered(5)))
+        backend = AnnVectorBackend(arango)
+        await backend.vector_search("structured_embeddings", [1.0] * 32,
+                                    filter_conditions={"tenant_id": "t1", "text": "x" * 300})
+        assert arango.scans == 1 and backend.get_stats()["scan_fallbacks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_is_rebuilt(self, tmp_path):
+        vectors = _clustered(30)
+        arango = _FakeArango(_docs(vectors[:20]))
+        backend = AnnVectorBackend(arango, index_dir=str(tmp_path))
+        await backend.vector_search("structured_embeddings", vectors[0].tolist(), filter_conditions={"tenant_id": "t1"})
+        assert await backend.persist() == 1
+
+        warm = AnnVectorBackend(arango, index_dir=str(tmp_path))
+        await warm.vector_search("structured_embeddings", vectors[0].tolist(), filter_conditions={"tenant_id": "t1"})
+        assert warm.get_stats()["snapshots_loaded"] == 1
+
+        arango.documents.update({doc["_key"]: doc for doc in _docs(vectors[20:], start=20)})
+        stale = AnnVectorBackend(arango, index_dir=str(tmp_path))
+        results = await stale.vector_search("structured_embeddings", vectors[25].tolist(),
+                                            filter_conditions={"tenant_id": "t1"}, limit=1)
+        assert stale.get_stats()["snapshots_loaded"] == 0
+        assert results[0]["_key"] == "k25"
+
+    def test_factory_falls_back_to_adapter_scan(self):
+        arango = _FakeArango()
+        assert create_vector_backend(arango) is arango  # opt-in: the index misses other processes' writes
+        assert isinstance(create_vector_backend(arango, ann_enabled=True), AnnVectorBackend)
@@ -0,0 +1,288 @@
+"""
+Test AS2 duplicate-message detection and off-loop decryption.
+
+Verifies that a partner's retransmission (same Message-ID) is rejected before decryption,
+that only decrypted and stored messages are recorded (a retransmission gets the first
+delivery's MDN back), that the Redis sets age out by retention
+window, that the Bloom filter answers while Redis is unreachable, and that decryption
+runs in the executor (a process pool here), which is replaced after a worker dies.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from symphainy_platform.foundations.public_works.adapters.as2_decryption import (
+    AS2DecryptionError,
+    AS2Decryptor,
+    as2_message_id,
+)
+from symphainy_platform.foundations.public_works.adapters.edi_adapter import EDIAdapter
+from symphainy_platform.foundations.public_works.as2_message_dedup import (
+    AS2MessageDeduplicator,
+    BloomFilter,
+)
+from symphainy_platform.foundations.public_works.protocols.ingestion_protocol import (
+    IngestionRequest,
+    IngestionType,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeRedis:
+    """Just enough of RedisAdapter (sets) for the shared tier; down=True simulates RedisError."""
+
+    def __init__(self):
+        self.sets = {}
+        self.values = {}
+        self.down = False
+
+    async def get(self, key):
+        return None if self.down else self.values.get(key)
+
+    async def set(self, key, value, ttl=None):
+        if self.down:
+            return False
+        self.values[key] = value
+        return True
+
+    async def sadd(self, key, member, ttl=None):
+        if self.down:
+            return None
+        members = self.sets.setdefault(key, set())
+        if member in members:
+            return 0
+        members.add(member)
+        return 1
+
+    async def sismember(self, key, member):
+        if self.down:
+            return None
+        return member in self.sets.get(key, set())
+
+    async def srem(self, key, member):
+        if self.down:
+            return None
+        members = self.sets.get(key, set())
+        removed = int(member in members)
+        members.discard(member)
+        return removed
+
+
+class _FakeDecryptor:
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    async def decrypt_and_verify(self, as2_message, organization_config=None):
+        self.calls += 1
+        if self.fail:
+            raise AS2DecryptionError("bad signature")
+        return b"ISA*00*decrypted~", {
+            "verified": True,
+            "sender": "PARTNER",
+            "message_id": "m-1@partner",
+            "mdn": {"headers": {"Message-ID": "<mdn-1@us>"}, "content": "processed"}
+        }
+
+
+def _decrypt_or_die(as2_message):
+    if b"crash" in as2_message:
+        os._exit(1)  # the worker dies, as when it is killed for memory
+    return b"ISA*00*decrypted~", {"verified": True, "pid": os.getpid()}
+
+
+class _PoolDecryptor:
+    """Runs a stand-in decryption in the executor the adapter hands it."""
+
+    executor = None
+
+    async def decrypt_and_verify(self, as2_message, organization_config=None):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, _decrypt_or_die, as2_message)
+
+
+class _FakeStorage:
+    """upload_file result: True, False, or an exception to raise."""
+
+    def __init__(self):
+        self.uploads = []
+        self.result = True
+
+    async def upload_file(self, file_path, file_data, metadata=None):
+        if isinstance(self.result, Exception):
+            raise self.result
+        if self.result:
+            self.uploads.append(file_path)
+        return self.result
+
+
+def _message(message_id="m-1@partner", body=b"ISA*00*plain~"):
+    return (
+        b"AS2-From: PARTNER\r\nAS2-To: US\r\n"
+        b"Message-ID: <" + message_id.encode() + b">\r\n"
+        b"Content-Type: application/edi-x12\r\n\r\n" + body
+    )
+
+
+def _request(data):
+    return IngestionRequest(
+        ingestion_type=IngestionType.EDI,
+        tenant_id="t1",
+        session_id="s1",
+        data=data,
+        source_metadata={"protocol": "as2", "partner_id": "acme"}
+    )
+
+
+def _edi_adapter(dedup, decryptor):
+    storage = _FakeStorage()
+    adapter = EDIAdapter(storage, edi_config={"partners": {}}, message_dedup=dedup, crypto_workers=0)
+    adapter._as2_decryptors["acme"] = decryptor
+    return adapter, storage
+
+
+class TestMessageDedup:
+    """Redis sets are authoritative; the Bloom filter covers Redis outages."""
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=1e-4)
+        for i in range(1000):
+            bloom.add(f"msg-{i}")
+
+        assert all(f"msg-{i}" in bloom for i in range(1000))
+        assert sum(f"other-{i}" in bloom for i in range(10000)) <= 5
+
+    @pytest.mark.asyncio
+    async def test_claimed_message_is_duplicate_until_two_windows_pass(self):
+        clock = _Clock()
+        dedup = AS2MessageDeduplicator(_FakeRedis(), retention_seconds=3600, bloom_capacity=100, clock=clock)
+
+        assert not await dedup.is_duplicate("acme", "<m-1@partner>")
+        assert await dedup.claim("acme", "<m-1@partner>")
+        assert await dedup.is_duplicate("acme", "m-1@partner")
+        assert not await dedup.is_duplicate("other", "m-1@partner")
+
+        clock.now += 3600
+        assert await dedup.is_duplicate("acme", "m-1@partner")
+        clock.now += 3600
+        assert not await dedup.is_duplicate("acme", "m-1@partner")
+
+    @pytest.mark.asyncio
+    async def test_second_claim_loses(self):
+        redis = _FakeRedis()
+        first = AS2MessageDeduplicator(redis, bloom_capacity=100)
+        second = AS2MessageDeduplicator(redis, bloom_capacity=100)
+
+        assert await first.claim("acme", "m-1")
+        assert not await second.claim("acme", "m-1")
+        assert second.get_stats()["lost_claims"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bloom_filter_answers_while_redis_is_down(self):
+        redis = _FakeRedis()
+        dedup = AS2MessageDeduplicator(redis, bloom_capacity=100)
+        assert await dedup.claim("acme", "m-1")
+
+        redis.down = True
+        assert await dedup.is_duplicate("acme", "m-1")
+        assert not await dedup.is_duplicate("acme", "m-2")
+        assert await dedup.claim("acme", "m-2")
+        assert await dedup.is_duplicate("acme", "m-2")
+        assert dedup.get_stats()["redis_errors"] == 4
+
+
+class TestEDIAdapterDedup:
+    """Retransmissions are rejected before the decryptor runs."""
+
+    def test_message_id_read_from_plaintext_headers(self):
+        assert as2_message_id(_message("abc@partner")) == "abc@partner"
+        assert as2_message_id(b"AS2-From: PARTNER\r\n\r\nbody") is None
+
+    @pytest.mark.asyncio
+    async def test_retransmission_rejected_before_decryption(self):
+        decryptor = _FakeDecryptor()
+        adapter, storage = _edi_adapter(AS2MessageDeduplicator(_FakeRedis(), bloom_capacity=100), decryptor)
+
+        first = await adapter.ingest(_request(_message()))
+        again = await adapter.ingest(_request(_message()))
+
+        assert first.success and len(storage.uploads) == 1
+        assert not again.success and again.error == "Duplicate AS2 message: m-1@partner"
+        assert again.ingestion_metadata == {
+            "duplicate": True,
+            "partner_id": "acme",
+            "message_id": "m-1@partner",
+            "mdn": {"headers": {"Message-ID": "<mdn-1@us>"}, "content": "processed"}
+        }
+        assert "dedup_claim" not in first.ingestion_metadata
+        assert decryptor.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_decryption_is_not_recorded(self):
+        dedup = AS2MessageDeduplicator(_FakeRedis(), bloom_capacity=100)
+        adapter, _ = _edi_adapter(dedup, _FakeDecryptor(fail=True))
+
+        failed = await adapter.ingest(_request(_message()))
+        adapter._as2_decryptors["acme"] = _FakeDecryptor()
+        resent = await adapter.ingest(_request(_message()))
+
+        assert not failed.success and "bad signature" in failed.error
+        assert resent.success
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("redis", [_FakeRedis(), None])
+    async def test_failed_storage_releases_the_claim(self, redis):
+        dedup = AS2MessageDeduplicator(redis, bloom_capacity=100)
+        adapter, storage = _edi_adapter(dedup, _FakeDecryptor())
+
+        storage.result = False
+        not_stored = await adapter.ingest(_request(_message()))
+        storage.result = ConnectionError("storage unreachable")
+        with pytest.raises(ConnectionError):
+            await adapter.ingest(_request(_message()))
+        storage.result = True
+        resent = await adapter.ingest(_request(_message()))
+
+        assert not not_stored.success and resent.success
+        assert len(storage.uploads) == 1
+        assert await dedup.is_duplicate("acme", "m-1@partner")
+        assert dedup.get_stats()["released"] == 2
+
+
+class TestOffLoopDecryption:
+    @pytest.mark.asyncio
+    async def test_decryption_runs_in_process_pool(self):
+        pool = ProcessPoolExecutor(max_workers=1)
+        try:
+            decryptor = AS2Decryptor({"as2_name": "PARTNER"}, executor=pool)
+            decryptor._pyas2_available = False  # pyas2lib path needs partner certificates
+            payload, metadata = await decryptor.decrypt_and_verify(_message(body=b"ISA*00*plain~"))
+        finally:
+            pool.shutdown()
+
+        assert payload == b"ISA*00*plain~"
+        assert metadata["message_id"] == "<m-1@partner>"
+
+    @pytest.mark.asyncio
+    async def test_dead_worker_pool_is_replaced(self):
+        adapter = EDIAdapter(_FakeStorage(), edi_config={"partners": {}}, crypto_workers=1)
+        adapter._as2_decryptors["acme"] = _PoolDecryptor()
+        try:
+            with pytest.raises(AS2DecryptionError):
+                await adapter._process_as2(_message(body=b"crash"), "acme")
+            assert adapter._crypto_pool is None
+
+            payload, metadata = await adapter._process_as2(_message(), "acme")
+            assert payload == b"ISA*00*decrypted~" and metadata["pid"] != os.getpid()
+        finally:
+            adapter.shutdown()
+        assert adapter._crypto_pool is None
@@ -0,0 +1,244 @@
+"""
+Test the verified-token cache on the auth hot path.
+
+Verifies that repeat validations of a token skip JWT verification and the tenant lookup,
+that entries end at the token's exp, that revocation and membership invalidation reach
+every worker (including membership writes and listener restarts), that only memberships
+read from user_tenants are cached, and that the raw token is never stored.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock
+
+from symphainy_platform.foundations.public_works.auth_token_cache import (
+    INVALIDATION_STREAM,
+    VerifiedTokenCache,
+    token_hash,
+)
+from symphainy_platform.civic_systems.smart_city.sdk.security_guard_sdk import SecurityGuardSDK
+from symphainy_platform.foundations.public_works.adapters.supabase_adapter import SupabaseAdapter
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeRedis:
+    """Just enough of RedisAdapter (strings, lists, one stream) for the shared tier."""
+
+    def __init__(self):
+        self.values = {}
+        self.lists = {}
+        self.stream = []
+        self._appended = asyncio.Event()
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.values[key] = value
+        return True
+
+    async def delete(self, key):
+        self.lists.pop(key, None)
+        return self.values.pop(key, None) is not None
+
+    async def rpush(self, key, value):
+        self.lists.setdefault(key, []).append(value)
+        return len(self.lists[key])
+
+    async def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+    async def expire(self, key, ttl):
+        return True
+
+    async def xadd(self, stream_name, fields, maxlen=None, approximate=True):
+        message_id = f"{10 ** 15 + len(self.stream)}-0"
+        self.stream.append((message_id, {k: str(v) for k, v in fields.items()}))
+        self._appended.set()
+        return message_id
+
+    async def xread(self, streams, count=None, block=None):
+        last_id = streams[INVALIDATION_STREAM]
+        messages = [m for m in self.stream if m[0] > last_id]
+        if not messages:
+            self._appended.clear()
+            try:
+                await asyncio.wait_for(self._appended.wait(), (block or 0) / 1000)
+            except asyncio.TimeoutError:
+                return {}
+            messages = [m for m in self.stream if m[0] > last_id]
+        return {INVALIDATION_STREAM: messages[:count]}
+
+
+class _Auth:
+    def __init__(self, expires_at):
+        self.expires_at = expires_at
+        self.calls = 0
+
+    async def validate_token(self, token):
+        self.calls += 1
+        return {"success": True, "user_id": "u1", "email": "u1@example.com", "expires_at": self.expires_at}
+
+
+class _Tenants:
+    def __init__(self):
+        self.calls = 0
+        self.roles = ["member"]
+        self.source = "user_tenants"
+
+    async def get_user_tenant_info(self, user_id):
+        self.calls += 1
+        tenant_id = "t1" if self.source == "user_tenants" else None
+        return {"tenant_id": tenant_id, "roles": list(self.roles), "permissions": ["read"], "tenant_source": self.source}
+
+
+class TestSecurityGuardTokenCache:
+    """Repeat validations are served from the cache until exp or invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_verification_and_tenant_lookup(self):
+        clock = _Clock()
+        auth, tenants = _Auth(expires_at=clock.now + 60), _Tenants()
+        sdk = SecurityGuardSDK(auth, tenants, token_cache=VerifiedTokenCache(clock=clock))
+
+        first = await sdk.validate_token("jwt-a")
+        second = await sdk.validate_token("jwt-a")
+
+        assert (auth.calls, tenants.calls) == (1, 1)
+        assert (second.user_id, second.tenant_id, second.roles) == ("u1", "t1", ["member"])
+        assert second.execution_contract["permissions"] == first.execution_contract["permissions"]
+        assert sdk.token_cache.get_stats()["local_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_entries_end_at_token_exp_and_max_ttl(self):
+        clock = _Clock()
+        cache = VerifiedTokenCache(max_ttl_seconds=300, clock=clock)
+        await cache.put("short", {"user_id": "u1"}, clock.now + 30)
+        await cache.put("long", {"user_id": "u1"}, clock.now + 3_600)
+        await cache.put("expired", {"user_id": "u1"}, clock.now - 1)
+        await cache.put("no-exp", {"user_id": "u1"}, None)
+
+        assert await cache.get("expired") is None and await cache.get("no-exp") is None
+        clock.now += 31
+        assert await cache.get("short") is None
+        assert await cache.get("long") is not None
+        clock.now += 270
+        assert await cache.get("long") is None
+
+    @pytest.mark.asyncio
+    async def test_revoke_and_membership_change_force_revalidation(self):
+        clock = _Clock()
+        auth, tenants = _Auth(expires_at=clock.now + 600), _Tenants()
+        sdk = SecurityGuardSDK(auth, tenants, token_cache=VerifiedTokenCache(clock=clock))
+        await sdk.validate_token("jwt-a")
+        await sdk.validate_token("jwt-b")
+
+        await sdk.revoke_token("jwt-a")
+        await sdk.validate_token("jwt-a")
+        await sdk.validate_token("jwt-b")
+        assert auth.calls == 3
+
+        tenants.roles = ["admin"]
+        await sdk.invalidate_user("u1")
+        result = await sdk.validate_token("jwt-b")
+        assert result.roles == ["admin"] and auth.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_metadata_fallback_is_not_cached(self):
+        clock = _Clock()
+        auth, tenants = _Auth(expires_at=clock.now + 600), _Tenants()
+        tenants.source, tenants.roles = "user_metadata", []
+        sdk = SecurityGuardSDK(auth, tenants, token_cache=VerifiedTokenCache(clock=clock))
+
+        degraded = await sdk.validate_token("jwt-a")
+        tenants.source, tenants.roles = "user_tenants", ["member"]
+        recovered = await sdk.validate_token("jwt-a")
+
+        assert degraded.tenant_id is None and recovered.tenant_id == "t1"
+        assert (auth.calls, tenants.calls) == (2, 2)
+        assert sdk.token_cache.get_stats()["stores"] == 1
+
+    @pytest.mark.asyncio
+    async def test_link_user_to_tenant_invalidates_cached_tokens(self):
+        clock = _Clock()
+        cache = VerifiedTokenCache(clock=clock)
+        await cache.put("jwt-a", {"user_id": "u1"}, clock.now + 60)
+        adapter = SupabaseAdapter.__new__(SupabaseAdapter)
+        adapter.logger, adapter.token_cache = MagicMock(), cache
+        adapter.service_key, adapter.service_client = "service-key", MagicMock()
+
+        result = await adapter.link_user_to_tenant("u1", "t2", role="admin", is_primary=True)
+
+        assert result["success"] is True
+        assert await cache.get("jwt-a") is None
+
+
+class TestSharedTier:
+    """Workers share verified tokens through Redis and follow each other's invalidations."""
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_never_stores_raw_token(self):
+        redis, clock = _FakeRedis(), _Clock()
+        worker_a = VerifiedTokenCache(redis_adapter=redis, clock=clock)
+        worker_b = VerifiedTokenCache(redis_adapter=redis, clock=clock)
+
+        await worker_a.put("secret-jwt", {"user_id": "u1", "tenant_info": {"tenant_id": "t1"}}, clock.now + 60)
+        entry = await worker_b.get("secret-jwt")
+
+        assert entry["tenant_info"] == {"tenant_id": "t1"}
+        assert worker_b.get_stats()["shared_hits"] == 1
+        assert "secret-jwt" not in repr(redis.values) + repr(redis.lists)
+        assert f"authcache:v1:token:{token_hash('secret-jwt')}" in redis.values
+        await worker_a.aclose()
+        await worker_b.aclose()
+
+    @pytest.mark.asyncio
+    async def test_invalidation_events_evict_other_workers(self):
+        redis, clock = _FakeRedis(), _Clock()
+        worker_a = VerifiedTokenCache(redis_adapter=redis, clock=clock)
+        worker_b = VerifiedTokenCache(redis_adapter=redis, clock=clock)
+        for token in ("jwt-a", "jwt-b"):
+            await worker_a.put(token, {"user_id": "u1"}, clock.now + 60)
+        assert await worker_b.get("jwt-a") is not None and await worker_b.get("jwt-b") is not None
+        await asyncio.sleep(0)  # worker_b is following the invalidation stream
+
+        await worker_a.revoke_token("jwt-a")
+        await asyncio.sleep(0.01)
+        assert worker_b.get_stats()["local_entries"] == 1
+        assert await worker_b.get("jwt-a") is None
+
+        await worker_a.invalidate_user("u1")
+        await asyncio.sleep(0.01)
+        assert worker_b.get_stats()["local_entries"] == 0
+        assert await worker_b.get("jwt-b") is None
+        await worker_a.aclose()
+        await worker_b.aclose()
+
+    @pytest.mark.asyncio
+    async def test_restarted_listener_applies_events_published_while_down(self):
+        redis, clock = _FakeRedis(), _Clock()
+        worker_a = VerifiedTokenCache(redis_adapter=redis, clock=clock)
+        worker_b = VerifiedTokenCache(redis_adapter=redis, clock=clock)
+        await worker_b.put("jwt-a", {"user_id": "u1"}, clock.now + 60)
+        await worker_b.get("jwt-a")
+        await asyncio.sleep(0)  # worker_b is following the invalidation stream
+        await worker_a.revoke_token("jwt-other")
+        await asyncio.sleep(0.01)
+
+        await worker_b.aclose()
+        await worker_a.invalidate_user("u1")
+        clock.now += 30  # the listener restarts later than the event was published
+        await worker_b.get("jwt-missing")
+        await asyncio.sleep(0.01)
+
+        assert worker_b.get_stats()["local_entries"] == 0
+        await worker_a.aclose()
+        await worker_b.aclose()
@@ -0,0 +1,206 @@
+"""
+Test incremental chunk embedding through chunk manifests.
+
+Verifies that re-parsing a slightly modified document embeds only the changed chunks
+(the rest keep their stored embedding documents, and chunks that only moved get their
+stored vector re-keyed), that removed chunks are reported,
+that chunks which failed to embed stay out of the manifest and are retried, and that
+manifests are kept per embedding profile.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("duckdb")
+
+from symphainy_platform.civic_systems.agentic.agents.embedding_agent import EmbeddingService
+from symphainy_platform.foundations.libraries.chunking import ChunkDiff, DeterministicChunkingService
+from symphainy_platform.foundations.public_works.abstractions.deterministic_compute_abstraction import (
+    DeterministicComputeAbstraction,
+)
+from symphainy_platform.foundations.public_works.adapters.duckdb_adapter import DuckDBAdapter
+
+
+def _document(pages):
+    return {
+        "text_content": "\n\n".join(pages),
+        "parsing_type": "unstructured",
+        "metadata": {"structure": {"pages": [{"text": text} for text in pages]}},
+    }
+
+
+def _pages(count, edits=None):
+    pages = [f"Page {i}: terms and conditions, clause {i}." for i in range(count)]
+    for index, text in (edits or {}).items():
+        pages[index] = text
+    return pages
+
+
+class _FakeLLM:
+    def __init__(self):
+        self.embedded = 0
+
+    async def embed_many(self, contents, model):
+        self.embedded += len(contents)
+        return [{"embedding": [float(len(text)), 1.0]} for text in contents]
+
+
+class _FakeVectorStore:
+    def __init__(self):
+        self.documents = {}
+        self.reject_chunk_ids = set()
+
+    async def store_semantic_embeddings(self, embedding_documents):
+        failed = [doc["_key"] for doc in embedding_documents if doc["chunk_id"] in self.reject_chunk_ids]
+        for doc in embedding_documents:
+            if doc["_key"] not in failed:
+                self.documents[doc["_key"]] = doc
+        return {"stored_count": len(embedding_documents) - len(failed), "failed_keys": failed}
+
+    async def get_semantic_embeddings_by_keys(self, keys):
+        return [self.documents[key] for key in keys if key in self.documents]
+
+
+async def _deterministic_compute():
+    adapter = DuckDBAdapter()  # in-memory
+    await adapter.connect()
+    abstraction = DeterministicComputeAbstraction(adapter)
+    assert await abstraction.initialize_schema()
+    return abstraction
+
+
+def _embedding_service(deterministic_compute):
+    llm = _FakeLLM()
+    public_works = SimpleNamespace(deterministic_compute_abstraction=deterministic_compute, openai_adapter=llm)
+    service = EmbeddingService()
+    service.public_works = public_works
+    service.vector_store = _FakeVectorStore()
+    return service, llm
+
+
+class TestChunkDiff:
+    """Content-addressed chunk IDs diffed against the previous parse's manifest."""
+
+    @pytest.mark.asyncio
+    async def test_reparse_embeds_only_changed_pages(self):
+        deterministic_compute = await _deterministic_compute()
+        service, llm = _embedding_service(deterministic_compute)
+
+        first = await service.create_incremental_chunk_embeddings(
+            _document(_pages(1000)), file_id="f1", parsed_file_id="p1", tenant_id="t1"
+        )
+        assert (len(first["embedded_chunk_ids"]), first["previous_parsed_file_id"]) == (1000, None)
+
+        edited = _pages(1000, {10: "Page 10: amended clause.", 500: "Page 500: new rate table."})[:-1]
+        second = await service.create_incremental_chunk_embeddings(
+            _document(edited), file_id="f1", parsed_file_id="p2", tenant_id="t1"
+        )
+
+        assert second["status"] == "success"
+        assert (len(second["embedded_chunk_ids"]), len(second["unchanged_chunk_ids"])) == (2, 997)
+        assert len(second["removed_chunk_ids"]) == 3
+        assert second["previous_parsed_file_id"] == "p1"
+        assert llm.embedded == 1002
+        assert len(service.vector_store.documents) == 1002
+
+    @pytest.mark.asyncio
+    async def test_insertion_near_the_top_rekeys_shifted_paragraphs(self):
+        deterministic_compute = await _deterministic_compute()
+        service, llm = _embedding_service(deterministic_compute)
+        paragraphs = [f"Paragraph {i}: the parties agree to clause {i}." for i in range(200)]
+
+        await service.create_incremental_chunk_embeddings(
+            {"text_content": "\n\n".join(paragraphs), "parsing_type": "unstructured"},
+            file_id="f1", parsed_file_id="p1", tenant_id="t1"
+        )
+        inserted = ["Preamble: added by amendment."] + paragraphs
+        second = await service.create_incremental_chunk_embeddings(
+            {"text_content": "\n\n".join(inserted), "parsing_type": "unstructured"},
+            file_id="f1", parsed_file_id="p2", tenant_id="t1"
+        )
+
+        assert second["status"] == "success"
+        assert (len(second["embedded_chunk_ids"]), len(second["rekeyed_chunk_ids"])) == (1, 200)
+        assert llm.embedded == 201
+        third = await service.create_incremental_chunk_embeddings(
+            {"text_content": "\n\n".join(inserted), "parsing_type": "unstructured"},
+            file_id="f1", parsed_file_id="p2", tenant_id="t1"
+        )
+        assert (len(third["unchanged_chunk_ids"]), third["rekeyed_chunk_ids"]) == (201, [])
+        assert llm.embedded == 201
+
+    @pytest.mark.asyncio
+    async def test_duplicate_text_is_matched_once_per_manifest_entry(self):
+        deterministic_compute = await _deterministic_compute()
+        chunking = DeterministicChunkingService()
+        chunking.deterministic_compute_abstraction = deterministic_compute
+        first = await chunking.diff_chunks(_document(["Same text.", "Other text."]), "f1", "t1", "p1")
+        assert await chunking.save_chunk_manifest(first)
+
+        diff = await chunking.diff_chunks(_document(["New text.", "Same text.", "Same text."]), "f1", "t1", "p2")
+
+        assert [chunk.text for chunk in diff.changed] == ["New text.", "Same text."]
+        assert list(diff.moved.values()) == [first.chunks[0].chunk_id]
+        assert len(diff.removed_chunk_ids) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_chunks_are_retried(self):
+        deterministic_compute = await _deterministic_compute()
+        service, llm = _embedding_service(deterministic_compute)
+        chunking = DeterministicChunkingService()
+        chunking.deterministic_compute_abstraction = deterministic_compute
+        rejected = (await chunking.create_chunks(_document(_pages(5)), "f1", "t1"))[3].chunk_id
+        service.vector_store.reject_chunk_ids = {rejected}
+
+        first = await service.create_incremental_chunk_embeddings(
+            _document(_pages(5)), file_id="f1", parsed_file_id="p1", tenant_id="t1"
+        )
+        service.vector_store.reject_chunk_ids = set()
+        again = await service.create_incremental_chunk_embeddings(
+            _document(_pages(5)), file_id="f1", parsed_file_id="p1", tenant_id="t1"
+        )
+        unchanged = await service.create_incremental_chunk_embeddings(
+            _document(_pages(5)), file_id="f1", parsed_file_id="p1", tenant_id="t1"
+        )
+
+        assert first["status"] == "partial" and rejected not in first["embedded_chunk_ids"]
+        assert again["embedded_chunk_ids"] == [rejected]
+        assert (unchanged["status"], unchanged["embedded_chunk_ids"]) == ("success", [])
+        assert llm.embedded == 6
+
+    @pytest.mark.asyncio
+    async def test_manifests_are_per_embedding_profile(self):
+        deterministic_compute = await _deterministic_compute()
+        service, llm = _embedding_service(deterministic_compute)
+        document = _document(_pages(4))
+
+        await service.create_incremental_chunk_embeddings(document, file_id="f1", parsed_file_id="p1", tenant_id="t1")
+        other_model = await service.create_incremental_chunk_embeddings(
+            document, file_id="f1", parsed_file_id="p1", tenant_id="t1", model_name="text-embedding-3-small"
+        )
+        other_tenant = await service.create_incremental_chunk_embeddings(
+            document, file_id="f1", parsed_file_id="p1", tenant_id="t2"
+        )
+
+        assert len(other_model["embedded_chunk_ids"]) == len(other_tenant["embedded_chunk_ids"]) == 4
+        assert llm.embedded == 12
+
+    @pytest.mark.asyncio
+    async def test_diff_without_manifest_marks_everything_changed(self):
+        deterministic_compute = await _deterministic_compute()
+        chunking = DeterministicChunkingService()
+        chunking.deterministic_compute_abstraction = deterministic_compute
+
+        diff = await chunking.diff_chunks(_document(_pages(3)), "f1", "t1", "p1")
+
+        assert isinstance(diff, ChunkDiff)
+        assert (len(diff.changed), diff.unchanged_chunk_ids, diff.removed_chunk_ids) == (3, [], [])
+        assert await chunking.save_chunk_manifest(diff)
+        manifest = await deterministic_compute.get_chunk_manifest("t1", "default", file_id="f1")
+        assert [entry["chunk_id"] for entry in manifest["chunks"]] == [chunk.chunk_id for chunk in diff.chunks]
+
+    @pytest.mark.asyncio
+    async def test_manifest_store_is_required(self):
+        with pytest.raises(RuntimeError):
+            await DeterministicChunkingService().diff_chunks(_document(_pages(1)), "f1", "t1", "p1")
@@ -0,0 +1,198 @@
+"""
+Test the shared single-pass column profile.
+
+Verifies the per-column statistics and pattern classes, that the result does not depend on
+batch size, that distinct counting is exact up to the limit and a HyperLogLog estimate
+beyond it, that concurrent requests for one parsed file share a single computation (and
+the shared tier serves other workers), and that embeddings and metrics read the profile.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from symphainy_platform.foundations.libraries.embeddings.deterministic_embedding_service import (
+    DeterministicEmbeddingService,
+)
+from symphainy_platform.foundations.libraries.metrics.metrics_calculator_service import MetricsCalculatorService
+from symphainy_platform.foundations.libraries.parsing.file_parser_service import FileParserService
+from symphainy_platform.foundations.libraries.statistics import (
+    ColumnProfileService,
+    HyperLogLog,
+    profile_rows,
+)
+from symphainy_platform.foundations.libraries.statistics.column_profile import hash_strings
+from symphainy_platform.foundations.public_works.column_profile_cache import ColumnProfileCache
+
+
+def _rows(count):
+    return [
+        {
+            "id": i,
+            "email": f"user{i}@example.com" if i % 10 else None,
+            "amount": i * 1.5,
+            "code": f"{i:05d}",
+            "note": "" if i % 4 == 0 else "x" * (i % 9),
+        }
+        for i in range(count)
+    ]
+
+
+class _FakeRedis:
+    """Just enough of RedisAdapter (get / set) for the shared tier."""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.values[key] = value
+        return True
+
+
+class _FakePublicWorks:
+    def __init__(self, cache):
+        self.cache = cache
+
+    deterministic_compute_abstraction = None
+
+    def get_file_storage_abstraction(self):
+        return None
+
+    def get_column_profile_cache(self):
+        return self.cache
+
+
+class TestColumnProfile:
+    """Statistics match a naive per-column scan, whatever the batch size."""
+
+    def test_column_statistics(self):
+        rows = _rows(1000) + [{"id": 1000}, "not a row"]
+        profile = profile_rows(rows, batch_rows=128)
+
+        assert (profile["row_count"], profile["dict_row_count"]) == (1002, 1001)
+        email = profile["columns"]["email"]
+        assert (email["count"], email["missing_count"], email["null_count"]) == (1000, 1, 100)
+        assert email["pattern_counts"] == {"email": 900}
+        assert email["distinct_count"] == 900 and email["distinct_exact"]
+        amount = profile["columns"]["amount"]
+        assert (amount["min"], amount["max"], amount["mean"]) == (0.0, 1498.5, pytest.approx(749.25))
+        assert amount["inferred_type"] == "float"
+        code = profile["columns"]["code"]
+        assert code["pattern_counts"]["numeric_string"] == 1000
+        assert (code["string_min"], code["string_max"]) == ("00000", "00999")
+        note = profile["columns"]["note"]
+        empty = sum(1 for i in range(1000) if i % 4 == 0 or i % 9 == 0)
+        assert note["empty_count"] == note["length"]["histogram"]["0"] == empty
+        assert note["length"]["histogram"]["4-7"] == sum(1 for i in range(1000) if i % 4 and 4 <= i % 9 <= 7)
+        assert profile["columns"]["id"]["sample_values"][:3] == ["0", "1", "2"]
+
+    def test_batch_size_does_not_change_profile(self):
+        rows = _rows(2000)
+
+        assert profile_rows(rows, batch_rows=37) == profile_rows(rows, batch_rows=5000)
+
+    def test_values_of_different_types_are_distinct(self):
+        column = profile_rows([{"v": 1}, {"v": "1"}, {"v": 1.0}, {"v": True}, {"v": 1}])["columns"]["v"]
+
+        assert column["distinct_count"] == 4
+        assert column["type_counts"] == {"integer": 2, "string": 1, "float": 1, "boolean": 1}
+
+    def test_distinct_switches_to_hyperloglog_past_limit(self):
+        rows = [{"k": f"key-{i % 30000}"} for i in range(60000)]
+
+        exact = profile_rows(rows, batch_rows=1000)["columns"]["k"]
+        estimated = profile_rows(rows, batch_rows=1000, exact_distinct_limit=5000)["columns"]["k"]
+
+        assert (exact["distinct_count"], exact["distinct_exact"]) == (30000, True)
+        assert not estimated["distinct_exact"]
+        assert abs(estimated["distinct_count"] - 30000) / 30000 < 0.05
+
+    def test_hyperloglog_merge_matches_union(self):
+        left, right, union = HyperLogLog(), HyperLogLog(), HyperLogLog()
+        a = hash_strings([f"a{i}" for i in range(20000)])
+        b = hash_strings([f"b{i}" for i in range(20000)])
+        left.add_hashes(a)
+        right.add_hashes(b)
+        union.add_hashes(a)
+        union.add_hashes(b)
+        left.merge(right)
+
+        assert left.estimate() == union.estimate()
+        assert abs(union.estimate() - 40000) / 40000 < 0.05
+
+
+class TestColumnProfileCache:
+    """One computation per parsed file; other workers read it from Redis."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_computation(self):
+        cache = ColumnProfileCache(_FakeRedis())
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"row_count": 3}
+
+        results = await asyncio.gather(*(cache.get_or_compute("t1", "pf-1", compute) for _ in range(5)))
+
+        assert calls == 1 and all(r == {"row_count": 3} for r in results)
+        assert cache.get_stats()["coalesced"] == 4
+        assert await cache.get_or_compute("t2", "pf-1", compute) == {"row_count": 3} and calls == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_serves_other_workers(self):
+        redis = _FakeRedis()
+        await ColumnProfileCache(redis).put("t1", "pf-1", {"row_count": 7})
+        other_worker = ColumnProfileCache(redis)
+
+        assert json.loads(redis.values["colprofile:v1:t1:pf-1"]) == {"row_count": 7}
+        assert await other_worker.get("t1", "pf-1") == {"row_count": 7}
+        assert other_worker.get_stats()["shared_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_computation_is_not_cached(self):
+        cache = ColumnProfileCache()
+
+        async def fail():
+            raise ValueError("bad rows")
+
+        with pytest.raises(ValueError):
+            await cache.get_or_compute("t1", "pf-1", fail)
+        assert await cache.get("t1", "pf-1") is None
+
+
+class TestProfileConsumers:
+    """Embeddings and metrics read the same cached profile."""
+
+    @pytest.mark.asyncio
+    async def test_signature_and_metrics_from_shared_profile(self, monkeypatch):
+        cache = ColumnProfileCache()
+        public_works = _FakePublicWorks(cache)
+        parsed_content = {
+            "data": [{"email": "a@b.com", "n": 1}, {"email": "c@d.org", "n": "x"}, {"email": None}],
+            "metadata": {"columns": [{"name": "email", "type": "string"}, {"name": "n", "type": "integer"}]},
+        }
+        profile = await ColumnProfileService(public_works=public_works).get_profile("pf-1", parsed_content, "t1")
+
+        signature = DeterministicEmbeddingService(public_works=public_works)._create_pattern_signature(
+            [{"name": "email", "type": "string"}], profile
+        )
+        assert signature["email"]["patterns"] == {"email": True}
+        assert (signature["email"]["null_count"], signature["email"]["unique_count"]) == (1, 2)
+
+        async def get_parsed_file(self, parsed_file_id, tenant_id, context):
+            return parsed_content
+
+        monkeypatch.setattr(FileParserService, "get_parsed_file", get_parsed_file)
+        result = await MetricsCalculatorService(public_works=public_works).calculate_metrics("pf-1", "t1", context=None)
+
+        completeness = result["metrics"]["completeness"]["column_scores"]
+        assert (completeness["email"]["null_count"], completeness["n"]["null_count"]) == (1, 1)
+        assert result["metrics"]["accuracy"]["column_scores"]["n"] == {"accuracy": 0.5, "type_matches": 1, "type_total": 2}
+        assert cache.get_stats()["misses"] == 1
@@ -0,0 +1,129 @@
+"""
+Test ConversationLog (append-only chat turns with windowed reads).
+
+Verifies O(1) appends with tail-window reads (which keep turns and meta alive
+together), optimistic concurrency on the meta record, background compaction of old turns into the summary (without losing turns
+appended meanwhile), and chat routing that keeps a parallel tab's route.
+"""
+
+import asyncio
+
+import pytest
+
+from symphainy_platform.foundations.public_works.conversation_log import (
+    ConversationLog,
+    _MemoryStore,
+    extractive_summary,
+)
+from symphainy_platform.civic_systems.experience.api.runtime_agent_websocket import (
+    _get_conversation_context,
+    _record_agent_route,
+)
+
+
+def _turn(i, role="user"):
+    return {"role": role, "text": f"message {i}"}
+
+
+class TestConversationLog:
+    """Appends, windows, meta versions and compaction."""
+
+    @pytest.mark.asyncio
+    async def test_append_and_window(self):
+        log = ConversationLog(window=3)
+        for i in range(5):
+            assert await log.append("t1", "c1", _turn(i)) == i + 1
+
+        window = await log.read_window("t1", "c1")
+        assert [m["text"] for m in window["messages"]] == ["message 2", "message 3", "message 4"]
+        assert window["total_messages"] == 5 and window["version"] == 0
+        assert (await log.read_window("t2", "c1"))["messages"] == []
+        assert (await log.read_window("t1", "c1", limit=0))["messages"] == []
+
+    @pytest.mark.asyncio
+    async def test_append_refreshes_meta_ttl(self):
+        clock = [0.0]
+        log = ConversationLog(redis_adapter=_MemoryStore(clock=lambda: clock[0]), ttl_seconds=100)
+        await log.update_meta("t1", "c1", {"agent_id": "guide.content"})
+        await log.append("t1", "c1", _turn(0))
+
+        clock[0] = 90
+        await log.append("t1", "c1", _turn(1))
+        clock[0] = 150
+        window = await log.read_window("t1", "c1")
+        assert (window["agent_id"], window["total_messages"]) == ("guide.content", 2)
+
+        clock[0] = 191
+        window = await log.read_window("t1", "c1")
+        assert (window["agent_id"], window["total_messages"]) == (None, 0)
+
+    @pytest.mark.asyncio
+    async def test_meta_updates_are_versioned(self):
+        log = ConversationLog()
+        version = (await log.read_window("t1", "c1"))["version"]
+
+        assert await log.update_meta("t1", "c1", {"agent_id": "guide.content"}, expected_version=version)
+        assert not await log.update_meta("t1", "c1", {"agent_id": "liaison.content"}, expected_version=version)
+        assert await log.update_meta("t1", "c1", {"surface": "content_pillar"})
+
+        window = await log.read_window("t1", "c1")
+        assert (window["agent_id"], window["surface"], window["version"]) == ("guide.content", "content_pillar", 2)
+        assert log.get_stats()["meta_conflicts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_background_compaction_keeps_concurrent_appends(self):
+        release = asyncio.Event()
+
+        async def summarizer(previous, messages, tenant_id):
+            await release.wait()
+            return f"{previous}|{len(messages)} turns for {tenant_id}"
+
+        log = ConversationLog(summarizer=summarizer, compact_threshold=6, keep_recent=2, window=10)
+        for i in range(7):
+            await log.append("t1", "c1", _turn(i))
+        assert log.get_stats()["compactions_running"] == 1
+        await asyncio.sleep(0)  # compaction has picked its 5 oldest turns
+
+        await log.append("t1", "c1", _turn(7))  # arrives while the summary is being written
+        release.set()
+        await log.aclose()
+
+        window = await log.read_window("t1", "c1")
+        assert window["summary"] == "|5 turns for t1"
+        assert [m["text"] for m in window["messages"]] == ["message 5", "message 6", "message 7"]
+        assert window["total_messages"] == 8
+
+    @pytest.mark.asyncio
+    async def test_compaction_yields_to_concurrent_meta_change(self):
+        log = ConversationLog(compact_threshold=100, keep_recent=1)
+        for i in range(4):
+            await log.append("t1", "c1", _turn(i))
+
+        async def summarizer(previous, messages, tenant_id):
+            await log.update_meta("t1", "c1", {"agent_id": "guide.content"})
+            return "summary"
+
+        log.summarizer = summarizer
+        assert not await log.compact("t1", "c1")
+        window = await log.read_window("t1", "c1")
+        assert len(window["messages"]) == 4 and window["summary"] == "" and window["agent_id"] == "guide.content"
+
+    def test_extractive_summary_is_bounded(self):
+        summary = extractive_summary("earlier", [_turn(i) for i in range(1000)], max_chars=100)
+        assert len(summary) == 100 and summary.endswith("user: message 999")
+
+
+class TestChatRouting:
+    """Websocket helpers read windows and keep the first route."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_tab_route_is_kept(self):
+        log = ConversationLog()
+        tab_a = await _get_conversation_context("c1", log, "t1", "general")
+        tab_b = await _get_conversation_context("c1", log, "t1", "general")
+
+        assert await _record_agent_route("c1", tab_a, log, "t1", "guide", "guide.content") == ("guide", "guide.content")
+        assert await _record_agent_route("c1", tab_b, log, "t1", "liaison", "liaison.content") == ("guide", "guide.content")
+
+        context = await _get_conversation_context("c1", log, "t1", "general")
+        assert (context["agent_id"], context["surface"], context["version"]) == ("guide.content", "general", 1)
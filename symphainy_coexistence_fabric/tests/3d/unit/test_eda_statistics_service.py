@@ -0,0 +1,134 @@
+"""
+Test EDAStatisticsService (out-of-core EDA statistics).
+
+Verifies column profiles (null rates, sketch quantiles, distinct counts, top-k,
+correlations), sampling modes, Parquet round trips, that request options are validated
+before they reach SQL, and that InsightsEDAAgent builds its EDA results from the profile
+instead of a pandas DataFrame (and does not echo engine errors).
+"""
+
+import pytest
+
+pytest.importorskip("duckdb")
+
+from symphainy_platform.foundations.libraries.statistics import EDAStatisticsService, ProfileOptions
+
+
+def _rows(n=2000):
+    return [
+        {
+            "id": i,
+            "amount": i * 2.0,
+            "region": None if i % 10 == 0 else ("north" if i % 3 else "south"),
+        }
+        for i in range(n)
+    ]
+
+
+class TestEDAStatisticsService:
+    """Profiles computed by DuckDB over spooled rows and files."""
+
+    @pytest.mark.asyncio
+    async def test_profile_rows_full(self):
+        profile = await EDAStatisticsService().profile_rows(_rows())
+
+        assert profile["row_count"] == 2000
+        assert profile["estimated"] is False
+        region = profile["columns"]["region"]
+        assert region["null_count"] == 200
+        assert region["null_rate"] == pytest.approx(0.1)
+        assert region["approx_distinct"] == 2
+        assert region["top_k"][0] == "north"
+        amount = profile["columns"]["amount"]
+        assert amount["mean"] == pytest.approx(1999.0)
+        assert amount["quantiles"]["p50"] == pytest.approx(2000.0, rel=0.01)
+        assert profile["correlations"][0]["correlation"] == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_reservoir_sampling_bounds_rows(self):
+        options = ProfileOptions(sampling="reservoir", sample_size=100)
+        profile = await EDAStatisticsService().profile_rows(_rows(), options=options)
+
+        assert profile["row_count"] == 2000
+        assert profile["sampled_rows"] == 100
+        assert profile["estimated"] is True
+        assert profile["sampling"] == {"mode": "reservoir", "sample_size": 100}
+
+    @pytest.mark.asyncio
+    async def test_unknown_sampling_mode_rejected(self):
+        with pytest.raises(ValueError):
+            await EDAStatisticsService().profile_rows(_rows(10), options=ProfileOptions(sampling="top"))
+
+    @pytest.mark.asyncio
+    async def test_parquet_round_trip(self, tmp_path):
+        service = EDAStatisticsService()
+        path = await service.materialize_parquet(
+            [[1, "a"], [2, None], [3, "c"]], str(tmp_path / "parsed.parquet"), columns=["n", "label"]
+        )
+        profile = await service.profile_file(path)
+
+        assert profile["row_count"] == 3
+        assert profile["columns"]["label"]["null_count"] == 1
+        assert profile["columns"]["n"]["max"] == "3"
+
+    def test_extract_rows_from_parsed_content(self):
+        rows, columns = EDAStatisticsService.extract_rows(
+            {"parsed_file_id": "p1", "parsed_content": {"rows": [[1, 2]], "columns": ["a", "b"]}}
+        )
+        assert rows == [[1, 2]]
+        assert columns == ["a", "b"]
+        assert EDAStatisticsService.extract_rows({"parsed_content": "free text"}) == ([], None)
+
+
+class TestInsightsEDAAgentProfile:
+    """InsightsEDAAgent results come from the statistics engine."""
+
+    @pytest.mark.asyncio
+    async def test_perform_eda_summarizes_profile(self):
+        from symphainy_platform.civic_systems.agentic.agents.insights_eda_agent import InsightsEDAAgent
+
+        agent = InsightsEDAAgent(agent_id="insights_eda_test", capabilities=["eda"])
+        results = await agent.perform_eda({"rows": _rows(100)}, context=None)
+
+        assert results["shape"] == (100, 3)
+        assert results["null_counts"]["region"] == 10
+        assert set(results["numeric_summary"]) == {"id", "amount"}
+        insights = await agent.generate_insights(results, context=None)
+        assert any("missing values" in insight for insight in insights)
+
+    @pytest.mark.asyncio
+    async def test_string_input_is_inline_content_not_a_path(self, tmp_path):
+        from symphainy_platform.civic_systems.agentic.agents.insights_eda_agent import InsightsEDAAgent
+
+        secret = tmp_path / "secret.csv"
+        secret.write_text("token\nabc\ndef\n")
+        agent = InsightsEDAAgent(agent_id="insights_eda_test", capabilities=["eda"])
+        results = await agent.perform_eda(str(secret), context=None)
+
+        assert results["shape"] == (1, 1)
+        assert results["columns"] == ["value"]
+
+    def test_request_options_cannot_set_server_paths(self, tmp_path):
+        options = ProfileOptions.from_request({"sampling": "reservoir", "temp_directory": str(tmp_path), "threads": 64})
+
+        assert (options.sampling, options.temp_directory, options.threads) == ("reservoir", None, None)
+
+    @pytest.mark.parametrize("quantiles", [
+        ["0.5]) || read_text('/etc/hostname') || ([0.5"], [float("nan")], [1.5], [-0.1], "0.5", [True]
+    ])
+    def test_request_quantiles_must_be_numbers_in_unit_interval(self, quantiles):
+        with pytest.raises(ValueError):
+            ProfileOptions.from_request({"quantiles": quantiles})
+
+    def test_request_quantiles_are_coerced_to_floats(self):
+        assert ProfileOptions.from_request({"quantiles": ["0.1", 0.9]}).quantiles == (0.1, 0.9)
+
+    @pytest.mark.asyncio
+    async def test_agent_error_does_not_echo_engine_message(self):
+        from symphainy_platform.civic_systems.agentic.agents.insights_eda_agent import InsightsEDAAgent
+
+        agent = InsightsEDAAgent(agent_id="insights_eda_test", capabilities=["eda"])
+        options = ProfileOptions(sampling="no such mode /etc/hostname")
+        results = await agent.perform_eda({"rows": _rows(10)}, context=None, options=options)
+
+        assert results == {"error": "EDA analysis failed", "error_type": "ValueError"}
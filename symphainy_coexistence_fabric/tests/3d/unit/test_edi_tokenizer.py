@@ -0,0 +1,204 @@
+"""
+Test the streaming X12 / EDIFACT tokenizer.
+
+Verifies that delimiters are detected from each ISA / UNA header, that segments come out
+the same however the stream is chunked (terminators and release characters split across
+chunks), that transactions are yielded one at a time with an ST/SE offset index, and that
+an indexed transaction can be re-read on its own from the index stored next to the payload.
+"""
+
+import pytest
+
+from symphainy_platform.foundations.public_works.adapters.edi_adapter import EDIAdapter
+from symphainy_platform.foundations.public_works.adapters.edi_tokenizer import (
+    EDIFormatError,
+    EDITokenizer,
+    iter_chunks,
+    read_transaction,
+)
+from symphainy_platform.foundations.public_works.protocols.ingestion_protocol import (
+    IngestionRequest,
+    IngestionType,
+)
+
+
+def _isa(control, element="*", component=":", terminator="~"):
+    fields = [
+        "ISA", "00", " " * 10, "00", " " * 10, "ZZ", "SENDER".ljust(15), "ZZ", "RECEIVER".ljust(15),
+        "240101", "1200", "^", "00501", control, "0", "P", component
+    ]
+    header = element.join(fields) + terminator
+    assert len(header) == 106
+    return header
+
+
+def _x12_claims(claims, control="000000001", element="*", component=":", terminator="~", newline="\r\n"):
+    segments = [_isa(control, element, component, terminator)[:-1], f"GS{element}HC{element}S{element}R{element}20240101{element}1200{element}77{element}X{element}005010X222A1"]
+    for number in range(1, claims + 1):
+        st = f"{number:04d}"
+        body = [
+            f"ST{element}837{element}{st}",
+            f"BHT{element}0019{element}00{element}REF{number}",
+            f"CLM{element}PAT{number}{element}{number * 10}{element}{element}{element}11{component}B{component}1",
+        ]
+        segments += body + [f"SE{element}{len(body) + 1}{element}{st}"]
+    segments += [f"GE{element}{claims}{element}77", f"IEA{element}1{element}{control}"]
+    return "".join(segment + terminator + newline for segment in segments).encode()
+
+
+def _edifact(with_una=True):
+    text = (
+        ("UNA:+.? '" if with_una else "")
+        + "UNB+UNOC:3+SENDER+RECEIVER+240101:1200+REF42'\n"
+        + "UNH+1+INVOIC:D:96A:UN'\n"
+        + "FTX+AAI+++O?'Brien pays 10?+2?:3'\n"
+        + "UNT+3+1'\n"
+        + "UNZ+1+REF42'\n"
+    )
+    return text.encode()
+
+
+def _segments(data, chunk_size):
+    return [(s.tag, s.elements, s.offset, s.end_offset) for s in EDITokenizer().iter_segments(iter_chunks(data, chunk_size))]
+
+
+class TestSegments:
+    """Delimiters come from the header; chunking never changes the result."""
+
+    def test_x12_delimiters_detected_and_chunking_irrelevant(self):
+        data = _x12_claims(3, element="|", component=">", terminator="~")
+        whole = _segments(data, len(data))
+
+        assert whole == _segments(data, 1) == _segments(data, 7)
+        tokenizer = EDITokenizer()
+        list(tokenizer.iter_segments([data]))
+        assert (tokenizer.delimiters.element, tokenizer.delimiters.component, tokenizer.delimiters.segment) == ("|", ">", "~")
+        assert tokenizer.delimiters.repetition == "^"
+        clm = next(s for s in whole if s[0] == "CLM")
+        assert tokenizer.components(clm[1][5]) == ["11", "B", "1"]
+        assert data[clm[2]:clm[3]] == b"CLM|PAT1|10|||11>B>1~"
+
+    def test_edifact_release_character_escapes_delimiters(self):
+        data = _edifact()
+        whole = _segments(data, len(data))
+
+        assert whole == _segments(data, 1)
+        ftx = next(s for s in whole if s[0] == "FTX")
+        assert ftx[1] == ["FTX", "AAI", "", "", "O'Brien pays 10+2?:3"]
+        tokenizer = EDITokenizer()
+        list(tokenizer.iter_segments([data]))
+        assert tokenizer.components(ftx[1][4]) == ["O'Brien pays 10+2:3"]
+
+    def test_unb_without_una_uses_default_delimiters(self):
+        assert _segments(_edifact(with_una=False), 5)[0][1][:3] == ["UNB", "UNOC:3", "SENDER"]
+
+    def test_each_interchange_brings_its_own_delimiters(self):
+        data = _x12_claims(1, control="000000001") + _x12_claims(1, control="000000002", element="|", terminator="\n", newline="")
+        tokenizer = EDITokenizer()
+        transactions = list(tokenizer.iter_transactions(iter_chunks(data, 16)))
+
+        assert [t.entry.interchange_control_number for t in transactions] == ["000000001", "000000002"]
+        assert [t.entry.delimiters.element for t in transactions] == ["*", "|"]
+
+    def test_non_edi_and_unterminated_transactions_rejected(self):
+        with pytest.raises(EDIFormatError):
+            list(EDITokenizer().iter_segments([b"name,amount\nA,1\n"]))
+        truncated = _x12_claims(2).split(b"SE*4*0002~")[0]
+        with pytest.raises(EDIFormatError):
+            list(EDITokenizer().iter_transactions(iter_chunks(truncated, 64)))
+
+
+class TestTransactions:
+    """Transactions stream one at a time and can be re-read from the offset index."""
+
+    def test_index_and_reread(self):
+        data = _x12_claims(50)
+        tokenizer = EDITokenizer()
+        streamed = list(tokenizer.iter_transactions(iter_chunks(data, 100)))
+
+        assert len(streamed) == len(tokenizer.index) == 50
+        entry = tokenizer.index[41]
+        assert (entry.transaction_type, entry.control_number, entry.segment_count) == ("837", "0042", 4)
+        assert (entry.interchange_control_number, entry.group_control_number) == ("000000001", "77")
+        assert data[entry.start_offset:entry.end_offset].startswith(b"ST*837*0042~")
+
+        reread = read_transaction(data, entry)
+        assert [s.elements for s in reread.segments] == [s.elements for s in streamed[41].segments]
+        assert [s.offset for s in reread.segments] == [s.offset for s in streamed[41].segments]
+
+    def test_edifact_transactions(self):
+        index = EDITokenizer().build_index(iter_chunks(_edifact(), 3))
+
+        assert [(e.standard, e.transaction_type, e.control_number, e.interchange_control_number) for e in index] == [
+            ("edifact", "INVOIC", "1", "REF42")
+        ]
+
+
+class _FakeStorage:
+    def __init__(self):
+        self.files = {}
+        self.metadata = {}
+
+    async def upload_file(self, file_path, file_data, metadata=None):
+        self.files[file_path] = file_data
+        self.metadata[file_path] = metadata
+        return {"success": True}
+
+    async def download_file(self, file_path):
+        return self.files.get(file_path)
+
+
+def _request(data):
+    return IngestionRequest(
+        ingestion_type=IngestionType.EDI,
+        tenant_id="t1",
+        session_id="s1",
+        data=data,
+        source_metadata={"protocol": "sftp", "transaction_type": "837"}
+    )
+
+
+class TestEDIAdapterIndex:
+    @pytest.mark.asyncio
+    async def test_ingest_persists_transaction_index(self):
+        storage = _FakeStorage()
+        adapter = EDIAdapter(storage, crypto_workers=0)
+        data = _x12_claims(5)
+
+        result = await adapter.ingest(_request(data))
+
+        assert result.success
+        assert (result.ingestion_metadata["edi_standard"], result.ingestion_metadata["transaction_count"]) == ("x12", 5)
+        payload_metadata = storage.metadata[result.storage_location]
+        assert "transaction_index" not in payload_metadata and payload_metadata["transaction_count"] == 5
+        assert payload_metadata["transaction_index_path"] == result.ingestion_metadata["transaction_index_path"]
+        assert result.ingestion_metadata["transaction_index_path"] in storage.files
+
+        # Re-read from storage alone: the index comes from the sidecar, the payload is downloaded
+        third = await adapter.read_transaction(result.storage_location, 2)
+        assert third.segments[0].elements == ["ST", "837", "0003"]
+        assert (await adapter.read_transaction(result.storage_location, 4, data=data)).entry.control_number == "0005"
+        assert [t.entry.control_number for t in adapter.iter_transactions(data)] == ["0001", "0002", "0003", "0004", "0005"]
+
+    @pytest.mark.asyncio
+    async def test_index_not_stored_fails_ingestion(self):
+        class _IndexRejected(_FakeStorage):
+            async def upload_file(self, file_path, file_data, metadata=None):
+                if file_path.endswith(".edi-index.json"):
+                    return {"success": False, "error": "quota"}
+                return await super().upload_file(file_path, file_data, metadata)
+
+        storage = _IndexRejected()
+        result = await EDIAdapter(storage, crypto_workers=0).ingest(_request(_x12_claims(2)))
+
+        assert not result.success and storage.files == {}
+
+    @pytest.mark.asyncio
+    async def test_non_edi_payload_has_no_index(self):
+        storage = _FakeStorage()
+        adapter = EDIAdapter(storage, crypto_workers=0)
+        result = await adapter.ingest(_request(b"not an interchange"))
+
+        assert result.success and list(storage.files) == [result.storage_location]
+        with pytest.raises(FileNotFoundError):
+            await adapter.read_transaction(result.storage_location, 0)
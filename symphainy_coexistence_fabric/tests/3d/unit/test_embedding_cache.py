@@ -0,0 +1,111 @@
+"""
+Test EmbeddingCache (in-process LRU plus shared Redis tier of packed float32 vectors).
+
+Verifies packing, LRU bounds, bulk lookups hitting each tier, that the embedding
+engine serves repeated texts without calling the provider, and that chunk
+embeddings use stable document keys instead of per-chunk existence queries.
+"""
+
+import pytest
+
+from symphainy_platform.foundations.public_works.embedding_cache import (
+    EmbeddingCache,
+    normalized_text_hash,
+    pack_vector,
+    unpack_vector,
+)
+from symphainy_platform.foundations.public_works.embedding_engine import EmbeddingEngine
+
+
+class _FakeRedis:
+    """RedisAdapter surface used by the cache (mget / mset), counting round trips."""
+
+    def __init__(self):
+        self.store = {}
+        self.round_trips = 0
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.store.get(key) for key in keys]
+
+    async def mset(self, mapping, ttl=None):
+        self.round_trips += 1
+        self.store.update(mapping)
+        return True
+
+
+class TestEmbeddingCache:
+    """Two-tier lookups and storage."""
+
+    def test_pack_round_trip_is_float32(self):
+        vector = [0.5, -1.25, 3.0]
+        payload = pack_vector(vector)
+        assert unpack_vector(payload) == vector
+        assert len(payload) == len(pack_vector([0.0] * 3))
+
+    def test_hash_matches_chunk_normalization(self):
+        assert normalized_text_hash("  a \n b\t") == normalized_text_hash("a b")
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_hit_populates_local(self):
+        redis = _FakeRedis()
+        await EmbeddingCache(redis).put_many({"h1": [1.0, 2.0]}, "m")
+
+        cache = EmbeddingCache(redis)
+        found = await cache.get_many(["h1", "h2"], "m")
+
+        assert found == {"h1": [1.0, 2.0]}
+        assert cache.get_local("h1", "m") == [1.0, 2.0]
+        stats = cache.get_stats()
+        assert stats["shared_hits"] == 1 and stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_keys_separate_model_and_dimension(self):
+        cache = EmbeddingCache(_FakeRedis())
+        await cache.put_many({"h": [1.0]}, "m1")
+
+        assert await cache.get_many(["h"], "m2") == {}
+        assert await cache.get_many(["h"], "m1", dimension=8) == {}
+
+    def test_local_tier_is_bounded(self):
+        cache = EmbeddingCache(local_max_entries=2)
+        for i in range(3):
+            cache._remember(f"h{i}", "m", None, [float(i)])
+        assert cache.get_local("h0", "m") is None
+        assert cache.get_local("h2", "m") == [2.0]
+
+
+class TestEngineWithCache:
+    """Cached texts never reach the provider."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_texts_served_from_cache(self):
+        calls = []
+
+        async def embed_batch(texts, model):
+            calls.append(list(texts))
+            return [[float(len(text))] for text in texts]
+
+        redis = _FakeRedis()
+        engine = EmbeddingEngine("test", embed_batch, cache=EmbeddingCache(redis))
+        first = await engine.embed_many(["Column: id", "Column: name"], "m")
+        second = await engine.embed_many(["Column:  id", "Column: name"], "m")
+
+        assert first == second
+        assert calls == [["Column: id", "Column: name"]]
+
+        # A different process (fresh in-process tier) hits the shared tier
+        other = EmbeddingEngine("test", embed_batch, cache=EmbeddingCache(redis))
+        await other.embed("Column: name", "m")
+        assert len(calls) == 1
+
+
+class TestChunkEmbeddingKeys:
+    """Chunk embeddings are idempotent through stable keys."""
+
+    def test_key_is_stable_per_profile_and_model(self):
+        from symphainy_platform.civic_systems.agentic.agents.embedding_agent import EmbeddingService
+
+        key = EmbeddingService._chunk_embedding_key("chunk-1", "default", "m", "1.0.0")
+        assert key == EmbeddingService._chunk_embedding_key("chunk-1", "default", "m", "1.0.0")
+        assert key != EmbeddingService._chunk_embedding_key("chunk-1", "default", "m2", "1.0.0")
@@ -0,0 +1,141 @@
+"""
+Test EmbeddingEngine (cross-request micro-batching for embedding providers).
+
+Verifies that concurrent single-text requests are coalesced into batched provider
+calls bounded by batch size and in-flight limits, that provider errors reach every
+waiting caller, and that the OpenAI / HuggingFace adapters embed through the engine.
+"""
+
+import asyncio
+
+import pytest
+
+from symphainy_platform.foundations.public_works.embedding_engine import EmbeddingEngine
+
+
+class _Provider:
+    """Records batch calls; vectors encode the text length."""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.calls = []
+        self.delay = delay
+        self.fail = fail
+        self.active = 0
+        self.peak = 0
+
+    async def embed_batch(self, texts, model):
+        self.calls.append((list(texts), model))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("provider unavailable")
+            return [[float(len(text))] for text in texts]
+        finally:
+            self.active -= 1
+
+
+class TestEmbeddingEngine:
+    """Coalescing, limits and error propagation."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self):
+        provider = _Provider()
+        engine = EmbeddingEngine("test", provider.embed_batch, max_batch_size=64, max_wait_ms=5)
+
+        vectors = await asyncio.gather(*(engine.embed("x" * i, "m") for i in range(1, 21)))
+
+        assert vectors == [[float(i)] for i in range(1, 21)]
+        assert len(provider.calls) == 1
+        assert engine.get_stats()["mean_batch_size"] == 20
+
+    @pytest.mark.asyncio
+    async def test_batches_split_by_size_and_model(self):
+        provider = _Provider()
+        engine = EmbeddingEngine("test", provider.embed_batch, max_batch_size=8, max_wait_ms=5)
+
+        await asyncio.gather(
+            engine.embed_many([f"a{i}" for i in range(20)], "m1"),
+            engine.embed_many([f"b{i}" for i in range(3)], "m2"),
+        )
+
+        sizes = sorted((model, len(texts)) for texts, model in provider.calls)
+        assert sizes == [("m1", 4), ("m1", 8), ("m1", 8), ("m2", 3)]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_texts_sent_once(self):
+        provider = _Provider()
+        engine = EmbeddingEngine("test", provider.embed_batch)
+
+        vectors = await engine.embed_many(["same", "same", "other"], "m")
+
+        assert vectors == [[4.0], [4.0], [5.0]]
+        assert provider.calls == [(["same", "other"], "m")]
+
+    @pytest.mark.asyncio
+    async def test_in_flight_calls_bounded(self):
+        provider = _Provider(delay=0.02)
+        engine = EmbeddingEngine("test", provider.embed_batch, max_batch_size=2, max_in_flight=2)
+
+        await engine.embed_many([f"t{i}" for i in range(12)], "m")
+
+        assert len(provider.calls) == 6
+        assert provider.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_provider_error_reaches_every_caller(self):
+        engine = EmbeddingEngine("test", _Provider(fail=True).embed_batch)
+
+        results = await asyncio.gather(engine.embed("a", "m"), engine.embed("b", "m"), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert engine.get_stats()["errors"] == 1
+
+
+class TestAdaptersUseEngine:
+    """Adapter single-text calls are coalesced into batched provider requests."""
+
+    @pytest.mark.asyncio
+    async def test_huggingface_generate_embedding_batches(self):
+        from symphainy_platform.foundations.public_works.adapters.huggingface_adapter import HuggingFaceAdapter
+
+        calls = []
+
+        class RecordingHF(HuggingFaceAdapter):
+            async def inference(self, inputs, model="m", **kwargs):
+                calls.append(inputs)
+                return {"embedding": [[1.0, 0.0] for _ in inputs], "model": model, "dimension": 2}
+
+        adapter = RecordingHF(endpoint_url="http://hf.local", api_key="k")
+        results = await asyncio.gather(*(adapter.generate_embedding(f"text {i}") for i in range(10)))
+
+        assert len(calls) == 1 and len(calls[0]) == 10
+        assert all(r["dimension"] == 2 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_openai_generate_embeddings_batches(self):
+        from symphainy_platform.foundations.public_works.adapters.openai_adapter import OpenAIAdapter
+
+        calls = []
+
+        class _Item:
+            def __init__(self, index):
+                self.index = index
+                self.embedding = [float(index)]
+
+        class _Embeddings:
+            async def create(self, input, model):
+                calls.append(input)
+                # Out of order on purpose: the adapter sorts by index
+                return type("R", (), {"data": [_Item(i) for i in reversed(range(len(input)))]})()
+
+        class RecordingOpenAI(OpenAIAdapter):
+            def _initialize_client(self):
+                self._client = self.client = type("C", (), {"embeddings": _Embeddings()})()
+
+        adapter = RecordingOpenAI(api_key="k")
+        vectors = await asyncio.gather(*(adapter.generate_embeddings(f"t{i}") for i in range(5)))
+
+        assert len(calls) == 1
+        assert vectors == [[float(i)] for i in range(5)]
@@ -0,0 +1,225 @@
+"""
+Test HybridRetrievalAbstraction (Meilisearch + vector store with reciprocal rank fusion).
+
+Verifies rank fusion, that the lexical and vector stages run concurrently with per-stage
+timings, the per-tenant hot-query cache, partial results when one engine fails, the
+non-blocking Meilisearch search call (whose failures are reported, not emptied), and that agents receive the retrieved context.
+"""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from symphainy_platform.foundations.public_works.abstractions.hybrid_retrieval_abstraction import (
+    HybridRetrievalAbstraction,
+    reciprocal_rank_fusion,
+)
+from symphainy_platform.foundations.public_works.adapters.meilisearch_adapter import MeilisearchAdapter
+from symphainy_platform.civic_systems.agentic.agent_base import AgentBase
+
+
+class _Lexical:
+    def __init__(self, hits, delay=0.0, error=None):
+        self.hits, self.delay, self.error = hits, delay, error
+        self.calls = []
+
+    async def asearch(self, index_name, query, filters=None, limit=20):
+        self.calls.append({"index": index_name, "query": query, "filters": filters, "limit": limit})
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return {"hits": self.hits}
+
+
+class _Vectors:
+    def __init__(self, hits, delay=0.0):
+        self.hits, self.delay = hits, delay
+        self.calls = []
+
+    async def vector_search(self, query_embedding, filter_conditions=None, limit=10):
+        self.calls.append({"embedding": query_embedding, "filters": filter_conditions, "limit": limit})
+        await asyncio.sleep(self.delay)
+        return self.hits
+
+
+class _Embedder:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    async def generate_embedding(self, text, model):
+        await asyncio.sleep(self.delay)
+        return {"embedding": [0.1, 0.2, 0.3]}
+
+
+LEXICAL_HITS = [{"id": "a", "title": "Invoice policy"}, {"id": "b", "title": "Claims"}, {"id": "c"}]
+VECTOR_HITS = [
+    {"_key": "x", "chunk_id": "b", "similarity": 0.9, "embedding": [1.0]},
+    {"_key": "y", "chunk_id": "d", "similarity": 0.8, "embedding": [1.0]},
+]
+
+
+class TestReciprocalRankFusion:
+    """Rank-only fusion."""
+
+    def test_documents_in_both_rankings_win(self):
+        fused = reciprocal_rank_fusion({"lexical": ["a", "b", "c"], "vector": ["b", "d"]}, k=60)
+
+        assert [key for key, _, _ in fused] == ["b", "a", "d", "c"]
+        assert fused[0][1] == pytest.approx(1 / 62 + 1 / 61)
+        assert fused[0][2] == {"lexical": 2, "vector": 1}
+
+    def test_weights_and_duplicates(self):
+        fused = reciprocal_rank_fusion({"lexical": ["a", "a"], "vector": ["b"]}, k=1, weights={"vector": 2.0})
+        assert [(key, score) for key, score, _ in fused] == [("b", 1.0), ("a", 0.5)]
+
+
+class TestHybridRetrievalAbstraction:
+    """Concurrent stages, fusion, cache and partial failure."""
+
+    @pytest.mark.asyncio
+    async def test_stages_run_concurrently_and_fuse(self):
+        lexical = _Lexical(LEXICAL_HITS, delay=0.1)
+        vectors = _Vectors(VECTOR_HITS, delay=0.05)
+        retrieval = HybridRetrievalAbstraction(lexical, vectors, _Embedder(delay=0.05))
+
+        started = time.perf_counter()
+        result = await retrieval.retrieve("invoice claims", "t1", limit=3, filters={"kind": "policy"})
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.18  # lexical (0.1s) overlaps embedding + vector (0.1s)
+        assert [item["key"] for item in result["results"]] == ["b", "a", "d"]
+        assert result["results"][0]["document"] == {
+            "id": "b", "title": "Claims", "_key": "x", "chunk_id": "b", "similarity": 0.9
+        }
+        assert set(result["timings_ms"]) == {"embedding", "lexical", "vector", "fusion", "total"}
+        assert result["timings_ms"]["lexical"] >= 90 and result["errors"] == {}
+        assert lexical.calls[0]["filters"] == {"kind": "policy", "tenant_id": "t1"}
+        assert vectors.calls[0]["filters"] == {"kind": "policy", "tenant_id": "t1"} and vectors.calls[0]["limit"] == 9
+
+    @pytest.mark.asyncio
+    async def test_hot_queries_cached_per_tenant(self):
+        lexical = _Lexical(LEXICAL_HITS)
+        retrieval = HybridRetrievalAbstraction(lexical, _Vectors(VECTOR_HITS), _Embedder())
+
+        first = await retrieval.retrieve("Invoice  claims", "t1")
+        again = await retrieval.retrieve("invoice claims", "t1")
+        other_tenant = await retrieval.retrieve("invoice claims", "t2")
+
+        assert again["cached"] and again["results"] == first["results"]
+        assert not other_tenant["cached"]
+        assert len(lexical.calls) == 2
+        assert retrieval.invalidate("t1") == 1
+        assert not (await retrieval.retrieve("invoice claims", "t1"))["cached"]
+
+        uncached = HybridRetrievalAbstraction(lexical, cache_ttl_seconds=0)
+        await uncached.retrieve("q", "t1")
+        assert not (await uncached.retrieve("q", "t1"))["cached"]
+
+    @pytest.mark.asyncio
+    async def test_failed_stage_returns_partial_results_uncached(self):
+        lexical = _Lexical([], error=RuntimeError("meilisearch down"))
+        retrieval = HybridRetrievalAbstraction(lexical, _Vectors(VECTOR_HITS), _Embedder())
+
+        result = await retrieval.retrieve("claims", "t1")
+
+        assert [item["key"] for item in result["results"]] == ["b", "d"]
+        assert result["errors"] == {"lexical": "meilisearch down"}
+        assert not (await retrieval.retrieve("claims", "t1"))["cached"]
+        assert retrieval.get_stats()["lexical_errors"] == 2
+
+    @pytest.mark.asyncio
+    async def test_vector_stage_skipped_without_embedding_source(self):
+        vectors = _Vectors(VECTOR_HITS)
+        retrieval = HybridRetrievalAbstraction(_Lexical(LEXICAL_HITS), vectors)
+
+        result = await retrieval.retrieve("claims", "t1")
+        assert [item["key"] for item in result["results"]] == ["a", "b", "c"]
+        assert "vector" not in result["timings_ms"] and not vectors.calls
+
+        await retrieval.retrieve("claims", "t1", query_embedding=[0.5], limit=2)
+        assert vectors.calls[0]["embedding"] == [0.5]
+
+
+class TestMeilisearchAsyncSearch:
+    """Non-blocking search over the Meilisearch HTTP API."""
+
+    @pytest.mark.asyncio
+    async def test_asearch_posts_search_request(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"hits": [{"id": "1"}], "estimatedTotalHits": 1})
+
+        adapter = MeilisearchAdapter(host="meili", api_key="secret")
+        adapter._client = object()  # connected
+        adapter._async_client = httpx.AsyncClient(
+            base_url=adapter.base_url, headers={"Authorization": "Bearer secret"},
+            transport=httpx.MockTransport(handler)
+        )
+        adapter._async_client_loop = asyncio.get_running_loop()
+
+        result = await adapter.asearch("docs", "invoice", filters={"tenant_id": "t1"}, limit=5)
+        await adapter.aclose()
+
+        assert result["hits"] == [{"id": "1"}]
+        assert requests[0].url.path == "/indexes/docs/search"
+        assert requests[0].headers["Authorization"] == "Bearer secret"
+        assert json.loads(requests[0].content) == {
+            "q": "invoice", "limit": 5, "offset": 0, "filter": 'tenant_id = "t1"'
+        }
+
+    @pytest.mark.asyncio
+    async def test_search_failure_reaches_retrieval_errors(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(503, json={"message": "unavailable"})
+
+        adapter = MeilisearchAdapter(host="meili", api_key="secret")
+        adapter._client = object()  # connected
+        adapter._async_client = httpx.AsyncClient(base_url=adapter.base_url, transport=httpx.MockTransport(handler))
+        adapter._async_client_loop = asyncio.get_running_loop()
+        retrieval = HybridRetrievalAbstraction(adapter)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await adapter.asearch("docs", "invoice")
+        first = await retrieval.retrieve("invoice", "t1")
+        again = await retrieval.retrieve("invoice", "t1")
+        await adapter.aclose()
+
+        assert "503" in first["errors"]["lexical"]
+        assert not again["cached"] and len(requests) == 3
+
+
+class _EchoAgent(AgentBase):
+    retrieves_knowledge_context = True
+
+    async def _process_with_assembled_prompt(self, system_message, user_message, runtime_context, context):
+        return {"user_message": user_message, "knowledge": runtime_context.knowledge_context}
+
+
+class TestAgentKnowledgeContext:
+    """Agents that opt in get retrieved knowledge in their prompt."""
+
+    @pytest.mark.asyncio
+    async def test_retrieved_context_reaches_prompt(self):
+        retrieval = HybridRetrievalAbstraction(_Lexical([{"id": "a", "text": "Invoices are due in 30 days."}]))
+        public_works = SimpleNamespace(get_hybrid_retrieval_abstraction=lambda: retrieval)
+        agent = _EchoAgent(agent_id="echo", public_works=public_works)
+
+        result = await agent.process_request({"message": "When are invoices due?"}, SimpleNamespace(tenant_id="t1"))
+
+        assert "Relevant knowledge:\n  - Invoices are due in 30 days." in result["user_message"]
+        assert result["knowledge"][0]["key"] == "a"
+
+    @pytest.mark.asyncio
+    async def test_missing_retrieval_gives_no_context(self):
+        agent = _EchoAgent(agent_id="echo", public_works=SimpleNamespace())
+        result = await agent.process_request({"message": "hello"}, SimpleNamespace(tenant_id="t1"))
+        assert result["knowledge"] == [] and "Relevant knowledge" not in result["user_message"]
@@ -0,0 +1,184 @@
+"""
+Test batch intent submission.
+
+Verifies that a batch is validated once, logged in one WAL write, executed under one
+concurrency limit shared by all batches with pre-assigned execution IDs, and queryable as
+one operation, that invalid intents are rejected per item without stopping the rest, and
+that running batches stop with the app.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from symphainy_platform.foundations.public_works.rate_limiter import DistributedRateLimiter, Quota
+from symphainy_platform.runtime.execution_lifecycle_manager import ExecutionLifecycleManager
+from symphainy_platform.runtime.intent_batch import IntentBatchExecutor
+from symphainy_platform.runtime.intent_registry import IntentRegistry
+from symphainy_platform.runtime.runtime_api import (
+    BatchIntentItem,
+    IntentBatchSubmitRequest,
+    RuntimeAPI,
+    create_runtime_app,
+)
+from symphainy_platform.runtime.state_surface import StateSurface
+from symphainy_platform.runtime.wal import WALEventType, WriteAheadLog
+
+
+class _CountingWAL(WriteAheadLog):
+    def __init__(self):
+        super().__init__(use_memory=True)
+        self.batch_writes = 0
+
+    async def append_many(self, events):
+        self.batch_writes += 1
+        return await super().append_many(events)
+
+
+class _Handler:
+    """Records concurrency and the execution context each intent ran with."""
+
+    def __init__(self, delay=0.01, fail_on=None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.running = 0
+        self.peak = 0
+        self.contexts = []
+
+    async def __call__(self, intent, context):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if intent.parameters.get("file_id") == self.fail_on:
+                raise RuntimeError("parse failed")
+            self.contexts.append((context.execution_id, dict(context.metadata)))
+            return {"artifacts": {}, "events": []}
+        finally:
+            self.running -= 1
+
+
+def _runtime(handler, max_concurrency=2, rate_limiter=None):
+    registry = IntentRegistry()
+    registry.register_intent("parse_content", "parse_content_service", handler_function=handler)
+    wal = _CountingWAL()
+    state_surface = StateSurface(use_memory=True)
+    manager = ExecutionLifecycleManager(registry, state_surface, wal)
+    executor = IntentBatchExecutor(manager, state_surface, max_concurrency=max_concurrency, max_batch_size=10)
+    api = RuntimeAPI(manager, state_surface, rate_limiter=rate_limiter, batch_executor=executor)
+    return api, wal, state_surface
+
+
+def _parse_items(count, prefix="f"):
+    return [BatchIntentItem(intent_type="parse_content", parameters={"file_id": f"{prefix}{i}"}) for i in range(count)]
+
+
+def _request(*intents):
+    return IntentBatchSubmitRequest(
+        tenant_id="t1", session_id="s1", solution_id="sol", metadata={"user_id": "u1"},
+        intents=list(intents)
+    )
+
+
+async def _wait_for_batch(api, batch_id):
+    for _ in range(200):
+        status = await api.get_intent_batch_status(batch_id, "t1")
+        if status.status != "running":
+            return status
+        await asyncio.sleep(0.01)
+    raise AssertionError("batch did not finish")
+
+
+class TestIntentBatch:
+    """Batch validation, logging, scheduling and status."""
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_with_bounded_concurrency_and_shared_context(self):
+        handler = _Handler()
+        api, wal, state_surface = _runtime(handler, max_concurrency=2)
+
+        response = await api.submit_intent_batch(_request(
+            *[BatchIntentItem(intent_type="parse_content", parameters={"file_id": f"f{i}"}) for i in range(6)]
+        ))
+        status = await _wait_for_batch(api, response.batch_id)
+
+        assert (response.accepted, response.rejected) == (6, 0)
+        assert (status.status, status.succeeded, status.processed) == ("completed", 6, 6)
+        assert handler.peak == 2
+        execution_ids = {item.execution_id for item in response.items}
+        assert {execution_id for execution_id, _ in handler.contexts} == execution_ids
+        assert all(metadata["batch_id"] == response.batch_id for _, metadata in handler.contexts)
+
+        received = [e for e in wal._memory_log if e.event_type == WALEventType.INTENT_RECEIVED]
+        assert wal.batch_writes == 1 and len(received) == 6
+        for execution_id in execution_ids:
+            assert (await state_surface.get_execution_state(execution_id, "t1"))["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_invalid_intents_rejected_per_item(self):
+        handler = _Handler(fail_on="bad")
+        api, _, _ = _runtime(handler)
+
+        response = await api.submit_intent_batch(_request(
+            BatchIntentItem(intent_type="parse_content", parameters={"file_id": "ok"}),
+            BatchIntentItem(intent_type="no_such_intent"),
+            BatchIntentItem(intent_type="parse_content", parameters={"file_id": "bad"}),
+        ))
+        status = await _wait_for_batch(api, response.batch_id)
+
+        assert [item.status for item in response.items] == ["queued", "rejected", "queued"]
+        assert response.items[1].execution_id is None and "No handler" in response.items[1].error
+        assert (status.status, status.succeeded, status.failed, status.rejected) == ("completed_with_errors", 1, 1, 1)
+        assert status.items[2].error == "parse failed"
+
+    @pytest.mark.asyncio
+    async def test_batch_limits(self):
+        limiter = DistributedRateLimiter(intent_quotas={"parse_content": Quota(3, 60)})
+        api, _, _ = _runtime(_Handler(delay=0), rate_limiter=limiter)
+
+        with pytest.raises(HTTPException) as error:
+            await api.submit_intent_batch(_request())
+        assert error.value.status_code == 400
+        with pytest.raises(HTTPException) as error:
+            await api.submit_intent_batch(_request(*[BatchIntentItem(intent_type="parse_content")] * 11))
+        assert error.value.status_code == 400
+
+        first = await api.submit_intent_batch(_request(*[BatchIntentItem(intent_type="parse_content")] * 3))
+        with pytest.raises(HTTPException) as error:
+            await api.submit_intent_batch(_request(BatchIntentItem(intent_type="parse_content")))
+        assert error.value.status_code == 429
+        await _wait_for_batch(api, first.batch_id)
+        with pytest.raises(HTTPException) as error:
+            await api.get_intent_batch_status("unknown", "t1")
+        assert error.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_is_shared_by_batches(self):
+        handler = _Handler()
+        api, _, _ = _runtime(handler, max_concurrency=2)
+
+        first, second = await asyncio.gather(
+            api.submit_intent_batch(_request(*_parse_items(4, "a"))),
+            api.submit_intent_batch(_request(*_parse_items(4, "b")))
+        )
+        await _wait_for_batch(api, first.batch_id)
+        await _wait_for_batch(api, second.batch_id)
+
+        assert len(handler.contexts) == 8
+        assert handler.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_app_shutdown_cancels_running_batches(self):
+        handler = _Handler(delay=10)
+        api, _, state_surface = _runtime(handler)
+        app = create_runtime_app(
+            api.execution_lifecycle_manager, state_surface, batch_executor=api.batch_executor
+        )
+
+        async with app.router.lifespan_context(app):
+            await api.submit_intent_batch(_request(*_parse_items(2)))
+            await asyncio.sleep(0.01)
+            assert handler.running == 2
+
+        assert handler.running == 0 and not api.batch_executor._running
@@ -0,0 +1,142 @@
+"""
+Test intent idempotency and single-flight coalescing.
+
+Verifies that repeated submissions (same client key, or same inputs for deterministic
+intent types) return the first execution's result without re-running the handler, that
+identical intents in flight share one execution, that failures are not replayed, and
+that a client key reused for a different intent is rejected.
+"""
+
+import asyncio
+
+import pytest
+
+from symphainy_platform.runtime.execution_lifecycle_manager import ExecutionLifecycleManager, IdempotencyConflictError
+from symphainy_platform.runtime.intent_model import IntentFactory
+from symphainy_platform.runtime.intent_registry import IntentRegistry
+from symphainy_platform.runtime.state_surface import StateSurface
+from symphainy_platform.runtime.wal import WriteAheadLog
+
+
+class _Handler:
+    def __init__(self, delay=0.0, fail_times=0):
+        self.delay = delay
+        self.fail_times = fail_times
+        self.calls = 0
+
+    async def __call__(self, intent, context):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.calls <= self.fail_times:
+            raise RuntimeError("upstream timeout")
+        return {"artifacts": {}, "events": []}
+
+
+def _manager(handler, **kwargs):
+    registry = IntentRegistry()
+    for intent_type in ("parse_content", "send_message"):
+        registry.register_intent(intent_type, f"{intent_type}_service", handler_function=handler)
+    return ExecutionLifecycleManager(registry, StateSurface(use_memory=True), WriteAheadLog(use_memory=True), **kwargs)
+
+
+def _intent(intent_type="parse_content", tenant_id="t1", idempotency_key=None, **parameters):
+    return IntentFactory.create_intent(
+        intent_type=intent_type, tenant_id=tenant_id, session_id="s1", solution_id="sol",
+        parameters=parameters or {"file_id": "f1"}, idempotency_key=idempotency_key
+    )
+
+
+class TestIdempotency:
+    """Stored results are replayed for repeated keys."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_deterministic_intent_replays_result(self):
+        handler = _Handler()
+        manager = _manager(handler)
+
+        first = await manager.execute(_intent())
+        repeat = await manager.execute(_intent())
+        other_file = await manager.execute(_intent(file_id="f2"))
+        other_tenant = await manager.execute(_intent(tenant_id="t2"))
+
+        assert handler.calls == 3
+        assert repeat.execution_id == first.execution_id and repeat.metadata["idempotent_replay"]
+        assert other_file.execution_id != first.execution_id
+        assert other_tenant.execution_id != first.execution_id
+        assert manager.get_idempotency_stats()["replayed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_client_key_applies_to_any_intent_type(self):
+        handler = _Handler()
+        manager = _manager(handler)
+
+        await manager.execute(_intent("send_message", text="hi"))
+        await manager.execute(_intent("send_message", text="hi"))
+        assert handler.calls == 2  # not deterministic: no derived key
+
+        first = await manager.execute(_intent("send_message", idempotency_key="req-1", text="hi"))
+        retry = await manager.execute(_intent("send_message", idempotency_key="req-1", text="hi"))
+        assert handler.calls == 3 and retry.execution_id == first.execution_id
+
+    @pytest.mark.asyncio
+    async def test_reused_client_key_for_other_intent_conflicts(self):
+        handler = _Handler(delay=0.02)
+        manager = _manager(handler)
+
+        running = asyncio.ensure_future(manager.execute(_intent("send_message", idempotency_key="req-1", text="hi")))
+        await asyncio.sleep(0)
+        with pytest.raises(IdempotencyConflictError):
+            await manager.execute(_intent("send_message", idempotency_key="req-1", text="bye"))
+        await running
+
+        with pytest.raises(IdempotencyConflictError) as conflict:
+            await manager.execute(_intent("parse_content", idempotency_key="req-1", file_id="f1"))
+        assert conflict.value.original_intent_type == "send_message"
+        assert handler.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_replayed_and_opt_out(self):
+        handler = _Handler(fail_times=1)
+        manager = _manager(handler)
+
+        assert not (await manager.execute(_intent())).success
+        assert (await manager.execute(_intent())).success
+        assert handler.calls == 2
+
+        forced = _intent()
+        forced.metadata["skip_idempotency"] = True
+        await manager.execute(forced)
+        assert handler.calls == 3
+
+        disabled = _manager(_Handler(), idempotency_ttl_seconds=None)
+        assert disabled.idempotency_key(_intent(idempotency_key="k")) is None
+
+
+class TestSingleFlight:
+    """Identical intents in flight share one execution."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_coalesce(self):
+        handler = _Handler(delay=0.02)
+        manager = _manager(handler)
+
+        results = await asyncio.gather(*(manager.execute(_intent()) for _ in range(5)))
+
+        assert handler.calls == 1
+        assert len({result.execution_id for result in results}) == 1
+        stats = manager.get_idempotency_stats()
+        assert (stats["executed"], stats["coalesced"], stats["in_flight"]) == (1, 4, 0)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_over(self):
+        handler = _Handler(delay=0.05)
+        manager = _manager(handler)
+
+        leader = asyncio.ensure_future(manager.execute(_intent()))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(manager.execute(_intent()))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        result = await follower
+        assert result.success and handler.calls == 2
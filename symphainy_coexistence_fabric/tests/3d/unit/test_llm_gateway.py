@@ -0,0 +1,227 @@
+"""
+Test LLMGateway (admission control in front of the LLM adapter).
+
+Verifies rate-limit header parsing, priority lanes, per-tenant isolation, queue
+deadlines, 429 backoff with retry, budget resync from provider headers, and that
+agents charge their tenant and lane.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from symphainy_platform.foundations.public_works.llm_gateway import (
+    LLMGateway,
+    LLMQueueTimeout,
+    ProviderRateLimitError,
+    estimate_request_tokens,
+    parse_rate_limit_headers,
+)
+from symphainy_platform.civic_systems.agentic.agent_base import AgentBase
+
+
+def _request(text="hello", max_tokens=100):
+    return {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": text}], "max_tokens": max_tokens}
+
+
+def _response(total_tokens=50, rate_limit=None):
+    response = {"choices": [{"message": {"role": "assistant", "content": "ok"}}],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 40, "total_tokens": total_tokens}}
+    if rate_limit is not None:
+        response["rate_limit"] = rate_limit
+    return response
+
+
+class _Adapter:
+    """Records call order; calls block until released when gated."""
+
+    def __init__(self, gated=False, failures=()):
+        self.calls = []
+        self.gate = asyncio.Event()
+        if not gated:
+            self.gate.set()
+        self.failures = list(failures)
+
+    async def generate_completion(self, request):
+        self.calls.append(request["messages"][0]["content"])
+        await self.gate.wait()
+        if self.failures:
+            raise self.failures.pop(0)
+        return _response()
+
+    async def generate_embeddings(self, text, model="m"):
+        return [1.0]
+
+
+class TestParsing:
+    """Provider header and token estimation helpers."""
+
+    def test_rate_limit_headers(self):
+        limits = parse_rate_limit_headers({
+            "X-RateLimit-Remaining-Requests": "59",
+            "x-ratelimit-remaining-tokens": "149984",
+            "x-ratelimit-reset-requests": "1s",
+            "x-ratelimit-reset-tokens": "6m0s",
+            "retry-after-ms": "250",
+        })
+        assert limits == {
+            "remaining_requests": 59, "remaining_tokens": 149984,
+            "reset_requests_seconds": 1.0, "reset_tokens_seconds": 360.0, "retry_after_seconds": 0.25,
+        }
+        assert parse_rate_limit_headers(None) == {}
+
+    def test_estimate_tokens(self):
+        assert estimate_request_tokens(_request("x" * 400, max_tokens=100)) == 200
+
+
+class TestLLMGateway:
+    """Admission, lanes, deadlines and adaptive backoff."""
+
+    @pytest.mark.asyncio
+    async def test_interactive_lane_served_before_batch(self):
+        adapter = _Adapter(gated=True)
+        gateway = LLMGateway(adapter, max_in_flight=1)
+
+        first = asyncio.create_task(gateway.generate_completion(_request("first"), "t1", "batch"))
+        await asyncio.sleep(0.01)
+        batch = asyncio.create_task(gateway.generate_completion(_request("batch"), "t2", "batch"))
+        chat = asyncio.create_task(gateway.generate_completion(_request("chat"), "t3", "interactive"))
+        await asyncio.sleep(0.01)
+        assert gateway.get_stats()["queued"] == {"interactive": 1, "batch": 1}
+
+        adapter.gate.set()
+        await asyncio.gather(first, batch, chat)
+        assert adapter.calls == ["first", "chat", "batch"]
+
+    @pytest.mark.asyncio
+    async def test_busy_tenant_does_not_block_others(self):
+        adapter = _Adapter(gated=True)
+        gateway = LLMGateway(adapter, max_in_flight=4, tenant_max_in_flight=1)
+
+        busy = [asyncio.create_task(gateway.generate_completion(_request(f"a{i}"), "a")) for i in range(2)]
+        other = asyncio.create_task(gateway.generate_completion(_request("b0"), "b"))
+        await asyncio.sleep(0.01)
+
+        assert adapter.calls == ["a0", "b0"]
+        adapter.gate.set()
+        await asyncio.gather(*busy, other)
+        assert adapter.calls[-1] == "a1"
+
+    @pytest.mark.asyncio
+    async def test_queue_deadline_expires(self):
+        adapter = _Adapter(gated=True)
+        gateway = LLMGateway(adapter, max_in_flight=1)
+        running = asyncio.create_task(gateway.generate_completion(_request(), "t1"))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(LLMQueueTimeout):
+            await gateway.generate_completion(_request(), "t1", "batch", deadline_seconds=0.05)
+        assert gateway.get_stats()["deadline_expired"] == 1
+
+        adapter.gate.set()
+        await running
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_backs_off_and_retries(self):
+        adapter = _Adapter(failures=[ProviderRateLimitError("429", retry_after=0.05)])
+        gateway = LLMGateway(adapter)
+
+        started = time.perf_counter()
+        response = await gateway.generate_completion(_request(), "t1")
+
+        assert time.perf_counter() - started >= 0.045
+        assert response["choices"][0]["message"]["content"] == "ok"
+        stats = gateway.get_stats()
+        assert (stats["rate_limited"], stats["retries"], stats["completed"]) == (1, 1, 1)
+        assert stats["rate_scale"] == pytest.approx(0.55)  # halved, then +0.05 on success
+
+    @pytest.mark.asyncio
+    async def test_retries_are_bounded(self):
+        adapter = _Adapter(failures=[ProviderRateLimitError("429", retry_after=0.0) for _ in range(3)])
+        gateway = LLMGateway(adapter, max_retries=2)
+        with pytest.raises(ProviderRateLimitError):
+            await gateway.generate_completion(_request(), "t1")
+        assert len(adapter.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_provider_headers_resync_budget(self):
+        class _Limited(_Adapter):
+            async def generate_completion(self, request):
+                self.calls.append(request)
+                return _response(rate_limit={"remaining_tokens": 100, "remaining_requests": 5})
+
+        gateway = LLMGateway(_Limited(), tokens_per_minute=60_000)
+        response = await gateway.generate_completion(_request(), "t1")
+
+        assert "rate_limit" not in response
+        assert gateway._tokens.level <= 101 and gateway._requests.level <= 5.1
+        assert await gateway.generate_embeddings("x") == [1.0]  # other adapter methods pass through
+
+    @pytest.mark.asyncio
+    async def test_unknown_priority_rejected(self):
+        with pytest.raises(ValueError):
+            await LLMGateway(_Adapter()).generate_completion(_request(), "t1", "urgent")
+
+    @pytest.mark.asyncio
+    async def test_openai_completions_leave_429_retries_to_gateway(self, monkeypatch):
+        from symphainy_platform.foundations.public_works.adapters import openai_adapter
+
+        class _RateLimited(Exception):
+            status_code = 429
+            response = SimpleNamespace(headers={"retry-after": "0"})
+
+        class _Completions:
+            def __init__(self, client):
+                self.with_raw_response = self
+                self.client = client
+
+            async def create(self, **request):
+                self.client.calls += 1
+                raise _RateLimited("429")
+
+        class _FakeAsyncOpenAI:
+            def __init__(self, max_retries=2, **kwargs):
+                self.max_retries = max_retries
+                self.calls = 0
+                self.chat = SimpleNamespace(completions=_Completions(self))
+
+            def with_options(self, max_retries):
+                return _FakeAsyncOpenAI(max_retries=max_retries)
+
+        monkeypatch.setattr(openai_adapter, "AsyncOpenAI", _FakeAsyncOpenAI)
+        adapter = openai_adapter.OpenAIAdapter(api_key="k")
+        assert adapter._completion_client.max_retries == 0
+
+        gateway = LLMGateway(adapter, max_retries=1)
+        with pytest.raises(ProviderRateLimitError):
+            await gateway.generate_completion(_request(), "t1")
+        assert adapter._completion_client.calls == 2
+        assert gateway.get_stats()["rate_limited"] == 2
+
+
+class _Agent(AgentBase):
+    llm_priority = "interactive"
+
+
+class TestAgentLLMGovernance:
+    """AgentBase._call_llm goes through the gateway with tenant and lane."""
+
+    @pytest.mark.asyncio
+    async def test_agent_charges_tenant_and_lane(self):
+        gateway = LLMGateway(_Adapter())
+        seen = {}
+        original = gateway.generate_completion
+
+        async def spy(request, tenant_id=None, priority="interactive", deadline_seconds=None):
+            seen.update(tenant_id=tenant_id, priority=priority)
+            return await original(request, tenant_id, priority, deadline_seconds)
+
+        gateway.generate_completion = spy
+        agent = _Agent(agent_id="a", public_works=SimpleNamespace(get_llm_adapter=lambda: gateway))
+
+        content = await agent._call_llm("hi", "sys", context=SimpleNamespace(tenant_id="t9"))
+
+        assert content == "ok"
+        assert seen == {"tenant_id": "t9", "priority": "interactive"}
@@ -0,0 +1,188 @@
+"""
+Test LLMResponseCache (reuse of deterministic completion responses).
+
+Verifies canonical request hashing, tenant scoping, TTL expiry, the temperature
+threshold, the shared tier (whose hits keep the writer's expiry), hit-rate metrics, and that opted-in agents skip the
+provider on a hit and honour the bypass flag.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from symphainy_platform.foundations.public_works.llm_response_cache import (
+    LLMResponseCache,
+    canonical_request_hash,
+)
+from symphainy_platform.civic_systems.agentic.agent_base import AgentBase
+
+
+def _request(text="hello", temperature=0.2):
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "user", "content": text}],
+        "max_tokens": 100,
+        "temperature": temperature,
+    }
+
+
+def _response(content="ok"):
+    return {"choices": [{"message": {"role": "assistant", "content": content}}]}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Redis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.store[key] = value
+        return True
+
+
+class TestLLMResponseCache:
+    """Keys, expiry, cacheability and the shared tier."""
+
+    def test_hash_is_canonical(self):
+        reordered = dict(reversed(list(_request().items())))
+        assert canonical_request_hash(reordered) == canonical_request_hash(_request())
+        assert canonical_request_hash(_request("other")) != canonical_request_hash(_request())
+
+    def test_only_low_temperature_single_choice_requests_cacheable(self):
+        cache = LLMResponseCache(max_temperature=0.3)
+        assert cache.is_cacheable(_request(temperature=0.3))
+        assert not cache.is_cacheable(_request(temperature=0.7))
+        assert not cache.is_cacheable({**_request(), "stream": True})
+        assert not cache.is_cacheable({**_request(), "n": 3})
+
+    @pytest.mark.asyncio
+    async def test_tenant_scoping_and_ttl(self):
+        clock = _Clock()
+        cache = LLMResponseCache(clock=clock)
+        key = cache.key(_request(), "t1", scope="sop")
+        await cache.put(key, _response(), ttl_seconds=60)
+
+        assert (await cache.get(key)) == _response()
+        assert await cache.get(cache.key(_request(), "t2", scope="sop")) is None
+
+        clock.now += 61
+        assert await cache.get(key) is None
+        assert cache.get_stats()["local_entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_serves_other_processes(self):
+        redis = _Redis()
+        writer, reader = LLMResponseCache(redis_adapter=redis), LLMResponseCache(redis_adapter=redis)
+        key = writer.key(_request(), "t1", scope="guide")
+        await writer.put(key, _response("shared"))
+
+        assert (await reader.get(key))["choices"][0]["message"]["content"] == "shared"
+        assert (await reader.get(key)) is not None
+        stats = reader.get_stats()
+        assert (stats["shared_hits"], stats["local_hits"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_shared_hit_keeps_the_writers_expiry(self):
+        clock, redis = _Clock(), _Redis()
+        writer = LLMResponseCache(redis_adapter=redis, clock=clock)
+        reader = LLMResponseCache(redis_adapter=redis, default_ttl_seconds=3600, clock=clock)
+        key = writer.key(_request(), "t1", scope="guide")
+        await writer.put(key, _response(), ttl_seconds=60)
+
+        clock.now += 50
+        assert await reader.get(key) == _response()
+        clock.now += 11
+        assert await reader.get(key) is None  # the local copy expires with the shared entry
+
+    @pytest.mark.asyncio
+    async def test_hit_rate_per_scope(self):
+        cache = LLMResponseCache()
+        key = cache.key(_request(), "t1", scope="sop")
+        await cache.get(key)
+        await cache.put(key, _response())
+        await cache.get(key)
+        await cache.get(key)
+        cache.record_bypass("sop")
+
+        stats = cache.get_stats()
+        assert stats["hit_rate"] == pytest.approx(2 / 3, abs=1e-4)
+        assert stats["scopes"]["sop"]["bypassed"] == 1 and stats["stores"] == 1
+
+
+class _Adapter:
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_completion(self, request):
+        self.calls += 1
+        return {**_response(f"answer {self.calls}"), "usage": {"total_tokens": 10}}
+
+
+class _CachingAgent(AgentBase):
+    llm_cache_ttl_seconds = 300
+
+
+class TestAgentResponseCaching:
+    """AgentBase._call_llm reuses responses for opted-in agents."""
+
+    def _agent(self, agent_class, adapter, cache):
+        public_works = SimpleNamespace(get_llm_adapter=lambda: adapter, get_llm_response_cache=lambda: cache)
+        return agent_class(agent_id="a", public_works=public_works)
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_provider_and_bypass_refreshes(self):
+        adapter, cache = _Adapter(), LLMResponseCache()
+        agent = self._agent(_CachingAgent, adapter, cache)
+        context = SimpleNamespace(tenant_id="t1")
+
+        assert await agent._call_llm("hi", "sys", context=context) == "answer 1"
+        assert await agent._call_llm("hi", "sys", context=context) == "answer 1"
+        assert adapter.calls == 1
+
+        assert await agent._call_llm("hi", "sys", metadata={"cache_bypass": True}, context=context) == "answer 2"
+        assert await agent._call_llm("hi", "sys", context=context) == "answer 2"
+        assert await agent._call_llm("hi", "sys", context=SimpleNamespace(tenant_id="t2")) == "answer 3"
+        assert await agent._call_llm("hi", "sys", temperature=0.9, context=context) == "answer 4"
+        assert adapter.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_hit_is_recorded_in_telemetry_without_token_cost(self):
+        executions = []
+
+        class _Telemetry:
+            async def record_agent_execution(self, **kwargs):
+                executions.append(kwargs)
+                return True
+
+        adapter, cache = _Adapter(), LLMResponseCache()
+        agent = self._agent(_CachingAgent, adapter, cache)
+        agent.telemetry_service = _Telemetry()
+        context = SimpleNamespace(tenant_id="t1")
+
+        await agent._call_llm("hi", "sys", context=context)
+        await agent._call_llm("hi", "sys", context=context)
+
+        assert adapter.calls == 1 and len(executions) == 2
+        miss, hit = executions
+        assert not miss.get("cached") and miss["tokens"]["total_tokens"] == 10
+        assert hit["cached"] is True and hit["success"] is True and hit["response"] == "answer 1"
+        assert hit["tokens"]["total_tokens"] == 0 and hit["cost"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_agents_without_opt_in_never_cache(self):
+        adapter, cache = _Adapter(), LLMResponseCache()
+        agent = self._agent(AgentBase, adapter, cache)
+
+        await agent._call_llm("hi", "sys")
+        await agent._call_llm("hi", "sys")
+        assert adapter.calls == 2 and cache.get_stats()["stores"] == 0
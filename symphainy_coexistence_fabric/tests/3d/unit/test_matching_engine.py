@@ -0,0 +1,155 @@
+"""
+Test the vectorized matching engine and the matching services built on it.
+
+Verifies the similarity matrix (cosine with Jaccard fallback), optimal and greedy
+one-to-one assignment, and that SchemaMatchingService / SemanticMatchingService
+produce the expected matches through the indexed / matrix paths.
+"""
+
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from symphainy_platform.foundations.libraries.matching.matching_engine import (
+    assign,
+    column_similarity_matrix,
+    paired_similarity,
+)
+from symphainy_platform.foundations.libraries.matching.schema_matching_service import SchemaMatchingService
+from symphainy_platform.foundations.libraries.matching.semantic_matching_service import SemanticMatchingService
+
+
+class TestMatchingEngine:
+    """Similarity matrix and assignment."""
+
+    def test_cosine_with_text_fallback(self):
+        source = [{"meaning_embedding": [1.0, 0.0]}, {"semantic_meaning": "customer id"}]
+        target = [{"meaning_embedding": [1.0, 1.0]}, {"semantic_meaning": "id of customer"}]
+
+        scores = column_similarity_matrix(source, target)
+
+        assert scores[0, 0] == pytest.approx(2 ** -0.5)
+        assert scores[1, 1] == pytest.approx(2 / 3)
+        assert paired_similarity(source, target).tolist() == pytest.approx([2 ** -0.5, 2 / 3])
+
+    def test_optimal_beats_greedy_on_total_score(self):
+        scores = np.array([[0.9, 0.8], [0.85, 0.1]])
+
+        assert [(r, c) for r, c, _ in assign(scores, 0.0, "greedy")] == [(0, 0), (1, 1)]
+        assert [(r, c) for r, c, _ in assign(scores, 0.0, "optimal")] == [(0, 1), (1, 0)]
+
+    def test_optimal_matches_brute_force(self):
+        rng = np.random.default_rng(3)
+        for _ in range(50):
+            rows, cols = (int(n) for n in rng.integers(1, 6, 2))
+            scores = rng.random((rows, cols))
+            total = sum(score for _, _, score in assign(scores, -1.0))
+            small = scores if rows <= cols else scores.T
+            best = max(
+                sum(small[i, j] for i, j in enumerate(perm))
+                for perm in itertools.permutations(range(small.shape[1]), small.shape[0])
+            )
+            assert total == pytest.approx(best)
+
+    def test_threshold_and_one_to_one(self):
+        scores = np.array([[0.95, 0.2], [0.9, 0.3], [0.1, 0.65]])
+        matches = assign(scores, 0.6)
+        assert [(r, c) for r, c, _ in matches] == [(0, 0), (2, 1)]
+
+    def test_wide_schema_is_fast(self):
+        import time
+
+        rng = np.random.default_rng(0)
+        base = rng.normal(size=(300, 64))
+        source = [{"meaning_embedding": v.tolist()} for v in base]
+        target = [{"meaning_embedding": v.tolist()} for v in base[::-1] + 0.1 * rng.normal(size=(300, 64))]
+
+        started = time.perf_counter()
+        matches = assign(column_similarity_matrix(source, target), 0.6)
+        assert time.perf_counter() - started < 2.0
+        assert all(c == 299 - r for r, c, _ in matches) and len(matches) == 300
+
+
+class TestSchemaMatchingService:
+    """Indexed target lookups preserve Phase 1 semantics."""
+
+    @pytest.mark.asyncio
+    async def test_exact_name_and_type_matches(self):
+        fingerprints = {
+            "src": {"columns": [
+                {"name": "id", "type": "int", "position": 0},
+                {"name": "Email", "type": "str", "position": 1},
+                {"name": "amount", "type": "float", "position": 2},
+                {"name": "flag", "type": "bool", "position": 3},
+            ]},
+            "tgt": {"columns": [
+                {"name": "id", "type": "int", "position": 0},
+                {"name": "email", "type": "text", "position": 5},
+                {"name": "total", "type": "float", "position": 2},
+            ]},
+        }
+
+        async def get_deterministic_embedding(embedding_id, tenant_id):
+            return {"schema_fingerprint": fingerprints[embedding_id]}
+
+        service = SchemaMatchingService()
+        service.deterministic_compute = SimpleNamespace(get_deterministic_embedding=get_deterministic_embedding)
+        result = await service.match_schemas("src", "tgt", SimpleNamespace(tenant_id="t1"))
+
+        assert [m["source_column"] for m in result["exact_matches"]] == ["id"]
+        assert result["similarity_scores"]["Email"] == {"target_column": "email", "score": 0.6, "match_type": "similarity"}
+        assert result["similarity_scores"]["amount"]["target_column"] == "total"
+        assert result["unmapped_source"] == ["flag"]
+
+
+class TestSemanticMatchingService:
+    """Unmapped columns are assigned one-to-one from one similarity matrix."""
+
+    @pytest.mark.asyncio
+    async def test_one_to_one_semantic_matches(self):
+        source = [
+            {"column_name": "cust_no", "meaning_embedding": [1.0, 0.0, 0.1]},
+            {"column_name": "client_number", "meaning_embedding": [0.95, 0.05, 0.0]},
+            {"column_name": "id", "meaning_embedding": [0.0, 0.0, 1.0]},
+        ]
+        target = [
+            {"column_name": "customer_id", "meaning_embedding": [1.0, 0.0, 0.0]},
+            {"column_name": "client_ref", "meaning_embedding": [0.9, 0.2, 0.0]},
+            {"column_name": "id", "meaning_embedding": [0.0, 0.1, 1.0]},
+        ]
+        chunks = {"s": [SimpleNamespace(chunk_id="s-chunk")], "t": [SimpleNamespace(chunk_id="t-chunk")]}
+
+        async def get_parsed_file(parsed_file_id, tenant_id, context):
+            return {"parsed_content": {}, "file_id": parsed_file_id}
+
+        async def create_chunks(parsed_content, file_id, tenant_id, parsed_file_id):
+            return chunks[parsed_file_id]
+
+        async def get_semantic_embeddings(filter_conditions, limit):
+            return source if filter_conditions["chunk_id"]["$in"] == ["s-chunk"] else target
+
+        service = SemanticMatchingService()
+        service.semantic_data = SimpleNamespace(get_semantic_embeddings=get_semantic_embeddings)
+        service.file_parser_service = SimpleNamespace(get_parsed_file=get_parsed_file)
+        service.deterministic_chunking_service = SimpleNamespace(create_chunks=create_chunks)
+
+        result = await service.match_semantically(
+            "s", "t",
+            {
+                "unmapped_source": ["cust_no", "client_number"],
+                "unmapped_target": ["customer_id", "client_ref"],
+                "exact_matches": [{"source_column": "id", "target_column": "id", "confidence": 0.8}],
+            },
+            SimpleNamespace(tenant_id="t1"),
+        )
+
+        pairs = {(m["source_column"], m["target_column"]) for m in result["semantic_matches"]}
+        assert len(pairs) == 2 and len({target for _, target in pairs}) == 2
+        assert result["enhanced_confidence"] == {"id->id": pytest.approx(0.9)}
+
+    def test_unknown_strategy_rejected(self):
+        with pytest.raises(ValueError):
+            SemanticMatchingService(assignment_strategy="best")
@@ -0,0 +1,37 @@
+"""
+Test ParseContentService parsed-result persistence.
+
+Verifies that a parsed result is never silently dropped when file storage or
+the State Surface is not wired (Platform contract §8A).
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from symphainy_platform.capabilities.content.intent_services.parse_content_service import (
+    ParseContentService,
+)
+
+
+def _ctx(file_storage=None, state_surface=None):
+    platform = SimpleNamespace(get_file_storage_abstraction=lambda: file_storage)
+    return SimpleNamespace(platform=platform, state_surface=state_surface, tenant_id="t1", session_id="s1")
+
+
+class TestStoreParsedResult:
+    """_store_parsed_result fails fast without its storage dependencies."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("file_storage, state_surface", [(None, object()), (object(), None)])
+    async def test_missing_storage_raises(self, file_storage, state_surface):
+        service = ParseContentService()
+        with pytest.raises(RuntimeError, match="§8A"):
+            await service._store_parsed_result(
+                ctx=_ctx(file_storage, state_surface),
+                parsed_file_id="parsed_f1",
+                file_id="f1",
+                parsed_file_reference="parsed:t1:s1:parsed_f1",
+                parsing_type="csv",
+                parsed_result={"parsed_content": []},
+            )
@@ -0,0 +1,170 @@
+"""
+Test page-parallel PDF extraction.
+
+Verifies that pages are extracted off the event loop (process pool for large documents,
+one worker thread for small ones), streamed back as they complete, assembled in page
+order, and cached by document hash and page index; that a pool broken by a dead worker is
+replaced on the next parse, and that a worker closes its open document once idle.
+
+The page counter / extractor are stand-ins for pdfplumber: a "document" is form-feed
+separated page texts, and every third page carries one table.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from symphainy_platform.foundations.public_works.adapters import pdf_adapter
+from symphainy_platform.foundations.public_works.adapters.pdf_adapter import PdfProcessingAdapter
+
+
+def _count_pages(path):
+    with open(path, "rb") as handle:
+        return len(handle.read().split(b"\f"))
+
+
+def _extract_pages(path, page_numbers):
+    with open(path, "rb") as handle:
+        texts = handle.read().decode().split("\f")
+    return [
+        {
+            "page": number,
+            "text": texts[number - 1],
+            "tables": [{"page": number, "table_index": 0, "headers": ["a"], "rows": [["1"]]}] if number % 3 == 0 else []
+        }
+        for number in page_numbers
+    ]
+
+
+def _crashing_extract_pages(path, page_numbers):
+    with open(path, "rb") as handle:
+        if b"crash" in handle.read():
+            os._exit(1)  # the worker dies, as when it is killed for memory
+    return _extract_pages(path, page_numbers)
+
+
+def _slow_extract_pages(path, page_numbers):
+    time.sleep(0.2)
+    return _extract_pages(path, page_numbers)
+
+
+def _document(pages, tag="doc"):
+    return "\f".join(f"{tag} page {i}" for i in range(1, pages + 1)).encode()
+
+
+def _adapter(**kwargs):
+    kwargs.setdefault("page_extractor", _extract_pages)
+    adapter = PdfProcessingAdapter(page_counter=_count_pages, **kwargs)
+    adapter.pdfplumber_available = True  # the stand-in extractor replaces pdfplumber
+    return adapter
+
+
+class TestPageParallelExtraction:
+    """Pages fan out to the pool and come back in page order."""
+
+    @pytest.mark.asyncio
+    async def test_large_document_uses_process_pool_and_keeps_page_order(self):
+        adapter = _adapter(max_workers=2, pages_per_task=3, parallel_min_pages=4)
+        try:
+            result = await adapter.parse_file(_document(10), "big.pdf")
+        finally:
+            adapter.shutdown()
+
+        assert result["success"]
+        assert result["text"].startswith("--- Page 1 ---\ndoc page 1\n\n--- Page 2 ---")
+        assert result["text"].index("doc page 9") < result["text"].index("doc page 10")
+        assert [table["page"] for table in result["tables"]] == [3, 6, 9]
+        assert (result["metadata"]["page_count"], result["metadata"]["table_count"]) == (10, 3)
+        stats = adapter.get_stats()
+        assert (stats["pool_tasks"], stats["pages_extracted"]) == (4, 10)
+
+    @pytest.mark.asyncio
+    async def test_pages_cached_by_document_hash_and_index(self):
+        adapter = _adapter(max_workers=0, page_cache_entries=6)
+
+        first = await adapter.parse_file(_document(5), "a.pdf")
+        again = await adapter.parse_file(_document(5), "a-copy.pdf")
+        other = await adapter.parse_file(_document(5, tag="other"), "b.pdf")
+
+        assert again["text"] == first["text"] and again["metadata"]["cached_pages"] == 5
+        assert other["metadata"]["cached_pages"] == 0 and "other page 1" in other["text"]
+        stats = adapter.get_stats()
+        assert (stats["pages_extracted"], stats["page_cache_hits"], stats["page_cache_entries"]) == (10, 5, 6)
+        assert stats["pool_tasks"] == 0
+
+    @pytest.mark.asyncio
+    async def test_extraction_does_not_block_event_loop(self):
+        adapter = _adapter(max_workers=0, page_extractor=_slow_extract_pages)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.ensure_future(ticker())
+        streamed = [page["page"] async for page in adapter.iter_pages(_document(3), "slow.pdf")]
+        task.cancel()
+
+        assert sorted(streamed) == [1, 2, 3]
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_consumer_can_stop_early(self):
+        adapter = _adapter(max_workers=2, pages_per_task=2, parallel_min_pages=1)
+        try:
+            pages = adapter.iter_pages(_document(8), "partial.pdf")
+            first = await pages.__anext__()
+            await pages.aclose()
+        finally:
+            adapter.shutdown()
+
+        assert first["page_count"] == 8 and not first["cached"]
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_is_replaced_on_next_parse(self):
+        adapter = _adapter(max_workers=2, pages_per_task=2, parallel_min_pages=1, page_extractor=_crashing_extract_pages)
+        try:
+            crashed = await adapter.parse_file(_document(4, tag="crash"), "hostile.pdf")
+            recovered = await adapter.parse_file(_document(4), "next.pdf")
+        finally:
+            adapter.shutdown()
+
+        assert not crashed["success"] and "page" not in crashed["text"]
+        assert recovered["success"] and recovered["metadata"]["page_count"] == 4
+
+
+class _FakePdf:
+    opened = []
+
+    def __init__(self, path):
+        self.closed = False
+        self.pages = [SimpleNamespace(extract_text=lambda: "text", extract_tables=lambda: [], close=lambda: None)] * 3
+        _FakePdf.opened.append(self)
+
+    def close(self):
+        self.closed = True
+
+
+class TestWorkerDocument:
+    """A worker reuses its open document across page ranges and closes it once idle."""
+
+    def test_document_reused_then_closed_when_idle(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pdfplumber", SimpleNamespace(open=_FakePdf))
+        monkeypatch.setattr(pdf_adapter, "DOCUMENT_IDLE_CLOSE_SECONDS", 0.05)
+        _FakePdf.opened = []
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(b"%PDF")
+
+        pdf_adapter._pdfplumber_extract_pages(str(path), [1, 2])
+        pdf_adapter._pdfplumber_extract_pages(str(path), [3])
+        assert len(_FakePdf.opened) == 1 and not _FakePdf.opened[0].closed
+
+        time.sleep(0.2)
+        assert _FakePdf.opened[0].closed
+        assert not pdf_adapter._worker_documents
@@ -0,0 +1,50 @@
+"""
+Test the worker process pool context.
+
+Verifies that pool workers are never forked and that a checkout inserted at the front of
+sys.path after the platform packages were imported does not shadow them in new workers.
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import utilities
+from utilities import pin_import_roots, worker_process_context
+
+
+def _utilities_file():
+    import utilities as worker_utilities
+    return worker_utilities.__file__
+
+
+@pytest.fixture
+def shadowed_path(tmp_path, monkeypatch):
+    """A stale copy of utilities inserted ahead of the real one, as project_root inserts do."""
+    stale = tmp_path / "utilities"
+    stale.mkdir()
+    (stale / "__init__.py").write_text("STALE = True\n")
+    monkeypatch.setattr(sys, "path", [str(tmp_path)] + list(sys.path))
+    return str(tmp_path)
+
+
+class TestWorkerProcessContext:
+    def test_never_forks(self):
+        assert worker_process_context().get_start_method() in ("forkserver", "spawn")
+
+    def test_loaded_root_moves_ahead_of_shadowing_entry(self, shadowed_path):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(utilities.__file__)))
+
+        pin_import_roots()
+
+        entries = [os.path.abspath(entry or os.curdir) for entry in sys.path]
+        assert entries.index(root) < entries.index(shadowed_path)
+
+    def test_spawned_worker_imports_same_utilities(self, shadowed_path):
+        import multiprocessing
+
+        pin_import_roots()
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            assert pool.submit(_utilities_file).result(timeout=60) == utilities.__file__
@@ -0,0 +1,196 @@
+"""
+Test request rate limiting and admission control.
+
+Verifies the shared token-bucket limiter (tenant / user / intent-type quotas, all-or-none
+consumption, Redis script path and in-process fallback), Traffic Cop session limits,
+admission control on in-flight executions and event-loop lag, and 429 + Retry-After
+on intent submission.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from symphainy_platform.foundations.public_works.rate_limiter import (
+    DistributedRateLimiter,
+    Quota,
+    parse_quota_spec,
+)
+from symphainy_platform.civic_systems.smart_city.primitives.traffic_cop_primitives import (
+    RateLimitStore,
+    TrafficCopPrimitives,
+)
+from symphainy_platform.runtime.admission_control import AdmissionController, AdmissionRejected
+from symphainy_platform.runtime.runtime_api import IntentSubmitRequest, RuntimeAPI
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _ScriptRedis:
+    """Records eval_script calls; returns a canned result (None = Redis unavailable)."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    async def eval_script(self, script, keys, args):
+        self.calls.append((keys, args))
+        return self.result
+
+
+class TestDistributedRateLimiter:
+    """Quota buckets, all-or-none consumption and the shared tier."""
+
+    @pytest.mark.asyncio
+    async def test_quotas_refill_and_report_scope(self):
+        clock = _Clock()
+        limiter = DistributedRateLimiter(
+            tenant_quota=Quota(5, 60),
+            user_quota=Quota(3, 60),
+            intent_quotas={"parse_content": Quota(2, 10)},
+            clock=clock
+        )
+
+        assert (await limiter.check_quotas("t1", "u1", "parse_content")).allowed
+        assert (await limiter.check_quotas("t1", "u1", "parse_content")).allowed
+        denied = await limiter.check_quotas("t1", "u1", "parse_content")
+        assert (denied.allowed, denied.scope, denied.limit) == (False, "intent", 2)
+        assert denied.retry_after == pytest.approx(5.0) and denied.retry_after_header == "5"
+
+        # The denied request took nothing from the tenant or user buckets
+        assert (await limiter.check_quotas("t1", "u1", "ingest_file")).allowed
+        denied = await limiter.check_quotas("t1", "u1", "ingest_file")
+        assert (denied.scope, denied.limit) == ("user", 3)
+        assert (await limiter.check_quotas("t1", "u2")).allowed
+        assert (await limiter.check_quotas("t1", "u3")).allowed
+        assert (await limiter.check_quotas("t1", "u3")).scope == "tenant"
+        assert (await limiter.check_quotas("t2", "u1")).allowed
+
+        clock.now = 12.0  # refills one tenant token (5/min) and the intent bucket (2/10s)
+        assert (await limiter.check_quotas("t1", "u2", "parse_content")).allowed
+        assert limiter.get_stats()["denied"] == 3
+
+    @pytest.mark.asyncio
+    async def test_shared_buckets_use_one_script_call(self):
+        redis = _ScriptRedis([0, "2.5", "0", 2])
+        limiter = DistributedRateLimiter(redis_adapter=redis, tenant_quota=Quota(600), user_quota=Quota(120))
+
+        decision = await limiter.check_quotas("t1", "u1", "parse_content")
+
+        keys, args = redis.calls[0]
+        assert keys == ["ratelimit:v1:tenant:t1", "ratelimit:v1:user:t1:u1"]
+        assert args == [1, 600, 10.0, 120, 2.0]
+        assert (decision.allowed, decision.scope, decision.retry_after_header) == (False, "user", "3")
+        assert limiter.get_stats()["local_checks"] == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_outage_falls_back_to_local_buckets(self):
+        limiter = DistributedRateLimiter(redis_adapter=_ScriptRedis(None), clock=_Clock())
+
+        results = [(await limiter.check("login:1.2.3.4", 2, 60)).allowed for _ in range(3)]
+
+        assert results == [True, True, False]
+        assert limiter.get_stats()["local_checks"] == 3
+
+    def test_parse_quota_spec(self):
+        quotas = parse_quota_spec("parse_content=60, embed_content=20/30,bad=x,zero=0")
+        assert quotas == {"parse_content": Quota(60, 60.0), "embed_content": Quota(20, 30.0)}
+
+
+class TestTrafficCop:
+    """Session creation is actually limited now."""
+
+    @pytest.mark.asyncio
+    async def test_session_creation_rate_limited(self):
+        store = RateLimitStore()
+        contract = {"action": "create_session", "session_id": "s1", "tenant_id": "t1", "user_id": "u1"}
+
+        results = [await TrafficCopPrimitives.validate_session_creation(contract, store) for _ in range(101)]
+
+        assert all(results[:100]) and not results[100]
+        assert await TrafficCopPrimitives.validate_session_creation({**contract, "user_id": "u2"}, store)
+
+
+class TestAdmissionControl:
+    """In-flight bounds and event-loop lag shedding."""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_limits(self):
+        controller = AdmissionController(max_in_flight=3, tenant_max_in_flight=2, max_loop_lag_ms=None)
+
+        with controller.admit("t1"), controller.admit("t1"):
+            with pytest.raises(AdmissionRejected) as rejected:
+                controller.admit("t1")
+            assert rejected.value.reason == "tenant_in_flight"
+            with controller.admit("t2"):
+                with pytest.raises(AdmissionRejected):
+                    controller.admit("t3")
+        with controller.admit("t1"):
+            assert controller.get_stats()["in_flight"] == 1
+
+    @pytest.mark.asyncio
+    async def test_loop_lag_sheds_load(self):
+        controller = AdmissionController(max_loop_lag_ms=50, lag_sample_interval=0.01)
+        with controller.admit("t1"):
+            pass
+        await asyncio.sleep(0)  # lag monitor is sampling
+
+        time.sleep(0.1)  # a blocking call stalls the loop
+        await asyncio.sleep(0.005)  # the overdue sample runs first
+        with pytest.raises(AdmissionRejected) as rejected:
+            controller.admit("t1")
+        assert rejected.value.reason == "loop_lag"
+
+        await asyncio.sleep(0.05)  # lag recovers once the loop runs freely again
+        with controller.admit("t1"):
+            pass
+        await controller.aclose()
+
+
+class _Lifecycle:
+    async def execute(self, intent):
+        return SimpleNamespace(success=True, execution_id="e1", metadata={"created_at": "now"})
+
+
+class TestIntentSubmission:
+    """Submissions over quota or while overloaded get 429 with Retry-After."""
+
+    def _request(self, intent_type="parse_content"):
+        return IntentSubmitRequest(
+            intent_type=intent_type, tenant_id="t1", session_id="s1", solution_id="sol",
+            metadata={"user_id": "u1"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_quota_exhausted_returns_429(self):
+        limiter = DistributedRateLimiter(intent_quotas={"parse_content": Quota(1, 30)})
+        api = RuntimeAPI(_Lifecycle(), state_surface=None, rate_limiter=limiter)
+
+        assert (await api.submit_intent(self._request())).execution_id == "e1"
+        with pytest.raises(HTTPException) as error:
+            await api.submit_intent(self._request())
+        assert error.value.status_code == 429
+        assert error.value.headers["Retry-After"] == "30"
+        assert error.value.detail["scope"] == "intent"
+        assert (await api.submit_intent(self._request("ingest_file"))).execution_id == "e1"
+
+    @pytest.mark.asyncio
+    async def test_overloaded_runtime_returns_429(self):
+        controller = AdmissionController(max_in_flight=1, max_loop_lag_ms=None, retry_after_seconds=2)
+        api = RuntimeAPI(_Lifecycle(), state_surface=None, admission_controller=controller)
+
+        with controller.admit("t9"):
+            with pytest.raises(HTTPException) as error:
+                await api.submit_intent(self._request())
+        assert error.value.status_code == 429 and error.value.headers["Retry-After"] == "2"
+        assert (await api.submit_intent(self._request())).execution_id == "e1"
+        assert controller.in_flight == 0
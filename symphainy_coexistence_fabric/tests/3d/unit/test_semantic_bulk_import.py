@@ -0,0 +1,193 @@
+"""
+Test bulk import for semantic embeddings and semantic graphs.
+
+Verifies that ArangoAdapter.import_documents batches through the import endpoint,
+honours on_duplicate, and reports failures per batch and per key (a connection error
+fails its whole batch), that SemanticDataAbstraction stores embeddings and graphs
+through it, and that column embeddings report the columns that were not stored.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("arango")
+
+from symphainy_platform.foundations.public_works.adapters.arango_adapter import ArangoAdapter, ArangoError
+from symphainy_platform.foundations.public_works.abstractions.semantic_data_abstraction import (
+    SemanticDataAbstraction,
+)
+from symphainy_platform.civic_systems.agentic.agents.embedding_agent import EmbeddingService
+from symphainy_platform.foundations.libraries.embeddings.deterministic_embedding_service import (
+    DeterministicEmbeddingService,
+)
+from symphainy_platform.foundations.libraries.parsing.file_parser_service import FileParserService
+
+
+class _FakeCollection:
+    """Minimal python-arango collection: import_bulk with on_duplicate semantics."""
+
+    def __init__(self, fail_batches=(), error=ArangoError):
+        self.documents = {}
+        self.calls = []
+        self.fail_batches = set(fail_batches)
+        self.error = error
+
+    def import_bulk(self, documents, halt_on_error=True, details=True, on_duplicate=None, **kwargs):
+        self.calls.append(len(documents))
+        if len(self.calls) - 1 in self.fail_batches:
+            raise self.error("connection reset")
+        report = {"created": 0, "updated": 0, "ignored": 0, "errors": 0, "details": []}
+        for position, doc in enumerate(documents):
+            key = doc["_key"]
+            if key in self.documents and on_duplicate == "error":
+                report["errors"] += 1
+                report["details"].append(f"at position {position}: unique constraint violated")
+            elif key in self.documents and on_duplicate == "ignore":
+                report["ignored"] += 1
+            else:
+                report["updated" if key in self.documents else "created"] += 1
+                self.documents[key] = doc
+        return report
+
+
+class _FakeDatabase:
+    def __init__(self, **kwargs):
+        self.collections = {}
+        self.kwargs = kwargs
+
+    def collection(self, name):
+        return self.collections.setdefault(name, _FakeCollection(**self.kwargs))
+
+
+def _adapter(**kwargs):
+    adapter = ArangoAdapter(url="http://localhost:8529")
+    adapter._db = _FakeDatabase(**kwargs)
+    return adapter
+
+
+def _embeddings(n):
+    return [{"_key": f"e{i}", "chunk_id": f"c{i}", "embedding": [0.1, 0.2]} for i in range(n)]
+
+
+class TestArangoImportDocuments:
+    """Batched import with upsert-on-key and per-batch error reporting."""
+
+    @pytest.mark.asyncio
+    async def test_batches_and_upserts(self):
+        adapter = _adapter()
+        first = await adapter.import_documents("structured_embeddings", _embeddings(25), batch_size=10)
+        again = await adapter.import_documents("structured_embeddings", _embeddings(5), batch_size=10)
+
+        assert adapter._db.collection("structured_embeddings").calls == [10, 10, 5, 5]
+        assert first["success"] and first["created"] == 25
+        assert [b["size"] for b in first["batches"]] == [10, 10, 5]
+        assert again["updated"] == 5 and again["created"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_does_not_stop_later_batches(self):
+        adapter = _adapter(fail_batches={1})
+        report = await adapter.import_documents("structured_embeddings", _embeddings(25), batch_size=10)
+
+        assert report["success"] is False
+        assert report["created"] == 15
+        assert report["errors"] == 10
+        assert report["failed_keys"] == [f"e{i}" for i in range(10, 20)]
+        assert "connection reset" in report["batches"][1]["error"]
+
+    @pytest.mark.asyncio
+    async def test_connection_error_fails_its_batch(self):
+        adapter = _adapter(fail_batches={0}, error=ConnectionError)
+        report = await adapter.import_documents("structured_embeddings", _embeddings(15), batch_size=10)
+
+        assert (report["success"], report["created"], report["errors"]) == (False, 5, 10)
+        assert report["failed_keys"] == [f"e{i}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_conflicts_reported_by_key(self):
+        adapter = _adapter()
+        await adapter.import_documents("structured_embeddings", _embeddings(3))
+        report = await adapter.import_documents(
+            "structured_embeddings", _embeddings(5), batch_size=2, on_duplicate="error"
+        )
+
+        assert report["failed_keys"] == ["e0", "e1", "e2"]
+        assert report["created"] == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_on_duplicate_rejected(self):
+        with pytest.raises(ValueError):
+            await _adapter().import_documents("structured_embeddings", _embeddings(1), on_duplicate="merge")
+
+
+class TestSemanticDataAbstractionBulk:
+    """Embeddings and graphs are stored through the bulk import path."""
+
+    @pytest.mark.asyncio
+    async def test_store_semantic_embeddings(self):
+        adapter = _adapter()
+        abstraction = SemanticDataAbstraction(adapter, import_batch_size=4)
+        result = await abstraction.store_semantic_embeddings(_embeddings(10))
+
+        assert result["success"] and result["stored_count"] == 10
+        assert len(result["batches"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_embeddings_validated_before_any_write(self):
+        adapter = _adapter()
+        docs = _embeddings(3) + [{"_key": "bad"}]
+        with pytest.raises(ValueError):
+            await SemanticDataAbstraction(adapter).store_semantic_embeddings(docs)
+        assert adapter._db.collection("structured_embeddings").calls == []
+
+    @pytest.mark.asyncio
+    async def test_store_semantic_graph(self):
+        adapter = _adapter()
+        nodes = [{"_key": f"n{i}"} for i in range(3)]
+        edges = [{"_key": "e0", "_from": "semantic_graph_nodes/n0", "_to": "semantic_graph_nodes/n1"}]
+        result = await SemanticDataAbstraction(adapter).store_semantic_graph(nodes, edges)
+
+        assert result["success"]
+        assert result["stored_nodes"] == 3 and result["stored_edges"] == 1
+        assert result["failed_node_keys"] == [] and result["failed_edge_keys"] == []
+
+
+class TestColumnEmbeddingStorage:
+    """Column embeddings report the columns the vector store did not take."""
+
+    @pytest.mark.asyncio
+    async def test_rejected_columns_are_reported(self, monkeypatch):
+        schema = [{"name": name, "type": "string"} for name in ("id", "name", "amount")]
+
+        async def get_deterministic_embedding(self, deterministic_embedding_id, context):
+            return {"schema": schema, "pattern_signature": {}}
+
+        async def get_parsed_file(self, parsed_file_id, tenant_id, context):
+            return {}
+
+        async def create_column_embeddings(column_name, column_type, sample_values, context):
+            vector = [0.1, 0.2]
+            return {"metadata_embedding": vector, "meaning_embedding": vector, "samples_embedding": vector, "semantic_meaning": "x"}
+
+        monkeypatch.setattr(DeterministicEmbeddingService, "get_deterministic_embedding", get_deterministic_embedding)
+        monkeypatch.setattr(FileParserService, "get_parsed_file", get_parsed_file)
+
+        class _RejectingStore:
+            async def store_semantic_embeddings(self, embedding_documents):
+                rejected = [doc["_key"] for doc in embedding_documents if doc["column_name"] == "amount"]
+                return {"success": False, "stored_count": len(embedding_documents) - 1, "failed_keys": rejected}
+
+        service = EmbeddingService()
+        service.vector_store = _RejectingStore()
+        service._sample_representative = lambda parsed_content, n: []
+        service._create_column_embeddings = create_column_embeddings
+        context = SimpleNamespace(tenant_id="t1", session_id="s1")
+
+        result = await service.create_semantic_embeddings("det-1", "p1", context)
+
+        assert (result["status"], result["embeddings_count"]) == ("partial", 2)
+        assert [failure["column_name"] for failure in result["failed_columns"]] == ["amount"]
+
+        service.vector_store = None
+        result = await service.create_semantic_embeddings("det-1", "p1", context)
+        assert (result["status"], result["embeddings_count"], len(result["failed_columns"])) == ("failed", 0, 3)
@@ -0,0 +1,139 @@
+"""
+Test StepGraph (dependency-ordered agent reasoning steps).
+
+Verifies that independent steps run concurrently so wall time follows the critical
+path, input passing, partial-failure handling (fallbacks, skipped dependents), graph
+validation, and that the roadmap agent runs its LLM steps through the graph.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from symphainy_platform.civic_systems.agentic.step_graph import (
+    AgentStep,
+    StepGraph,
+    StepGraphError,
+)
+from symphainy_platform.civic_systems.agentic.agents.roadmap_generation_agent import RoadmapGenerationAgent
+
+
+def _sleeper(value, delay):
+    async def run(**inputs):
+        await asyncio.sleep(delay)
+        return value(**inputs) if callable(value) else value
+    return run
+
+
+async def _fail(**inputs):
+    raise RuntimeError("llm down")
+
+
+class TestStepGraph:
+    """Scheduling, failure handling and validation."""
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_overlap(self):
+        graph = StepGraph([
+            AgentStep("strategy", _sleeper("s", 0.05)),
+            AgentStep("phases", _sleeper(lambda strategy: [strategy, "p"], 0.05), inputs=("strategy",)),
+            AgentStep("milestones", _sleeper("m", 0.05), inputs=("phases",)),
+            AgentStep("risks", _sleeper("r", 0.05), inputs=("phases",)),
+            AgentStep("summary", _sleeper("x", 0.05), inputs=("phases", "strategy")),
+        ])
+
+        started = time.perf_counter()
+        result = await graph.run()
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.2  # critical path is 3 x 0.05s, not 5 x 0.05s
+        assert result.succeeded and result.values["phases"] == ["s", "p"]
+        assert result.critical_path[:2] == ["strategy", "phases"] and len(result.critical_path) == 3
+        assert set(result.timings_ms["risks"]) == {"started", "duration"}
+        assert result.timings_ms["risks"]["started"] >= result.timings_ms["phases"]["started"] + 40
+
+    @pytest.mark.asyncio
+    async def test_failures_fall_back_or_skip_dependents(self):
+        graph = StepGraph([
+            AgentStep("a", _sleeper(1, 0)),
+            AgentStep("b", _fail, inputs=("a",), fallback=lambda error: "default"),
+            AgentStep("c", _fail, inputs=("a",)),
+            AgentStep("d", _sleeper(lambda c: c, 0), inputs=("c",)),
+            AgentStep("e", _sleeper(lambda b: b + "!", 0), inputs=("b",)),
+        ])
+
+        result = await graph.run()
+
+        assert result.status == {"a": "completed", "b": "fallback", "c": "failed", "d": "skipped", "e": "completed"}
+        assert result.values["e"] == "default!" and "d" not in result.values
+        assert result.errors["c"] == "llm down" and "'c'" in result.errors["d"]
+        with pytest.raises(StepGraphError):
+            result.raise_for_failures()
+
+    @pytest.mark.asyncio
+    async def test_seeds_timeouts_and_concurrency_bound(self):
+        running, peak = [0], [0]
+
+        async def tracked(**inputs):
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+            return inputs.get("seed")
+
+        graph = StepGraph(
+            [AgentStep(f"s{i}", tracked, inputs=("seed",)) for i in range(4)]
+            + [AgentStep("slow", _sleeper(1, 1.0), timeout_seconds=0.01)],
+            max_concurrency=2
+        )
+        result = await graph.run({"seed": 7})
+
+        assert peak[0] <= 2 and result.values["s3"] == 7
+        assert result.status["slow"] == "failed"
+
+    def test_invalid_graphs_rejected(self):
+        with pytest.raises(StepGraphError):
+            StepGraph([AgentStep("a", _fail, inputs=("b",)), AgentStep("b", _fail, inputs=("a",))])
+        with pytest.raises(StepGraphError):
+            StepGraph([AgentStep("a", _fail), AgentStep("a", _fail)])
+        with pytest.raises(StepGraphError):
+            asyncio.run(StepGraph([AgentStep("a", _fail, inputs=("missing",))]).run())
+
+
+class _SlowLLMRoadmapAgent(RoadmapGenerationAgent):
+    """Every LLM call takes 50ms; records concurrency."""
+
+    def __init__(self):
+        super().__init__(public_works=SimpleNamespace())
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _gather_platform_context(self, context):
+        return {}
+
+    async def _call_llm(self, prompt, system_message, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.05)
+        self.in_flight -= 1
+        return "not json"
+
+
+class TestRoadmapStepGraph:
+    """Milestones, risks and the executive summary run concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_roadmap_latency_follows_critical_path(self):
+        agent = _SlowLLMRoadmapAgent()
+        context = SimpleNamespace(tenant_id="t1", session_id="s1", execution_id="e1", state_surface=None)
+
+        started = time.perf_counter()
+        result = await agent.process_request({"goals": ["Reduce claim backlog"], "timeline": "6 months"}, context)
+        elapsed = time.perf_counter() - started
+
+        assert result["artifact_type"] == "roadmap"
+        assert result["artifact"]["executive_summary"]["summary"] == "not json"
+        assert agent.peak == 3
+        assert elapsed < 0.25  # strategy, phases, then 3 parallel calls: ~0.15s rather than 0.25s
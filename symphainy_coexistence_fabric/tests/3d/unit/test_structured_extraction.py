@@ -0,0 +1,139 @@
+"""
+Test StructuredExtractionAgent extraction runs.
+
+Verifies that a run loads the parsed file once, that prompts carry the parsed content
+(cut at the prompt budget, and saying so, for large files), that the bounded preview is
+identical to the old truncated dump, and that categories extract concurrently in
+dependency order.
+"""
+
+import asyncio
+import json
+import sys
+import time
+import types
+from types import SimpleNamespace
+
+import pytest
+
+from symphainy_platform.civic_systems.agentic.agents.structured_extraction_agent import (
+    PROMPT_CONTENT_CHARS,
+    StructuredExtractionAgent,
+    _bounded_json_preview,
+)
+from symphainy_platform.realms.insights.models.extraction_config import ExtractionCategory, ExtractionConfig
+
+
+PARSED_CONTENT = {"rows": [{"policy": f"P{i}", "premium": i * 10} for i in range(5000)]}
+
+
+class _Loads(list):
+    content = PARSED_CONTENT
+
+
+class _Agent(StructuredExtractionAgent):
+    def __init__(self):
+        super().__init__(public_works=SimpleNamespace())
+        self.prompts = []
+        self.in_flight = 0
+        self.peak = 0
+        self.started = {}
+
+    async def _call_llm(self, prompt, system_message, **kwargs):
+        category = kwargs["metadata"]["category"]
+        self.started[category] = time.perf_counter()
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.05)
+        self.in_flight -= 1
+        return json.dumps({"category": category})
+
+
+@pytest.fixture
+def parser_loads(monkeypatch):
+    """Replace FileParserService with one that counts parsed-file loads (content: loads.content)."""
+    loads = _Loads()
+
+    class _FileParserService:
+        def __init__(self, public_works=None):
+            pass
+
+        async def get_parsed_file(self, parsed_file_id, tenant_id, context=None):
+            loads.append(parsed_file_id)
+            return {"parsed_content": loads.content, "metadata": {"rows": 5000}}
+
+    module = types.ModuleType("file_parser_service")
+    module.FileParserService = _FileParserService
+    monkeypatch.setitem(sys.modules, "symphainy_platform.foundations.libraries.parsing.file_parser_service", module)
+    return loads
+
+
+def _config(dependencies=None):
+    return ExtractionConfig(
+        config_id="c1",
+        name="Policies",
+        description="",
+        domain="insurance",
+        categories=[ExtractionCategory(name=name, extraction_type="llm") for name in ("a", "b", "c", "d")],
+        dependencies=dependencies or {},
+    )
+
+
+def test_bounded_preview_matches_truncated_dump():
+    assert _bounded_json_preview(PARSED_CONTENT) == json.dumps(PARSED_CONTENT, indent=2)[:2000]
+    assert _bounded_json_preview({"a": 1}) == json.dumps({"a": 1}, indent=2)
+    assert _bounded_json_preview(PARSED_CONTENT, 500, indent=None) == json.dumps(PARSED_CONTENT, separators=(",", ":"))[:500]
+
+
+class TestExtractionRun:
+    """One load per run, budgeted prompt content, dependency-ordered concurrency."""
+
+    @pytest.mark.asyncio
+    async def test_independent_categories_extract_concurrently(self, parser_loads):
+        agent = _Agent()
+        context = SimpleNamespace(tenant_id="t1")
+
+        started = time.perf_counter()
+        result = await agent.extract_structured_data(_config(), {"parsed_file_id": "pf1"}, context)
+        elapsed = time.perf_counter() - started
+
+        assert parser_loads == ["pf1"]
+        assert agent.peak == 4 and elapsed < 0.15
+        assert [category["name"] for category in result["categories"]] == ["a", "b", "c", "d"]
+        assert result["extracted_data"]["c"] == {"category": "c"}
+        data_block = agent.prompts[0].split("Data Source:\n", 1)[1]
+        assert all(prompt.endswith(data_block) for prompt in agent.prompts)
+        assert '{"policy":"P0","premium":0}' in agent.prompts[0] and "P4999" not in agent.prompts[0]
+        assert "Parsed content truncated" in agent.prompts[0]
+        assert len(agent.prompts[0]) < PROMPT_CONTENT_CHARS + 2000
+
+    @pytest.mark.asyncio
+    async def test_prompt_carries_whole_content_within_budget(self, parser_loads):
+        parser_loads.content = {"rows": [{"policy": f"P{i}", "premium": i * 10} for i in range(50)]}
+        agent = _Agent()
+
+        await agent.extract_structured_data(_config(), {"parsed_file_id": "pf1"}, SimpleNamespace(tenant_id="t1"))
+
+        assert json.dumps(parser_loads.content, separators=(",", ":")) in agent.prompts[0]
+        assert "truncated" not in agent.prompts[0] and "data_preview" not in agent.prompts[0]
+
+    @pytest.mark.asyncio
+    async def test_dependencies_order_extraction(self, parser_loads):
+        agent = _Agent()
+        config = _config({"c": ["a", "b"], "d": ["c", "missing"]})
+
+        result = await agent.extract_structured_data(config, {"parsed_file_id": "pf1"}, SimpleNamespace(tenant_id="t1"))
+
+        assert agent.started["c"] >= max(agent.started["a"], agent.started["b"]) + 0.04
+        assert agent.started["d"] >= agent.started["c"] + 0.04
+        assert agent.peak == 2 and set(result["confidence_scores"]) == {"a", "b", "c", "d"}
+
+    @pytest.mark.asyncio
+    async def test_cyclic_dependencies_extract_sequentially(self, parser_loads):
+        agent = _Agent()
+        config = _config({"a": ["b"], "b": ["a"]})
+
+        result = await agent.extract_structured_data(config, {"parsed_file_id": "pf1"}, SimpleNamespace(tenant_id="t1"))
+
+        assert agent.peak == 1 and len(result["categories"]) == 4
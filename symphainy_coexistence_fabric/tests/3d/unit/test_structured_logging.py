@@ -0,0 +1,116 @@
+"""
+Test Structured Logging
+
+Tests:
+- Log context propagation (contextvars) into records
+- Lazy messages are not built when the level is disabled or the record is sampled out
+- Per-category rate limiting / sampling (WARNING and above never dropped)
+"""
+
+import asyncio
+import json
+import logging
+
+import pytest
+
+from utilities.logging import (
+    JSONFormatter,
+    LogCategory,
+    LogRateLimiter,
+    bind_log_context,
+    configure_log_sampling,
+    get_log_context,
+    get_logger,
+    log_context,
+    reset_log_context,
+)
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def captured():
+    logger = get_logger("test.structured_logging")
+    capture = _Capture()
+    logger.logger.addHandler(capture)
+    yield logger, capture.records
+    logger.logger.removeHandler(capture)
+
+
+class TestLogContext:
+    """Context fields are bound once and attached to every record."""
+
+    def test_context_fields_attached_and_explicit_kwargs_win(self, captured):
+        logger, records = captured
+        with log_context(tenant_id="tenant_a", execution_id="exec_1"):
+            logger.info("inside", tenant_id="tenant_b")
+        logger.info("outside")
+
+        inside = json.loads(JSONFormatter().format(records[0]))
+        assert inside["tenant_id"] == "tenant_b"
+        assert inside["execution_id"] == "exec_1"
+        assert not hasattr(records[1], "execution_id")
+
+    def test_bind_and_reset(self):
+        token = bind_log_context(session_id="s1")
+        assert get_log_context() == {"session_id": "s1"}
+        reset_log_context(token)
+        assert get_log_context() == {}
+
+    def test_unknown_fields_rejected(self):
+        with pytest.raises(ValueError):
+            bind_log_context(module="nope")
+
+    @pytest.mark.asyncio
+    async def test_context_is_isolated_per_task(self, captured):
+        logger, records = captured
+
+        async def work(execution_id):
+            with log_context(execution_id=execution_id):
+                await asyncio.sleep(0)
+                logger.info("step")
+
+        await asyncio.gather(work("a"), work("b"))
+        assert sorted(r.execution_id for r in records) == ["a", "b"]
+
+
+class TestLazyMessagesAndSampling:
+    """Hot-path messages are cheap when not emitted."""
+
+    def test_lazy_message_not_built_when_level_disabled(self, captured):
+        logger, records = captured
+        calls = []
+        logger.debug(lambda: calls.append(1) or "never")
+        assert calls == []
+        assert records == []
+
+    def test_category_rate_limit_reports_suppressed(self, captured):
+        logger, records = captured
+        configure_log_sampling("bench_category", max_per_second=0.001, burst=2)
+        try:
+            built = []
+            for i in range(10):
+                logger.info(lambda i=i: built.append(i) or f"hot {i}", category="bench_category")
+            logger.warning("never dropped", category="bench_category")
+        finally:
+            configure_log_sampling("bench_category")
+
+        assert [r.getMessage() for r in records] == ["hot 0", "hot 1", "never dropped"]
+        assert built == [0, 1]
+
+    def test_sample_ratio_keeps_one_in_n(self):
+        limiter = LogRateLimiter(sample_ratio=0.25)
+        decisions = [limiter.acquire() for _ in range(8)]
+        assert [allowed for allowed, _ in decisions] == [True, False, False, False] * 2
+        assert decisions[4] == (True, 3)
+
+    def test_hot_path_category_has_default_limit(self):
+        from utilities.logging import _sampling_rules
+        assert LogCategory.HOT_PATH.value in _sampling_rules
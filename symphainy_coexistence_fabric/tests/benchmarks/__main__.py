@@ -0,0 +1,88 @@
+"""
+Benchmark CLI
+
+    python -m tests.benchmarks --documents 50 --concurrency 8
+    python -m tests.benchmarks --latency redis=0.5,arango=2,gcs=5 --save-baseline bench/baseline.json
+    python -m tests.benchmarks --compare bench/baseline.json --tolerance 0.15
+
+Exits non-zero when --compare finds regressions.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from typing import Dict
+
+from .harness import (
+    DEFAULT_PIPELINE,
+    BenchmarkConfig,
+    compare_reports,
+    format_report,
+    load_report,
+    run_benchmark,
+    save_report,
+)
+
+
+def _parse_latency(value: str) -> Dict[str, float]:
+    """Parse 'redis=0.5,arango=2' into {'redis': 0.5, 'arango': 2.0}."""
+    latency: Dict[str, float] = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        backend, _, ms = item.partition("=")
+        if not ms:
+            raise argparse.ArgumentTypeError(f"Expected backend=ms, got: {item}")
+        latency[backend.strip()] = float(ms)
+    return latency
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=20, help="Documents pushed through the pipeline")
+    parser.add_argument("--concurrency", type=int, default=4, help="Documents in flight at once")
+    parser.add_argument("--rows", type=int, default=200, help="CSV rows per document")
+    parser.add_argument("--intents", default=",".join(DEFAULT_PIPELINE),
+                        help="Comma-separated pipeline intents, in order")
+    parser.add_argument("--latency", type=_parse_latency, default={},
+                        help="Simulated per-call latency, e.g. redis=0.5,arango=2,gcs=5,supabase=3,llm=50")
+    parser.add_argument("--output", help="Write the JSON report here")
+    parser.add_argument("--save-baseline", help="Write the JSON report here as the new baseline")
+    parser.add_argument("--compare", help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Relative change treated as a regression (default 0.2)")
+    parser.add_argument("--json", action="store_true", help="Print the JSON report instead of the table")
+    parser.add_argument("--verbose", action="store_true", help="Keep platform logging enabled")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)
+
+    config = BenchmarkConfig(
+        documents=args.documents,
+        concurrency=args.concurrency,
+        rows_per_document=args.rows,
+        intents=tuple(i.strip() for i in args.intents.split(",") if i.strip()),
+        latency_ms=args.latency,
+    )
+    report = asyncio.run(run_benchmark(config))
+
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        save_report(report, path)
+
+    if args.compare:
+        regressions = compare_reports(report, load_report(args.compare), args.tolerance)
+        if regressions:
+            print(f"\nREGRESSIONS vs {args.compare}:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print(f"\nNo regressions vs {args.compare} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,453 @@
+"""
+End-to-End Benchmark Harness
+
+Boots the real runtime (create_runtime_services) on top of local backend
+stand-ins and drives the content pipeline through ExecutionLifecycleManager:
+
+    ingest_file → parse_content → create_deterministic_embeddings
+        → extract_embeddings → assess_data_quality → create_blueprint
+
+Each synthetic document runs the pipeline in order; documents run concurrently
+up to ``concurrency``. The report records, per intent type: throughput,
+p50/p95/p99 latency, success/error counts and backend round trips per
+execution, plus startup time and peak RSS. Reports are plain JSON so a run can
+be saved as a baseline and later runs compared against it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import os
+import platform
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+_project_root = Path(__file__).resolve().parents[2]
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+from symphainy_platform.runtime.intent_model import IntentFactory  # noqa: E402
+from symphainy_platform.runtime.service_factory import create_runtime_services  # noqa: E402
+
+from .standins import LocalBackends, LocalPublicWorksFoundationService  # noqa: E402
+
+
+REPORT_VERSION = 1
+
+DEFAULT_PIPELINE: Tuple[str, ...] = (
+    "ingest_file",
+    "parse_content",
+    "create_deterministic_embeddings",
+    "extract_embeddings",
+    "assess_data_quality",
+    "create_blueprint",
+)
+
+
+# ============================================================================
+# CONFIGURATION AND STATISTICS
+# ============================================================================
+
+
+@dataclass
+class BenchmarkConfig:
+    """Benchmark run configuration."""
+
+    documents: int = 20
+    concurrency: int = 4
+    rows_per_document: int = 200
+    intents: Tuple[str, ...] = DEFAULT_PIPELINE
+    latency_ms: Dict[str, float] = field(default_factory=dict)
+    tenant_id: str = "benchmark_tenant"
+    solution_id: str = "content_solution"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "documents": self.documents,
+            "concurrency": self.concurrency,
+            "rows_per_document": self.rows_per_document,
+            "intents": list(self.intents),
+            "latency_ms": dict(self.latency_ms),
+        }
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (pct in 0..100); 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+@dataclass
+class IntentStats:
+    """Latency and outcome samples for one intent type."""
+
+    intent_type: str
+    latencies_ms: List[float] = field(default_factory=list)
+    successes: int = 0
+    errors: int = 0
+    error_samples: List[str] = field(default_factory=list)
+
+    def record(self, latency_ms: float, success: bool, error: Optional[str] = None) -> None:
+        self.latencies_ms.append(latency_ms)
+        if success:
+            self.successes += 1
+        else:
+            self.errors += 1
+            if error and len(self.error_samples) < 3 and error not in self.error_samples:
+                self.error_samples.append(error)
+
+    def summary(self, wall_seconds: float, round_trips: Dict[str, int]) -> Dict[str, Any]:
+        count = len(self.latencies_ms)
+        per_execution = {
+            backend: round(total / count, 2) for backend, total in sorted(round_trips.items())
+        } if count else {}
+        return {
+            "count": count,
+            "successes": self.successes,
+            "errors": self.errors,
+            "throughput_per_s": round(count / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+            "latency_ms": {
+                "mean": round(sum(self.latencies_ms) / count, 3) if count else 0.0,
+                "p50": round(percentile(self.latencies_ms, 50), 3),
+                "p95": round(percentile(self.latencies_ms, 95), 3),
+                "p99": round(percentile(self.latencies_ms, 99), 3),
+                "max": round(max(self.latencies_ms), 3) if count else 0.0,
+            },
+            "round_trips_per_execution": per_execution,
+            "round_trips_total_per_execution": round(sum(per_execution.values()), 2),
+            "error_samples": list(self.error_samples),
+        }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 2)
+
+
+def synthetic_csv(document_index: int, rows: int) -> bytes:
+    """Deterministic CSV document used as pipeline input."""
+    lines = ["record_id,customer_name,email,amount,region,created_at"]
+    regions = ("north", "south", "east", "west")
+    for row in range(rows):
+        key = document_index * rows + row
+        lines.append(
+            f"{key},Customer {key},customer{key}@example.com,{(key % 997) * 1.25:.2f},"
+            f"{regions[key % len(regions)]},2026-01-{(key % 28) + 1:02d}"
+        )
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _semantic_payload(artifacts: Optional[Dict[str, Any]], key: str) -> Optional[Any]:
+    """Find ``key`` in any artifact's semantic_payload (or the artifact itself)."""
+    for artifact in (artifacts or {}).values():
+        if not isinstance(artifact, dict):
+            continue
+        payload = artifact.get("semantic_payload", artifact)
+        if isinstance(payload, dict) and payload.get(key):
+            return payload[key]
+    return None
+
+
+@contextmanager
+def _boot_environment():
+    """
+    Satisfy the runtime env contract (it requires an OTLP endpoint) for the
+    duration of boot only, so other tests in the same process are unaffected.
+    Nothing is exported; the endpoint is never contacted.
+    """
+    key = "OTEL_EXPORTER_OTLP_ENDPOINT"
+    previous = os.environ.get(key)
+    if previous is None:
+        os.environ[key] = "http://localhost:4317"
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(key, None)
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+
+class BenchmarkRunner:
+    """Boots the runtime on local stand-ins and drives the intent pipeline."""
+
+    def __init__(self, config: BenchmarkConfig):
+        self.config = config
+        self.backends = LocalBackends(latency_ms=config.latency_ms)
+        self.services = None
+        self.startup_seconds = 0.0
+        self.startup_round_trips: Dict[str, int] = {}
+        self.startup_breakdown: Dict[str, Any] = {}
+        self._stats: Dict[str, IntentStats] = {
+            intent_type: IntentStats(intent_type) for intent_type in config.intents
+        }
+
+    async def setup(self) -> None:
+        """Boot Public Works and the runtime object graph."""
+        started = time.perf_counter()
+        with _boot_environment():
+            public_works = LocalPublicWorksFoundationService(self.backends)
+            self.services = await create_runtime_services({}, public_works=public_works)
+        self.startup_seconds = time.perf_counter() - started
+        self.startup_round_trips = self.backends.counter.totals()
+        self.startup_breakdown = public_works.get_startup_timings()
+        self.backends.counter.reset()
+
+    async def run(self) -> Dict[str, Any]:
+        """Run the configured workload and return the report dict."""
+        if self.services is None:
+            await self.setup()
+
+        semaphore = asyncio.Semaphore(max(1, self.config.concurrency))
+
+        async def bounded(index: int) -> None:
+            async with semaphore:
+                await self._run_document(index)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(bounded(i) for i in range(self.config.documents)))
+        wall_seconds = time.perf_counter() - started
+
+        return self._build_report(wall_seconds)
+
+    async def _run_document(self, index: int) -> None:
+        """Drive one document through the pipeline, stopping at the first failure."""
+        session_id = f"benchmark_session_{index}"
+        state: Dict[str, Any] = {"document_index": index}
+
+        for intent_type in self.config.intents:
+            parameters = self._parameters_for(intent_type, state)
+            if parameters is None:
+                # An upstream step did not produce what this step needs
+                self._stats[intent_type].record(0.0, False, "skipped: upstream step failed")
+                continue
+
+            result, latency_ms, error = await self._execute(intent_type, session_id, parameters)
+            success = result is not None and result.success
+            self._stats[intent_type].record(latency_ms, success, error)
+            if success:
+                self._collect_outputs(intent_type, result.artifacts, state)
+
+    async def _execute(
+        self,
+        intent_type: str,
+        session_id: str,
+        parameters: Dict[str, Any]
+    ) -> Tuple[Optional[Any], float, Optional[str]]:
+        intent = IntentFactory.create_intent(
+            intent_type=intent_type,
+            tenant_id=self.config.tenant_id,
+            session_id=session_id,
+            solution_id=self.config.solution_id,
+            parameters=parameters,
+        )
+        counter = self.backends.counter
+        token = counter.scope(intent_type)
+        started = time.perf_counter()
+        try:
+            result = await self.services.execution_lifecycle_manager.execute(intent)
+            error = None if result.success else (result.error or "execution failed")
+        except Exception as e:
+            result, error = None, f"{type(e).__name__}: {e}"
+        finally:
+            latency_ms = (time.perf_counter() - started) * 1000.0
+            counter.end_scope(token)
+        return result, latency_ms, error
+
+    def _parameters_for(self, intent_type: str, state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        index = state["document_index"]
+        if intent_type == "ingest_file":
+            return {
+                "ui_name": f"benchmark_{index}.csv",
+                "file_content": synthetic_csv(index, self.config.rows_per_document).hex(),
+                "file_type": "csv",
+                "mime_type": "text/csv",
+                "ingestion_type": "upload",
+            }
+        if intent_type == "parse_content":
+            if not state.get("file_id"):
+                return None
+            return {
+                "file_id": state["file_id"],
+                "file_reference": state.get("file_reference"),
+                "file_type": "csv",
+            }
+        if intent_type in ("create_deterministic_embeddings", "extract_embeddings", "assess_data_quality"):
+            if not state.get("parsed_file_id"):
+                return None
+            return {
+                "parsed_file_id": state["parsed_file_id"],
+                "parsed_artifact_id": state["parsed_file_id"],
+                "deterministic_embedding_id": state.get("deterministic_embedding_id"),
+                "embedding_id": state.get("embedding_id"),
+            }
+        if intent_type == "create_blueprint":
+            return {
+                "outcome_id": f"benchmark_outcome_{index}",
+                "blueprint_type": "technical",
+            }
+        return {}
+
+    @staticmethod
+    def _collect_outputs(intent_type: str, artifacts: Optional[Dict[str, Any]], state: Dict[str, Any]) -> None:
+        if intent_type == "ingest_file":
+            state["file_id"] = _semantic_payload(artifacts, "artifact_id")
+            state["file_reference"] = _semantic_payload(artifacts, "file_reference")
+        elif intent_type == "parse_content":
+            state["parsed_file_id"] = _semantic_payload(artifacts, "parsed_file_id")
+        elif intent_type == "create_deterministic_embeddings":
+            state["deterministic_embedding_id"] = _semantic_payload(artifacts, "deterministic_embedding_id")
+        elif intent_type == "extract_embeddings":
+            state["embedding_id"] = _semantic_payload(artifacts, "embedding_id")
+
+    def _build_report(self, wall_seconds: float) -> Dict[str, Any]:
+        by_scope = self.backends.counter.by_scope()
+        intents = {
+            intent_type: stats.summary(wall_seconds, by_scope.get(intent_type, {}))
+            for intent_type, stats in self._stats.items()
+        }
+        total_executions = sum(s["count"] for s in intents.values())
+        return {
+            "version": REPORT_VERSION,
+            "created_at": datetime.utcnow().isoformat(),
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "config": self.config.to_dict(),
+            "startup": {
+                "seconds": round(self.startup_seconds, 3),
+                "round_trips": self.startup_round_trips,
+                "breakdown": self.startup_breakdown,
+            },
+            "totals": {
+                "wall_seconds": round(wall_seconds, 3),
+                "executions": total_executions,
+                "errors": sum(s["errors"] for s in intents.values()),
+                "throughput_per_s": round(total_executions / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+                "round_trips": self.backends.counter.totals(),
+            },
+            "peak_rss_mb": peak_rss_mb(),
+            "intents": intents,
+        }
+
+
+async def run_benchmark(config: BenchmarkConfig) -> Dict[str, Any]:
+    """Boot, run and report in one call."""
+    runner = BenchmarkRunner(config)
+    await runner.setup()
+    return await runner.run()
+
+
+# ============================================================================
+# BASELINES
+# ============================================================================
+
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text())
+
+
+def compare_reports(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = 0.2
+) -> List[str]:
+    """
+    Compare a report against a baseline.
+
+    Returns a list of human-readable regressions: p95 latency or round trips
+    per execution up by more than ``tolerance``, throughput down by more than
+    ``tolerance``, new errors, or peak RSS up by more than ``tolerance``.
+    """
+    regressions: List[str] = []
+
+    for intent_type, current in report.get("intents", {}).items():
+        previous = baseline.get("intents", {}).get(intent_type)
+        if not previous:
+            continue
+
+        current_p95 = current["latency_ms"]["p95"]
+        previous_p95 = previous["latency_ms"]["p95"]
+        if previous_p95 > 0 and current_p95 > previous_p95 * (1 + tolerance):
+            regressions.append(
+                f"{intent_type}: p95 latency {previous_p95:.1f}ms -> {current_p95:.1f}ms"
+            )
+
+        current_tp = current["throughput_per_s"]
+        previous_tp = previous["throughput_per_s"]
+        if previous_tp > 0 and current_tp < previous_tp * (1 - tolerance):
+            regressions.append(
+                f"{intent_type}: throughput {previous_tp:.2f}/s -> {current_tp:.2f}/s"
+            )
+
+        current_rt = current["round_trips_total_per_execution"]
+        previous_rt = previous["round_trips_total_per_execution"]
+        if current_rt > previous_rt * (1 + tolerance) and current_rt - previous_rt >= 1:
+            regressions.append(
+                f"{intent_type}: round trips/execution {previous_rt:.1f} -> {current_rt:.1f}"
+            )
+
+        if current["errors"] > previous["errors"]:
+            regressions.append(
+                f"{intent_type}: errors {previous['errors']} -> {current['errors']}"
+            )
+
+    current_rss = report.get("peak_rss_mb", 0.0)
+    previous_rss = baseline.get("peak_rss_mb", 0.0)
+    if previous_rss > 0 and current_rss > previous_rss * (1 + tolerance):
+        regressions.append(f"peak RSS {previous_rss:.1f}MiB -> {current_rss:.1f}MiB")
+
+    return regressions
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render a report as a fixed-width text table."""
+    lines = [
+        f"startup: {report['startup']['seconds']:.3f}s   "
+        f"wall: {report['totals']['wall_seconds']:.3f}s   "
+        f"executions: {report['totals']['executions']}   "
+        f"errors: {report['totals']['errors']}   "
+        f"peak RSS: {report['peak_rss_mb']:.1f}MiB",
+    ]
+    phases = report["startup"].get("breakdown", {}).get("phases", {})
+    if phases:
+        lines.append("startup phases: " + "   ".join(
+            f"{phase} {values['wall_ms']:.1f}ms" for phase, values in phases.items()
+        ))
+    lines.append("")
+    lines.append(
+        f"{'intent':<34}{'n':>6}{'err':>6}{'tput/s':>9}{'p50ms':>9}{'p95ms':>9}{'p99ms':>9}{'rt/exec':>9}"
+    )
+    for intent_type, stats in report["intents"].items():
+        latency = stats["latency_ms"]
+        lines.append(
+            f"{intent_type:<34}{stats['count']:>6}{stats['errors']:>6}"
+            f"{stats['throughput_per_s']:>9.2f}{latency['p50']:>9.2f}{latency['p95']:>9.2f}"
+            f"{latency['p99']:>9.2f}{stats['round_trips_total_per_execution']:>9.1f}"
+        )
+        for sample in stats["error_samples"]:
+            lines.append(f"    ! {sample[:110]}")
+    return "\n".join(lines)
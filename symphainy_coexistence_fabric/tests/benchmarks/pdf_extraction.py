@@ -0,0 +1,206 @@
+"""
+PDF extraction benchmark: page-parallel process pool vs sequential extraction
+
+    python -m tests.benchmarks.pdf_extraction --pages 500 --workers 1,2,4,8
+    python -m tests.benchmarks.pdf_extraction --pages 500 --json
+
+The document is generated locally (no PDF library needed): every page carries
+lines of text, and every fifth page a ruled table pdfplumber detects. Modes:
+
+- inline: all pages extracted on the event loop thread, page by page (the previous
+  adapter behaviour)
+- thread: max_workers=0, one worker thread (off the loop, still sequential)
+- pool(N): N extraction processes, pages_per_task pages per task
+- cached: the pool run repeated on the same document (page cache hits only)
+
+Each mode reports wall time, pages per second and the worst event-loop stall seen by
+a 10 ms ticker while the parse runs. Requires pdfplumber.
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from typing import Any, Dict, List, Sequence
+
+from symphainy_platform.foundations.public_works.adapters.pdf_adapter import (
+    PdfProcessingAdapter,
+    _pdfplumber_extract_pages,
+)
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _page_content(page_number: int, lines: int) -> bytes:
+    ops = ["BT", "/F1 10 Tf", "12 TL", "72 740 Td", f"({_escape(f'Page {page_number} of the benchmark document')}) Tj"]
+    for line in range(lines):
+        ops.append(f"T* ({_escape(f'Line {line + 1}: quarterly ledger entry {page_number * 100 + line} reconciled')}) Tj")
+    ops.append("ET")
+    if page_number % 5 == 0:
+        # 4 x 3 ruled table below the text
+        left, top, width, height = 72, 380, 150, 20
+        ops.append("0.5 w")
+        for row in range(5):
+            y = top - row * height
+            ops.append(f"{left} {y} m {left + 3 * width} {y} l S")
+        for col in range(4):
+            x = left + col * width
+            ops.append(f"{x} {top} m {x} {top - 4 * height} l S")
+        for row in range(4):
+            for col in range(3):
+                cell = f"h{col}" if row == 0 else f"r{row}c{col}-{page_number}"
+                ops.append(f"BT /F1 9 Tf {left + col * width + 4} {top - (row + 1) * height + 6} Td ({cell}) Tj ET")
+    return "\n".join(ops).encode("latin-1")
+
+
+def generate_pdf(pages: int, lines_per_page: int = 40) -> bytes:
+    """A valid multi-page PDF with text on every page and a table on every fifth page."""
+    objects: List[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # page tree, filled in once page object numbers are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_refs = []
+    for page_number in range(1, pages + 1):
+        content = _page_content(page_number, lines_per_page)
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        content_ref = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_ref
+        )
+        page_refs.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % ref for ref in page_refs)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, pages)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return bytes(out)
+
+
+async def _measure(parse) -> Dict[str, Any]:
+    """Run parse() while a 10 ms ticker records the worst event-loop stall."""
+    worst_stall = 0.0
+
+    async def ticker():
+        nonlocal worst_stall
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(0.01)
+            worst_stall = max(worst_stall, time.perf_counter() - started - 0.01)
+
+    task = asyncio.ensure_future(ticker())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    result = await parse()
+    seconds = time.perf_counter() - started
+    await asyncio.sleep(0.02)  # let the ticker observe a stall that lasted until the end
+    task.cancel()
+    return {"seconds": seconds, "max_loop_stall_ms": round(worst_stall * 1000, 1), "result": result}
+
+
+async def _inline_parse(file_data: bytes, pages: int) -> Dict[str, Any]:
+    with tempfile.NamedTemporaryFile(suffix=".pdf") as handle:
+        handle.write(file_data)
+        handle.flush()
+        extracted = _pdfplumber_extract_pages(handle.name, list(range(1, pages + 1)))
+    return {"text": "".join(page["text"] for page in extracted), "tables": [t for page in extracted for t in page["tables"]]}
+
+
+def _row(mode: str, measured: Dict[str, Any], pages: int, baseline_seconds: float, tables: int) -> Dict[str, Any]:
+    seconds = measured["seconds"]
+    return {
+        "mode": mode,
+        "seconds": round(seconds, 3),
+        "pages_per_second": round(pages / seconds, 1) if seconds else None,
+        "speedup": round(baseline_seconds / seconds, 2) if seconds else None,
+        "max_loop_stall_ms": measured["max_loop_stall_ms"],
+        "tables": tables,
+    }
+
+
+async def run_pdf_benchmark(
+    pages: int = 500,
+    workers: Sequence[int] = (1, 2, 4),
+    pages_per_task: int = 8,
+    lines_per_page: int = 40
+) -> Dict[str, Any]:
+    """
+    Generate a pages-long PDF and time extraction in each mode.
+
+    Returns:
+        Report with document size and, per mode, wall time, pages/s, speedup over inline
+        extraction, worst event-loop stall and tables found
+    """
+    file_data = generate_pdf(pages, lines_per_page)
+    report: Dict[str, Any] = {"pages": pages, "bytes": len(file_data), "pages_per_task": pages_per_task, "modes": []}
+
+    inline = await _measure(lambda: _inline_parse(file_data, pages))
+    baseline = inline["seconds"]
+    report["modes"].append(_row("inline", inline, pages, baseline, len(inline["result"]["tables"])))
+
+    thread_adapter = PdfProcessingAdapter(max_workers=0, page_cache_entries=0)
+    threaded = await _measure(lambda: thread_adapter.parse_file(file_data, "bench.pdf"))
+    report["modes"].append(_row("thread", threaded, pages, baseline, threaded["result"]["metadata"]["table_count"]))
+
+    for count in workers:
+        adapter = PdfProcessingAdapter(max_workers=count, pages_per_task=pages_per_task, parallel_min_pages=1)
+        try:
+            pooled = await _measure(lambda: adapter.parse_file(file_data, "bench.pdf"))
+            report["modes"].append(_row(f"pool({count})", pooled, pages, baseline, pooled["result"]["metadata"]["table_count"]))
+            if pooled["result"]["text"] != threaded["result"]["text"]:
+                raise AssertionError(f"pool({count}) text differs from sequential extraction")
+            if count == max(workers):
+                cached = await _measure(lambda: adapter.parse_file(file_data, "bench.pdf"))
+                report["modes"].append(_row("cached", cached, pages, baseline, cached["result"]["metadata"]["table_count"]))
+        finally:
+            adapter.shutdown()
+    return report
+
+
+def format_pdf_report(report: Dict[str, Any]) -> str:
+    """Human-readable table of a run_pdf_benchmark report."""
+    lines = [
+        f"{report['pages']} pages ({report['bytes'] / 1024:.0f} KiB), {report['pages_per_task']} pages per pool task",
+        f"{'mode':<10}{'seconds':>10}{'pages/s':>10}{'speedup':>10}{'loop stall ms':>15}{'tables':>8}",
+    ]
+    for row in report["modes"]:
+        lines.append(
+            f"{row['mode']:<10}{row['seconds']:>10.3f}{row['pages_per_second'] or 0:>10.1f}"
+            f"{row['speedup'] or 0:>10.2f}{row['max_loop_stall_ms']:>15.1f}{row['tables']:>8}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks.pdf_extraction", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=500, help="Pages in the generated PDF")
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated process pool sizes to compare")
+    parser.add_argument("--pages-per-task", type=int, default=8, help="Pages extracted per pool task")
+    parser.add_argument("--lines", type=int, default=40, help="Text lines per page")
+    parser.add_argument("--json", action="store_true", help="Print the JSON report instead of the table")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_pdf_benchmark(
+        pages=args.pages,
+        workers=[int(n) for n in args.workers.split(",") if n.strip()],
+        pages_per_task=args.pages_per_task,
+        lines_per_page=args.lines,
+    ))
+    print(json.dumps(report, indent=2) if args.json else format_pdf_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,1063 @@
+"""
+Local Backend Stand-ins for Performance Benchmarks
+
+In-process replacements for the raw clients that Public Works adapters wrap
+(redis.asyncio, python-arango StandardDatabase, google-cloud-storage Bucket,
+supabase Client, OpenAI / HuggingFace endpoints).
+
+The stand-ins are attached *underneath* the real adapters, so every benchmark
+run exercises the real adapter → abstraction → runtime code path; only the
+network hop is replaced. Every client call is recorded in a RoundTripCounter so
+reports can show backend round trips per intent.
+
+If STORAGE_EMULATOR_HOST is set, the real GCS client is used against the
+emulator instead of the in-memory bucket.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import fnmatch
+import hashlib
+import itertools
+import math
+import os
+import re
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from symphainy_platform.foundations.public_works.foundation_service import (
+    PublicWorksFoundationService,
+)
+
+
+# ============================================================================
+# ROUND-TRIP ACCOUNTING
+# ============================================================================
+
+
+_current_scope: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "benchmark_round_trip_scope", default=None
+)
+
+
+class RoundTripCounter:
+    """
+    Counts simulated backend round trips per backend and operation.
+
+    Round trips are also attributed to the active scope (usually the intent
+    type being executed), set via ``scope()``. The scope is a ContextVar, so
+    concurrent intents running in separate asyncio tasks are attributed
+    correctly.
+    """
+
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._scoped: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def scope(self, name: str) -> contextvars.Token:
+        """Attribute subsequent round trips in this context to ``name``."""
+        return _current_scope.set(name)
+
+    def end_scope(self, token: contextvars.Token) -> None:
+        _current_scope.reset(token)
+
+    def record(self, backend: str, operation: str) -> None:
+        self._counts[backend][operation] += 1
+        scope = _current_scope.get()
+        if scope is not None:
+            self._scoped[scope][backend] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        return {backend: dict(ops) for backend, ops in self._counts.items()}
+
+    def totals(self) -> Dict[str, int]:
+        return {backend: sum(ops.values()) for backend, ops in self._counts.items()}
+
+    def by_scope(self) -> Dict[str, Dict[str, int]]:
+        """Round trips per scope, broken down by backend."""
+        return {scope: dict(backends) for scope, backends in self._scoped.items()}
+
+    def reset(self) -> None:
+        self._counts.clear()
+        self._scoped.clear()
+
+
+async def _simulate_latency(latency_ms: float) -> None:
+    if latency_ms > 0:
+        await asyncio.sleep(latency_ms / 1000.0)
+
+
+# ============================================================================
+# REDIS (redis.asyncio.Redis subset)
+# ============================================================================
+
+
+class LocalRedisClient:
+    """In-memory stand-in for redis.asyncio.Redis (decode_responses=True)."""
+
+    def __init__(self, counter: RoundTripCounter, latency_ms: float = 0.0):
+        self._counter = counter
+        self._latency_ms = latency_ms
+        self._strings: Dict[str, str] = {}
+        self._lists: Dict[str, List[str]] = defaultdict(list)
+        self._streams: Dict[str, List[Tuple[str, Dict[str, str]]]] = defaultdict(list)
+        self._expiry: Dict[str, float] = {}
+        self._stream_seq = itertools.count(1)
+
+    async def _hop(self, operation: str) -> None:
+        self._counter.record("redis", operation)
+        await _simulate_latency(self._latency_ms)
+
+    def _expired(self, key: str) -> bool:
+        deadline = self._expiry.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self._strings.pop(key, None)
+            self._lists.pop(key, None)
+            self._expiry.pop(key, None)
+            return True
+        return False
+
+    async def ping(self) -> bool:
+        await self._hop("ping")
+        return True
+
+    async def aclose(self) -> None:
+        return None
+
+    async def set(self, key: str, value: str, ex: Optional[int] = None, **kwargs) -> bool:
+        await self._hop("set")
+        self._strings[key] = value
+        if ex:
+            self._expiry[key] = time.monotonic() + ex
+        else:
+            self._expiry.pop(key, None)
+        return True
+
+    async def setex(self, key: str, ttl: int, value: str) -> bool:
+        return await self.set(key, value, ex=ttl)
+
+    async def get(self, key: str) -> Optional[str]:
+        await self._hop("get")
+        if self._expired(key):
+            return None
+        return self._strings.get(key)
+
+    async def mget(self, keys: List[str], *args: str) -> List[Optional[str]]:
+        await self._hop("mget")
+        keys = list(keys) + list(args) if isinstance(keys, list) else [keys, *args]
+        return [None if self._expired(key) else self._strings.get(key) for key in keys]
+
+    def pipeline(self, transaction: bool = True) -> "_LocalRedisPipeline":
+        return _LocalRedisPipeline(self)
+
+    async def delete(self, *keys: str) -> int:
+        await self._hop("delete")
+        removed = 0
+        for key in keys:
+            for store in (self._strings, self._lists, self._streams):
+                if key in store:
+                    del store[key]
+                    removed += 1
+        return removed
+
+    async def exists(self, *keys: str) -> int:
+        await self._hop("exists")
+        return sum(
+            1 for key in keys
+            if not self._expired(key) and (key in self._strings or key in self._lists or key in self._streams)
+        )
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        await self._hop("expire")
+        self._expiry[key] = time.monotonic() + ttl
+        return True
+
+    async def flushdb(self) -> bool:
+        await self._hop("flushdb")
+        self._strings.clear()
+        self._lists.clear()
+        self._streams.clear()
+        self._expiry.clear()
+        return True
+
+    async def lpush(self, key: str, *values: str) -> int:
+        await self._hop("lpush")
+        for value in values:
+            self._lists[key].insert(0, value)
+        return len(self._lists[key])
+
+    async def rpush(self, key: str, *values: str) -> int:
+        await self._hop("rpush")
+        self._lists[key].extend(values)
+        return len(self._lists[key])
+
+    async def lrange(self, key: str, start: int, end: int) -> List[str]:
+        await self._hop("lrange")
+        items = self._lists.get(key, [])
+        end = len(items) - 1 if end == -1 else end
+        return list(items[start:end + 1])
+
+    async def ltrim(self, key: str, start: int, end: int) -> bool:
+        await self._hop("ltrim")
+        items = self._lists.get(key, [])
+        end = len(items) - 1 if end == -1 else end
+        self._lists[key] = items[start:end + 1]
+        return True
+
+    async def scan_iter(self, match: str = "*", count: int = 100):
+        self._counter.record("redis", "scan")
+        keys = list(self._strings) + list(self._lists) + list(self._streams)
+        for key in keys:
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    async def xadd(self, stream_name: str, fields: Dict[str, str], maxlen: Optional[int] = None,
+                   approximate: bool = True) -> str:
+        await self._hop("xadd")
+        message_id = f"{int(time.time() * 1000)}-{next(self._stream_seq)}"
+        entries = self._streams[stream_name]
+        entries.append((message_id, {k: str(v) for k, v in fields.items()}))
+        if maxlen and len(entries) > maxlen:
+            del entries[: len(entries) - maxlen]
+        return message_id
+
+    async def xrange(self, stream_name: str, min: str = "-", max: str = "+",
+                     count: Optional[int] = None) -> List[Tuple[str, Dict[str, str]]]:
+        await self._hop("xrange")
+        entries = list(self._streams.get(stream_name, []))
+        return entries[:count] if count else entries
+
+    async def xread(self, streams: Dict[str, str], count: Optional[int] = None,
+                    block: Optional[int] = None) -> List[Tuple[str, List[Tuple[str, Dict[str, str]]]]]:
+        await self._hop("xread")
+        result = []
+        for stream_name, last_id in streams.items():
+            entries = [e for e in self._streams.get(stream_name, []) if last_id in ("0", "0-0") or e[0] > last_id]
+            if entries:
+                result.append((stream_name, entries[:count] if count else entries))
+        return result
+
+    async def xgroup_create(self, stream_name: str, group_name: str, id: str = "0",
+                            mkstream: bool = False) -> bool:
+        await self._hop("xgroup_create")
+        self._streams.setdefault(stream_name, [])
+        return True
+
+    async def xreadgroup(self, group_name: str, consumer_name: str, streams: Dict[str, str],
+                         count: Optional[int] = None, block: Optional[int] = None,
+                         noack: bool = False):
+        await self._hop("xreadgroup")
+        return []
+
+    async def xack(self, stream_name: str, group_name: str, *message_ids: str) -> int:
+        await self._hop("xack")
+        return len(message_ids)
+
+
+# ============================================================================
+# ARANGO (python-arango StandardDatabase subset)
+# ============================================================================
+
+
+class _LocalRedisPipeline:
+    """Queues SET/SETEX commands and applies them in one round trip."""
+
+    def __init__(self, client: LocalRedisClient):
+        self._client = client
+        self._commands: List[Tuple[str, Optional[int], str]] = []
+
+    async def __aenter__(self) -> "_LocalRedisPipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._commands = []
+
+    def set(self, key: str, value: str, ex: Optional[int] = None, **kwargs) -> "_LocalRedisPipeline":
+        self._commands.append((key, ex, value))
+        return self
+
+    def setex(self, key: str, ttl: int, value: str) -> "_LocalRedisPipeline":
+        return self.set(key, value, ex=ttl)
+
+    async def execute(self) -> List[bool]:
+        await self._client._hop("pipeline")
+        for key, ttl, value in self._commands:
+            self._client._strings[key] = value
+            if ttl:
+                self._client._expiry[key] = time.monotonic() + ttl
+            else:
+                self._client._expiry.pop(key, None)
+        results = [True] * len(self._commands)
+        self._commands = []
+        return results
+
+
+class _LocalArangoCollection:
+    def __init__(self, database: "LocalArangoDatabase", name: str):
+        self._database = database
+        self.name = name
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self._keys = itertools.count(1)
+
+    def _meta(self, key: str) -> Dict[str, Any]:
+        return {"_key": key, "_id": f"{self.name}/{key}", "_rev": str(time.monotonic_ns())}
+
+    def insert(self, document: Dict[str, Any], overwrite: bool = False, **kwargs) -> Dict[str, Any]:
+        self._database._hop("insert")
+        key = str(document.get("_key") or next(self._keys))
+        if key in self.documents and not overwrite:
+            raise self._database.error_class(f"unique constraint violated - in index primary of type primary over '_key'; conflicting key: {key}")
+        meta = self._meta(key)
+        self.documents[key] = {**document, **meta}
+        return meta
+
+    def insert_many(self, documents: List[Dict[str, Any]], overwrite: bool = False, **kwargs) -> List[Dict[str, Any]]:
+        self._database._hop("insert_many")
+        results = []
+        for document in documents:
+            key = str(document.get("_key") or next(self._keys))
+            meta = self._meta(key)
+            self.documents[key] = {**document, **meta}
+            results.append(meta)
+        return results
+
+    def import_bulk(
+        self,
+        documents: List[Dict[str, Any]],
+        halt_on_error: bool = True,
+        details: bool = True,
+        on_duplicate: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        self._database._hop("import_bulk")
+        report = {"created": 0, "updated": 0, "ignored": 0, "errors": 0, "empty": 0, "details": []}
+        for position, document in enumerate(documents):
+            key = str(document.get("_key") or next(self._keys))
+            if key in self.documents:
+                if on_duplicate in (None, "error"):
+                    report["errors"] += 1
+                    report["details"].append(
+                        f"at position {position}: creating document failed with error 'unique constraint violated'"
+                    )
+                    if halt_on_error:
+                        raise self._database.error_class(report["details"][-1])
+                    continue
+                if on_duplicate == "ignore":
+                    report["ignored"] += 1
+                    continue
+                base = self.documents[key] if on_duplicate == "update" else {}
+                self.documents[key] = {**base, **document, **self._meta(key)}
+                report["updated"] += 1
+            else:
+                self.documents[key] = {**document, **self._meta(key)}
+                report["created"] += 1
+        if not details:
+            report.pop("details")
+        return report
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        self._database._hop("get")
+        if isinstance(key, dict):
+            key = key.get("_key")
+        return self.documents.get(str(key))
+
+    def has(self, key: str) -> bool:
+        self._database._hop("has")
+        return str(key) in self.documents
+
+    def update(self, document: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        self._database._hop("update")
+        key = str(document["_key"])
+        current = self.documents.setdefault(key, {})
+        current.update(document)
+        current.update(self._meta(key))
+        return self._meta(key)
+
+    def replace(self, document: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        self._database._hop("replace")
+        key = str(document["_key"])
+        self.documents[key] = {**document, **self._meta(key)}
+        return self._meta(key)
+
+    def delete(self, key: Any, **kwargs) -> bool:
+        self._database._hop("delete")
+        if isinstance(key, dict):
+            key = key.get("_key")
+        return self.documents.pop(str(key), None) is not None
+
+    def count(self) -> int:
+        self._database._hop("count")
+        return len(self.documents)
+
+    def all(self):
+        self._database._hop("all")
+        return iter(list(self.documents.values()))
+
+    def add_persistent_index(self, *args, **kwargs) -> Dict[str, Any]:
+        return {}
+
+    def add_hash_index(self, *args, **kwargs) -> Dict[str, Any]:
+        return {}
+
+    def indexes(self) -> List[Dict[str, Any]]:
+        return []
+
+
+class _LocalAQL:
+    """
+    Minimal AQL evaluator covering the adapter's generated lookups:
+
+        FOR doc IN <collection> FILTER doc.<field> == @<var> [AND ...] [LIMIT n] RETURN doc
+
+    Any other query (graph traversals, COSINE_SIMILARITY, aggregations) scans the
+    collection it names and returns no rows, which keeps the round-trip count
+    honest without pretending to implement the query language.
+    """
+
+    _FOR_PATTERN = re.compile(r"FOR\s+(\w+)\s+IN\s+(\w+)", re.IGNORECASE)
+    _EQ_PATTERN = re.compile(r"(\w+)\.(\w+)\s*==\s*@(\w+)")
+    _LIMIT_PATTERN = re.compile(r"LIMIT\s+(\d+)\s", re.IGNORECASE)
+
+    def __init__(self, database: "LocalArangoDatabase"):
+        self._database = database
+
+    def execute(self, query: str, bind_vars: Optional[Dict[str, Any]] = None, **kwargs):
+        self._database._hop("aql")
+        bind_vars = bind_vars or {}
+        match = self._FOR_PATTERN.search(query)
+        if not match:
+            return iter([])
+        variable, collection_name = match.group(1), match.group(2)
+        collection = self._database.collections.get(collection_name)
+        if collection is None:
+            return iter([])
+        simple = re.fullmatch(
+            r"\s*FOR\s+\w+\s+IN\s+\w+\s+FILTER\s+.+?(\s+LIMIT\s+\d+)?\s+RETURN\s+\w+\s*",
+            query,
+            re.IGNORECASE | re.DOTALL,
+        )
+        if not simple:
+            return iter([])
+        conditions = [
+            (field, bind_vars.get(var))
+            for name, field, var in self._EQ_PATTERN.findall(query)
+            if name == variable
+        ]
+        rows = [
+            doc for doc in collection.documents.values()
+            if all(doc.get(field) == value for field, value in conditions)
+        ]
+        limit = self._LIMIT_PATTERN.search(query + " ")
+        if limit:
+            rows = rows[: int(limit.group(1))]
+        return iter(rows)
+
+
+class LocalArangoDatabase:
+    """In-memory stand-in for python-arango StandardDatabase."""
+
+    def __init__(self, counter: RoundTripCounter, latency_ms: float = 0.0):
+        from symphainy_platform.foundations.public_works.adapters.arango_adapter import ArangoError
+
+        self.error_class = ArangoError
+        self._counter = counter
+        self._latency_ms = latency_ms
+        self.collections: Dict[str, _LocalArangoCollection] = {}
+        self.aql = _LocalAQL(self)
+
+    def _hop(self, operation: str) -> None:
+        # python-arango is synchronous; latency is charged as a blocking sleep
+        # to reproduce the event-loop stall the real client causes.
+        self._counter.record("arango", operation)
+        if self._latency_ms > 0:
+            time.sleep(self._latency_ms / 1000.0)
+
+    def properties(self) -> Dict[str, Any]:
+        self._hop("properties")
+        return {"name": "symphainy_platform"}
+
+    def has_collection(self, name: str) -> bool:
+        self._hop("has_collection")
+        return name in self.collections
+
+    def create_collection(self, name: str, edge: bool = False, **kwargs) -> _LocalArangoCollection:
+        self._hop("create_collection")
+        if name in self.collections:
+            raise self.error_class(f"duplicate name: {name}")
+        self.collections[name] = _LocalArangoCollection(self, name)
+        return self.collections[name]
+
+    def delete_collection(self, name: str, **kwargs) -> bool:
+        self._hop("delete_collection")
+        return self.collections.pop(name, None) is not None
+
+    def collection(self, name: str) -> _LocalArangoCollection:
+        if name not in self.collections:
+            self.collections[name] = _LocalArangoCollection(self, name)
+        return self.collections[name]
+
+    def has_graph(self, name: str) -> bool:
+        self._hop("has_graph")
+        return False
+
+    def create_graph(self, name: str, **kwargs) -> Any:
+        self._hop("create_graph")
+        return None
+
+
+# ============================================================================
+# GCS (google.cloud.storage Bucket subset)
+# ============================================================================
+
+
+class _LocalBlob:
+    def __init__(self, bucket: "LocalGCSBucket", name: str):
+        self._bucket = bucket
+        self.name = name
+        self.content_type: Optional[str] = None
+        self.metadata: Dict[str, str] = {}
+        self.size: Optional[int] = None
+        self.time_created = None
+        self.updated = None
+        self.md5_hash: Optional[str] = None
+        self.crc32c: Optional[str] = None
+        self.etag: Optional[str] = None
+        self.generation: Optional[int] = None
+        self.public_url = f"local://{bucket.name}/{name}"
+
+    def _store(self, data: bytes, content_type: Optional[str]) -> None:
+        self.content_type = content_type or self.content_type
+        self.size = len(data)
+        self.md5_hash = hashlib.md5(data).hexdigest()
+        self._bucket.objects[self.name] = (data, self.content_type, dict(self.metadata or {}))
+
+    def upload_from_string(self, data, content_type: Optional[str] = None, **kwargs) -> None:
+        self._bucket._hop("upload")
+        self._store(data.encode() if isinstance(data, str) else bytes(data), content_type)
+
+    def upload_from_file(self, file_stream, content_type: Optional[str] = None, **kwargs) -> None:
+        self._bucket._hop("upload")
+        self._store(file_stream.read(), content_type)
+
+    def upload_from_filename(self, filename: str, content_type: Optional[str] = None, **kwargs) -> None:
+        self._bucket._hop("upload")
+        with open(filename, "rb") as handle:
+            self._store(handle.read(), content_type)
+
+    def download_as_bytes(self, **kwargs) -> bytes:
+        self._bucket._hop("download")
+        if self.name not in self._bucket.objects:
+            from symphainy_platform.foundations.public_works.adapters.gcs_adapter import NotFound
+            raise NotFound(f"No such object: {self._bucket.name}/{self.name}")
+        return self._bucket.objects[self.name][0]
+
+    def download_as_string(self, **kwargs) -> bytes:
+        return self.download_as_bytes()
+
+    def download_to_filename(self, filename: str, **kwargs) -> None:
+        with open(filename, "wb") as handle:
+            handle.write(self.download_as_bytes())
+
+    def download_to_file(self, file_stream, **kwargs) -> None:
+        file_stream.write(self.download_as_bytes())
+
+    def exists(self, **kwargs) -> bool:
+        self._bucket._hop("exists")
+        return self.name in self._bucket.objects
+
+    def delete(self, **kwargs) -> None:
+        self._bucket._hop("delete")
+        self._bucket.objects.pop(self.name, None)
+
+    def reload(self, **kwargs) -> None:
+        self._bucket._hop("reload")
+        if self.name in self._bucket.objects:
+            data, content_type, metadata = self._bucket.objects[self.name]
+            self.size = len(data)
+            self.content_type = content_type
+            self.metadata = dict(metadata)
+
+    def patch(self, **kwargs) -> None:
+        self._bucket._hop("patch")
+        if self.name in self._bucket.objects:
+            data, content_type, _ = self._bucket.objects[self.name]
+            self._bucket.objects[self.name] = (data, content_type, dict(self.metadata or {}))
+
+    def generate_signed_url(self, expiration=None, method: str = "GET", **kwargs) -> str:
+        return f"local://{self._bucket.name}/{self.name}?signed=1"
+
+
+class LocalGCSBucket:
+    """In-memory stand-in for a google.cloud.storage Bucket."""
+
+    def __init__(self, name: str, counter: RoundTripCounter, latency_ms: float = 0.0):
+        self.name = name
+        self.location = "local"
+        self.storage_class = "STANDARD"
+        self.time_created = None
+        self.updated = None
+        self.versioning_enabled = False
+        self.labels: Dict[str, str] = {}
+        self.objects: Dict[str, Tuple[bytes, Optional[str], Dict[str, str]]] = {}
+        self._counter = counter
+        self._latency_ms = latency_ms
+
+    def _hop(self, operation: str) -> None:
+        self._counter.record("gcs", operation)
+        if self._latency_ms > 0:
+            time.sleep(self._latency_ms / 1000.0)
+
+    def blob(self, name: str, **kwargs) -> _LocalBlob:
+        blob = _LocalBlob(self, name)
+        if name in self.objects:
+            data, content_type, metadata = self.objects[name]
+            blob.size, blob.content_type, blob.metadata = len(data), content_type, dict(metadata)
+        return blob
+
+    def get_blob(self, name: str, **kwargs) -> Optional[_LocalBlob]:
+        self._hop("get_blob")
+        return self.blob(name) if name in self.objects else None
+
+    def list_blobs(self, prefix: Optional[str] = None, delimiter: Optional[str] = None, **kwargs):
+        self._hop("list")
+        return [self.blob(name) for name in sorted(self.objects) if not prefix or name.startswith(prefix)]
+
+    def copy_blob(self, source: _LocalBlob, dest_bucket: "LocalGCSBucket", dest_name: str, **kwargs) -> _LocalBlob:
+        self._hop("copy")
+        dest_bucket.objects[dest_name] = self.objects[source.name]
+        return dest_bucket.blob(dest_name)
+
+    def delete_blobs(self, blobs: List[_LocalBlob], **kwargs) -> None:
+        for blob in blobs:
+            blob.delete()
+
+    def reload(self, **kwargs) -> None:
+        self._hop("reload")
+
+
+class LocalGCSClient:
+    """In-memory stand-in for google.cloud.storage.Client."""
+
+    def __init__(self, counter: RoundTripCounter, latency_ms: float = 0.0):
+        self._counter = counter
+        self._latency_ms = latency_ms
+        self._buckets: Dict[str, LocalGCSBucket] = {}
+
+    def bucket(self, name: str) -> LocalGCSBucket:
+        if name not in self._buckets:
+            self._buckets[name] = LocalGCSBucket(name, self._counter, self._latency_ms)
+        return self._buckets[name]
+
+    def delete_blobs(self, blobs: List[_LocalBlob]) -> None:
+        for blob in blobs:
+            blob.delete()
+
+
+# ============================================================================
+# SUPABASE (postgrest query builder subset)
+# ============================================================================
+
+
+class _LocalResponse:
+    def __init__(self, data: Any, count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+class _LocalQuery:
+    def __init__(self, client: "LocalSupabaseClient", table: str):
+        self._client = client
+        self._table = table
+        self._operation = "select"
+        self._payload: Any = None
+        self._filters: List[Any] = []
+        self._order: Optional[Tuple[str, bool]] = None
+        self._limit: Optional[int] = None
+        self._offset = 0
+        self._single = False
+        self._upsert_key: Optional[str] = None
+
+    # Operations
+    def select(self, *columns, count: Optional[str] = None, **kwargs) -> "_LocalQuery":
+        self._operation = "select"
+        return self
+
+    def insert(self, data: Any, **kwargs) -> "_LocalQuery":
+        self._operation, self._payload = "insert", data
+        return self
+
+    def upsert(self, data: Any, on_conflict: Optional[str] = None, **kwargs) -> "_LocalQuery":
+        self._operation, self._payload, self._upsert_key = "upsert", data, on_conflict
+        return self
+
+    def update(self, data: Dict[str, Any], **kwargs) -> "_LocalQuery":
+        self._operation, self._payload = "update", data
+        return self
+
+    def delete(self, **kwargs) -> "_LocalQuery":
+        self._operation = "delete"
+        return self
+
+    # Filters
+    def eq(self, column: str, value: Any) -> "_LocalQuery":
+        self._filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def neq(self, column: str, value: Any) -> "_LocalQuery":
+        self._filters.append(lambda row: row.get(column) != value)
+        return self
+
+    def in_(self, column: str, values: List[Any]) -> "_LocalQuery":
+        allowed = set(values)
+        self._filters.append(lambda row: row.get(column) in allowed)
+        return self
+
+    def is_(self, column: str, value: Any) -> "_LocalQuery":
+        expected = None if value in (None, "null") else value
+        self._filters.append(lambda row: row.get(column) is expected or row.get(column) == expected)
+        return self
+
+    def ilike(self, column: str, pattern: str) -> "_LocalQuery":
+        regex = re.compile("^" + re.escape(pattern).replace("%", ".*") + "$", re.IGNORECASE)
+        self._filters.append(lambda row: bool(regex.match(str(row.get(column) or ""))))
+        return self
+
+    def gt(self, column: str, value: Any) -> "_LocalQuery":
+        self._filters.append(lambda row: row.get(column) is not None and row.get(column) > value)
+        return self
+
+    def gte(self, column: str, value: Any) -> "_LocalQuery":
+        self._filters.append(lambda row: row.get(column) is not None and row.get(column) >= value)
+        return self
+
+    def lt(self, column: str, value: Any) -> "_LocalQuery":
+        self._filters.append(lambda row: row.get(column) is not None and row.get(column) < value)
+        return self
+
+    def lte(self, column: str, value: Any) -> "_LocalQuery":
+        self._filters.append(lambda row: row.get(column) is not None and row.get(column) <= value)
+        return self
+
+    def contains(self, column: str, value: Any) -> "_LocalQuery":
+        return self
+
+    def or_(self, *args, **kwargs) -> "_LocalQuery":
+        return self
+
+    # Modifiers
+    def order(self, column: str, desc: bool = False, **kwargs) -> "_LocalQuery":
+        self._order = (column, desc)
+        return self
+
+    def limit(self, count: int, **kwargs) -> "_LocalQuery":
+        self._limit = count
+        return self
+
+    def range(self, start: int, end: int, **kwargs) -> "_LocalQuery":
+        self._offset, self._limit = start, end - start + 1
+        return self
+
+    def single(self) -> "_LocalQuery":
+        self._single = True
+        return self
+
+    def maybe_single(self) -> "_LocalQuery":
+        self._single = True
+        return self
+
+    def _matches(self, row: Dict[str, Any]) -> bool:
+        return all(check(row) for check in self._filters)
+
+    def execute(self) -> _LocalResponse:
+        self._client._hop(f"{self._operation}:{self._table}")
+        rows = self._client.tables[self._table]
+        if self._operation in ("insert", "upsert"):
+            payload = self._payload if isinstance(self._payload, list) else [self._payload]
+            inserted = []
+            for record in payload:
+                record = dict(record)
+                record.setdefault("id", record.get("uuid") or str(next(self._client.ids)))
+                if self._operation == "upsert":
+                    key = self._upsert_key or "id"
+                    rows[:] = [row for row in rows if row.get(key) != record.get(key)]
+                rows.append(record)
+                inserted.append(dict(record))
+            return _LocalResponse(inserted, len(inserted))
+        matched = [row for row in rows if self._matches(row)]
+        if self._operation == "update":
+            for row in matched:
+                row.update(self._payload)
+            return _LocalResponse([dict(row) for row in matched], len(matched))
+        if self._operation == "delete":
+            rows[:] = [row for row in rows if not self._matches(row)]
+            return _LocalResponse([dict(row) for row in matched], len(matched))
+        if self._order:
+            column, desc = self._order
+            matched.sort(key=lambda row: str(row.get(column) or ""), reverse=desc)
+        total = len(matched)
+        matched = matched[self._offset:]
+        if self._limit is not None:
+            matched = matched[: self._limit]
+        data = [dict(row) for row in matched]
+        if self._single:
+            return _LocalResponse(data[0] if data else None, total)
+        return _LocalResponse(data, total)
+
+
+class _LocalRPC:
+    def __init__(self, client: "LocalSupabaseClient", name: str):
+        self._client = client
+        self._name = name
+
+    def execute(self) -> _LocalResponse:
+        self._client._hop(f"rpc:{self._name}")
+        return _LocalResponse([])
+
+
+class LocalSupabaseClient:
+    """In-memory stand-in for a supabase Client's PostgREST surface."""
+
+    def __init__(self, counter: RoundTripCounter, latency_ms: float = 0.0):
+        self._counter = counter
+        self._latency_ms = latency_ms
+        self.tables: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.ids = itertools.count(1)
+
+    def _hop(self, operation: str) -> None:
+        # supabase-py's sync client blocks the event loop, same as here.
+        self._counter.record("supabase", operation.split(":", 1)[0])
+        if self._latency_ms > 0:
+            time.sleep(self._latency_ms / 1000.0)
+
+    def table(self, name: str) -> _LocalQuery:
+        return _LocalQuery(self, name)
+
+    def from_(self, name: str) -> _LocalQuery:
+        return _LocalQuery(self, name)
+
+    def rpc(self, name: str, params: Optional[Dict[str, Any]] = None) -> _LocalRPC:
+        return _LocalRPC(self, name)
+
+
+# ============================================================================
+# LLM / EMBEDDINGS (in-process stub)
+# ============================================================================
+
+
+def stub_embedding(text: str, dimension: int = 384) -> List[float]:
+    """Deterministic unit-length pseudo-embedding derived from the text hash."""
+    seed = hashlib.sha256(text.encode("utf-8", errors="replace")).digest()
+    values = []
+    block = seed
+    while len(values) < dimension:
+        block = hashlib.sha256(block).digest()
+        values.extend((b - 127.5) / 127.5 for b in block)
+    values = values[:dimension]
+    norm = math.sqrt(sum(v * v for v in values)) or 1.0
+    return [v / norm for v in values]
+
+
+class _StubObject:
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+class _StubCompletions:
+    def __init__(self, client: "StubLLMClient"):
+        self._client = client
+
+    async def create(self, **request) -> _StubObject:
+        self._client.counter.record("llm", "chat.completions")
+        await _simulate_latency(self._client.latency_ms)
+        prompt = " ".join(str(m.get("content", "")) for m in request.get("messages", []))
+        content = self._client.responder(prompt) if self._client.responder else (
+            '{"summary": "stub response", "items": [], "confidence": 0.9}'
+        )
+        return _StubObject(
+            id=f"stub-{hashlib.sha1(prompt.encode()).hexdigest()[:12]}",
+            choices=[_StubObject(message=_StubObject(role="assistant", content=content), finish_reason="stop")],
+            usage=_StubObject(prompt_tokens=len(prompt) // 4, completion_tokens=len(content) // 4,
+                              total_tokens=(len(prompt) + len(content)) // 4),
+            model=request.get("model", "stub-model"),
+            created=int(time.time()),
+        )
+
+
+class _StubEmbeddings:
+    def __init__(self, client: "StubLLMClient"):
+        self._client = client
+
+    async def create(self, input: Any, model: str = "stub-embedding", **kwargs) -> _StubObject:
+        self._client.counter.record("llm", "embeddings")
+        await _simulate_latency(self._client.latency_ms)
+        inputs = input if isinstance(input, list) else [input]
+        return _StubObject(data=[_StubObject(embedding=stub_embedding(str(text)), index=i) for i, text in enumerate(inputs)])
+
+
+class StubLLMClient:
+    """In-process stand-in for openai.AsyncOpenAI (chat + embeddings)."""
+
+    def __init__(self, counter: RoundTripCounter, latency_ms: float = 0.0, responder=None):
+        self.counter = counter
+        self.latency_ms = latency_ms
+        self.responder = responder
+        self.chat = _StubObject(completions=_StubCompletions(self))
+        self.embeddings = _StubEmbeddings(self)
+
+
+def build_stub_openai_adapter(counter: RoundTripCounter, latency_ms: float = 0.0, responder=None):
+    """OpenAIAdapter whose client is the in-process stub (no openai SDK required)."""
+    from symphainy_platform.foundations.public_works.adapters.openai_adapter import OpenAIAdapter
+
+    class StubOpenAIAdapter(OpenAIAdapter):
+        def _initialize_client(self):
+            self._client = StubLLMClient(counter, latency_ms, responder)
+            self.client = self._client
+
+    return StubOpenAIAdapter(api_key="stub-key")
+
+
+def build_stub_huggingface_adapter(counter: RoundTripCounter, latency_ms: float = 0.0, dimension: int = 384):
+    """HuggingFaceAdapter whose inference endpoint is answered in-process."""
+    from symphainy_platform.foundations.public_works.adapters.huggingface_adapter import HuggingFaceAdapter
+
+    class StubHuggingFaceAdapter(HuggingFaceAdapter):
+        async def inference(self, inputs: Any, model: str = "sentence-transformers/all-mpnet-base-v2", **kwargs):
+            counter.record("llm", "hf.inference")
+            await _simulate_latency(latency_ms)
+            if isinstance(inputs, list):
+                embeddings = [stub_embedding(str(text), dimension) for text in inputs]
+                return {"embedding": embeddings, "model": model, "dimension": dimension}
+            embedding = stub_embedding(str(inputs), dimension)
+            return {"embedding": embedding, "model": model, "dimension": dimension}
+
+    return StubHuggingFaceAdapter(endpoint_url="http://stub-hf.local", api_key="stub-key")
+
+
+# ============================================================================
+# PUBLIC WORKS WIRED TO STAND-INS
+# ============================================================================
+
+
+class LocalBackends:
+    """The set of stand-in clients shared by one benchmark run."""
+
+    def __init__(self, latency_ms: Optional[Dict[str, float]] = None, llm_responder=None):
+        latency_ms = latency_ms or {}
+        self.counter = RoundTripCounter()
+        self.redis = LocalRedisClient(self.counter, latency_ms.get("redis", 0.0))
+        self.arango = LocalArangoDatabase(self.counter, latency_ms.get("arango", 0.0))
+        self.gcs = LocalGCSClient(self.counter, latency_ms.get("gcs", 0.0))
+        self.supabase = LocalSupabaseClient(self.counter, latency_ms.get("supabase", 0.0))
+        self.llm_latency_ms = latency_ms.get("llm", 0.0)
+        self.llm_responder = llm_responder
+
+
+class LocalPublicWorksFoundationService(PublicWorksFoundationService):
+    """
+    PublicWorksFoundationService with Layer 0 bound to LocalBackends.
+
+    Only adapter construction differs from production; abstractions, SDKs and
+    the runtime object graph are built by the unmodified code paths.
+    """
+
+    def __init__(self, backends: LocalBackends, config: Optional[Dict[str, Any]] = None):
+        base_config = {
+            "gcs_project_id": "local-benchmark",
+            "gcs_bucket_name": "local-benchmark-bucket",
+            "supabase_url": "http://supabase.local",
+            "supabase_anon_key": "local-anon-key",
+            "supabase_service_key": "local-service-key",
+            "duckdb": {"database_path": ":memory:"},
+        }
+        base_config.update(config or {})
+        super().__init__(config=base_config)
+        self.backends = backends
+
+    async def _create_adapters(self):
+        from symphainy_platform.foundations.public_works.adapters.redis_adapter import RedisAdapter
+        from symphainy_platform.foundations.public_works.adapters.arango_adapter import ArangoAdapter
+        from symphainy_platform.foundations.public_works.adapters.arango_graph_adapter import ArangoGraphAdapter
+        from symphainy_platform.foundations.public_works.adapters.gcs_adapter import GCSAdapter
+        from symphainy_platform.foundations.public_works.adapters.supabase_adapter import SupabaseAdapter
+        from symphainy_platform.foundations.public_works.adapters.supabase_file_adapter import SupabaseFileAdapter
+        from symphainy_platform.foundations.public_works.adapters.csv_adapter import CsvProcessingAdapter
+        from symphainy_platform.foundations.public_works.adapters.excel_adapter import ExcelProcessingAdapter
+        from symphainy_platform.foundations.public_works.adapters.pdf_adapter import PdfProcessingAdapter
+        from symphainy_platform.foundations.public_works.adapters.word_adapter import WordProcessingAdapter
+        from symphainy_platform.foundations.public_works.adapters.html_adapter import HtmlProcessingAdapter
+        from symphainy_platform.foundations.public_works.adapters.image_adapter import ImageProcessingAdapter
+        from symphainy_platform.foundations.public_works.adapters.json_adapter import JsonProcessingAdapter
+        from symphainy_platform.foundations.public_works.adapters.visual_generation_adapter import VisualGenerationAdapter
+        from symphainy_platform.foundations.public_works.abstractions.llm_abstraction import LLMAbstraction
+        from symphainy_platform.foundations.public_works.embedding_cache import EmbeddingCache
+
+        backends = self.backends
+
+        self.redis_adapter = RedisAdapter(host="redis.local", port=6379)
+        self.redis_adapter._client = backends.redis
+
+        self.arango_adapter = ArangoAdapter(url="http://arango.local:8529")
+        self.arango_adapter._client = object()
+        self.arango_adapter._db = backends.arango
+        self.arango_graph_adapter = ArangoGraphAdapter(self.arango_adapter)
+
+        bucket_name = self.config["gcs_bucket_name"]
+        if os.environ.get("STORAGE_EMULATOR_HOST"):
+            self.gcs_adapter = GCSAdapter(project_id=self.config["gcs_project_id"], bucket_name=bucket_name)
+        else:
+            os.environ.setdefault("STORAGE_EMULATOR_HOST", "http://gcs.local:4443")
+            try:
+                self.gcs_adapter = GCSAdapter(project_id=self.config["gcs_project_id"], bucket_name=bucket_name)
+            finally:
+                if os.environ.get("STORAGE_EMULATOR_HOST") == "http://gcs.local:4443":
+                    del os.environ["STORAGE_EMULATOR_HOST"]
+            self.gcs_adapter._client = self.gcs_adapter.client = backends.gcs
+            self.gcs_adapter._bucket = self.gcs_adapter.bucket = backends.gcs.bucket(bucket_name)
+
+        self.supabase_adapter = SupabaseAdapter(
+            url=self.config["supabase_url"],
+            anon_key=self.config["supabase_anon_key"],
+            service_key=self.config["supabase_service_key"],
+        )
+        self.supabase_adapter.anon_client = backends.supabase
+        self.supabase_adapter.service_client = backends.supabase
+        self.supabase_file_adapter = SupabaseFileAdapter(
+            url=self.config["supabase_url"],
+            service_key=self.config["supabase_service_key"],
+        )
+        self.supabase_file_adapter._client = self.supabase_file_adapter.client = backends.supabase
+
+        self.csv_adapter = CsvProcessingAdapter()
+        self.excel_adapter = ExcelProcessingAdapter()
+        self.pdf_adapter = PdfProcessingAdapter()
+        self.word_adapter = WordProcessingAdapter()
+        self.html_adapter = HtmlProcessingAdapter()
+        self.image_adapter = ImageProcessingAdapter()
+        self.json_adapter = JsonProcessingAdapter()
+        self.visual_generation_adapter = VisualGenerationAdapter()
+
+        self.openai_adapter = build_stub_openai_adapter(
+            backends.counter, backends.llm_latency_ms, backends.llm_responder
+        )
+        self.huggingface_adapter = build_stub_huggingface_adapter(backends.counter, backends.llm_latency_ms)
+        self.embedding_cache = EmbeddingCache(redis_adapter=self.redis_adapter)
+        self.openai_adapter.embedding_engine.cache = self.embedding_cache
+        self.huggingface_adapter.embedding_engine.cache = self.embedding_cache
+        self._llm_abstraction = LLMAbstraction(
+            openai_adapter=self.openai_adapter,
+            huggingface_adapter=self.huggingface_adapter,
+        )
+
+        # DuckDB is embedded, so the real engine runs in-memory (production's connect and schema steps).
+        if self._create_duckdb_adapter():
+            with self.startup_timings.measure("duckdb", "connect"):
+                connected = await self._connect_duckdb()
+            if connected:
+                with self.startup_timings.measure("duckdb_schema", "schema"):
+                    await self._initialize_duckdb_schema()
+
+        self.logger.info("Local benchmark adapters created (in-process stand-ins)")
@@ -0,0 +1,101 @@
+"""
+Smoke tests for the benchmark harness: boots the runtime on local stand-ins,
+runs a tiny workload and checks the report shape and baseline comparison.
+"""
+
+import copy
+
+import pytest
+
+from .harness import (
+    DEFAULT_PIPELINE,
+    BenchmarkConfig,
+    compare_reports,
+    percentile,
+    run_benchmark,
+)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runs_on_local_backends():
+    report = await run_benchmark(BenchmarkConfig(documents=2, concurrency=2, rows_per_document=10))
+
+    assert report["totals"]["executions"] == 2 * len(DEFAULT_PIPELINE)
+    assert set(report["intents"]) == set(DEFAULT_PIPELINE)
+    for stats in report["intents"].values():
+        assert stats["count"] == 2
+        assert stats["latency_ms"]["p95"] >= stats["latency_ms"]["p50"]
+    assert report["intents"]["ingest_file"]["errors"] == 0
+    assert report["intents"]["ingest_file"]["round_trips_total_per_execution"] > 0
+    assert report["peak_rss_mb"] > 0
+    assert compare_reports(report, report) == []
+
+
+def test_compare_reports_flags_regressions():
+    baseline = {
+        "peak_rss_mb": 100.0,
+        "intents": {
+            "ingest_file": {
+                "latency_ms": {"p95": 10.0},
+                "throughput_per_s": 50.0,
+                "round_trips_total_per_execution": 10.0,
+                "errors": 0,
+            }
+        },
+    }
+    current = copy.deepcopy(baseline)
+    current["peak_rss_mb"] = 130.0
+    current["intents"]["ingest_file"].update(
+        {"latency_ms": {"p95": 15.0}, "throughput_per_s": 30.0,
+         "round_trips_total_per_execution": 14.0, "errors": 1}
+    )
+
+    regressions = compare_reports(current, baseline, tolerance=0.2)
+
+    assert len(regressions) == 5
+    assert compare_reports(baseline, baseline) == []
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 95) == 0.0
+
+
+def test_vector_index_recall_against_exact_scan():
+    pytest.importorskip("numpy")
+    from .vector_search import run_vector_benchmark
+
+    report = run_vector_benchmark(vectors=3000, dimension=32, queries=20, nprobes=(16,), clusters=16)
+
+    assert report["lists"] > 1
+    assert report["ann"][0]["recall@10"] >= 0.9
+
+
+def test_generated_pdf_is_well_formed():
+    import re
+
+    from .pdf_extraction import generate_pdf
+
+    pdf = generate_pdf(12, lines_per_page=3)
+
+    assert pdf.startswith(b"%PDF-1.4") and pdf.rstrip().endswith(b"%%EOF")
+    assert len(re.findall(rb"/Type /Page ", pdf)) == 12 and b"/Count 12" in pdf
+    xref_offset = int(pdf.rsplit(b"startxref\n", 1)[1].split(b"\n")[0])
+    assert pdf[xref_offset:].startswith(b"xref")
+    offsets = [int(line[:10]) for line in pdf[xref_offset:].split(b"\n")[3:] if line.endswith(b" n ")]
+    assert all(pdf[offset:].startswith(b"%d 0 obj" % number) for number, offset in enumerate(offsets, 1))
+
+
+@pytest.mark.asyncio
+async def test_pdf_pool_extraction_matches_sequential():
+    pytest.importorskip("pdfplumber")
+    from .pdf_extraction import run_pdf_benchmark
+
+    report = await run_pdf_benchmark(pages=20, workers=(2,), pages_per_task=4, lines_per_page=5)
+
+    modes = {row["mode"]: row for row in report["modes"]}
+    assert set(modes) == {"inline", "thread", "pool(2)", "cached"}
+    assert modes["pool(2)"]["tables"] == modes["inline"]["tables"] == 4
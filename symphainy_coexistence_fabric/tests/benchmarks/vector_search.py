@@ -0,0 +1,149 @@
+"""
+Vector search benchmark: IVF-Flat ANN index vs exact scan
+
+    python -m tests.benchmarks.vector_search --vectors 50000 --dimension 384 --queries 200
+    python -m tests.benchmarks.vector_search --nprobe 4,8,16,32 --json
+
+The exact baseline scores every vector against the query, which is the work the
+ArangoDB backend's AQL COSINE_SIMILARITY scan does per search (without the
+ArangoDB round trip, so the measured speedup is a lower bound). Recall@k is the
+fraction of the exact top-k returned by the index.
+"""
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from symphainy_platform.foundations.public_works.backends.ann_vector_backend import IVFFlatIndex
+
+from .harness import percentile
+
+
+def _clustered(n: int, dimension: int, clusters: int, rng: "np.random.Generator") -> "np.ndarray":
+    """Gaussian clusters, a rough stand-in for topic structure in real embeddings."""
+    centers = rng.normal(size=(clusters, dimension))
+    return (centers[rng.integers(clusters, size=n)] + 0.35 * rng.normal(size=(n, dimension))).astype(np.float32)
+
+
+def _latency(samples: List[float]) -> Dict[str, float]:
+    return {
+        "mean_ms": round(statistics.fmean(samples) * 1000, 3),
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 95) * 1000, 3),
+    }
+
+
+def run_vector_benchmark(
+    vectors: int = 20000,
+    dimension: int = 384,
+    queries: int = 100,
+    k: int = 10,
+    nprobes: Sequence[int] = (8, 16, 32),
+    clusters: int = 64,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Build an index over synthetic clustered vectors and compare it to an exact scan.
+
+    Returns:
+        Report with build time, exact-scan latency and, per nprobe, latency and recall@k
+    """
+    rng = np.random.default_rng(seed)
+    data = _clustered(vectors, dimension, clusters, rng)
+    query_set = _clustered(queries, dimension, clusters, np.random.default_rng(seed + 1))
+    keys = [str(i) for i in range(vectors)]
+
+    started = time.perf_counter()
+    index = IVFFlatIndex(dimension)
+    index.add(keys, data)
+    if index.needs_rebuild():
+        index = index.rebuilt()
+    build_seconds = time.perf_counter() - started
+
+    normalized = data / np.linalg.norm(data, axis=1, keepdims=True)
+    exact_times: List[float] = []
+    exact_top: List[set] = []
+    for query in query_set:
+        started = time.perf_counter()
+        scores = normalized @ (query / np.linalg.norm(query))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        exact_times.append(time.perf_counter() - started)
+        exact_top.append({str(i) for i in top})
+
+    report: Dict[str, Any] = {
+        "vectors": vectors,
+        "dimension": dimension,
+        "queries": queries,
+        "k": k,
+        "lists": index.nlist,
+        "build_seconds": round(build_seconds, 3),
+        "exact_scan": _latency(exact_times),
+        "ann": [],
+    }
+    for nprobe in nprobes:
+        times: List[float] = []
+        hits = 0
+        for query, expected in zip(query_set, exact_top):
+            started = time.perf_counter()
+            found = index.search(query, k, nprobe=nprobe)
+            times.append(time.perf_counter() - started)
+            hits += len({key for key, _ in found} & expected)
+        latency = _latency(times)
+        report["ann"].append({
+            "nprobe": nprobe,
+            f"recall@{k}": round(hits / (k * queries), 4),
+            **latency,
+            "speedup_p50": round(report["exact_scan"]["p50_ms"] / latency["p50_ms"], 2) if latency["p50_ms"] else None,
+        })
+    return report
+
+
+def format_vector_report(report: Dict[str, Any]) -> str:
+    """Human-readable table of a run_vector_benchmark report."""
+    k = report["k"]
+    lines = [
+        f"{report['vectors']} vectors x {report['dimension']} dims, {report['lists']} lists, "
+        f"built in {report['build_seconds']}s; {report['queries']} queries, k={k}",
+        f"{'search':<14}{'recall@' + str(k):>10}{'p50 ms':>10}{'p95 ms':>10}{'speedup':>10}",
+        f"{'exact scan':<14}{1.0:>10.4f}{report['exact_scan']['p50_ms']:>10.3f}"
+        f"{report['exact_scan']['p95_ms']:>10.3f}{1.0:>10.2f}",
+    ]
+    for row in report["ann"]:
+        lines.append(
+            f"{'nprobe=' + str(row['nprobe']):<14}{row[f'recall@{k}']:>10.4f}{row['p50_ms']:>10.3f}"
+            f"{row['p95_ms']:>10.3f}{row['speedup_p50'] or 0:>10.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks.vector_search", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vectors", type=int, default=20000, help="Indexed vectors")
+    parser.add_argument("--dimension", type=int, default=384, help="Vector dimension")
+    parser.add_argument("--queries", type=int, default=100, help="Queries measured")
+    parser.add_argument("--k", type=int, default=10, help="Results per query")
+    parser.add_argument("--nprobe", default="8,16,32", help="Comma-separated nprobe values to compare")
+    parser.add_argument("--clusters", type=int, default=64, help="Synthetic topic clusters")
+    parser.add_argument("--json", action="store_true", help="Print the JSON report instead of the table")
+    args = parser.parse_args(argv)
+
+    report = run_vector_benchmark(
+        vectors=args.vectors,
+        dimension=args.dimension,
+        queries=args.queries,
+        k=args.k,
+        nprobes=[int(n) for n in args.nprobe.split(",") if n.strip()],
+        clusters=args.clusters,
+    )
+    print(json.dumps(report, indent=2) if args.json else format_vector_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -17,6 +17,10 @@ _project_root = Path(__file__).resolve().parents[1]
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
+# Pin this project's utilities package now: some test modules prepend the
+# parent directory to sys.path, which holds an older top-level utilities copy.
+import utilities  # noqa: E402,F401
+
 # Load tests/3d/conftest.py so e2e tests get the same fixtures
 _conftest_3d_path = Path(__file__).resolve().parent / "3d" / "conftest.py"
 _spec = importlib.util.spec_from_file_location("conftest_3d", _conftest_3d_path)
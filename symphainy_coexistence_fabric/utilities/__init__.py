@@ -6,9 +6,22 @@ Platform primitives for:
 - ID generation (session_id, saga_id, event_id)
 - Clock abstraction (for determinism)
 - Error taxonomy (platform vs domain vs agent)
+- Lazy imports (defer heavy optional libraries until first use)
+- Process pool context (worker start method, no fork)
 """
 
-from .logging import StructuredLogger, get_logger, LogLevel, LogCategory
+from .logging import (
+    StructuredLogger,
+    get_logger,
+    LogLevel,
+    LogCategory,
+    log_context,
+    bind_log_context,
+    reset_log_context,
+    get_log_context,
+    configure_log_sampling,
+    shutdown_logging,
+)
 from .ids import IDGenerator, generate_session_id, generate_saga_id, generate_event_id, generate_trace_id, generate_execution_id, generate_step_id
 from .clock import Clock, get_clock
 from .errors import (
@@ -18,6 +31,8 @@ from .errors import (
     ErrorTaxonomy,
     categorize_error
 )
+from .lazy_import import LazyModule, lazy_import, module_available, get_lazy_import_timings
+from .process_pool import worker_process_context, pin_import_roots
 
 __all__ = [
     # Logging
@@ -25,6 +40,12 @@ __all__ = [
     "get_logger",
     "LogLevel",
     "LogCategory",
+    "log_context",
+    "bind_log_context",
+    "reset_log_context",
+    "get_log_context",
+    "configure_log_sampling",
+    "shutdown_logging",
     # ID Generation
     "IDGenerator",
     "generate_session_id",
@@ -42,4 +63,12 @@ __all__ = [
     "AgentError",
     "ErrorTaxonomy",
     "categorize_error",
+    # Lazy imports
+    "LazyModule",
+    "lazy_import",
+    "module_available",
+    "get_lazy_import_timings",
+    # Process pools
+    "worker_process_context",
+    "pin_import_roots",
 ]
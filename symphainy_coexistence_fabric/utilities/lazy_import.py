@@ -0,0 +1,97 @@
+"""
+Lazy Imports
+
+Phase 0 Utility: Defers heavy optional libraries (plotly, pandas, pdfplumber, ...)
+until first use so process startup only pays for what a request actually touches.
+
+WHAT (Utility): I provide module proxies that import on first attribute access
+HOW (Implementation): I use importlib.util.find_spec for availability checks and
+                      importlib.import_module on first use, recording the import cost
+"""
+
+import importlib
+import importlib.util
+import threading
+import time
+from types import ModuleType
+from typing import Dict, Optional
+
+
+_import_timings_ms: Dict[str, float] = {}
+_import_lock = threading.Lock()
+
+
+def module_available(name: str) -> bool:
+    """
+    Check whether a module can be imported, without importing it.
+
+    Args:
+        name: Dotted module name (e.g. "pandas", "plotly.graph_objects")
+
+    Returns:
+        bool: True if the module (and its parent packages) can be found
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        # find_spec imports parent packages; a missing parent raises
+        return False
+
+
+class LazyModule:
+    """
+    Module proxy that imports the real module on first attribute access.
+
+    Import failures surface at first use as ImportError, exactly as an eager
+    import would have, just later.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the underlying module has been imported."""
+        return self._module is not None
+
+    def load(self) -> ModuleType:
+        """Import (once) and return the underlying module."""
+        if self._module is None:
+            with _import_lock:
+                if self._module is None:
+                    started = time.perf_counter()
+                    module = importlib.import_module(self._name)
+                    _import_timings_ms[self._name] = round((time.perf_counter() - started) * 1000, 3)
+                    self._module = module
+        return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "deferred"
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Return a proxy for `name` that imports the module on first use.
+
+    Args:
+        name: Dotted module name
+
+    Returns:
+        LazyModule: Proxy forwarding attribute access to the real module
+    """
+    return LazyModule(name)
+
+
+def get_lazy_import_timings() -> Dict[str, float]:
+    """
+    Return how long each deferred import took when it was first used.
+
+    Returns:
+        Dict mapping module name to import duration in milliseconds
+    """
+    return dict(_import_timings_ms)
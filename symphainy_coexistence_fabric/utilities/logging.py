@@ -4,16 +4,44 @@ Structured Logging (JSON)
 Phase 0 Utility: Provides structured JSON logging for all platform components.
 
 WHAT (Utility): I provide structured JSON logging
-HOW (Implementation): I use Python logging with JSON formatter
+HOW (Implementation): I use Python logging with a JSON formatter behind a
+queue: callers enqueue records, a background listener thread formats and
+writes them, so stdout writes and JSON encoding stay off the event loop.
+
+Hot-path support:
+- Lazy messages: pass a zero-arg callable instead of a string; it is only
+  evaluated if the record will actually be emitted.
+- Per-category rate limits / sampling (configure_log_sampling); DEBUG/INFO
+  only, WARNING and above are never dropped. The next emitted record carries
+  a "suppressed" count.
+- Context propagation: bind tenant/session/execution IDs once per request via
+  log_context()/bind_log_context() (contextvars) instead of per-call kwargs.
+
+Set LOG_ASYNC=false to write synchronously (e.g. when debugging crashes).
 """
 
+import atexit
 import json
 import logging
+import os
+import queue
 import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
 from datetime import datetime
-from typing import Any, Dict, Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
 from enum import Enum
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 
 class LogLevel(str, Enum):
     """Log levels."""
@@ -30,6 +58,171 @@ class LogCategory(str, Enum):
     DOMAIN = "domain"
     AGENT = "agent"
     INFRASTRUCTURE = "infrastructure"
+    HOT_PATH = "hot_path"  # High-volume per-request messages (sampled)
+
+
+# Fields carried by log context and accepted as per-call kwargs
+CONTEXT_FIELDS = ("session_id", "saga_id", "event_id", "tenant_id", "trace_id", "execution_id", "intent_type")
+
+Message = Union[str, Callable[[], str]]
+
+
+# ============================================================================
+# CONTEXT PROPAGATION
+# ============================================================================
+
+_log_context: ContextVar[Optional[Dict[str, Any]]] = ContextVar("symphainy_log_context", default=None)
+
+
+def get_log_context() -> Dict[str, Any]:
+    """Return the log fields bound in the current context."""
+    return dict(_log_context.get() or {})
+
+
+def bind_log_context(**fields: Any) -> Token:
+    """
+    Bind log fields (tenant_id, execution_id, ...) for the current context.
+    
+    Fields are merged over any already bound. Returns a token for
+    reset_log_context().
+    
+    Raises:
+        ValueError: If a field is not one of CONTEXT_FIELDS
+    """
+    unknown = set(fields) - set(CONTEXT_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown log context fields: {sorted(unknown)}; expected {CONTEXT_FIELDS}")
+    merged = dict(_log_context.get() or {})
+    merged.update({k: v for k, v in fields.items() if v is not None})
+    return _log_context.set(merged)
+
+
+def reset_log_context(token: Token) -> None:
+    """Restore the log context that was active before bind_log_context()."""
+    _log_context.reset(token)
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[None]:
+    """Bind log fields for the duration of a block (async-safe via contextvars)."""
+    token = bind_log_context(**fields)
+    try:
+        yield
+    finally:
+        reset_log_context(token)
+
+
+# ============================================================================
+# SAMPLING / RATE LIMITING
+# ============================================================================
+
+
+class LogRateLimiter:
+    """
+    Token bucket plus deterministic 1-in-N sampling for one log category.
+    
+    Thread-safe: records may be logged from worker threads as well as the loop.
+    """
+    
+    def __init__(
+        self,
+        max_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        sample_ratio: float = 1.0
+    ):
+        """
+        Args:
+            max_per_second: Sustained records per second (None = unlimited)
+            burst: Bucket size (defaults to max_per_second, at least 1)
+            sample_ratio: Fraction of records kept before rate limiting (0 < r <= 1)
+        """
+        if not 0 < sample_ratio <= 1:
+            raise ValueError(f"sample_ratio must be in (0, 1], got {sample_ratio}")
+        self.max_per_second = max_per_second
+        self.burst = burst or max(1, int(max_per_second or 1))
+        self.sample_every = max(1, round(1 / sample_ratio))
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._seen = 0
+        self._suppressed = 0
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> Tuple[bool, int]:
+        """
+        Decide whether to emit a record.
+        
+        Returns:
+            (allowed, suppressed) - suppressed is the number of records
+            dropped since the last allowed one (only non-zero when allowed).
+        """
+        with self._lock:
+            self._seen += 1
+            allowed = (self._seen - 1) % self.sample_every == 0
+            
+            if allowed and self.max_per_second is not None:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.max_per_second)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                else:
+                    allowed = False
+            
+            if not allowed:
+                self._suppressed += 1
+                return False, 0
+            
+            suppressed, self._suppressed = self._suppressed, 0
+            return True, suppressed
+
+
+_sampling_rules: Dict[str, LogRateLimiter] = {}
+
+
+def configure_log_sampling(
+    category: Union[LogCategory, str],
+    max_per_second: Optional[float] = None,
+    burst: Optional[int] = None,
+    sample_ratio: float = 1.0
+) -> None:
+    """
+    Rate-limit / sample DEBUG and INFO records for a category.
+    
+    Passing neither max_per_second nor a sample_ratio below 1 removes the rule.
+    """
+    key = category.value if isinstance(category, LogCategory) else str(category)
+    if max_per_second is None and sample_ratio >= 1:
+        _sampling_rules.pop(key, None)
+        return
+    _sampling_rules[key] = LogRateLimiter(
+        max_per_second=max_per_second,
+        burst=burst,
+        sample_ratio=sample_ratio
+    )
+
+
+# Hot-path messages are capped by default; tune with LOG_HOT_PATH_RATE (0 disables the cap)
+_hot_path_rate = float(os.getenv("LOG_HOT_PATH_RATE", "20"))
+if _hot_path_rate > 0:
+    configure_log_sampling(LogCategory.HOT_PATH, max_per_second=_hot_path_rate)
+
+
+# ============================================================================
+# FORMATTING
+# ============================================================================
+
+_json_encoder = json.JSONEncoder(default=str)
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Encode a log record dict (orjson when available, stdlib otherwise)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # e.g. integers beyond 64 bits; stdlib handles them
+            pass
+    return _json_encoder.encode(data)
 
 
 class JSONFormatter(logging.Formatter):
@@ -42,7 +235,8 @@ class JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            # Record creation time, not format time (formatting is deferred to the listener)
+            "timestamp": datetime.utcfromtimestamp(record.created).isoformat(),
             "level": record.levelname.lower(),
             "logger": record.name,
             "message": record.getMessage(),
@@ -70,6 +264,15 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "trace_id"):
             log_data["trace_id"] = record.trace_id
         
+        if hasattr(record, "execution_id"):
+            log_data["execution_id"] = record.execution_id
+        
+        if hasattr(record, "intent_type"):
+            log_data["intent_type"] = record.intent_type
+        
+        if hasattr(record, "suppressed"):
+            log_data["suppressed"] = record.suppressed
+        
         if hasattr(record, "metadata"):
             log_data["metadata"] = record.metadata
         
@@ -81,7 +284,74 @@ class JSONFormatter(logging.Formatter):
                 "traceback": self.formatException(record.exc_info) if record.exc_info else None,
             }
         
-        return json.dumps(log_data, default=str)
+        return _dumps(log_data)
+
+
+# ============================================================================
+# OUTPUT PIPELINE
+# ============================================================================
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler that resolves sys.stdout at write time (survives stdout swaps)."""
+    
+    @property
+    def stream(self):
+        return sys.stdout
+    
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues the record as-is.
+    
+    The stock prepare() formats the message in the calling thread (so records
+    can be pickled); our queue never leaves the process, so formatting is left
+    entirely to the listener thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_output_lock = threading.Lock()
+_output_handler: Optional[logging.Handler] = None
+_listener: Optional[QueueListener] = None
+
+
+def _get_output_handler() -> logging.Handler:
+    """Shared handler for all structured loggers (created on first use)."""
+    global _output_handler, _listener
+    if _output_handler is not None:
+        return _output_handler
+    
+    with _output_lock:
+        if _output_handler is None:
+            writer = _StdoutHandler()
+            writer.setFormatter(JSONFormatter())
+            
+            if os.getenv("LOG_ASYNC", "true").lower() in ("false", "0", "no"):
+                _output_handler = writer
+            else:
+                log_queue: queue.SimpleQueue = queue.SimpleQueue()
+                _listener = QueueListener(log_queue, writer)
+                _listener.start()
+                _output_handler = _InProcessQueueHandler(log_queue)
+                atexit.register(shutdown_logging)
+    return _output_handler
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background writer (idempotent)."""
+    global _output_handler, _listener
+    with _output_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+            _output_handler = None
 
 
 class StructuredLogger:
@@ -113,28 +383,49 @@ class StructuredLogger:
         # Remove existing handlers to avoid duplicates
         self.logger.handlers.clear()
         
-        # Add JSON formatter handler
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(JSONFormatter())
-        self.logger.addHandler(handler)
+        # All structured loggers share one queued JSON handler
+        self.logger.addHandler(_get_output_handler())
     
     def _log(
         self,
         level: LogLevel,
-        message: str,
+        message: Message,
         session_id: Optional[str] = None,
         saga_id: Optional[str] = None,
         event_id: Optional[str] = None,
         tenant_id: Optional[str] = None,
         trace_id: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
-        exc_info: Optional[Any] = None
+        exc_info: Optional[Any] = None,
+        category: Optional[LogCategory] = None
     ):
         """Internal log method with structured fields."""
+        level_no = getattr(logging, level.value.upper())
+        if not self.logger.isEnabledFor(level_no):
+            return
+        
+        category = category or self.category
+        category_value = category.value if isinstance(category, LogCategory) else str(category)
+        suppressed = 0
+        if level_no < logging.WARNING:
+            limiter = _sampling_rules.get(category_value)
+            if limiter is not None:
+                allowed, suppressed = limiter.acquire()
+                if not allowed:
+                    return
+        
+        if callable(message):
+            message = message()
+        
         extra = {
-            "category": self.category.value,
+            "category": category_value,
         }
         
+        # Context-bound fields first; explicit kwargs win
+        context = _log_context.get()
+        if context:
+            extra.update(context)
+        
         if session_id:
             extra["session_id"] = session_id
         if saga_id:
@@ -147,19 +438,22 @@ class StructuredLogger:
             extra["trace_id"] = trace_id
         if metadata:
             extra["metadata"] = metadata
+        if suppressed:
+            extra["suppressed"] = suppressed
         
-        log_method = getattr(self.logger, level.value.lower())
-        log_method(message, extra=extra, exc_info=exc_info)
+        # stacklevel=3 attributes module/function/line to the caller, not this wrapper
+        self.logger.log(level_no, message, extra=extra, exc_info=exc_info, stacklevel=3)
     
     def debug(
         self,
-        message: str,
+        message: Message,
         session_id: Optional[str] = None,
         saga_id: Optional[str] = None,
         event_id: Optional[str] = None,
         tenant_id: Optional[str] = None,
         trace_id: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        category: Optional[LogCategory] = None
     ):
         """Log debug message."""
         self._log(
@@ -170,18 +464,20 @@ class StructuredLogger:
             event_id=event_id,
             tenant_id=tenant_id,
             trace_id=trace_id,
-            metadata=metadata
+            metadata=metadata,
+            category=category
         )
     
     def info(
         self,
-        message: str,
+        message: Message,
         session_id: Optional[str] = None,
         saga_id: Optional[str] = None,
         event_id: Optional[str] = None,
         tenant_id: Optional[str] = None,
         trace_id: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        category: Optional[LogCategory] = None
     ):
         """Log info message."""
         self._log(
@@ -192,18 +488,20 @@ class StructuredLogger:
             event_id=event_id,
             tenant_id=tenant_id,
             trace_id=trace_id,
-            metadata=metadata
+            metadata=metadata,
+            category=category
         )
     
     def warning(
         self,
-        message: str,
+        message: Message,
         session_id: Optional[str] = None,
         saga_id: Optional[str] = None,
         event_id: Optional[str] = None,
         tenant_id: Optional[str] = None,
         trace_id: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        category: Optional[LogCategory] = None
     ):
         """Log warning message."""
         self._log(
@@ -214,12 +512,13 @@ class StructuredLogger:
             event_id=event_id,
             tenant_id=tenant_id,
             trace_id=trace_id,
-            metadata=metadata
+            metadata=metadata,
+            category=category
         )
     
     def error(
         self,
-        message: str,
+        message: Message,
         session_id: Optional[str] = None,
         saga_id: Optional[str] = None,
         event_id: Optional[str] = None,
@@ -243,7 +542,7 @@ class StructuredLogger:
     
     def critical(
         self,
-        message: str,
+        message: Message,
         session_id: Optional[str] = None,
         saga_id: Optional[str] = None,
         event_id: Optional[str] = None,
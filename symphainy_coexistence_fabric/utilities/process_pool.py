@@ -0,0 +1,58 @@
+"""
+Process Pool Context
+
+Phase 0 Utility: Start method for worker process pools (PDF extraction, AS2 decryption).
+
+WHAT (Utility): I choose how pool workers are started and make them import the same code as this process
+HOW (Implementation): I use forkserver where available (spawn otherwise) and never fork, since
+                      forking once the event loop and client threads exist can deadlock; workers
+                      re-import modules from sys.path, so the roots this process loaded its platform
+                      packages from are moved ahead of any other copy inserted in front of them
+"""
+
+import multiprocessing
+import os
+import sys
+from multiprocessing.context import BaseContext
+from typing import Iterable
+
+
+# Top-level packages a worker must resolve exactly as the parent did
+PINNED_PACKAGES = ("utilities", "symphainy_platform")
+
+
+def _import_root(package: str) -> str:
+    """sys.path entry the loaded package was imported from ("" if not loaded from a directory)."""
+    module = sys.modules.get(package)
+    module_file = getattr(module, "__file__", None)
+    if not module_file:
+        return ""
+    return os.path.dirname(os.path.dirname(os.path.abspath(module_file)))
+
+
+def pin_import_roots(packages: Iterable[str] = PINNED_PACKAGES) -> None:
+    """
+    Move the sys.path roots of already-loaded packages ahead of earlier entries.
+
+    A module that inserts another checkout's root at sys.path[0] after these packages were
+    imported is harmless here (the modules are cached) but would shadow them in a fresh worker.
+    """
+    for package in packages:
+        root = _import_root(package)
+        if not root:
+            continue
+        positions = [i for i, entry in enumerate(sys.path) if os.path.abspath(entry or os.curdir) == root]
+        if positions and positions[0] > 0:
+            sys.path.insert(0, sys.path.pop(positions[0]))
+
+
+def worker_process_context() -> BaseContext:
+    """
+    Multiprocessing context for ProcessPoolExecutor workers.
+
+    Returns:
+        forkserver context (spawn where forkserver is unavailable)
+    """
+    pin_import_roots()
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)